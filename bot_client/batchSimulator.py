@@ -0,0 +1,526 @@
+# NumPy (for vectorized simulation)
+import numpy as np
+
+# Game state (for conversion to and from snapshots, and lookup tables)
+from gameState import *
+
+# Precomputed moves between cells
+from moveTable import NEXT_CELL, NO_CELL, NUM_CELLS
+
+# Move table, indexed by cell * 5 + direction (NO_CELL if the move is blocked)
+NEXT_CELL_ARR: np.ndarray = np.array(NEXT_CELL, dtype=np.int64)
+
+# Direction matching each (row, col) step, indexed by deltaIndex(rowDir, colDir)
+DELTA_DIRECTIONS_ARR: np.ndarray = np.array(DELTA_DIRECTIONS, dtype=np.int64)
+
+# Row and column steps, and reversals, indexed by direction
+D_ROW_ARR: np.ndarray = np.array(D_ROW, dtype=np.int64)
+D_COL_ARR: np.ndarray = np.array(D_COL, dtype=np.int64)
+REVERSED_ARR: np.ndarray = np.array(
+	[reversedDirections[direction] for direction in Directions], dtype=np.int64
+)
+
+# Candidate ghost moves (see GHOST_MOVES), as one column per direction: whether
+# the move is allowed, and the row and column it leads to
+GHOST_MOVE_VALID: np.ndarray = np.zeros((NUM_CELLS * 5, 4), dtype=bool)
+GHOST_MOVE_ROW: np.ndarray = np.zeros((NUM_CELLS * 5, 4), dtype=np.int64)
+GHOST_MOVE_COL: np.ndarray = np.zeros((NUM_CELLS * 5, 4), dtype=np.int64)
+for _index, _moves in enumerate(GHOST_MOVES):
+	for _direction, _row, _col in _moves:
+		GHOST_MOVE_VALID[_index, _direction] = True
+		GHOST_MOVE_ROW[_index, _direction] = _row
+		GHOST_MOVE_COL[_index, _direction] = _col
+
+# Scatter targets for each of the ghosts
+SCATTER_ROW_ARR: np.ndarray = np.array(SCATTER_ROW, dtype=np.int64)
+SCATTER_COL_ARR: np.ndarray = np.array(SCATTER_COL, dtype=np.int64)
+
+# Zobrist hashing keys (see gameState.py)
+ZOBRIST_PACMAN_ARR: np.ndarray = np.array(ZOBRIST_PACMAN, dtype=np.uint64)
+ZOBRIST_GHOST_ARR: np.ndarray = np.array(ZOBRIST_GHOST, dtype=np.uint64)
+ZOBRIST_FRIGHT_ARR: np.ndarray = np.array(ZOBRIST_FRIGHT, dtype=np.uint64)
+ZOBRIST_SPAWNING_ARR: np.ndarray = np.array(ZOBRIST_SPAWNING, dtype=np.uint64)
+ZOBRIST_MODE_ARR: np.ndarray = np.array(ZOBRIST_MODE, dtype=np.uint64)
+ZOBRIST_PELLET_ARR: np.ndarray = np.array(ZOBRIST_PELLET, dtype=np.uint64)
+
+# Number of ghosts tracked by the server (and by snapshots)
+NUM_GHOSTS: int = 4
+
+def cellIndex(row: np.ndarray, col: np.ndarray) -> np.ndarray:
+	'''
+	Cell indices of rows and columns that are known to be in the grid
+	'''
+
+	return row * 28 + col
+
+def inGrid(row: np.ndarray, col: np.ndarray) -> np.ndarray:
+	'''
+	Whether rows and columns are in the grid
+	'''
+
+	return (row >= 0) & (row < 31) & (col >= 0) & (col < 28)
+
+class BatchGameState:
+	'''
+	Struct-of-arrays copy of many game states (candidates), which can all be
+	simulated at once; simulateAction reproduces GameState.simulateAction for
+	each candidate, including its hash, early returns and approximations
+	'''
+
+	__slots__ = (
+		'updatePeriod', 'currTicks', 'gameMode', 'modeSteps', 'modeDuration',
+		'currScore', 'fruitSteps', 'fruitRow', 'fruitCol', 'pacmanRow',
+		'pacmanCol', 'pacmanRowDir', 'pacmanColDir', 'ghostRow', 'ghostCol',
+		'ghostRowDir', 'ghostColDir', 'frightSteps', 'spawning',
+		'plannedDirection', 'pelletArr', 'pelletCount', 'superPelletCount',
+		'zobrist'
+	)
+
+	def __init__(self, size: int, updatePeriod: int = 12) -> None:
+		'''
+		Construct a batch of (empty) game states
+		'''
+
+		# Update period (shared by all candidates, as it is fixed by the server)
+		self.updatePeriod: int = updatePeriod
+
+		# General game info, one entry per candidate
+		self.currTicks: np.ndarray    = np.zeros(size, dtype=np.int64)
+		self.gameMode: np.ndarray     = np.zeros(size, dtype=np.int64)
+		self.modeSteps: np.ndarray    = np.zeros(size, dtype=np.int64)
+		self.modeDuration: np.ndarray = np.zeros(size, dtype=np.int64)
+		self.currScore: np.ndarray    = np.zeros(size, dtype=np.int64)
+
+		# Fruit info
+		self.fruitSteps: np.ndarray = np.zeros(size, dtype=np.int64)
+		self.fruitRow: np.ndarray   = np.full(size, 32, dtype=np.int64)
+		self.fruitCol: np.ndarray   = np.full(size, 32, dtype=np.int64)
+
+		# Pacman location info
+		self.pacmanRow: np.ndarray    = np.full(size, 32, dtype=np.int64)
+		self.pacmanCol: np.ndarray    = np.full(size, 32, dtype=np.int64)
+		self.pacmanRowDir: np.ndarray = np.zeros(size, dtype=np.int64)
+		self.pacmanColDir: np.ndarray = np.zeros(size, dtype=np.int64)
+
+		# Ghost info, one row per candidate and one column per ghost color
+		self.ghostRow: np.ndarray         = np.full((size, NUM_GHOSTS), 32, dtype=np.int64)
+		self.ghostCol: np.ndarray         = np.full((size, NUM_GHOSTS), 32, dtype=np.int64)
+		self.ghostRowDir: np.ndarray      = np.zeros((size, NUM_GHOSTS), dtype=np.int64)
+		self.ghostColDir: np.ndarray      = np.zeros((size, NUM_GHOSTS), dtype=np.int64)
+		self.frightSteps: np.ndarray      = np.zeros((size, NUM_GHOSTS), dtype=np.int64)
+		self.spawning: np.ndarray         = np.ones((size, NUM_GHOSTS), dtype=bool)
+		self.plannedDirection: np.ndarray = np.full((size, NUM_GHOSTS), Directions.NONE, dtype=np.int64)
+
+		# Pellet info (one 32-bit bitset per row, as in GameState)
+		self.pelletArr: np.ndarray        = np.zeros((size, 31), dtype=np.uint32)
+		self.pelletCount: np.ndarray      = np.zeros(size, dtype=np.int64)
+		self.superPelletCount: np.ndarray = np.zeros(size, dtype=np.int64)
+
+		# Zobrist hash of each candidate
+		self.zobrist: np.ndarray = np.zeros(size, dtype=np.uint64)
+
+	def __len__(self) -> int:
+		return len(self.currTicks)
+
+	@classmethod
+	def fromSnapshots(cls, snapshots: list[tuple], updatePeriod: int = 12) -> 'BatchGameState':
+		'''
+		Construct a batch from game state snapshots (see GameState.snapshot)
+		'''
+
+		batch = cls(len(snapshots), updatePeriod)
+		if not snapshots:
+			return batch
+
+		# Transpose the snapshots, leaving out the pellets and the hash
+		fields = np.array([snapshot[:40] for snapshot in snapshots], dtype=np.int64)
+		(
+			batch.currTicks, batch.gameMode, batch.modeSteps, batch.modeDuration,
+			batch.currScore,
+			batch.fruitSteps, batch.fruitRow, batch.fruitCol,
+			batch.pacmanRow, batch.pacmanCol, batch.pacmanRowDir, batch.pacmanColDir
+		) = fields[:, :12].T.copy()
+
+		# Ghost info (seven fields per ghost)
+		ghostFields = fields[:, 12:40].reshape(-1, NUM_GHOSTS, 7)
+		batch.ghostRow         = ghostFields[:, :, 0].copy()
+		batch.ghostCol         = ghostFields[:, :, 1].copy()
+		batch.ghostRowDir      = ghostFields[:, :, 2].copy()
+		batch.ghostColDir      = ghostFields[:, :, 3].copy()
+		batch.frightSteps      = ghostFields[:, :, 4].copy()
+		batch.spawning         = ghostFields[:, :, 5].astype(bool)
+		batch.plannedDirection = ghostFields[:, :, 6].copy()
+
+		# Pellet info
+		batch.pelletArr        = np.array([snapshot[40] for snapshot in snapshots], dtype=np.uint32)
+		batch.pelletCount      = np.array([snapshot[41] for snapshot in snapshots], dtype=np.int64)
+		batch.superPelletCount = np.array([snapshot[42] for snapshot in snapshots], dtype=np.int64)
+
+		# Hash of each state
+		batch.zobrist = np.array([snapshot[43] for snapshot in snapshots], dtype=np.uint64)
+
+		return batch
+
+	@classmethod
+	def fromState(cls, state: GameState, size: int = 1) -> 'BatchGameState':
+		'''
+		Construct a batch of identical copies of a game state
+		'''
+
+		return cls.fromSnapshots([state.snapshot()] * size, state.updatePeriod)
+
+	def snapshot(self, index: int) -> tuple:
+		'''
+		Snapshot of one candidate, in the same format as GameState.snapshot
+		(so that it can be restored into a game state)
+		'''
+
+		ghostFields: list = []
+		for color in range(NUM_GHOSTS):
+			ghostFields += [
+				int(self.ghostRow[index, color]), int(self.ghostCol[index, color]),
+				int(self.ghostRowDir[index, color]), int(self.ghostColDir[index, color]),
+				int(self.frightSteps[index, color]), bool(self.spawning[index, color]),
+				Directions(self.plannedDirection[index, color])
+			]
+
+		return (
+			int(self.currTicks[index]), GameModes(self.gameMode[index]),
+			int(self.modeSteps[index]), int(self.modeDuration[index]),
+			int(self.currScore[index]),
+			int(self.fruitSteps[index]), int(self.fruitRow[index]), int(self.fruitCol[index]),
+			int(self.pacmanRow[index]), int(self.pacmanCol[index]),
+			int(self.pacmanRowDir[index]), int(self.pacmanColDir[index]),
+			*ghostFields,
+			tuple(self.pelletArr[index].tolist()), int(self.pelletCount[index]),
+			int(self.superPelletCount[index]),
+			int(self.zobrist[index])
+		)
+
+	def take(self, indices: np.ndarray) -> 'BatchGameState':
+		'''
+		Construct a new batch from some of the candidates of this one (in any
+		order, with repeats), e.g. one copy of each candidate per action
+		'''
+
+		batch = BatchGameState.__new__(BatchGameState)
+		batch.updatePeriod = self.updatePeriod
+		for field in BatchGameState.__slots__[1:]:
+			setattr(batch, field, getattr(self, field)[indices])
+		return batch
+
+	def ghostZobrist(self, sel: np.ndarray, color: int) -> np.ndarray:
+		'''
+		Contribution of one ghost to the Zobrist hash, for selected candidates
+		'''
+
+		direction = DELTA_DIRECTIONS_ARR[
+			((self.ghostRowDir[sel, color] & 0x03) << 2) | (self.ghostColDir[sel, color] & 0x03)
+		]
+		location = (((self.ghostRow[sel, color] & 0x3f) << 6) | (self.ghostCol[sel, color] & 0x3f)) * 5 + direction
+		return ZOBRIST_GHOST_ARR[color][location] ^ \
+			ZOBRIST_FRIGHT_ARR[color][self.frightSteps[sel, color] & 0x3f] ^ \
+			np.where(self.spawning[sel, color], ZOBRIST_SPAWNING_ARR[color], np.uint64(0))
+
+	def pacmanZobrist(self, sel: np.ndarray) -> np.ndarray:
+		'''
+		Contribution of Pacman to the Zobrist hash, for selected candidates
+		'''
+
+		direction = DELTA_DIRECTIONS_ARR[
+			((self.pacmanRowDir[sel] & 0x03) << 2) | (self.pacmanColDir[sel] & 0x03)
+		]
+		location = (((self.pacmanRow[sel] & 0x3f) << 6) | (self.pacmanCol[sel] & 0x3f)) * 5 + direction
+		return ZOBRIST_PACMAN_ARR[location]
+
+	def guessGhostPlans(self, sel: np.ndarray, ghosts: np.ndarray | None = None) -> None:
+		'''
+		Predict where the ghosts (all of them, or those in a mask with one row per
+		selected candidate) might aim at the next step, for selected candidates
+		(see GameState.guessGhostPlans)
+		'''
+
+		# Pacman info
+		pacmanRow = self.pacmanRow[sel, None]
+		pacmanCol = self.pacmanCol[sel, None]
+		pacmanRowDir = self.pacmanRowDir[sel, None]
+		pacmanColDir = self.pacmanColDir[sel, None]
+
+		# Red ghost's location
+		redRow = self.ghostRow[sel, GhostColors.RED, None]
+		redCol = self.ghostCol[sel, GhostColors.RED, None]
+
+		# Ghost info
+		row = self.ghostRow[sel]
+		col = self.ghostCol[sel]
+		rowDir = self.ghostRowDir[sel]
+		colDir = self.ghostColDir[sel]
+
+		# Ghosts to plan: not spawning, and not at an empty location
+		planned = ~self.spawning[sel] & (row < 32) & (col < 32)
+		if ghosts is not None:
+			planned &= ghosts
+
+		# Row and column at the next step (every neighbor of a cell off the grid is
+		# a wall, so ghosts moving off the grid will choose up)
+		nextRow = row + rowDir
+		nextCol = col + colDir
+		nextInGrid = inGrid(nextRow, nextCol)
+		heading = DELTA_DIRECTIONS_ARR[((rowDir & 0x03) << 2) | (colDir & 0x03)]
+		index = np.where(nextInGrid, cellIndex(nextRow, nextCol) * 5 + heading, 0)
+
+		# Chase mode targets, based on the ghost colors (the pink target matches
+		# the original row/column mix-up in GameState.guessGhostPlans)
+		distSqToPacman = (nextRow - pacmanRow) * (nextRow - pacmanRow) + \
+											(nextCol - pacmanCol) * (nextCol - pacmanCol)
+		orangeNear = distSqToPacman[:, GhostColors.ORANGE] < 64
+		targetRow = np.column_stack((
+			pacmanRow[:, 0],
+			pacmanCol[:, 0] + 4 * pacmanColDir[:, 0],
+			2 * pacmanRow[:, 0] + 4 * pacmanRowDir[:, 0] - redRow[:, 0],
+			np.where(orangeNear, pacmanRow[:, 0], SCATTER_ROW[GhostColors.ORANGE])
+		))
+		targetCol = np.column_stack((
+			pacmanCol[:, 0],
+			np.zeros_like(pacmanCol[:, 0]),
+			2 * pacmanCol[:, 0] + 4 * pacmanColDir[:, 0] - redCol[:, 0],
+			np.where(orangeNear, pacmanCol[:, 0], SCATTER_COL[GhostColors.ORANGE])
+		))
+
+		# Scatter mode targets are fixed, and other modes target the origin
+		gameMode = self.gameMode[sel, None]
+		targetRow = np.where(gameMode == GameModes.SCATTER, SCATTER_ROW_ARR,
+			np.where(gameMode == GameModes.CHASE, targetRow, 0))
+		targetCol = np.where(gameMode == GameModes.SCATTER, SCATTER_COL_ARR,
+			np.where(gameMode == GameModes.CHASE, targetCol, 0))
+
+		# Compare the candidate moves in order (see chooseGhostMove), keeping the
+		# direction closest to the target, and the one a frightened ghost chooses
+		minDist = np.full(row.shape, 0xfffffff, dtype=np.int64)
+		maxDist = np.full(row.shape, -1, dtype=np.int64)
+		minDir = np.zeros(row.shape, dtype=np.int64)
+		maxDir = np.zeros(row.shape, dtype=np.int64)
+		for direction in MOVE_DIRECTIONS:
+			valid = GHOST_MOVE_VALID[index, direction] & nextInGrid
+			newRow = GHOST_MOVE_ROW[index, direction]
+			newCol = GHOST_MOVE_COL[index, direction]
+			distSqToTarget = (newRow - targetRow) * (newRow - targetRow) + \
+												(newCol - targetCol) * (newCol - targetCol)
+			closer = valid & (distSqToTarget < minDist)
+			farther = valid & ~closer & (distSqToTarget >= maxDist)
+			minDir[closer] = direction
+			minDist[closer] = distSqToTarget[closer]
+			maxDir[farther] = direction
+			maxDist[farther] = distSqToTarget[farther]
+
+		# Update the best direction to be the plan
+		plan = np.where(self.frightSteps[sel] > 0, maxDir, minDir)
+		self.plannedDirection[sel] = np.where(planned, plan, self.plannedDirection[sel])
+
+	def safetyCheck(self, sel: np.ndarray) -> np.ndarray:
+		'''
+		Check whether Pacman is safe, for selected candidates, 'respawning'
+		frightened ghosts that Pacman collides with (see GameState.safetyCheck)
+
+		Returns: a mask of the selected candidates that are safe
+		'''
+
+		pacmanRow = self.pacmanRow[sel]
+		pacmanCol = self.pacmanCol[sel]
+		pacmanInGrid = (pacmanRow < 31) & (pacmanCol < 28)
+
+		# Check the ghosts in order, as the check stops at the first collision
+		# with a non-frightened ghost
+		safe = np.ones(len(sel), dtype=bool)
+		for color in range(NUM_GHOSTS):
+			collided = safe & pacmanInGrid & (self.ghostRow[sel, color] == pacmanRow) & \
+				(self.ghostCol[sel, color] == pacmanCol)
+			frightened = self.frightSteps[sel, color] > 0
+			safe &= ~(collided & ~frightened)
+
+			# 'Respawn' the frightened ghosts
+			respawned = sel[collided & frightened]
+			self.zobrist[respawned] ^= self.ghostZobrist(respawned, color)
+			self.spawning[respawned, color] = True
+			self.zobrist[respawned] ^= self.ghostZobrist(respawned, color)
+
+		return safe
+
+	def moveGhosts(self, sel: np.ndarray) -> None:
+		'''
+		Update the ghost positions (and reduce frightened steps if applicable),
+		for selected candidates (see Ghost.move)
+		'''
+
+		for color in range(NUM_GHOSTS):
+
+			# Spawning ghosts do not move
+			moved = sel[~self.spawning[sel, color]]
+			self.zobrist[moved] ^= self.ghostZobrist(moved, color)
+
+			# Advance the ghost's location, if it is in the grid and not blocked
+			row = self.ghostRow[moved, color]
+			col = self.ghostCol[moved, color]
+			heading = DELTA_DIRECTIONS_ARR[
+				((self.ghostRowDir[moved, color] & 0x03) << 2) | (self.ghostColDir[moved, color] & 0x03)
+			]
+			rowColInGrid = inGrid(row, col)
+			newCell = np.where(rowColInGrid,
+				NEXT_CELL_ARR[np.where(rowColInGrid, cellIndex(row, col), 0) * 5 + heading], NO_CELL)
+			advanced = newCell != NO_CELL
+			self.ghostRow[moved, color] = np.where(advanced, newCell // 28, row)
+			self.ghostCol[moved, color] = np.where(advanced, newCell % 28, col)
+
+			# Set the current direction to the guess of the planned direction
+			plannedDirection = self.plannedDirection[moved, color]
+			self.ghostRowDir[moved, color] = D_ROW_ARR[plannedDirection]
+			self.ghostColDir[moved, color] = D_COL_ARR[plannedDirection]
+
+			# If the ghost is frightened, drop its steps by 1
+			frightSteps = self.frightSteps[moved, color]
+			self.frightSteps[moved, color] = np.where(frightSteps > 0, frightSteps - 1, frightSteps)
+
+			self.zobrist[moved] ^= self.ghostZobrist(moved, color)
+
+	def updateMode(self, sel: np.ndarray) -> None:
+		'''
+		Update the mode steps counter, and change the mode if necessary, for
+		selected candidates
+		'''
+
+		gameMode = self.gameMode[sel]
+		modeSteps = self.modeSteps[sel]
+		self.zobrist[sel] ^= ZOBRIST_MODE_ARR[gameMode * 256 + modeSteps]
+		modeSteps = np.where(modeSteps > 0, modeSteps - 1, modeSteps)
+
+		# Scatter -> Chase, or Chase -> Scatter
+		modeOver = (modeSteps == 0)
+		toChase = modeOver & (gameMode == GameModes.SCATTER)
+		toScatter = modeOver & (gameMode == GameModes.CHASE) & (self.pelletCount[sel] > 20)
+		self.gameMode[sel] = np.where(toChase, GameModes.CHASE,
+			np.where(toScatter, GameModes.SCATTER, gameMode))
+		modeSteps = np.where(toChase, 175, np.where(toScatter, 65, modeSteps))
+		self.modeSteps[sel] = modeSteps
+		self.modeDuration[sel] = np.where(toChase, 175,
+			np.where(toScatter, 65, self.modeDuration[sel]))
+
+		# Reverse the planned directions of all ghosts
+		modeChanged = sel[modeOver]
+		self.plannedDirection[modeChanged] = REVERSED_ARR[self.plannedDirection[modeChanged]]
+
+		self.zobrist[sel] ^= ZOBRIST_MODE_ARR[self.gameMode[sel] * 256 + modeSteps]
+
+	def collectPellets(self, sel: np.ndarray) -> None:
+		'''
+		Collect the pellets under Pacman, for selected candidates (see
+		GameState.collectPellet)
+		'''
+
+		row = self.pacmanRow[sel]
+		col = self.pacmanCol[sel]
+		collected = ((self.pelletArr[sel, row] >> col.astype(np.uint32)) & 1).astype(bool)
+		sel, row, col = sel[collected], row[collected], col[collected]
+
+		# Determine the type of pellet (super / normal)
+		superPellet = ((row == 3) | (row == 23)) & ((col == 1) | (col == 26))
+
+		# Remove the pellet at this location
+		self.pelletArr[sel, row] &= ~(np.uint32(1) << col.astype(np.uint32))
+		self.pelletCount[sel] -= 1
+		self.superPelletCount[sel] -= superPellet
+		self.zobrist[sel] ^= ZOBRIST_PELLET_ARR[((row & 0x3f) << 6) | (col & 0x3f)]
+
+		# Increase the score by this amount
+		self.currScore[sel] += np.where(superPellet, 50, 10)
+
+		# Spawn the fruit based on the number of pellets, if applicable
+		fruit = sel[(self.pelletCount[sel] == 174) | (self.pelletCount[sel] == 74)]
+		self.fruitSteps[fruit] = 30
+		self.fruitRow[fruit] = 17
+		self.fruitCol[fruit] = 13
+
+		# Scare the ghosts, if applicable
+		scared = sel[superPellet]
+		for color in range(NUM_GHOSTS):
+			self.zobrist[scared] ^= self.ghostZobrist(scared, color)
+			self.frightSteps[scared, color] = 40
+			self.zobrist[scared] ^= self.ghostZobrist(scared, color)
+		self.plannedDirection[scared] = REVERSED_ARR[self.plannedDirection[scared]]
+
+	def simulateAction(self, numTicks: int | np.ndarray, pacmanDir: int | np.ndarray) -> np.ndarray:
+		'''
+		Advance every candidate as in GameState.simulateAction, with a number of
+		ticks and Pacman direction per candidate (or shared by all of them)
+
+		Returns: a mask of the candidates for which this action is safe
+		'''
+
+		size = len(self)
+		numTicks = np.broadcast_to(np.asarray(numTicks, dtype=np.int64), size)
+		pacmanDir = np.broadcast_to(np.asarray(pacmanDir, dtype=np.int64), size)
+		result = np.ones(size, dtype=bool)
+
+		# Candidates that have not returned yet
+		active = np.arange(size)
+
+		# Try to plan the ghost directions if we expect them to be none
+		self.guessGhostPlans(active, self.plannedDirection == Directions.NONE)
+
+		# Number of updates (every updatePeriod ticks) during the action
+		firstUpdateTick = self.updatePeriod - (self.currTicks % self.updatePeriod)
+		numUpdates = np.maximum(0, (numTicks - firstUpdateTick) // self.updatePeriod + 1)
+
+		for update in range(int(numUpdates.max(initial=0))):
+			sel = active[numUpdates[active] > update]
+
+			# Update the ghost positions
+			self.moveGhosts(sel)
+
+			# Return if Pacman collides with a non-frightened ghost
+			safe = self.safetyCheck(sel)
+			result[sel[~safe]] = False
+			active = np.setdiff1d(active, sel[~safe], assume_unique=True)
+			sel = sel[safe]
+
+			# Update the mode steps counter, and guess the next ghost moves
+			self.updateMode(sel)
+			self.guessGhostPlans(sel)
+
+		# Set the direction of Pacman, as chosen, and try to move one step
+		sel = active[pacmanDir[active] != Directions.NONE]
+		self.zobrist[sel] ^= self.pacmanZobrist(sel)
+		direction = pacmanDir[sel]
+		pacmanPrevDir = DELTA_DIRECTIONS_ARR[
+			((self.pacmanRowDir[sel] & 0x03) << 2) | (self.pacmanColDir[sel] & 0x03)
+		]
+		row = self.pacmanRow[sel]
+		col = self.pacmanCol[sel]
+		rowColInGrid = inGrid(row, col)
+		newCell = np.where(rowColInGrid,
+			NEXT_CELL_ARR[np.where(rowColInGrid, cellIndex(row, col), 0) * 5 + direction], NO_CELL)
+		advanced = newCell != NO_CELL
+
+		# If Pacman could not move, restore its direction and return
+		direction = np.where(advanced, direction, pacmanPrevDir)
+		self.pacmanRowDir[sel] = D_ROW_ARR[direction]
+		self.pacmanColDir[sel] = D_COL_ARR[direction]
+		self.pacmanRow[sel] = np.where(advanced, newCell // 28, row)
+		self.pacmanCol[sel] = np.where(advanced, newCell % 28, col)
+		self.zobrist[sel] ^= self.pacmanZobrist(sel)
+		result[sel[~advanced]] = False
+		active = np.setdiff1d(active, sel[~advanced], assume_unique=True)
+		sel = sel[advanced]
+
+		# Collect pellets, and return if there are no pellets left
+		self.collectPellets(sel)
+		active = np.setdiff1d(active, sel[self.pelletCount[sel] == 0], assume_unique=True)
+
+		# Return if Pacman collides with a non-frightened ghost
+		safe = self.safetyCheck(active)
+		result[active[~safe]] = False
+		active = active[safe]
+
+		# Increment the number of ticks by the chosen amount
+		self.currTicks[active] += numTicks[active]
+
+		return result
@@ -0,0 +1,431 @@
+# Argument parsing (for choosing benchmarks)
+import argparse
+
+# Asyncio (for running the policy)
+import asyncio
+
+# Time and memory measurement
+import time
+import tracemalloc
+
+# Heap queues (for replaying A-Star frontiers)
+import heapq
+
+# Game state
+from gameState import *
+
+# A-Star Policy
+from policies.astar.aStarPolicy import *
+
+# A-Star Policy module (for recording its frontier operations)
+import policies.astar.aStarPolicy as aStarPolicy
+
+# Batched simulator
+from batchSimulator import BatchGameState
+
+# Bitboards
+import bitboard
+
+# Initial pellets (identical to initPellets in the server code)
+INIT_PELLETS: list[int] = [
+	0b0000_0000000000000000000000000000, # row 0
+	0b0000_0111111111111001111111111110, # row 1
+	0b0000_0100001000001001000001000010, # row 2
+	0b0000_0100001000001001000001000010, # row 3
+	0b0000_0100001000001001000001000010, # row 4
+	0b0000_0111111111111111111111111110, # row 5
+	0b0000_0100001001000000001001000010, # row 6
+	0b0000_0100001001000000001001000010, # row 7
+	0b0000_0111111001111001111001111110, # row 8
+	0b0000_0000001000000000000001000000, # row 9
+	0b0000_0000001000000000000001000000, # row 10
+	0b0000_0000001000000000000001000000, # row 11
+	0b0000_0000001000000000000001000000, # row 12
+	0b0000_0000001000000000000001000000, # row 13
+	0b0000_0000001000000000000001000000, # row 14
+	0b0000_0000001000000000000001000000, # row 15
+	0b0000_0000001000000000000001000000, # row 16
+	0b0000_0000001000000000000001000000, # row 17
+	0b0000_0000001000000000000001000000, # row 18
+	0b0000_0000001000000000000001000000, # row 19
+	0b0000_0111111111111001111111111110, # row 20
+	0b0000_0100001000001001000001000010, # row 21
+	0b0000_0100001000001001000001000010, # row 22
+	0b0000_0111001111111001111111001110, # row 23
+	0b0000_0001001001000000001001001000, # row 24
+	0b0000_0001001001000000001001001000, # row 25
+	0b0000_0111111001111001111001111110, # row 26
+	0b0000_0100000000001001000000000010, # row 27
+	0b0000_0100000000001001000000000010, # row 28
+	0b0000_0111111111111111111111111110, # row 29
+	0b0000_0000000000000000000000000000  # row 30
+]
+
+def initialFrame() -> bytes:
+	'''
+	Serialization of the game state at the start of a game (as sent by the server)
+	'''
+
+	state = GameState()
+	state.gameMode = GameModes.SCATTER
+	state.modeSteps = 65
+	state.modeDuration = 65
+	state.pelletArr = list(INIT_PELLETS)
+
+	# Pacman spawns facing right
+	state.pacmanLoc.row, state.pacmanLoc.col = 23, 13
+	state.pacmanLoc.setDirection(Directions.RIGHT)
+
+	# Only the red ghost starts outside of the ghost house
+	spawns = [(11, 13, Directions.LEFT), (13, 13, Directions.DOWN), (14, 11, Directions.UP), (14, 15, Directions.UP)]
+	for ghost, (row, col, direction) in zip(state.ghosts, spawns):
+		ghost.location.row, ghost.location.col = row, col
+		ghost.location.setDirection(direction)
+		ghost.spawning = (ghost.color != GhostColors.RED)
+
+	# No fruit
+	state.fruitLoc.row, state.fruitLoc.col = 32, 32
+
+	return state.serialize()
+
+async def recordFrames(numFrames: int) -> list[bytes]:
+	'''
+	Record game states by letting the policy play against the simulator
+	'''
+
+	state = GameState()
+	state.update(initialFrame())
+	policy = AStarPolicy(state, newLocation(5, 21, state), reuseTree=False, planCacheSize=0)
+	victimColor, pelletTarget = GhostColors.NONE, newLocation(23, 6, state)
+
+	frames: list[bytes] = []
+	while len(frames) < numFrames:
+		frame = state.serialize()
+		frames.append(frame)
+
+		# Plan, then play the first queued action from the recorded state
+		state.writeServerBuf.clear()
+		victimColor, pelletTarget = await policy.act(4, victimColor, pelletTarget)
+		state.update(frame, lockOverride=True)
+		if not state.writeServerBuf:
+			state.update(initialFrame(), lockOverride=True)
+			continue
+		message = state.writeServerBuf[0]
+		direction = Directions(D_MESSAGES.index(message.getBytes()))
+		for _ in range(message.dist):
+			if not state.simulateAction(4, direction):
+				break
+
+		# Start over once the game is over
+		if not state.numPellets() or not state.safetyCheck():
+			state.update(initialFrame(), lockOverride=True)
+
+	return frames
+
+def nodeBytes(frame: bytes, numNodes: int = 5000) -> float:
+	'''
+	Average memory used by one A-Star node (including its game state copy)
+	'''
+
+	state = GameState()
+	state.update(frame)
+	parent = AStarNode(state.snapshot(), fCost = 0, gCost = 0, bufLength = 6)
+
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	nodes = [
+		AStarNode(
+			state.snapshot(),
+			fCost = 0,
+			gCost = 0,
+			parent = parent,
+			direction = Directions.UP,
+			delay = 4,
+			bufLength = 7
+		) for _ in range(numNodes)
+	]
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+
+	del nodes
+	return (after - before) / numNodes
+
+async def benchNodes(
+	frames: list[bytes],
+	repeat: int,
+	macroActions: bool = False,
+	pruneTraps: bool = False
+) -> None:
+	'''
+	Measure the memory per node and the search throughput of the A-Star policy
+	(optionally in macro-action mode, running corridors to the next junction,
+	and pruning moves into traps)
+	'''
+
+	# Each frame is searched from scratch (no reused trees or cached plans)
+	state = GameState()
+	policy = AStarPolicy(
+		state, newLocation(5, 21, state), reuseTree=False, planCacheSize=0,
+		macroActions=macroActions, pruneTraps=pruneTraps
+	)
+
+	# Keep the best of several runs, to reduce timing noise
+	elapsed = float('inf')
+	for _ in range(repeat):
+		victimColor, pelletTarget = GhostColors.NONE, newLocation(23, 6, state)
+		totalNodes = 0
+		totalExpanded = 0
+		totalPruned = 0
+		start = time.perf_counter()
+		for frame in frames:
+			state.update(frame, lockOverride=True)
+			state.writeServerBuf.clear()
+			victimColor, pelletTarget = await policy.act(4, victimColor, pelletTarget)
+			totalNodes += policy.numNodes
+			totalExpanded += policy.numExpanded
+			totalPruned += policy.numPruned
+		elapsed = min(elapsed, time.perf_counter() - start)
+
+	print(f'bytes per node:   {nodeBytes(frames[0]):10.1f}')
+	print(f'nodes per second: {totalNodes / elapsed:10.1f} ({totalNodes} nodes, {len(frames)} searches)')
+	print(f'ms per search:    {1000 * elapsed / len(frames):10.2f}')
+	print(f'nodes per search: {totalNodes / len(frames):10.1f} ({totalExpanded / len(frames):.1f} expanded, ' + \
+		f'{totalPruned / len(frames):.1f} pruned)')
+
+def benchFrames(frames: list[bytes], repeat: int, passes: int = 100) -> None:
+	'''
+	Measure how fast server frames are decoded into the game state
+	'''
+
+	state = GameState()
+
+	# New frames are fully decoded, while repeated frames are skipped; keep the
+	# best of several runs, to reduce timing noise
+	for label, copies in (('new', 1), ('repeated', 10)):
+		elapsed = float('inf')
+		for _ in range(repeat):
+			start = time.perf_counter()
+			for _ in range(passes):
+				for frame in frames:
+					for _ in range(copies):
+						state.update(frame)
+			elapsed = min(elapsed, time.perf_counter() - start)
+		numFrames = passes * len(frames) * copies
+		print(f'{label} frames per second: {numFrames / elapsed:12.1f}')
+
+def benchBatch(frames: list[bytes], repeat: int, copies: int = 10) -> None:
+	'''
+	Measure how fast candidate states are simulated one at a time, compared to
+	all at once with the batched simulator
+	'''
+
+	# One candidate per recorded state and direction (several copies of each)
+	state = GameState()
+	snapshots: list[tuple] = []
+	for frame in frames:
+		state.update(frame)
+		snapshots += [state.snapshot()] * (5 * copies)
+	directions = [direction for direction in Directions] * (len(snapshots) // 5)
+
+	# Keep the best of several runs, to reduce timing noise
+	scalarElapsed = float('inf')
+	batchElapsed = float('inf')
+	for _ in range(repeat):
+		start = time.perf_counter()
+		for snapshot, direction in zip(snapshots, directions):
+			state.restore(snapshot)
+			state.simulateAction(4, direction)
+		scalarElapsed = min(scalarElapsed, time.perf_counter() - start)
+
+		start = time.perf_counter()
+		batch = BatchGameState.fromSnapshots(snapshots, state.updatePeriod)
+		batch.simulateAction(4, directions)
+		batchElapsed = min(batchElapsed, time.perf_counter() - start)
+
+	print(f'scalar steps per second: {len(snapshots) / scalarElapsed:12.1f}')
+	print(f'batch steps per second:  {len(snapshots) / batchElapsed:12.1f} ({len(snapshots)} candidates)')
+
+def reachCells(state: GameState, steps: int) -> set[int]:
+	'''
+	Cells which the ghosts could reach within a number of steps, as in
+	bitboard.ghostReach, with a BFS over single cells
+	'''
+
+	frontier = [
+		ghost.location.row * 28 + ghost.location.col for ghost in state.ghosts
+		if not ghost.spawning and not ghost.isFrightened() and
+			(0 <= ghost.location.row < 31) and (0 <= ghost.location.col < 28)
+	]
+	reach = set(frontier)
+	for _ in range(steps):
+		nextFrontier = []
+		for cell in frontier:
+			for direction in MOVE_DIRECTIONS:
+				nextCell = NEXT_CELL[cell * 5 + direction]
+				if (nextCell != NO_CELL) and (nextCell not in reach):
+					reach.add(nextCell)
+					nextFrontier.append(nextCell)
+		frontier = nextFrontier
+	return reach
+
+def benchFlood(frames: list[bytes], repeat: int, steps: int = 8) -> None:
+	'''
+	Measure how fast the ghost reach sets are found cell by cell, compared to
+	with bitboards
+	'''
+
+	states: list[GameState] = []
+	for frame in frames:
+		states.append(GameState())
+		states[-1].update(frame)
+
+	# Keep the best of several runs, to reduce timing noise
+	cellElapsed = float('inf')
+	boardElapsed = float('inf')
+	for _ in range(repeat):
+		start = time.perf_counter()
+		for state in states:
+			reachCells(state, steps)
+		cellElapsed = min(cellElapsed, time.perf_counter() - start)
+
+		start = time.perf_counter()
+		for state in states:
+			bitboard.ghostReach(state, steps)
+		boardElapsed = min(boardElapsed, time.perf_counter() - start)
+
+	print(f'cell reach sets per second:     {len(states) / cellElapsed:12.1f}')
+	print(f'bitboard reach sets per second: {len(states) / boardElapsed:12.1f} ({steps} steps)')
+
+class HeapNode:
+	'''
+	Frontier entry ordered by a Python-level comparison, as A-Star nodes were
+	before the frontier held (f-cost, creation order, node) tuples
+	'''
+
+	__slots__ = ('fCost',)
+
+	def __init__(self, fCost: int) -> None:
+		self.fCost = fCost
+
+	def __lt__(self, other) -> bool: # type: ignore
+		return self.fCost < other.fCost # type: ignore
+
+async def recordHeapOps(frames: list[bytes]) -> list[list[int | None]]:
+	'''
+	Record the frontier operations of the A-Star policy on each game state:
+	the f-cost of each push, or None for a pop (a cleared frontier is
+	replayed as pops)
+	'''
+
+	state = GameState()
+	policy = AStarPolicy(state, newLocation(5, 21, state), reuseTree=False, planCacheSize=0)
+	traces: list[list[int | None]] = []
+	trace: list[int | None] = []
+	frontierSize = 0
+
+	# Wrap the heap functions used by the policy, to log each operation
+	def push(heap: list, item: tuple) -> None:
+		nonlocal frontierSize
+		trace.extend([None] * (frontierSize - len(heap)))
+		trace.append(item[0])
+		heapq.heappush(heap, item)
+		frontierSize = len(heap)
+
+	def pop(heap: list) -> tuple:
+		nonlocal frontierSize
+		trace.extend([None] * (frontierSize - len(heap)))
+		trace.append(None)
+		item = heapq.heappop(heap)
+		frontierSize = len(heap)
+		return item
+
+	aStarPolicy.heappush, aStarPolicy.heappop = push, pop
+	try:
+		victimColor, pelletTarget = GhostColors.NONE, newLocation(23, 6, state)
+		for frame in frames:
+			trace, frontierSize = [], 0
+			state.update(frame, lockOverride=True)
+			state.writeServerBuf.clear()
+			victimColor, pelletTarget = await policy.act(4, victimColor, pelletTarget)
+			traces.append(trace)
+	finally:
+		aStarPolicy.heappush, aStarPolicy.heappop = heapq.heappush, heapq.heappop
+
+	return traces
+
+async def benchHeap(frames: list[bytes], repeat: int, passes: int = 10) -> None:
+	'''
+	Measure how fast recorded A-Star frontier operations are replayed, with
+	nodes compared in Python and with (f-cost, creation order, node) tuples
+	'''
+
+	traces = await recordHeapOps(frames)
+	numOps = passes * sum(len(trace) for trace in traces)
+
+	def replayNodes() -> None:
+		for trace in traces:
+			heap: list[HeapNode] = []
+			for fCost in trace:
+				if fCost is None:
+					if heap:
+						heapq.heappop(heap)
+				else:
+					heapq.heappush(heap, HeapNode(fCost))
+
+	def replayTuples() -> None:
+		for trace in traces:
+			heap: list[tuple[int, int, HeapNode]] = []
+			for order, fCost in enumerate(trace):
+				if fCost is None:
+					if heap:
+						heapq.heappop(heap)
+				else:
+					heapq.heappush(heap, (fCost, order, HeapNode(fCost)))
+
+	# Keep the best of several runs, to reduce timing noise
+	for label, replay in (('node', replayNodes), ('tuple', replayTuples)):
+		elapsed = float('inf')
+		for _ in range(repeat):
+			start = time.perf_counter()
+			for _ in range(passes):
+				replay()
+			elapsed = min(elapsed, time.perf_counter() - start)
+		print(f'{label} heap ops per second: {numOps / elapsed:12.1f}')
+
+# Names of the available benchmarks
+BENCHMARKS: list[str] = ['nodes', 'frames', 'batch', 'heap', 'flood']
+
+async def main() -> None:
+
+	parser = argparse.ArgumentParser(description='Benchmarks for the Pacbot client')
+	parser.add_argument('benchmarks', nargs='*', help=f'benchmarks to run: {", ".join(BENCHMARKS)} (default: all)')
+	parser.add_argument('-n', '--frames', type=int, default=100, help='number of recorded game states')
+	parser.add_argument('-r', '--repeat', type=int, default=5, help='runs per benchmark (the best is kept)')
+	parser.add_argument('--macro', action='store_true', help='search in macro-action mode (for the nodes benchmark)')
+	parser.add_argument('--prune-traps', action='store_true', help='prune moves into traps (for the nodes benchmark)')
+	args = parser.parse_args()
+
+	for name in args.benchmarks:
+		if name not in BENCHMARKS:
+			parser.error(f'unknown benchmark: {name}')
+	benchmarks = args.benchmarks or BENCHMARKS
+
+	frames = await recordFrames(args.frames)
+
+	if 'nodes' in benchmarks:
+		await benchNodes(frames, args.repeat, args.macro, args.prune_traps)
+
+	if 'frames' in benchmarks:
+		benchFrames(frames, args.repeat)
+
+	if 'batch' in benchmarks:
+		benchBatch(frames, args.repeat)
+
+	if 'heap' in benchmarks:
+		await benchHeap(frames, args.repeat)
+
+	if 'flood' in benchmarks:
+		benchFlood(frames, args.repeat)
+
+if __name__ == '__main__':
+	asyncio.run(main())
@@ -0,0 +1,153 @@
+# Move table and maze dimensions
+from moveTable import NEXT_CELL, NO_CELL, NUM_COLS, NUM_ROWS
+
+# Internal representation of walls
+from walls import wallArr
+
+# Game state (for ghost reach sets)
+from gameState import GameState
+
+'''
+Bitboards: sets of cells packed into one integer, with 32 bits per row
+(bit row * 32 + col), matching the 32-bit row bitsets of wallArr and
+pelletArr; a step of a BFS frontier is a few whole-board shifts and masks
+(left and right by one bit, up and down by one row), rather than a loop over
+the cells of the frontier
+'''
+
+# Bits per row of a bitboard
+ROW_BITS: int = 32
+
+# Columns of the maze within a row
+ROW_MASK: int = (1 << NUM_COLS) - 1
+
+def pack(rows: list[int]) -> int:
+	'''
+	Pack row bitsets (such as pelletArr) into a bitboard
+	'''
+
+	board = 0
+	for row in range(NUM_ROWS - 1, -1, -1):
+		board = (board << ROW_BITS) | (rows[row] & ROW_MASK)
+	return board
+
+def unpack(board: int) -> list[int]:
+	'''
+	Unpack a bitboard into row bitsets
+	'''
+
+	return [(board >> (row * ROW_BITS)) & ROW_MASK for row in range(NUM_ROWS)]
+
+def cellBit(row: int, col: int) -> int:
+	'''
+	Bitboard of a single cell
+	'''
+
+	return 1 << (row * ROW_BITS + col)
+
+def bitCell(bit: int) -> int:
+	'''
+	Cell index (row * 28 + col) of a single-cell bitboard
+	'''
+
+	row, col = divmod(bit.bit_length() - 1, ROW_BITS)
+	return row * NUM_COLS + col
+
+# Open cells (no padding columns are open, so shifts across rows are masked)
+OPEN: int = pack([~walls for walls in wallArr])
+
+# Super pellet cells
+SUPER_PELLETS: int = cellBit(3, 1) | cellBit(3, 26) | cellBit(23, 1) | cellBit(23, 26)
+
+def expand(board: int, passable: int = OPEN) -> int:
+	'''
+	Cells at most one step away from a set of cells (moves within the
+	passable cells, open cells by default)
+	'''
+
+	return (board | (board << 1) | (board >> 1) | \
+		(board << ROW_BITS) | (board >> ROW_BITS)) & passable
+
+def reachWithin(start: int, steps: int, passable: int = OPEN) -> int:
+	'''
+	Cells reachable from a set of cells within a number of steps
+	'''
+
+	reach = start & passable
+	for _ in range(steps):
+		nextReach = expand(reach, passable)
+		if nextReach == reach:
+			break
+		reach = nextReach
+	return reach
+
+def floodFill(start: int, passable: int = OPEN) -> int:
+	'''
+	Cells reachable from a set of cells, in any number of steps
+	'''
+
+	return reachWithin(start, NUM_ROWS * NUM_COLS, passable)
+
+def nearestPellet(row: int, col: int, pelletArr: list[int]) -> int:
+	'''
+	Nearest normal pellet to a cell, without passing through super pellets,
+	breaking ties as a BFS from the cell would (by the order of the move
+	directions), or NO_CELL if there is none
+
+	Returns: the cell index (row * 28 + col) of the pellet
+	'''
+
+	pellets = pack(pelletArr) & OPEN
+	targets = pellets & ~SUPER_PELLETS
+	passable = OPEN & ~(pellets & SUPER_PELLETS)
+	start = cellBit(row, col) & OPEN
+	if not start:
+		return NO_CELL
+
+	# Expand BFS layers (paths may start on a super pellet, but not pass one)
+	passable |= start
+	layers = [start]
+	visited = start
+	frontier = start
+	while not (frontier & targets):
+		frontier = expand(frontier & passable) & ~visited
+		if not frontier:
+			return NO_CELL
+		visited |= frontier
+		layers.append(frontier)
+
+	# Walk back, to find the cells of each layer on a shortest path to a pellet
+	# (which can only pass through passable cells)
+	onPath = [0] * len(layers)
+	onPath[-1] = layers[-1] & targets
+	for index in range(len(layers) - 2, 0, -1):
+		onPath[index] = layers[index] & passable & expand(onPath[index + 1])
+
+	# Follow the first direction which stays on such a path, at each step
+	cell = row * NUM_COLS + col
+	for index in range(1, len(layers)):
+		for direction in range(4):
+			nextCell = NEXT_CELL[cell * 5 + direction]
+			if (nextCell != NO_CELL) and \
+				(onPath[index] >> ((nextCell // NUM_COLS) * ROW_BITS + nextCell % NUM_COLS)) & 1:
+				cell = nextCell
+				break
+
+	return cell
+
+def ghostReach(state: GameState, steps: int, frightened: bool = False) -> int:
+	'''
+	Cells which the ghosts that are out of the ghost house (and not
+	frightened, unless asked for) could reach within a number of steps
+	(ignoring that ghosts cannot turn around)
+	'''
+
+	start = 0
+	for ghost in state.ghosts:
+		location = ghost.location
+		if ghost.spawning or (ghost.isFrightened() and not frightened) or \
+			not ((0 <= location.row < NUM_ROWS) and (0 <= location.col < NUM_COLS)):
+			continue
+		start |= cellBit(location.row, location.col)
+
+	return reachWithin(start, steps)
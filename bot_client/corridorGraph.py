@@ -0,0 +1,154 @@
+# Move table and maze dimensions
+from moveTable import NEXT_CELL, NO_CELL, NUM_CELLS, NUM_COLS, NUM_ROWS
+
+# Internal representation of walls
+from walls import wallArr
+
+# Bitboards (for the pellets along corridors)
+from bitboard import cellBit
+
+'''
+Corridor graph: the maze compressed into junctions (open cells without
+exactly two open neighbors: intersections and dead ends) and corridors
+between them (runs of cells with exactly two open neighbors, which can only
+be walked through); a corridor is one edge of the graph, with its length,
+moves and a bitboard of its cells (for counting its pellets)
+'''
+
+# Sentinel for cells which do not continue a corridor
+NO_DIRECTION: int = -1
+
+def isOpen(cell: int) -> bool:
+	'''
+	Whether a cell is not a wall
+	'''
+
+	return not ((wallArr[cell // NUM_COLS] >> (cell % NUM_COLS)) & 1)
+
+def reverse(direction: int) -> int:
+	'''
+	Opposite of a move direction (up and down, left and right)
+	'''
+
+	return direction ^ 2
+
+def exits(cell: int) -> list[int]:
+	'''
+	Directions of the open neighbors of a cell (none for walls)
+	'''
+
+	if not isOpen(cell):
+		return []
+	return [direction for direction in range(4) if NEXT_CELL[cell * 5 + direction] != NO_CELL]
+
+def isJunction(cell: int) -> bool:
+	'''
+	Whether an open cell is a junction (any number of exits but two)
+	'''
+
+	return isOpen(cell) and (len(exits(cell)) != 2)
+
+def buildCorridorExits() -> list[int]:
+	'''
+	Build the direction in which to keep running through each corridor cell,
+	indexed by cell * 5 + the direction it was entered with (NO_DIRECTION for
+	junctions, walls, and directions which cannot enter the cell)
+	'''
+
+	table: list[int] = [NO_DIRECTION] * (NUM_CELLS * 5)
+	for cell in range(NUM_CELLS):
+		cellExits = exits(cell)
+		if len(cellExits) != 2:
+			continue
+		first, second = cellExits
+		table[cell * 5 + reverse(first)] = second
+		table[cell * 5 + reverse(second)] = first
+
+	return table
+
+# Direction to keep running through each corridor cell, built once on import
+CORRIDOR_EXIT: list[int] = buildCorridorExits()
+
+class Corridor:
+	'''
+	Edge of the corridor graph: the run from a cell in a direction to the
+	next junction (or back to the cell, for a loop without junctions)
+	'''
+
+	__slots__ = ('start', 'end', 'directions', 'cells', 'length', 'mask')
+
+	def __init__(self, start: int, direction: int) -> None:
+
+		# Cells at both ends of the corridor
+		self.start: int = start
+		self.end: int = start
+
+		# Moves along the corridor, and the cells they reach (the last is the end)
+		self.directions: list[int] = []
+		self.cells: list[int] = []
+
+		cell = start
+		while direction != NO_DIRECTION:
+			cell = NEXT_CELL[cell * 5 + direction]
+			self.directions.append(direction)
+			self.cells.append(cell)
+			if cell == start:
+				break
+			direction = CORRIDOR_EXIT[cell * 5 + direction]
+
+		self.end = cell
+		self.length: int = len(self.cells)
+
+		# Bitboard of the cells reached along the corridor
+		self.mask: int = 0
+		for cell in self.cells:
+			self.mask |= cellBit(cell // NUM_COLS, cell % NUM_COLS)
+
+	def numPellets(self, pellets: int) -> int:
+		'''
+		Number of pellets along the corridor, given a bitboard of the pellets
+		'''
+
+		return (self.mask & pellets).bit_count()
+
+	def __repr__(self) -> str:
+		return f'Corridor({divmod(self.start, NUM_COLS)} -> {divmod(self.end, NUM_COLS)}, length {self.length})'
+
+def buildGraph() -> dict[int, dict[int, Corridor]]:
+	'''
+	Build the corridors leaving each junction, by direction
+	'''
+
+	return {
+		cell: {direction: Corridor(cell, direction) for direction in exits(cell)}
+		for cell in range(NUM_CELLS) if isJunction(cell)
+	}
+
+# Corridors leaving each junction, by junction cell and direction
+GRAPH: dict[int, dict[int, Corridor]] = buildGraph()
+
+def corridorFrom(cell: int, direction: int) -> Corridor | None:
+	'''
+	Corridor from any open cell in a direction, up to the next junction
+	(None if the move is blocked)
+	'''
+
+	if not (0 <= cell < NUM_CELLS) or (NEXT_CELL[cell * 5 + direction] == NO_CELL):
+		return None
+	if cell in GRAPH:
+		return GRAPH[cell][direction]
+	return Corridor(cell, direction)
+
+def summary() -> str:
+	'''
+	Size of the corridor graph, compared to the open cells of the maze
+	'''
+
+	numOpen = sum(isOpen(cell) for cell in range(NUM_ROWS * NUM_COLS))
+	corridors = [corridor for edges in GRAPH.values() for corridor in edges.values()]
+	meanLength = sum(corridor.length for corridor in corridors) / max(len(corridors), 1)
+	return f'{numOpen} open cells, {len(GRAPH)} junctions, ' + \
+		f'{len(corridors)} corridors (mean length {meanLength:.1f})'
+
+if __name__ == '__main__':
+	print(summary())
@@ -1,15 +1,24 @@
 # Enum class (for game mode)
 from enum import IntEnum
 
+# Type hints
+from typing import Iterable
+
 # Struct class (for processing)
-from struct import unpack_from, pack
+from struct import Struct
 
 # Internal representation of walls
 from walls import wallArr
 
+# Precomputed moves between cells
+from moveTable import NEXT_CELL, NO_CELL, NUM_CELLS
+
 # Buffer to collect messages to write to the server
 from collections import deque
 
+# Random number generator (for Zobrist hashing keys)
+from random import Random
+
 # Terminal colors for formatting output text
 from terminalColors import *
 
@@ -72,6 +81,113 @@ reversedDirections: dict[Directions, Directions] = {
 	Directions.NONE:  Directions.NONE
 }
 
+# Directions an agent can move in (in order of preference for ties)
+MOVE_DIRECTIONS: tuple[Directions, ...] = (
+	Directions.UP, Directions.LEFT, Directions.DOWN, Directions.RIGHT
+)
+
+# Direction matching each (row, col) step, indexed by deltaIndex(rowDir, colDir)
+def deltaIndex(rowDir: int, colDir: int) -> int:
+	return ((rowDir & 0x03) << 2) | (colDir & 0x03)
+
+DELTA_DIRECTIONS: list[Directions] = [
+	next((d for d in Directions if deltaIndex(D_ROW[d], D_COL[d]) == index), Directions.NONE)
+	for index in range(16)
+]
+
+def buildGhostMoves() -> list[tuple[tuple[Directions, int, int], ...]]:
+	'''
+	For each cell a ghost moves into next and each heading (indexed by
+	cell * 5 + heading), list the moves the ghost may choose from afterwards
+	(direction, row and column), avoiding reversals and walls
+	'''
+
+	ghostMoves: list[tuple[tuple[Directions, int, int], ...]] = []
+	for cell in range(NUM_CELLS):
+		for heading in Directions:
+
+			# Avoid reversals, as ghosts are not typically allowed to reverse
+			reverseDir = reversedDirections[heading]
+			ghostMoves.append(tuple(
+				(direction, *divmod(NEXT_CELL[cell * 5 + direction], 28))
+				for direction in MOVE_DIRECTIONS
+				if direction != reverseDir and NEXT_CELL[cell * 5 + direction] != NO_CELL
+			))
+
+	return ghostMoves
+
+# Candidate ghost moves, built once on import
+GHOST_MOVES: list[tuple[tuple[Directions, int, int], ...]] = buildGhostMoves()
+
+def chooseGhostMove(moves: tuple[tuple[Directions, int, int], ...], targetRow: int, targetCol: int) -> int:
+	'''
+	Choose between candidate ghost moves for a given target, returning the
+	direction closest to the target, plus (shifted left by 2 bits) the
+	direction a frightened ghost would choose instead
+	'''
+
+	# Calculate the distance squared to the target, for all candidate moves
+	minDist = 0xfffffff
+	maxDist = -1
+	minDir  = Directions.UP
+	maxDir  = Directions.UP
+	for direction, newRow, newCol in moves:
+
+		# Compare the distance squared to the target to the current best;
+		# if it is better, choose it to be the new ghost plan
+		distSqToTarget = (newRow - targetRow) * (newRow - targetRow) + \
+											(newCol - targetCol) * (newCol - targetCol)
+		if distSqToTarget < minDist:
+			minDir  = direction
+			minDist = distSqToTarget
+		elif distSqToTarget >= maxDist:
+			maxDir  = direction
+			maxDist = distSqToTarget
+
+	return minDir | (maxDir << 2)
+
+# Ghost decisions in scatter mode (fixed targets), indexed by color, then by
+# the cell the ghost moves into next * 5 + heading
+SCATTER_PLANS: list[list[int]] = [
+	[chooseGhostMove(moves, SCATTER_ROW[color], SCATTER_COL[color]) for moves in GHOST_MOVES]
+	for color in range(4)
+]
+
+# Ghost decisions in paused mode (the target stays at the top-left corner)
+PAUSED_PLANS: list[int] = [chooseGhostMove(moves, 0, 0) for moves in GHOST_MOVES]
+
+# Precompiled codec for the game state serialization (big endian, identical to
+# the server's): general game info, ghosts, Pacman and fruit, then the pellets
+GAME_STATE_HEADER: Struct  = Struct('>HBBBBHBBHBHBHBHBHHBB')
+GAME_STATE_PELLETS: Struct = Struct('>31I')
+GAME_STATE_STRUCT: Struct  = Struct(GAME_STATE_HEADER.format + 31 * 'I')
+
+# Zobrist hashing keys (random 64-bit integers, fixed across runs); locations
+# are indexed by zobristIndex(row, col) * 5 + direction
+def zobristIndex(row: int, col: int) -> int:
+	return ((row & 0x3f) << 6) | (col & 0x3f)
+
+_zobristRandom = Random(0x7ac8)
+def _zobristKeys(count: int) -> list[int]:
+	return [_zobristRandom.getrandbits(64) for _ in range(count)]
+
+ZOBRIST_PACMAN: list[int]         = _zobristKeys(4096 * 5)
+ZOBRIST_GHOST: list[list[int]]    = [_zobristKeys(4096 * 5) for _ in range(4)]
+ZOBRIST_FRIGHT: list[list[int]]   = [_zobristKeys(64) for _ in range(4)]
+ZOBRIST_SPAWNING: list[int]       = _zobristKeys(4)
+ZOBRIST_MODE: list[int]           = _zobristKeys(4 * 256)
+ZOBRIST_PELLET: list[int]         = _zobristKeys(4096)
+
+# Combined pellet keys for each byte of each row of the pellet bitsets, indexed
+# by (row * 4 + byte) * 256 + value, to hash a full row with four lookups
+ZOBRIST_PELLET_BYTES: list[int] = [0] * (31 * 4 * 256)
+for _index in range(31 * 4 * 256):
+	_value = _index & 0xff
+	if _value:
+		_lowBit = (_value & -_value).bit_length() - 1
+		ZOBRIST_PELLET_BYTES[_index] = ZOBRIST_PELLET_BYTES[_index & ~0xff | (_value & (_value - 1))] ^ \
+			ZOBRIST_PELLET[zobristIndex(_index >> 10, ((_index >> 8) & 0x03) * 8 + _lowBit)]
+
 # Possible comms module states
 class ClientMode(IntEnum):
 	'''
@@ -88,6 +204,8 @@ class Location:
 	Location of an entity in the game engine
 	'''
 
+	__slots__ = ('state', 'rowDir', 'row', 'colDir', 'col')
+
 	def __init__(self, state) -> None: # type: ignore
 		'''
 		Construct a new location state object
@@ -169,18 +287,18 @@ class Location:
 		if (self.row >= 31) or (self.col >= 28) or (self.row < 0) or (self.col < 0):
 			return False
 
-		# Calculate the next row and column
-		newRow = self.row + self.rowDir
-		newCol = self.col + self.colDir
+		# Look up the next cell in the move table
+		newCell = NEXT_CELL[
+			(self.row * 28 + self.col) * 5 + DELTA_DIRECTIONS[deltaIndex(self.rowDir, self.colDir)]
+		]
 
-		# Move to the next row and column, if applicable
-		if not self.state.wallAt(newRow, newCol):
-			self.row = newRow
-			self.col = newCol
-			return True
+		# Return false, if the next cell is a wall
+		if newCell == NO_CELL:
+			return False
 
-		# Return false, if the update was not successful
-		return False
+		# Move to the next row and column
+		self.row, self.col = divmod(newCell, 28)
+		return True
 
 	def setDirection(self, direction: Directions) -> None:
 		'''
@@ -196,19 +314,16 @@ class Location:
 		Return a direction enum object corresponding to this location
 		'''
 
-		# Return the matching direction, if applicable
-		for direction in Directions:
-			if self.rowDir == D_ROW[direction] and self.colDir == D_COL[direction]:
-				return direction
-
-		# Return none if no direction matches
-		return Directions.NONE
+		# Return the matching direction (none if no direction matches)
+		return DELTA_DIRECTIONS[deltaIndex(self.rowDir, self.colDir)]
 
 class Ghost:
 	'''
 	Location and auxiliary info of a ghost in the game engine
 	'''
 
+	__slots__ = ('state', 'color', 'location', 'frightSteps', 'spawning', 'plannedDirection')
+
 	def __init__(self, color: GhostColors, state) -> None: # type: ignore
 		'''
 		Construct a new ghost state object
@@ -248,6 +363,22 @@ class Ghost:
 
 		return (self.frightSteps > 0)
 
+	def zobrist(self) -> int:
+		'''
+		Return this ghost's contribution to the Zobrist hash of the game state
+		(location, direction, fright steps and spawning flag)
+		'''
+
+		# Only the four ghosts tracked by the server are hashed
+		if self.color == GhostColors.NONE:
+			return 0
+
+		location = self.location
+		return ZOBRIST_GHOST[self.color][
+				zobristIndex(location.row, location.col) * 5 + location.getDirection()
+			] ^ ZOBRIST_FRIGHT[self.color][self.frightSteps & 0x3f] ^ \
+			(ZOBRIST_SPAWNING[self.color] if self.spawning else 0)
+
 	def move(self) -> None:
 		'''
 		Update the ghost's position for simulation purposes
@@ -277,116 +408,7 @@ class Ghost:
 		ghosts might aim at the next step
 		'''
 
-		# For the same reason as in move(), ignore spawning ghosts during short-
-		# term projections into the future
-		if self.spawning:
-			return
-
-		# If the ghost is at an empty location, ignore it
-		if self.location.row >= 32 or self.location.col >= 32:
-			return
-
-		# Row and column at the next step
-		nextRow: int = self.location.row + self.location.rowDir
-		nextCol: int = self.location.col + self.location.colDir
-
-		# Pacman row and column
-		pacmanRow: int = self.state.pacmanLoc.row
-		pacmanCol: int = self.state.pacmanLoc.col
-		pacmanRowDir: int = self.state.pacmanLoc.rowDir
-		pacmanColDir: int = self.state.pacmanLoc.colDir
-
-		# Red ghost's location
-		redRow: int = self.state.ghosts[GhostColors.RED].location.row
-		redCol: int = self.state.ghosts[GhostColors.RED].location.col
-
-		# Target row and column
-		targetRow: int = 0
-		targetCol: int = 0
-
-		# Choose a target for the ghost based on its color
-		if self.state.gameMode == GameModes.CHASE:
-
-			# Red targets Pacman
-			if self.color == GhostColors.RED:
-				targetRow = pacmanRow
-				targetCol = pacmanCol
-
-			# Pink targets the space 4 ahead of Pacman
-			elif self.color == GhostColors.PINK:
-				targetRow = pacmanRow + 4 * pacmanRowDir
-				targetRow = pacmanCol + 4 * pacmanColDir
-
-			# Cyan targets the position of red, reflected about the position 2 spaces
-			# ahead of Pacman
-			elif self.color == GhostColors.CYAN:
-				targetRow = 2 * pacmanRow + 4 * pacmanRowDir - redRow
-				targetCol = 2 * pacmanCol + 4 * pacmanColDir - redCol
-
-			# Orange targets Pacman, but only if Pacman is farther than 8 spaces away
-			elif self.color == GhostColors.ORANGE:
-				distSqToPacman = (nextRow - pacmanRow) * (nextRow - pacmanRow) + \
-													(nextCol - pacmanCol) * (nextCol - pacmanCol)
-				targetRow = pacmanRow if (distSqToPacman < 64) else \
-											SCATTER_ROW[GhostColors.ORANGE]
-				targetCol = pacmanCol if (distSqToPacman < 64) else \
-											SCATTER_COL[GhostColors.ORANGE]
-
-		# In scatter mode, each ghost tracks a fixed target at a corner of the maze
-		if self.state.gameMode == GameModes.SCATTER:
-			targetRow = SCATTER_ROW[self.color]
-			targetCol = SCATTER_COL[self.color]
-
-		# Calculate the distance squared to the target, for all 4 moves
-		minDist = 0xfffffff
-		maxDist = -1
-		minDir  = Directions.UP
-		maxDir  = Directions.UP
-		for direction in Directions:
-			if direction != Directions.NONE:
-
-				# Avoid reversals, as ghosts are not typically allowed to reverse
-				if D_ROW[direction] + self.location.rowDir != 0 or \
-					D_COL[direction] + self.location.colDir != 0:
-
-					# Check whether this new location would be valid (not in a wall)
-					newRow = nextRow + D_ROW[direction]
-					newCol = nextCol + D_COL[direction]
-					if not self.state.wallAt(newRow, newCol):
-
-						# Compare the distance squared to the target to the current best;
-						# if it is better, choose it to be the new ghost plan
-						distSqToTarget = (newRow - targetRow) * (newRow - targetRow) + \
-															(newCol - targetCol) * (newCol - targetCol)
-						if distSqToTarget < minDist:
-							minDir  = direction
-							minDist = distSqToTarget
-						elif distSqToTarget >= maxDist:
-							maxDir  = direction
-							maxDist = distSqToTarget
-
-		# Update the best direction to be the plan
-		self.plannedDirection = minDir if (not self.isFrightened()) else maxDir
-
-class GameStateCompressed:
-	'''
-	Compressed copy of the game state, for easier storage for path planning.
-	'''
-
-	def __init__(
-		self,
-		serialized: bytes,
-		ghostPlans: dict[GhostColors, Directions]
-	) -> None:
-		'''
-		Construct a new compressed game state object
-		'''
-
-		# Serialization of the game state, in bytes
-		self.serialized: bytes = serialized
-
-		# Store tentative ghost plans
-		self.ghostPlans: dict[GhostColors, Directions] = ghostPlans
+		self.state.guessGhostPlans((self,))
 
 class GameState:
 	'''
@@ -394,13 +416,22 @@ class GameState:
 	from the server to make querying the game state simple.
 	'''
 
+	__slots__ = (
+		'_lastFrame', '_locked', '_connected', 'writeServerBuf', 'wallArr',
+		'currTicks', 'updatePeriod', 'gameMode', 'modeSteps', 'modeDuration',
+		'currScore', 'currLevel', 'currLives', 'ghosts', 'pacmanLoc', 'fruitLoc',
+		'fruitSteps', 'fruitDuration', 'pelletArr', '_pelletTuple', 'pelletCount',
+		'superPelletCount', 'clientMode', 'zobrist'
+	)
+
 	def __init__(self) -> None:
 		'''
 		Construct a new game state object
 		'''
 
-		# Big endian format specifier
-		self.format: str = '>'
+		# Last serialized state decoded from the server, to skip repeated frames
+		# (reset whenever the state is changed by simulation)
+		self._lastFrame: bytes | None = None
 
 		# Internal variable to lock the state
 		self._locked: bool = False
@@ -419,57 +450,58 @@ class GameState:
 
 		# 2 bytes
 		self.currTicks: int = 0
-		self.format += 'H'
 
 		# 1 byte
 		self.updatePeriod: int = 12
-		self.format += 'B'
 
 		# 1 byte
 		self.gameMode: GameModes = GameModes.PAUSED
-		self.format += 'B'
 
 		# 2 bytes
 		self.modeSteps: int = 0
 		self.modeDuration: int = 255
-		self.format += 'BB'
 
 		# 2 bytes
 		self.currScore: int = 0
-		self.format += 'H'
 
 		# 1 byte
 		self.currLevel: int = 0
-		self.format += 'B'
 
 		# 1 byte
 		self.currLives: int = 3
-		self.format += 'B'
 
 		# 4 * 3 bytes = 4 * (2 bytes location + 1 byte aux info)
 		self.ghosts: list[Ghost] = [Ghost(color, self) for color in GhostColors]
-		self.format += 'HBHBHBHB'
 
 		# 2 byte location
 		self.pacmanLoc: Location = Location(self)
-		self.format += 'H'
 
 		# 2 byte location
 		self.fruitLoc: Location = Location(self)
-		self.format += 'H'
 
 		# 2 bytes
 		self.fruitSteps: int = 0
 		self.fruitDuration: int = 30
-		self.format += 'BB'
 
 		# 31 * 4 bytes = 31 * (32-bit integer bitset)
 		self.pelletArr: list[int] = [0 for _ in range(31)]
-		self.format += (31 * 'I')
+
+		# Immutable copy of the pellets, shared between snapshots until a pellet
+		# is collected (None if it needs to be rebuilt)
+		self._pelletTuple: tuple[int, ...] | None = None
+
+		# Number of pellets (and super pellets) left, maintained as pellets are
+		# collected rather than counted on every query
+		self.pelletCount: int = 0
+		self.superPelletCount: int = 0
 
 		# Client mode
 		self.clientMode: ClientMode = ClientMode.PLANNED
 
+		# Zobrist hash of the search-relevant state (Pacman, ghosts, mode steps
+		# and pellets), kept up to date by the simulation helpers
+		self.zobrist: int = self.computeZobrist()
+
 	def isPaused(self) -> bool:
 		return self.gameMode == GameModes.PAUSED
 
@@ -564,10 +596,7 @@ class GameState:
 		'''
 
 		# Return a serialization with the same format as server updates
-		return pack(
-
-			# Format string
-			self.format,
+		return GAME_STATE_STRUCT.pack(
 
 			# General game info
 			self.currTicks,
@@ -615,17 +644,21 @@ class GameState:
 
 		return {ghost.color: ghost.plannedDirection for ghost in self.ghosts}
 
-	def update(self, serializedState: bytes, lockOverride: bool = False) -> None:
+	def update(self, serializedState: bytes | memoryview, lockOverride: bool = False) -> None:
 		'''
-		Update this game state, given a bytes object from the client
+		Update this game state, given a bytes object (or memoryview) from the client
 		'''
 
 		# If the state is locked, don't update it
 		if self._locked and not lockOverride:
 			return
 
-		# Unpack the values based on the format string
-		unpacked: tuple[int, ...] = unpack_from(self.format, serializedState, 0)
+		# If the frame is identical to the last one, there is nothing to update
+		if serializedState == self._lastFrame:
+			return
+
+		# Unpack the values (directly from the buffer) based on the format string
+		unpacked: tuple[int, ...] = GAME_STATE_HEADER.unpack_from(serializedState)
 
 		# General game info
 		self.currTicks    = unpacked[0]
@@ -667,12 +700,54 @@ class GameState:
 		self.fruitDuration = unpacked[19]
 
 		# Pellet info
-		self.pelletArr = list[int](unpacked)[20:]
+		self.pelletArr = list(GAME_STATE_PELLETS.unpack_from(serializedState, GAME_STATE_HEADER.size))
+		self._pelletTuple = None
+		self.countPellets()
 
 		# Reset our guesses of the planned ghost directions
 		for ghost in self.ghosts:
 			ghost.plannedDirection = Directions.NONE
 
+		# Re-hash the new state
+		self.zobrist = self.computeZobrist()
+
+		# Keep a copy of this frame (a no-op for bytes objects)
+		self._lastFrame = bytes(serializedState)
+
+	def computeZobrist(self) -> int:
+		'''
+		Compute the Zobrist hash of the game state from scratch
+		'''
+
+		# Pacman location and direction
+		result: int = self.pacmanZobrist()
+
+		# Ghost info
+		for ghost in self.ghosts:
+			result ^= ghost.zobrist()
+
+		# Mode steps
+		result ^= ZOBRIST_MODE[self.gameMode * 256 + self.modeSteps]
+
+		# Pellets (one byte of a row at a time)
+		for row, pellets in enumerate(self.pelletArr):
+			offset = row << 10
+			result ^= ZOBRIST_PELLET_BYTES[offset | (pellets & 0xff)] ^ \
+				ZOBRIST_PELLET_BYTES[offset | 0x100 | ((pellets >> 8) & 0xff)] ^ \
+				ZOBRIST_PELLET_BYTES[offset | 0x200 | ((pellets >> 16) & 0xff)] ^ \
+				ZOBRIST_PELLET_BYTES[offset | 0x300 | ((pellets >> 24) & 0xff)]
+
+		return result
+
+	def pacmanZobrist(self) -> int:
+		'''
+		Return Pacman's contribution to the Zobrist hash of the game state
+		'''
+
+		return ZOBRIST_PACMAN[
+			zobristIndex(self.pacmanLoc.row, self.pacmanLoc.col) * 5 + self.pacmanLoc.getDirection()
+		]
+
 	def updateGhostPlans(self, ghostPlans: dict[GhostColors, Directions]):
 		'''
 		Update this game state, given a list of ghost planned directions
@@ -681,6 +756,182 @@ class GameState:
 		for ghost in self.ghosts:
 			ghost.plannedDirection = ghostPlans[ghost.color]
 
+	def snapshot(self) -> tuple:
+		'''
+		Copy the fields that the simulator can change (including the planned
+		ghost directions) into a flat tuple, for cheap storage for path planning;
+		like serialize(), this only covers the four ghosts tracked by the server
+		'''
+
+		pacmanLoc = self.pacmanLoc
+		ghosts = self.ghosts
+		red, pink, cyan, orange = ghosts[0], ghosts[1], ghosts[2], ghosts[3]
+		redLoc, pinkLoc, cyanLoc, orangeLoc = \
+			red.location, pink.location, cyan.location, orange.location
+
+		# Reuse the pellet copy from the last snapshot, if no pellets were collected
+		if self._pelletTuple is None:
+			self._pelletTuple = tuple(self.pelletArr)
+
+		return (
+
+			# General game info
+			self.currTicks, self.gameMode, self.modeSteps, self.modeDuration,
+			self.currScore,
+
+			# Fruit info
+			self.fruitSteps, self.fruitLoc.row, self.fruitLoc.col,
+
+			# Pacman location info
+			pacmanLoc.row, pacmanLoc.col, pacmanLoc.rowDir, pacmanLoc.colDir,
+
+			# Ghost info
+			redLoc.row, redLoc.col, redLoc.rowDir, redLoc.colDir,
+			red.frightSteps, red.spawning, red.plannedDirection,
+			pinkLoc.row, pinkLoc.col, pinkLoc.rowDir, pinkLoc.colDir,
+			pink.frightSteps, pink.spawning, pink.plannedDirection,
+			cyanLoc.row, cyanLoc.col, cyanLoc.rowDir, cyanLoc.colDir,
+			cyan.frightSteps, cyan.spawning, cyan.plannedDirection,
+			orangeLoc.row, orangeLoc.col, orangeLoc.rowDir, orangeLoc.colDir,
+			orange.frightSteps, orange.spawning, orange.plannedDirection,
+
+			# Pellet info
+			self._pelletTuple, self.pelletCount, self.superPelletCount,
+
+			# Hash of the state
+			self.zobrist
+
+		)
+
+	def restore(self, snapshot: tuple) -> None:
+		'''
+		Restore this game state from a snapshot (ignoring the lock, as this is
+		only used for path planning)
+		'''
+
+		pacmanLoc = self.pacmanLoc
+		fruitLoc = self.fruitLoc
+		ghosts = self.ghosts
+		red, pink, cyan, orange = ghosts[0], ghosts[1], ghosts[2], ghosts[3]
+		redLoc, pinkLoc, cyanLoc, orangeLoc = \
+			red.location, pink.location, cyan.location, orange.location
+
+		(
+			self.currTicks, self.gameMode, self.modeSteps, self.modeDuration,
+			self.currScore,
+			self.fruitSteps, fruitLoc.row, fruitLoc.col,
+			pacmanLoc.row, pacmanLoc.col, pacmanLoc.rowDir, pacmanLoc.colDir,
+			redLoc.row, redLoc.col, redLoc.rowDir, redLoc.colDir,
+			red.frightSteps, red.spawning, red.plannedDirection,
+			pinkLoc.row, pinkLoc.col, pinkLoc.rowDir, pinkLoc.colDir,
+			pink.frightSteps, pink.spawning, pink.plannedDirection,
+			cyanLoc.row, cyanLoc.col, cyanLoc.rowDir, cyanLoc.colDir,
+			cyan.frightSteps, cyan.spawning, cyan.plannedDirection,
+			orangeLoc.row, orangeLoc.col, orangeLoc.rowDir, orangeLoc.colDir,
+			orange.frightSteps, orange.spawning, orange.plannedDirection,
+			pelletArr, self.pelletCount, self.superPelletCount,
+			self.zobrist
+		) = snapshot
+
+		# Copy the pellets, as collecting pellets modifies the list in place
+		self.pelletArr = list(pelletArr)
+		self._pelletTuple = pelletArr
+
+		# The state no longer matches the last frame from the server
+		self._lastFrame = None
+
+	def guessGhostPlans(self, ghosts: Iterable[Ghost] | None = None) -> None:
+		'''
+		Use incomplete knowledge of the current game state to predict where the
+		ghosts (all of them, by default) might aim at the next step, in one pass
+		'''
+
+		# Pacman row and column
+		pacmanRow: int = self.pacmanLoc.row
+		pacmanCol: int = self.pacmanLoc.col
+		pacmanRowDir: int = self.pacmanLoc.rowDir
+		pacmanColDir: int = self.pacmanLoc.colDir
+
+		# Red ghost's location
+		redRow: int = self.ghosts[GhostColors.RED].location.row
+		redCol: int = self.ghosts[GhostColors.RED].location.col
+
+		# Choose targets based on the game mode
+		chase: bool = (self.gameMode == GameModes.CHASE)
+		scatter: bool = (self.gameMode == GameModes.SCATTER)
+
+		for ghost in (self.ghosts if ghosts is None else ghosts):
+
+			# For the same reason as in move(), ignore spawning ghosts during short-
+			# term projections into the future
+			if ghost.spawning:
+				continue
+
+			# If the ghost is at an empty location, ignore it
+			location = ghost.location
+			if location.row >= 32 or location.col >= 32:
+				continue
+
+			# Row and column at the next step
+			nextRow: int = location.row + location.rowDir
+			nextCol: int = location.col + location.colDir
+
+			# Every neighbor of a cell off the grid is a wall (the maze has a border),
+			# so the ghost has no moves to choose from
+			if not ((0 <= nextRow < 31) and (0 <= nextCol < 28)):
+				ghost.plannedDirection = Directions.UP
+				continue
+
+			# Index of the ghost's next cell and heading in the decision tables
+			index: int = (nextRow * 28 + nextCol) * 5 + location.getDirection()
+
+			# In scatter mode, each ghost tracks a fixed target at a corner of the maze
+			if scatter:
+				plan: int = SCATTER_PLANS[ghost.color][index]
+
+			# Otherwise, without a chase target, the target stays at (0, 0)
+			elif not chase:
+				plan = PAUSED_PLANS[index]
+
+			else:
+
+				# Target row and column
+				targetRow: int = 0
+				targetCol: int = 0
+
+				# Choose a target for the ghost based on its color (in chase mode)
+
+				# Red targets Pacman
+				if ghost.color == GhostColors.RED:
+					targetRow = pacmanRow
+					targetCol = pacmanCol
+
+				# Pink targets the space 4 ahead of Pacman
+				elif ghost.color == GhostColors.PINK:
+					targetRow = pacmanRow + 4 * pacmanRowDir
+					targetRow = pacmanCol + 4 * pacmanColDir
+
+				# Cyan targets the position of red, reflected about the position 2 spaces
+				# ahead of Pacman
+				elif ghost.color == GhostColors.CYAN:
+					targetRow = 2 * pacmanRow + 4 * pacmanRowDir - redRow
+					targetCol = 2 * pacmanCol + 4 * pacmanColDir - redCol
+
+				# Orange targets Pacman, but only if Pacman is farther than 8 spaces away
+				elif ghost.color == GhostColors.ORANGE:
+					distSqToPacman = (nextRow - pacmanRow) * (nextRow - pacmanRow) + \
+														(nextCol - pacmanCol) * (nextCol - pacmanCol)
+					targetRow = pacmanRow if (distSqToPacman < 64) else \
+												SCATTER_ROW[GhostColors.ORANGE]
+					targetCol = pacmanCol if (distSqToPacman < 64) else \
+												SCATTER_COL[GhostColors.ORANGE]
+
+				# Choose between the candidate moves out of the next cell, for this target
+				plan = chooseGhostMove(GHOST_MOVES[index], targetRow, targetCol)
+
+			# Update the best direction to be the plan
+			ghost.plannedDirection = MOVE_DIRECTIONS[(plan >> 2) if ghost.isFrightened() else (plan & 0x03)]
+
 	def pelletAt(self, row: int, col: int) -> bool:
 		'''
 		Helper function to check if a pellet is at a given location
@@ -704,19 +955,28 @@ class GameState:
 		return (self.fruitSteps > 0) and (row == self.fruitLoc.row) and \
 			(col == self.fruitLoc.col)
 
+	def countPellets(self) -> None:
+		'''
+		Helper function to recount the pellets (and super pellets) in the maze
+		'''
+
+		self.pelletCount = sum(row_arr.bit_count() for row_arr in self.pelletArr)
+		self.superPelletCount = self.pelletAt(3, 1) + self.pelletAt(3, 26) + \
+			self.pelletAt(23, 1) + self.pelletAt(23, 26)
+
 	def numPellets(self) -> int:
 		'''
-		Helper function to compute how many pellets are left in the maze
+		Helper function to return how many pellets are left in the maze
 		'''
 
-		return sum(row_arr.bit_count() for row_arr in self.pelletArr)
+		return self.pelletCount
 
 	def numSuperPellets(self) -> int:
 		'''
-		Helper function to compute how many super pellets are left in the maze
+		Helper function to return how many super pellets are left in the maze
 		'''
 
-		return self.pelletAt(3, 1) + self.pelletAt(3, 26) + self.pelletAt(23, 1) + self.pelletAt(23, 26)
+		return self.superPelletCount
 
 	def collectPellet(self, row: int, col: int) -> None:
 		'''
@@ -732,12 +992,17 @@ class GameState:
 
 		# Remove the pellet at this location
 		self.pelletArr[row] &= (~(1 << col))
+		self._pelletTuple = None
+		self.pelletCount -= 1
+		if superPellet:
+			self.superPelletCount -= 1
+		self.zobrist ^= ZOBRIST_PELLET[zobristIndex(row, col)]
 
 		# Increase the score by this amount
 		self.currScore += (50 if superPellet else 10)
 
 		# Spawn the fruit based on the number of pellets, if applicable
-		numPellets = self.numPellets()
+		numPellets = self.pelletCount
 		if numPellets == 174 or numPellets == 74:
 			self.fruitSteps = 30
 			self.fruitLoc.row = 17
@@ -751,7 +1016,9 @@ class GameState:
 		# Scare the ghosts, if applicable
 		if superPellet:
 			for ghost in self.ghosts:
+				self.zobrist ^= ghost.zobrist()
 				ghost.frightSteps = 40
+				self.zobrist ^= ghost.zobrist()
 				ghost.plannedDirection = reversedDirections[ghost.plannedDirection]
 
 	def wallAt(self, row: int, col: int) -> bool:
@@ -849,7 +1116,9 @@ class GameState:
 				#else: # 'Respawn' the ghost
 				#	ghost.location.row = 32
 				#	ghost.location.col = 32
+				self.zobrist ^= ghost.zobrist()
 				ghost.spawning = True
+				self.zobrist ^= ghost.zobrist()
 
 		# Otherwise, Pacman is safe
 		return True
@@ -874,27 +1143,43 @@ class GameState:
 		of colliding with non-frightened ghosts.
 		'''
 
-		# Try to plan the ghost directions if we expect them to be none
-		for ghost in self.ghosts:
-			if ghost.plannedDirection == Directions.NONE:
-				ghost.guessPlan()
+		return self.advanceWorld(numTicks) and self.movePacman(numTicks, pacmanDir)
 
-		# Loop over every tick
-		for tick in range(1, numTicks+1):
+	def advanceWorld(self, numTicks: int) -> bool:
+		'''
+		First part of simulateAction: advance the ghosts and the game mode over
+		the chosen number of ticks, before Pacman moves (this does not depend on
+		Pacman's next direction, so it can be shared between actions with the
+		same number of ticks)
 
-			# Keep ticking until an update
-			if (self.currTicks + tick) % self.updatePeriod != 0:
-				continue
+		Returns: whether Pacman is safe from non-frightened ghosts meanwhile
+		'''
+
+		# The state will no longer match the last frame from the server
+		self._lastFrame = None
+
+		# Try to plan the ghost directions if we expect them to be none
+		self.guessGhostPlans([
+			ghost for ghost in self.ghosts if ghost.plannedDirection == Directions.NONE
+		])
+
+		# Jump straight to each tick with an update (every updatePeriod ticks),
+		# skipping the ticks in between, where nothing happens
+		firstUpdateTick = self.updatePeriod - (self.currTicks % self.updatePeriod)
+		for _ in range(firstUpdateTick, numTicks+1, self.updatePeriod):
 
 			# Update the ghost positions (and reduce frightened steps if applicable) # UNCOMMENT
 			for ghost in self.ghosts:
+				self.zobrist ^= ghost.zobrist()
 				ghost.move()
+				self.zobrist ^= ghost.zobrist()
 
 			# Return if Pacman collides with a non-frightened ghost
 			if not self.safetyCheck():
 				return False
 
 			# Update the mode steps counter, and change the mode if necessary
+			self.zobrist ^= ZOBRIST_MODE[self.gameMode * 256 + self.modeSteps]
 			if self.modeSteps > 0:
 				self.modeSteps -= 1
 
@@ -907,7 +1192,7 @@ class GameState:
 					self.modeDuration = 175
 
 				# Chase -> Scatter
-				elif self.gameMode == GameModes.CHASE and self.numPellets() > 20:
+				elif self.gameMode == GameModes.CHASE and self.pelletCount > 20:
 					self.gameMode = GameModes.SCATTER
 					self.modeSteps = 65
 					self.modeDuration = 65
@@ -916,10 +1201,24 @@ class GameState:
 				for ghost in self.ghosts:
 						ghost.plannedDirection = reversedDirections[ghost.plannedDirection]
 
+			self.zobrist ^= ZOBRIST_MODE[self.gameMode * 256 + self.modeSteps]
+
 			# Guess the next ghost moves (will likely be inaccurate, due to inferring
 			# unknown information from other features of the game state)
-			for ghost in self.ghosts:
-				ghost.guessPlan()
+			self.guessGhostPlans()
+
+		return True
+
+	def movePacman(self, numTicks: int, pacmanDir: Directions) -> bool:
+		'''
+		Second part of simulateAction: move Pacman one space in a chosen
+		direction, after advanceWorld, and count the ticks of the action
+
+		Returns: whether Pacman is safe from non-frightened ghosts
+		'''
+
+		# The state will no longer match the last frame from the server
+		self._lastFrame = None
 
 		# If Pacman is not given a direction to move towards, skip motion
 		if pacmanDir == Directions.NONE:
@@ -927,16 +1226,20 @@ class GameState:
 
 		else:
 			# Set the direction of Pacman, as chosen, and try to move one step
+			# (re-hashing Pacman's location and direction)
 			pacmanPrevDir = self.pacmanLoc.getDirection()
+			self.zobrist ^= self.pacmanZobrist()
 			self.pacmanLoc.setDirection(pacmanDir)
 			if not self.pacmanLoc.advance():
 				self.pacmanLoc.setDirection(pacmanPrevDir)
+				self.zobrist ^= self.pacmanZobrist()
 				return False
+			self.zobrist ^= self.pacmanZobrist()
 
 			self.collectPellet(self.pacmanLoc.row, self.pacmanLoc.col)
 
 			# If there are no pellets left, return
-			if self.numPellets() == 0:
+			if self.pelletCount == 0:
 				return True
 
 		# Return if Pacman collides with a non-frightened ghost
@@ -949,20 +1252,19 @@ class GameState:
 		# Return that Pacman was safe during this transition
 		return True
 
-def compressGameState(state: GameState) -> GameStateCompressed:
-	'''
-	Function to compress the game state into a smaller object, for easier storage
-	'''
-
-	return GameStateCompressed(state.serialize(), state.getGhostPlans())
+	def simulateActions(self, actions: list[tuple[int, Directions]]) -> int:
+		'''
+		Helper function to simulate a sequence of actions (number of ticks and
+		Pacman direction, as in simulateAction) in one call, stopping early if an
+		action is unsafe
 
-def decompressGameState(state: GameState, compressed: GameStateCompressed):
-	'''
-	Function to de-compress game state information for path planning
-	'''
+		Returns: the number of actions that were simulated safely (all of them,
+		if this equals the length of the sequence)
+		'''
 
-	# Serialization (bytes) to state
-	state.update(compressed.serialized, lockOverride=True)
+		simulateAction = self.simulateAction
+		for index, (numTicks, pacmanDir) in enumerate(actions):
+			if not simulateAction(numTicks, pacmanDir):
+				return index
 
-	# Unpack the ghost plans
-	state.updateGhostPlans(compressed.ghostPlans)
\ No newline at end of file
+		return len(actions)
\ No newline at end of file
@@ -0,0 +1,43 @@
+# Internal representation of walls
+from walls import wallArr
+
+# Maze dimensions (cells are indexed by row * NUM_COLS + col)
+NUM_ROWS: int  = 31
+NUM_COLS: int  = 28
+NUM_CELLS: int = NUM_ROWS * NUM_COLS
+
+# Number of move table entries per cell (one per direction, including none)
+NUM_MOVES: int = 5
+
+# Sentinel for a move into a wall (or off the grid)
+NO_CELL: int = -1
+
+# Same order as the Directions enum:  U   L   D   R  None
+MOVE_ROW: list[int]                = [-1, -0, +1, +0, +0]
+MOVE_COL: list[int]                = [-0, -1, +0, +1, +0]
+
+def buildMoveTable(walls: list[int]) -> list[int]:
+	'''
+	Build a flat table of the cell reached from each cell in each direction,
+	indexed by cell * NUM_MOVES + direction (NO_CELL if the move is blocked)
+	'''
+
+	def isOpen(row: int, col: int) -> bool:
+		return (0 <= row < NUM_ROWS) and (0 <= col < NUM_COLS) and \
+			not ((walls[row] >> col) & 1)
+
+	# Only the destination is checked, so that entities stuck in a wall cell
+	# behave the same as with a direct wall lookup
+	table: list[int] = [NO_CELL] * (NUM_CELLS * NUM_MOVES)
+	for row in range(NUM_ROWS):
+		for col in range(NUM_COLS):
+			for direction in range(NUM_MOVES):
+				newRow = row + MOVE_ROW[direction]
+				newCol = col + MOVE_COL[direction]
+				if isOpen(newRow, newCol):
+					table[(row * NUM_COLS + col) * NUM_MOVES + direction] = newRow * NUM_COLS + newCol
+
+	return table
+
+# Move table for the maze walls, built once on import
+NEXT_CELL: list[int] = buildMoveTable(wallArr)
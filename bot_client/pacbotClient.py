@@ -208,6 +208,10 @@ class PacbotClient:
 		doneCheckIt = 0
 		pausedCheckIt = 0
 
+		# Last message received, and its bytes (to avoid re-encoding it)
+		lastMessage: Data | None = None
+		messageBytes: bytes = bytes()
+
 		# Receive values as long as the connection is open
 		while self.isOpen():
 
@@ -217,12 +221,13 @@ class PacbotClient:
 				# Receive a message from the connection
 				message: Data = self.message
 
-				# Convert the message to bytes, if necessary
-				messageBytes: bytes
-				if isinstance(message, bytes):
-					messageBytes = message # type: ignore
-				else:
-					messageBytes = message.encode('ascii') # type: ignore
+				# Convert the message to bytes, if it is new and necessary
+				if message is not lastMessage:
+					lastMessage = message
+					if isinstance(message, bytes):
+						messageBytes = message # type: ignore
+					else:
+						messageBytes = message.encode('ascii') # type: ignore
 
 				# Update the state, given this message from the server
 				self.state.update(messageBytes)
@@ -0,0 +1,213 @@
+# Heap queues (for repairing distances)
+from heapq import heappush, heappop, heapify
+
+# Move table and maze dimensions
+from moveTable import NEXT_CELL, NO_CELL, NUM_CELLS, NUM_COLS, NUM_ROWS
+
+# Internal representation of walls
+from walls import wallArr
+
+# Bitboards (for building the field a BFS layer at a time)
+import bitboard
+
+# Distance of cells which cannot reach a pellet
+UNREACHABLE: int = NUM_CELLS
+
+# Cells of the super pellets
+SUPER_CELLS: frozenset[int] = frozenset((
+	3 * NUM_COLS + 1, 3 * NUM_COLS + 26, 23 * NUM_COLS + 1, 23 * NUM_COLS + 26
+))
+
+# Changed pellets beyond which the field is rebuilt, rather than repaired
+REBUILD_CHANGES: int = 16
+
+def buildNeighbors() -> list[tuple[int, ...]]:
+	'''
+	Build the neighbors of each open cell (in the order of the move
+	directions: up, left, down, right), and no neighbors for walls; moves
+	between open cells go both ways, so these are also the cells which can
+	move to each cell
+	'''
+
+	def isOpen(cell: int) -> bool:
+		return not ((wallArr[cell // NUM_COLS] >> (cell % NUM_COLS)) & 1)
+
+	return [
+		tuple(
+			nextCell for nextCell in NEXT_CELL[cell * 5 : cell * 5 + 4] if nextCell != NO_CELL
+		) if isOpen(cell) else ()
+		for cell in range(NUM_CELLS)
+	]
+
+# Neighbors of each cell, built once on import
+NEIGHBORS: list[tuple[int, ...]] = buildNeighbors()
+
+class PelletField:
+	'''
+	Distance from each cell to the nearest normal pellet, without passing
+	through super pellets (as in AStarPolicy.getNearestPellet): built by a
+	multi-source BFS from the pellets, then repaired incrementally as pellets
+	change (see sync), so that the nearest pellet to a cell is found by
+	descending the field, in time proportional to its distance
+	'''
+
+	__slots__ = ('pelletArr', 'dist')
+
+	def __init__(self) -> None:
+
+		# Pellets the field was built for (one bit mask per row)
+		self.pelletArr: list[int] = [0] * NUM_ROWS
+
+		# Distance from each cell to the nearest normal pellet
+		self.dist: list[int] = [UNREACHABLE] * NUM_CELLS
+
+	def isSource(self, cell: int) -> bool:
+		'''
+		Whether a cell has a normal pellet
+		'''
+
+		return bool((self.pelletArr[cell // NUM_COLS] >> (cell % NUM_COLS)) & 1) and \
+			(cell not in SUPER_CELLS)
+
+	def isBlocked(self, cell: int) -> bool:
+		'''
+		Whether a cell has a super pellet (which paths cannot pass through)
+		'''
+
+		return (cell in SUPER_CELLS) and \
+			bool((self.pelletArr[cell // NUM_COLS] >> (cell % NUM_COLS)) & 1)
+
+	def rebuild(self, pelletArr: list[int]) -> None:
+		'''
+		Build the field from scratch, with a multi-source BFS from the pellets,
+		expanded a whole layer at a time on bitboards (see bitboard.expand)
+		'''
+
+		self.pelletArr = list(pelletArr)
+		dist = self.dist = [UNREACHABLE] * NUM_CELLS
+
+		# Super pellets get a distance, but paths do not pass through them
+		pellets = bitboard.pack(pelletArr) & bitboard.OPEN
+		blocked = pellets & bitboard.SUPER_PELLETS
+		layer = visited = pellets & ~bitboard.SUPER_PELLETS
+
+		layerDist = 0
+		while layer:
+
+			# Distances of the cells of this layer (bit row * 32 + col, see
+			# bitboard.bitCell)
+			board = layer
+			while board:
+				bit = board & -board
+				index = bit.bit_length() - 1
+				dist[(index >> 5) * NUM_COLS + (index & 31)] = layerDist
+				board ^= bit
+
+			# Next layer: unvisited cells next to this one
+			layer = bitboard.expand(layer & ~blocked) & ~visited
+			visited |= layer
+			layerDist += 1
+
+	def sync(self, pelletArr: list[int]) -> None:
+		'''
+		Bring the field up to date with the given pellets, repairing only the
+		distances which the changed pellets affect (or rebuilding it, if too
+		many pellets changed)
+		'''
+
+		if pelletArr == self.pelletArr:
+			return
+
+		# Cells whose pellet changed
+		changed: list[int] = []
+		for row in range(NUM_ROWS):
+			diff = self.pelletArr[row] ^ pelletArr[row]
+			while diff:
+				lowBit = diff & -diff
+				changed.append(row * NUM_COLS + lowBit.bit_length() - 1)
+				diff ^= lowBit
+			if len(changed) > REBUILD_CHANGES:
+				self.rebuild(pelletArr)
+				return
+
+		if not changed:
+			return
+
+		wasBlocked = [self.isBlocked(cell) for cell in changed]
+		self.pelletArr = list(pelletArr)
+		dist = self.dist
+
+		# Find the cells whose distance is now too low: cells which are not
+		# pellets, and have no neighbor one step closer which still leads to a
+		# pellet (checked by increasing distance, starting at the changed cells)
+		invalid: set[int] = set()
+		checks: list[tuple[int, int]] = [(dist[cell], cell) for cell in changed if dist[cell] < UNREACHABLE]
+		heapify(checks)
+		checked: set[int] = set()
+		while checks:
+			cellDist, cell = heappop(checks)
+			if cell in checked:
+				continue
+			checked.add(cell)
+
+			supported = self.isSource(cell) or any(
+				(dist[nextCell] == cellDist - 1) and (nextCell not in invalid) and
+				not self.isBlocked(nextCell)
+				for nextCell in NEIGHBORS[cell]
+			)
+			if not supported:
+				invalid.add(cell)
+
+			# Neighbors one step farther may have relied on this cell
+			if (not supported) or self.isBlocked(cell):
+				for nextCell in NEIGHBORS[cell]:
+					if dist[nextCell] == cellDist + 1:
+						heappush(checks, (cellDist + 1, nextCell))
+
+		for cell in invalid:
+			dist[cell] = UNREACHABLE
+
+		# Recompute distances from the cells which may now lead somewhere closer:
+		# the invalid cells (from their valid neighbors), new pellets, and eaten
+		# super pellets, which paths can now pass through
+		repairs: list[tuple[int, int]] = []
+		for cell in invalid:
+			for nextCell in NEIGHBORS[cell]:
+				if (dist[nextCell] + 1 < dist[cell]) and not self.isBlocked(nextCell):
+					dist[cell] = dist[nextCell] + 1
+			if dist[cell] < UNREACHABLE:
+				heappush(repairs, (dist[cell], cell))
+		for cell, blocked in zip(changed, wasBlocked):
+			if self.isSource(cell) and NEIGHBORS[cell]:
+				dist[cell] = 0
+				heappush(repairs, (0, cell))
+			elif blocked and (dist[cell] < UNREACHABLE):
+				heappush(repairs, (dist[cell], cell))
+
+		while repairs:
+			cellDist, cell = heappop(repairs)
+			if (cellDist > dist[cell]) or self.isBlocked(cell):
+				continue
+			for nextCell in NEIGHBORS[cell]:
+				if cellDist + 1 < dist[nextCell]:
+					dist[nextCell] = cellDist + 1
+					heappush(repairs, (cellDist + 1, nextCell))
+
+	def nearest(self, cell: int) -> int:
+		'''
+		Nearest normal pellet to a cell, breaking ties as a BFS from the cell
+		would (by the order of the move directions), or NO_CELL if there is none
+		'''
+
+		if self.dist[cell] == UNREACHABLE:
+			return NO_CELL
+
+		# Follow the first neighbor one step closer, until reaching a pellet
+		dist = self.dist
+		while dist[cell]:
+			for nextCell in NEIGHBORS[cell]:
+				if (dist[nextCell] == dist[cell] - 1) and not self.isBlocked(nextCell):
+					cell = nextCell
+					break
+
+		return cell
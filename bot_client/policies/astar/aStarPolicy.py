@@ -1,12 +1,35 @@
 # Heap Queues
-from heapq import heappush, heappop
+from heapq import heappush, heappop, heapify
+
+# Time (for the planning budget)
+import time
+
+# Shared values (for the bound shared by parallel searches)
+from multiprocessing.sharedctypes import Synchronized
 
 # Game state
 from gameState import *
 
 # Location mapping
 import policies.astar.genPachattanDistDict as pacdist
-import policies.astar.example as ex
+
+# Plan cache
+from policies.astar.planCache import PlanCache, CachedPlan
+
+# Distance field to the nearest pellet
+from pelletField import PelletField
+
+# Precomputed heuristic fields
+from policies.astar.heuristicFields import HeuristicFields
+
+# Corridors between junctions (for macro-action searches)
+from corridorGraph import CORRIDOR_EXIT, NO_DIRECTION
+
+# Escapes from corridors (for pruning moves into traps)
+import trapMap
+
+# Pachattan distance matrix (memory-mapped, one byte per pair of cells)
+PACHATTAN = pacdist.loadDistMatrix()
 
 # Big Distance
 INF = 999999
@@ -69,46 +92,58 @@ def distL2(loc1: Location, loc2: Location) -> int:
 
 # Pachattan distance
 def distL3(loc1: Location, loc2: Location) -> int:
-	key = pacdist.getKey(loc1, loc2)
-	return ex.PACHATTAN[key]
+	return PACHATTAN[(loc1.row * 28 + loc1.col) * 868 + loc2.row * 28 + loc2.col]
 
 # Squared Pachattan distance
 def distSqL3(loc1: Location, loc2: Location) -> int:
 	pacDist = distL3(loc1, loc2)
 	return pacDist * pacDist
 
+# Parts of a game state snapshot that a prediction must match, for a search
+# tree to be reused: Pacman's cell, and the ghosts' cells and directions
+def predictionKey(snapshot: tuple) -> tuple:
+	return snapshot[8:10] + snapshot[12:16] + snapshot[19:23] + \
+		snapshot[26:30] + snapshot[33:37]
+
 
 class AStarNode:
 	'''
 	Node class for running the A-Star Algorithm for Pacbot.
 	'''
 
+	__slots__ = (
+		'snapshot', 'fCost', 'gCost', 'parent', 'runMoves', 'direction',
+		'delay', 'bufLength', 'victimCaught', 'targetCaught'
+	)
+
 	def __init__(
 		self,
-		compressedState: GameStateCompressed,
+		snapshot: tuple,
 		fCost: int,
 		gCost: int,
-		directionBuf: list[Directions],
-		delayBuf: list[int],
-		bufLength: int,
+		parent: 'AStarNode | None' = None,
+		direction: Directions = Directions.NONE,
+		delay: int = 0,
+		bufLength: int = 0,
 		victimCaught: bool = False,
 		targetCaught: bool = False
 	) -> None:
 
-		# Compressed game state
-		self.compressedState = compressedState
+		# Game state snapshot
+		self.snapshot = snapshot
 
 		# Costs
 		self.fCost = fCost
 		self.gCost = gCost
 
-		# Estimated velocity
-		self.estSpeed = 0
-		self.direction = Directions.NONE
-
-		# Message buffer
-		self.directionBuf = directionBuf
-		self.delayBuf = delayBuf
+		# Message buffer: the previous node, and the last move (direction and
+		# delay) from it, so the moves are only rebuilt for the chosen node; the
+		# moves before the last one, if the node is a corridor run (see
+		# AStarPolicy.runCorridor), and the number of moves from the start
+		self.parent = parent
+		self.runMoves: tuple[tuple[Directions, int], ...] = ()
+		self.direction = direction
+		self.delay = delay
 		self.bufLength = bufLength
 
 		# Victim color (catching scared ghosts)
@@ -117,12 +152,49 @@ class AStarNode:
 		# Determines whether the target was caught
 		self.targetCaught: bool = targetCaught
 
-	def __lt__(self, other) -> bool: # type: ignore
-		return self.fCost < other.fCost # type: ignore
-
 	def __repr__(self) -> str:
 		return str(f'g = {self.gCost} ~ f = {self.fCost}')
 
+	def path(self, root: 'AStarNode | None' = None) -> tuple[list[Directions], list[int]]:
+		'''
+		Rebuild the directions and delays of the moves leading to this node
+		(from the root of the search tree, or from a given ancestor)
+		'''
+
+		directionBuf: list[Directions] = []
+		delayBuf: list[int] = []
+		node = self
+		while (node.parent is not None) and (node is not root):
+			directionBuf.append(node.direction)
+			delayBuf.append(node.delay)
+			for direction, delay in reversed(node.runMoves):
+				directionBuf.append(direction)
+				delayBuf.append(delay)
+			node = node.parent
+
+		directionBuf.reverse()
+		delayBuf.reverse()
+		return directionBuf, delayBuf
+
+	def descendsFrom(self, ancestor: 'AStarNode') -> bool:
+		'''
+		Whether this node is in the subtree of a given node
+		'''
+
+		node: AStarNode | None = self
+		while (node is not None) and (node.bufLength > ancestor.bufLength):
+			node = node.parent
+		return node is ancestor
+
+	def betterPartialPlan(self, other) -> bool: # type: ignore
+		'''
+		Whether this node is a better partial plan than another (if planning runs
+		out of time): deeper plans first, then plans with lower f-costs
+		'''
+
+		return (self.bufLength > other.bufLength) or \
+			(self.bufLength == other.bufLength and self.fCost < other.fCost)
+
 class AStarPolicy:
 	'''
 	Policy class for running the A-Star Algorithm for Pacbot.
@@ -132,7 +204,14 @@ class AStarPolicy:
 		self,
 		state: GameState,
 		target: Location,
-		distType: DistTypes = DistTypes.PACHATTAN_DISTANCE
+		distType: DistTypes = DistTypes.PACHATTAN_DISTANCE,
+		gameFPS: int = 24,
+		horizon: int = 14,
+		reuseTree: bool = True,
+		planCacheSize: int = 4096,
+		planCacheRadius: int = 6,
+		macroActions: bool = False,
+		pruneTraps: bool = False
 	) -> None:
 
 		# Game state
@@ -142,7 +221,7 @@ class AStarPolicy:
 		# Target location
 		self.target: Location = target
 
-		# Expected location
+		# Expected location (after the first message of the last plan)
 		self.expectedLoc: Location = newLocation(23, 13, self.state)
 		self.error_sum = 0
 		self.error_count = 0
@@ -163,6 +242,86 @@ class AStarPolicy:
 
 		self.initialSeqComplete = False
 
+		# Location of the ghost lair
+		self.lairLoc: Location = newLocation(11, 13, self.state)
+
+		# Targets next to each super pellet (top left, top right, bottom left,
+		# bottom right), created once rather than on every target selection
+		self.superPelletTargets: list[Location] = [
+			newLocation(5, 1, self.state),
+			newLocation(5, 26, self.state),
+			newLocation(20, 3, self.state),
+			newLocation(20, 24, self.state)
+		]
+
+		# Distance from each cell to the nearest pellet (for target selection),
+		# repaired as the pellets change between queries
+		self.pelletField: PelletField = PelletField()
+
+		# Heuristic terms over all cells, for the ghost configurations and targets
+		# seen by the search (see HeuristicFields); they are built from Pachattan
+		# distances, so other distance types use the per-node terms instead
+		self.fields: HeuristicFields | None = None
+		if self.distType == DistTypes.PACHATTAN_DISTANCE:
+			self.fields = HeuristicFields(PACHATTAN)
+
+		# Scratch locations, reused for temporary moves during the search (and
+		# for the victim's location, when expanding a node)
+		self.scratchLoc: Location = Location(self.state)
+		self.victimLoc: Location = Location(self.state)
+
+		# Number of nodes created, expanded and pruned by the last search (for
+		# profiling)
+		self.numNodes: int = 0
+		self.numExpanded: int = 0
+		self.numPruned: int = 0
+
+		# Server frame rate (ticks per second), for the default planning budget
+		self.gameFPS: int = gameFPS
+
+		# Time taken by the last search (seconds), the fraction of its budget this
+		# used, and whether it ran out of time (returning a partial plan)
+		self.planTime: float = 0.0
+		self.budgetUsed: float = 0.0
+		self.timedOut: bool = False
+
+		# Number of moves a plan needs before it is complete
+		self.horizon: int = horizon
+
+		# Whether each move out of a corridor cell keeps running to the end of the
+		# corridor, rather than branching on every cell (see runCorridor)
+		self.macroActions: bool = macroActions
+
+		# Whether moves from a safe cell into a trap (a cell with ghosts coming at
+		# Pacman along every way out, see trapMap) are pruned from the search
+		self.pruneTraps: bool = pruneTraps
+
+		# Number of moves of the last queued plan (zero if no plan was queued), and
+		# the highest f-cost popped before the last search first committed to a
+		# path (None if it never did), to compare plans from parallel searches
+		self.planDepth: int = 0
+		self.commitCost: int | None = None
+
+		# Search tree kept from the last complete plan (its root, its chosen node,
+		# and the frontier, including the chosen node), with the victim and pellet
+		# target it ended with, to continue from if a new state matches a prediction
+		self.reuseTree: bool = reuseTree
+		self.lastRootNode: AStarNode | None = None
+		self.lastPlanNode: AStarNode | None = None
+		self.lastFrontier: list[tuple[int, int, AStarNode]] = []
+		self.lastVictimColor: GhostColors = GhostColors.NONE
+		self.lastPelletTarget: tuple[int, int] = (32, 32)
+
+		# Whether the last search continued from the previous search tree
+		self.treeReused: bool = False
+
+		# Cache of complete plans, by quantized game state (none if the size is 0)
+		self.planCache: PlanCache | None = \
+			PlanCache(planCacheSize, planCacheRadius) if planCacheSize else None
+
+		# Number of nodes ever pushed to a frontier (orders ties between nodes,
+		# including nodes kept from previous searches)
+		self.pushCount: int = 0
 
 	def getNearestPellet(self) -> Location:
 
@@ -171,40 +330,15 @@ class AStarPolicy:
 		if self.state.wallAt(first.row, first.col):
 			return self.state.pacmanLoc
 
-		#  BFS traverse
-		queue = [first]
-		visited = {first.hash()}
-		while queue:
-
-			# pop from queue
-			currLoc = queue.pop(0)
+		# Descend the distance field of the current pellets (repairing it first)
+		self.pelletField.sync(self.state.pelletArr)
+		firstCell = first.row * 28 + first.col
+		cell = self.pelletField.nearest(firstCell)
+		if cell == NO_CELL:
+			#print('No nearest...')
+			return first
 
-			# Base Case: Found a pellet
-			if self.state.pelletAt(currLoc.row, currLoc.col) and \
-				not self.state.superPelletAt(currLoc.row, currLoc.col):
-				return currLoc
-
-			# Loop over the directions
-			for direction in Directions:
-
-				# If the direction is none, skip it
-				if direction == Directions.NONE:
-					continue
-
-				# Increment direction
-				nextLoc = Location(self.state)
-				nextLoc.col = currLoc.col
-				nextLoc.row = currLoc.row
-				nextLoc.setDirection(direction)
-				valid = nextLoc.advance() and not self.state.superPelletAt(nextLoc.row, nextLoc.col)
-
-				# avoid same node twice and check this is a valid move
-				if nextLoc.hash() not in visited and valid:
-					queue.append(nextLoc)
-					visited.add(nextLoc.hash())
-
-		#print('No nearest...')
-		return first
+		return first if (cell == firstCell) else newLocation(cell // 28, cell % 28, self.state)
 
 	def scaryVictim(self, victimColor: GhostColors) -> bool:
 
@@ -281,16 +415,38 @@ class AStarPolicy:
 		hCostTarget = self.dist(self.state.pacmanLoc, self.target)
 		return int(hCostTarget + hCostGhost + hCostFruit)
 
-	def hCostExtend(self, gCost: int, bufLen: int, victimColor: GhostColors) -> int:
+	def hCostExtend(
+		self,
+		gCost: int,
+		bufLen: int,
+		victimColor: GhostColors,
+		attraction: tuple[list[int], list[int] | None, list[int] | None] | None = None
+	) -> int:
 		'''
 		Extends the existing g_cost delta to estimate a new h-cost due to
-		distance Pachattan distance and estimated speed
+		distance Pachattan distance and estimated speed (reading the distances
+		from the fields of the target, victim and fruit, if given, see
+		attraction)
 		'''
 
 		# make sure pacman in bounds
 		if 0 > self.state.pacmanLoc.row or 32 <= self.state.pacmanLoc.row or 0 > self.state.pacmanLoc.col or 28 <= self.state.pacmanLoc.col:
 			return 999999999
 
+		# Distance to the chosen target, from the fields (as below)
+		if (attraction is not None) and (self.state.pacmanLoc.row < 31):
+			cell = self.state.pacmanLoc.row * 28 + self.state.pacmanLoc.col
+			targetField, victimField, fruitField = attraction
+			distTarget = targetField[cell]
+			if distTarget == 0:
+				return -10000000
+			if victimField is not None:
+				dist = victimField[cell]
+			else:
+				distFruit = fruitField[cell] if (fruitField is not None) else 999999
+				dist = distTarget if (distTarget < distFruit // 20) else distFruit
+			return int((gCost / bufLen if (bufLen >= 4) else 2) * dist)
+
 		# Dist to target
 		distTarget: int = self.dist(self.state.pacmanLoc, self.target)
 		if (distTarget == 0):
@@ -317,7 +473,16 @@ class AStarPolicy:
 		# Return the result: (g-cost) / (buffer length) * (dist to target)
 		return int(gCostPerStep * dist)
 
-	def fCostMultiplier(self) -> float:
+	def fCostMultiplier(self, danger: tuple[list[int], ...] | None = None) -> float:
+
+		# Add up the danger fields of the ghosts, if given (see HeuristicFields)
+		pacmanRow, pacmanCol = self.state.pacmanLoc.row, self.state.pacmanLoc.col
+		if (danger is not None) and (0 <= pacmanRow < 31) and (0 <= pacmanCol < 28):
+			cell = pacmanRow * 28 + pacmanCol
+			multiplier = 1
+			for field in danger:
+				multiplier += field[cell]
+			return multiplier
 
 		# Constant for the multiplier
 		K: int = 128 # TODO: considering changing to 128
@@ -326,9 +491,7 @@ class AStarPolicy:
 		multTerm: int = 0
 
 		# Location of the ghost lair
-		lairLoc: Location = Location(self.state)
-		lairLoc.row = 11
-		lairLoc.col = 13
+		lairLoc: Location = self.lairLoc
 
 		# Check if any ghosts are frightened
 		fright = False
@@ -351,6 +514,46 @@ class AStarPolicy:
 		# Return the multiplier (1 + constant / distance squared)
 		return 1 + multTerm
 
+	def danger(self) -> tuple[list[int], ...] | None:
+		'''
+		Danger fields of the ghosts in the current state (None without fields),
+		see HeuristicFields
+		'''
+
+		if self.fields is None:
+			return None
+		return self.fields.danger(self.state)
+
+	def attraction(self, victimColor: GhostColors) -> tuple[list[int], list[int] | None, list[int] | None] | None:
+		'''
+		Distance fields of the current target, victim and fruit (None for the
+		victim or fruit if there is none, and None without fields or if one of
+		them is off the grid), see HeuristicFields
+		'''
+
+		if self.fields is None:
+			return None
+
+		target = self.target
+		if not ((0 <= target.row < 31) and (0 <= target.col < 28)):
+			return None
+
+		victimField = None
+		if (victimColor != GhostColors.NONE) and not self.state.ghosts[victimColor].spawning:
+			victimLoc = self.state.ghosts[victimColor].location
+			if not ((0 <= victimLoc.row < 31) and (0 <= victimLoc.col < 28)):
+				return None
+			victimField = self.fields.distance(victimLoc.row * 28 + victimLoc.col)
+
+		fruitField = None
+		if self.state.fruitSteps > 0:
+			fruitLoc = self.state.fruitLoc
+			if not ((0 <= fruitLoc.row < 31) and (0 <= fruitLoc.col < 28)):
+				return None
+			fruitField = self.fields.distance(fruitLoc.row * 28 + fruitLoc.col)
+
+		return self.fields.distance(target.row * 28 + target.col), victimField, fruitField
+
 	def selectTarget(self, pelletTarget: Location) -> None:
 
 		chase = self.state.gameMode == GameModes.CHASE
@@ -360,29 +563,345 @@ class AStarPolicy:
 
 		# check if top left pellet exists
 		if self.state.superPelletAt(3, 1) and chase:
-			self.target = newLocation(5, 1, self.state)
+			self.target = self.superPelletTargets[0]
 
 		# check if top right pellet exists
 		elif self.state.superPelletAt(3, 26) and chase:
-			self.target = newLocation(5, 26, self.state)
+			self.target = self.superPelletTargets[1]
 
 		# check if bottom left pellet exists
 		elif self.state.superPelletAt(23, 1) and chase:
-			self.target = newLocation(20, 3, self.state)
+			self.target = self.superPelletTargets[2]
 
 		# check if bottom right pellet exists
 		elif self.state.superPelletAt(23, 26) and chase:
-			self.target = newLocation(20, 24, self.state)
+			self.target = self.superPelletTargets[3]
 
 		# no super pellets
 		else:
 			# target the nearest pellet
 			self.target = pelletTarget
 
-	async def act(self, predicted_delay: int, victimColor: GhostColors, pelletTarget: Location) -> tuple[GhostColors, Location]:
+	def defaultBudget(self) -> float:
+		'''
+		Default planning budget (seconds): the time between two game updates
+		'''
 
-		# Make a priority queue of A-Star Nodes
-		priorityQueue: list[AStarNode] = []
+		return self.state.updatePeriod / self.gameFPS
+
+	def queuePlan(self, node: AStarNode, startRow: int, startCol: int, root: AStarNode | None = None) -> None:
+		'''
+		Queue the first move of a node's plan, from the root of the search tree
+		(coalescing repeated directions into one message)
+		'''
+
+		# testLoc = newLocation(startRow, startCol, self.state)
+		# for index in range(1):
+		# 	testLoc.setDirection(directionBuf[index])
+		# 	testLoc.advance()
+
+		# 	self.state.queueAction(
+		# 		delayBuf[index] - (index == 0),
+		# 		directionBuf[index],
+		# 		testLoc.row,
+		# 		testLoc.col
+		# 	)
+
+		self.planDepth = node.bufLength
+
+		# Rebuild the moves leading to the node
+		directionBuf, delayBuf = node.path(root)
+		self.queueMoves(directionBuf, delayBuf, startRow, startCol)
+
+	def queueMoves(self, directionBuf: list[Directions], delayBuf: list[int], startRow: int, startCol: int) -> None:
+		'''
+		Queue the first move of a sequence of moves (coalescing repeated
+		directions into one message)
+		'''
+
+		testLoc = newLocation(startRow, startCol, self.state)
+		lastDir = directionBuf[0]
+		dist = 0
+
+		for index in range(len(directionBuf)):
+			# coalesce
+			if lastDir != directionBuf[index]:
+				break
+			dist += 1
+
+			# get target location
+			testLoc.setDirection(directionBuf[index])
+			testLoc.advance()
+
+
+		self.state.queueAction(
+			delayBuf[0] - (0 == 0),
+			lastDir,
+			dist,
+			testLoc.row,
+			testLoc.col,
+		)
+
+		self.expectedLoc.row = testLoc.row
+		self.expectedLoc.col = testLoc.col
+
+	def matchPrediction(self) -> AStarNode | None:
+		'''
+		Find the first node along the last plan whose predicted state matches
+		the current state (see predictionKey), if any (only from the root of the
+		last search, as the nodes before it are states Pacman already left)
+		'''
+
+		# Nodes along the last plan, from its root
+		planNodes: list[AStarNode] = []
+		node = self.lastPlanNode
+		while node is not None:
+			planNodes.append(node)
+			if node is self.lastRootNode:
+				break
+			node = node.parent
+
+		currentKey = predictionKey(self.state.snapshot())
+		for node in reversed(planNodes):
+			if predictionKey(node.snapshot) == currentKey:
+				return node
+
+		return None
+
+	def commit(self, cost: int, bound: Synchronized | None) -> None:
+		'''
+		Record the cost at which a search first commits to a path (by completing
+		a plan, or catching its target or victim), sharing it with parallel
+		searches: the search which commits at the lowest cost is the one which
+		would have committed first in a single search over all first moves
+		'''
+
+		if self.commitCost is not None:
+			return
+
+		self.commitCost = cost
+		if bound is not None:
+			with bound.get_lock():
+				bound.value = min(bound.value, cost)
+
+	def reportBudget(self, startTime: float, budget: float) -> None:
+		'''
+		Record the time taken by a search, and the fraction of its budget used
+		'''
+
+		self.planTime = time.perf_counter() - startTime
+		self.budgetUsed = self.planTime / budget
+
+	def trapped(self) -> bool:
+		'''
+		Whether Pacman is in a trap in the current state: ghosts coming at him
+		along every way out (see trapMap.isTrapped), which reach him before a
+		change of mode turns them around, with no super pellet on the way to
+		turn them around either
+		'''
+
+		pacmanLoc = self.state.pacmanLoc
+		if not ((0 <= pacmanLoc.row < 31) and (0 <= pacmanLoc.col < 28)):
+			return False
+		cell = pacmanLoc.row * 28 + pacmanLoc.col
+		if not trapMap.SEALERS[cell]:
+			return False
+
+		# The next move of a ghost is along its current heading (the planned
+		# direction only applies from the cell after it, see Ghost.move)
+		ghostMoves: list[int] = []
+		for ghost in self.state.ghosts:
+			location = ghost.location
+			if (not ghost.spawning) and (not ghost.isFrightened()) and \
+				(0 <= location.row < 31) and (0 <= location.col < 28):
+				ghostMoves.append((location.row * 28 + location.col) * 5 + location.getDirection())
+
+		if not trapMap.isTrapped(cell, ghostMoves):
+			return False
+
+		# Ghosts move one cell per update, so the ghosts have swept every cell
+		# between them (and Pacman with it) once the farthest of the nearest
+		# sealing ghosts of each way out has covered its distance in cells
+		paths = trapMap.PATHS[cell]
+		catchUpdates = 0
+		for path, side in zip(paths, trapMap.SEALERS[cell]):
+			catchUpdates = max(catchUpdates, min(
+				path.index(move // 5) + 1 for move in ghostMoves if move in side
+			))
+
+		# Updates come every updatePeriod ticks; after the update which changes
+		# the mode, the ghosts still move once along their headings before they
+		# turn around, so the trap holds if they reach Pacman by then
+		updatePeriod = self.state.updatePeriod
+		firstUpdateTick = updatePeriod - (self.state.currTicks % updatePeriod)
+		catchTicks = firstUpdateTick + (catchUpdates - 1) * updatePeriod
+		turnTicks = firstUpdateTick + max(self.state.modeSteps, 1) * updatePeriod
+		if catchTicks > turnTicks:
+			return False
+
+		for path in paths:
+			for pathCell in path:
+				if self.state.superPelletAt(pathCell // 28, pathCell % 28):
+					return False
+
+		return True
+
+	def runCorridor(
+		self,
+		node: AStarNode,
+		predicted_delay: int,
+		turnLag: int,
+		victimColor: GhostColors,
+		pelletTarget: Location,
+		rootNode: AStarNode
+	) -> None:
+		'''
+		Macro-action step of a search: from a node which just moved into a
+		corridor (the game state is the node's), keep moving along it until the
+		next junction (see corridorGraph), costed as in plan; the run stops early
+		once the victim or the target is caught, at the horizon, or before a move
+		which is not safe. The cells of the run are only simulated: the node
+		itself (not in the search tree yet) becomes a single edge for the whole
+		run, with the moves before its last one in runMoves
+		'''
+
+		startSnapshot = node.snapshot
+		moves: list[tuple[int, Directions]] = []
+		lastDirection = node.direction
+		prevGCost = gCost = node.gCost
+		prevBufLength = bufLength = node.bufLength
+		victimCaught, targetCaught = node.victimCaught, node.targetCaught
+
+		while (not victimCaught) and (not targetCaught) and \
+			(bufLength - rootNode.bufLength < self.horizon):
+
+			# Only corridor cells have a way to keep running
+			pacmanRow, pacmanCol = self.state.pacmanLoc.row, self.state.pacmanLoc.col
+			if not ((0 <= pacmanRow < 31) and (0 <= pacmanCol < 28)):
+				break
+			nextDirection = CORRIDOR_EXIT[(pacmanRow * 28 + pacmanCol) * 5 + lastDirection]
+			if nextDirection == NO_DIRECTION:
+				break
+			direction = Directions(nextDirection)
+
+			# Corners of the corridor count as turns
+			turnPenalty = 0
+			evadePenalty = 0
+			if self.state.pacmanLoc.getDirection() != direction:
+				turnPenalty = 2
+
+				if (victimColor != GhostColors.NONE) and not self.state.ghosts[victimColor].spawning:
+
+					victimLoc = self.state.ghosts[victimColor].location
+					loc: Location = self.scratchLoc
+					loc.update(self.state.pacmanLoc.serialize())
+					loc.setDirection(direction)
+					dist1 = self.dist(loc, victimLoc)
+					loc.advance()
+					dist2 = self.dist(loc, victimLoc)
+
+					if (dist1 < dist2):
+						evadePenalty = 10
+
+			# An unsafe move ends the run: replay the safe moves from the start
+			# (cheaper than a snapshot of every cell, as runs rarely end this way)
+			numTicks = predicted_delay + turnPenalty * turnLag
+			npBefore = self.state.pelletCount
+			nspBefore = self.state.superPelletCount
+			if not self.state.simulateAction(numTicks, direction):
+				self.state.restore(startSnapshot)
+				self.state.simulateActions(moves)
+				break
+			ateNormalPellet = (npBefore > self.state.pelletCount) and (nspBefore == self.state.superPelletCount)
+
+			# Goals and target, as in plan
+			targetCaught = self.state.wallAt(pelletTarget.row, pelletTarget.col) or (not self.state.pelletAt(pelletTarget.row, pelletTarget.col)) or pelletTarget.at(self.state.pacmanLoc.row, self.state.pacmanLoc.col) or (self.state.fruitLoc.at(self.state.pacmanLoc.row, self.state.pacmanLoc.col))
+			victimCaught = (victimColor != GhostColors.NONE) and ((not self.state.ghosts[victimColor].isFrightened()) or self.state.ghosts[victimColor].spawning)
+			self.selectTarget(pelletTarget)
+			victimExists = (victimColor == GhostColors.NONE)
+
+			prevGCost, prevBufLength = gCost, bufLength
+			gCost += 2 + 4 * ((not ateNormalPellet) and (not victimExists)) + 2 * (turnPenalty and victimExists) + 5 * evadePenalty
+			bufLength += 1
+			moves.append((numTicks, direction))
+			lastDirection = direction
+
+		if not moves:
+			return
+
+		# The node ends the run, costed from the last cell before its end
+		node.runMoves = ((node.direction, node.delay),) + \
+			tuple((direction, numTicks) for numTicks, direction in moves[:-1])
+		node.delay, node.direction = moves[-1]
+		node.snapshot = self.state.snapshot()
+		node.fCost = int((self.hCostExtend(prevGCost, prevBufLength, victimColor, self.attraction(victimColor)) + prevGCost + 1) * self.fCostMultiplier(self.danger()))
+		node.gCost = gCost
+		node.bufLength = bufLength
+		node.victimCaught = victimCaught
+		node.targetCaught = targetCaught
+
+	async def act(
+		self,
+		predicted_delay: int,
+		victimColor: GhostColors,
+		pelletTarget: Location,
+		budget: float | None = None
+	) -> tuple[GhostColors, Location]:
+		'''
+		Plan the next moves (see plan), for use from the decision loop
+		'''
+
+		return self.plan(predicted_delay, victimColor, pelletTarget, budget)
+
+	def plan(
+		self,
+		predicted_delay: int,
+		victimColor: GhostColors,
+		pelletTarget: Location,
+		budget: float | None = None,
+		rootDirections: tuple[Directions, ...] | None = None,
+		bound: Synchronized | None = None,
+		stop: tuple[Synchronized, int] | None = None
+	) -> tuple[GhostColors, Location]:
+		'''
+		Plan with A-Star until a node's buffer is full, or until the planning
+		budget (seconds, by default the time between two game updates) runs
+		out, in which case the best partial plan found so far is queued
+
+		For parallel searches, the first move can be restricted to some
+		directions, and a bound shared between searches (the lowest cost at
+		which a search committed to a path so far, see commit) cuts off
+		searches that can no longer commit first
+
+		A search can also be stopped from another process, given a shared
+		counter and the value it had when the search started: once the counter
+		changes, the search stops as if its budget ran out (for speculative
+		searches whose prediction was dropped, see SpeculativePlanner)
+		'''
+
+		# State, victim and target to start over from, if a reused tree runs out
+		# of nodes (the search changes them)
+		startSnapshot = self.state.snapshot()
+		startVictimColor, startPelletTarget = victimColor, pelletTarget
+
+		# Start the clock for the planning budget
+		startTime = time.perf_counter()
+		if budget is None:
+			budget = self.defaultBudget()
+		deadline = startTime + budget
+		self.timedOut = False
+		self.planDepth = 0
+		self.commitCost = None
+		self.numExpanded = 0
+		self.numPruned = 0
+
+		# Highest f-cost popped so far (until the search commits to a path)
+		maxCost = -INF * INF
+
+		# Make a priority queue of A-Star Nodes, as (f-cost, creation order, node)
+		# tuples: tuples are compared in C, and ties go to the oldest node, so
+		# plans are reproducible
+		priorityQueue: list[tuple[int, int, AStarNode]] = []
 
 		# Starting row and col
 		startRow = self.state.pacmanLoc.row
@@ -390,16 +909,22 @@ class AStarPolicy:
 
 		# Construct an initial node
 		initialNode = AStarNode(
-			compressGameState(self.state),
+			self.state.snapshot(),
 			fCost = self.hCostExtend(0, 0, victimColor),
-			gCost = 0,
-			directionBuf = [],
-			delayBuf = [],
-			bufLength = 0
+			gCost = 0
 		)
 
 		# Add the initial node to the priority queue
-		heappush(priorityQueue, initialNode)
+		heappush(priorityQueue, (initialNode.fCost, self.pushCount, initialNode))
+		self.pushCount += 1
+		self.numNodes = 1
+
+		# Best partial plan found so far (see AStarNode.betterPartialPlan)
+		bestNode = initialNode
+
+		# Transposition table: lowest g-cost pushed for each state (Zobrist hash),
+		# so identical states reached by different move orders are expanded once
+		transpositions: dict[int, int] = {self.state.zobrist: 0}
 
 		# Select a target
 		self.selectTarget(pelletTarget)
@@ -414,8 +939,46 @@ class AStarPolicy:
 		if targetCaught:
 			pelletTarget = self.getNearestPellet()
 
+		# Continue from the last search tree, if the current state matches one of
+		# its predictions: the subtree of the matching node becomes the frontier
+		rootNode = initialNode
+		self.treeReused = False
+		if self.reuseTree and (rootDirections is None) and \
+			(victimColor == self.lastVictimColor) and \
+			((pelletTarget.row, pelletTarget.col) == self.lastPelletTarget):
+
+			matchNode = self.matchPrediction()
+			if matchNode is not None:
+				# The matching node becomes the root (detached from its ancestors, so
+				# that they can be freed)
+				matchNode.parent = None
+				rootNode = bestNode = matchNode
+				priorityQueue = [
+					entry for entry in self.lastFrontier if entry[2].descendsFrom(matchNode)
+				]
+				heapify(priorityQueue)
+				transpositions = {node.snapshot[-1]: node.gCost for _, _, node in priorityQueue}
+				self.treeReused = True
+
+		self.lastRootNode = None
+		self.lastPlanNode = None
+		self.lastFrontier = []
+
+		# Otherwise, reuse a cached plan for a similar state, if it is still safe
+		cacheKey: tuple | None = None
+		if (self.planCache is not None) and (rootDirections is None) and (not self.treeReused):
+			cacheKey = self.planCache.key(self.state, victimColor, pelletTarget)
+			cachedPlan = self.planCache.get(self.state, cacheKey)
+			if cachedPlan is not None:
+				self.numNodes = 0
+				self.planDepth = len(cachedPlan.directions)
+				self.queueMoves(cachedPlan.directions, cachedPlan.delays, startRow, startCol)
+				self.reportBudget(startTime, budget)
+				return cachedPlan.victimColor, \
+					newLocation(cachedPlan.targetRow, cachedPlan.targetCol, self.state)
+
 		# Flag for first iteration
-		firstIt = True
+		firstIt = not self.treeReused
 
 		# Lag for first iteration
 		firstItLag = 0
@@ -426,52 +989,56 @@ class AStarPolicy:
 		# Keep proceeding until a break point is hit
 		while len(priorityQueue):
 
+			# If the planning budget ran out, settle for the best partial plan
+			if time.perf_counter() >= deadline:
+				self.timedOut = True
+				break
+
+			# Likewise if the search was stopped
+			if (stop is not None) and (stop[0].value != stop[1]):
+				self.timedOut = True
+				break
+
 			# Pop the lowest f-cost node
-			currNode = heappop(priorityQueue)
+			currNode = heappop(priorityQueue)[2]
+			self.numExpanded += 1
 
-			# Reset to the current compressed state
-			decompressGameState(self.state, currNode.compressedState)
+			# Stop if another search already committed to a path at a lower cost
+			# (the initial node is shared by all searches, so it does not count)
+			if (self.commitCost is None) and (currNode is not rootNode):
+				maxCost = max(maxCost, currNode.fCost)
+				if (bound is not None) and (maxCost > bound.value):
+					break
+
+			# Reset to the current game state snapshot
+			self.state.restore(currNode.snapshot)
 
 			# If the g-cost of this node is high enough or we reached the target,
 			# make the moves and return
-			if currNode.bufLength >= 14:
-
-				# testLoc = newLocation(startRow, startCol, self.state)
-				# for index in range(1):
-				# 	testLoc.setDirection(currNode.directionBuf[index])
-				# 	testLoc.advance()
-
-				# 	self.state.queueAction(
-				# 		currNode.delayBuf[index] - (index == 0),
-				# 		currNode.directionBuf[index],
-				# 		testLoc.row,
-				# 		testLoc.col
-				# 	)
-
-				testLoc = newLocation(startRow, startCol, self.state)
-				lastDir = currNode.directionBuf[0]
-				dist = 0
-
-				for index in range(len(currNode.directionBuf)):
-					# coalesce
-					if lastDir != currNode.directionBuf[index]:
-						break
-					dist += 1
-
-					# get target location
-					testLoc.setDirection(currNode.directionBuf[index])
-					testLoc.advance()
-
-
-				self.state.queueAction(
-					currNode.delayBuf[0] - (0 == 0),
-					lastDir,
-					dist,
-					testLoc.row,
-					testLoc.col,
-				)
+			if currNode.bufLength - rootNode.bufLength >= self.horizon:
+
+				self.commit(maxCost, bound)
+				self.queuePlan(currNode, startRow, startCol, rootNode)
+
+				# Keep the search tree, to continue from it next time (the chosen node
+				# goes back to the frontier, to be extended)
+				heappush(priorityQueue, (currNode.fCost, self.pushCount, currNode))
+				self.pushCount += 1
+				self.lastRootNode = rootNode
+				self.lastPlanNode = currNode
+				self.lastFrontier = priorityQueue
+				self.lastVictimColor = victimColor
+				self.lastPelletTarget = (pelletTarget.row, pelletTarget.col)
+
+				# Cache the plan, for similar states
+				if cacheKey is not None:
+					directionBuf, delayBuf = currNode.path(rootNode)
+					self.planCache.put(cacheKey, CachedPlan( # type: ignore
+						directionBuf, delayBuf, victimColor, pelletTarget.row, pelletTarget.col
+					))
 
 				#print(['RED', 'PINK', 'CYAN', 'ORANGE', 'NONE'][victimColor], pelletTarget)
+				self.reportBudget(startTime, budget)
 				return victimColor, pelletTarget
 
 			if currNode.victimCaught:
@@ -502,6 +1069,9 @@ class AStarPolicy:
 
 				# force pb to take this path
 				priorityQueue.clear()
+				transpositions.clear()
+				bestNode = currNode
+				self.commit(maxCost, bound)
 
 				if currNode.targetCaught:
 					#print('target caught')
@@ -514,6 +1084,9 @@ class AStarPolicy:
 
 				# force pb to take this path
 				priorityQueue.clear()
+				transpositions.clear()
+				bestNode = currNode
+				self.commit(maxCost, bound)
 
 				# choose new target
 				pelletTarget = self.getNearestPellet()
@@ -552,9 +1125,33 @@ class AStarPolicy:
 			# Get Pacman's current direction
 			prevDir = self.state.pacmanLoc.getDirection()
 
+			# Offset of Pacman's cell in the move table (negative if off the grid)
+			pacmanRow, pacmanCol = self.state.pacmanLoc.row, self.state.pacmanLoc.col
+			pacmanMoves = (pacmanRow * 28 + pacmanCol) * 5 if \
+				(0 <= pacmanRow < 31) and (0 <= pacmanCol < 28) else -1
+
+			# Whether Pacman is already in a trap (if so, moves which stay in it are
+			# still searched, as there may be no better option)
+			inTrap = self.pruneTraps and self.trapped()
+
 			# Determines if waiting (none) is allowed as a move
 			waitAllowed = (victimColor == GhostColors.NONE)
 
+			# Pacman's location, and the victim's location if it is not spawning, for
+			# the evade penalty (the state changes as the children are simulated)
+			pacmanSerial = self.state.pacmanLoc.serialize()
+			victimLoc: Location | None = None
+			if (victimColor != GhostColors.NONE) and not self.state.ghosts[victimColor].spawning:
+				victimLoc = self.victimLoc
+				victimLoc.update(self.state.ghosts[victimColor].location.serialize())
+
+			# States after advancing the ghosts from this node (see advanceWorld),
+			# and whether Pacman was safe meanwhile, by number of ticks: children
+			# with the same delay only differ in Pacman's move, so the ghosts
+			# advance once (and their danger field is looked up once)
+			worlds: dict[int, tuple[bool, tuple]] = {}
+			dangers: dict[int, tuple[list[int], ...] | None] = {}
+
 			# TODO: EVALUATE THIS
 
 			# Loop over the directions
@@ -564,31 +1161,47 @@ class AStarPolicy:
 				if (direction == Directions.NONE) and (not waitAllowed):
 					continue
 
-				# Reset to the current compressed state
-				decompressGameState(self.state, currNode.compressedState)
+				# Only expand the allowed first moves, if they are restricted
+				if firstIt and (rootDirections is not None) and (direction not in rootDirections):
+					continue
+
+				# Skip moves into walls, as simulating them can never succeed
+				if (direction != Directions.NONE) and \
+					(pacmanMoves < 0 or NEXT_CELL[pacmanMoves + direction] == NO_CELL):
+					continue
 
 				turnPenalty = 0
 				evadePenalty = 0
 				if (prevDir != direction):
 					turnPenalty = 2
 
-					if (victimColor != GhostColors.NONE) and not self.state.ghosts[victimColor].spawning:
+					if victimLoc is not None:
 
-						loc: Location = Location(self.state)
-						loc.update(self.state.pacmanLoc.serialize())
+						loc: Location = self.scratchLoc
+						loc.update(pacmanSerial)
 						loc.setDirection(direction)
-						dist1 = self.dist(loc, self.state.ghosts[victimColor].location)
+						dist1 = self.dist(loc, victimLoc)
 						loc.advance()
-						dist2 = self.dist(loc, self.state.ghosts[victimColor].location)
+						dist2 = self.dist(loc, victimLoc)
 
 						if (dist1 < dist2):
 							evadePenalty = 10
 
-				npBefore = self.state.numPellets()
-				nspBefore = self.state.numSuperPellets()
-				valid = self.state.simulateAction(predicted_delay + firstItLag * firstIt + turnPenalty * turnLag, direction)
-				npAfter = self.state.numPellets()
-				nspAfter = self.state.numSuperPellets()
+				# Advance the ghosts from this node (once per number of ticks), then
+				# move Pacman
+				numTicks = predicted_delay + firstItLag * firstIt + turnPenalty * turnLag
+				world = worlds.get(numTicks)
+				if world is None:
+					self.state.restore(currNode.snapshot)
+					world = worlds[numTicks] = (self.state.advanceWorld(numTicks), self.state.snapshot())
+				else:
+					self.state.restore(world[1])
+
+				npBefore = self.state.pelletCount
+				nspBefore = self.state.superPelletCount
+				valid = world[0] and self.state.movePacman(numTicks, direction)
+				npAfter = self.state.pelletCount
+				nspAfter = self.state.superPelletCount
 				ateNormalPellet = (npBefore > npAfter) and (nspBefore == nspAfter)
 
 				# Determines if the target was caught
@@ -605,22 +1218,72 @@ class AStarPolicy:
 
 				# If the state is valid, add it to the priority queue
 				if valid:
+					gCost = currNode.gCost + 2 + 4 * ((not ateNormalPellet) and (not victimExists)) + 2 * (turnPenalty and victimExists) + 5 * evadePenalty
+
+					# Skip the state if it was already reached at no higher cost
+					if transpositions.get(self.state.zobrist, INF) <= gCost:
+						continue
+					transpositions[self.state.zobrist] = gCost
+
+					# Danger field of the ghosts (which only changes with Pacman's move
+					# if a super pellet frightens them)
+					if nspBefore != nspAfter:
+						danger = self.danger()
+					elif numTicks in dangers:
+						danger = dangers[numTicks]
+					else:
+						danger = dangers[numTicks] = self.danger()
+
 					nextNode = AStarNode(
-						compressGameState(self.state),
-						fCost = int((self.hCostExtend(currNode.gCost, currNode.bufLength, victimColor) + currNode.gCost + 1) * self.fCostMultiplier()),
-						gCost = currNode.gCost + 2 + 4 * ((not ateNormalPellet) and (not victimExists)) + 2 * (turnPenalty and victimExists) + 5 * evadePenalty,
-						directionBuf = currNode.directionBuf + [direction],
-						delayBuf = currNode.delayBuf + [predicted_delay + firstItLag * firstIt + turnPenalty * turnLag],
+						self.state.snapshot(),
+						fCost = int((self.hCostExtend(currNode.gCost, currNode.bufLength, victimColor, self.attraction(victimColor)) + currNode.gCost + 1) * self.fCostMultiplier(danger)),
+						gCost = gCost,
+						parent = currNode,
+						direction = direction,
+						delay = predicted_delay + firstItLag * firstIt + turnPenalty * turnLag,
 						bufLength = currNode.bufLength + 1,
 						victimCaught = victimCaught,
 						targetCaught = targetCaught
 					)
 
+					# In macro-action mode, keep running to the end of the corridor
+					if self.macroActions and (direction != Directions.NONE):
+						self.runCorridor(nextNode, predicted_delay, turnLag, victimColor, pelletTarget, rootNode)
+						if nextNode.runMoves:
+							if transpositions.get(nextNode.snapshot[-1], INF) <= nextNode.gCost:
+								continue
+							transpositions[nextNode.snapshot[-1]] = nextNode.gCost
+
+					# Prune moves into traps
+					if self.pruneTraps and (not inTrap) and self.trapped():
+						self.numPruned += 1
+						continue
+
 					# Add the next node to the priority queue
-					heappush(priorityQueue, nextNode)
+					heappush(priorityQueue, (nextNode.fCost, self.pushCount, nextNode))
+					self.pushCount += 1
+					self.numNodes += 1
+
+					# Keep track of the best partial plan
+					if nextNode.betterPartialPlan(bestNode):
+						bestNode = nextNode
 
 			firstIt = False
 
+		# Out of time: queue the best partial plan (if it has any moves)
+		if self.timedOut and (bestNode is not rootNode):
+			self.queuePlan(bestNode, startRow, startCol, rootNode)
+
+		# Out of nodes in a reused tree: it may lack moves which a fresh search
+		# would find (pruned as transpositions of other subtrees), so start over
+		elif self.treeReused and not self.timedOut:
+			self.state.restore(startSnapshot)
+			return self.plan(
+				predicted_delay, startVictimColor, startPelletTarget,
+				max(deadline - time.perf_counter(), 0.0), rootDirections, bound, stop
+			)
+
 		#print("Trapped...")
 
+		self.reportBudget(startTime, budget)
 		return victimColor, pelletTarget
\ No newline at end of file
@@ -10,6 +10,12 @@ from gameState import *
 # A-Star Policy
 from policies.astar.aStarPolicy import *
 
+# A-Star Policy, running in worker processes
+from policies.astar.workerPolicy import WorkerPolicy, RootSplitPolicy
+
+# Speculative planning, while the robot carries out a move
+from policies.astar.speculativePlanner import SpeculativePlanner
+
 # Get the FPS of the server from the config.json file
 def getGameFPS() -> int:
 
@@ -26,7 +32,14 @@ class DecisionModule:
 	programming for Pacbot, using asyncio.
 	'''
 
-	def __init__(self, state: GameState) -> None:
+	def __init__(
+		self,
+		state: GameState,
+		useWorker: bool = True,
+		numWorkers: int = 1,
+		horizon: int = 14,
+		speculate: bool = True
+	) -> None:
 		'''
 		Construct a new decision module object
 		'''
@@ -34,8 +47,35 @@ class DecisionModule:
 		# Game state object to store the game information
 		self.state = state
 
-		# Policy object, with the game state
-		self.policy = AStarPolicy(state, newLocation(5, 21, self.state))
+		# Policy object, with the game state (and the server frame rate, which
+		# sets the planning budget); by default, planning runs in a worker
+		# process, so that it does not block the event loop, and with more than
+		# one worker, the search is split by first move across the workers
+		self.policy: AStarPolicy | WorkerPolicy | RootSplitPolicy
+		if useWorker and numWorkers > 1:
+			self.policy = RootSplitPolicy(state, gameFPS=getGameFPS(), numWorkers=numWorkers, horizon=horizon)
+		elif useWorker:
+			self.policy = WorkerPolicy(state, gameFPS=getGameFPS(), horizon=horizon)
+		else:
+			self.policy = AStarPolicy(state, newLocation(5, 21, self.state), gameFPS=getGameFPS(), horizon=horizon)
+
+		# Speculative planner, planning for the next state while the robot moves
+		# (only with a single worker process, as it plans in the background)
+		self.speculator: SpeculativePlanner | None = None
+		if speculate and isinstance(self.policy, WorkerPolicy):
+			self.speculator = SpeculativePlanner(state, self.policy)
+
+	def cacheCounters(self) -> tuple[int, int, int, int] | None:
+		'''
+		Counters of the policy's plan cache (see PlanCache.counters), which is in
+		the worker process when planning runs there (None without a cache)
+		'''
+
+		if isinstance(self.policy, AStarPolicy):
+			return self.policy.planCache.counters() if (self.policy.planCache is not None) else None
+		if isinstance(self.policy, WorkerPolicy):
+			return self.policy.cacheCounters
+		return None
 
 	async def decisionLoop(self) -> None:
 		'''
@@ -69,8 +109,21 @@ class DecisionModule:
 			# Figure out which actions to take, according to the policy
 
 			print("astar calculating...")
-			victimColor, pelletTarget = await self.policy.act(4, victimColor, pelletTarget)
-			print("astar done")
+			if self.speculator is not None:
+				hits = self.speculator.hits
+				victimColor, pelletTarget = await self.speculator.act(4, victimColor, pelletTarget)
+				print(f"astar {'speculative hit' if self.speculator.hits > hits else 'speculative miss'} " + \
+					f"({100 * self.speculator.hitRate():.0f}% hit rate, " + \
+					f"{self.speculator.hits} hits, {self.speculator.misses} misses)")
+			else:
+				victimColor, pelletTarget = await self.policy.act(4, victimColor, pelletTarget)
+			print(f"astar done ({1000 * self.policy.planTime:.1f} ms, {100 * self.policy.budgetUsed:.0f}% of budget" + \
+				(", partial plan)" if self.policy.timedOut else ")"))
+			cacheCounters = self.cacheCounters()
+			if cacheCounters is not None:
+				hits, misses, invalidations, evictions = cacheCounters
+				print(f"plan cache: {100 * hits / max(hits + misses, 1):.0f}% hit rate, " + \
+					f"{invalidations} invalidated, {evictions} evicted")
 
 			if not len(self.state.writeServerBuf):
 				print(f"{YELLOW}astar failed, trying again{NORMAL}")
@@ -83,6 +136,10 @@ class DecisionModule:
 
 			self.state.setClientMode(ClientMode.PLANNED)
 
+			# Plan ahead for the likely next states, while the robot moves
+			if self.speculator is not None:
+				self.speculator.speculate(4, victimColor, pelletTarget)
+
 			# Free up the event loop
 			await asyncio.sleep(0.005)
 
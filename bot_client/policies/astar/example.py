@@ -1 +0,0 @@
-PACHATTAN = {541200: 0, 541712: 1, 541216: 1, 542224: 2, 541232: 2, 542736: 3, 541248: 3, 543248: 4, 541264: 4, 543760: 5, 543264: 5, 541280: 5, 544272: 6, 543280: 6, 541792: 6, 541296: 6, 544784: 7, 543296: 7, 542304: 7, 541312: 7, 544800: 8, 543312: 8, 542816: 8, 541328: 8, 544816: 9, 543328: 9, 541344: 9, 544832: 10, 543840: 10, 543344: 10, 541360: 10, 544848: 11, 544352: 11, 543360: 11, 541376: 11, 544864: 12, 543376: 12, 541888: 12, 545376: 13, 543888: 13, 543392: 13, 542400: 13, 545888: 14, 544400: 14, 543408: 14, 542912: 14, 546400: 15, 544912: 15, 543424: 15, 546912: 16, 544928: 16, 543440: 16, 547424: 17, 544944: 17, 543456: 17, 547936: 18, 544960: 18, 543472: 18, 548448: 19, 547952: 19, 545472: 19, 542960: 19, 543488: 19, 548960: 20, 547968: 20, 545984: 20, 542448: 20, 543504: 20, 549472: 21, 547984: 21, 546496: 21, 541936: 21, 543520: 21, 549984: 22, 547472: 22, 548496: 22, 546480: 22, 546512: 22, 541424: 22, 544032: 22, 543536: 22, 550496: 23, 546960: 23, 549008: 23, 546464: 23, 546528: 23, 541440: 23, 544544: 23, 543552: 23, 551008: 24, 546448: 24, 549520: 24, 546544: 24, 541456: 24, 545056: 24, 543568: 24, 550992: 25, 551520: 25, 551024: 25, 550032: 25, 549536: 25, 546032: 25, 546560: 25, 541472: 25, 545040: 25, 543056: 25, 544080: 25, 543584: 25, 550976: 26, 552032: 26, 551040: 26, 550544: 26, 549552: 26, 545520: 26, 546576: 26, 541488: 26, 545024: 26, 542544: 26, 544592: 26, 543600: 26, 550960: 27, 552544: 27, 551056: 27, 549568: 27, 545008: 27, 546592: 27, 541504: 27, 542032: 27, 545104: 27, 543616: 27, 550944: 28, 553056: 28, 552560: 28, 551072: 28, 549584: 28, 547104: 28, 541520: 28, 545616: 28, 545120: 28, 543632: 28, 550928: 29, 553568: 29, 552576: 29, 551088: 29, 549600: 29, 547616: 29, 541536: 29, 546128: 29, 545136: 29, 543648: 29, 551440: 30, 554080: 30, 552592: 30, 551104: 30, 549616: 30, 548128: 30, 541552: 30, 546640: 30, 545152: 30, 543136: 30, 544160: 30, 551952: 31, 554064: 31, 553104: 31, 552608: 31, 551616: 31, 549632: 31, 548640: 31, 548144: 31, 541568: 31, 547152: 31, 545168: 31, 542624: 31, 544672: 31, 552464: 32, 554048: 32, 553616: 32, 552624: 32, 552128: 32, 549648: 32, 549152: 32, 548160: 32, 541584: 32, 547664: 32, 545184: 32, 542112: 32, 552480: 33, 554032: 33, 554128: 33, 552640: 33, 549664: 33, 548176: 33, 541600: 33, 552496: 34, 553520: 34, 554016: 34, 554144: 34, 552656: 34, 550176: 34, 548688: 34, 553008: 35, 554000: 35, 554160: 35, 552672: 35, 550688: 35, 549200: 35, 554512: 36, 554176: 36, 552688: 36, 551200: 36, 549712: 36, 555024: 37, 554688: 37, 552176: 37, 552704: 37, 551184: 37, 551216: 37, 550224: 37, 555536: 38, 555200: 38, 551664: 38, 552720: 38, 551168: 38, 551232: 38, 550736: 38, 555552: 39, 555712: 39, 551152: 39, 552736: 39, 551248: 39, 555568: 40, 555696: 40, 555728: 40, 553248: 40, 552752: 40, 551760: 40, 551264: 40, 555584: 41, 555680: 41, 555744: 41, 553760: 41, 552768: 41, 552272: 41, 551280: 41, 555600: 42, 555664: 42, 555760: 42, 554272: 42, 552784: 42, 551296: 42, 555616: 43, 555648: 43, 555248: 43, 555776: 43, 554256: 43, 553296: 43, 551312: 43, 555632: 44, 554736: 44, 555792: 44, 554240: 44, 553808: 44, 551328: 44, 554224: 45, 555808: 45, 554320: 45, 551840: 45, 555824: 46, 554336: 46, 552352: 46, 555840: 47, 554352: 47, 552864: 47, 555856: 48, 554368: 48, 552848: 48, 555872: 49, 553856: 49, 554384: 49, 552832: 49, 555888: 50, 553344: 50, 554400: 50, 555904: 51, 554912: 51, 555920: 52, 555424: 52, 555936: 53, 1066000: 0, 1066512: 1, 558096: 2, 1067024: 2, 574480: 3, 1067536: 3, 590864: 4, 1068048: 4, 1067552: 4, 607248: 5, 1068560: 5, 1067568: 5, 623632: 6, 1069072: 6, 1067584: 6, 1066080: 7, 640016: 7, 1069088: 7, 1067600: 7, 1066592: 8, 656400: 8, 1069104: 8, 1067616: 8, 1067104: 9, 672784: 9, 1069120: 9, 1068128: 9, 1067632: 9, 689168: 10, 1069136: 10, 1068640: 10, 1067648: 10, 705552: 11, 1069152: 11, 1067664: 11, 721936: 12, 1069664: 12, 1068176: 12, 1067680: 12, 1066176: 13, 1070176: 13, 1068688: 13, 1067696: 13, 1066688: 14, 1070688: 14, 1069200: 14, 1067712: 14, 1067200: 15, 1071200: 15, 1069216: 15, 1067728: 15, 1071712: 16, 1069232: 16, 1067744: 16, 1072224: 17, 1069248: 17, 1067760: 17, 1072736: 18, 1072240: 18, 1069760: 18, 1067248: 18, 1067776: 18, 1073248: 19, 1072256: 19, 1070272: 19, 1066736: 19, 1067792: 19, 1073760: 20, 1072272: 20, 1070784: 20, 1066224: 20, 1067808: 20, 1074272: 21, 1071760: 21, 1072784: 21, 1070768: 21, 1070800: 21, 771088: 21, 1068320: 21, 1067824: 21, 1074784: 22, 1071248: 22, 1073296: 22, 1070752: 22, 1070816: 22, 787472: 22, 1068832: 22, 1067840: 22, 1075296: 23, 1070736: 23, 1073808: 23, 1070832: 23, 803856: 23, 1069344: 23, 1067856: 23, 1075280: 24, 1075808: 24, 1075312: 24, 1074320: 24, 1073824: 24, 1070320: 24, 1070848: 24, 820240: 24, 1069328: 24, 1067344: 24, 1068368: 24, 1067872: 24, 1075264: 25, 1076320: 25, 1075328: 25, 1074832: 25, 1073840: 25, 1069808: 25, 1070864: 25, 836624: 25, 1069312: 25, 1066832: 25, 1068880: 25, 1067888: 25, 1075248: 26, 1076832: 26, 1075344: 26, 1073856: 26, 1069296: 26, 1070880: 26, 853008: 26, 1066320: 26, 1069392: 26, 1067904: 26, 1075232: 27, 1077344: 27, 1076848: 27, 1075360: 27, 1073872: 27, 1071392: 27, 869392: 27, 1069904: 27, 1069408: 27, 1067920: 27, 1075216: 28, 1077856: 28, 1076864: 28, 1075376: 28, 1073888: 28, 1071904: 28, 885776: 28, 1070416: 28, 1069424: 28, 1067936: 28, 1075728: 29, 1078368: 29, 1076880: 29, 1075392: 29, 1073904: 29, 1072416: 29, 902160: 29, 1070928: 29, 1069440: 29, 1067424: 29, 1068448: 29, 1076240: 30, 1078352: 30, 1077392: 30, 1076896: 30, 1075904: 30, 1073920: 30, 1072928: 30, 1072432: 30, 918544: 30, 1071440: 30, 1069456: 30, 1066912: 30, 1068960: 30, 1076752: 31, 1078336: 31, 1077904: 31, 1076912: 31, 1076416: 31, 1073936: 31, 1073440: 31, 1072448: 31, 934928: 31, 1071952: 31, 1069472: 31, 1066400: 31, 1076768: 32, 1078320: 32, 1078416: 32, 1076928: 32, 1073952: 32, 1072464: 32, 951312: 32, 1076784: 33, 1077808: 33, 1078304: 33, 1078432: 33, 1076944: 33, 1074464: 33, 1072976: 33, 1077296: 34, 1078288: 34, 1078448: 34, 1076960: 34, 1074976: 34, 1073488: 34, 1078800: 35, 1078464: 35, 1076976: 35, 1075488: 35, 1074000: 35, 1079312: 36, 1078976: 36, 1076464: 36, 1076992: 36, 1075472: 36, 1075504: 36, 1074512: 36, 1079824: 37, 1079488: 37, 1075952: 37, 1077008: 37, 1075456: 37, 1075520: 37, 1075024: 37, 1079840: 38, 1080000: 38, 1075440: 38, 1077024: 38, 1075536: 38, 1079856: 39, 1079984: 39, 1080016: 39, 1077536: 39, 1077040: 39, 1076048: 39, 1075552: 39, 1079872: 40, 1079968: 40, 1080032: 40, 1078048: 40, 1077056: 40, 1076560: 40, 1075568: 40, 1079888: 41, 1079952: 41, 1080048: 41, 1078560: 41, 1077072: 41, 1075584: 41, 1079904: 42, 1079936: 42, 1079536: 42, 1080064: 42, 1078544: 42, 1077584: 42, 1075600: 42, 1079920: 43, 1079024: 43, 1080080: 43, 1078528: 43, 1078096: 43, 1075616: 43, 1078512: 44, 1080096: 44, 1078608: 44, 1076128: 44, 1080112: 45, 1078624: 45, 1076640: 45, 1080128: 46, 1078640: 46, 1077152: 46, 1080144: 47, 1078656: 47, 1077136: 47, 1080160: 48, 1078144: 48, 1078672: 48, 1077120: 48, 1080176: 49, 1077632: 49, 1078688: 49, 1080192: 50, 1079200: 50, 1080208: 51, 1079712: 51, 1080224: 52, 1590800: 0, 1591312: 1, 1591824: 2, 558608: 3, 1592336: 3, 1591840: 3, 574992: 4, 1592848: 4, 1591856: 4, 591376: 5, 1593360: 5, 1591872: 5, 607760: 6, 1593376: 6, 1591888: 6, 624144: 7, 1593392: 7, 1591904: 7, 1148432: 8, 640528: 8, 1593408: 8, 1591392: 8, 1592416: 8, 1591920: 8, 1590880: 9, 656912: 9, 1593424: 9, 1592928: 9, 1591936: 9, 673296: 10, 1593440: 10, 1591952: 10, 689680: 11, 1593952: 11, 1592464: 11, 1591968: 11, 706064: 12, 1594464: 12, 1592976: 12, 1591984: 12, 722448: 13, 1594976: 13, 1593488: 13, 1592000: 13, 1246736: 14, 1595488: 14, 1593504: 14, 1591488: 14, 1592016: 14, 1590976: 15, 1596000: 15, 1593520: 15, 1592032: 15, 1596512: 16, 1593536: 16, 1592048: 16, 1597024: 17, 1596528: 17, 1594048: 17, 1591536: 17, 1592064: 17, 1597536: 18, 1596544: 18, 1594560: 18, 1591024: 18, 1592080: 18, 1598048: 19, 1596560: 19, 1595072: 19, 1295888: 19, 1592096: 19, 1598560: 20, 1596048: 20, 1597072: 20, 1595056: 20, 1595088: 20, 771600: 20, 1592608: 20, 1592112: 20, 1599072: 21, 1595536: 21, 1597584: 21, 1595040: 21, 1595104: 21, 787984: 21, 1593120: 21, 1592128: 21, 1599584: 22, 1595024: 22, 1598096: 22, 1595120: 22, 804368: 22, 1593632: 22, 1592144: 22, 1599568: 23, 1600096: 23, 1599600: 23, 1598608: 23, 1598112: 23, 1594608: 23, 1595136: 23, 820752: 23, 1593616: 23, 1591632: 23, 1592656: 23, 1592160: 23, 1599552: 24, 1600608: 24, 1599616: 24, 1599120: 24, 1598128: 24, 1594096: 24, 1595152: 24, 837136: 24, 1593600: 24, 1591120: 24, 1593168: 24, 1592176: 24, 1599536: 25, 1601120: 25, 1599632: 25, 1598144: 25, 1593584: 25, 1595168: 25, 853520: 25, 1394192: 25, 1593680: 25, 1592192: 25, 1599520: 26, 1601632: 26, 1601136: 26, 1599648: 26, 1598160: 26, 1595680: 26, 869904: 26, 1594192: 26, 1593696: 26, 1592208: 26, 1599504: 27, 1602144: 27, 1601152: 27, 1599664: 27, 1598176: 27, 1596192: 27, 886288: 27, 1594704: 27, 1593712: 27, 1592224: 27, 1600016: 28, 1602656: 28, 1601168: 28, 1599680: 28, 1598192: 28, 1596704: 28, 902672: 28, 1595216: 28, 1593728: 28, 1591712: 28, 1592736: 28, 1600528: 29, 1602640: 29, 1601680: 29, 1601184: 29, 1600192: 29, 1598208: 29, 1597216: 29, 1596720: 29, 919056: 29, 1595728: 29, 1593744: 29, 1591200: 29, 1593248: 29, 1601040: 30, 1602624: 30, 1602192: 30, 1601200: 30, 1600704: 30, 1598224: 30, 1597728: 30, 1596736: 30, 935440: 30, 1596240: 30, 1593760: 30, 1476112: 30, 1601056: 31, 1602608: 31, 1602704: 31, 1601216: 31, 1598240: 31, 1596752: 31, 951824: 31, 1601072: 32, 1602096: 32, 1602592: 32, 1602720: 32, 1601232: 32, 1598752: 32, 1597264: 32, 1601584: 33, 1602576: 33, 1602736: 33, 1601248: 33, 1599264: 33, 1597776: 33, 1603088: 34, 1602752: 34, 1601264: 34, 1599776: 34, 1598288: 34, 1603600: 35, 1603264: 35, 1600752: 35, 1601280: 35, 1599760: 35, 1599792: 35, 1598800: 35, 1604112: 36, 1603776: 36, 1600240: 36, 1601296: 36, 1599744: 36, 1599808: 36, 1599312: 36, 1604128: 37, 1604288: 37, 1599728: 37, 1601312: 37, 1599824: 37, 1604144: 38, 1604272: 38, 1604304: 38, 1601824: 38, 1601328: 38, 1600336: 38, 1599840: 38, 1604160: 39, 1604256: 39, 1604320: 39, 1602336: 39, 1601344: 39, 1600848: 39, 1599856: 39, 1604176: 40, 1604240: 40, 1604336: 40, 1602848: 40, 1601360: 40, 1599872: 40, 1604192: 41, 1604224: 41, 1603824: 41, 1604352: 41, 1602832: 41, 1601872: 41, 1599888: 41, 1604208: 42, 1603312: 42, 1604368: 42, 1602816: 42, 1602384: 42, 1599904: 42, 1602800: 43, 1604384: 43, 1602896: 43, 1600416: 43, 1604400: 44, 1602912: 44, 1600928: 44, 1604416: 45, 1602928: 45, 1601440: 45, 1604432: 46, 1602944: 46, 1601424: 46, 1604448: 47, 1602432: 47, 1602960: 47, 1601408: 47, 1604464: 48, 1601920: 48, 1602976: 48, 1604480: 49, 1603488: 49, 1604496: 50, 1604000: 50, 1604512: 51, 2115600: 0, 2116112: 1, 2116624: 2, 2116128: 2, 2117136: 3, 2116144: 3, 559120: 4, 2117648: 4, 2116160: 4, 575504: 5, 2117664: 5, 2116176: 5, 591888: 6, 2117680: 6, 2116192: 6, 608272: 7, 2117696: 7, 2115680: 7, 2116704: 7, 2116208: 7, 624656: 8, 2117712: 8, 1673232: 8, 2117216: 8, 2116224: 8, 1148944: 9, 641040: 9, 2117728: 9, 2116240: 9, 657424: 10, 2118240: 10, 2116752: 10, 2116256: 10, 673808: 11, 2118752: 11, 2117264: 11, 2116272: 11, 690192: 12, 2119264: 12, 2117776: 12, 2116288: 12, 706576: 13, 2119776: 13, 2117792: 13, 2115776: 13, 2116304: 13, 722960: 14, 2120288: 14, 2117808: 14, 1771536: 14, 2116320: 14, 1247248: 15, 2120800: 15, 2117824: 15, 2116336: 15, 2121312: 16, 2120816: 16, 2118336: 16, 2115824: 16, 2116352: 16, 2121824: 17, 2120832: 17, 2118848: 17, 1820688: 17, 2116368: 17, 2122336: 18, 2120848: 18, 2119360: 18, 1296400: 18, 2116384: 18, 2122848: 19, 2120336: 19, 2121360: 19, 2119344: 19, 2119376: 19, 772112: 19, 2116896: 19, 2116400: 19, 2123360: 20, 2119824: 20, 2121872: 20, 2119328: 20, 2119392: 20, 788496: 20, 2117408: 20, 2116416: 20, 2123872: 21, 2119312: 21, 2122384: 21, 2119408: 21, 804880: 21, 2117920: 21, 2116432: 21, 2123856: 22, 2124384: 22, 2123888: 22, 2122896: 22, 2122400: 22, 2118896: 22, 2119424: 22, 821264: 22, 2117904: 22, 2115920: 22, 2116944: 22, 2116448: 22, 2123840: 23, 2124896: 23, 2123904: 23, 2123408: 23, 2122416: 23, 2118384: 23, 2119440: 23, 837648: 23, 2117888: 23, 1918992: 23, 2117456: 23, 2116464: 23, 2123824: 24, 2125408: 24, 2123920: 24, 2122432: 24, 2117872: 24, 2119456: 24, 854032: 24, 1394704: 24, 2117968: 24, 2116480: 24, 2123808: 25, 2125920: 25, 2125424: 25, 2123936: 25, 2122448: 25, 2119968: 25, 870416: 25, 2118480: 25, 2117984: 25, 2116496: 25, 2123792: 26, 2126432: 26, 2125440: 26, 2123952: 26, 2122464: 26, 2120480: 26, 886800: 26, 2118992: 26, 2118000: 26, 2116512: 26, 2124304: 27, 2126944: 27, 2125456: 27, 2123968: 27, 2122480: 27, 2120992: 27, 903184: 27, 2119504: 27, 2118016: 27, 2116000: 27, 2117024: 27, 2124816: 28, 2126928: 28, 2125968: 28, 2125472: 28, 2124480: 28, 2122496: 28, 2121504: 28, 2121008: 28, 919568: 28, 2120016: 28, 2118032: 28, 2000912: 28, 2117536: 28, 2125328: 29, 2126912: 29, 2126480: 29, 2125488: 29, 2124992: 29, 2122512: 29, 2122016: 29, 2121024: 29, 935952: 29, 2120528: 29, 2118048: 29, 1476624: 29, 2125344: 30, 2126896: 30, 2126992: 30, 2125504: 30, 2122528: 30, 2121040: 30, 952336: 30, 2125360: 31, 2126384: 31, 2126880: 31, 2127008: 31, 2125520: 31, 2123040: 31, 2121552: 31, 2125872: 32, 2126864: 32, 2127024: 32, 2125536: 32, 2123552: 32, 2122064: 32, 2127376: 33, 2127040: 33, 2125552: 33, 2124064: 33, 2122576: 33, 2127888: 34, 2127552: 34, 2125040: 34, 2125568: 34, 2124048: 34, 2124080: 34, 2123088: 34, 2128400: 35, 2128064: 35, 2124528: 35, 2125584: 35, 2124032: 35, 2124096: 35, 2123600: 35, 2128416: 36, 2128576: 36, 2124016: 36, 2125600: 36, 2124112: 36, 2128432: 37, 2128560: 37, 2128592: 37, 2126112: 37, 2125616: 37, 2124624: 37, 2124128: 37, 2128448: 38, 2128544: 38, 2128608: 38, 2126624: 38, 2125632: 38, 2125136: 38, 2124144: 38, 2128464: 39, 2128528: 39, 2128624: 39, 2127136: 39, 2125648: 39, 2124160: 39, 2128480: 40, 2128512: 40, 2128112: 40, 2128640: 40, 2127120: 40, 2126160: 40, 2124176: 40, 2128496: 41, 2127600: 41, 2128656: 41, 2127104: 41, 2126672: 41, 2124192: 41, 2127088: 42, 2128672: 42, 2127184: 42, 2124704: 42, 2128688: 43, 2127200: 43, 2125216: 43, 2128704: 44, 2127216: 44, 2125728: 44, 2128720: 45, 2127232: 45, 2125712: 45, 2128736: 46, 2126720: 46, 2127248: 46, 2125696: 46, 2128752: 47, 2126208: 47, 2127264: 47, 2128768: 48, 2127776: 48, 2128784: 49, 2128288: 49, 2128800: 50, 2640400: 0, 2640912: 1, 2640416: 1, 2641424: 2, 2640432: 2, 2641936: 3, 2640448: 3, 2641952: 4, 2640464: 4, 559632: 5, 2641968: 5, 2640480: 5, 576016: 6, 2641984: 6, 2198032: 6, 2640992: 6, 2640496: 6, 592400: 7, 2642000: 7, 1673744: 7, 2641504: 7, 2640512: 7, 608784: 8, 2642016: 8, 1149456: 8, 2640528: 8, 625168: 9, 2642528: 9, 2641040: 9, 2640544: 9, 641552: 10, 2643040: 10, 2641552: 10, 2640560: 10, 657936: 11, 2643552: 11, 2642064: 11, 2640576: 11, 674320: 12, 2644064: 12, 2642080: 12, 2296336: 12, 2640592: 12, 690704: 13, 2644576: 13, 2642096: 13, 1772048: 13, 2640608: 13, 707088: 14, 2645088: 14, 2642112: 14, 1247760: 14, 2640624: 14, 723472: 15, 2645600: 15, 2645104: 15, 2642624: 15, 2345488: 15, 2640640: 15, 2646112: 16, 2645120: 16, 2643136: 16, 1821200: 16, 2640656: 16, 2646624: 17, 2645136: 17, 2643648: 17, 1296912: 17, 2640672: 17, 2647136: 18, 2644624: 18, 2645648: 18, 2643632: 18, 2643664: 18, 772624: 18, 2641184: 18, 2640688: 18, 2647648: 19, 2644112: 19, 2646160: 19, 2643616: 19, 2643680: 19, 789008: 19, 2641696: 19, 2640704: 19, 2648160: 20, 2643600: 20, 2646672: 20, 2643696: 20, 805392: 20, 2642208: 20, 2640720: 20, 2648144: 21, 2648672: 21, 2648176: 21, 2647184: 21, 2646688: 21, 2643184: 21, 2643712: 21, 821776: 21, 2642192: 21, 2443792: 21, 2641232: 21, 2640736: 21, 2648128: 22, 2649184: 22, 2648192: 22, 2647696: 22, 2646704: 22, 2642672: 22, 2643728: 22, 838160: 22, 2642176: 22, 1919504: 22, 2641744: 22, 2640752: 22, 2648112: 23, 2649696: 23, 2648208: 23, 2646720: 23, 2642160: 23, 2643744: 23, 854544: 23, 1395216: 23, 2642256: 23, 2640768: 23, 2648096: 24, 2650208: 24, 2649712: 24, 2648224: 24, 2646736: 24, 2644256: 24, 870928: 24, 2642768: 24, 2642272: 24, 2640784: 24, 2648080: 25, 2650720: 25, 2649728: 25, 2648240: 25, 2646752: 25, 2644768: 25, 887312: 25, 2643280: 25, 2642288: 25, 2640800: 25, 2648592: 26, 2651232: 26, 2649744: 26, 2648256: 26, 2646768: 26, 2645280: 26, 903696: 26, 2643792: 26, 2642304: 26, 2525712: 26, 2641312: 26, 2649104: 27, 2651216: 27, 2650256: 27, 2649760: 27, 2648768: 27, 2646784: 27, 2645792: 27, 2645296: 27, 920080: 27, 2644304: 27, 2642320: 27, 2001424: 27, 2641824: 27, 2649616: 28, 2651200: 28, 2650768: 28, 2649776: 28, 2649280: 28, 2646800: 28, 2646304: 28, 2645312: 28, 936464: 28, 2644816: 28, 2642336: 28, 1477136: 28, 2649632: 29, 2651184: 29, 2651280: 29, 2649792: 29, 2646816: 29, 2645328: 29, 952848: 29, 2649648: 30, 2650672: 30, 2651168: 30, 2651296: 30, 2649808: 30, 2647328: 30, 2645840: 30, 2650160: 31, 2651152: 31, 2651312: 31, 2649824: 31, 2647840: 31, 2646352: 31, 2651664: 32, 2651328: 32, 2649840: 32, 2648352: 32, 2646864: 32, 2652176: 33, 2651840: 33, 2649328: 33, 2649856: 33, 2648336: 33, 2648368: 33, 2647376: 33, 2652688: 34, 2652352: 34, 2648816: 34, 2649872: 34, 2648320: 34, 2648384: 34, 2647888: 34, 2652704: 35, 2652864: 35, 2648304: 35, 2649888: 35, 2648400: 35, 2652720: 36, 2652848: 36, 2652880: 36, 2650400: 36, 2649904: 36, 2648912: 36, 2648416: 36, 2652736: 37, 2652832: 37, 2652896: 37, 2650912: 37, 2649920: 37, 2649424: 37, 2648432: 37, 2652752: 38, 2652816: 38, 2652912: 38, 2651424: 38, 2649936: 38, 2648448: 38, 2652768: 39, 2652800: 39, 2652400: 39, 2652928: 39, 2651408: 39, 2650448: 39, 2648464: 39, 2652784: 40, 2651888: 40, 2652944: 40, 2651392: 40, 2650960: 40, 2648480: 40, 2651376: 41, 2652960: 41, 2651472: 41, 2648992: 41, 2652976: 42, 2651488: 42, 2649504: 42, 2652992: 43, 2651504: 43, 2650016: 43, 2653008: 44, 2651520: 44, 2650000: 44, 2653024: 45, 2651008: 45, 2651536: 45, 2649984: 45, 2653040: 46, 2650496: 46, 2651552: 46, 2653056: 47, 2652064: 47, 2653072: 48, 2652576: 48, 2653088: 49, 3165200: 0, 3165712: 1, 2657296: 2, 3166224: 2, 2673680: 3, 3166240: 3, 2690064: 4, 3166256: 4, 2706448: 5, 3166272: 5, 560144: 6, 2722832: 6, 3166288: 6, 576528: 7, 2198544: 7, 3165280: 7, 2739216: 7, 3166304: 7, 592912: 8, 1674256: 8, 3165792: 8, 2755600: 8, 3166816: 8, 609296: 9, 1149968: 9, 2771984: 9, 3167328: 9, 625680: 10, 3165328: 10, 2788368: 10, 3167840: 10, 642064: 11, 3165840: 11, 2804752: 11, 3168352: 11, 658448: 12, 3166352: 12, 2821136: 12, 3168864: 12, 674832: 13, 3166368: 13, 2296848: 13, 2837520: 13, 3169376: 13, 691216: 14, 3166384: 14, 1772560: 14, 2853904: 14, 3169888: 14, 3169392: 14, 707600: 15, 3166400: 15, 1248272: 15, 2870288: 15, 3170400: 15, 3169408: 15, 723984: 16, 3166912: 16, 2346000: 16, 2886672: 16, 3170912: 16, 3169424: 16, 3167424: 17, 1821712: 17, 2903056: 17, 3171424: 17, 3168912: 17, 3169936: 17, 3167936: 18, 1297424: 18, 2919440: 18, 3171936: 18, 3168400: 18, 3170448: 18, 3167920: 19, 3167952: 19, 773136: 19, 3165472: 19, 2935824: 19, 3172448: 19, 3167888: 19, 3170960: 19, 3167904: 20, 3167968: 20, 789520: 20, 3165984: 20, 2952208: 20, 3172432: 20, 3172960: 20, 3172464: 20, 3171472: 20, 3170976: 20, 3167984: 21, 805904: 21, 3166496: 21, 2968592: 21, 3172416: 21, 3173472: 21, 3172480: 21, 3171984: 21, 3170992: 21, 3167472: 22, 3168000: 22, 822288: 22, 3166480: 22, 2444304: 22, 3165520: 22, 2984976: 22, 3172400: 22, 3173984: 22, 3172496: 22, 3171008: 22, 3166960: 23, 3168016: 23, 838672: 23, 3166464: 23, 1920016: 23, 3166032: 23, 3001360: 23, 3172384: 23, 3174496: 23, 3174000: 23, 3172512: 23, 3171024: 23, 3166448: 24, 3168032: 24, 855056: 24, 1395728: 24, 3166544: 24, 3017744: 24, 3172368: 24, 3175008: 24, 3174016: 24, 3172528: 24, 3171040: 24, 3168544: 25, 871440: 25, 3167056: 25, 3166560: 25, 3034128: 25, 3172880: 25, 3175520: 25, 3174032: 25, 3172544: 25, 3171056: 25, 3169056: 26, 887824: 26, 3167568: 26, 3166576: 26, 3050512: 26, 3173392: 26, 3175504: 26, 3174544: 26, 3174048: 26, 3173056: 26, 3171072: 26, 3169568: 27, 904208: 27, 3168080: 27, 3166592: 27, 2526224: 27, 3165600: 27, 3173904: 27, 3175488: 27, 3175056: 27, 3174064: 27, 3173568: 27, 3171088: 27, 3170080: 28, 3169584: 28, 920592: 28, 3168592: 28, 3166608: 28, 2001936: 28, 3166112: 28, 3173920: 28, 3175472: 28, 3175568: 28, 3174080: 28, 3171104: 28, 3170592: 29, 3169600: 29, 936976: 29, 3169104: 29, 3166624: 29, 1477648: 29, 3173936: 29, 3174960: 29, 3175456: 29, 3175584: 29, 3174096: 29, 3171616: 29, 3169616: 30, 953360: 30, 3174448: 30, 3175440: 30, 3175600: 30, 3174112: 30, 3172128: 30, 3170128: 31, 3175952: 31, 3175616: 31, 3174128: 31, 3172640: 31, 3170640: 32, 3176464: 32, 3176128: 32, 3173616: 32, 3174144: 32, 3172624: 32, 3172656: 32, 3171152: 33, 3176976: 33, 3176640: 33, 3173104: 33, 3174160: 33, 3172608: 33, 3172672: 33, 3171664: 34, 3176992: 34, 3177152: 34, 3172592: 34, 3174176: 34, 3172688: 34, 3172176: 35, 3177008: 35, 3177136: 35, 3177168: 35, 3174688: 35, 3174192: 35, 3173200: 35, 3172704: 35, 3177024: 36, 3177120: 36, 3177184: 36, 3175200: 36, 3174208: 36, 3173712: 36, 3172720: 36, 3177040: 37, 3177104: 37, 3177200: 37, 3175712: 37, 3174224: 37, 3172736: 37, 3177056: 38, 3177088: 38, 3176688: 38, 3177216: 38, 3175696: 38, 3174736: 38, 3172752: 38, 3177072: 39, 3176176: 39, 3177232: 39, 3175680: 39, 3175248: 39, 3172768: 39, 3175664: 40, 3177248: 40, 3175760: 40, 3173280: 40, 3177264: 41, 3175776: 41, 3173792: 41, 3177280: 42, 3175792: 42, 3174304: 42, 3177296: 43, 3175808: 43, 3174288: 43, 3177312: 44, 3175296: 44, 3175824: 44, 3174272: 44, 3177328: 45, 3174784: 45, 3175840: 45, 3177344: 46, 3176352: 46, 3177360: 47, 3176864: 47, 3177376: 48, 3690000: 0, 3690512: 1, 3690528: 2, 2657808: 3, 3690544: 3, 2674192: 4, 3690560: 4, 2690576: 5, 3690576: 5, 2706960: 6, 3690592: 6, 560656: 7, 2723344: 7, 3690080: 7, 3691104: 7, 577040: 8, 2199056: 8, 3247632: 8, 2739728: 8, 3691616: 8, 593424: 9, 1674768: 9, 2756112: 9, 3692128: 9, 609808: 10, 1150480: 10, 2772496: 10, 3692640: 10, 626192: 11, 3296784: 11, 2788880: 11, 3693152: 11, 642576: 12, 3690128: 12, 2805264: 12, 3693664: 12, 658960: 13, 3690640: 13, 2821648: 13, 3694176: 13, 3693680: 13, 675344: 14, 3690656: 14, 2297360: 14, 2838032: 14, 3694688: 14, 3693696: 14, 691728: 15, 3690672: 15, 1773072: 15, 2854416: 15, 3695200: 15, 3693712: 15, 708112: 16, 3690688: 16, 1248784: 16, 2870800: 16, 3695712: 16, 3693200: 16, 3694224: 16, 724496: 17, 3691200: 17, 2346512: 17, 2887184: 17, 3696224: 17, 3692688: 17, 3694736: 17, 3691712: 18, 1822224: 18, 2903568: 18, 3696736: 18, 3692176: 18, 3695248: 18, 3692224: 19, 1297936: 19, 2919952: 19, 3696720: 19, 3697248: 19, 3696752: 19, 3692192: 19, 3695760: 19, 3695264: 19, 3692208: 20, 3692240: 20, 773648: 20, 3444240: 20, 2936336: 20, 3696704: 20, 3697760: 20, 3696768: 20, 3696272: 20, 3695280: 20, 3692256: 21, 790032: 21, 3690272: 21, 2952720: 21, 3696688: 21, 3698272: 21, 3696784: 21, 3695296: 21, 3692272: 22, 806416: 22, 3690784: 22, 2969104: 22, 3696672: 22, 3698784: 22, 3698288: 22, 3696800: 22, 3695312: 22, 3691760: 23, 3692288: 23, 822800: 23, 3690768: 23, 2444816: 23, 3493392: 23, 2985488: 23, 3696656: 23, 3699296: 23, 3698304: 23, 3696816: 23, 3695328: 23, 3691248: 24, 3692304: 24, 839184: 24, 3690752: 24, 1920528: 24, 3690320: 24, 3001872: 24, 3697168: 24, 3699808: 24, 3698320: 24, 3696832: 24, 3695344: 24, 3690736: 25, 3692320: 25, 855568: 25, 1396240: 25, 3690832: 25, 3018256: 25, 3697680: 25, 3699792: 25, 3698832: 25, 3698336: 25, 3697344: 25, 3695360: 25, 3692832: 26, 871952: 26, 3691344: 26, 3690848: 26, 3034640: 26, 3698192: 26, 3699776: 26, 3699344: 26, 3698352: 26, 3697856: 26, 3695376: 26, 3693344: 27, 888336: 27, 3691856: 27, 3690864: 27, 3051024: 27, 3698208: 27, 3699760: 27, 3699856: 27, 3698368: 27, 3695392: 27, 3693856: 28, 904720: 28, 3692368: 28, 3690880: 28, 2526736: 28, 3575312: 28, 3698224: 28, 3699248: 28, 3699744: 28, 3699872: 28, 3698384: 28, 3694880: 28, 3695904: 28, 3694368: 29, 3693872: 29, 921104: 29, 3692880: 29, 3690896: 29, 2002448: 29, 3690400: 29, 3698736: 29, 3699728: 29, 3699888: 29, 3698400: 29, 3696416: 29, 3693888: 30, 937488: 30, 3693392: 30, 3690912: 30, 1478160: 30, 3700240: 30, 3699904: 30, 3698416: 30, 3696928: 30, 3693904: 31, 953872: 31, 3700752: 31, 3700416: 31, 3697904: 31, 3698432: 31, 3696912: 31, 3696944: 31, 3694416: 32, 3701264: 32, 3700928: 32, 3697392: 32, 3698448: 32, 3696896: 32, 3696960: 32, 3694928: 33, 3701280: 33, 3701440: 33, 3696880: 33, 3698464: 33, 3696976: 33, 3695440: 34, 3701296: 34, 3701424: 34, 3701456: 34, 3698976: 34, 3698480: 34, 3696464: 34, 3697488: 34, 3696992: 34, 3695952: 35, 3701312: 35, 3701408: 35, 3701472: 35, 3699488: 35, 3698496: 35, 3698000: 35, 3697008: 35, 3701328: 36, 3701392: 36, 3701488: 36, 3700000: 36, 3698512: 36, 3697024: 36, 3701344: 37, 3701376: 37, 3700976: 37, 3701504: 37, 3699984: 37, 3699024: 37, 3697040: 37, 3701360: 38, 3700464: 38, 3701520: 38, 3699968: 38, 3699536: 38, 3697056: 38, 3699952: 39, 3701536: 39, 3700048: 39, 3697568: 39, 3701552: 40, 3700064: 40, 3698080: 40, 3701568: 41, 3700080: 41, 3698592: 41, 3701584: 42, 3700096: 42, 3698576: 42, 3701600: 43, 3699584: 43, 3700112: 43, 3698560: 43, 3701616: 44, 3699072: 44, 3700128: 44, 3701632: 45, 3700640: 45, 3701648: 46, 3701152: 46, 3701664: 47, 4214800: 0, 4214816: 1, 4214832: 2, 4214848: 3, 2658320: 4, 4214864: 4, 2674704: 5, 4214880: 5, 2691088: 6, 3772432: 6, 4215392: 6, 2707472: 7, 3248144: 7, 4215904: 7, 561168: 8, 2723856: 8, 4216416: 8, 577552: 9, 2199568: 9, 2740240: 9, 4216928: 9, 593936: 10, 1675280: 10, 2756624: 10, 4217440: 10, 610320: 11, 1150992: 11, 2773008: 11, 4217952: 11, 626704: 12, 3297296: 12, 2789392: 12, 4218464: 12, 4217968: 12, 643088: 13, 3821584: 13, 2805776: 13, 4218976: 13, 4217984: 13, 659472: 14, 4214928: 14, 2822160: 14, 4219488: 14, 4218000: 14, 675856: 15, 4214944: 15, 2297872: 15, 2838544: 15, 4220000: 15, 4217488: 15, 4218512: 15, 692240: 16, 4214960: 16, 1773584: 16, 2854928: 16, 4220512: 16, 4216976: 16, 4219024: 16, 708624: 17, 4214976: 17, 1249296: 17, 2871312: 17, 4221024: 17, 4216464: 17, 4219536: 17, 725008: 18, 4215488: 18, 2347024: 18, 2887696: 18, 4221008: 18, 4221536: 18, 4221040: 18, 4216480: 18, 4220048: 18, 4219552: 18, 4216000: 19, 1822736: 19, 2904080: 19, 4220992: 19, 4222048: 19, 4221056: 19, 4216496: 19, 4220560: 19, 4219568: 19, 4216512: 20, 1298448: 20, 2920464: 20, 4220976: 20, 4222560: 20, 4221072: 20, 4219584: 20, 4216528: 21, 774160: 21, 3444752: 21, 2936848: 21, 4220960: 21, 4223072: 21, 4222576: 21, 4221088: 21, 4219600: 21, 4216544: 22, 790544: 22, 3969040: 22, 2953232: 22, 4220944: 22, 4223584: 22, 4222592: 22, 4221104: 22, 4219616: 22, 4216560: 23, 806928: 23, 4215072: 23, 2969616: 23, 4221456: 23, 4224096: 23, 4222608: 23, 4221120: 23, 4219632: 23, 4216048: 24, 4216576: 24, 823312: 24, 4215056: 24, 2445328: 24, 3493904: 24, 2986000: 24, 4221968: 24, 4224080: 24, 4223120: 24, 4222624: 24, 4221632: 24, 4219648: 24, 4215536: 25, 4216592: 25, 839696: 25, 4215040: 25, 1921040: 25, 4018192: 25, 3002384: 25, 4222480: 25, 4224064: 25, 4223632: 25, 4222640: 25, 4222144: 25, 4219664: 25, 4215024: 26, 4216608: 26, 856080: 26, 1396752: 26, 4215120: 26, 3018768: 26, 4222496: 26, 4224048: 26, 4224144: 26, 4222656: 26, 4219680: 26, 4217120: 27, 872464: 27, 4215632: 27, 4215136: 27, 3035152: 27, 4222512: 27, 4223536: 27, 4224032: 27, 4224160: 27, 4222672: 27, 4219168: 27, 4220192: 27, 4217632: 28, 888848: 28, 4216144: 28, 4215152: 28, 3051536: 28, 4223024: 28, 4224016: 28, 4224176: 28, 4222688: 28, 4218656: 28, 4220704: 28, 4218144: 29, 905232: 29, 4216656: 29, 4215168: 29, 2527248: 29, 3575824: 29, 4224528: 29, 4224192: 29, 4222704: 29, 4221216: 29, 4218160: 30, 921616: 30, 4217168: 30, 4215184: 30, 2002960: 30, 4100112: 30, 4225040: 30, 4224704: 30, 4222192: 30, 4222720: 30, 4221200: 30, 4221232: 30, 4218176: 31, 938000: 31, 4217680: 31, 4215200: 31, 1478672: 31, 4225552: 31, 4225216: 31, 4221680: 31, 4222736: 31, 4221184: 31, 4221248: 31, 4218192: 32, 954384: 32, 4225568: 32, 4225728: 32, 4221168: 32, 4222752: 32, 4221264: 32, 4218704: 33, 4225584: 33, 4225712: 33, 4225744: 33, 4223264: 33, 4222768: 33, 4220752: 33, 4221776: 33, 4221280: 33, 4219216: 34, 4225600: 34, 4225696: 34, 4225760: 34, 4223776: 34, 4222784: 34, 4220240: 34, 4222288: 34, 4221296: 34, 4219728: 35, 4225616: 35, 4225680: 35, 4225776: 35, 4224288: 35, 4222800: 35, 4221312: 35, 4225632: 36, 4225664: 36, 4225264: 36, 4225792: 36, 4224272: 36, 4223312: 36, 4221328: 36, 4225648: 37, 4224752: 37, 4225808: 37, 4224256: 37, 4223824: 37, 4221344: 37, 4224240: 38, 4225824: 38, 4224336: 38, 4221856: 38, 4225840: 39, 4224352: 39, 4222368: 39, 4225856: 40, 4224368: 40, 4222880: 40, 4225872: 41, 4224384: 41, 4222864: 41, 4225888: 42, 4223872: 42, 4224400: 42, 4222848: 42, 4225904: 43, 4223360: 43, 4224416: 43, 4225920: 44, 4224928: 44, 4225936: 45, 4225440: 45, 4225952: 46, 10512400: 0, 10512912: 1, 10512416: 1, 10513424: 2, 10512432: 2, 10513936: 3, 10512448: 3, 10513952: 4, 10512464: 4, 10513968: 5, 10512480: 5, 10514480: 6, 10070032: 6, 10512992: 6, 10512496: 6, 10514992: 7, 9545744: 7, 10513504: 7, 10512512: 7, 10515504: 8, 9021456: 8, 10514016: 8, 10512528: 8, 10515488: 9, 10515520: 9, 8497168: 9, 10514528: 9, 10514032: 9, 10119184: 9, 10512544: 9, 10515472: 10, 10515536: 10, 7972880: 10, 10515040: 10, 10514048: 10, 9594896: 10, 10512560: 10, 10515984: 11, 10515552: 11, 7448592: 11, 10514064: 11, 9070608: 11, 10512576: 11, 10516496: 12, 6924304: 12, 7464976: 12, 10514576: 12, 10514080: 12, 8546320: 12, 9086992: 12, 10513088: 12, 10517008: 13, 6400016: 13, 7481360: 13, 10515088: 13, 10514096: 13, 8022032: 13, 9103376: 13, 10513600: 13, 10517024: 14, 5875728: 14, 7497744: 14, 10515600: 14, 10514112: 14, 9119760: 14, 10517040: 15, 5351440: 15, 6973456: 15, 10515616: 15, 10514128: 15, 9136144: 15, 10517056: 16, 4827152: 16, 6449168: 16, 10515632: 16, 10514144: 16, 9152528: 16, 10517072: 17, 4302864: 17, 5924880: 17, 10515648: 17, 10514160: 17, 9168912: 17, 10517088: 18, 3778576: 18, 4286480: 18, 5941264: 18, 10516160: 18, 10513648: 18, 10514176: 18, 9185296: 18, 10517104: 19, 3254288: 19, 4270096: 19, 5957648: 19, 10516672: 19, 10513136: 19, 10514192: 19, 9201680: 19, 10517120: 20, 2730000: 20, 4253712: 20, 5974032: 20, 10517184: 20, 10512624: 20, 10514208: 20, 9218064: 20, 10517136: 21, 2205712: 21, 2713616: 21, 2746384: 21, 4237328: 21, 5449744: 21, 5990416: 21, 10517168: 21, 10517200: 21, 10512640: 21, 10514720: 21, 10514224: 21, 8693776: 21, 9742352: 21, 10517152: 22, 1681424: 22, 2697232: 22, 2762768: 22, 4925456: 22, 6006800: 22, 10517216: 22, 10512656: 22, 10515232: 22, 10514240: 22, 8169488: 22, 10266640: 22, 1157136: 23, 2680848: 23, 2779152: 23, 4401168: 23, 6023184: 23, 10517232: 23, 10512672: 23, 10515744: 23, 10514256: 23, 7645200: 23, 632848: 24, 2664464: 24, 3303440: 24, 2795536: 24, 4384784: 24, 5498896: 24, 6039568: 24, 10516720: 24, 10517248: 24, 10512688: 24, 10515728: 24, 10513744: 24, 10514768: 24, 7120912: 24, 7661584: 24, 616464: 25, 649232: 25, 3827728: 25, 2811920: 25, 4368400: 25, 4974608: 25, 6055952: 25, 10516208: 25, 10517264: 25, 10512704: 25, 10515712: 25, 10513232: 25, 10515280: 25, 6596624: 25, 7677968: 25, 600080: 26, 665616: 26, 4352016: 26, 2828304: 26, 4450320: 26, 6072336: 26, 10515696: 26, 10517280: 26, 10512720: 26, 10515792: 26, 7694352: 26, 583696: 27, 682000: 27, 2304016: 27, 2844688: 27, 4466704: 27, 10517296: 27, 10315792: 27, 10512736: 27, 10515808: 27, 7170064: 27, 8218640: 27, 567312: 28, 698384: 28, 1779728: 28, 2861072: 28, 4483088: 28, 10517312: 28, 9791504: 28, 10512752: 28, 10515824: 28, 6645776: 28, 8742928: 28, 714768: 29, 1255440: 29, 2877456: 29, 4499472: 29, 10517328: 29, 9267216: 29, 10512768: 29, 10515840: 29, 6121488: 29, 731152: 30, 2353168: 30, 2893840: 30, 3975184: 30, 10517344: 30, 10512784: 30, 10515328: 30, 10515856: 30, 5597200: 30, 1828880: 31, 2910224: 31, 3450896: 31, 10517360: 31, 10512800: 31, 10514816: 31, 10515872: 31, 5072912: 31, 1304592: 32, 2926608: 32, 10517376: 32, 10513312: 32, 10514304: 32, 10516384: 32, 4548624: 32, 780304: 33, 2942992: 33, 10517392: 33, 10513824: 33, 10514320: 33, 10516896: 33, 4024336: 33, 4565008: 33, 796688: 34, 2959376: 34, 10517408: 34, 10514336: 34, 3500048: 34, 4581392: 34, 813072: 35, 2975760: 35, 4597776: 35, 829456: 36, 2451472: 36, 2992144: 36, 4614160: 36, 845840: 37, 1927184: 37, 3008528: 37, 4630544: 37, 862224: 38, 1402896: 38, 3024912: 38, 4106256: 38, 878608: 39, 3041296: 39, 3581968: 39, 894992: 40, 3057680: 40, 911376: 41, 2533392: 41, 927760: 42, 2009104: 42, 944144: 43, 1484816: 43, 960528: 44, 11037200: 0, 11037712: 1, 10529296: 2, 11038224: 2, 10545680: 3, 11038240: 3, 10562064: 4, 11038256: 4, 10578448: 5, 11038768: 5, 10594832: 6, 11039280: 6, 10070544: 7, 11037280: 7, 10611216: 7, 11039792: 7, 9546256: 8, 11037792: 8, 10627600: 8, 11039776: 8, 11039808: 8, 9021968: 9, 11038304: 9, 10643984: 9, 11039760: 9, 11039824: 9, 8497680: 10, 11038816: 10, 11038320: 10, 10119696: 10, 10660368: 10, 11040272: 10, 11039840: 10, 7973392: 11, 11039328: 11, 11038336: 11, 9595408: 11, 10676752: 11, 11040784: 11, 7449104: 12, 11038352: 12, 9071120: 12, 10693136: 12, 11041296: 12, 6924816: 13, 7465488: 13, 11038864: 13, 11038368: 13, 8546832: 13, 9087504: 13, 11037376: 13, 11041312: 13, 6400528: 14, 7481872: 14, 11039376: 14, 11038384: 14, 8022544: 14, 9103888: 14, 11037888: 14, 11041328: 14, 5876240: 15, 7498256: 15, 11039888: 15, 11038400: 15, 9120272: 15, 11041344: 15, 5351952: 16, 6973968: 16, 11039904: 16, 11038416: 16, 9136656: 16, 11041360: 16, 4827664: 17, 6449680: 17, 11039920: 17, 11038432: 17, 9153040: 17, 11041376: 17, 4303376: 18, 5925392: 18, 11039936: 18, 11038448: 18, 9169424: 18, 11041392: 18, 3779088: 19, 4286992: 19, 5941776: 19, 11040448: 19, 11037936: 19, 11038464: 19, 9185808: 19, 11041408: 19, 3254800: 20, 4270608: 20, 5958160: 20, 11040960: 20, 11037424: 20, 11038480: 20, 9202192: 20, 11041424: 20, 2730512: 21, 4254224: 21, 5974544: 21, 11041472: 21, 10742288: 21, 11038496: 21, 9218576: 21, 11041440: 21, 2206224: 22, 2714128: 22, 2746896: 22, 4237840: 22, 5450256: 22, 5990928: 22, 11041456: 22, 11041488: 22, 10758672: 22, 11039008: 22, 11038512: 22, 8694288: 22, 9742864: 22, 1681936: 23, 2697744: 23, 2763280: 23, 4925968: 23, 6007312: 23, 11041504: 23, 10775056: 23, 11039520: 23, 11038528: 23, 8170000: 23, 10267152: 23, 1157648: 24, 2681360: 24, 2779664: 24, 4401680: 24, 6023696: 24, 11041520: 24, 10791440: 24, 11040032: 24, 11038544: 24, 7645712: 24, 633360: 25, 2664976: 25, 3303952: 25, 2796048: 25, 4385296: 25, 5499408: 25, 6040080: 25, 11041008: 25, 11041536: 25, 10807824: 25, 11040016: 25, 11038032: 25, 11039056: 25, 7121424: 25, 7662096: 25, 616976: 26, 649744: 26, 3828240: 26, 2812432: 26, 4368912: 26, 4975120: 26, 6056464: 26, 11040496: 26, 11041552: 26, 10824208: 26, 11040000: 26, 11037520: 26, 11039568: 26, 6597136: 26, 7678480: 26, 600592: 27, 666128: 27, 4352528: 27, 2828816: 27, 4450832: 27, 6072848: 27, 11039984: 27, 11041568: 27, 10840592: 27, 11040080: 27, 7694864: 27, 584208: 28, 682512: 28, 2304528: 28, 2845200: 28, 4467216: 28, 11041584: 28, 10316304: 28, 10856976: 28, 11040096: 28, 7170576: 28, 8219152: 28, 567824: 29, 698896: 29, 1780240: 29, 2861584: 29, 4483600: 29, 11041600: 29, 9792016: 29, 10873360: 29, 11040112: 29, 6646288: 29, 8743440: 29, 715280: 30, 1255952: 30, 2877968: 30, 4499984: 30, 11041616: 30, 9267728: 30, 10889744: 30, 11040128: 30, 6122000: 30, 731664: 31, 2353680: 31, 2894352: 31, 3975696: 31, 11041632: 31, 10906128: 31, 11039616: 31, 11040144: 31, 5597712: 31, 1829392: 32, 2910736: 32, 3451408: 32, 11041648: 32, 10922512: 32, 11039104: 32, 11040160: 32, 5073424: 32, 1305104: 33, 2927120: 33, 11041664: 33, 11037600: 33, 11038592: 33, 11040672: 33, 4549136: 33, 780816: 34, 2943504: 34, 11041680: 34, 11038112: 34, 11038608: 34, 11041184: 34, 4024848: 34, 4565520: 34, 797200: 35, 2959888: 35, 11041696: 35, 11038624: 35, 3500560: 35, 4581904: 35, 813584: 36, 2976272: 36, 4598288: 36, 829968: 37, 2451984: 37, 2992656: 37, 4614672: 37, 846352: 38, 1927696: 38, 3009040: 38, 4631056: 38, 862736: 39, 1403408: 39, 3025424: 39, 4106768: 39, 879120: 40, 3041808: 40, 3582480: 40, 895504: 41, 3058192: 41, 911888: 42, 2533904: 42, 928272: 43, 2009616: 43, 944656: 44, 1485328: 44, 961040: 45, 11562000: 0, 11562512: 1, 11562528: 2, 10529808: 3, 11562544: 3, 10546192: 4, 11563056: 4, 10562576: 5, 11563568: 5, 10578960: 6, 11564080: 6, 10595344: 7, 11564064: 7, 11564096: 7, 10071056: 8, 11119632: 8, 10611728: 8, 11564048: 8, 11564112: 8, 9546768: 9, 11562080: 9, 10628112: 9, 11564560: 9, 11564128: 9, 9022480: 10, 11562592: 10, 10644496: 10, 11565072: 10, 11563616: 10, 8498192: 11, 11563104: 11, 11562608: 11, 10120208: 11, 10660880: 11, 11565584: 11, 7973904: 12, 11562624: 12, 9595920: 12, 10677264: 12, 11565600: 12, 7449616: 13, 11562640: 13, 9071632: 13, 10693648: 13, 11565616: 13, 6925328: 14, 7466000: 14, 11563152: 14, 11562656: 14, 8547344: 14, 9088016: 14, 11217936: 14, 11565632: 14, 6401040: 15, 7482384: 15, 11563664: 15, 11562672: 15, 8023056: 15, 9104400: 15, 11562176: 15, 11565648: 15, 5876752: 16, 7498768: 16, 11564176: 16, 11562688: 16, 9120784: 16, 11565664: 16, 5352464: 17, 6974480: 17, 11564192: 17, 11562704: 17, 9137168: 17, 11565680: 17, 4828176: 18, 6450192: 18, 11564208: 18, 11562720: 18, 9153552: 18, 11565696: 18, 4303888: 19, 5925904: 19, 11564224: 19, 11562736: 19, 9169936: 19, 11565712: 19, 3779600: 20, 4287504: 20, 5942288: 20, 11564736: 20, 11562224: 20, 11562752: 20, 9186320: 20, 11565728: 20, 3255312: 21, 4271120: 21, 5958672: 21, 11565248: 21, 11267088: 21, 11562768: 21, 9202704: 21, 11565744: 21, 2731024: 22, 4254736: 22, 5975056: 22, 11565760: 22, 10742800: 22, 11562784: 22, 9219088: 22, 2206736: 23, 2714640: 23, 2747408: 23, 4238352: 23, 5450768: 23, 5991440: 23, 11565776: 23, 10759184: 23, 11563296: 23, 11562800: 23, 8694800: 23, 9743376: 23, 1682448: 24, 2698256: 24, 2763792: 24, 4926480: 24, 6007824: 24, 11565792: 24, 10775568: 24, 11563808: 24, 11562816: 24, 8170512: 24, 10267664: 24, 1158160: 25, 2681872: 25, 2780176: 25, 4402192: 25, 6024208: 25, 11565808: 25, 10791952: 25, 11564320: 25, 11562832: 25, 7646224: 25, 633872: 26, 2665488: 26, 3304464: 26, 2796560: 26, 4385808: 26, 5499920: 26, 6040592: 26, 11565296: 26, 11565824: 26, 10808336: 26, 11564304: 26, 11562320: 26, 11563344: 26, 7121936: 26, 7662608: 26, 617488: 27, 650256: 27, 3828752: 27, 2812944: 27, 4369424: 27, 4975632: 27, 6056976: 27, 11564784: 27, 11565840: 27, 10824720: 27, 11564288: 27, 11365392: 27, 11563856: 27, 6597648: 27, 7678992: 27, 601104: 28, 666640: 28, 4353040: 28, 2829328: 28, 4451344: 28, 6073360: 28, 11564272: 28, 11565856: 28, 10841104: 28, 11564368: 28, 7695376: 28, 584720: 29, 683024: 29, 2305040: 29, 2845712: 29, 4467728: 29, 11565872: 29, 10316816: 29, 10857488: 29, 11564384: 29, 7171088: 29, 8219664: 29, 568336: 30, 699408: 30, 1780752: 30, 2862096: 30, 4484112: 30, 11565888: 30, 9792528: 30, 10873872: 30, 11564400: 30, 6646800: 30, 8743952: 30, 715792: 31, 1256464: 31, 2878480: 31, 4500496: 31, 11565904: 31, 9268240: 31, 10890256: 31, 11564416: 31, 6122512: 31, 732176: 32, 2354192: 32, 2894864: 32, 3976208: 32, 11565920: 32, 10906640: 32, 11563904: 32, 11564432: 32, 5598224: 32, 1829904: 33, 2911248: 33, 3451920: 33, 11565936: 33, 10923024: 33, 11563392: 33, 11564448: 33, 5073936: 33, 1305616: 34, 2927632: 34, 11565952: 34, 11447312: 34, 11562880: 34, 11564960: 34, 4549648: 34, 781328: 35, 2944016: 35, 11565968: 35, 11562400: 35, 11562896: 35, 11565472: 35, 4025360: 35, 4566032: 35, 797712: 36, 2960400: 36, 11565984: 36, 11562912: 36, 3501072: 36, 4582416: 36, 814096: 37, 2976784: 37, 4598800: 37, 830480: 38, 2452496: 38, 2993168: 38, 4615184: 38, 846864: 39, 1928208: 39, 3009552: 39, 4631568: 39, 863248: 40, 1403920: 40, 3025936: 40, 4107280: 40, 879632: 41, 3042320: 41, 3582992: 41, 896016: 42, 3058704: 42, 912400: 43, 2534416: 43, 928784: 44, 2010128: 44, 945168: 45, 1485840: 45, 961552: 46, 12086800: 0, 12086816: 1, 12086832: 2, 12087344: 3, 10530320: 4, 12087856: 4, 10546704: 5, 12088368: 5, 10563088: 6, 12088352: 6, 12088384: 6, 10579472: 7, 12088336: 7, 12088400: 7, 10595856: 8, 12088848: 8, 12088416: 8, 10071568: 9, 11120144: 9, 10612240: 9, 12089360: 9, 12087904: 9, 9547280: 10, 11644432: 10, 10628624: 10, 12089872: 10, 12087392: 10, 9022992: 11, 12086880: 11, 10645008: 11, 12089888: 11, 8498704: 12, 12086896: 12, 10120720: 12, 10661392: 12, 12089904: 12, 7974416: 13, 12086912: 13, 9596432: 13, 10677776: 13, 12089920: 13, 7450128: 14, 12086928: 14, 9072144: 14, 10694160: 14, 12089936: 14, 6925840: 15, 7466512: 15, 12087440: 15, 12086944: 15, 8547856: 15, 9088528: 15, 11218448: 15, 12089952: 15, 6401552: 16, 7482896: 16, 12087952: 16, 12086960: 16, 8023568: 16, 9104912: 16, 11742736: 16, 12089968: 16, 5877264: 17, 7499280: 17, 12088464: 17, 12086976: 17, 9121296: 17, 12089984: 17, 5352976: 18, 6974992: 18, 12088480: 18, 12086992: 18, 9137680: 18, 12090000: 18, 4828688: 19, 6450704: 19, 12088496: 19, 12087008: 19, 9154064: 19, 12090016: 19, 4304400: 20, 5926416: 20, 12088512: 20, 12087024: 20, 9170448: 20, 12090032: 20, 3780112: 21, 4288016: 21, 5942800: 21, 12089024: 21, 11791888: 21, 12087040: 21, 9186832: 21, 12090048: 21, 3255824: 22, 4271632: 22, 5959184: 22, 12089536: 22, 11267600: 22, 12087056: 22, 9203216: 22, 12090064: 22, 2731536: 23, 4255248: 23, 5975568: 23, 10743312: 23, 12087072: 23, 9219600: 23, 12090080: 23, 2207248: 24, 2715152: 24, 2747920: 24, 4238864: 24, 5451280: 24, 5991952: 24, 10759696: 24, 12087584: 24, 12087088: 24, 8695312: 24, 9743888: 24, 12090096: 24, 1682960: 25, 2698768: 25, 2764304: 25, 4926992: 25, 6008336: 25, 10776080: 25, 12088096: 25, 12087104: 25, 8171024: 25, 10268176: 25, 12089584: 25, 12090112: 25, 1158672: 26, 2682384: 26, 2780688: 26, 4402704: 26, 6024720: 26, 10792464: 26, 12088608: 26, 12087120: 26, 7646736: 26, 12089072: 26, 12090128: 26, 634384: 27, 2666000: 27, 3304976: 27, 2797072: 27, 4386320: 27, 5500432: 27, 6041104: 27, 10808848: 27, 12088592: 27, 11890192: 27, 12087632: 27, 7122448: 27, 7663120: 27, 12088560: 27, 12090144: 27, 618000: 28, 650768: 28, 3829264: 28, 2813456: 28, 4369936: 28, 4976144: 28, 6057488: 28, 10825232: 28, 12088576: 28, 11365904: 28, 12088144: 28, 6598160: 28, 7679504: 28, 12090160: 28, 601616: 29, 667152: 29, 4353552: 29, 2829840: 29, 4451856: 29, 6073872: 29, 10841616: 29, 12088656: 29, 7695888: 29, 12090176: 29, 585232: 30, 683536: 30, 2305552: 30, 2846224: 30, 4468240: 30, 10317328: 30, 10858000: 30, 12088672: 30, 7171600: 30, 8220176: 30, 12090192: 30, 568848: 31, 699920: 31, 1781264: 31, 2862608: 31, 4484624: 31, 9793040: 31, 10874384: 31, 12088688: 31, 6647312: 31, 8744464: 31, 12090208: 31, 716304: 32, 1256976: 32, 2878992: 32, 4501008: 32, 9268752: 32, 10890768: 32, 12088704: 32, 6123024: 32, 12090224: 32, 732688: 33, 2354704: 33, 2895376: 33, 3976720: 33, 10907152: 33, 12088192: 33, 12088720: 33, 5598736: 33, 12090240: 33, 1830416: 34, 2911760: 34, 3452432: 34, 10923536: 34, 12087680: 34, 12088736: 34, 5074448: 34, 12090256: 34, 1306128: 35, 2928144: 35, 11447824: 35, 12087168: 35, 12089248: 35, 4550160: 35, 12090272: 35, 781840: 36, 2944528: 36, 11972112: 36, 12087184: 36, 12089760: 36, 4025872: 36, 4566544: 36, 798224: 37, 2960912: 37, 12087200: 37, 3501584: 37, 4582928: 37, 814608: 38, 2977296: 38, 4599312: 38, 830992: 39, 2453008: 39, 2993680: 39, 4615696: 39, 847376: 40, 1928720: 40, 3010064: 40, 4632080: 40, 863760: 41, 1404432: 41, 3026448: 41, 4107792: 41, 880144: 42, 3042832: 42, 3583504: 42, 896528: 43, 3059216: 43, 912912: 44, 2534928: 44, 929296: 45, 2010640: 45, 945680: 46, 1486352: 46, 962064: 47, 13661200: 0, 13661712: 1, 13661216: 1, 13662224: 2, 13661232: 2, 13662736: 3, 13169680: 3, 13661248: 3, 13662752: 4, 12645392: 4, 13661264: 4, 13662768: 5, 12121104: 5, 13661280: 5, 13662784: 6, 12104720: 6, 13218832: 6, 13662800: 7, 12694544: 7, 13662816: 8, 12170256: 8, 13662832: 9, 11645968: 9, 12186640: 9, 13662848: 10, 11121680: 10, 12203024: 10, 13662864: 11, 10531856: 11, 10597392: 11, 12219408: 11, 13662880: 12, 10548240: 12, 10073104: 12, 10581008: 12, 10613776: 12, 12743696: 12, 12235792: 12, 13662896: 13, 10564624: 13, 9548816: 13, 10630160: 13, 13267984: 13, 12252176: 13, 13662912: 14, 9024528: 14, 10646544: 14, 13661328: 14, 12268560: 14, 13662400: 15, 13662928: 15, 8500240: 15, 10122256: 15, 10662928: 15, 13661344: 15, 11744272: 15, 12284944: 15, 13661888: 16, 13662944: 16, 7975952: 16, 9597968: 16, 10679312: 16, 13661360: 16, 11219984: 16, 12301328: 16, 13661376: 17, 13662960: 17, 7451664: 17, 9073680: 17, 10695696: 17, 12317712: 17, 13662448: 18, 13662976: 18, 6927376: 18, 7468048: 18, 8549392: 18, 9090064: 18, 11793424: 18, 12334096: 18, 13661936: 19, 13662992: 19, 6403088: 19, 7484432: 19, 8025104: 19, 9106448: 19, 11269136: 19, 12350480: 19, 13661424: 20, 13663008: 20, 5878800: 20, 7500816: 20, 9122832: 20, 10744848: 20, 12366864: 20, 13661440: 21, 13663024: 21, 5354512: 21, 6976528: 21, 9139216: 21, 10761232: 21, 12891152: 21, 12383248: 21, 13661456: 22, 13663040: 22, 4830224: 22, 6452240: 22, 9155600: 22, 10777616: 22, 13415440: 22, 12399632: 22, 13661472: 23, 13663056: 23, 4305936: 23, 5927952: 23, 9171984: 23, 10794000: 23, 12416016: 23, 13663072: 24, 3781648: 24, 4289552: 24, 5944336: 24, 9188368: 24, 10269712: 24, 10810384: 24, 11891728: 24, 12940304: 24, 13663088: 25, 3257360: 25, 4273168: 25, 5960720: 25, 9204752: 25, 9745424: 25, 10826768: 25, 11367440: 25, 13464592: 25, 13663104: 26, 2733072: 26, 4256784: 26, 5977104: 26, 9221136: 26, 10843152: 26, 13661520: 26, 13663120: 27, 2208784: 27, 2716688: 27, 2749456: 27, 4240400: 27, 5452816: 27, 5993488: 27, 8696848: 27, 10318864: 27, 10859536: 27, 13661536: 27, 13663136: 28, 1684496: 28, 2700304: 28, 2765840: 28, 4928528: 28, 6009872: 28, 8172560: 28, 9794576: 28, 10875920: 28, 13661552: 28, 13662624: 29, 1160208: 29, 2683920: 29, 2782224: 29, 4404240: 29, 6026256: 29, 7648272: 29, 9270288: 29, 10892304: 29, 13661568: 29, 13662112: 30, 635920: 30, 2667536: 30, 3306512: 30, 2798608: 30, 4387856: 30, 5501968: 30, 6042640: 30, 7123984: 30, 7664656: 30, 8746000: 30, 10908688: 30, 13513744: 30, 13661584: 30, 13661600: 31, 619536: 31, 652304: 31, 3830800: 31, 2814992: 31, 4371472: 31, 4977680: 31, 6059024: 31, 6599696: 31, 7681040: 31, 8221712: 31, 10925072: 31, 12989456: 31, 603152: 32, 668688: 32, 4355088: 32, 2831376: 32, 4453392: 32, 6075408: 32, 7697424: 32, 11449360: 32, 12465168: 32, 586768: 33, 685072: 33, 2307088: 33, 2847760: 33, 4469776: 33, 7173136: 33, 11973648: 33, 12481552: 33, 570384: 34, 701456: 34, 1782800: 34, 2864144: 34, 4486160: 34, 6648848: 34, 12497936: 34, 717840: 35, 1258512: 35, 2880528: 35, 4502544: 35, 6124560: 35, 734224: 36, 2356240: 36, 2896912: 36, 3978256: 36, 5600272: 36, 1831952: 37, 2913296: 37, 3453968: 37, 5075984: 37, 1307664: 38, 2929680: 38, 4551696: 38, 783376: 39, 2946064: 39, 4027408: 39, 4568080: 39, 799760: 40, 2962448: 40, 3503120: 40, 4584464: 40, 816144: 41, 2978832: 41, 4600848: 41, 832528: 42, 2454544: 42, 2995216: 42, 4617232: 42, 848912: 43, 1930256: 43, 3011600: 43, 4633616: 43, 865296: 44, 1405968: 44, 3027984: 44, 4109328: 44, 881680: 45, 3044368: 45, 3585040: 45, 898064: 46, 3060752: 46, 914448: 47, 2536464: 47, 930832: 48, 2012176: 48, 947216: 49, 1487888: 49, 963600: 50, 14186000: 0, 14186512: 1, 13678096: 2, 14187024: 2, 13694480: 3, 14187040: 3, 13170192: 4, 13710864: 4, 14187056: 4, 12645904: 5, 13727248: 5, 14187072: 5, 12121616: 6, 13743632: 6, 14187088: 6, 12105232: 7, 13219344: 7, 14187104: 7, 12695056: 8, 14187120: 8, 12170768: 9, 14187136: 9, 11646480: 10, 12187152: 10, 14187152: 10, 11122192: 11, 12203536: 11, 14187168: 11, 10532368: 12, 10597904: 12, 12219920: 12, 14187184: 12, 10548752: 13, 10073616: 13, 10581520: 13, 10614288: 13, 12744208: 13, 12236304: 13, 14187200: 13, 10565136: 14, 9549328: 14, 10630672: 14, 13268496: 14, 12252688: 14, 14186688: 14, 14187216: 14, 9025040: 15, 10647056: 15, 13792784: 15, 12269072: 15, 14186176: 15, 14187232: 15, 8500752: 16, 10122768: 16, 10663440: 16, 13809168: 16, 11744784: 16, 12285456: 16, 13841936: 16, 14187248: 16, 7976464: 17, 9598480: 17, 10679824: 17, 13825552: 17, 11220496: 17, 12301840: 17, 14186736: 17, 14187264: 17, 7452176: 18, 9074192: 18, 10696208: 18, 12318224: 18, 14186224: 18, 14187280: 18, 6927888: 19, 7468560: 19, 8549904: 19, 9090576: 19, 11793936: 19, 12334608: 19, 13891088: 19, 14187296: 19, 6403600: 20, 7484944: 20, 8025616: 20, 9106960: 20, 11269648: 20, 12350992: 20, 13907472: 20, 14187312: 20, 5879312: 21, 7501328: 21, 9123344: 21, 10745360: 21, 12367376: 21, 13923856: 21, 14187328: 21, 5355024: 22, 6977040: 22, 9139728: 22, 10761744: 22, 12891664: 22, 12383760: 22, 13940240: 22, 14187344: 22, 4830736: 23, 6452752: 23, 9156112: 23, 10778128: 23, 13415952: 23, 12400144: 23, 14187360: 23, 4306448: 24, 5928464: 24, 9172496: 24, 10794512: 24, 12416528: 24, 14187376: 24, 3782160: 25, 4290064: 25, 5944848: 25, 9188880: 25, 10270224: 25, 10810896: 25, 11892240: 25, 12940816: 25, 14187392: 25, 3257872: 26, 4273680: 26, 5961232: 26, 9205264: 26, 9745936: 26, 10827280: 26, 11367952: 26, 13465104: 26, 14187408: 26, 2733584: 27, 4257296: 27, 5977616: 27, 9221648: 27, 10843664: 27, 13989392: 27, 14187424: 27, 2209296: 28, 2717200: 28, 2749968: 28, 4240912: 28, 5453328: 28, 5994000: 28, 8697360: 28, 10319376: 28, 10860048: 28, 14005776: 28, 14186912: 28, 1685008: 29, 2700816: 29, 2766352: 29, 4929040: 29, 6010384: 29, 8173072: 29, 9795088: 29, 10876432: 29, 14022160: 29, 14186400: 29, 1160720: 30, 2684432: 30, 2782736: 30, 4404752: 30, 6026768: 30, 7648784: 30, 9270800: 30, 10892816: 30, 14038544: 30, 14071312: 30, 636432: 31, 2668048: 31, 3307024: 31, 2799120: 31, 4388368: 31, 5502480: 31, 6043152: 31, 7124496: 31, 7665168: 31, 8746512: 31, 10909200: 31, 13514256: 31, 14054928: 31, 620048: 32, 652816: 32, 3831312: 32, 2815504: 32, 4371984: 32, 4978192: 32, 6059536: 32, 6600208: 32, 7681552: 32, 8222224: 32, 10925584: 32, 12989968: 32, 603664: 33, 669200: 33, 4355600: 33, 2831888: 33, 4453904: 33, 6075920: 33, 7697936: 33, 11449872: 33, 12465680: 33, 587280: 34, 685584: 34, 2307600: 34, 2848272: 34, 4470288: 34, 7173648: 34, 11974160: 34, 12482064: 34, 570896: 35, 701968: 35, 1783312: 35, 2864656: 35, 4486672: 35, 6649360: 35, 12498448: 35, 718352: 36, 1259024: 36, 2881040: 36, 4503056: 36, 6125072: 36, 734736: 37, 2356752: 37, 2897424: 37, 3978768: 37, 5600784: 37, 1832464: 38, 2913808: 38, 3454480: 38, 5076496: 38, 1308176: 39, 2930192: 39, 4552208: 39, 783888: 40, 2946576: 40, 4027920: 40, 4568592: 40, 800272: 41, 2962960: 41, 3503632: 41, 4584976: 41, 816656: 42, 2979344: 42, 4601360: 42, 833040: 43, 2455056: 43, 2995728: 43, 4617744: 43, 849424: 44, 1930768: 44, 3012112: 44, 4634128: 44, 865808: 45, 1406480: 45, 3028496: 45, 4109840: 45, 882192: 46, 3044880: 46, 3585552: 46, 898576: 47, 3061264: 47, 914960: 48, 2536976: 48, 931344: 49, 2012688: 49, 947728: 50, 1488400: 50, 964112: 51, 14710800: 0, 14711312: 1, 14711328: 2, 13678608: 3, 14711344: 3, 13694992: 4, 14711360: 4, 13170704: 5, 13711376: 5, 14711376: 5, 12646416: 6, 13727760: 6, 14711392: 6, 12122128: 7, 13744144: 7, 14711408: 7, 12105744: 8, 13219856: 8, 14711424: 8, 12695568: 9, 14711440: 9, 12171280: 10, 14711456: 10, 11646992: 11, 12187664: 11, 14711472: 11, 11122704: 12, 12204048: 12, 14711488: 12, 10532880: 13, 10598416: 13, 12220432: 13, 14710976: 13, 14711504: 13, 10549264: 14, 10074128: 14, 10582032: 14, 10614800: 14, 12744720: 14, 12236816: 14, 14366736: 14, 14711520: 14, 10565648: 15, 9549840: 15, 10631184: 15, 13269008: 15, 12253200: 15, 13842448: 15, 14711536: 15, 9025552: 16, 10647568: 16, 13793296: 16, 12269584: 16, 13826064: 16, 14711024: 16, 14711552: 16, 8501264: 17, 10123280: 17, 10663952: 17, 13809680: 17, 11745296: 17, 12285968: 17, 14415888: 17, 14711568: 17, 7976976: 18, 9598992: 18, 10680336: 18, 11221008: 18, 12302352: 18, 13891600: 18, 14711584: 18, 7452688: 19, 9074704: 19, 10696720: 19, 12318736: 19, 13907984: 19, 14711600: 19, 6928400: 20, 7469072: 20, 8550416: 20, 9091088: 20, 11794448: 20, 12335120: 20, 13924368: 20, 14711616: 20, 6404112: 21, 7485456: 21, 8026128: 21, 9107472: 21, 11270160: 21, 12351504: 21, 13940752: 21, 14711632: 21, 5879824: 22, 7501840: 22, 9123856: 22, 10745872: 22, 12367888: 22, 13416464: 22, 14711648: 22, 5355536: 23, 6977552: 23, 9140240: 23, 10762256: 23, 12892176: 23, 12384272: 23, 14711664: 23, 4831248: 24, 6453264: 24, 9156624: 24, 10778640: 24, 12400656: 24, 14711680: 24, 4306960: 25, 5928976: 25, 9173008: 25, 10795024: 25, 12417040: 25, 14711696: 25, 3782672: 26, 4290576: 26, 5945360: 26, 9189392: 26, 10270736: 26, 10811408: 26, 11892752: 26, 12941328: 26, 14711712: 26, 3258384: 27, 4274192: 27, 5961744: 27, 9205776: 27, 9746448: 27, 10827792: 27, 11368464: 27, 13465616: 27, 14711200: 27, 2734096: 28, 4257808: 28, 5978128: 28, 9222160: 28, 10844176: 28, 13989904: 28, 14596112: 28, 2209808: 29, 2717712: 29, 2750480: 29, 4241424: 29, 5453840: 29, 5994512: 29, 8697872: 29, 10319888: 29, 10860560: 29, 14006288: 29, 14071824: 29, 1685520: 30, 2701328: 30, 2766864: 30, 4929552: 30, 6010896: 30, 8173584: 30, 9795600: 30, 10876944: 30, 14022672: 30, 14055440: 30, 1161232: 31, 2684944: 31, 2783248: 31, 4405264: 31, 6027280: 31, 7649296: 31, 9271312: 31, 10893328: 31, 14039056: 31, 636944: 32, 2668560: 32, 3307536: 32, 2799632: 32, 4388880: 32, 5502992: 32, 6043664: 32, 7125008: 32, 7665680: 32, 8747024: 32, 10909712: 32, 13514768: 32, 620560: 33, 653328: 33, 3831824: 33, 2816016: 33, 4372496: 33, 4978704: 33, 6060048: 33, 6600720: 33, 7682064: 33, 8222736: 33, 10926096: 33, 12990480: 33, 604176: 34, 669712: 34, 4356112: 34, 2832400: 34, 4454416: 34, 6076432: 34, 7698448: 34, 11450384: 34, 12466192: 34, 587792: 35, 686096: 35, 2308112: 35, 2848784: 35, 4470800: 35, 7174160: 35, 11974672: 35, 12482576: 35, 571408: 36, 702480: 36, 1783824: 36, 2865168: 36, 4487184: 36, 6649872: 36, 12498960: 36, 718864: 37, 1259536: 37, 2881552: 37, 4503568: 37, 6125584: 37, 735248: 38, 2357264: 38, 2897936: 38, 3979280: 38, 5601296: 38, 1832976: 39, 2914320: 39, 3454992: 39, 5077008: 39, 1308688: 40, 2930704: 40, 4552720: 40, 784400: 41, 2947088: 41, 4028432: 41, 4569104: 41, 800784: 42, 2963472: 42, 3504144: 42, 4585488: 42, 817168: 43, 2979856: 43, 4601872: 43, 833552: 44, 2455568: 44, 2996240: 44, 4618256: 44, 849936: 45, 1931280: 45, 3012624: 45, 4634640: 45, 866320: 46, 1406992: 46, 3029008: 46, 4110352: 46, 882704: 47, 3045392: 47, 3586064: 47, 899088: 48, 3061776: 48, 915472: 49, 2537488: 49, 931856: 50, 2013200: 50, 948240: 51, 1488912: 51, 964624: 52, 15235600: 0, 15235616: 1, 15235632: 2, 15235648: 3, 13679120: 4, 15235664: 4, 13695504: 5, 15235680: 5, 13171216: 6, 13711888: 6, 15235696: 6, 12646928: 7, 13728272: 7, 15235712: 7, 12122640: 8, 13744656: 8, 15235728: 8, 12106256: 9, 13220368: 9, 15235744: 9, 12696080: 10, 15235760: 10, 12171792: 11, 15235776: 11, 11647504: 12, 12188176: 12, 14891536: 12, 15235792: 12, 11123216: 13, 12204560: 13, 14367248: 13, 15235808: 13, 10533392: 14, 10598928: 14, 12220944: 14, 13842960: 14, 15235824: 14, 10549776: 15, 10074640: 15, 10582544: 15, 10615312: 15, 12745232: 15, 12237328: 15, 13826576: 15, 14940688: 15, 15235840: 15, 10566160: 16, 9550352: 16, 10631696: 16, 13269520: 16, 12253712: 16, 13810192: 16, 14416400: 16, 15235856: 16, 9026064: 17, 10648080: 17, 13793808: 17, 12270096: 17, 13892112: 17, 15235872: 17, 8501776: 18, 10123792: 18, 10664464: 18, 11745808: 18, 12286480: 18, 13908496: 18, 15235888: 18, 7977488: 19, 9599504: 19, 10680848: 19, 11221520: 19, 12302864: 19, 13924880: 19, 15235904: 19, 7453200: 20, 9075216: 20, 10697232: 20, 12319248: 20, 13941264: 20, 15235920: 20, 6928912: 21, 7469584: 21, 8550928: 21, 9091600: 21, 11794960: 21, 12335632: 21, 13416976: 21, 15235936: 21, 6404624: 22, 7485968: 22, 8026640: 22, 9107984: 22, 11270672: 22, 12352016: 22, 12892688: 22, 15235952: 22, 5880336: 23, 7502352: 23, 9124368: 23, 10746384: 23, 12368400: 23, 15235968: 23, 5356048: 24, 6978064: 24, 9140752: 24, 10762768: 24, 12384784: 24, 15235984: 24, 4831760: 25, 6453776: 25, 9157136: 25, 10779152: 25, 12401168: 25, 15236000: 25, 4307472: 26, 5929488: 26, 9173520: 26, 10795536: 26, 12417552: 26, 15120912: 26, 3783184: 27, 4291088: 27, 5945872: 27, 9189904: 27, 10271248: 27, 10811920: 27, 11893264: 27, 12941840: 27, 14596624: 27, 3258896: 28, 4274704: 28, 5962256: 28, 9206288: 28, 9746960: 28, 10828304: 28, 11368976: 28, 13466128: 28, 14072336: 28, 2734608: 29, 4258320: 29, 5978640: 29, 9222672: 29, 10844688: 29, 13990416: 29, 14055952: 29, 2210320: 30, 2718224: 30, 2750992: 30, 4241936: 30, 5454352: 30, 5995024: 30, 8698384: 30, 10320400: 30, 10861072: 30, 14006800: 30, 14039568: 30, 1686032: 31, 2701840: 31, 2767376: 31, 4930064: 31, 6011408: 31, 8174096: 31, 9796112: 31, 10877456: 31, 14023184: 31, 13515280: 31, 1161744: 32, 2685456: 32, 2783760: 32, 4405776: 32, 6027792: 32, 7649808: 32, 9271824: 32, 10893840: 32, 12990992: 32, 637456: 33, 2669072: 33, 3308048: 33, 2800144: 33, 4389392: 33, 5503504: 33, 6044176: 33, 7125520: 33, 7666192: 33, 8747536: 33, 10910224: 33, 12466704: 33, 621072: 34, 653840: 34, 3832336: 34, 2816528: 34, 4373008: 34, 4979216: 34, 6060560: 34, 6601232: 34, 7682576: 34, 8223248: 34, 10926608: 34, 12483088: 34, 604688: 35, 670224: 35, 4356624: 35, 2832912: 35, 4454928: 35, 6076944: 35, 7698960: 35, 11450896: 35, 12499472: 35, 588304: 36, 686608: 36, 2308624: 36, 2849296: 36, 4471312: 36, 7174672: 36, 11975184: 36, 571920: 37, 702992: 37, 1784336: 37, 2865680: 37, 4487696: 37, 6650384: 37, 719376: 38, 1260048: 38, 2882064: 38, 4504080: 38, 6126096: 38, 735760: 39, 2357776: 39, 2898448: 39, 3979792: 39, 5601808: 39, 1833488: 40, 2914832: 40, 3455504: 40, 5077520: 40, 1309200: 41, 2931216: 41, 4553232: 41, 784912: 42, 2947600: 42, 4028944: 42, 4569616: 42, 801296: 43, 2963984: 43, 3504656: 43, 4586000: 43, 817680: 44, 2980368: 44, 4602384: 44, 834064: 45, 2456080: 45, 2996752: 45, 4618768: 45, 850448: 46, 1931792: 46, 3013136: 46, 4635152: 46, 866832: 47, 1407504: 47, 3029520: 47, 4110864: 47, 883216: 48, 3045904: 48, 3586576: 48, 899600: 49, 3062288: 49, 915984: 50, 2538000: 50, 932368: 51, 2013712: 51, 948752: 52, 1489424: 52, 965136: 53, 557600: 0, 557616: 1, 557632: 2, 557648: 3, 557664: 4, 558176: 5, 557680: 5, 559648: 6, 558688: 6, 557696: 6, 559664: 7, 559200: 7, 557712: 7, 559680: 8, 559712: 8, 557728: 8, 561184: 9, 559696: 9, 560224: 9, 559728: 9, 557744: 9, 561200: 10, 560736: 10, 559744: 10, 557760: 10, 561216: 11, 561248: 11, 559760: 11, 558272: 11, 561232: 12, 561760: 12, 560272: 12, 559776: 12, 558784: 12, 562272: 13, 560784: 13, 559792: 13, 559296: 13, 562784: 14, 561296: 14, 559808: 14, 563296: 15, 561312: 15, 559824: 15, 563808: 16, 561328: 16, 559840: 16, 564320: 17, 561344: 17, 559856: 17, 564832: 18, 564336: 18, 561856: 18, 559344: 18, 559872: 18, 565344: 19, 564352: 19, 562368: 19, 558832: 19, 559888: 19, 565856: 20, 564368: 20, 562880: 20, 558320: 20, 559904: 20, 566368: 21, 563856: 21, 564880: 21, 562864: 21, 562896: 21, 557808: 21, 560416: 21, 559920: 21, 566880: 22, 563344: 22, 565392: 22, 562848: 22, 562912: 22, 557824: 22, 560928: 22, 559936: 22, 567392: 23, 562832: 23, 565904: 23, 562928: 23, 557840: 23, 561440: 23, 559952: 23, 567376: 24, 567904: 24, 567408: 24, 566416: 24, 565920: 24, 562416: 24, 562944: 24, 557856: 24, 561424: 24, 559440: 24, 560464: 24, 559968: 24, 567360: 25, 568416: 25, 567424: 25, 566928: 25, 565936: 25, 561904: 25, 562960: 25, 557872: 25, 561408: 25, 558928: 25, 560976: 25, 559984: 25, 567344: 26, 568928: 26, 567440: 26, 565952: 26, 561392: 26, 562976: 26, 557888: 26, 558416: 26, 561488: 26, 560000: 26, 567328: 27, 569440: 27, 568944: 27, 567456: 27, 565968: 27, 563488: 27, 557904: 27, 562000: 27, 561504: 27, 560016: 27, 569952: 28, 568960: 28, 567472: 28, 565984: 28, 564000: 28, 557920: 28, 562512: 28, 561520: 28, 560032: 28, 570464: 29, 568976: 29, 567488: 29, 566000: 29, 564512: 29, 557936: 29, 563024: 29, 561536: 29, 559520: 29, 560544: 29, 570448: 30, 569488: 30, 568992: 30, 568000: 30, 566016: 30, 565024: 30, 564528: 30, 557952: 30, 563536: 30, 561552: 30, 559008: 30, 561056: 30, 570432: 31, 570000: 31, 569008: 31, 568512: 31, 566032: 31, 565536: 31, 564544: 31, 557968: 31, 564048: 31, 561568: 31, 558496: 31, 568864: 32, 570416: 32, 570512: 32, 569024: 32, 566048: 32, 564560: 32, 557984: 32, 568880: 33, 569904: 33, 570400: 33, 570528: 33, 569040: 33, 566560: 33, 565072: 33, 569392: 34, 570544: 34, 569056: 34, 567072: 34, 565584: 34, 570560: 35, 569072: 35, 567584: 35, 566096: 35, 571072: 36, 568560: 36, 569088: 36, 567568: 36, 567600: 36, 566608: 36, 571584: 37, 568048: 37, 569104: 37, 567552: 37, 567616: 37, 567120: 37, 571936: 38, 572096: 38, 567536: 38, 569120: 38, 567632: 38, 571952: 39, 572080: 39, 572112: 39, 569632: 39, 569136: 39, 568144: 39, 567648: 39, 571968: 40, 572064: 40, 572128: 40, 570144: 40, 569152: 40, 568656: 40, 567664: 40, 571984: 41, 572048: 41, 572144: 41, 570656: 41, 569168: 41, 567680: 41, 572000: 42, 572032: 42, 571632: 42, 572160: 42, 570640: 42, 569680: 42, 567696: 42, 572016: 43, 571120: 43, 572176: 43, 570624: 43, 570192: 43, 567712: 43, 570608: 44, 572192: 44, 570704: 44, 568224: 44, 572208: 45, 570720: 45, 568736: 45, 572224: 46, 570736: 46, 569248: 46, 572240: 47, 570752: 47, 569232: 47, 572256: 48, 570240: 48, 570768: 48, 569216: 48, 572272: 49, 569728: 49, 570784: 49, 572288: 50, 571296: 50, 572304: 51, 571808: 51, 572320: 52, 2656800: 0, 2656816: 1, 2656832: 2, 2656848: 3, 2656864: 4, 2658336: 5, 2198048: 5, 2657376: 5, 2656880: 5, 2658352: 6, 1673760: 6, 2657888: 6, 2656896: 6, 576032: 7, 2658368: 7, 1149472: 7, 2658400: 7, 2656912: 7, 592416: 8, 2658384: 8, 625184: 8, 2658912: 8, 2657424: 8, 2656928: 8, 608800: 9, 641568: 9, 2659424: 9, 2657936: 9, 2656944: 9, 657952: 10, 2659936: 10, 2658448: 10, 2656960: 10, 674336: 11, 2660448: 11, 2658464: 11, 2296352: 11, 2656976: 11, 690720: 12, 2660960: 12, 2658480: 12, 1772064: 12, 2656992: 12, 707104: 13, 2661472: 13, 2658496: 13, 1247776: 13, 2657008: 13, 723488: 14, 2661984: 14, 2661488: 14, 2659008: 14, 2345504: 14, 2657024: 14, 2662496: 15, 2661504: 15, 2659520: 15, 1821216: 15, 2657040: 15, 2663008: 16, 2661520: 16, 2660032: 16, 1296928: 16, 2657056: 16, 2663520: 17, 2661008: 17, 2662032: 17, 2660016: 17, 2660048: 17, 772640: 17, 2657568: 17, 2657072: 17, 2664032: 18, 2660496: 18, 2662544: 18, 2660000: 18, 2660064: 18, 789024: 18, 2658080: 18, 2657088: 18, 2664544: 19, 2659984: 19, 2663056: 19, 2660080: 19, 805408: 19, 2658592: 19, 2657104: 19, 2664528: 20, 2665056: 20, 2664560: 20, 2663568: 20, 2663072: 20, 2659568: 20, 2660096: 20, 821792: 20, 2658576: 20, 2443808: 20, 2657616: 20, 2657120: 20, 2664512: 21, 2665568: 21, 2664576: 21, 2664080: 21, 2663088: 21, 2659056: 21, 2660112: 21, 838176: 21, 2658560: 21, 1919520: 21, 2658128: 21, 2657136: 21, 2664496: 22, 2666080: 22, 2664592: 22, 2663104: 22, 2658544: 22, 2660128: 22, 854560: 22, 1395232: 22, 2658640: 22, 2657152: 22, 2664480: 23, 2666592: 23, 2666096: 23, 2664608: 23, 2663120: 23, 2660640: 23, 870944: 23, 2659152: 23, 2658656: 23, 2657168: 23, 2667104: 24, 2666112: 24, 2664624: 24, 2663136: 24, 2661152: 24, 887328: 24, 2659664: 24, 2658672: 24, 2657184: 24, 2667616: 25, 2666128: 25, 2664640: 25, 2663152: 25, 2661664: 25, 903712: 25, 2660176: 25, 2658688: 25, 2525728: 25, 2657696: 25, 2667600: 26, 2666640: 26, 2666144: 26, 2665152: 26, 2663168: 26, 2662176: 26, 2661680: 26, 920096: 26, 2660688: 26, 2658704: 26, 2001440: 26, 2658208: 26, 2667584: 27, 2667152: 27, 2666160: 27, 2665664: 27, 2663184: 27, 2662688: 27, 2661696: 27, 936480: 27, 2661200: 27, 2658720: 27, 1477152: 27, 2666016: 28, 2667568: 28, 2667664: 28, 2666176: 28, 2663200: 28, 2661712: 28, 952864: 28, 2666032: 29, 2667056: 29, 2667552: 29, 2667680: 29, 2666192: 29, 2663712: 29, 2662224: 29, 2666544: 30, 2667696: 30, 2666208: 30, 2664224: 30, 2662736: 30, 2667712: 31, 2666224: 31, 2664736: 31, 2663248: 31, 2668224: 32, 2665712: 32, 2666240: 32, 2664720: 32, 2664752: 32, 2663760: 32, 2668736: 33, 2665200: 33, 2666256: 33, 2664704: 33, 2664768: 33, 2664272: 33, 2669088: 34, 2669248: 34, 2664688: 34, 2666272: 34, 2664784: 34, 2669104: 35, 2669232: 35, 2669264: 35, 2666784: 35, 2666288: 35, 2665296: 35, 2664800: 35, 2669120: 36, 2669216: 36, 2669280: 36, 2667296: 36, 2666304: 36, 2665808: 36, 2664816: 36, 2669136: 37, 2669200: 37, 2669296: 37, 2667808: 37, 2666320: 37, 2664832: 37, 2669152: 38, 2669184: 38, 2668784: 38, 2669312: 38, 2667792: 38, 2666832: 38, 2664848: 38, 2669168: 39, 2668272: 39, 2669328: 39, 2667776: 39, 2667344: 39, 2664864: 39, 2667760: 40, 2669344: 40, 2667856: 40, 2665376: 40, 2669360: 41, 2667872: 41, 2665888: 41, 2669376: 42, 2667888: 42, 2666400: 42, 2669392: 43, 2667904: 43, 2666384: 43, 2669408: 44, 2667392: 44, 2667920: 44, 2666368: 44, 2669424: 45, 2666880: 45, 2667936: 45, 2669440: 46, 2668448: 46, 2669456: 47, 2668960: 47, 2669472: 48, 4231200: 0, 4231216: 1, 4231232: 2, 4231248: 3, 4231264: 4, 3772448: 5, 4231776: 5, 2674720: 6, 3248160: 6, 4232288: 6, 2691104: 7, 2723872: 7, 4232800: 7, 2707488: 8, 2199584: 8, 2740256: 8, 4233312: 8, 1675296: 9, 2756640: 9, 4233824: 9, 577568: 10, 1151008: 10, 2773024: 10, 4234336: 10, 593952: 11, 626720: 11, 3297312: 11, 2789408: 11, 4234848: 11, 4234352: 11, 610336: 12, 643104: 12, 3821600: 12, 2805792: 12, 4235360: 12, 4234368: 12, 659488: 13, 4231312: 13, 2822176: 13, 4235872: 13, 4234384: 13, 675872: 14, 4231328: 14, 2297888: 14, 2838560: 14, 4236384: 14, 4233872: 14, 4234896: 14, 692256: 15, 4231344: 15, 1773600: 15, 2854944: 15, 4236896: 15, 4233360: 15, 4235408: 15, 708640: 16, 4231360: 16, 1249312: 16, 2871328: 16, 4237408: 16, 4232848: 16, 4235920: 16, 725024: 17, 4231872: 17, 2347040: 17, 2887712: 17, 4237392: 17, 4237920: 17, 4237424: 17, 4232864: 17, 4236432: 17, 4235936: 17, 4232384: 18, 1822752: 18, 2904096: 18, 4237376: 18, 4238432: 18, 4237440: 18, 4232880: 18, 4236944: 18, 4235952: 18, 4232896: 19, 1298464: 19, 2920480: 19, 4237360: 19, 4238944: 19, 4237456: 19, 4235968: 19, 4232912: 20, 774176: 20, 3444768: 20, 2936864: 20, 4237344: 20, 4239456: 20, 4238960: 20, 4237472: 20, 4235984: 20, 4232928: 21, 790560: 21, 3969056: 21, 2953248: 21, 4239968: 21, 4238976: 21, 4237488: 21, 4236000: 21, 4232944: 22, 806944: 22, 4231456: 22, 2969632: 22, 4240480: 22, 4238992: 22, 4237504: 22, 4236016: 22, 4232432: 23, 4232960: 23, 823328: 23, 4231440: 23, 2445344: 23, 3493920: 23, 2986016: 23, 4240464: 23, 4239504: 23, 4239008: 23, 4238016: 23, 4236032: 23, 4231920: 24, 4232976: 24, 839712: 24, 4231424: 24, 1921056: 24, 4018208: 24, 3002400: 24, 4240448: 24, 4240016: 24, 4239024: 24, 4238528: 24, 4236048: 24, 4231408: 25, 4232992: 25, 856096: 25, 1396768: 25, 4231504: 25, 3018784: 25, 4238880: 25, 4240432: 25, 4240528: 25, 4239040: 25, 4236064: 25, 4233504: 26, 872480: 26, 4232016: 26, 4231520: 26, 3035168: 26, 4238896: 26, 4239920: 26, 4240416: 26, 4240544: 26, 4239056: 26, 4235552: 26, 4236576: 26, 4234016: 27, 888864: 27, 4232528: 27, 4231536: 27, 3051552: 27, 4239408: 27, 4240560: 27, 4239072: 27, 4235040: 27, 4237088: 27, 4234528: 28, 905248: 28, 4233040: 28, 4231552: 28, 2527264: 28, 3575840: 28, 4240576: 28, 4239088: 28, 4237600: 28, 4234544: 29, 921632: 29, 4233552: 29, 4231568: 29, 2002976: 29, 4100128: 29, 4241088: 29, 4238576: 29, 4239104: 29, 4237584: 29, 4237616: 29, 4234560: 30, 938016: 30, 4234064: 30, 4231584: 30, 1478688: 30, 4241600: 30, 4238064: 30, 4239120: 30, 4237568: 30, 4237632: 30, 4234576: 31, 954400: 31, 4241952: 31, 4242112: 31, 4237552: 31, 4239136: 31, 4237648: 31, 4235088: 32, 4241968: 32, 4242096: 32, 4242128: 32, 4239648: 32, 4239152: 32, 4237136: 32, 4238160: 32, 4237664: 32, 4235600: 33, 4241984: 33, 4242080: 33, 4242144: 33, 4240160: 33, 4239168: 33, 4236624: 33, 4238672: 33, 4237680: 33, 4236112: 34, 4242000: 34, 4242064: 34, 4242160: 34, 4240672: 34, 4239184: 34, 4237696: 34, 4242016: 35, 4242048: 35, 4241648: 35, 4242176: 35, 4240656: 35, 4239696: 35, 4237712: 35, 4242032: 36, 4241136: 36, 4242192: 36, 4240640: 36, 4240208: 36, 4237728: 36, 4240624: 37, 4242208: 37, 4240720: 37, 4238240: 37, 4242224: 38, 4240736: 38, 4238752: 38, 4242240: 39, 4240752: 39, 4239264: 39, 4242256: 40, 4240768: 40, 4239248: 40, 4242272: 41, 4240256: 41, 4240784: 41, 4239232: 41, 4242288: 42, 4239744: 42, 4240800: 42, 4242304: 43, 4241312: 43, 4242320: 44, 4241824: 44, 4242336: 45, 10528800: 0, 10528816: 1, 10528832: 2, 10528848: 3, 10528864: 4, 10530336: 5, 10070048: 5, 10529376: 5, 10528880: 5, 10530352: 6, 9545760: 6, 10529888: 6, 10528896: 6, 10530864: 7, 9021472: 7, 10530400: 7, 10528912: 7, 10531376: 8, 8497184: 8, 10530912: 8, 10530416: 8, 10119200: 8, 10528928: 8, 10531888: 9, 7972896: 9, 10531424: 9, 10530432: 9, 9594912: 9, 10528944: 9, 10531872: 10, 10531904: 10, 7448608: 10, 10531936: 10, 10530448: 10, 9070624: 10, 10528960: 10, 10531920: 11, 6924320: 11, 7464992: 11, 10530960: 11, 10530464: 11, 8546336: 11, 9087008: 11, 10529472: 11, 6400032: 12, 7481376: 12, 10531472: 12, 10530480: 12, 8022048: 12, 9103392: 12, 10529984: 12, 5875744: 13, 7497760: 13, 10531984: 13, 10530496: 13, 9119776: 13, 5351456: 14, 6973472: 14, 10532000: 14, 10530512: 14, 9136160: 14, 10533408: 15, 4827168: 15, 6449184: 15, 10532016: 15, 10530528: 15, 9152544: 15, 10533424: 16, 4302880: 16, 5924896: 16, 10532032: 16, 10530544: 16, 9168928: 16, 10533440: 17, 3778592: 17, 4286496: 17, 5941280: 17, 10532544: 17, 10530032: 17, 10530560: 17, 9185312: 17, 10533456: 18, 3254304: 18, 4270112: 18, 5957664: 18, 10533056: 18, 10529520: 18, 10530576: 18, 9201696: 18, 10533472: 19, 2730016: 19, 4253728: 19, 5974048: 19, 10533568: 19, 10529008: 19, 10530592: 19, 9218080: 19, 10533488: 20, 2205728: 20, 2713632: 20, 2746400: 20, 5449760: 20, 5990432: 20, 10533552: 20, 10533584: 20, 10529024: 20, 10531104: 20, 10530608: 20, 8693792: 20, 9742368: 20, 10533504: 21, 1681440: 21, 2697248: 21, 2762784: 21, 4925472: 21, 6006816: 21, 10533536: 21, 10533600: 21, 10529040: 21, 10531616: 21, 10530624: 21, 8169504: 21, 10266656: 21, 10533520: 22, 1157152: 22, 2680864: 22, 2779168: 22, 4401184: 22, 6023200: 22, 10533616: 22, 10529056: 22, 10532128: 22, 10530640: 22, 7645216: 22, 632864: 23, 3303456: 23, 2795552: 23, 4384800: 23, 5498912: 23, 6039584: 23, 10533104: 23, 10533632: 23, 10529072: 23, 10532112: 23, 10530128: 23, 10531152: 23, 7120928: 23, 7661600: 23, 616480: 24, 649248: 24, 3827744: 24, 2811936: 24, 4368416: 24, 4974624: 24, 6055968: 24, 10532592: 24, 10533648: 24, 10529088: 24, 10532096: 24, 10529616: 24, 10531664: 24, 6596640: 24, 7677984: 24, 600096: 25, 665632: 25, 4352032: 25, 2828320: 25, 4450336: 25, 6072352: 25, 10532080: 25, 10533664: 25, 10529104: 25, 10532176: 25, 7694368: 25, 583712: 26, 682016: 26, 2304032: 26, 2844704: 26, 4466720: 26, 10533680: 26, 10315808: 26, 10529120: 26, 10532192: 26, 7170080: 26, 8218656: 26, 698400: 27, 1779744: 27, 2861088: 27, 4483104: 27, 10533696: 27, 9791520: 27, 10529136: 27, 10532208: 27, 6645792: 27, 8742944: 27, 714784: 28, 1255456: 28, 2877472: 28, 4499488: 28, 10533712: 28, 9267232: 28, 10529152: 28, 10532224: 28, 6121504: 28, 731168: 29, 2353184: 29, 2893856: 29, 3975200: 29, 10533728: 29, 10529168: 29, 10531712: 29, 10532240: 29, 5597216: 29, 1828896: 30, 2910240: 30, 3450912: 30, 10533744: 30, 10529184: 30, 10531200: 30, 10532256: 30, 5072928: 30, 1304608: 31, 2926624: 31, 10533760: 31, 10529696: 31, 10530688: 31, 10532768: 31, 4548640: 31, 780320: 32, 2943008: 32, 10533776: 32, 10530208: 32, 10530704: 32, 10533280: 32, 4024352: 32, 4565024: 32, 796704: 33, 2959392: 33, 10533792: 33, 10530720: 33, 3500064: 33, 4581408: 33, 813088: 34, 2975776: 34, 4597792: 34, 829472: 35, 2451488: 35, 2992160: 35, 4614176: 35, 845856: 36, 1927200: 36, 3008544: 36, 4630560: 36, 862240: 37, 1402912: 37, 3024928: 37, 4106272: 37, 878624: 38, 3041312: 38, 3581984: 38, 895008: 39, 3057696: 39, 911392: 40, 2533408: 40, 927776: 41, 2009120: 41, 944160: 42, 1484832: 42, 960544: 43, 12103200: 0, 12103216: 1, 12103728: 2, 12104240: 3, 12104752: 4, 12104736: 5, 12104768: 5, 10546720: 6, 12104784: 6, 10563104: 7, 12104800: 7, 10579488: 8, 12104288: 8, 10595872: 9, 12103776: 9, 10071584: 10, 11120160: 10, 10612256: 10, 12106272: 10, 12103264: 10, 9547296: 11, 11644448: 11, 10628640: 11, 12106288: 11, 12103280: 11, 9023008: 12, 10645024: 12, 12106304: 12, 12103296: 12, 8498720: 13, 10120736: 13, 10661408: 13, 12106320: 13, 12103312: 13, 7974432: 14, 9596448: 14, 10677792: 14, 12106336: 14, 12103824: 14, 12103328: 14, 7450144: 15, 9072160: 15, 10694176: 15, 12106352: 15, 12104336: 15, 12103344: 15, 6925856: 16, 7466528: 16, 8547872: 16, 9088544: 16, 11218464: 16, 12106368: 16, 12104848: 16, 12103360: 16, 6401568: 17, 7482912: 17, 8023584: 17, 9104928: 17, 11742752: 17, 12106384: 17, 12104864: 17, 12103376: 17, 5877280: 18, 7499296: 18, 9121312: 18, 12106400: 18, 12104880: 18, 12103392: 18, 5352992: 19, 6975008: 19, 9137696: 19, 12106416: 19, 12104896: 19, 12103408: 19, 4828704: 20, 6450720: 20, 9154080: 20, 12106432: 20, 12105408: 20, 11791904: 20, 12103424: 20, 4304416: 21, 5926432: 21, 9170464: 21, 12105920: 21, 12106448: 21, 11267616: 21, 12103440: 21, 3780128: 22, 4288032: 22, 5942816: 22, 9186848: 22, 12106464: 22, 10743328: 22, 12103456: 22, 3255840: 23, 4271648: 23, 5959200: 23, 9203232: 23, 12106480: 23, 10759712: 23, 12103968: 23, 12103472: 23, 2731552: 24, 4255264: 24, 5975584: 24, 9219616: 24, 12105968: 24, 12106496: 24, 10776096: 24, 12104480: 24, 12103488: 24, 2207264: 25, 2715168: 25, 2747936: 25, 5451296: 25, 5991968: 25, 8695328: 25, 9743904: 25, 12105456: 25, 12106512: 25, 10792480: 25, 12104992: 25, 12103504: 25, 1682976: 26, 2698784: 26, 2764320: 26, 4927008: 26, 6008352: 26, 8171040: 26, 10268192: 26, 12104944: 26, 12106528: 26, 10808864: 26, 12104976: 26, 11890208: 26, 12104016: 26, 1158688: 27, 2682400: 27, 2780704: 27, 4402720: 27, 6024736: 27, 7646752: 27, 12104960: 27, 12106544: 27, 10825248: 27, 11365920: 27, 12104528: 27, 634400: 28, 3304992: 28, 2797088: 28, 4386336: 28, 5500448: 28, 6041120: 28, 7122464: 28, 7663136: 28, 12106560: 28, 10841632: 28, 12105040: 28, 618016: 29, 650784: 29, 3829280: 29, 2813472: 29, 4369952: 29, 4976160: 29, 6057504: 29, 6598176: 29, 7679520: 29, 12106576: 29, 10317344: 29, 10858016: 29, 12105056: 29, 601632: 30, 667168: 30, 4353568: 30, 2829856: 30, 4451872: 30, 6073888: 30, 7695904: 30, 12106592: 30, 9793056: 30, 10874400: 30, 12105072: 30, 585248: 31, 683552: 31, 2305568: 31, 2846240: 31, 4468256: 31, 7171616: 31, 8220192: 31, 12106608: 31, 9268768: 31, 10890784: 31, 12105088: 31, 699936: 32, 1781280: 32, 2862624: 32, 4484640: 32, 6647328: 32, 8744480: 32, 12106624: 32, 10907168: 32, 12104576: 32, 12105104: 32, 716320: 33, 1256992: 33, 2879008: 33, 4501024: 33, 6123040: 33, 12106640: 33, 10923552: 33, 12104064: 33, 12105120: 33, 732704: 34, 2354720: 34, 2895392: 34, 3976736: 34, 5598752: 34, 12106656: 34, 11447840: 34, 12103552: 34, 12105632: 34, 1830432: 35, 2911776: 35, 3452448: 35, 5074464: 35, 12106144: 35, 11972128: 35, 12103568: 35, 1306144: 36, 2928160: 36, 4550176: 36, 12103584: 36, 781856: 37, 2944544: 37, 4025888: 37, 4566560: 37, 798240: 38, 2960928: 38, 3501600: 38, 4582944: 38, 814624: 39, 2977312: 39, 4599328: 39, 831008: 40, 2453024: 40, 2993696: 40, 4615712: 40, 847392: 41, 1928736: 41, 3010080: 41, 4632096: 41, 863776: 42, 1404448: 42, 3026464: 42, 4107808: 42, 880160: 43, 3042848: 43, 3583520: 43, 896544: 44, 3059232: 44, 912928: 45, 2534944: 45, 929312: 46, 2010656: 46, 945696: 47, 1486368: 47, 962080: 48, 13677600: 0, 13677616: 1, 13169696: 2, 13677632: 2, 12645408: 3, 13677648: 3, 12121120: 4, 13677664: 4, 13679136: 5, 13218848: 5, 13679152: 6, 12694560: 6, 13679168: 7, 12170272: 7, 13679184: 8, 11645984: 8, 12186656: 8, 13679200: 9, 11121696: 9, 12203040: 9, 13679216: 10, 10597408: 10, 12219424: 10, 13679232: 11, 10548256: 11, 10073120: 11, 10581024: 11, 10613792: 11, 12743712: 11, 12235808: 11, 13679248: 12, 10564640: 12, 9548832: 12, 10630176: 12, 13268000: 12, 12252192: 12, 13679264: 13, 9024544: 13, 10646560: 13, 13677712: 13, 12268576: 13, 13679280: 14, 8500256: 14, 10122272: 14, 10662944: 14, 13677728: 14, 11744288: 14, 12284960: 14, 13679296: 15, 7975968: 15, 9597984: 15, 10679328: 15, 13677744: 15, 11220000: 15, 12301344: 15, 13678784: 16, 13679312: 16, 7451680: 16, 9073696: 16, 10695712: 16, 13677760: 16, 12317728: 16, 13678272: 17, 13679328: 17, 6927392: 17, 7468064: 17, 8549408: 17, 9090080: 17, 11793440: 17, 12334112: 17, 13679344: 18, 6403104: 18, 7484448: 18, 8025120: 18, 9106464: 18, 11269152: 18, 12350496: 18, 13678832: 19, 13679360: 19, 5878816: 19, 7500832: 19, 9122848: 19, 10744864: 19, 12366880: 19, 13678320: 20, 13679376: 20, 5354528: 20, 6976544: 20, 9139232: 20, 10761248: 20, 12891168: 20, 12383264: 20, 13677808: 21, 13679392: 21, 4830240: 21, 6452256: 21, 9155616: 21, 10777632: 21, 13415456: 21, 12399648: 21, 13677824: 22, 13679408: 22, 4305952: 22, 5927968: 22, 9172000: 22, 10794016: 22, 13677856: 22, 12416032: 22, 13677840: 23, 13679424: 23, 3781664: 23, 4289568: 23, 5944352: 23, 9188384: 23, 10269728: 23, 10810400: 23, 11891744: 23, 12940320: 23, 13679440: 24, 3257376: 24, 4273184: 24, 5960736: 24, 9204768: 24, 9745440: 24, 10826784: 24, 11367456: 24, 13464608: 24, 13679456: 25, 2733088: 25, 4256800: 25, 5977120: 25, 9221152: 25, 10843168: 25, 13677904: 25, 13679472: 26, 2208800: 26, 2716704: 26, 2749472: 26, 5452832: 26, 5993504: 26, 8696864: 26, 10318880: 26, 10859552: 26, 13677920: 26, 13679488: 27, 1684512: 27, 2700320: 27, 2765856: 27, 4928544: 27, 6009888: 27, 8172576: 27, 9794592: 27, 10875936: 27, 13677936: 27, 13679504: 28, 1160224: 28, 2683936: 28, 2782240: 28, 4404256: 28, 6026272: 28, 7648288: 28, 9270304: 28, 10892320: 28, 13677952: 28, 13679520: 29, 635936: 29, 3306528: 29, 2798624: 29, 4387872: 29, 5501984: 29, 6042656: 29, 7124000: 29, 7664672: 29, 8746016: 29, 10908704: 29, 13513760: 29, 13677968: 29, 13679008: 30, 619552: 30, 652320: 30, 3830816: 30, 2815008: 30, 4371488: 30, 4977696: 30, 6059040: 30, 6599712: 30, 7681056: 30, 8221728: 30, 10925088: 30, 12989472: 30, 13677984: 30, 13678496: 31, 603168: 31, 668704: 31, 4355104: 31, 2831392: 31, 4453408: 31, 6075424: 31, 7697440: 31, 11449376: 31, 12465184: 31, 586784: 32, 685088: 32, 2307104: 32, 2847776: 32, 4469792: 32, 7173152: 32, 11973664: 32, 12481568: 32, 701472: 33, 1782816: 33, 2864160: 33, 4486176: 33, 6648864: 33, 12497952: 33, 717856: 34, 1258528: 34, 2880544: 34, 4502560: 34, 6124576: 34, 734240: 35, 2356256: 35, 2896928: 35, 3978272: 35, 5600288: 35, 1831968: 36, 2913312: 36, 3453984: 36, 5076000: 36, 1307680: 37, 2929696: 37, 4551712: 37, 783392: 38, 2946080: 38, 4027424: 38, 4568096: 38, 799776: 39, 2962464: 39, 3503136: 39, 4584480: 39, 816160: 40, 2978848: 40, 4600864: 40, 832544: 41, 2454560: 41, 2995232: 41, 4617248: 41, 848928: 42, 1930272: 42, 3011616: 42, 4633632: 42, 865312: 43, 1405984: 43, 3028000: 43, 4109344: 43, 881696: 44, 3044384: 44, 3585056: 44, 898080: 45, 3060768: 45, 914464: 46, 2536480: 46, 930848: 47, 2012192: 47, 947232: 48, 1487904: 48, 963616: 49, 15252000: 0, 15252016: 1, 15252032: 2, 15252048: 3, 15252064: 4, 15252080: 5, 13695520: 6, 15252096: 6, 13171232: 7, 13711904: 7, 15252112: 7, 12646944: 8, 13728288: 8, 15252128: 8, 12122656: 9, 13744672: 9, 15252144: 9, 13220384: 10, 15252160: 10, 12696096: 11, 14891552: 11, 15252176: 11, 12171808: 12, 14367264: 12, 15252192: 12, 11647520: 13, 12188192: 13, 13842976: 13, 15252208: 13, 11123232: 14, 12204576: 14, 13826592: 14, 14940704: 14, 15252224: 14, 10598944: 15, 12220960: 15, 13810208: 15, 14416416: 15, 15252240: 15, 10549792: 16, 10074656: 16, 10582560: 16, 10615328: 16, 12745248: 16, 12237344: 16, 13793824: 16, 13892128: 16, 15252256: 16, 10566176: 17, 9550368: 17, 10631712: 17, 13269536: 17, 12253728: 17, 13908512: 17, 15252272: 17, 9026080: 18, 10648096: 18, 12270112: 18, 13924896: 18, 15252288: 18, 8501792: 19, 10123808: 19, 10664480: 19, 11745824: 19, 12286496: 19, 13941280: 19, 15252304: 19, 7977504: 20, 9599520: 20, 10680864: 20, 11221536: 20, 12302880: 20, 13416992: 20, 15252320: 20, 7453216: 21, 9075232: 21, 10697248: 21, 12319264: 21, 12892704: 21, 15252336: 21, 6928928: 22, 7469600: 22, 8550944: 22, 9091616: 22, 11794976: 22, 12335648: 22, 12368416: 22, 15252352: 22, 6404640: 23, 7485984: 23, 8026656: 23, 9108000: 23, 11270688: 23, 12352032: 23, 12384800: 23, 15252368: 23, 5880352: 24, 7502368: 24, 9124384: 24, 10746400: 24, 12401184: 24, 15252384: 24, 5356064: 25, 6978080: 25, 9140768: 25, 10762784: 25, 12417568: 25, 15120928: 25, 4831776: 26, 6453792: 26, 9157152: 26, 10779168: 26, 11893280: 26, 12941856: 26, 14596640: 26, 4307488: 27, 5929504: 27, 9173536: 27, 10795552: 27, 11368992: 27, 13466144: 27, 14072352: 27, 3783200: 28, 4291104: 28, 5945888: 28, 9189920: 28, 10271264: 28, 10811936: 28, 10844704: 28, 13990432: 28, 14055968: 28, 3258912: 29, 4274720: 29, 5962272: 29, 9206304: 29, 9746976: 29, 10828320: 29, 10320416: 29, 10861088: 29, 14006816: 29, 14039584: 29, 2734624: 30, 4258336: 30, 5978656: 30, 9222688: 30, 9796128: 30, 10877472: 30, 14023200: 30, 13515296: 30, 2210336: 31, 2718240: 31, 2751008: 31, 5454368: 31, 5995040: 31, 8698400: 31, 9271840: 31, 10893856: 31, 12991008: 31, 1686048: 32, 2701856: 32, 2767392: 32, 4930080: 32, 6011424: 32, 8174112: 32, 8747552: 32, 10910240: 32, 12466720: 32, 1161760: 33, 2685472: 33, 2783776: 33, 4405792: 33, 6027808: 33, 7649824: 33, 8223264: 33, 10926624: 33, 12483104: 33, 637472: 34, 3308064: 34, 2800160: 34, 4389408: 34, 5503520: 34, 6044192: 34, 7125536: 34, 7666208: 34, 7698976: 34, 11450912: 34, 12499488: 34, 621088: 35, 653856: 35, 3832352: 35, 2816544: 35, 4373024: 35, 4979232: 35, 6060576: 35, 6601248: 35, 7682592: 35, 7174688: 35, 11975200: 35, 604704: 36, 670240: 36, 4356640: 36, 2832928: 36, 4454944: 36, 6076960: 36, 6650400: 36, 588320: 37, 686624: 37, 2308640: 37, 2849312: 37, 4471328: 37, 6126112: 37, 703008: 38, 1784352: 38, 2865696: 38, 4487712: 38, 5601824: 38, 719392: 39, 1260064: 39, 2882080: 39, 4504096: 39, 5077536: 39, 735776: 40, 2357792: 40, 2898464: 40, 3979808: 40, 4553248: 40, 1833504: 41, 2914848: 41, 3455520: 41, 4028960: 41, 4569632: 41, 1309216: 42, 2931232: 42, 3504672: 42, 4586016: 42, 784928: 43, 2947616: 43, 2980384: 43, 4602400: 43, 801312: 44, 2964000: 44, 2456096: 44, 2996768: 44, 4618784: 44, 817696: 45, 1931808: 45, 3013152: 45, 4635168: 45, 834080: 46, 1407520: 46, 3029536: 46, 4110880: 46, 850464: 47, 883232: 47, 3045920: 47, 3586592: 47, 866848: 48, 899616: 48, 3062304: 48, 916000: 49, 2538016: 49, 932384: 50, 2013728: 50, 948768: 51, 1489440: 51, 965152: 52, 574000: 0, 574016: 1, 574032: 2, 574048: 3, 574560: 4, 574064: 4, 575072: 5, 574080: 5, 575584: 6, 574096: 6, 576096: 7, 574112: 7, 576048: 8, 576080: 8, 576608: 8, 576112: 8, 574128: 8, 576064: 9, 577120: 9, 576128: 9, 574144: 9, 577632: 10, 576144: 10, 574656: 10, 577584: 11, 577616: 11, 578144: 11, 576656: 11, 576160: 11, 575168: 11, 577600: 12, 578656: 12, 577168: 12, 576176: 12, 575680: 12, 579168: 13, 577680: 13, 576192: 13, 579680: 14, 577696: 14, 576208: 14, 580192: 15, 577712: 15, 576224: 15, 580704: 16, 577728: 16, 576240: 16, 581216: 17, 580720: 17, 578240: 17, 575728: 17, 576256: 17, 581728: 18, 580736: 18, 578752: 18, 575216: 18, 576272: 18, 582240: 19, 580752: 19, 579264: 19, 574704: 19, 576288: 19, 582752: 20, 580240: 20, 581264: 20, 579248: 20, 579280: 20, 574192: 20, 576800: 20, 576304: 20, 583264: 21, 579728: 21, 581776: 21, 579232: 21, 579296: 21, 574208: 21, 577312: 21, 576320: 21, 583776: 22, 579216: 22, 582288: 22, 579312: 22, 574224: 22, 577824: 22, 576336: 22, 583760: 23, 584288: 23, 583792: 23, 582800: 23, 582304: 23, 578800: 23, 579328: 23, 574240: 23, 577808: 23, 575824: 23, 576848: 23, 576352: 23, 583744: 24, 584800: 24, 583808: 24, 583312: 24, 582320: 24, 578288: 24, 579344: 24, 574256: 24, 577792: 24, 575312: 24, 577360: 24, 576368: 24, 583728: 25, 585312: 25, 583824: 25, 582336: 25, 577776: 25, 579360: 25, 574272: 25, 574800: 25, 577872: 25, 576384: 25, 585824: 26, 585328: 26, 583840: 26, 582352: 26, 579872: 26, 574288: 26, 578384: 26, 577888: 26, 576400: 26, 586336: 27, 585344: 27, 583856: 27, 582368: 27, 580384: 27, 574304: 27, 578896: 27, 577904: 27, 576416: 27, 586848: 28, 585360: 28, 583872: 28, 582384: 28, 580896: 28, 574320: 28, 579408: 28, 577920: 28, 575904: 28, 576928: 28, 586832: 29, 585872: 29, 585376: 29, 584384: 29, 582400: 29, 581408: 29, 580912: 29, 574336: 29, 579920: 29, 577936: 29, 575392: 29, 577440: 29, 586816: 30, 586384: 30, 585392: 30, 584896: 30, 582416: 30, 581920: 30, 580928: 30, 574352: 30, 580432: 30, 577952: 30, 574880: 30, 586800: 31, 586896: 31, 585408: 31, 582432: 31, 580944: 31, 574368: 31, 585264: 32, 586288: 32, 586912: 32, 585424: 32, 582944: 32, 581456: 32, 585776: 33, 586928: 33, 585440: 33, 583456: 33, 581968: 33, 586944: 34, 585456: 34, 583968: 34, 582480: 34, 587456: 35, 584944: 35, 585472: 35, 583952: 35, 583984: 35, 582992: 35, 587968: 36, 584432: 36, 585488: 36, 583936: 36, 584000: 36, 583504: 36, 588480: 37, 583920: 37, 585504: 37, 584016: 37, 588336: 38, 588464: 38, 588496: 38, 586016: 38, 585520: 38, 584528: 38, 584032: 38, 588352: 39, 588448: 39, 588512: 39, 586528: 39, 585536: 39, 585040: 39, 584048: 39, 588368: 40, 588432: 40, 588528: 40, 587040: 40, 585552: 40, 584064: 40, 588384: 41, 588416: 41, 588016: 41, 588544: 41, 587024: 41, 586064: 41, 584080: 41, 588400: 42, 587504: 42, 588560: 42, 587008: 42, 586576: 42, 584096: 42, 586992: 43, 588576: 43, 587088: 43, 584608: 43, 588592: 44, 587104: 44, 585120: 44, 588608: 45, 587120: 45, 585632: 45, 588624: 46, 587136: 46, 585616: 46, 588640: 47, 586624: 47, 587152: 47, 585600: 47, 588656: 48, 586112: 48, 587168: 48, 588672: 49, 587680: 49, 588688: 50, 588192: 50, 588704: 51, 2673200: 0, 2673216: 1, 2673232: 2, 2673248: 3, 2198064: 4, 2673760: 4, 2673264: 4, 1673776: 5, 2674272: 5, 2673280: 5, 1149488: 6, 2674784: 6, 2673296: 6, 2674736: 7, 625200: 7, 2674768: 7, 2675296: 7, 2673808: 7, 2673312: 7, 2674752: 8, 608816: 8, 641584: 8, 2675808: 8, 2674320: 8, 2673328: 8, 592432: 9, 657968: 9, 2676320: 9, 2674832: 9, 2673344: 9, 674352: 10, 2676832: 10, 2674848: 10, 2296368: 10, 2673360: 10, 690736: 11, 2677344: 11, 2674864: 11, 1772080: 11, 2673376: 11, 707120: 12, 2677856: 12, 2674880: 12, 1247792: 12, 2673392: 12, 723504: 13, 2678368: 13, 2677872: 13, 2675392: 13, 2345520: 13, 2673408: 13, 2678880: 14, 2677888: 14, 2675904: 14, 1821232: 14, 2673424: 14, 2679392: 15, 2677904: 15, 2676416: 15, 1296944: 15, 2673440: 15, 2679904: 16, 2677392: 16, 2678416: 16, 2676400: 16, 2676432: 16, 772656: 16, 2673952: 16, 2673456: 16, 2680416: 17, 2676880: 17, 2678928: 17, 2676384: 17, 2676448: 17, 789040: 17, 2674464: 17, 2673472: 17, 2680928: 18, 2676368: 18, 2679440: 18, 2676464: 18, 805424: 18, 2674976: 18, 2673488: 18, 2680912: 19, 2681440: 19, 2680944: 19, 2679952: 19, 2679456: 19, 2675952: 19, 2676480: 19, 821808: 19, 2674960: 19, 2443824: 19, 2674000: 19, 2673504: 19, 2680896: 20, 2681952: 20, 2680960: 20, 2680464: 20, 2679472: 20, 2675440: 20, 2676496: 20, 838192: 20, 2674944: 20, 1919536: 20, 2674512: 20, 2673520: 20, 2680880: 21, 2682464: 21, 2680976: 21, 2679488: 21, 2674928: 21, 2676512: 21, 854576: 21, 1395248: 21, 2675024: 21, 2673536: 21, 2682976: 22, 2682480: 22, 2680992: 22, 2679504: 22, 2677024: 22, 870960: 22, 2675536: 22, 2675040: 22, 2673552: 22, 2683488: 23, 2682496: 23, 2681008: 23, 2679520: 23, 2677536: 23, 887344: 23, 2676048: 23, 2675056: 23, 2673568: 23, 2684000: 24, 2682512: 24, 2681024: 24, 2679536: 24, 2678048: 24, 903728: 24, 2676560: 24, 2675072: 24, 2525744: 24, 2674080: 24, 2683984: 25, 2683024: 25, 2682528: 25, 2681536: 25, 2679552: 25, 2678560: 25, 2678064: 25, 920112: 25, 2677072: 25, 2675088: 25, 2001456: 25, 2674592: 25, 2683968: 26, 2683536: 26, 2682544: 26, 2682048: 26, 2679568: 26, 2679072: 26, 2678080: 26, 936496: 26, 2677584: 26, 2675104: 26, 1477168: 26, 2683952: 27, 2684048: 27, 2682560: 27, 2679584: 27, 2678096: 27, 952880: 27, 2682416: 28, 2683440: 28, 2684064: 28, 2682576: 28, 2680096: 28, 2678608: 28, 2682928: 29, 2684080: 29, 2682592: 29, 2680608: 29, 2679120: 29, 2684096: 30, 2682608: 30, 2681120: 30, 2679632: 30, 2684608: 31, 2682096: 31, 2682624: 31, 2681104: 31, 2681136: 31, 2680144: 31, 2685120: 32, 2681584: 32, 2682640: 32, 2681088: 32, 2681152: 32, 2680656: 32, 2685632: 33, 2681072: 33, 2682656: 33, 2681168: 33, 2685488: 34, 2685616: 34, 2685648: 34, 2683168: 34, 2682672: 34, 2681680: 34, 2681184: 34, 2685504: 35, 2685600: 35, 2685664: 35, 2683680: 35, 2682688: 35, 2682192: 35, 2681200: 35, 2685520: 36, 2685584: 36, 2685680: 36, 2684192: 36, 2682704: 36, 2681216: 36, 2685536: 37, 2685568: 37, 2685168: 37, 2685696: 37, 2684176: 37, 2683216: 37, 2681232: 37, 2685552: 38, 2684656: 38, 2685712: 38, 2684160: 38, 2683728: 38, 2681248: 38, 2684144: 39, 2685728: 39, 2684240: 39, 2681760: 39, 2685744: 40, 2684256: 40, 2682272: 40, 2685760: 41, 2684272: 41, 2682784: 41, 2685776: 42, 2684288: 42, 2682768: 42, 2685792: 43, 2683776: 43, 2684304: 43, 2682752: 43, 2685808: 44, 2683264: 44, 2684320: 44, 2685824: 45, 2684832: 45, 2685840: 46, 2685344: 46, 2685856: 47, 4247600: 0, 4247616: 1, 4247632: 2, 4247648: 3, 3772464: 4, 4248160: 4, 3248176: 5, 4248672: 5, 2723888: 6, 4249184: 6, 2199600: 7, 2707504: 7, 2740272: 7, 4249696: 7, 2691120: 8, 1675312: 8, 2756656: 8, 4250208: 8, 1151024: 9, 2773040: 9, 4250720: 9, 626736: 10, 3297328: 10, 2789424: 10, 4251232: 10, 4250736: 10, 610352: 11, 643120: 11, 3821616: 11, 2805808: 11, 4251744: 11, 4250752: 11, 593968: 12, 659504: 12, 4247696: 12, 2822192: 12, 4252256: 12, 4250768: 12, 675888: 13, 4247712: 13, 2297904: 13, 2838576: 13, 4252768: 13, 4250256: 13, 4251280: 13, 692272: 14, 4247728: 14, 1773616: 14, 2854960: 14, 4253280: 14, 4249744: 14, 4251792: 14, 708656: 15, 4247744: 15, 1249328: 15, 2871344: 15, 4253792: 15, 4249232: 15, 4252304: 15, 725040: 16, 4248256: 16, 2347056: 16, 2887728: 16, 4253776: 16, 4254304: 16, 4253808: 16, 4249248: 16, 4252816: 16, 4252320: 16, 4248768: 17, 1822768: 17, 2904112: 17, 4253760: 17, 4254816: 17, 4253824: 17, 4249264: 17, 4253328: 17, 4252336: 17, 4249280: 18, 1298480: 18, 2920496: 18, 4253744: 18, 4255328: 18, 4253840: 18, 4252352: 18, 4249296: 19, 774192: 19, 3444784: 19, 2936880: 19, 4255840: 19, 4255344: 19, 4253856: 19, 4252368: 19, 4249312: 20, 790576: 20, 3969072: 20, 2953264: 20, 4256352: 20, 4255360: 20, 4253872: 20, 4252384: 20, 4249328: 21, 806960: 21, 4247840: 21, 2969648: 21, 4256864: 21, 4255376: 21, 4253888: 21, 4252400: 21, 4248816: 22, 4249344: 22, 823344: 22, 4247824: 22, 2445360: 22, 3493936: 22, 2986032: 22, 4256848: 22, 4255888: 22, 4255392: 22, 4254400: 22, 4252416: 22, 4248304: 23, 4249360: 23, 839728: 23, 4247808: 23, 1921072: 23, 4018224: 23, 3002416: 23, 4256832: 23, 4256400: 23, 4255408: 23, 4254912: 23, 4252432: 23, 4247792: 24, 4249376: 24, 856112: 24, 1396784: 24, 4247888: 24, 3018800: 24, 4256816: 24, 4256912: 24, 4255424: 24, 4252448: 24, 4249888: 25, 872496: 25, 4248400: 25, 4247904: 25, 3035184: 25, 4255280: 25, 4256304: 25, 4256928: 25, 4255440: 25, 4251936: 25, 4252960: 25, 4250400: 26, 888880: 26, 4248912: 26, 4247920: 26, 3051568: 26, 4255792: 26, 4256944: 26, 4255456: 26, 4251424: 26, 4253472: 26, 4250912: 27, 905264: 27, 4249424: 27, 4247936: 27, 2527280: 27, 3575856: 27, 4256960: 27, 4255472: 27, 4253984: 27, 4250928: 28, 921648: 28, 4249936: 28, 4247952: 28, 2002992: 28, 4100144: 28, 4257472: 28, 4254960: 28, 4255488: 28, 4253968: 28, 4254000: 28, 4250944: 29, 938032: 29, 4250448: 29, 4247968: 29, 1478704: 29, 4257984: 29, 4254448: 29, 4255504: 29, 4253952: 29, 4254016: 29, 4250960: 30, 954416: 30, 4258496: 30, 4253936: 30, 4255520: 30, 4254032: 30, 4251472: 31, 4258352: 31, 4258480: 31, 4258512: 31, 4256032: 31, 4255536: 31, 4253520: 31, 4254544: 31, 4254048: 31, 4251984: 32, 4258368: 32, 4258464: 32, 4258528: 32, 4256544: 32, 4255552: 32, 4253008: 32, 4255056: 32, 4254064: 32, 4252496: 33, 4258384: 33, 4258448: 33, 4258544: 33, 4257056: 33, 4255568: 33, 4254080: 33, 4258400: 34, 4258432: 34, 4258032: 34, 4258560: 34, 4257040: 34, 4256080: 34, 4254096: 34, 4258416: 35, 4257520: 35, 4258576: 35, 4257024: 35, 4256592: 35, 4254112: 35, 4257008: 36, 4258592: 36, 4257104: 36, 4254624: 36, 4258608: 37, 4257120: 37, 4255136: 37, 4258624: 38, 4257136: 38, 4255648: 38, 4258640: 39, 4257152: 39, 4255632: 39, 4258656: 40, 4256640: 40, 4257168: 40, 4255616: 40, 4258672: 41, 4256128: 41, 4257184: 41, 4258688: 42, 4257696: 42, 4258704: 43, 4258208: 43, 4258720: 44, 10545200: 0, 10545216: 1, 10545232: 2, 10545248: 3, 10070064: 4, 10545760: 4, 10545264: 4, 9545776: 5, 10546272: 5, 10545280: 5, 9021488: 6, 10546784: 6, 10545296: 6, 10546736: 7, 8497200: 7, 10547296: 7, 10546800: 7, 10119216: 7, 10545312: 7, 10547248: 8, 7972912: 8, 10547808: 8, 10546816: 8, 9594928: 8, 10545328: 8, 10547760: 9, 7448624: 9, 10548320: 9, 10546832: 9, 9070640: 9, 10545344: 9, 10548272: 10, 6924336: 10, 7465008: 10, 10548304: 10, 10547344: 10, 10546848: 10, 8546352: 10, 9087024: 10, 10545856: 10, 10548288: 11, 6400048: 11, 7481392: 11, 10547856: 11, 10546864: 11, 8022064: 11, 9103408: 11, 10546368: 11, 5875760: 12, 7497776: 12, 10548368: 12, 10546880: 12, 9119792: 12, 5351472: 13, 6973488: 13, 10548384: 13, 10546896: 13, 9136176: 13, 4827184: 14, 6449200: 14, 10548400: 14, 10546912: 14, 9152560: 14, 4302896: 15, 5924912: 15, 10548416: 15, 10546928: 15, 9168944: 15, 3778608: 16, 4286512: 16, 5941296: 16, 10548928: 16, 10546416: 16, 10546944: 16, 9185328: 16, 10549808: 17, 3254320: 17, 4270128: 17, 5957680: 17, 10549440: 17, 10545904: 17, 10546960: 17, 9201712: 17, 10549824: 18, 2730032: 18, 5974064: 18, 10549952: 18, 10545392: 18, 10546976: 18, 9218096: 18, 10549840: 19, 2205744: 19, 2713648: 19, 2746416: 19, 5449776: 19, 5990448: 19, 10549936: 19, 10549968: 19, 10545408: 19, 10547488: 19, 10546992: 19, 8693808: 19, 9742384: 19, 10549856: 20, 1681456: 20, 2697264: 20, 2762800: 20, 4925488: 20, 6006832: 20, 10549920: 20, 10549984: 20, 10545424: 20, 10548000: 20, 10547008: 20, 8169520: 20, 10266672: 20, 10549872: 21, 1157168: 21, 2779184: 21, 4401200: 21, 6023216: 21, 10549904: 21, 10550000: 21, 10545440: 21, 10548512: 21, 10547024: 21, 7645232: 21, 10549888: 22, 632880: 22, 3303472: 22, 2795568: 22, 4384816: 22, 5498928: 22, 6039600: 22, 10549488: 22, 10550016: 22, 10545456: 22, 10548496: 22, 10546512: 22, 10547536: 22, 7120944: 22, 7661616: 22, 616496: 23, 649264: 23, 3827760: 23, 2811952: 23, 4368432: 23, 4974640: 23, 6055984: 23, 10548976: 23, 10550032: 23, 10545472: 23, 10548480: 23, 10546000: 23, 10548048: 23, 6596656: 23, 7678000: 23, 600112: 24, 665648: 24, 4352048: 24, 2828336: 24, 4450352: 24, 6072368: 24, 10548464: 24, 10550048: 24, 10545488: 24, 10548560: 24, 7694384: 24, 682032: 25, 2304048: 25, 2844720: 25, 4466736: 25, 10550064: 25, 10315824: 25, 10545504: 25, 10548576: 25, 7170096: 25, 8218672: 25, 698416: 26, 1779760: 26, 2861104: 26, 4483120: 26, 10550080: 26, 9791536: 26, 10545520: 26, 10548592: 26, 6645808: 26, 8742960: 26, 714800: 27, 1255472: 27, 2877488: 27, 4499504: 27, 10550096: 27, 9267248: 27, 10545536: 27, 10548608: 27, 6121520: 27, 731184: 28, 2353200: 28, 2893872: 28, 3975216: 28, 10550112: 28, 10545552: 28, 10548096: 28, 10548624: 28, 5597232: 28, 1828912: 29, 2910256: 29, 3450928: 29, 10550128: 29, 10545568: 29, 10547584: 29, 10548640: 29, 5072944: 29, 1304624: 30, 2926640: 30, 10550144: 30, 10546080: 30, 10547072: 30, 10549152: 30, 4548656: 30, 780336: 31, 2943024: 31, 10550160: 31, 10546592: 31, 10547088: 31, 10549664: 31, 4024368: 31, 4565040: 31, 796720: 32, 2959408: 32, 10550176: 32, 10547104: 32, 3500080: 32, 4581424: 32, 813104: 33, 2975792: 33, 4597808: 33, 829488: 34, 2451504: 34, 2992176: 34, 4614192: 34, 845872: 35, 1927216: 35, 3008560: 35, 4630576: 35, 862256: 36, 1402928: 36, 3024944: 36, 4106288: 36, 878640: 37, 3041328: 37, 3582000: 37, 895024: 38, 3057712: 38, 911408: 39, 2533424: 39, 927792: 40, 2009136: 40, 944176: 41, 1484848: 41, 960560: 42, 12119600: 0, 12120112: 1, 12120624: 2, 12121136: 3, 12121152: 4, 12121168: 5, 12121184: 6, 12120672: 7, 10563120: 8, 12120160: 8, 10579504: 9, 12119648: 9, 10595888: 10, 12122672: 10, 11644464: 10, 12119664: 10, 10071600: 11, 11120176: 11, 10612272: 11, 12122688: 11, 12119680: 11, 9547312: 12, 10628656: 12, 12122704: 12, 12119696: 12, 9023024: 13, 10645040: 13, 12122720: 13, 12120208: 13, 12119712: 13, 8498736: 14, 10120752: 14, 10661424: 14, 12122736: 14, 12120720: 14, 12119728: 14, 7974448: 15, 9596464: 15, 10677808: 15, 12122752: 15, 12121232: 15, 12119744: 15, 7450160: 16, 9072176: 16, 10694192: 16, 12122768: 16, 12121248: 16, 11742768: 16, 12119760: 16, 6925872: 17, 7466544: 17, 8547888: 17, 9088560: 17, 11218480: 17, 12122784: 17, 12121264: 17, 12119776: 17, 6401584: 18, 7482928: 18, 8023600: 18, 9104944: 18, 12122800: 18, 12121280: 18, 12119792: 18, 5877296: 19, 7499312: 19, 9121328: 19, 12122816: 19, 12121792: 19, 11791920: 19, 12119808: 19, 5353008: 20, 6975024: 20, 9137712: 20, 12122304: 20, 12122832: 20, 11267632: 20, 12119824: 20, 4828720: 21, 6450736: 21, 9154096: 21, 12122848: 21, 10743344: 21, 12119840: 21, 4304432: 22, 5926448: 22, 9170480: 22, 12122864: 22, 10759728: 22, 12120352: 22, 12119856: 22, 3780144: 23, 4288048: 23, 5942832: 23, 9186864: 23, 12122352: 23, 12122880: 23, 10776112: 23, 12120864: 23, 12119872: 23, 3255856: 24, 4271664: 24, 5959216: 24, 9203248: 24, 12121840: 24, 12122896: 24, 10792496: 24, 12121376: 24, 12119888: 24, 2731568: 25, 5975600: 25, 9219632: 25, 12121328: 25, 12122912: 25, 10268208: 25, 10808880: 25, 12121360: 25, 11890224: 25, 12120400: 25, 2207280: 26, 2715184: 26, 2747952: 26, 5451312: 26, 5991984: 26, 8695344: 26, 9743920: 26, 12121344: 26, 12122928: 26, 10825264: 26, 11365936: 26, 12120912: 26, 1682992: 27, 2698800: 27, 2764336: 27, 4927024: 27, 6008368: 27, 8171056: 27, 12122944: 27, 10841648: 27, 12121424: 27, 1158704: 28, 2780720: 28, 4402736: 28, 6024752: 28, 7646768: 28, 12122960: 28, 10317360: 28, 10858032: 28, 12121440: 28, 634416: 29, 3305008: 29, 2797104: 29, 4386352: 29, 5500464: 29, 6041136: 29, 7122480: 29, 7663152: 29, 12122976: 29, 9793072: 29, 10874416: 29, 12121456: 29, 618032: 30, 650800: 30, 3829296: 30, 2813488: 30, 4369968: 30, 4976176: 30, 6057520: 30, 6598192: 30, 7679536: 30, 12122992: 30, 9268784: 30, 10890800: 30, 12121472: 30, 601648: 31, 667184: 31, 4353584: 31, 2829872: 31, 4451888: 31, 6073904: 31, 7695920: 31, 12123008: 31, 8744496: 31, 10907184: 31, 12120960: 31, 12121488: 31, 683568: 32, 2305584: 32, 2846256: 32, 4468272: 32, 7171632: 32, 8220208: 32, 12123024: 32, 10923568: 32, 12120448: 32, 12121504: 32, 699952: 33, 1781296: 33, 2862640: 33, 4484656: 33, 6647344: 33, 12123040: 33, 11447856: 33, 12119936: 33, 12122016: 33, 716336: 34, 1257008: 34, 2879024: 34, 4501040: 34, 6123056: 34, 12122528: 34, 11972144: 34, 12119952: 34, 732720: 35, 2354736: 35, 2895408: 35, 3976752: 35, 5598768: 35, 12119968: 35, 1830448: 36, 2911792: 36, 3452464: 36, 5074480: 36, 1306160: 37, 2928176: 37, 4550192: 37, 781872: 38, 2944560: 38, 4025904: 38, 4566576: 38, 798256: 39, 2960944: 39, 3501616: 39, 4582960: 39, 814640: 40, 2977328: 40, 4599344: 40, 831024: 41, 2453040: 41, 2993712: 41, 4615728: 41, 847408: 42, 1928752: 42, 3010096: 42, 4632112: 42, 863792: 43, 1404464: 43, 3026480: 43, 4107824: 43, 880176: 44, 3042864: 44, 3583536: 44, 896560: 45, 3059248: 45, 912944: 46, 2534960: 46, 929328: 47, 2010672: 47, 945712: 48, 1486384: 48, 962096: 49, 12644400: 0, 12644912: 1, 12645424: 2, 12645440: 3, 12645456: 4, 12645472: 5, 12644960: 6, 12644448: 7, 12169264: 8, 10563632: 9, 12646960: 9, 11644976: 9, 12185648: 9, 10580016: 10, 12646976: 10, 11120688: 10, 12202032: 10, 10596400: 11, 12646992: 11, 12218416: 11, 10072112: 12, 10612784: 12, 12647008: 12, 12644496: 12, 12234800: 12, 9547824: 13, 10629168: 13, 12647024: 13, 12645008: 13, 12251184: 13, 9023536: 14, 10645552: 14, 12647040: 14, 12645520: 14, 12267568: 14, 8499248: 15, 10121264: 15, 10661936: 15, 12647056: 15, 12645536: 15, 11743280: 15, 12283952: 15, 7974960: 16, 9596976: 16, 10678320: 16, 12647072: 16, 12645552: 16, 11218992: 16, 12300336: 16, 7450672: 17, 9072688: 17, 10694704: 17, 12647088: 17, 12645568: 17, 12316720: 17, 6926384: 18, 7467056: 18, 8548400: 18, 9089072: 18, 12647104: 18, 12646080: 18, 11792432: 18, 12333104: 18, 6402096: 19, 7483440: 19, 8024112: 19, 9105456: 19, 12646592: 19, 12647120: 19, 11268144: 19, 12349488: 19, 5877808: 20, 7499824: 20, 9121840: 20, 12647136: 20, 10743856: 20, 12365872: 20, 5353520: 21, 6975536: 21, 9138224: 21, 12647152: 21, 10760240: 21, 12644640: 21, 12382256: 21, 4829232: 22, 6451248: 22, 9154608: 22, 12646640: 22, 12647168: 22, 10776624: 22, 12645152: 22, 12398640: 22, 4304944: 23, 5926960: 23, 9170992: 23, 12646128: 23, 12647184: 23, 10793008: 23, 12645664: 23, 12415024: 23, 3780656: 24, 4288560: 24, 5943344: 24, 9187376: 24, 12645616: 24, 12647200: 24, 10268720: 24, 10809392: 24, 12645648: 24, 11890736: 24, 12644688: 24, 3256368: 25, 4272176: 25, 5959728: 25, 9203760: 25, 12645632: 25, 12647216: 25, 9744432: 25, 10825776: 25, 11366448: 25, 12645200: 25, 2732080: 26, 5976112: 26, 9220144: 26, 12647232: 26, 10842160: 26, 12645712: 26, 2207792: 27, 2715696: 27, 2748464: 27, 5451824: 27, 5992496: 27, 8695856: 27, 12647248: 27, 10317872: 27, 10858544: 27, 12645728: 27, 1683504: 28, 2699312: 28, 2764848: 28, 4927536: 28, 6008880: 28, 8171568: 28, 12647264: 28, 9793584: 28, 10874928: 28, 12645744: 28, 1159216: 29, 2781232: 29, 4403248: 29, 6025264: 29, 7647280: 29, 12647280: 29, 9269296: 29, 10891312: 29, 12645760: 29, 634928: 30, 3305520: 30, 2797616: 30, 4386864: 30, 5500976: 30, 6041648: 30, 7122992: 30, 7663664: 30, 12647296: 30, 8745008: 30, 10907696: 30, 12645248: 30, 12645776: 30, 618544: 31, 651312: 31, 3829808: 31, 2814000: 31, 4370480: 31, 4976688: 31, 6058032: 31, 6598704: 31, 7680048: 31, 12647312: 31, 8220720: 31, 10924080: 31, 12644736: 31, 12645792: 31, 602160: 32, 667696: 32, 4354096: 32, 2830384: 32, 4452400: 32, 6074416: 32, 7696432: 32, 12647328: 32, 11448368: 32, 12464176: 32, 12646304: 32, 684080: 33, 2306096: 33, 2846768: 33, 4468784: 33, 7172144: 33, 12646816: 33, 11972656: 33, 12480560: 33, 700464: 34, 1781808: 34, 2863152: 34, 4485168: 34, 6647856: 34, 12496944: 34, 716848: 35, 1257520: 35, 2879536: 35, 4501552: 35, 6123568: 35, 733232: 36, 2355248: 36, 2895920: 36, 3977264: 36, 5599280: 36, 1830960: 37, 2912304: 37, 3452976: 37, 5074992: 37, 1306672: 38, 2928688: 38, 4550704: 38, 782384: 39, 2945072: 39, 4026416: 39, 4567088: 39, 798768: 40, 2961456: 40, 3502128: 40, 4583472: 40, 815152: 41, 2977840: 41, 4599856: 41, 831536: 42, 2453552: 42, 2994224: 42, 4616240: 42, 847920: 43, 1929264: 43, 3010608: 43, 4632624: 43, 864304: 44, 1404976: 44, 3026992: 44, 4108336: 44, 880688: 45, 3043376: 45, 3584048: 45, 897072: 46, 3059760: 46, 913456: 47, 2535472: 47, 929840: 48, 2011184: 48, 946224: 49, 1486896: 49, 962608: 50, 13169200: 0, 13169712: 1, 13169728: 2, 13169744: 3, 13169760: 4, 13169248: 5, 12694064: 6, 12169776: 7, 13171248: 8, 11645488: 8, 12186160: 8, 13171264: 9, 11121200: 9, 12202544: 9, 10564144: 10, 13171280: 10, 10596912: 10, 12218928: 10, 10580528: 11, 13171296: 11, 10072624: 11, 10613296: 11, 12743216: 11, 12235312: 11, 13171312: 12, 9548336: 12, 10629680: 12, 13169296: 12, 12251696: 12, 13171328: 13, 9024048: 13, 10646064: 13, 13169808: 13, 12268080: 13, 13171344: 14, 8499760: 14, 10121776: 14, 10662448: 14, 13169824: 14, 11743792: 14, 12284464: 14, 13171360: 15, 7975472: 15, 9597488: 15, 10678832: 15, 13169840: 15, 11219504: 15, 12300848: 15, 13171376: 16, 7451184: 16, 9073200: 16, 10695216: 16, 13169856: 16, 12317232: 16, 13171392: 17, 6926896: 17, 7467568: 17, 8548912: 17, 9089584: 17, 13170368: 17, 11792944: 17, 12333616: 17, 13170880: 18, 13171408: 18, 6402608: 18, 7483952: 18, 8024624: 18, 9105968: 18, 11268656: 18, 12350000: 18, 13171424: 19, 5878320: 19, 7500336: 19, 9122352: 19, 10744368: 19, 12366384: 19, 13171440: 20, 5354032: 20, 6976048: 20, 9138736: 20, 10760752: 20, 12890672: 20, 12382768: 20, 13170928: 21, 13171456: 21, 4829744: 21, 6451760: 21, 9155120: 21, 10777136: 21, 13169440: 21, 12399152: 21, 13170416: 22, 13171472: 22, 4305456: 22, 5927472: 22, 9171504: 22, 10793520: 22, 13169952: 22, 12415536: 22, 13169904: 23, 13171488: 23, 3781168: 23, 4289072: 23, 5943856: 23, 9187888: 23, 10269232: 23, 10809904: 23, 13169936: 23, 11891248: 23, 12939824: 23, 13169920: 24, 13171504: 24, 3256880: 24, 4272688: 24, 5960240: 24, 9204272: 24, 9744944: 24, 10826288: 24, 11366960: 24, 13169488: 24, 13171520: 25, 2732592: 25, 5976624: 25, 9220656: 25, 10842672: 25, 13170000: 25, 13171536: 26, 2208304: 26, 2716208: 26, 2748976: 26, 5452336: 26, 5993008: 26, 8696368: 26, 10318384: 26, 10859056: 26, 13170016: 26, 13171552: 27, 1684016: 27, 2699824: 27, 2765360: 27, 4928048: 27, 6009392: 27, 8172080: 27, 9794096: 27, 10875440: 27, 13170032: 27, 13171568: 28, 1159728: 28, 2781744: 28, 4403760: 28, 6025776: 28, 7647792: 28, 9269808: 28, 10891824: 28, 13170048: 28, 13171584: 29, 635440: 29, 3306032: 29, 2798128: 29, 4387376: 29, 5501488: 29, 6042160: 29, 7123504: 29, 7664176: 29, 8745520: 29, 10908208: 29, 13169536: 29, 13170064: 29, 13171600: 30, 619056: 30, 651824: 30, 3830320: 30, 2814512: 30, 4370992: 30, 4977200: 30, 6058544: 30, 6599216: 30, 7680560: 30, 8221232: 30, 10924592: 30, 12988976: 30, 13170080: 30, 13171616: 31, 602672: 31, 668208: 31, 4354608: 31, 2830896: 31, 4452912: 31, 6074928: 31, 7696944: 31, 11448880: 31, 12464688: 31, 13170592: 31, 13171104: 32, 684592: 32, 2306608: 32, 2847280: 32, 4469296: 32, 7172656: 32, 11973168: 32, 12481072: 32, 700976: 33, 1782320: 33, 2863664: 33, 4485680: 33, 6648368: 33, 12497456: 33, 717360: 34, 1258032: 34, 2880048: 34, 4502064: 34, 6124080: 34, 733744: 35, 2355760: 35, 2896432: 35, 3977776: 35, 5599792: 35, 1831472: 36, 2912816: 36, 3453488: 36, 5075504: 36, 1307184: 37, 2929200: 37, 4551216: 37, 782896: 38, 2945584: 38, 4026928: 38, 4567600: 38, 799280: 39, 2961968: 39, 3502640: 39, 4583984: 39, 815664: 40, 2978352: 40, 4600368: 40, 832048: 41, 2454064: 41, 2994736: 41, 4616752: 41, 848432: 42, 1929776: 42, 3011120: 42, 4633136: 42, 864816: 43, 1405488: 43, 3027504: 43, 4108848: 43, 881200: 44, 3043888: 44, 3584560: 44, 897584: 45, 3060272: 45, 913968: 46, 2535984: 46, 930352: 47, 2011696: 47, 946736: 48, 1487408: 48, 963120: 49, 13694000: 0, 13694016: 1, 13694032: 2, 13694048: 3, 13218864: 4, 12694576: 5, 12170288: 6, 13695536: 7, 11646000: 7, 12186672: 7, 13695552: 8, 11121712: 8, 12203056: 8, 13695568: 9, 10597424: 9, 12219440: 9, 13695584: 10, 10073136: 10, 10581040: 10, 10613808: 10, 12743728: 10, 12235824: 10, 10564656: 11, 13695600: 11, 9548848: 11, 10630192: 11, 13268016: 11, 12252208: 11, 13695616: 12, 9024560: 12, 10646576: 12, 13694096: 12, 12268592: 12, 13695632: 13, 8500272: 13, 10122288: 13, 10662960: 13, 13694112: 13, 11744304: 13, 12284976: 13, 13695648: 14, 7975984: 14, 9598000: 14, 10679344: 14, 13694128: 14, 11220016: 14, 12301360: 14, 13695664: 15, 7451696: 15, 9073712: 15, 10695728: 15, 13694144: 15, 12317744: 15, 13695680: 16, 6927408: 16, 7468080: 16, 8549424: 16, 9090096: 16, 13694656: 16, 11793456: 16, 12334128: 16, 13695168: 17, 13695696: 17, 6403120: 17, 7484464: 17, 8025136: 17, 9106480: 17, 11269168: 17, 12350512: 17, 13695712: 18, 5878832: 18, 7500848: 18, 9122864: 18, 10744880: 18, 12366896: 18, 13695728: 19, 5354544: 19, 6976560: 19, 9139248: 19, 10761264: 19, 12891184: 19, 12383280: 19, 13695216: 20, 13695744: 20, 4830256: 20, 6452272: 20, 9155632: 20, 10777648: 20, 13415472: 20, 12399664: 20, 13694704: 21, 13695760: 21, 4305968: 21, 5927984: 21, 9172016: 21, 10794032: 21, 13694240: 21, 12416048: 21, 13694192: 22, 13695776: 22, 3781680: 22, 4289584: 22, 5944368: 22, 9188400: 22, 10269744: 22, 10810416: 22, 13694224: 22, 11891760: 22, 12940336: 22, 13694208: 23, 13695792: 23, 3257392: 23, 4273200: 23, 5960752: 23, 9204784: 23, 9745456: 23, 10826800: 23, 11367472: 23, 13464624: 23, 13695808: 24, 2733104: 24, 5977136: 24, 9221168: 24, 10843184: 24, 13694288: 24, 13695824: 25, 2208816: 25, 2716720: 25, 2749488: 25, 5452848: 25, 5993520: 25, 8696880: 25, 10318896: 25, 10859568: 25, 13694304: 25, 13695840: 26, 1684528: 26, 2700336: 26, 2765872: 26, 4928560: 26, 6009904: 26, 8172592: 26, 9794608: 26, 10875952: 26, 13694320: 26, 13695856: 27, 1160240: 27, 2782256: 27, 4404272: 27, 6026288: 27, 7648304: 27, 9270320: 27, 10892336: 27, 13694336: 27, 13695872: 28, 635952: 28, 3306544: 28, 2798640: 28, 4387888: 28, 5502000: 28, 6042672: 28, 7124016: 28, 7664688: 28, 8746032: 28, 10908720: 28, 13513776: 28, 13694352: 28, 13695888: 29, 619568: 29, 652336: 29, 3830832: 29, 2815024: 29, 4371504: 29, 4977712: 29, 6059056: 29, 6599728: 29, 7681072: 29, 8221744: 29, 10925104: 29, 12989488: 29, 13694368: 29, 13695904: 30, 603184: 30, 668720: 30, 4355120: 30, 2831408: 30, 4453424: 30, 6075440: 30, 7697456: 30, 11449392: 30, 12465200: 30, 13694880: 30, 13695392: 31, 685104: 31, 2307120: 31, 2847792: 31, 4469808: 31, 7173168: 31, 11973680: 31, 12481584: 31, 701488: 32, 1782832: 32, 2864176: 32, 4486192: 32, 6648880: 32, 12497968: 32, 717872: 33, 1258544: 33, 2880560: 33, 4502576: 33, 6124592: 33, 734256: 34, 2356272: 34, 2896944: 34, 3978288: 34, 5600304: 34, 1831984: 35, 2913328: 35, 3454000: 35, 5076016: 35, 1307696: 36, 2929712: 36, 4551728: 36, 783408: 37, 2946096: 37, 4027440: 37, 4568112: 37, 799792: 38, 2962480: 38, 3503152: 38, 4584496: 38, 816176: 39, 2978864: 39, 4600880: 39, 832560: 40, 2454576: 40, 2995248: 40, 4617264: 40, 848944: 41, 1930288: 41, 3011632: 41, 4633648: 41, 865328: 42, 1406000: 42, 3028016: 42, 4109360: 42, 881712: 43, 3044400: 43, 3585072: 43, 898096: 44, 3060784: 44, 914480: 45, 2536496: 45, 930864: 46, 2012208: 46, 947248: 47, 1487920: 47, 963632: 48, 15268400: 0, 15268416: 1, 15268432: 2, 15268448: 3, 15268464: 4, 15268480: 5, 15268496: 6, 15268512: 7, 13711920: 8, 15268528: 8, 13728304: 9, 15268544: 9, 13744688: 10, 14891568: 10, 15268560: 10, 13220400: 11, 14367280: 11, 15268576: 11, 12696112: 12, 13842992: 12, 15268592: 12, 12171824: 13, 13826608: 13, 14940720: 13, 15268608: 13, 11647536: 14, 12188208: 14, 13810224: 14, 14416432: 14, 15268624: 14, 11123248: 15, 12204592: 15, 13793840: 15, 13892144: 15, 15268640: 15, 10598960: 16, 12220976: 16, 13269552: 16, 13908528: 16, 15268656: 16, 10074672: 17, 10582576: 17, 10615344: 17, 12745264: 17, 12237360: 17, 13924912: 17, 15268672: 17, 10566192: 18, 9550384: 18, 10631728: 18, 12253744: 18, 13941296: 18, 15268688: 18, 9026096: 19, 10648112: 19, 12270128: 19, 13417008: 19, 15268704: 19, 8501808: 20, 10123824: 20, 10664496: 20, 11745840: 20, 12286512: 20, 12892720: 20, 15268720: 20, 7977520: 21, 9599536: 21, 10680880: 21, 11221552: 21, 12302896: 21, 12368432: 21, 15268736: 21, 7453232: 22, 9075248: 22, 10697264: 22, 12319280: 22, 12352048: 22, 12384816: 22, 15268752: 22, 6928944: 23, 7469616: 23, 8550960: 23, 9091632: 23, 11794992: 23, 12335664: 23, 12401200: 23, 15268768: 23, 6404656: 24, 7486000: 24, 8026672: 24, 9108016: 24, 11270704: 24, 12417584: 24, 15120944: 24, 5880368: 25, 7502384: 25, 9124400: 25, 10746416: 25, 11893296: 25, 12941872: 25, 14596656: 25, 5356080: 26, 6978096: 26, 9140784: 26, 10762800: 26, 11369008: 26, 13466160: 26, 14072368: 26, 4831792: 27, 6453808: 27, 9157168: 27, 10779184: 27, 10844720: 27, 13990448: 27, 14055984: 27, 4307504: 28, 5929520: 28, 9173552: 28, 10795568: 28, 10320432: 28, 10828336: 28, 10861104: 28, 14006832: 28, 14039600: 28, 3783216: 29, 4291120: 29, 5945904: 29, 9189936: 29, 10271280: 29, 10811952: 29, 9796144: 29, 10877488: 29, 14023216: 29, 13515312: 29, 3258928: 30, 4274736: 30, 5962288: 30, 9206320: 30, 9746992: 30, 9271856: 30, 10893872: 30, 12991024: 30, 2734640: 31, 5978672: 31, 9222704: 31, 8747568: 31, 10910256: 31, 12466736: 31, 2210352: 32, 2718256: 32, 2751024: 32, 5454384: 32, 5995056: 32, 8698416: 32, 8223280: 32, 10926640: 32, 12483120: 32, 1686064: 33, 2701872: 33, 2767408: 33, 4930096: 33, 6011440: 33, 8174128: 33, 7698992: 33, 11450928: 33, 12499504: 33, 1161776: 34, 2783792: 34, 4405808: 34, 6027824: 34, 7649840: 34, 7174704: 34, 7682608: 34, 11975216: 34, 637488: 35, 3308080: 35, 2800176: 35, 4389424: 35, 5503536: 35, 6044208: 35, 7125552: 35, 7666224: 35, 6650416: 35, 621104: 36, 653872: 36, 3832368: 36, 2816560: 36, 4373040: 36, 4979248: 36, 6060592: 36, 6601264: 36, 6126128: 36, 604720: 37, 670256: 37, 4356656: 37, 2832944: 37, 4454960: 37, 6076976: 37, 5601840: 37, 686640: 38, 2308656: 38, 2849328: 38, 4471344: 38, 5077552: 38, 703024: 39, 1784368: 39, 2865712: 39, 4487728: 39, 4553264: 39, 719408: 40, 1260080: 40, 2882096: 40, 4504112: 40, 4028976: 40, 4569648: 40, 735792: 41, 2357808: 41, 2898480: 41, 3979824: 41, 3504688: 41, 4586032: 41, 1833520: 42, 2914864: 42, 3455536: 42, 2980400: 42, 4602416: 42, 1309232: 43, 2931248: 43, 2456112: 43, 2964016: 43, 2996784: 43, 4618800: 43, 784944: 44, 2947632: 44, 1931824: 44, 3013168: 44, 4635184: 44, 801328: 45, 1407536: 45, 3029552: 45, 4110896: 45, 817712: 46, 883248: 46, 3045936: 46, 3586608: 46, 834096: 47, 866864: 47, 899632: 47, 3062320: 47, 850480: 48, 916016: 48, 2538032: 48, 932400: 49, 2013744: 49, 948784: 50, 1489456: 50, 965168: 51, 590400: 0, 590416: 1, 590432: 2, 590944: 3, 590448: 3, 591456: 4, 590464: 4, 591968: 5, 590480: 5, 592480: 6, 590496: 6, 592464: 7, 592992: 7, 592496: 7, 590512: 7, 592448: 8, 593504: 8, 592512: 8, 590528: 8, 594016: 9, 592528: 9, 591040: 9, 594000: 10, 594528: 10, 593040: 10, 592544: 10, 591552: 10, 593984: 11, 595040: 11, 593552: 11, 592560: 11, 592064: 11, 595552: 12, 594064: 12, 592576: 12, 596064: 13, 594080: 13, 592592: 13, 596576: 14, 594096: 14, 592608: 14, 597088: 15, 594112: 15, 592624: 15, 597600: 16, 597104: 16, 594624: 16, 592112: 16, 592640: 16, 598112: 17, 597120: 17, 595136: 17, 591600: 17, 592656: 17, 598624: 18, 597136: 18, 595648: 18, 591088: 18, 592672: 18, 599136: 19, 596624: 19, 597648: 19, 595632: 19, 595664: 19, 590576: 19, 593184: 19, 592688: 19, 599648: 20, 596112: 20, 598160: 20, 595616: 20, 595680: 20, 590592: 20, 593696: 20, 592704: 20, 600160: 21, 595600: 21, 598672: 21, 595696: 21, 590608: 21, 594208: 21, 592720: 21, 600144: 22, 600672: 22, 600176: 22, 599184: 22, 598688: 22, 595184: 22, 595712: 22, 590624: 22, 594192: 22, 592208: 22, 593232: 22, 592736: 22, 600128: 23, 601184: 23, 600192: 23, 599696: 23, 598704: 23, 594672: 23, 595728: 23, 590640: 23, 594176: 23, 591696: 23, 593744: 23, 592752: 23, 601696: 24, 600208: 24, 598720: 24, 594160: 24, 595744: 24, 590656: 24, 591184: 24, 594256: 24, 592768: 24, 602208: 25, 601712: 25, 600224: 25, 598736: 25, 596256: 25, 590672: 25, 594768: 25, 594272: 25, 592784: 25, 602720: 26, 601728: 26, 600240: 26, 598752: 26, 596768: 26, 590688: 26, 595280: 26, 594288: 26, 592800: 26, 603232: 27, 601744: 27, 600256: 27, 598768: 27, 597280: 27, 590704: 27, 595792: 27, 594304: 27, 592288: 27, 593312: 27, 603216: 28, 602256: 28, 601760: 28, 600768: 28, 598784: 28, 597792: 28, 597296: 28, 590720: 28, 596304: 28, 594320: 28, 591776: 28, 593824: 28, 603200: 29, 602768: 29, 601776: 29, 601280: 29, 598800: 29, 598304: 29, 597312: 29, 590736: 29, 596816: 29, 594336: 29, 591264: 29, 603280: 30, 601792: 30, 598816: 30, 597328: 30, 590752: 30, 603296: 31, 601808: 31, 599328: 31, 597840: 31, 603312: 32, 601824: 32, 599840: 32, 598352: 32, 603328: 33, 601840: 33, 600352: 33, 598864: 33, 603840: 34, 601328: 34, 601856: 34, 600336: 34, 600368: 34, 599376: 34, 604352: 35, 600816: 35, 601872: 35, 600320: 35, 600384: 35, 599888: 35, 604864: 36, 600304: 36, 601888: 36, 600400: 36, 604848: 37, 604880: 37, 602400: 37, 601904: 37, 600912: 37, 600416: 37, 604736: 38, 604832: 38, 604896: 38, 602912: 38, 601920: 38, 601424: 38, 600432: 38, 604752: 39, 604816: 39, 604912: 39, 603424: 39, 601936: 39, 600448: 39, 604768: 40, 604800: 40, 604400: 40, 604928: 40, 603408: 40, 602448: 40, 600464: 40, 604784: 41, 603888: 41, 604944: 41, 603392: 41, 602960: 41, 600480: 41, 603376: 42, 604960: 42, 603472: 42, 600992: 42, 604976: 43, 603488: 43, 601504: 43, 604992: 44, 603504: 44, 602016: 44, 605008: 45, 603520: 45, 602000: 45, 605024: 46, 603008: 46, 603536: 46, 601984: 46, 605040: 47, 602496: 47, 603552: 47, 605056: 48, 604064: 48, 605072: 49, 604576: 49, 605088: 50, 2689600: 0, 2689616: 1, 2689632: 2, 2198080: 3, 2690144: 3, 2689648: 3, 1673792: 4, 2690656: 4, 2689664: 4, 1149504: 5, 2691168: 5, 2689680: 5, 625216: 6, 2691152: 6, 2691680: 6, 2690192: 6, 2689696: 6, 608832: 7, 641600: 7, 2691136: 7, 2692192: 7, 2690704: 7, 2689712: 7, 657984: 8, 2692704: 8, 2691216: 8, 2689728: 8, 674368: 9, 2693216: 9, 2691232: 9, 2296384: 9, 2689744: 9, 690752: 10, 2693728: 10, 2691248: 10, 1772096: 10, 2689760: 10, 707136: 11, 2694240: 11, 2691264: 11, 1247808: 11, 2689776: 11, 723520: 12, 2694752: 12, 2694256: 12, 2691776: 12, 2345536: 12, 2689792: 12, 2695264: 13, 2694272: 13, 2692288: 13, 1821248: 13, 2689808: 13, 2695776: 14, 2694288: 14, 2692800: 14, 1296960: 14, 2689824: 14, 2696288: 15, 2693776: 15, 2694800: 15, 2692784: 15, 2692816: 15, 772672: 15, 2690336: 15, 2689840: 15, 2696800: 16, 2693264: 16, 2695312: 16, 2692768: 16, 2692832: 16, 789056: 16, 2690848: 16, 2689856: 16, 2697312: 17, 2692752: 17, 2695824: 17, 2692848: 17, 805440: 17, 2691360: 17, 2689872: 17, 2697296: 18, 2697824: 18, 2697328: 18, 2696336: 18, 2695840: 18, 2692336: 18, 2692864: 18, 821824: 18, 2691344: 18, 2443840: 18, 2690384: 18, 2689888: 18, 2697280: 19, 2698336: 19, 2697344: 19, 2696848: 19, 2695856: 19, 2691824: 19, 2692880: 19, 838208: 19, 2691328: 19, 1919552: 19, 2690896: 19, 2689904: 19, 2698848: 20, 2697360: 20, 2695872: 20, 2691312: 20, 2692896: 20, 854592: 20, 1395264: 20, 2691408: 20, 2689920: 20, 2699360: 21, 2698864: 21, 2697376: 21, 2695888: 21, 2693408: 21, 870976: 21, 2691920: 21, 2691424: 21, 2689936: 21, 2699872: 22, 2698880: 22, 2697392: 22, 2695904: 22, 2693920: 22, 887360: 22, 2692432: 22, 2691440: 22, 2689952: 22, 2700384: 23, 2698896: 23, 2697408: 23, 2695920: 23, 2694432: 23, 903744: 23, 2692944: 23, 2691456: 23, 2525760: 23, 2690464: 23, 2700368: 24, 2699408: 24, 2698912: 24, 2697920: 24, 2695936: 24, 2694944: 24, 2694448: 24, 920128: 24, 2693456: 24, 2691472: 24, 2001472: 24, 2690976: 24, 2700352: 25, 2699920: 25, 2698928: 25, 2698432: 25, 2695952: 25, 2695456: 25, 2694464: 25, 936512: 25, 2693968: 25, 2691488: 25, 1477184: 25, 2700432: 26, 2698944: 26, 2695968: 26, 2694480: 26, 952896: 26, 2700448: 27, 2698960: 27, 2696480: 27, 2694992: 27, 2700464: 28, 2698976: 28, 2696992: 28, 2695504: 28, 2700480: 29, 2698992: 29, 2697504: 29, 2696016: 29, 2700992: 30, 2698480: 30, 2699008: 30, 2697488: 30, 2697520: 30, 2696528: 30, 2701504: 31, 2697968: 31, 2699024: 31, 2697472: 31, 2697536: 31, 2697040: 31, 2702016: 32, 2697456: 32, 2699040: 32, 2697552: 32, 2702000: 33, 2702032: 33, 2699552: 33, 2699056: 33, 2698064: 33, 2697568: 33, 2701888: 34, 2701984: 34, 2702048: 34, 2700064: 34, 2699072: 34, 2698576: 34, 2697584: 34, 2701904: 35, 2701968: 35, 2702064: 35, 2700576: 35, 2699088: 35, 2697600: 35, 2701920: 36, 2701952: 36, 2701552: 36, 2702080: 36, 2700560: 36, 2699600: 36, 2697616: 36, 2701936: 37, 2701040: 37, 2702096: 37, 2700544: 37, 2700112: 37, 2697632: 37, 2700528: 38, 2702112: 38, 2700624: 38, 2698144: 38, 2702128: 39, 2700640: 39, 2698656: 39, 2702144: 40, 2700656: 40, 2699168: 40, 2702160: 41, 2700672: 41, 2699152: 41, 2702176: 42, 2700160: 42, 2700688: 42, 2699136: 42, 2702192: 43, 2699648: 43, 2700704: 43, 2702208: 44, 2701216: 44, 2702224: 45, 2701728: 45, 2702240: 46, 4264000: 0, 4264016: 1, 4264032: 2, 3772480: 3, 4264544: 3, 3248192: 4, 4265056: 4, 2723904: 5, 4265568: 5, 2199616: 6, 2707520: 6, 2740288: 6, 4266080: 6, 1675328: 7, 2756672: 7, 4266592: 7, 1151040: 8, 2773056: 8, 4267104: 8, 626752: 9, 3297344: 9, 2789440: 9, 4267616: 9, 4267120: 9, 610368: 10, 643136: 10, 3821632: 10, 2805824: 10, 4268128: 10, 4267136: 10, 659520: 11, 4264080: 11, 2822208: 11, 4268640: 11, 4267152: 11, 675904: 12, 4264096: 12, 2297920: 12, 2838592: 12, 4269152: 12, 4266640: 12, 4267664: 12, 692288: 13, 4264112: 13, 1773632: 13, 2854976: 13, 4269664: 13, 4266128: 13, 4268176: 13, 708672: 14, 4264128: 14, 1249344: 14, 2871360: 14, 4270176: 14, 4265616: 14, 4268688: 14, 725056: 15, 4264640: 15, 2347072: 15, 2887744: 15, 4270160: 15, 4270688: 15, 4270192: 15, 4265632: 15, 4269200: 15, 4268704: 15, 4265152: 16, 1822784: 16, 2904128: 16, 4270144: 16, 4271200: 16, 4270208: 16, 4265648: 16, 4269712: 16, 4268720: 16, 4265664: 17, 1298496: 17, 2920512: 17, 4271712: 17, 4270224: 17, 4268736: 17, 4265680: 18, 774208: 18, 3444800: 18, 2936896: 18, 4272224: 18, 4271728: 18, 4270240: 18, 4268752: 18, 4265696: 19, 790592: 19, 3969088: 19, 2953280: 19, 4272736: 19, 4271744: 19, 4270256: 19, 4268768: 19, 4265712: 20, 806976: 20, 4264224: 20, 2969664: 20, 4273248: 20, 4271760: 20, 4270272: 20, 4268784: 20, 4265200: 21, 4265728: 21, 823360: 21, 4264208: 21, 2445376: 21, 3493952: 21, 2986048: 21, 4273232: 21, 4272272: 21, 4271776: 21, 4270784: 21, 4268800: 21, 4264688: 22, 4265744: 22, 839744: 22, 4264192: 22, 1921088: 22, 4018240: 22, 3002432: 22, 4273216: 22, 4272784: 22, 4271792: 22, 4271296: 22, 4268816: 22, 4264176: 23, 4265760: 23, 856128: 23, 1396800: 23, 4264272: 23, 3018816: 23, 4273296: 23, 4271808: 23, 4268832: 23, 4266272: 24, 872512: 24, 4264784: 24, 4264288: 24, 3035200: 24, 4273312: 24, 4271824: 24, 4268320: 24, 4269344: 24, 4266784: 25, 888896: 25, 4265296: 25, 4264304: 25, 3051584: 25, 4273328: 25, 4271840: 25, 4267808: 25, 4269856: 25, 4267296: 26, 905280: 26, 4265808: 26, 4264320: 26, 2527296: 26, 3575872: 26, 4273344: 26, 4271856: 26, 4270368: 26, 4267312: 27, 921664: 27, 4266320: 27, 4264336: 27, 2003008: 27, 4100160: 27, 4273856: 27, 4271344: 27, 4271872: 27, 4270352: 27, 4270384: 27, 4267328: 28, 938048: 28, 4266832: 28, 4264352: 28, 1478720: 28, 4274368: 28, 4270832: 28, 4271888: 28, 4270336: 28, 4270400: 28, 4267344: 29, 954432: 29, 4274880: 29, 4270320: 29, 4271904: 29, 4270416: 29, 4267856: 30, 4274864: 30, 4274896: 30, 4272416: 30, 4271920: 30, 4269904: 30, 4270928: 30, 4270432: 30, 4268368: 31, 4274752: 31, 4274848: 31, 4274912: 31, 4272928: 31, 4271936: 31, 4269392: 31, 4271440: 31, 4270448: 31, 4268880: 32, 4274768: 32, 4274832: 32, 4274928: 32, 4273440: 32, 4271952: 32, 4270464: 32, 4274784: 33, 4274816: 33, 4274416: 33, 4274944: 33, 4273424: 33, 4272464: 33, 4270480: 33, 4274800: 34, 4273904: 34, 4274960: 34, 4273408: 34, 4272976: 34, 4270496: 34, 4273392: 35, 4274976: 35, 4273488: 35, 4271008: 35, 4274992: 36, 4273504: 36, 4271520: 36, 4275008: 37, 4273520: 37, 4272032: 37, 4275024: 38, 4273536: 38, 4272016: 38, 4275040: 39, 4273024: 39, 4273552: 39, 4272000: 39, 4275056: 40, 4272512: 40, 4273568: 40, 4275072: 41, 4274080: 41, 4275088: 42, 4274592: 42, 4275104: 43, 10561600: 0, 10561616: 1, 10561632: 2, 10070080: 3, 10562144: 3, 10561648: 3, 9545792: 4, 10562656: 4, 10561664: 4, 9021504: 5, 10563168: 5, 10561680: 5, 8497216: 6, 10563680: 6, 10563184: 6, 10119232: 6, 10561696: 6, 7972928: 7, 10564192: 7, 10563200: 7, 9594944: 7, 10561712: 7, 7448640: 8, 10564704: 8, 10563216: 8, 9070656: 8, 10561728: 8, 6924352: 9, 7465024: 9, 10564688: 9, 10563728: 9, 10563232: 9, 8546368: 9, 9087040: 9, 10562240: 9, 6400064: 10, 7481408: 10, 10564672: 10, 10564240: 10, 10563248: 10, 8022080: 10, 9103424: 10, 10562752: 10, 5875776: 11, 7497792: 11, 10564752: 11, 10563264: 11, 9119808: 11, 5351488: 12, 6973504: 12, 10564768: 12, 10563280: 12, 9136192: 12, 4827200: 13, 6449216: 13, 10564784: 13, 10563296: 13, 9152576: 13, 4302912: 14, 5924928: 14, 10564800: 14, 10563312: 14, 9168960: 14, 3778624: 15, 4286528: 15, 5941312: 15, 10565312: 15, 10562800: 15, 10563328: 15, 9185344: 15, 3254336: 16, 5957696: 16, 10565824: 16, 10562288: 16, 10563344: 16, 9201728: 16, 2730048: 17, 5974080: 17, 10566336: 17, 10561776: 17, 10563360: 17, 9218112: 17, 2205760: 18, 2713664: 18, 2746432: 18, 5449792: 18, 5990464: 18, 10566320: 18, 10566352: 18, 10561792: 18, 10563872: 18, 10563376: 18, 8693824: 18, 9742400: 18, 10566208: 19, 1681472: 19, 2762816: 19, 4925504: 19, 6006848: 19, 10566304: 19, 10566368: 19, 10561808: 19, 10564384: 19, 10563392: 19, 8169536: 19, 10266688: 19, 10566224: 20, 1157184: 20, 2779200: 20, 4401216: 20, 6023232: 20, 10566288: 20, 10566384: 20, 10561824: 20, 10564896: 20, 10563408: 20, 7645248: 20, 10566240: 21, 632896: 21, 3303488: 21, 2795584: 21, 4384832: 21, 5498944: 21, 6039616: 21, 10566272: 21, 10565872: 21, 10566400: 21, 10561840: 21, 10564880: 21, 10562896: 21, 10563920: 21, 7120960: 21, 7661632: 21, 10566256: 22, 616512: 22, 649280: 22, 3827776: 22, 2811968: 22, 4368448: 22, 4974656: 22, 6056000: 22, 10565360: 22, 10566416: 22, 10561856: 22, 10564864: 22, 10562384: 22, 10564432: 22, 6596672: 22, 7678016: 22, 665664: 23, 4352064: 23, 2828352: 23, 4450368: 23, 6072384: 23, 10564848: 23, 10566432: 23, 10561872: 23, 10564944: 23, 7694400: 23, 682048: 24, 2304064: 24, 2844736: 24, 4466752: 24, 10566448: 24, 10315840: 24, 10561888: 24, 10564960: 24, 7170112: 24, 8218688: 24, 698432: 25, 1779776: 25, 2861120: 25, 4483136: 25, 10566464: 25, 9791552: 25, 10561904: 25, 10564976: 25, 6645824: 25, 8742976: 25, 714816: 26, 1255488: 26, 2877504: 26, 4499520: 26, 10566480: 26, 9267264: 26, 10561920: 26, 10564992: 26, 6121536: 26, 731200: 27, 2353216: 27, 2893888: 27, 3975232: 27, 10566496: 27, 10561936: 27, 10564480: 27, 10565008: 27, 5597248: 27, 1828928: 28, 2910272: 28, 3450944: 28, 10566512: 28, 10561952: 28, 10563968: 28, 10565024: 28, 5072960: 28, 1304640: 29, 2926656: 29, 10566528: 29, 10562464: 29, 10563456: 29, 10565536: 29, 4548672: 29, 780352: 30, 2943040: 30, 10566544: 30, 10562976: 30, 10563472: 30, 10566048: 30, 4024384: 30, 4565056: 30, 796736: 31, 2959424: 31, 10566560: 31, 10563488: 31, 3500096: 31, 4581440: 31, 813120: 32, 2975808: 32, 4597824: 32, 829504: 33, 2451520: 33, 2992192: 33, 4614208: 33, 845888: 34, 1927232: 34, 3008576: 34, 4630592: 34, 862272: 35, 1402944: 35, 3024960: 35, 4106304: 35, 878656: 36, 3041344: 36, 3582016: 36, 895040: 37, 3057728: 37, 911424: 38, 2533440: 38, 927808: 39, 2009152: 39, 944192: 40, 1484864: 40, 960576: 41, 13710400: 0, 13710416: 1, 13710432: 2, 13218880: 3, 12694592: 4, 12170304: 5, 11646016: 6, 12186688: 6, 11121728: 7, 12203072: 7, 10597440: 8, 12219456: 8, 13711936: 9, 10073152: 9, 10581056: 9, 10613824: 9, 12743744: 9, 12235840: 9, 13711952: 10, 9548864: 10, 10630208: 10, 13268032: 10, 12252224: 10, 13711968: 11, 9024576: 11, 10646592: 11, 13710480: 11, 12268608: 11, 13711984: 12, 8500288: 12, 10122304: 12, 10662976: 12, 13710496: 12, 11744320: 12, 12284992: 12, 13712000: 13, 7976000: 13, 9598016: 13, 10679360: 13, 13710512: 13, 11220032: 13, 12301376: 13, 13712016: 14, 7451712: 14, 9073728: 14, 10695744: 14, 13710528: 14, 12317760: 14, 13712032: 15, 6927424: 15, 7468096: 15, 8549440: 15, 9090112: 15, 13711040: 15, 11793472: 15, 12334144: 15, 13712048: 16, 6403136: 16, 7484480: 16, 8025152: 16, 9106496: 16, 13711552: 16, 11269184: 16, 12350528: 16, 13712064: 17, 5878848: 17, 7500864: 17, 9122880: 17, 10744896: 17, 12366912: 17, 13712080: 18, 5354560: 18, 6976576: 18, 9139264: 18, 10761280: 18, 12891200: 18, 12383296: 18, 13712096: 19, 4830272: 19, 6452288: 19, 9155648: 19, 10777664: 19, 13415488: 19, 12399680: 19, 13712112: 20, 4305984: 20, 5928000: 20, 9172032: 20, 10794048: 20, 13710624: 20, 12416064: 20, 13711600: 21, 13712128: 21, 3781696: 21, 4289600: 21, 5944384: 21, 9188416: 21, 10269760: 21, 10810432: 21, 13710608: 21, 11891776: 21, 12940352: 21, 13711088: 22, 13712144: 22, 3257408: 22, 5960768: 22, 9204800: 22, 9745472: 22, 10826816: 22, 13710592: 22, 11367488: 22, 13464640: 22, 13710576: 23, 13712160: 23, 2733120: 23, 5977152: 23, 9221184: 23, 10843200: 23, 13710672: 23, 13712176: 24, 2208832: 24, 2716736: 24, 2749504: 24, 5452864: 24, 5993536: 24, 8696896: 24, 10318912: 24, 10859584: 24, 13710688: 24, 13712192: 25, 1684544: 25, 2765888: 25, 4928576: 25, 6009920: 25, 8172608: 25, 9794624: 25, 10875968: 25, 13710704: 25, 13712208: 26, 1160256: 26, 2782272: 26, 4404288: 26, 6026304: 26, 7648320: 26, 9270336: 26, 10892352: 26, 13710720: 26, 13712224: 27, 635968: 27, 3306560: 27, 2798656: 27, 4387904: 27, 5502016: 27, 6042688: 27, 7124032: 27, 7664704: 27, 8746048: 27, 10908736: 27, 13513792: 27, 13710736: 27, 13712240: 28, 619584: 28, 652352: 28, 3830848: 28, 2815040: 28, 4371520: 28, 4977728: 28, 6059072: 28, 6599744: 28, 7681088: 28, 8221760: 28, 10925120: 28, 12989504: 28, 13710752: 28, 13712256: 29, 668736: 29, 4355136: 29, 2831424: 29, 4453440: 29, 6075456: 29, 7697472: 29, 11449408: 29, 12465216: 29, 13711264: 29, 13712272: 30, 685120: 30, 2307136: 30, 2847808: 30, 4469824: 30, 7173184: 30, 11973696: 30, 12481600: 30, 13711776: 30, 13712288: 31, 701504: 31, 1782848: 31, 2864192: 31, 4486208: 31, 6648896: 31, 12497984: 31, 717888: 32, 1258560: 32, 2880576: 32, 4502592: 32, 6124608: 32, 734272: 33, 2356288: 33, 2896960: 33, 3978304: 33, 5600320: 33, 1832000: 34, 2913344: 34, 3454016: 34, 5076032: 34, 1307712: 35, 2929728: 35, 4551744: 35, 783424: 36, 2946112: 36, 4027456: 36, 4568128: 36, 799808: 37, 2962496: 37, 3503168: 37, 4584512: 37, 816192: 38, 2978880: 38, 4600896: 38, 832576: 39, 2454592: 39, 2995264: 39, 4617280: 39, 848960: 40, 1930304: 40, 3011648: 40, 4633664: 40, 865344: 41, 1406016: 41, 3028032: 41, 4109376: 41, 881728: 42, 3044416: 42, 3585088: 42, 898112: 43, 3060800: 43, 914496: 44, 2536512: 44, 930880: 45, 2012224: 45, 947264: 46, 1487936: 46, 963648: 47, 15284800: 0, 15284816: 1, 15284832: 2, 15284848: 3, 15284864: 4, 15284880: 5, 15284896: 6, 15284912: 7, 15284928: 8, 14891584: 9, 15284944: 9, 13728320: 10, 14367296: 10, 15284960: 10, 13744704: 11, 13843008: 11, 15284976: 11, 13220416: 12, 13826624: 12, 14940736: 12, 15284992: 12, 12696128: 13, 13810240: 13, 14416448: 13, 15285008: 13, 12171840: 14, 13793856: 14, 13892160: 14, 15285024: 14, 11647552: 15, 12188224: 15, 13269568: 15, 13908544: 15, 15285040: 15, 11123264: 16, 12204608: 16, 12745280: 16, 13924928: 16, 15285056: 16, 10598976: 17, 12220992: 17, 13941312: 17, 15285072: 17, 10074688: 18, 10582592: 18, 10615360: 18, 12237376: 18, 13417024: 18, 15285088: 18, 9550400: 19, 10631744: 19, 12253760: 19, 12892736: 19, 15285104: 19, 9026112: 20, 10648128: 20, 12270144: 20, 12368448: 20, 15285120: 20, 8501824: 21, 10123840: 21, 10664512: 21, 11745856: 21, 12286528: 21, 12352064: 21, 12384832: 21, 15285136: 21, 7977536: 22, 9599552: 22, 10680896: 22, 11221568: 22, 12302912: 22, 12335680: 22, 12401216: 22, 15285152: 22, 7453248: 23, 9075264: 23, 10697280: 23, 12319296: 23, 12417600: 23, 15120960: 23, 6928960: 24, 7469632: 24, 8550976: 24, 9091648: 24, 11795008: 24, 11893312: 24, 12941888: 24, 14596672: 24, 6404672: 25, 7486016: 25, 8026688: 25, 9108032: 25, 11270720: 25, 11369024: 25, 13466176: 25, 14072384: 25, 5880384: 26, 7502400: 26, 9124416: 26, 10746432: 26, 10844736: 26, 13990464: 26, 14056000: 26, 5356096: 27, 6978112: 27, 9140800: 27, 10762816: 27, 10320448: 27, 10828352: 27, 10861120: 27, 14006848: 27, 14039616: 27, 4831808: 28, 6453824: 28, 9157184: 28, 10779200: 28, 9796160: 28, 10811968: 28, 10877504: 28, 14023232: 28, 13515328: 28, 4307520: 29, 5929536: 29, 9173568: 29, 10795584: 29, 9271872: 29, 10893888: 29, 12991040: 29, 3783232: 30, 4291136: 30, 5945920: 30, 9189952: 30, 10271296: 30, 8747584: 30, 10910272: 30, 12466752: 30, 3258944: 31, 5962304: 31, 9206336: 31, 9747008: 31, 8223296: 31, 10926656: 31, 12483136: 31, 2734656: 32, 5978688: 32, 9222720: 32, 7699008: 32, 11450944: 32, 12499520: 32, 2210368: 33, 2718272: 33, 2751040: 33, 5454400: 33, 5995072: 33, 8698432: 33, 7174720: 33, 7682624: 33, 11975232: 33, 1686080: 34, 2767424: 34, 4930112: 34, 6011456: 34, 8174144: 34, 6650432: 34, 7666240: 34, 1161792: 35, 2783808: 35, 4405824: 35, 6027840: 35, 7649856: 35, 6126144: 35, 637504: 36, 3308096: 36, 2800192: 36, 4389440: 36, 5503552: 36, 6044224: 36, 7125568: 36, 5601856: 36, 621120: 37, 653888: 37, 3832384: 37, 2816576: 37, 4373056: 37, 4979264: 37, 6060608: 37, 6601280: 37, 5077568: 37, 670272: 38, 4356672: 38, 2832960: 38, 4454976: 38, 6076992: 38, 4553280: 38, 686656: 39, 2308672: 39, 2849344: 39, 4471360: 39, 4028992: 39, 4569664: 39, 703040: 40, 1784384: 40, 2865728: 40, 4487744: 40, 3504704: 40, 4586048: 40, 719424: 41, 1260096: 41, 2882112: 41, 4504128: 41, 2980416: 41, 4602432: 41, 735808: 42, 2357824: 42, 2898496: 42, 3979840: 42, 2456128: 42, 2964032: 42, 2996800: 42, 4618816: 42, 1833536: 43, 2914880: 43, 3455552: 43, 1931840: 43, 2947648: 43, 3013184: 43, 4635200: 43, 1309248: 44, 2931264: 44, 1407552: 44, 3029568: 44, 4110912: 44, 784960: 45, 883264: 45, 3045952: 45, 3586624: 45, 801344: 46, 866880: 46, 899648: 46, 3062336: 46, 817728: 47, 850496: 47, 916032: 47, 2538048: 47, 834112: 48, 932416: 48, 2013760: 48, 948800: 49, 1489472: 49, 965184: 50, 606800: 0, 606816: 1, 607328: 2, 606832: 2, 607840: 3, 606848: 3, 608352: 4, 606864: 4, 608864: 5, 606880: 5, 608848: 6, 609376: 6, 608880: 6, 606896: 6, 609888: 7, 608896: 7, 606912: 7, 610400: 8, 608912: 8, 607424: 8, 610384: 9, 610912: 9, 609424: 9, 608928: 9, 607936: 9, 611424: 10, 609936: 10, 608944: 10, 608448: 10, 611936: 11, 610448: 11, 608960: 11, 612448: 12, 610464: 12, 608976: 12, 612960: 13, 610480: 13, 608992: 13, 613472: 14, 610496: 14, 609008: 14, 613984: 15, 613488: 15, 611008: 15, 608496: 15, 609024: 15, 614496: 16, 613504: 16, 611520: 16, 607984: 16, 609040: 16, 615008: 17, 613520: 17, 612032: 17, 607472: 17, 609056: 17, 615520: 18, 613008: 18, 614032: 18, 612016: 18, 612048: 18, 606960: 18, 609568: 18, 609072: 18, 616032: 19, 612496: 19, 614544: 19, 612000: 19, 612064: 19, 606976: 19, 610080: 19, 609088: 19, 616544: 20, 611984: 20, 615056: 20, 612080: 20, 606992: 20, 610592: 20, 609104: 20, 616528: 21, 617056: 21, 616560: 21, 615568: 21, 615072: 21, 611568: 21, 612096: 21, 607008: 21, 610576: 21, 608592: 21, 609616: 21, 609120: 21, 617568: 22, 616576: 22, 616080: 22, 615088: 22, 611056: 22, 612112: 22, 607024: 22, 610560: 22, 608080: 22, 610128: 22, 609136: 22, 618080: 23, 616592: 23, 615104: 23, 610544: 23, 612128: 23, 607040: 23, 607568: 23, 610640: 23, 609152: 23, 618592: 24, 618096: 24, 616608: 24, 615120: 24, 612640: 24, 607056: 24, 611152: 24, 610656: 24, 609168: 24, 619104: 25, 618112: 25, 616624: 25, 615136: 25, 613152: 25, 607072: 25, 611664: 25, 610672: 25, 609184: 25, 619616: 26, 618128: 26, 616640: 26, 615152: 26, 613664: 26, 607088: 26, 612176: 26, 610688: 26, 608672: 26, 609696: 26, 619600: 27, 618640: 27, 618144: 27, 617152: 27, 615168: 27, 614176: 27, 613680: 27, 607104: 27, 612688: 27, 610704: 27, 608160: 27, 610208: 27, 619152: 28, 618160: 28, 617664: 28, 615184: 28, 614688: 28, 613696: 28, 607120: 28, 613200: 28, 610720: 28, 607648: 28, 619664: 29, 618176: 29, 615200: 29, 613712: 29, 607136: 29, 619680: 30, 618192: 30, 615712: 30, 614224: 30, 619696: 31, 618208: 31, 616224: 31, 614736: 31, 619712: 32, 618224: 32, 616736: 32, 615248: 32, 620224: 33, 617712: 33, 618240: 33, 616720: 33, 616752: 33, 615760: 33, 620736: 34, 617200: 34, 618256: 34, 616704: 34, 616768: 34, 616272: 34, 621248: 35, 616688: 35, 618272: 35, 616784: 35, 621232: 36, 621264: 36, 618784: 36, 618288: 36, 617296: 36, 616800: 36, 621216: 37, 621280: 37, 619296: 37, 618304: 37, 617808: 37, 616816: 37, 621136: 38, 621200: 38, 621296: 38, 619808: 38, 618320: 38, 616832: 38, 621152: 39, 621184: 39, 620784: 39, 621312: 39, 619792: 39, 618832: 39, 616848: 39, 621168: 40, 620272: 40, 621328: 40, 619776: 40, 619344: 40, 616864: 40, 619760: 41, 621344: 41, 619856: 41, 617376: 41, 621360: 42, 619872: 42, 617888: 42, 621376: 43, 619888: 43, 618400: 43, 621392: 44, 619904: 44, 618384: 44, 621408: 45, 619392: 45, 619920: 45, 618368: 45, 621424: 46, 618880: 46, 619936: 46, 621440: 47, 620448: 47, 621456: 48, 620960: 48, 621472: 49, 2706000: 0, 2706016: 1, 2198096: 2, 2706528: 2, 2706032: 2, 1673808: 3, 2707040: 3, 2706048: 3, 1149520: 4, 2707552: 4, 2706064: 4, 625232: 5, 2707536: 5, 2708064: 5, 2706576: 5, 2706080: 5, 641616: 6, 2708576: 6, 2707088: 6, 2706096: 6, 658000: 7, 2709088: 7, 2707600: 7, 2706112: 7, 674384: 8, 2709600: 8, 2707616: 8, 2296400: 8, 2706128: 8, 690768: 9, 2710112: 9, 2707632: 9, 1772112: 9, 2706144: 9, 707152: 10, 2710624: 10, 2707648: 10, 1247824: 10, 2706160: 10, 723536: 11, 2711136: 11, 2710640: 11, 2708160: 11, 2345552: 11, 2706176: 11, 2711648: 12, 2710656: 12, 2708672: 12, 1821264: 12, 2706192: 12, 2712160: 13, 2710672: 13, 2709184: 13, 1296976: 13, 2706208: 13, 2712672: 14, 2710160: 14, 2711184: 14, 2709168: 14, 2709200: 14, 772688: 14, 2706720: 14, 2706224: 14, 2713184: 15, 2709648: 15, 2711696: 15, 2709152: 15, 2709216: 15, 789072: 15, 2707232: 15, 2706240: 15, 2713696: 16, 2709136: 16, 2712208: 16, 2709232: 16, 805456: 16, 2707744: 16, 2706256: 16, 2713680: 17, 2714208: 17, 2713712: 17, 2712720: 17, 2712224: 17, 2708720: 17, 2709248: 17, 821840: 17, 2707728: 17, 2443856: 17, 2706768: 17, 2706272: 17, 2714720: 18, 2713728: 18, 2713232: 18, 2712240: 18, 2708208: 18, 2709264: 18, 838224: 18, 2707712: 18, 1919568: 18, 2707280: 18, 2706288: 18, 2715232: 19, 2713744: 19, 2712256: 19, 2707696: 19, 2709280: 19, 854608: 19, 1395280: 19, 2707792: 19, 2706304: 19, 2715744: 20, 2715248: 20, 2713760: 20, 2712272: 20, 2709792: 20, 870992: 20, 2708304: 20, 2707808: 20, 2706320: 20, 2716256: 21, 2715264: 21, 2713776: 21, 2712288: 21, 2710304: 21, 887376: 21, 2708816: 21, 2707824: 21, 2706336: 21, 2716768: 22, 2715280: 22, 2713792: 22, 2712304: 22, 2710816: 22, 903760: 22, 2709328: 22, 2707840: 22, 2525776: 22, 2706848: 22, 2716752: 23, 2715792: 23, 2715296: 23, 2714304: 23, 2712320: 23, 2711328: 23, 2710832: 23, 920144: 23, 2709840: 23, 2707856: 23, 2001488: 23, 2707360: 23, 2716304: 24, 2715312: 24, 2714816: 24, 2712336: 24, 2711840: 24, 2710848: 24, 936528: 24, 2710352: 24, 2707872: 24, 1477200: 24, 2716816: 25, 2715328: 25, 2712352: 25, 2710864: 25, 952912: 25, 2716832: 26, 2715344: 26, 2712864: 26, 2711376: 26, 2716848: 27, 2715360: 27, 2713376: 27, 2711888: 27, 2716864: 28, 2715376: 28, 2713888: 28, 2712400: 28, 2717376: 29, 2714864: 29, 2715392: 29, 2713872: 29, 2713904: 29, 2712912: 29, 2717888: 30, 2714352: 30, 2715408: 30, 2713856: 30, 2713920: 30, 2713424: 30, 2718400: 31, 2713840: 31, 2715424: 31, 2713936: 31, 2718384: 32, 2718416: 32, 2715936: 32, 2715440: 32, 2714448: 32, 2713952: 32, 2718368: 33, 2718432: 33, 2716448: 33, 2715456: 33, 2714960: 33, 2713968: 33, 2718288: 34, 2718352: 34, 2718448: 34, 2716960: 34, 2715472: 34, 2713984: 34, 2718304: 35, 2718336: 35, 2717936: 35, 2718464: 35, 2716944: 35, 2715984: 35, 2714000: 35, 2718320: 36, 2717424: 36, 2718480: 36, 2716928: 36, 2716496: 36, 2714016: 36, 2716912: 37, 2718496: 37, 2717008: 37, 2714528: 37, 2718512: 38, 2717024: 38, 2715040: 38, 2718528: 39, 2717040: 39, 2715552: 39, 2718544: 40, 2717056: 40, 2715536: 40, 2718560: 41, 2716544: 41, 2717072: 41, 2715520: 41, 2718576: 42, 2716032: 42, 2717088: 42, 2718592: 43, 2717600: 43, 2718608: 44, 2718112: 44, 2718624: 45, 4280400: 0, 4280416: 1, 3772496: 2, 4280928: 2, 3248208: 3, 4281440: 3, 2723920: 4, 4281952: 4, 2199632: 5, 2740304: 5, 4282464: 5, 1675344: 6, 2756688: 6, 4282976: 6, 1151056: 7, 2773072: 7, 4283488: 7, 626768: 8, 3297360: 8, 2789456: 8, 4284000: 8, 4283504: 8, 643152: 9, 3821648: 9, 2805840: 9, 4284512: 9, 4283520: 9, 659536: 10, 4280464: 10, 2822224: 10, 4285024: 10, 4283536: 10, 675920: 11, 4280480: 11, 2297936: 11, 2838608: 11, 4285536: 11, 4283024: 11, 4284048: 11, 692304: 12, 4280496: 12, 1773648: 12, 2854992: 12, 4286048: 12, 4282512: 12, 4284560: 12, 708688: 13, 4280512: 13, 1249360: 13, 2871376: 13, 4286560: 13, 4282000: 13, 4285072: 13, 725072: 14, 4281024: 14, 2347088: 14, 2887760: 14, 4286544: 14, 4287072: 14, 4286576: 14, 4282016: 14, 4285584: 14, 4285088: 14, 4281536: 15, 1822800: 15, 2904144: 15, 4287584: 15, 4286592: 15, 4282032: 15, 4286096: 15, 4285104: 15, 4282048: 16, 1298512: 16, 2920528: 16, 4288096: 16, 4286608: 16, 4285120: 16, 4282064: 17, 774224: 17, 3444816: 17, 2936912: 17, 4288608: 17, 4288112: 17, 4286624: 17, 4285136: 17, 4282080: 18, 790608: 18, 3969104: 18, 2953296: 18, 4289120: 18, 4288128: 18, 4286640: 18, 4285152: 18, 4282096: 19, 806992: 19, 4280608: 19, 2969680: 19, 4289632: 19, 4288144: 19, 4286656: 19, 4285168: 19, 4281584: 20, 4282112: 20, 823376: 20, 4280592: 20, 2445392: 20, 3493968: 20, 2986064: 20, 4289616: 20, 4288656: 20, 4288160: 20, 4287168: 20, 4285184: 20, 4281072: 21, 4282128: 21, 839760: 21, 4280576: 21, 1921104: 21, 4018256: 21, 3002448: 21, 4289168: 21, 4288176: 21, 4287680: 21, 4285200: 21, 4280560: 22, 4282144: 22, 856144: 22, 1396816: 22, 4280656: 22, 3018832: 22, 4289680: 22, 4288192: 22, 4285216: 22, 4282656: 23, 872528: 23, 4281168: 23, 4280672: 23, 3035216: 23, 4289696: 23, 4288208: 23, 4284704: 23, 4285728: 23, 4283168: 24, 888912: 24, 4281680: 24, 4280688: 24, 3051600: 24, 4289712: 24, 4288224: 24, 4284192: 24, 4286240: 24, 4283680: 25, 905296: 25, 4282192: 25, 4280704: 25, 2527312: 25, 3575888: 25, 4289728: 25, 4288240: 25, 4286752: 25, 4283696: 26, 921680: 26, 4282704: 26, 4280720: 26, 2003024: 26, 4100176: 26, 4290240: 26, 4287728: 26, 4288256: 26, 4286736: 26, 4286768: 26, 4283712: 27, 938064: 27, 4283216: 27, 4280736: 27, 1478736: 27, 4290752: 27, 4287216: 27, 4288272: 27, 4286720: 27, 4286784: 27, 4283728: 28, 954448: 28, 4291264: 28, 4286704: 28, 4288288: 28, 4286800: 28, 4284240: 29, 4291248: 29, 4291280: 29, 4288800: 29, 4288304: 29, 4286288: 29, 4287312: 29, 4286816: 29, 4284752: 30, 4291232: 30, 4291296: 30, 4289312: 30, 4288320: 30, 4285776: 30, 4287824: 30, 4286832: 30, 4285264: 31, 4291152: 31, 4291216: 31, 4291312: 31, 4289824: 31, 4288336: 31, 4286848: 31, 4291168: 32, 4291200: 32, 4290800: 32, 4291328: 32, 4289808: 32, 4288848: 32, 4286864: 32, 4291184: 33, 4290288: 33, 4291344: 33, 4289792: 33, 4289360: 33, 4286880: 33, 4289776: 34, 4291360: 34, 4289872: 34, 4287392: 34, 4291376: 35, 4289888: 35, 4287904: 35, 4291392: 36, 4289904: 36, 4288416: 36, 4291408: 37, 4289920: 37, 4288400: 37, 4291424: 38, 4289408: 38, 4289936: 38, 4288384: 38, 4291440: 39, 4288896: 39, 4289952: 39, 4291456: 40, 4290464: 40, 4291472: 41, 4290976: 41, 4291488: 42, 10578000: 0, 10578016: 1, 10070096: 2, 10578528: 2, 10578032: 2, 9545808: 3, 10579040: 3, 10578048: 3, 9021520: 4, 10579552: 4, 10578064: 4, 8497232: 5, 10580064: 5, 10579568: 5, 10119248: 5, 10578080: 5, 7972944: 6, 10580576: 6, 10579584: 6, 9594960: 6, 10578096: 6, 7448656: 7, 10581088: 7, 10579600: 7, 9070672: 7, 10578112: 7, 6924368: 8, 7465040: 8, 10581072: 8, 10580112: 8, 10579616: 8, 8546384: 8, 9087056: 8, 10578624: 8, 6400080: 9, 7481424: 9, 10580624: 9, 10579632: 9, 8022096: 9, 9103440: 9, 10579136: 9, 5875792: 10, 7497808: 10, 10581136: 10, 10579648: 10, 9119824: 10, 5351504: 11, 6973520: 11, 10581152: 11, 10579664: 11, 9136208: 11, 4827216: 12, 6449232: 12, 10581168: 12, 10579680: 12, 9152592: 12, 4302928: 13, 5924944: 13, 10581184: 13, 10579696: 13, 9168976: 13, 3778640: 14, 5941328: 14, 10581696: 14, 10579184: 14, 10579712: 14, 9185360: 14, 3254352: 15, 5957712: 15, 10582208: 15, 10578672: 15, 10579728: 15, 9201744: 15, 2730064: 16, 5974096: 16, 10582720: 16, 10578160: 16, 10579744: 16, 9218128: 16, 2205776: 17, 2746448: 17, 5449808: 17, 5990480: 17, 10582704: 17, 10582736: 17, 10578176: 17, 10580256: 17, 10579760: 17, 8693840: 17, 9742416: 17, 1681488: 18, 2762832: 18, 4925520: 18, 6006864: 18, 10582688: 18, 10582752: 18, 10578192: 18, 10580768: 18, 10579776: 18, 8169552: 18, 10266704: 18, 1157200: 19, 2779216: 19, 4401232: 19, 6023248: 19, 10582608: 19, 10582672: 19, 10582768: 19, 10578208: 19, 10581280: 19, 10579792: 19, 7645264: 19, 632912: 20, 3303504: 20, 2795600: 20, 4384848: 20, 5498960: 20, 6039632: 20, 10582624: 20, 10582656: 20, 10582256: 20, 10582784: 20, 10578224: 20, 10581264: 20, 10579280: 20, 10580304: 20, 7120976: 20, 7661648: 20, 649296: 21, 3827792: 21, 2811984: 21, 4368464: 21, 4974672: 21, 6056016: 21, 10582640: 21, 10581744: 21, 10582800: 21, 10578240: 21, 10581248: 21, 10578768: 21, 10580816: 21, 6596688: 21, 7678032: 21, 665680: 22, 4352080: 22, 2828368: 22, 4450384: 22, 6072400: 22, 10581232: 22, 10582816: 22, 10578256: 22, 10581328: 22, 7694416: 22, 682064: 23, 2304080: 23, 2844752: 23, 4466768: 23, 10582832: 23, 10315856: 23, 10578272: 23, 10581344: 23, 7170128: 23, 8218704: 23, 698448: 24, 1779792: 24, 2861136: 24, 4483152: 24, 10582848: 24, 9791568: 24, 10578288: 24, 10581360: 24, 6645840: 24, 8742992: 24, 714832: 25, 1255504: 25, 2877520: 25, 4499536: 25, 10582864: 25, 9267280: 25, 10578304: 25, 10581376: 25, 6121552: 25, 731216: 26, 2353232: 26, 2893904: 26, 3975248: 26, 10582880: 26, 10578320: 26, 10580864: 26, 10581392: 26, 5597264: 26, 1828944: 27, 2910288: 27, 3450960: 27, 10582896: 27, 10578336: 27, 10580352: 27, 10581408: 27, 5072976: 27, 1304656: 28, 2926672: 28, 10582912: 28, 10578848: 28, 10579840: 28, 10581920: 28, 4548688: 28, 780368: 29, 2943056: 29, 10582928: 29, 10579360: 29, 10579856: 29, 10582432: 29, 4024400: 29, 4565072: 29, 796752: 30, 2959440: 30, 10582944: 30, 10579872: 30, 3500112: 30, 4581456: 30, 813136: 31, 2975824: 31, 4597840: 31, 829520: 32, 2451536: 32, 2992208: 32, 4614224: 32, 845904: 33, 1927248: 33, 3008592: 33, 4630608: 33, 862288: 34, 1402960: 34, 3024976: 34, 4106320: 34, 878672: 35, 3041360: 35, 3582032: 35, 895056: 36, 3057744: 36, 911440: 37, 2533456: 37, 927824: 38, 2009168: 38, 944208: 39, 1484880: 39, 960592: 40, 13726800: 0, 13726816: 1, 13218896: 2, 12694608: 3, 12170320: 4, 11646032: 5, 12186704: 5, 11121744: 6, 12203088: 6, 10597456: 7, 12219472: 7, 10073168: 8, 10613840: 8, 12743760: 8, 12235856: 8, 9548880: 9, 10630224: 9, 13268048: 9, 12252240: 9, 9024592: 10, 10646608: 10, 13726864: 10, 12268624: 10, 13728336: 11, 8500304: 11, 10122320: 11, 10662992: 11, 13726880: 11, 11744336: 11, 12285008: 11, 13728352: 12, 7976016: 12, 9598032: 12, 10679376: 12, 13726896: 12, 11220048: 12, 12301392: 12, 13728368: 13, 7451728: 13, 9073744: 13, 10695760: 13, 13726912: 13, 12317776: 13, 13728384: 14, 6927440: 14, 7468112: 14, 8549456: 14, 9090128: 14, 13727424: 14, 11793488: 14, 12334160: 14, 13728400: 15, 6403152: 15, 7484496: 15, 8025168: 15, 9106512: 15, 13727936: 15, 11269200: 15, 12350544: 15, 13728416: 16, 5878864: 16, 7500880: 16, 9122896: 16, 13728448: 16, 10744912: 16, 12366928: 16, 13728432: 17, 5354576: 17, 6976592: 17, 9139280: 17, 13728464: 17, 10761296: 17, 12891216: 17, 12383312: 17, 4830288: 18, 6452304: 18, 9155664: 18, 13728480: 18, 10777680: 18, 13415504: 18, 12399696: 18, 4306000: 19, 5928016: 19, 9172048: 19, 13728496: 19, 10794064: 19, 13727008: 19, 12416080: 19, 3781712: 20, 5944400: 20, 9188432: 20, 13727984: 20, 13728512: 20, 10269776: 20, 10810448: 20, 13726992: 20, 11891792: 20, 12940368: 20, 3257424: 21, 5960784: 21, 9204816: 21, 13727472: 21, 13728528: 21, 9745488: 21, 10826832: 21, 13726976: 21, 11367504: 21, 13464656: 21, 2733136: 22, 5977168: 22, 9221200: 22, 13726960: 22, 13728544: 22, 10843216: 22, 13727056: 22, 2208848: 23, 2749520: 23, 5452880: 23, 5993552: 23, 8696912: 23, 13728560: 23, 10318928: 23, 10859600: 23, 13727072: 23, 1684560: 24, 2765904: 24, 4928592: 24, 6009936: 24, 8172624: 24, 13728576: 24, 9794640: 24, 10875984: 24, 13727088: 24, 1160272: 25, 2782288: 25, 4404304: 25, 6026320: 25, 7648336: 25, 13728592: 25, 9270352: 25, 10892368: 25, 13727104: 25, 635984: 26, 3306576: 26, 2798672: 26, 4387920: 26, 5502032: 26, 6042704: 26, 7124048: 26, 7664720: 26, 13728608: 26, 8746064: 26, 10908752: 26, 13513808: 26, 13727120: 26, 652368: 27, 3830864: 27, 2815056: 27, 4371536: 27, 4977744: 27, 6059088: 27, 6599760: 27, 7681104: 27, 13728624: 27, 8221776: 27, 10925136: 27, 12989520: 27, 13727136: 27, 668752: 28, 4355152: 28, 2831440: 28, 4453456: 28, 6075472: 28, 7697488: 28, 13728640: 28, 11449424: 28, 12465232: 28, 13727648: 28, 685136: 29, 2307152: 29, 2847824: 29, 4469840: 29, 7173200: 29, 13728656: 29, 11973712: 29, 12481616: 29, 13728160: 29, 701520: 30, 1782864: 30, 2864208: 30, 4486224: 30, 6648912: 30, 13728672: 30, 12498000: 30, 717904: 31, 1258576: 31, 2880592: 31, 4502608: 31, 6124624: 31, 734288: 32, 2356304: 32, 2896976: 32, 3978320: 32, 5600336: 32, 1832016: 33, 2913360: 33, 3454032: 33, 5076048: 33, 1307728: 34, 2929744: 34, 4551760: 34, 783440: 35, 2946128: 35, 4027472: 35, 4568144: 35, 799824: 36, 2962512: 36, 3503184: 36, 4584528: 36, 816208: 37, 2978896: 37, 4600912: 37, 832592: 38, 2454608: 38, 2995280: 38, 4617296: 38, 848976: 39, 1930320: 39, 3011664: 39, 4633680: 39, 865360: 40, 1406032: 40, 3028048: 40, 4109392: 40, 881744: 41, 3044432: 41, 3585104: 41, 898128: 42, 3060816: 42, 914512: 43, 2536528: 43, 930896: 44, 2012240: 44, 947280: 45, 1487952: 45, 963664: 46, 15301200: 0, 15301216: 1, 15301232: 2, 15301248: 3, 15301264: 4, 15301280: 5, 15301296: 6, 15301312: 7, 14891600: 8, 15301328: 8, 14367312: 9, 15301344: 9, 13843024: 10, 15301360: 10, 13826640: 11, 14940752: 11, 15301376: 11, 13744720: 12, 13810256: 12, 14416464: 12, 15301392: 12, 13220432: 13, 13793872: 13, 13892176: 13, 15301408: 13, 12696144: 14, 13269584: 14, 13908560: 14, 15301424: 14, 12171856: 15, 12745296: 15, 13924944: 15, 15301440: 15, 11647568: 16, 12188240: 16, 12221008: 16, 13941328: 16, 15301456: 16, 11123280: 17, 12204624: 17, 12237392: 17, 13417040: 17, 15301472: 17, 10598992: 18, 12253776: 18, 12892752: 18, 15301488: 18, 10074704: 19, 10615376: 19, 12270160: 19, 12368464: 19, 15301504: 19, 9550416: 20, 10631760: 20, 11745872: 20, 12286544: 20, 12352080: 20, 12384848: 20, 15301520: 20, 9026128: 21, 10648144: 21, 11221584: 21, 12302928: 21, 12335696: 21, 12401232: 21, 15301536: 21, 8501840: 22, 10123856: 22, 10664528: 22, 10697296: 22, 12319312: 22, 12417616: 22, 15120976: 22, 7977552: 23, 9599568: 23, 10680912: 23, 11795024: 23, 11893328: 23, 12941904: 23, 14596688: 23, 7453264: 24, 9075280: 24, 11270736: 24, 11369040: 24, 13466192: 24, 14072400: 24, 6928976: 25, 7469648: 25, 8550992: 25, 9091664: 25, 10746448: 25, 10844752: 25, 13990480: 25, 14056016: 25, 6404688: 26, 7486032: 26, 8026704: 26, 9108048: 26, 10762832: 26, 10320464: 26, 10828368: 26, 10861136: 26, 14006864: 26, 14039632: 26, 5880400: 27, 7502416: 27, 9124432: 27, 10779216: 27, 9796176: 27, 10811984: 27, 10877520: 27, 14023248: 27, 13515344: 27, 5356112: 28, 6978128: 28, 9140816: 28, 10795600: 28, 9271888: 28, 10893904: 28, 12991056: 28, 4831824: 29, 6453840: 29, 9157200: 29, 10271312: 29, 8747600: 29, 10910288: 29, 12466768: 29, 4307536: 30, 5929552: 30, 9173584: 30, 9747024: 30, 8223312: 30, 10926672: 30, 12483152: 30, 3783248: 31, 5945936: 31, 9189968: 31, 9222736: 31, 7699024: 31, 11450960: 31, 12499536: 31, 3258960: 32, 5962320: 32, 9206352: 32, 8698448: 32, 7174736: 32, 7682640: 32, 11975248: 32, 2734672: 33, 5978704: 33, 8174160: 33, 6650448: 33, 7666256: 33, 2210384: 34, 2751056: 34, 5454416: 34, 5995088: 34, 7649872: 34, 6126160: 34, 1686096: 35, 2767440: 35, 4930128: 35, 6011472: 35, 7125584: 35, 5601872: 35, 1161808: 36, 2783824: 36, 4405840: 36, 6027856: 36, 6601296: 36, 5077584: 36, 637520: 37, 3308112: 37, 2800208: 37, 4389456: 37, 5503568: 37, 6044240: 37, 6077008: 37, 4553296: 37, 653904: 38, 3832400: 38, 2816592: 38, 4373072: 38, 4979280: 38, 6060624: 38, 4029008: 38, 4569680: 38, 670288: 39, 4356688: 39, 2832976: 39, 4454992: 39, 3504720: 39, 4586064: 39, 686672: 40, 2308688: 40, 2849360: 40, 4471376: 40, 2980432: 40, 4602448: 40, 703056: 41, 1784400: 41, 2865744: 41, 4487760: 41, 2456144: 41, 2964048: 41, 2996816: 41, 4618832: 41, 719440: 42, 1260112: 42, 2882128: 42, 4504144: 42, 1931856: 42, 2947664: 42, 3013200: 42, 4635216: 42, 735824: 43, 2357840: 43, 2898512: 43, 3979856: 43, 1407568: 43, 2931280: 43, 3029584: 43, 4110928: 43, 1833552: 44, 2914896: 44, 3455568: 44, 883280: 44, 3045968: 44, 3586640: 44, 1309264: 45, 866896: 45, 899664: 45, 3062352: 45, 784976: 46, 850512: 46, 916048: 46, 2538064: 46, 801360: 47, 834128: 47, 932432: 47, 2013776: 47, 817744: 48, 948816: 48, 1489488: 48, 965200: 49, 623200: 0, 623712: 1, 623216: 1, 624224: 2, 623232: 2, 624736: 3, 623248: 3, 625248: 4, 623264: 4, 625760: 5, 625264: 5, 623280: 5, 626272: 6, 625280: 6, 623296: 6, 626784: 7, 625296: 7, 623808: 7, 627296: 8, 625808: 8, 625312: 8, 624320: 8, 627808: 9, 626320: 9, 625328: 9, 624832: 9, 628320: 10, 626832: 10, 625344: 10, 628832: 11, 626848: 11, 625360: 11, 629344: 12, 626864: 12, 625376: 12, 629856: 13, 626880: 13, 625392: 13, 630368: 14, 629872: 14, 627392: 14, 624880: 14, 625408: 14, 630880: 15, 629888: 15, 627904: 15, 624368: 15, 625424: 15, 631392: 16, 629904: 16, 628416: 16, 623856: 16, 625440: 16, 631904: 17, 629392: 17, 630416: 17, 628400: 17, 628432: 17, 623344: 17, 625952: 17, 625456: 17, 632416: 18, 628880: 18, 630928: 18, 628384: 18, 628448: 18, 623360: 18, 626464: 18, 625472: 18, 632928: 19, 628368: 19, 631440: 19, 628464: 19, 623376: 19, 626976: 19, 625488: 19, 633440: 20, 632944: 20, 631952: 20, 631456: 20, 627952: 20, 628480: 20, 623392: 20, 626960: 20, 624976: 20, 626000: 20, 625504: 20, 633952: 21, 632960: 21, 632464: 21, 631472: 21, 627440: 21, 628496: 21, 623408: 21, 626944: 21, 624464: 21, 626512: 21, 625520: 21, 634464: 22, 632976: 22, 631488: 22, 626928: 22, 628512: 22, 623424: 22, 623952: 22, 627024: 22, 625536: 22, 634976: 23, 634480: 23, 632992: 23, 631504: 23, 629024: 23, 623440: 23, 627536: 23, 627040: 23, 625552: 23, 635488: 24, 634496: 24, 633008: 24, 631520: 24, 629536: 24, 623456: 24, 628048: 24, 627056: 24, 625568: 24, 636000: 25, 634512: 25, 633024: 25, 631536: 25, 630048: 25, 623472: 25, 628560: 25, 627072: 25, 625056: 25, 626080: 25, 635024: 26, 634528: 26, 633536: 26, 631552: 26, 630560: 26, 630064: 26, 623488: 26, 629072: 26, 627088: 26, 624544: 26, 626592: 26, 635536: 27, 634544: 27, 634048: 27, 631568: 27, 631072: 27, 630080: 27, 623504: 27, 629584: 27, 627104: 27, 624032: 27, 636048: 28, 634560: 28, 631584: 28, 630096: 28, 623520: 28, 636064: 29, 634576: 29, 632096: 29, 630608: 29, 636080: 30, 634592: 30, 632608: 30, 631120: 30, 636096: 31, 634608: 31, 633120: 31, 631632: 31, 636608: 32, 634096: 32, 634624: 32, 633104: 32, 633136: 32, 632144: 32, 637120: 33, 633584: 33, 634640: 33, 633088: 33, 633152: 33, 632656: 33, 637632: 34, 633072: 34, 634656: 34, 633168: 34, 637616: 35, 637648: 35, 635168: 35, 634672: 35, 633680: 35, 633184: 35, 637600: 36, 637664: 36, 635680: 36, 634688: 36, 634192: 36, 633200: 36, 637584: 37, 637680: 37, 636192: 37, 634704: 37, 633216: 37, 637536: 38, 637568: 38, 637168: 38, 637696: 38, 636176: 38, 635216: 38, 633232: 38, 637552: 39, 636656: 39, 637712: 39, 636160: 39, 635728: 39, 633248: 39, 636144: 40, 637728: 40, 636240: 40, 633760: 40, 637744: 41, 636256: 41, 634272: 41, 637760: 42, 636272: 42, 634784: 42, 637776: 43, 636288: 43, 634768: 43, 637792: 44, 635776: 44, 636304: 44, 634752: 44, 637808: 45, 635264: 45, 636320: 45, 637824: 46, 636832: 46, 637840: 47, 637344: 47, 637856: 48, 1148000: 0, 1148512: 1, 640096: 2, 1149024: 2, 656480: 3, 1149536: 3, 672864: 4, 1150048: 4, 1149552: 4, 689248: 5, 1150560: 5, 1149568: 5, 705632: 6, 1151072: 6, 1149584: 6, 722016: 7, 1151584: 7, 1150096: 7, 1149600: 7, 1148096: 8, 1152096: 8, 1150608: 8, 1149616: 8, 1148608: 9, 1152608: 9, 1151120: 9, 1149632: 9, 1149120: 10, 1153120: 10, 1151136: 10, 1149648: 10, 1153632: 11, 1151152: 11, 1149664: 11, 1154144: 12, 1151168: 12, 1149680: 12, 1154656: 13, 1154160: 13, 1151680: 13, 1149168: 13, 1149696: 13, 1155168: 14, 1154176: 14, 1152192: 14, 1148656: 14, 1149712: 14, 1155680: 15, 1154192: 15, 1152704: 15, 1148144: 15, 1149728: 15, 1156192: 16, 1153680: 16, 1154704: 16, 1152688: 16, 1152720: 16, 771168: 16, 1150240: 16, 1149744: 16, 1156704: 17, 1153168: 17, 1155216: 17, 1152672: 17, 1152736: 17, 787552: 17, 1150752: 17, 1149760: 17, 1157216: 18, 1152656: 18, 1155728: 18, 1152752: 18, 803936: 18, 1151264: 18, 1149776: 18, 1157728: 19, 1157232: 19, 1156240: 19, 1155744: 19, 1152240: 19, 1152768: 19, 820320: 19, 1151248: 19, 1149264: 19, 1150288: 19, 1149792: 19, 1158240: 20, 1157248: 20, 1156752: 20, 1155760: 20, 1151728: 20, 1152784: 20, 836704: 20, 1151232: 20, 1148752: 20, 1150800: 20, 1149808: 20, 1158752: 21, 1157264: 21, 1155776: 21, 1151216: 21, 1152800: 21, 853088: 21, 1148240: 21, 1151312: 21, 1149824: 21, 1159264: 22, 1158768: 22, 1157280: 22, 1155792: 22, 1153312: 22, 869472: 22, 1151824: 22, 1151328: 22, 1149840: 22, 1159776: 23, 1158784: 23, 1157296: 23, 1155808: 23, 1153824: 23, 885856: 23, 1152336: 23, 1151344: 23, 1149856: 23, 1160288: 24, 1158800: 24, 1157312: 24, 1155824: 24, 1154336: 24, 902240: 24, 1152848: 24, 1151360: 24, 1149344: 24, 1150368: 24, 1159312: 25, 1158816: 25, 1157824: 25, 1155840: 25, 1154848: 25, 1154352: 25, 918624: 25, 1153360: 25, 1151376: 25, 1148832: 25, 1150880: 25, 1159824: 26, 1158832: 26, 1158336: 26, 1155856: 26, 1155360: 26, 1154368: 26, 935008: 26, 1153872: 26, 1151392: 26, 1148320: 26, 1160336: 27, 1158848: 27, 1155872: 27, 1154384: 27, 951392: 27, 1160352: 28, 1158864: 28, 1156384: 28, 1154896: 28, 1160368: 29, 1158880: 29, 1156896: 29, 1155408: 29, 1160384: 30, 1158896: 30, 1157408: 30, 1155920: 30, 1160896: 31, 1158384: 31, 1158912: 31, 1157392: 31, 1157424: 31, 1156432: 31, 1161408: 32, 1157872: 32, 1158928: 32, 1157376: 32, 1157440: 32, 1156944: 32, 1161920: 33, 1157360: 33, 1158944: 33, 1157456: 33, 1161904: 34, 1161936: 34, 1159456: 34, 1158960: 34, 1157968: 34, 1157472: 34, 1161888: 35, 1161952: 35, 1159968: 35, 1158976: 35, 1158480: 35, 1157488: 35, 1161872: 36, 1161968: 36, 1160480: 36, 1158992: 36, 1157504: 36, 1161824: 37, 1161856: 37, 1161456: 37, 1161984: 37, 1160464: 37, 1159504: 37, 1157520: 37, 1161840: 38, 1160944: 38, 1162000: 38, 1160448: 38, 1160016: 38, 1157536: 38, 1160432: 39, 1162016: 39, 1160528: 39, 1158048: 39, 1162032: 40, 1160544: 40, 1158560: 40, 1162048: 41, 1160560: 41, 1159072: 41, 1162064: 42, 1160576: 42, 1159056: 42, 1162080: 43, 1160064: 43, 1160592: 43, 1159040: 43, 1162096: 44, 1159552: 44, 1160608: 44, 1162112: 45, 1161120: 45, 1162128: 46, 1161632: 46, 1162144: 47, 1672800: 0, 1673312: 1, 1673824: 2, 640608: 3, 1674336: 3, 1673840: 3, 656992: 4, 1674848: 4, 1673856: 4, 673376: 5, 1675360: 5, 1673872: 5, 689760: 6, 1675872: 6, 1674384: 6, 1673888: 6, 706144: 7, 1676384: 7, 1674896: 7, 1673904: 7, 722528: 8, 1676896: 8, 1675408: 8, 1673920: 8, 1246816: 9, 1677408: 9, 1675424: 9, 1673408: 9, 1673936: 9, 1672896: 10, 1677920: 10, 1675440: 10, 1673952: 10, 1678432: 11, 1675456: 11, 1673968: 11, 1678944: 12, 1678448: 12, 1675968: 12, 1673456: 12, 1673984: 12, 1679456: 13, 1678464: 13, 1676480: 13, 1672944: 13, 1674000: 13, 1679968: 14, 1678480: 14, 1676992: 14, 1295968: 14, 1674016: 14, 1680480: 15, 1677968: 15, 1678992: 15, 1676976: 15, 1677008: 15, 771680: 15, 1674528: 15, 1674032: 15, 1680992: 16, 1677456: 16, 1679504: 16, 1676960: 16, 1677024: 16, 788064: 16, 1675040: 16, 1674048: 16, 1681504: 17, 1676944: 17, 1680016: 17, 1677040: 17, 804448: 17, 1675552: 17, 1674064: 17, 1682016: 18, 1681520: 18, 1680528: 18, 1680032: 18, 1676528: 18, 1677056: 18, 820832: 18, 1675536: 18, 1673552: 18, 1674576: 18, 1674080: 18, 1682528: 19, 1681536: 19, 1681040: 19, 1680048: 19, 1676016: 19, 1677072: 19, 837216: 19, 1675520: 19, 1673040: 19, 1675088: 19, 1674096: 19, 1683040: 20, 1681552: 20, 1680064: 20, 1675504: 20, 1677088: 20, 853600: 20, 1394272: 20, 1675600: 20, 1674112: 20, 1683552: 21, 1683056: 21, 1681568: 21, 1680080: 21, 1677600: 21, 869984: 21, 1676112: 21, 1675616: 21, 1674128: 21, 1684064: 22, 1683072: 22, 1681584: 22, 1680096: 22, 1678112: 22, 886368: 22, 1676624: 22, 1675632: 22, 1674144: 22, 1684576: 23, 1683088: 23, 1681600: 23, 1680112: 23, 1678624: 23, 902752: 23, 1677136: 23, 1675648: 23, 1673632: 23, 1674656: 23, 1683600: 24, 1683104: 24, 1682112: 24, 1680128: 24, 1679136: 24, 1678640: 24, 919136: 24, 1677648: 24, 1675664: 24, 1673120: 24, 1675168: 24, 1684112: 25, 1683120: 25, 1682624: 25, 1680144: 25, 1679648: 25, 1678656: 25, 935520: 25, 1678160: 25, 1675680: 25, 1476192: 25, 1684624: 26, 1683136: 26, 1680160: 26, 1678672: 26, 951904: 26, 1684640: 27, 1683152: 27, 1680672: 27, 1679184: 27, 1684656: 28, 1683168: 28, 1681184: 28, 1679696: 28, 1684672: 29, 1683184: 29, 1681696: 29, 1680208: 29, 1685184: 30, 1682672: 30, 1683200: 30, 1681680: 30, 1681712: 30, 1680720: 30, 1685696: 31, 1682160: 31, 1683216: 31, 1681664: 31, 1681728: 31, 1681232: 31, 1686208: 32, 1681648: 32, 1683232: 32, 1681744: 32, 1686192: 33, 1686224: 33, 1683744: 33, 1683248: 33, 1682256: 33, 1681760: 33, 1686176: 34, 1686240: 34, 1684256: 34, 1683264: 34, 1682768: 34, 1681776: 34, 1686160: 35, 1686256: 35, 1684768: 35, 1683280: 35, 1681792: 35, 1686112: 36, 1686144: 36, 1685744: 36, 1686272: 36, 1684752: 36, 1683792: 36, 1681808: 36, 1686128: 37, 1685232: 37, 1686288: 37, 1684736: 37, 1684304: 37, 1681824: 37, 1684720: 38, 1686304: 38, 1684816: 38, 1682336: 38, 1686320: 39, 1684832: 39, 1682848: 39, 1686336: 40, 1684848: 40, 1683360: 40, 1686352: 41, 1684864: 41, 1683344: 41, 1686368: 42, 1684352: 42, 1684880: 42, 1683328: 42, 1686384: 43, 1683840: 43, 1684896: 43, 1686400: 44, 1685408: 44, 1686416: 45, 1685920: 45, 1686432: 46, 2197600: 0, 2198112: 1, 2198624: 2, 2198128: 2, 2199136: 3, 2198144: 3, 641120: 4, 2199648: 4, 2198160: 4, 657504: 5, 2200160: 5, 2198672: 5, 2198176: 5, 673888: 6, 2200672: 6, 2199184: 6, 2198192: 6, 690272: 7, 2201184: 7, 2199696: 7, 2198208: 7, 706656: 8, 2201696: 8, 2199712: 8, 2197696: 8, 2198224: 8, 723040: 9, 2202208: 9, 2199728: 9, 1771616: 9, 2198240: 9, 1247328: 10, 2202720: 10, 2199744: 10, 2198256: 10, 2203232: 11, 2202736: 11, 2200256: 11, 2197744: 11, 2198272: 11, 2203744: 12, 2202752: 12, 2200768: 12, 1820768: 12, 2198288: 12, 2204256: 13, 2202768: 13, 2201280: 13, 1296480: 13, 2198304: 13, 2204768: 14, 2202256: 14, 2203280: 14, 2201264: 14, 2201296: 14, 772192: 14, 2198816: 14, 2198320: 14, 2205280: 15, 2201744: 15, 2203792: 15, 2201248: 15, 2201312: 15, 788576: 15, 2199328: 15, 2198336: 15, 2205792: 16, 2201232: 16, 2204304: 16, 2201328: 16, 804960: 16, 2199840: 16, 2198352: 16, 2206304: 17, 2205808: 17, 2204816: 17, 2204320: 17, 2200816: 17, 2201344: 17, 821344: 17, 2199824: 17, 2197840: 17, 2198864: 17, 2198368: 17, 2206816: 18, 2205824: 18, 2205328: 18, 2204336: 18, 2200304: 18, 2201360: 18, 837728: 18, 2199808: 18, 1919072: 18, 2199376: 18, 2198384: 18, 2207328: 19, 2205840: 19, 2204352: 19, 2199792: 19, 2201376: 19, 854112: 19, 1394784: 19, 2199888: 19, 2198400: 19, 2207840: 20, 2207344: 20, 2205856: 20, 2204368: 20, 2201888: 20, 870496: 20, 2200400: 20, 2199904: 20, 2198416: 20, 2208352: 21, 2207360: 21, 2205872: 21, 2204384: 21, 2202400: 21, 886880: 21, 2200912: 21, 2199920: 21, 2198432: 21, 2208864: 22, 2207376: 22, 2205888: 22, 2204400: 22, 2202912: 22, 903264: 22, 2201424: 22, 2199936: 22, 2197920: 22, 2198944: 22, 2207888: 23, 2207392: 23, 2206400: 23, 2204416: 23, 2203424: 23, 2202928: 23, 919648: 23, 2201936: 23, 2199952: 23, 2000992: 23, 2199456: 23, 2208400: 24, 2207408: 24, 2206912: 24, 2204432: 24, 2203936: 24, 2202944: 24, 936032: 24, 2202448: 24, 2199968: 24, 1476704: 24, 2208912: 25, 2207424: 25, 2204448: 25, 2202960: 25, 952416: 25, 2208928: 26, 2207440: 26, 2204960: 26, 2203472: 26, 2208944: 27, 2207456: 27, 2205472: 27, 2203984: 27, 2208960: 28, 2207472: 28, 2205984: 28, 2204496: 28, 2209472: 29, 2206960: 29, 2207488: 29, 2205968: 29, 2206000: 29, 2205008: 29, 2209984: 30, 2206448: 30, 2207504: 30, 2205952: 30, 2206016: 30, 2205520: 30, 2210496: 31, 2205936: 31, 2207520: 31, 2206032: 31, 2210480: 32, 2210512: 32, 2208032: 32, 2207536: 32, 2206544: 32, 2206048: 32, 2210464: 33, 2210528: 33, 2208544: 33, 2207552: 33, 2207056: 33, 2206064: 33, 2210448: 34, 2210544: 34, 2209056: 34, 2207568: 34, 2206080: 34, 2210400: 35, 2210432: 35, 2210032: 35, 2210560: 35, 2209040: 35, 2208080: 35, 2206096: 35, 2210416: 36, 2209520: 36, 2210576: 36, 2209024: 36, 2208592: 36, 2206112: 36, 2209008: 37, 2210592: 37, 2209104: 37, 2206624: 37, 2210608: 38, 2209120: 38, 2207136: 38, 2210624: 39, 2209136: 39, 2207648: 39, 2210640: 40, 2209152: 40, 2207632: 40, 2210656: 41, 2208640: 41, 2209168: 41, 2207616: 41, 2210672: 42, 2208128: 42, 2209184: 42, 2210688: 43, 2209696: 43, 2210704: 44, 2210208: 44, 2210720: 45, 2722400: 0, 2722912: 1, 2722416: 1, 2723424: 2, 2722432: 2, 2723936: 3, 2722448: 3, 2724448: 4, 2722960: 4, 2722464: 4, 641632: 5, 2724960: 5, 2723472: 5, 2722480: 5, 658016: 6, 2725472: 6, 2723984: 6, 2722496: 6, 674400: 7, 2725984: 7, 2724000: 7, 2296416: 7, 2722512: 7, 690784: 8, 2726496: 8, 2724016: 8, 1772128: 8, 2722528: 8, 707168: 9, 2727008: 9, 2724032: 9, 1247840: 9, 2722544: 9, 723552: 10, 2727520: 10, 2727024: 10, 2724544: 10, 2345568: 10, 2722560: 10, 2728032: 11, 2727040: 11, 2725056: 11, 1821280: 11, 2722576: 11, 2728544: 12, 2727056: 12, 2725568: 12, 1296992: 12, 2722592: 12, 2729056: 13, 2726544: 13, 2727568: 13, 2725552: 13, 2725584: 13, 772704: 13, 2723104: 13, 2722608: 13, 2729568: 14, 2726032: 14, 2728080: 14, 2725536: 14, 2725600: 14, 789088: 14, 2723616: 14, 2722624: 14, 2730080: 15, 2725520: 15, 2728592: 15, 2725616: 15, 805472: 15, 2724128: 15, 2722640: 15, 2730592: 16, 2730096: 16, 2729104: 16, 2728608: 16, 2725104: 16, 2725632: 16, 821856: 16, 2724112: 16, 2443872: 16, 2723152: 16, 2722656: 16, 2731104: 17, 2730112: 17, 2729616: 17, 2728624: 17, 2724592: 17, 2725648: 17, 838240: 17, 2724096: 17, 1919584: 17, 2723664: 17, 2722672: 17, 2731616: 18, 2730128: 18, 2728640: 18, 2724080: 18, 2725664: 18, 854624: 18, 1395296: 18, 2724176: 18, 2722688: 18, 2732128: 19, 2731632: 19, 2730144: 19, 2728656: 19, 2726176: 19, 871008: 19, 2724688: 19, 2724192: 19, 2722704: 19, 2732640: 20, 2731648: 20, 2730160: 20, 2728672: 20, 2726688: 20, 887392: 20, 2725200: 20, 2724208: 20, 2722720: 20, 2733152: 21, 2731664: 21, 2730176: 21, 2728688: 21, 2727200: 21, 903776: 21, 2725712: 21, 2724224: 21, 2525792: 21, 2723232: 21, 2732176: 22, 2731680: 22, 2730688: 22, 2728704: 22, 2727712: 22, 2727216: 22, 920160: 22, 2726224: 22, 2724240: 22, 2001504: 22, 2723744: 22, 2732688: 23, 2731696: 23, 2731200: 23, 2728720: 23, 2728224: 23, 2727232: 23, 936544: 23, 2726736: 23, 2724256: 23, 1477216: 23, 2733200: 24, 2731712: 24, 2728736: 24, 2727248: 24, 952928: 24, 2733216: 25, 2731728: 25, 2729248: 25, 2727760: 25, 2733232: 26, 2731744: 26, 2729760: 26, 2728272: 26, 2733248: 27, 2731760: 27, 2730272: 27, 2728784: 27, 2733760: 28, 2731248: 28, 2731776: 28, 2730256: 28, 2730288: 28, 2729296: 28, 2734272: 29, 2730736: 29, 2731792: 29, 2730240: 29, 2730304: 29, 2729808: 29, 2734784: 30, 2730224: 30, 2731808: 30, 2730320: 30, 2734768: 31, 2734800: 31, 2732320: 31, 2731824: 31, 2730832: 31, 2730336: 31, 2734752: 32, 2734816: 32, 2732832: 32, 2731840: 32, 2731344: 32, 2730352: 32, 2734736: 33, 2734832: 33, 2733344: 33, 2731856: 33, 2730368: 33, 2734688: 34, 2734720: 34, 2734320: 34, 2734848: 34, 2733328: 34, 2732368: 34, 2730384: 34, 2734704: 35, 2733808: 35, 2734864: 35, 2733312: 35, 2732880: 35, 2730400: 35, 2733296: 36, 2734880: 36, 2733392: 36, 2730912: 36, 2734896: 37, 2733408: 37, 2731424: 37, 2734912: 38, 2733424: 38, 2731936: 38, 2734928: 39, 2733440: 39, 2731920: 39, 2734944: 40, 2732928: 40, 2733456: 40, 2731904: 40, 2734960: 41, 2732416: 41, 2733472: 41, 2734976: 42, 2733984: 42, 2734992: 43, 2734496: 43, 2735008: 44, 3247200: 0, 3247712: 1, 2739296: 2, 3248224: 2, 2755680: 3, 3248736: 3, 2772064: 4, 3249248: 4, 3247248: 5, 2788448: 5, 3249760: 5, 642144: 6, 3247760: 6, 2804832: 6, 3250272: 6, 658528: 7, 3248272: 7, 2821216: 7, 3250784: 7, 674912: 8, 3248288: 8, 2296928: 8, 2837600: 8, 3251296: 8, 691296: 9, 3248304: 9, 1772640: 9, 2853984: 9, 3251808: 9, 3251312: 9, 707680: 10, 3248320: 10, 1248352: 10, 2870368: 10, 3252320: 10, 3251328: 10, 724064: 11, 3248832: 11, 2346080: 11, 2886752: 11, 3252832: 11, 3251344: 11, 3249344: 12, 1821792: 12, 2903136: 12, 3253344: 12, 3250832: 12, 3251856: 12, 3249856: 13, 1297504: 13, 2919520: 13, 3253856: 13, 3250320: 13, 3252368: 13, 3249840: 14, 3249872: 14, 773216: 14, 3247392: 14, 2935904: 14, 3254368: 14, 3249808: 14, 3252880: 14, 3249824: 15, 3249888: 15, 789600: 15, 3247904: 15, 2952288: 15, 3254880: 15, 3254384: 15, 3253392: 15, 3252896: 15, 3249904: 16, 805984: 16, 3248416: 16, 2968672: 16, 3255392: 16, 3254400: 16, 3253904: 16, 3252912: 16, 3249392: 17, 3249920: 17, 822368: 17, 3248400: 17, 2444384: 17, 3247440: 17, 2985056: 17, 3255904: 17, 3254416: 17, 3252928: 17, 3248880: 18, 3249936: 18, 838752: 18, 3248384: 18, 1920096: 18, 3247952: 18, 3001440: 18, 3256416: 18, 3255920: 18, 3254432: 18, 3252944: 18, 3248368: 19, 3249952: 19, 855136: 19, 1395808: 19, 3248464: 19, 3017824: 19, 3256928: 19, 3255936: 19, 3254448: 19, 3252960: 19, 3250464: 20, 871520: 20, 3248976: 20, 3248480: 20, 3034208: 20, 3257440: 20, 3255952: 20, 3254464: 20, 3252976: 20, 3250976: 21, 887904: 21, 3249488: 21, 3248496: 21, 3050592: 21, 3256464: 21, 3255968: 21, 3254976: 21, 3252992: 21, 3251488: 22, 904288: 22, 3250000: 22, 3248512: 22, 2526304: 22, 3247520: 22, 3256976: 22, 3255984: 22, 3255488: 22, 3253008: 22, 3252000: 23, 3251504: 23, 920672: 23, 3250512: 23, 3248528: 23, 2002016: 23, 3248032: 23, 3257488: 23, 3256000: 23, 3253024: 23, 3252512: 24, 3251520: 24, 937056: 24, 3251024: 24, 3248544: 24, 1477728: 24, 3257504: 24, 3256016: 24, 3253536: 24, 3251536: 25, 953440: 25, 3257520: 25, 3256032: 25, 3254048: 25, 3252048: 26, 3257536: 26, 3256048: 26, 3254560: 26, 3252560: 27, 3258048: 27, 3255536: 27, 3256064: 27, 3254544: 27, 3254576: 27, 3253072: 28, 3258560: 28, 3255024: 28, 3256080: 28, 3254528: 28, 3254592: 28, 3253584: 29, 3259072: 29, 3254512: 29, 3256096: 29, 3254608: 29, 3254096: 30, 3259056: 30, 3259088: 30, 3256608: 30, 3256112: 30, 3255120: 30, 3254624: 30, 3259040: 31, 3259104: 31, 3257120: 31, 3256128: 31, 3255632: 31, 3254640: 31, 3259024: 32, 3259120: 32, 3257632: 32, 3256144: 32, 3254656: 32, 3258976: 33, 3259008: 33, 3258608: 33, 3259136: 33, 3257616: 33, 3256656: 33, 3254672: 33, 3258992: 34, 3258096: 34, 3259152: 34, 3257600: 34, 3257168: 34, 3254688: 34, 3257584: 35, 3259168: 35, 3257680: 35, 3255200: 35, 3259184: 36, 3257696: 36, 3255712: 36, 3259200: 37, 3257712: 37, 3256224: 37, 3259216: 38, 3257728: 38, 3256208: 38, 3259232: 39, 3257216: 39, 3257744: 39, 3256192: 39, 3259248: 40, 3256704: 40, 3257760: 40, 3259264: 41, 3258272: 41, 3259280: 42, 3258784: 42, 3259296: 43, 3772000: 0, 3772512: 1, 3773024: 2, 2739808: 3, 3773536: 3, 2756192: 4, 3774048: 4, 2772576: 5, 3774560: 5, 3296864: 6, 2788960: 6, 3775072: 6, 642656: 7, 3772048: 7, 2805344: 7, 3775584: 7, 659040: 8, 3772560: 8, 2821728: 8, 3776096: 8, 3775600: 8, 675424: 9, 3772576: 9, 2297440: 9, 2838112: 9, 3776608: 9, 3775616: 9, 691808: 10, 3772592: 10, 1773152: 10, 2854496: 10, 3777120: 10, 3775632: 10, 708192: 11, 3772608: 11, 1248864: 11, 2870880: 11, 3777632: 11, 3775120: 11, 3776144: 11, 724576: 12, 3773120: 12, 2346592: 12, 2887264: 12, 3778144: 12, 3774608: 12, 3776656: 12, 3773632: 13, 1822304: 13, 2903648: 13, 3778656: 13, 3774096: 13, 3777168: 13, 3774144: 14, 1298016: 14, 2920032: 14, 3779168: 14, 3778672: 14, 3774112: 14, 3777680: 14, 3777184: 14, 3774128: 15, 3774160: 15, 773728: 15, 3444320: 15, 2936416: 15, 3779680: 15, 3778688: 15, 3778192: 15, 3777200: 15, 3774176: 16, 790112: 16, 3772192: 16, 2952800: 16, 3780192: 16, 3778704: 16, 3777216: 16, 3774192: 17, 806496: 17, 3772704: 17, 2969184: 17, 3780704: 17, 3780208: 17, 3778720: 17, 3777232: 17, 3773680: 18, 3774208: 18, 822880: 18, 3772688: 18, 2444896: 18, 3493472: 18, 2985568: 18, 3781216: 18, 3780224: 18, 3778736: 18, 3777248: 18, 3773168: 19, 3774224: 19, 839264: 19, 3772672: 19, 1920608: 19, 3772240: 19, 3001952: 19, 3781728: 19, 3780240: 19, 3778752: 19, 3777264: 19, 3772656: 20, 3774240: 20, 855648: 20, 1396320: 20, 3772752: 20, 3018336: 20, 3780752: 20, 3780256: 20, 3779264: 20, 3777280: 20, 3774752: 21, 872032: 21, 3773264: 21, 3772768: 21, 3034720: 21, 3781264: 21, 3780272: 21, 3779776: 21, 3777296: 21, 3775264: 22, 888416: 22, 3773776: 22, 3772784: 22, 3051104: 22, 3781776: 22, 3780288: 22, 3777312: 22, 3775776: 23, 904800: 23, 3774288: 23, 3772800: 23, 2526816: 23, 3575392: 23, 3781792: 23, 3780304: 23, 3776800: 23, 3777824: 23, 3776288: 24, 3775792: 24, 921184: 24, 3774800: 24, 3772816: 24, 2002528: 24, 3772320: 24, 3781808: 24, 3780320: 24, 3778336: 24, 3775808: 25, 937568: 25, 3775312: 25, 3772832: 25, 1478240: 25, 3781824: 25, 3780336: 25, 3778848: 25, 3775824: 26, 953952: 26, 3782336: 26, 3779824: 26, 3780352: 26, 3778832: 26, 3778864: 26, 3776336: 27, 3782848: 27, 3779312: 27, 3780368: 27, 3778816: 27, 3778880: 27, 3776848: 28, 3783360: 28, 3778800: 28, 3780384: 28, 3778896: 28, 3777360: 29, 3783344: 29, 3783376: 29, 3780896: 29, 3780400: 29, 3778384: 29, 3779408: 29, 3778912: 29, 3777872: 30, 3783328: 30, 3783392: 30, 3781408: 30, 3780416: 30, 3779920: 30, 3778928: 30, 3783312: 31, 3783408: 31, 3781920: 31, 3780432: 31, 3778944: 31, 3783264: 32, 3783296: 32, 3782896: 32, 3783424: 32, 3781904: 32, 3780944: 32, 3778960: 32, 3783280: 33, 3782384: 33, 3783440: 33, 3781888: 33, 3781456: 33, 3778976: 33, 3781872: 34, 3783456: 34, 3781968: 34, 3779488: 34, 3783472: 35, 3781984: 35, 3780000: 35, 3783488: 36, 3782000: 36, 3780512: 36, 3783504: 37, 3782016: 37, 3780496: 37, 3783520: 38, 3781504: 38, 3782032: 38, 3780480: 38, 3783536: 39, 3780992: 39, 3782048: 39, 3783552: 40, 3782560: 40, 3783568: 41, 3783072: 41, 3783584: 42, 4296800: 0, 4297312: 1, 4297824: 2, 4298336: 3, 2740320: 4, 4298848: 4, 2756704: 5, 4299360: 5, 2773088: 6, 4299872: 6, 3297376: 7, 2789472: 7, 4300384: 7, 4299888: 7, 643168: 8, 3821664: 8, 2805856: 8, 4300896: 8, 4299904: 8, 659552: 9, 4296848: 9, 2822240: 9, 4301408: 9, 4299920: 9, 675936: 10, 4296864: 10, 2297952: 10, 2838624: 10, 4301920: 10, 4299408: 10, 4300432: 10, 692320: 11, 4296880: 11, 1773664: 11, 2855008: 11, 4302432: 11, 4298896: 11, 4300944: 11, 708704: 12, 4296896: 12, 1249376: 12, 2871392: 12, 4302944: 12, 4298384: 12, 4301456: 12, 725088: 13, 4297408: 13, 2347104: 13, 2887776: 13, 4303456: 13, 4302960: 13, 4298400: 13, 4301968: 13, 4301472: 13, 4297920: 14, 1822816: 14, 2904160: 14, 4303968: 14, 4302976: 14, 4298416: 14, 4302480: 14, 4301488: 14, 4298432: 15, 1298528: 15, 2920544: 15, 4304480: 15, 4302992: 15, 4301504: 15, 4298448: 16, 774240: 16, 3444832: 16, 2936928: 16, 4304992: 16, 4304496: 16, 4303008: 16, 4301520: 16, 4298464: 17, 790624: 17, 3969120: 17, 2953312: 17, 4305504: 17, 4304512: 17, 4303024: 17, 4301536: 17, 4298480: 18, 807008: 18, 4296992: 18, 2969696: 18, 4306016: 18, 4304528: 18, 4303040: 18, 4301552: 18, 4297968: 19, 4298496: 19, 823392: 19, 4296976: 19, 2445408: 19, 3493984: 19, 2986080: 19, 4305040: 19, 4304544: 19, 4303552: 19, 4301568: 19, 4297456: 20, 4298512: 20, 839776: 20, 4296960: 20, 1921120: 20, 4018272: 20, 3002464: 20, 4305552: 20, 4304560: 20, 4304064: 20, 4301584: 20, 4296944: 21, 4298528: 21, 856160: 21, 1396832: 21, 4297040: 21, 3018848: 21, 4306064: 21, 4304576: 21, 4301600: 21, 4299040: 22, 872544: 22, 4297552: 22, 4297056: 22, 3035232: 22, 4306080: 22, 4304592: 22, 4301088: 22, 4302112: 22, 4299552: 23, 888928: 23, 4298064: 23, 4297072: 23, 3051616: 23, 4306096: 23, 4304608: 23, 4300576: 23, 4302624: 23, 4300064: 24, 905312: 24, 4298576: 24, 4297088: 24, 2527328: 24, 3575904: 24, 4306112: 24, 4304624: 24, 4303136: 24, 4300080: 25, 921696: 25, 4299088: 25, 4297104: 25, 2003040: 25, 4100192: 25, 4306624: 25, 4304112: 25, 4304640: 25, 4303120: 25, 4303152: 25, 4300096: 26, 938080: 26, 4299600: 26, 4297120: 26, 1478752: 26, 4307136: 26, 4303600: 26, 4304656: 26, 4303104: 26, 4303168: 26, 4300112: 27, 954464: 27, 4307648: 27, 4303088: 27, 4304672: 27, 4303184: 27, 4300624: 28, 4307632: 28, 4307664: 28, 4305184: 28, 4304688: 28, 4302672: 28, 4303696: 28, 4303200: 28, 4301136: 29, 4307616: 29, 4307680: 29, 4305696: 29, 4304704: 29, 4302160: 29, 4304208: 29, 4303216: 29, 4301648: 30, 4307600: 30, 4307696: 30, 4306208: 30, 4304720: 30, 4303232: 30, 4307552: 31, 4307584: 31, 4307184: 31, 4307712: 31, 4306192: 31, 4305232: 31, 4303248: 31, 4307568: 32, 4306672: 32, 4307728: 32, 4306176: 32, 4305744: 32, 4303264: 32, 4306160: 33, 4307744: 33, 4306256: 33, 4303776: 33, 4307760: 34, 4306272: 34, 4304288: 34, 4307776: 35, 4306288: 35, 4304800: 35, 4307792: 36, 4306304: 36, 4304784: 36, 4307808: 37, 4305792: 37, 4306320: 37, 4304768: 37, 4307824: 38, 4305280: 38, 4306336: 38, 4307840: 39, 4306848: 39, 4307856: 40, 4307360: 40, 4307872: 41, 4821600: 0, 4822112: 1, 4822624: 2, 4823136: 3, 4823648: 4, 2740832: 5, 4824160: 5, 2757216: 6, 4824672: 6, 4824176: 6, 2773600: 7, 4825184: 7, 4824192: 7, 3297888: 8, 2789984: 8, 4825696: 8, 4824208: 8, 643680: 9, 3822176: 9, 2806368: 9, 4826208: 9, 4823696: 9, 4824720: 9, 660064: 10, 4346464: 10, 2822752: 10, 4826720: 10, 4823184: 10, 4825232: 10, 676448: 11, 4362848: 11, 2298464: 11, 2839136: 11, 4827232: 11, 4822672: 11, 4825744: 11, 692832: 12, 4379232: 12, 1774176: 12, 2855520: 12, 4827744: 12, 4827248: 12, 4822688: 12, 4826256: 12, 4825760: 12, 709216: 13, 4395616: 13, 1249888: 13, 2871904: 13, 4828256: 13, 4827264: 13, 4822704: 13, 4826768: 13, 4825776: 13, 725600: 14, 4821696: 14, 2347616: 14, 2888288: 14, 4828768: 14, 4827280: 14, 4822720: 14, 4825792: 14, 4822208: 15, 1823328: 15, 2904672: 15, 4829280: 15, 4828784: 15, 4827296: 15, 4822736: 15, 4825808: 15, 1299040: 16, 2921056: 16, 4829792: 16, 4828800: 16, 4827312: 16, 4822752: 16, 4825824: 16, 774752: 17, 3445344: 17, 2937440: 17, 4830304: 17, 4828816: 17, 4827328: 17, 4822768: 17, 4825840: 17, 791136: 18, 3969632: 18, 2953824: 18, 4829328: 18, 4828832: 18, 4827840: 18, 4822256: 18, 4822784: 18, 4825856: 18, 807520: 19, 4493920: 19, 2970208: 19, 4829840: 19, 4828848: 19, 4828352: 19, 4821744: 19, 4822800: 19, 4825872: 19, 823904: 20, 4477536: 20, 2445920: 20, 3494496: 20, 2986592: 20, 4830352: 20, 4828864: 20, 4444768: 20, 4822816: 20, 4825888: 20, 840288: 21, 4461152: 21, 1921632: 21, 4018784: 21, 3002976: 21, 4830368: 21, 4828880: 21, 4823328: 21, 4825376: 21, 4826400: 21, 856672: 22, 1397344: 22, 4543072: 22, 3019360: 22, 4830384: 22, 4828896: 22, 4823840: 22, 4824864: 22, 4826912: 22, 873056: 23, 4821840: 23, 4559456: 23, 3035744: 23, 4830400: 23, 4828912: 23, 4824352: 23, 4827424: 23, 889440: 24, 4822352: 24, 4575840: 24, 3052128: 24, 4830912: 24, 4828400: 24, 4828928: 24, 4824368: 24, 4827408: 24, 4827440: 24, 905824: 25, 4822864: 25, 4592224: 25, 2527840: 25, 3576416: 25, 4831424: 25, 4827888: 25, 4828944: 25, 4824384: 25, 4827392: 25, 4827456: 25, 922208: 26, 4823376: 26, 4608608: 26, 2003552: 26, 4100704: 26, 4831936: 26, 4827376: 26, 4828960: 26, 4824400: 26, 4827472: 26, 938592: 27, 4823888: 27, 4624992: 27, 1479264: 27, 4831920: 27, 4831952: 27, 4829472: 27, 4828976: 27, 4824912: 27, 4826960: 27, 4827984: 27, 4827488: 27, 954976: 28, 4831904: 28, 4831968: 28, 4829984: 28, 4828992: 28, 4825424: 28, 4826448: 28, 4828496: 28, 4827504: 28, 4831888: 29, 4831984: 29, 4830496: 29, 4829008: 29, 4825936: 29, 4827520: 29, 4831840: 30, 4831872: 30, 4831472: 30, 4832000: 30, 4830480: 30, 4829520: 30, 4827536: 30, 4831856: 31, 4830960: 31, 4832016: 31, 4830464: 31, 4830032: 31, 4827552: 31, 4830448: 32, 4832032: 32, 4830544: 32, 4828064: 32, 4832048: 33, 4830560: 33, 4828576: 33, 4832064: 34, 4830576: 34, 4829088: 34, 4832080: 35, 4830592: 35, 4829072: 35, 4832096: 36, 4830080: 36, 4830608: 36, 4829056: 36, 4832112: 37, 4829568: 37, 4830624: 37, 4832128: 38, 4831136: 38, 4832144: 39, 4831648: 39, 4832160: 40, 5346400: 0, 5346912: 1, 5347424: 2, 5347936: 3, 5348448: 4, 5348960: 5, 5348464: 5, 2741344: 6, 5349472: 6, 5348480: 6, 2757728: 7, 5349984: 7, 5348496: 7, 2774112: 8, 5350496: 8, 5347984: 8, 5349008: 8, 3298400: 9, 2790496: 9, 5351008: 9, 5347472: 9, 5349520: 9, 644192: 10, 3822688: 10, 2806880: 10, 5351520: 10, 5346960: 10, 5350032: 10, 660576: 11, 4346976: 11, 2823264: 11, 5352032: 11, 5351536: 11, 5346976: 11, 5350544: 11, 5350048: 11, 676960: 12, 4363360: 12, 2298976: 12, 2839648: 12, 5352544: 12, 5351552: 12, 5346992: 12, 5351056: 12, 5350064: 12, 693344: 13, 4379744: 13, 1774688: 13, 2856032: 13, 5353056: 13, 5351568: 13, 5347008: 13, 5350080: 13, 709728: 14, 4396128: 14, 1250400: 14, 2872416: 14, 5353568: 14, 5353072: 14, 5351584: 14, 5346496: 14, 5347024: 14, 5350096: 14, 726112: 15, 4920416: 15, 2348128: 15, 2888800: 15, 5354080: 15, 5353088: 15, 5351600: 15, 5347040: 15, 5350112: 15, 1823840: 16, 2905184: 16, 5354592: 16, 5353104: 16, 5351616: 16, 5347056: 16, 5350128: 16, 1299552: 17, 2921568: 17, 5353616: 17, 5353120: 17, 5352128: 17, 5346544: 17, 5347072: 17, 5350144: 17, 775264: 18, 3445856: 18, 2937952: 18, 5354128: 18, 5353136: 18, 5352640: 18, 4969568: 18, 5347088: 18, 5350160: 18, 791648: 19, 3970144: 19, 2954336: 19, 5354640: 19, 5353152: 19, 4445280: 19, 5347104: 19, 5350176: 19, 808032: 20, 4494432: 20, 2970720: 20, 5354656: 20, 5353168: 20, 4461664: 20, 5347616: 20, 5349664: 20, 5350688: 20, 824416: 21, 4478048: 21, 2446432: 21, 3495008: 21, 2987104: 21, 5354672: 21, 5353184: 21, 5348128: 21, 5349152: 21, 5351200: 21, 840800: 22, 1922144: 22, 4019296: 22, 3003488: 22, 5354688: 22, 5353200: 22, 5348640: 22, 5351712: 22, 857184: 23, 1397856: 23, 4543584: 23, 3019872: 23, 5355200: 23, 5352688: 23, 5353216: 23, 5348656: 23, 5351696: 23, 5351728: 23, 873568: 24, 5067872: 24, 4559968: 24, 3036256: 24, 5355712: 24, 5352176: 24, 5353232: 24, 5348672: 24, 5351680: 24, 5351744: 24, 889952: 25, 5346640: 25, 4576352: 25, 3052640: 25, 5356224: 25, 5351664: 25, 5353248: 25, 5348688: 25, 5351760: 25, 906336: 26, 5347152: 26, 4592736: 26, 2528352: 26, 3576928: 26, 5356208: 26, 5356240: 26, 5353760: 26, 5353264: 26, 5348176: 26, 5349200: 26, 5351248: 26, 5352272: 26, 5351776: 26, 922720: 27, 5347664: 27, 4609120: 27, 2004064: 27, 4101216: 27, 5356192: 27, 5356256: 27, 5354272: 27, 5353280: 27, 5349712: 27, 5350736: 27, 5352784: 27, 5351792: 27, 939104: 28, 4625504: 28, 1479776: 28, 5356176: 28, 5356272: 28, 5354784: 28, 5353296: 28, 5350224: 28, 5351808: 28, 955488: 29, 5356128: 29, 5356160: 29, 5355760: 29, 5356288: 29, 5354768: 29, 5353808: 29, 5351824: 29, 5356144: 30, 5355248: 30, 5356304: 30, 5354752: 30, 5354320: 30, 5351840: 30, 5354736: 31, 5356320: 31, 5354832: 31, 5352352: 31, 5356336: 32, 5354848: 32, 5352864: 32, 5356352: 33, 5354864: 33, 5353376: 33, 5356368: 34, 5354880: 34, 5353360: 34, 5356384: 35, 5354368: 35, 5354896: 35, 5353344: 35, 5356400: 36, 5353856: 36, 5354912: 36, 5356416: 37, 5355424: 37, 5356432: 38, 5355936: 38, 5356448: 39, 5871200: 0, 5871712: 1, 5872224: 2, 5872736: 3, 5873248: 4, 5872752: 4, 5873760: 5, 5872768: 5, 5874272: 6, 5872784: 6, 2741856: 7, 5874784: 7, 5872272: 7, 5873296: 7, 2758240: 8, 5875296: 8, 5871760: 8, 5873808: 8, 2774624: 9, 5875808: 9, 5871248: 9, 5874320: 9, 3298912: 10, 2791008: 10, 5876320: 10, 5875824: 10, 5871264: 10, 5874832: 10, 5874336: 10, 644704: 11, 3823200: 11, 2807392: 11, 5876832: 11, 5875840: 11, 5871280: 11, 5875344: 11, 5874352: 11, 661088: 12, 4347488: 12, 2823776: 12, 5877344: 12, 5875856: 12, 5871296: 12, 5874368: 12, 677472: 13, 4363872: 13, 2299488: 13, 2840160: 13, 5877856: 13, 5877360: 13, 5875872: 13, 5445216: 13, 5871312: 13, 5874384: 13, 693856: 14, 4380256: 14, 1775200: 14, 2856544: 14, 5878368: 14, 5877376: 14, 5875888: 14, 4920928: 14, 5871328: 14, 5874400: 14, 710240: 15, 4396640: 15, 1250912: 15, 2872928: 15, 5878880: 15, 5877392: 15, 5875904: 15, 5871344: 15, 5874416: 15, 726624: 16, 2348640: 16, 2889312: 16, 5877904: 16, 5877408: 16, 5876416: 16, 5494368: 16, 5871360: 16, 5874432: 16, 1824352: 17, 2905696: 17, 5878416: 17, 5877424: 17, 5876928: 17, 4970080: 17, 5871376: 17, 5874448: 17, 1300064: 18, 2922080: 18, 5878928: 18, 5877440: 18, 4445792: 18, 5871392: 18, 5874464: 18, 775776: 19, 3446368: 19, 2938464: 19, 5878944: 19, 5877456: 19, 4462176: 19, 5871904: 19, 5873952: 19, 5874976: 19, 792160: 20, 3970656: 20, 2954848: 20, 5878960: 20, 5877472: 20, 4478560: 20, 5872416: 20, 5873440: 20, 5875488: 20, 808544: 21, 4494944: 21, 2971232: 21, 5878976: 21, 5877488: 21, 5872928: 21, 5876000: 21, 824928: 22, 2446944: 22, 3495520: 22, 2987616: 22, 5879488: 22, 5876976: 22, 5877504: 22, 5872944: 22, 5875984: 22, 5876016: 22, 841312: 23, 1922656: 23, 4019808: 23, 3004000: 23, 5880000: 23, 5876464: 23, 5877520: 23, 5872960: 23, 5875968: 23, 5876032: 23, 857696: 24, 1398368: 24, 4544096: 24, 3020384: 24, 5880512: 24, 5875952: 24, 5877536: 24, 5872976: 24, 5876048: 24, 874080: 25, 5068384: 25, 4560480: 25, 3036768: 25, 5880496: 25, 5880528: 25, 5878048: 25, 5877552: 25, 5872464: 25, 5873488: 25, 5875536: 25, 5876560: 25, 5876064: 25, 890464: 26, 5592672: 26, 4576864: 26, 3053152: 26, 5880480: 26, 5880544: 26, 5878560: 26, 5877568: 26, 5871952: 26, 5874000: 26, 5875024: 26, 5877072: 26, 5876080: 26, 906848: 27, 5871440: 27, 4593248: 27, 2528864: 27, 3577440: 27, 5880464: 27, 5880560: 27, 5879072: 27, 5877584: 27, 5874512: 27, 5876096: 27, 923232: 28, 4609632: 28, 2004576: 28, 4101728: 28, 5880416: 28, 5880448: 28, 5880048: 28, 5880576: 28, 5879056: 28, 5878096: 28, 5876112: 28, 939616: 29, 4626016: 29, 1480288: 29, 5880432: 29, 5879536: 29, 5880592: 29, 5879040: 29, 5878608: 29, 5876128: 29, 956000: 30, 5879024: 30, 5880608: 30, 5879120: 30, 5876640: 30, 5880624: 31, 5879136: 31, 5877152: 31, 5880640: 32, 5879152: 32, 5877664: 32, 5880656: 33, 5879168: 33, 5877648: 33, 5880672: 34, 5878656: 34, 5879184: 34, 5877632: 34, 5880688: 35, 5878144: 35, 5879200: 35, 5880704: 36, 5879712: 36, 5880720: 37, 5880224: 37, 5880736: 38, 6396000: 0, 6396512: 1, 6397024: 2, 6397536: 3, 6397040: 3, 6398048: 4, 6397056: 4, 6398560: 5, 6397072: 5, 6399072: 6, 6396560: 6, 6397584: 6, 6399584: 7, 6396048: 7, 6398096: 7, 2742368: 8, 6400096: 8, 5920864: 8, 6398608: 8, 2758752: 9, 6400608: 9, 6400112: 9, 5937248: 9, 6399120: 9, 6398624: 9, 2775136: 10, 6401120: 10, 6400128: 10, 5953632: 10, 6399632: 10, 6398640: 10, 3299424: 11, 2791520: 11, 6401632: 11, 6400144: 11, 5970016: 11, 6398656: 11, 645216: 12, 3823712: 12, 2807904: 12, 6402144: 12, 6401648: 12, 6400160: 12, 5445728: 12, 5986400: 12, 6398672: 12, 661600: 13, 4348000: 13, 2824288: 13, 6402656: 13, 6401664: 13, 6400176: 13, 4921440: 13, 6002784: 13, 6398688: 13, 677984: 14, 4364384: 14, 2300000: 14, 2840672: 14, 6403168: 14, 6401680: 14, 6400192: 14, 4397152: 14, 6019168: 14, 6398704: 14, 694368: 15, 4380768: 15, 1775712: 15, 2857056: 15, 6402192: 15, 6401696: 15, 6400704: 15, 5494880: 15, 6035552: 15, 6398720: 15, 710752: 16, 1251424: 16, 2873440: 16, 6402704: 16, 6401712: 16, 6401216: 16, 4970592: 16, 6051936: 16, 6398736: 16, 727136: 17, 2349152: 17, 2889824: 17, 6403216: 17, 6401728: 17, 4446304: 17, 6068320: 17, 6398752: 17, 1824864: 18, 2906208: 18, 6403232: 18, 6401744: 18, 4462688: 18, 6396192: 18, 6398240: 18, 6399264: 18, 1300576: 19, 2922592: 19, 6403248: 19, 6401760: 19, 4479072: 19, 6396704: 19, 6397728: 19, 6399776: 19, 776288: 20, 3446880: 20, 2938976: 20, 6403264: 20, 6401776: 20, 4495456: 20, 6397216: 20, 6400288: 20, 792672: 21, 3971168: 21, 2955360: 21, 6403776: 21, 6401264: 21, 6401792: 21, 6397232: 21, 6400272: 21, 6400304: 21, 809056: 22, 2971744: 22, 6404288: 22, 6400752: 22, 6401808: 22, 6397248: 22, 6400256: 22, 6400320: 22, 825440: 23, 2447456: 23, 3496032: 23, 2988128: 23, 6404800: 23, 6400240: 23, 6401824: 23, 6397264: 23, 6400336: 23, 841824: 24, 1923168: 24, 4020320: 24, 3004512: 24, 6404784: 24, 6404816: 24, 6402336: 24, 6401840: 24, 6396752: 24, 6397776: 24, 6399824: 24, 6400848: 24, 6400352: 24, 858208: 25, 1398880: 25, 4544608: 25, 3020896: 25, 6404768: 25, 6404832: 25, 6402848: 25, 6401856: 25, 6396240: 25, 6398288: 25, 6399312: 25, 6401360: 25, 6400368: 25, 874592: 26, 5068896: 26, 4560992: 26, 3037280: 26, 6404752: 26, 6404848: 26, 6403360: 26, 6401872: 26, 6117472: 26, 6398800: 26, 6400384: 26, 890976: 27, 5593184: 27, 4577376: 27, 3053664: 27, 6404704: 27, 6404736: 27, 6404336: 27, 6404864: 27, 6403344: 27, 6402384: 27, 6400400: 27, 907360: 28, 4593760: 28, 2529376: 28, 3577952: 28, 6404720: 28, 6403824: 28, 6404880: 28, 6403328: 28, 6402896: 28, 6400416: 28, 923744: 29, 4610144: 29, 2005088: 29, 4102240: 29, 6403312: 29, 6404896: 29, 6403408: 29, 6400928: 29, 940128: 30, 4626528: 30, 1480800: 30, 6404912: 30, 6403424: 30, 6401440: 30, 956512: 31, 6404928: 31, 6403440: 31, 6401952: 31, 6404944: 32, 6403456: 32, 6401936: 32, 6404960: 33, 6402944: 33, 6403472: 33, 6401920: 33, 6404976: 34, 6402432: 34, 6403488: 34, 6404992: 35, 6404000: 35, 6405008: 36, 6404512: 36, 6405024: 37, 6920800: 0, 6921312: 1, 6921824: 2, 6921328: 2, 6922336: 3, 6921344: 3, 6922848: 4, 6921360: 4, 6923360: 5, 6920848: 5, 6921872: 5, 6923872: 6, 6445664: 6, 6922384: 6, 6924384: 7, 5921376: 7, 6922896: 7, 6924896: 8, 6924400: 8, 5937760: 8, 6923408: 8, 6922912: 8, 2742880: 9, 6925408: 9, 6924416: 9, 5954144: 9, 6923920: 9, 6922928: 9, 2759264: 10, 6925920: 10, 6924432: 10, 5970528: 10, 6922944: 10, 2775648: 11, 6926432: 11, 6925936: 11, 6924448: 11, 5446240: 11, 5986912: 11, 6922960: 11, 3299936: 12, 2792032: 12, 6926944: 12, 6925952: 12, 6924464: 12, 4921952: 12, 6003296: 12, 6922976: 12, 645728: 13, 3824224: 13, 2808416: 13, 6927456: 13, 6925968: 13, 6924480: 13, 4397664: 13, 6019680: 13, 6922992: 13, 662112: 14, 4348512: 14, 2824800: 14, 6926480: 14, 6925984: 14, 6924992: 14, 4381280: 14, 5495392: 14, 6036064: 14, 6923008: 14, 678496: 15, 4364896: 15, 2300512: 15, 2841184: 15, 6926992: 15, 6926000: 15, 6925504: 15, 4971104: 15, 6052448: 15, 6923024: 15, 694880: 16, 1776224: 16, 2857568: 16, 6927504: 16, 6926016: 16, 4446816: 16, 6068832: 16, 6923040: 16, 711264: 17, 1251936: 17, 2873952: 17, 6927520: 17, 6926032: 17, 4463200: 17, 6593120: 17, 6922528: 17, 6923552: 17, 727648: 18, 2349664: 18, 2890336: 18, 6927536: 18, 6926048: 18, 4479584: 18, 6920992: 18, 6922016: 18, 6924064: 18, 1825376: 19, 2906720: 19, 6927552: 19, 6926064: 19, 4495968: 19, 6921504: 19, 6924576: 19, 1301088: 20, 2923104: 20, 6928064: 20, 6925552: 20, 6926080: 20, 3971680: 20, 6921520: 20, 6924560: 20, 6924592: 20, 776800: 21, 3447392: 21, 2939488: 21, 6928576: 21, 6925040: 21, 6926096: 21, 6921536: 21, 6924544: 21, 6924608: 21, 793184: 22, 2955872: 22, 6929088: 22, 6924528: 22, 6926112: 22, 6921552: 22, 6924624: 22, 809568: 23, 2972256: 23, 6929072: 23, 6929104: 23, 6926624: 23, 6926128: 23, 6921040: 23, 6922064: 23, 6924112: 23, 6925136: 23, 6924640: 23, 825952: 24, 2447968: 24, 3496544: 24, 2988640: 24, 6929056: 24, 6929120: 24, 6927136: 24, 6926144: 24, 6642272: 24, 6922576: 24, 6923600: 24, 6925648: 24, 6924656: 24, 842336: 25, 1923680: 25, 4020832: 25, 3005024: 25, 6929040: 25, 6929136: 25, 6927648: 25, 6926160: 25, 6117984: 25, 6923088: 25, 6924672: 25, 858720: 26, 1399392: 26, 4545120: 26, 3021408: 26, 6928992: 26, 6929024: 26, 6928624: 26, 6929152: 26, 6927632: 26, 6926672: 26, 5593696: 26, 6924688: 26, 875104: 27, 5069408: 27, 4561504: 27, 3037792: 27, 6929008: 27, 6928112: 27, 6929168: 27, 6927616: 27, 6927184: 27, 6924704: 27, 891488: 28, 4577888: 28, 3054176: 28, 6927600: 28, 6929184: 28, 6927696: 28, 6925216: 28, 907872: 29, 4594272: 29, 2529888: 29, 3578464: 29, 6929200: 29, 6927712: 29, 6925728: 29, 924256: 30, 4610656: 30, 2005600: 30, 4102752: 30, 6929216: 30, 6927728: 30, 6926240: 30, 940640: 31, 4627040: 31, 1481312: 31, 6929232: 31, 6927744: 31, 6926224: 31, 957024: 32, 6929248: 32, 6927232: 32, 6927760: 32, 6926208: 32, 6929264: 33, 6926720: 33, 6927776: 33, 6929280: 34, 6928288: 34, 6929296: 35, 6928800: 35, 6929312: 36, 7445600: 0, 7446112: 1, 7445616: 1, 7446624: 2, 7445632: 2, 7447136: 3, 7445648: 3, 7447648: 4, 6970464: 4, 7446160: 4, 7448160: 5, 6446176: 5, 7446672: 5, 7448672: 6, 5921888: 6, 7447184: 6, 7449184: 7, 7448688: 7, 5938272: 7, 7447696: 7, 7447200: 7, 7449696: 8, 7448704: 8, 5954656: 8, 7448208: 8, 7447216: 8, 7450208: 9, 7448720: 9, 5971040: 9, 7447232: 9, 2743392: 10, 7450720: 10, 7450224: 10, 7448736: 10, 5446752: 10, 5987424: 10, 7447248: 10, 2759776: 11, 7451232: 11, 7450240: 11, 7448752: 11, 4922464: 11, 6003808: 11, 7447264: 11, 2776160: 12, 7451744: 12, 7450256: 12, 7448768: 12, 4398176: 12, 6020192: 12, 7447280: 12, 3300448: 13, 2792544: 13, 7450768: 13, 7450272: 13, 7449280: 13, 4381792: 13, 5495904: 13, 6036576: 13, 7447296: 13, 646240: 14, 3824736: 14, 2808928: 14, 7451280: 14, 7450288: 14, 7449792: 14, 4365408: 14, 4971616: 14, 6052960: 14, 7447312: 14, 662624: 15, 4349024: 15, 2825312: 15, 7451792: 15, 7450304: 15, 4447328: 15, 6069344: 15, 7447328: 15, 679008: 16, 2301024: 16, 2841696: 16, 7451808: 16, 7450320: 16, 4463712: 16, 6593632: 16, 7446816: 16, 7447840: 16, 695392: 17, 1776736: 17, 2858080: 17, 7451824: 17, 7450336: 17, 4480096: 17, 7117920: 17, 7446304: 17, 7448352: 17, 711776: 18, 1252448: 18, 2874464: 18, 7451840: 18, 7450352: 18, 4496480: 18, 7445792: 18, 7448864: 18, 728160: 19, 2350176: 19, 2890848: 19, 7452352: 19, 7449840: 19, 7450368: 19, 3972192: 19, 7445808: 19, 7448848: 19, 7448880: 19, 1825888: 20, 2907232: 20, 7452864: 20, 7449328: 20, 7450384: 20, 3447904: 20, 7445824: 20, 7448832: 20, 7448896: 20, 1301600: 21, 2923616: 21, 7453376: 21, 7448816: 21, 7450400: 21, 7445840: 21, 7448912: 21, 777312: 22, 2940000: 22, 7453360: 22, 7453392: 22, 7450912: 22, 7450416: 22, 7167072: 22, 7446352: 22, 7448400: 22, 7449424: 22, 7448928: 22, 793696: 23, 2956384: 23, 7453344: 23, 7453408: 23, 7451424: 23, 7450432: 23, 6642784: 23, 7446864: 23, 7447888: 23, 7449936: 23, 7448944: 23, 810080: 24, 2972768: 24, 7453328: 24, 7453424: 24, 7451936: 24, 7450448: 24, 6118496: 24, 7447376: 24, 7448960: 24, 826464: 25, 2448480: 25, 3497056: 25, 2989152: 25, 7453280: 25, 7453312: 25, 7452912: 25, 7453440: 25, 7451920: 25, 7450960: 25, 5594208: 25, 7448976: 25, 842848: 26, 1924192: 26, 4021344: 26, 3005536: 26, 7453296: 26, 7452400: 26, 7453456: 26, 7451904: 26, 7451472: 26, 5069920: 26, 7448992: 26, 859232: 27, 1399904: 27, 4545632: 27, 3021920: 27, 7451888: 27, 7453472: 27, 7451984: 27, 7449504: 27, 875616: 28, 4562016: 28, 3038304: 28, 7453488: 28, 7452000: 28, 7450016: 28, 892000: 29, 4578400: 29, 3054688: 29, 7453504: 29, 7452016: 29, 7450528: 29, 908384: 30, 4594784: 30, 2530400: 30, 3578976: 30, 7453520: 30, 7452032: 30, 7450512: 30, 924768: 31, 4611168: 31, 2006112: 31, 4103264: 31, 7453536: 31, 7451520: 31, 7452048: 31, 7450496: 31, 941152: 32, 4627552: 32, 1481824: 32, 7453552: 32, 7451008: 32, 7452064: 32, 957536: 33, 7453568: 33, 7452576: 33, 7453584: 34, 7453088: 34, 7453600: 35, 7970400: 0, 7970912: 1, 7462496: 2, 7971424: 2, 7478880: 3, 7971936: 3, 7495264: 4, 7972448: 4, 6970976: 5, 7970448: 5, 7972960: 5, 6446688: 6, 7970960: 6, 7973472: 6, 7972976: 6, 5922400: 7, 7971472: 7, 7973984: 7, 7972992: 7, 5938784: 8, 7971984: 8, 7971488: 8, 7974496: 8, 7973008: 8, 5955168: 9, 7972496: 9, 7971504: 9, 7975008: 9, 7974512: 9, 7973024: 9, 5971552: 10, 7971520: 10, 7975520: 10, 7974528: 10, 7973040: 10, 2743904: 11, 5447264: 11, 5987936: 11, 7971536: 11, 7976032: 11, 7974544: 11, 7973056: 11, 2760288: 12, 4922976: 12, 6004320: 12, 7971552: 12, 7975056: 12, 7974560: 12, 7973568: 12, 2776672: 13, 4398688: 13, 6020704: 13, 7971568: 13, 7975568: 13, 7974576: 13, 7974080: 13, 3300960: 14, 2793056: 14, 4382304: 14, 5496416: 14, 6037088: 14, 7971584: 14, 7976080: 14, 7974592: 14, 646752: 15, 3825248: 15, 2809440: 15, 4365920: 15, 4972128: 15, 6053472: 15, 7971600: 15, 7976096: 15, 7974608: 15, 663136: 16, 4349536: 16, 2825824: 16, 4447840: 16, 6069856: 16, 7971616: 16, 7976112: 16, 7974624: 16, 679520: 17, 2301536: 17, 2842208: 17, 4464224: 17, 6594144: 17, 7971104: 17, 7972128: 17, 7976128: 17, 7974640: 17, 695904: 18, 1777248: 18, 2858592: 18, 4480608: 18, 7118432: 18, 7970592: 18, 7972640: 18, 7976640: 18, 7974128: 18, 7974656: 18, 712288: 19, 1252960: 19, 2874976: 19, 4496992: 19, 7642720: 19, 7973152: 19, 7977152: 19, 7973616: 19, 7974672: 19, 728672: 20, 2350688: 20, 2891360: 20, 3972704: 20, 7659104: 20, 7973136: 20, 7973168: 20, 7977664: 20, 7973104: 20, 7974688: 20, 1826400: 21, 2907744: 21, 3448416: 21, 7675488: 21, 7973120: 21, 7973184: 21, 7977648: 21, 7977680: 21, 7975200: 21, 7974704: 21, 1302112: 22, 2924128: 22, 7691872: 22, 7973200: 22, 7977632: 22, 7977696: 22, 7975712: 22, 7974720: 22, 777824: 23, 2940512: 23, 7167584: 23, 7970640: 23, 7972688: 23, 7973712: 23, 7973216: 23, 7977616: 23, 7977712: 23, 7976224: 23, 7974736: 23, 794208: 24, 2956896: 24, 6643296: 24, 7971152: 24, 7972176: 24, 7974224: 24, 7973232: 24, 7977568: 24, 7977600: 24, 7977200: 24, 7977728: 24, 7976208: 24, 7975248: 24, 810592: 25, 2973280: 25, 6119008: 25, 7971664: 25, 7973248: 25, 7977584: 25, 7976688: 25, 7977744: 25, 7976192: 25, 7975760: 25, 826976: 26, 2448992: 26, 3497568: 26, 2989664: 26, 5594720: 26, 7973264: 26, 7976176: 26, 7977760: 26, 7976272: 26, 843360: 27, 1924704: 27, 4021856: 27, 3006048: 27, 5070432: 27, 7973280: 27, 7977776: 27, 7976288: 27, 859744: 28, 1400416: 28, 4546144: 28, 3022432: 28, 7973792: 28, 7977792: 28, 7976304: 28, 876128: 29, 4562528: 29, 3038816: 29, 7974304: 29, 7977808: 29, 7976320: 29, 892512: 30, 4578912: 30, 3055200: 30, 7974816: 30, 7977824: 30, 7975808: 30, 7976336: 30, 908896: 31, 4595296: 31, 2530912: 31, 3579488: 31, 7974800: 31, 7977840: 31, 7975296: 31, 7976352: 31, 925280: 32, 4611680: 32, 2006624: 32, 4103776: 32, 7974784: 32, 7977856: 32, 7976864: 32, 941664: 33, 4628064: 33, 1482336: 33, 7977872: 33, 7977376: 33, 958048: 34, 7977888: 34, 8495200: 0, 8495712: 1, 8496224: 2, 7463008: 3, 8496736: 3, 7479392: 4, 8497248: 4, 7495776: 5, 8497760: 5, 8497264: 5, 6971488: 6, 8020064: 6, 8498272: 6, 8497280: 6, 6447200: 7, 8495248: 7, 8498784: 7, 8497296: 7, 5922912: 8, 8495760: 8, 8499296: 8, 8498800: 8, 8496784: 8, 8497312: 8, 5939296: 9, 8496272: 9, 8495776: 9, 8499808: 9, 8498816: 9, 8497328: 9, 5955680: 10, 8495792: 10, 8500320: 10, 8498832: 10, 8497344: 10, 5972064: 11, 8495808: 11, 8499344: 11, 8498848: 11, 8497856: 11, 2744416: 12, 5447776: 12, 5988448: 12, 8495824: 12, 8499856: 12, 8498864: 12, 8498368: 12, 2760800: 13, 4923488: 13, 6004832: 13, 8495840: 13, 8500368: 13, 8498880: 13, 2777184: 14, 4399200: 14, 6021216: 14, 8495856: 14, 8500384: 14, 8498896: 14, 3301472: 15, 2793568: 15, 4382816: 15, 5496928: 15, 6037600: 15, 8495872: 15, 8500400: 15, 8498912: 15, 647264: 16, 3825760: 16, 2809952: 16, 4366432: 16, 4972640: 16, 6053984: 16, 8495888: 16, 8500416: 16, 8498928: 16, 663648: 17, 4350048: 17, 2826336: 17, 4448352: 17, 6070368: 17, 8495904: 17, 8500928: 17, 8498416: 17, 8498944: 17, 680032: 18, 2302048: 18, 2842720: 18, 4464736: 18, 6594656: 18, 8495392: 18, 8496416: 18, 8501440: 18, 8497904: 18, 8498960: 18, 696416: 19, 1777760: 19, 2859104: 19, 4481120: 19, 7118944: 19, 8167520: 19, 8496928: 19, 8501952: 19, 8497392: 19, 8498976: 19, 712800: 20, 1253472: 20, 2875488: 20, 4497504: 20, 7643232: 20, 8497440: 20, 8501936: 20, 8501968: 20, 8497408: 20, 8499488: 20, 8498992: 20, 729184: 21, 2351200: 21, 2891872: 21, 3973216: 21, 7659616: 21, 8497424: 21, 8497456: 21, 8501920: 21, 8501984: 21, 8500000: 21, 8499008: 21, 1826912: 22, 2908256: 22, 3448928: 22, 7676000: 22, 8497472: 22, 8501904: 22, 8502000: 22, 8500512: 22, 8499024: 22, 1302624: 23, 2924640: 23, 7692384: 23, 8497488: 23, 8501856: 23, 8501888: 23, 8501488: 23, 8502016: 23, 8500496: 23, 8498512: 23, 8499536: 23, 778336: 24, 2941024: 24, 7168096: 24, 8216672: 24, 8496976: 24, 8498000: 24, 8497504: 24, 8501872: 24, 8500976: 24, 8502032: 24, 8500480: 24, 8500048: 24, 794720: 25, 2957408: 25, 6643808: 25, 8495440: 25, 8496464: 25, 8497520: 25, 8500464: 25, 8502048: 25, 8500560: 25, 811104: 26, 2973792: 26, 6119520: 26, 8495952: 26, 8497536: 26, 8502064: 26, 8500576: 26, 827488: 27, 2449504: 27, 3498080: 27, 2990176: 27, 5595232: 27, 8497552: 27, 8502080: 27, 8500592: 27, 843872: 28, 1925216: 28, 4022368: 28, 3006560: 28, 5070944: 28, 8497568: 28, 8502096: 28, 8500608: 28, 860256: 29, 1400928: 29, 4546656: 29, 3022944: 29, 8498080: 29, 8502112: 29, 8500096: 29, 8500624: 29, 876640: 30, 4563040: 30, 3039328: 30, 8498592: 30, 8502128: 30, 8499584: 30, 8500640: 30, 893024: 31, 4579424: 31, 3055712: 31, 8499104: 31, 8502144: 31, 8499072: 31, 8501152: 31, 909408: 32, 4595808: 32, 2531424: 32, 3580000: 32, 8499088: 32, 8502160: 32, 8501664: 32, 925792: 33, 4612192: 33, 2007136: 33, 4104288: 33, 8502176: 33, 942176: 34, 4628576: 34, 1482848: 34, 958560: 35, 9020000: 0, 9020512: 1, 9021024: 2, 9021536: 3, 7463520: 4, 9022048: 4, 9021552: 4, 7479904: 5, 9022560: 5, 9021568: 5, 7496288: 6, 9023072: 6, 9021584: 6, 6972000: 7, 8020576: 7, 9023584: 7, 9023088: 7, 9021072: 7, 9021600: 7, 6447712: 8, 8544864: 8, 9024096: 8, 9023104: 8, 9020560: 8, 9021616: 8, 5923424: 9, 9020048: 9, 9024608: 9, 9023120: 9, 9021632: 9, 5939808: 10, 9020064: 10, 9023632: 10, 9023136: 10, 9022144: 10, 5956192: 11, 9020080: 11, 9024144: 11, 9023152: 11, 9022656: 11, 5972576: 12, 9020096: 12, 9024656: 12, 9023168: 12, 2744928: 13, 5448288: 13, 5988960: 13, 9020112: 13, 9024672: 13, 9023184: 13, 2761312: 14, 4924000: 14, 6005344: 14, 9020128: 14, 9024688: 14, 9023200: 14, 2777696: 15, 4399712: 15, 6021728: 15, 9020144: 15, 9024704: 15, 9023216: 15, 3301984: 16, 2794080: 16, 4383328: 16, 5497440: 16, 6038112: 16, 9020160: 16, 9025216: 16, 9022704: 16, 9023232: 16, 647776: 17, 3826272: 17, 2810464: 17, 4366944: 17, 4973152: 17, 6054496: 17, 9020176: 17, 9025728: 17, 9022192: 17, 9023248: 17, 664160: 18, 4350560: 18, 2826848: 18, 4448864: 18, 6070880: 18, 9020192: 18, 9026240: 18, 9021680: 18, 9023264: 18, 680544: 19, 2302560: 19, 2843232: 19, 4465248: 19, 6595168: 19, 8692320: 19, 9020704: 19, 9026224: 19, 9026256: 19, 9021696: 19, 9023776: 19, 9023280: 19, 696928: 20, 1778272: 20, 2859616: 20, 4481632: 20, 7119456: 20, 8168032: 20, 9021216: 20, 9026208: 20, 9026272: 20, 9021712: 20, 9024288: 20, 9023296: 20, 713312: 21, 1253984: 21, 2876000: 21, 4498016: 21, 7643744: 21, 9021728: 21, 9026192: 21, 9026288: 21, 9024800: 21, 9023312: 21, 729696: 22, 2351712: 22, 2892384: 22, 3973728: 22, 7660128: 22, 9021744: 22, 9026144: 22, 9026176: 22, 9025776: 22, 9026304: 22, 9024784: 22, 9022800: 22, 9023824: 22, 1827424: 23, 2908768: 23, 3449440: 23, 7676512: 23, 9021760: 23, 9026160: 23, 9025264: 23, 9026320: 23, 9024768: 23, 9022288: 23, 9024336: 23, 1303136: 24, 2925152: 24, 7692896: 24, 9021776: 24, 9024752: 24, 9026336: 24, 9024848: 24, 778848: 25, 2941536: 25, 7168608: 25, 8217184: 25, 9021264: 25, 9021792: 25, 9026352: 25, 9024864: 25, 795232: 26, 2957920: 26, 6644320: 26, 8741472: 26, 9020752: 26, 9021808: 26, 9026368: 26, 9024880: 26, 811616: 27, 2974304: 27, 6120032: 27, 9020240: 27, 9021824: 27, 9026384: 27, 9024896: 27, 828000: 28, 2450016: 28, 3498592: 28, 2990688: 28, 5595744: 28, 9021840: 28, 9026400: 28, 9024384: 28, 9024912: 28, 844384: 29, 1925728: 29, 4022880: 29, 3007072: 29, 5071456: 29, 9021856: 29, 9026416: 29, 9023872: 29, 9024928: 29, 860768: 30, 1401440: 30, 4547168: 30, 3023456: 30, 9022368: 30, 9026432: 30, 9023360: 30, 9025440: 30, 877152: 31, 4563552: 31, 3039840: 31, 9022880: 31, 9026448: 31, 9023376: 31, 9025952: 31, 893536: 32, 4579936: 32, 3056224: 32, 9023392: 32, 9026464: 32, 909920: 33, 4596320: 33, 2531936: 33, 3580512: 33, 926304: 34, 4612704: 34, 2007648: 34, 4104800: 34, 942688: 35, 4629088: 35, 1483360: 35, 959072: 36, 9544800: 0, 9545312: 1, 9545824: 2, 9546336: 3, 9545840: 3, 9546848: 4, 9545856: 4, 7464032: 5, 9547360: 5, 9545872: 5, 7480416: 6, 9547872: 6, 9547376: 6, 9545360: 6, 9545888: 6, 7496800: 7, 9548384: 7, 9547392: 7, 9544848: 7, 9545904: 7, 6972512: 8, 8021088: 8, 9548896: 8, 9547408: 8, 9069664: 8, 9545920: 8, 6448224: 9, 8545376: 9, 9547920: 9, 9547424: 9, 9086048: 9, 9546432: 9, 5923936: 10, 9548432: 10, 9547440: 10, 9102432: 10, 9546944: 10, 5940320: 11, 9548944: 11, 9547456: 11, 9118816: 11, 5956704: 12, 9548960: 12, 9547472: 12, 9135200: 12, 5973088: 13, 9548976: 13, 9547488: 13, 9151584: 13, 2745440: 14, 5448800: 14, 5989472: 14, 9548992: 14, 9547504: 14, 9167968: 14, 2761824: 15, 4924512: 15, 6005856: 15, 9549504: 15, 9546992: 15, 9547520: 15, 9184352: 15, 2778208: 16, 4400224: 16, 6022240: 16, 9550016: 16, 9546480: 16, 9547536: 16, 9200736: 16, 3302496: 17, 2794592: 17, 4383840: 17, 5497952: 17, 6038624: 17, 9550528: 17, 9545968: 17, 9547552: 17, 9217120: 17, 648288: 18, 3826784: 18, 2810976: 18, 4367456: 18, 4973664: 18, 6055008: 18, 9550512: 18, 9550544: 18, 9545984: 18, 9548064: 18, 9547568: 18, 8692832: 18, 9544992: 18, 664672: 19, 4351072: 19, 2827360: 19, 4449376: 19, 6071392: 19, 9550496: 19, 9550560: 19, 9546000: 19, 9548576: 19, 9547584: 19, 8168544: 19, 9545504: 19, 681056: 20, 2303072: 20, 2843744: 20, 4465760: 20, 6595680: 20, 9550480: 20, 9550576: 20, 9546016: 20, 9549088: 20, 9547600: 20, 7644256: 20, 697440: 21, 1778784: 21, 2860128: 21, 4482144: 21, 7119968: 21, 9550432: 21, 9550464: 21, 9550064: 21, 9550592: 21, 9546032: 21, 9549072: 21, 9547088: 21, 9548112: 21, 7660640: 21, 713824: 22, 1254496: 22, 2876512: 22, 4498528: 22, 9550448: 22, 9549552: 22, 9550608: 22, 9546048: 22, 9549056: 22, 9546576: 22, 9548624: 22, 7677024: 22, 730208: 23, 2352224: 23, 2892896: 23, 3974240: 23, 9549040: 23, 9550624: 23, 9546064: 23, 9549136: 23, 7693408: 23, 1827936: 24, 2909280: 24, 3449952: 24, 9550640: 24, 9545552: 24, 9546080: 24, 9549152: 24, 7169120: 24, 8217696: 24, 1303648: 25, 2925664: 25, 9550656: 25, 9545040: 25, 9546096: 25, 9549168: 25, 6644832: 25, 8741984: 25, 779360: 26, 2942048: 26, 9550672: 26, 9266272: 26, 9546112: 26, 9549184: 26, 6120544: 26, 795744: 27, 2958432: 27, 9550688: 27, 9546128: 27, 9548672: 27, 9549200: 27, 5596256: 27, 812128: 28, 2974816: 28, 9550704: 28, 9546144: 28, 9548160: 28, 9549216: 28, 5071968: 28, 828512: 29, 2450528: 29, 3499104: 29, 2991200: 29, 9550720: 29, 9546656: 29, 9547648: 29, 9549728: 29, 4547680: 29, 844896: 30, 1926240: 30, 4023392: 30, 3007584: 30, 9550736: 30, 9547168: 30, 9547664: 30, 9550240: 30, 4564064: 30, 861280: 31, 1401952: 31, 3023968: 31, 9550752: 31, 9547680: 31, 4580448: 31, 877664: 32, 3040352: 32, 4596832: 32, 894048: 33, 3056736: 33, 4613216: 33, 910432: 34, 2532448: 34, 3581024: 34, 4629600: 34, 926816: 35, 2008160: 35, 4105312: 35, 943200: 36, 1483872: 36, 959584: 37, 10069600: 0, 10070112: 1, 10070624: 2, 10070128: 2, 10071136: 3, 10070144: 3, 10071648: 4, 10070160: 4, 10072160: 5, 10071664: 5, 10069648: 5, 10070176: 5, 7464544: 6, 10072672: 6, 10071680: 6, 9594464: 6, 10070192: 6, 7480928: 7, 10073184: 7, 10071696: 7, 9070176: 7, 10070208: 7, 7497312: 8, 10072208: 8, 10071712: 8, 8545888: 8, 9086560: 8, 10070720: 8, 6973024: 9, 8021600: 9, 10072720: 9, 10071728: 9, 9102944: 9, 10071232: 9, 6448736: 10, 10073232: 10, 10071744: 10, 9119328: 10, 5924448: 11, 10073248: 11, 10071760: 11, 9135712: 11, 5940832: 12, 10073264: 12, 10071776: 12, 9152096: 12, 5957216: 13, 10073280: 13, 10071792: 13, 9168480: 13, 5973600: 14, 10073792: 14, 10071280: 14, 10071808: 14, 9184864: 14, 2745952: 15, 5449312: 15, 5989984: 15, 10074304: 15, 10070768: 15, 10071824: 15, 9201248: 15, 2762336: 16, 4925024: 16, 6006368: 16, 10074816: 16, 10070256: 16, 10071840: 16, 9217632: 16, 2778720: 17, 4400736: 17, 6022752: 17, 10074800: 17, 10074832: 17, 10070272: 17, 10072352: 17, 10071856: 17, 8693344: 17, 9741920: 17, 3303008: 18, 2795104: 18, 4384352: 18, 5498464: 18, 6039136: 18, 10074784: 18, 10074848: 18, 10070288: 18, 10072864: 18, 10071872: 18, 8169056: 18, 10069792: 18, 648800: 19, 3827296: 19, 2811488: 19, 4367968: 19, 4974176: 19, 6055520: 19, 10074768: 19, 10074864: 19, 10070304: 19, 10073376: 19, 10071888: 19, 7644768: 19, 665184: 20, 4351584: 20, 2827872: 20, 4449888: 20, 6071904: 20, 10074720: 20, 10074752: 20, 10074352: 20, 10074880: 20, 10070320: 20, 10073360: 20, 10071376: 20, 10072400: 20, 7120480: 20, 7661152: 20, 681568: 21, 2303584: 21, 2844256: 21, 4466272: 21, 6596192: 21, 10074736: 21, 10073840: 21, 10074896: 21, 10070336: 21, 10073344: 21, 10070864: 21, 10072912: 21, 7677536: 21, 697952: 22, 1779296: 22, 2860640: 22, 4482656: 22, 10073328: 22, 10074912: 22, 10070352: 22, 10073424: 22, 7693920: 22, 714336: 23, 1255008: 23, 2877024: 23, 4499040: 23, 10074928: 23, 10069840: 23, 10070368: 23, 10073440: 23, 7169632: 23, 8218208: 23, 730720: 24, 2352736: 24, 2893408: 24, 3974752: 24, 10074944: 24, 9791072: 24, 10070384: 24, 10073456: 24, 6645344: 24, 8742496: 24, 1828448: 25, 2909792: 25, 3450464: 25, 10074960: 25, 9266784: 25, 10070400: 25, 10073472: 25, 6121056: 25, 1304160: 26, 2926176: 26, 10074976: 26, 10070416: 26, 10072960: 26, 10073488: 26, 5596768: 26, 779872: 27, 2942560: 27, 10074992: 27, 10070432: 27, 10072448: 27, 10073504: 27, 5072480: 27, 796256: 28, 2958944: 28, 10075008: 28, 10070944: 28, 10071936: 28, 10074016: 28, 4548192: 28, 812640: 29, 2975328: 29, 10075024: 29, 10071456: 29, 10071952: 29, 10074528: 29, 4023904: 29, 4564576: 29, 829024: 30, 2451040: 30, 3499616: 30, 2991712: 30, 10075040: 30, 10071968: 30, 4580960: 30, 845408: 31, 1926752: 31, 3008096: 31, 4597344: 31, 861792: 32, 1402464: 32, 3024480: 32, 4613728: 32, 878176: 33, 3040864: 33, 4630112: 33, 894560: 34, 3057248: 34, 4105824: 34, 910944: 35, 2532960: 35, 3581536: 35, 927328: 36, 2008672: 36, 943712: 37, 1484384: 37, 960096: 38, 10594400: 0, 10594912: 1, 10594416: 1, 10595424: 2, 10594432: 2, 10595936: 3, 10594448: 3, 10596448: 4, 10595952: 4, 10119264: 4, 10594464: 4, 10596960: 5, 10595968: 5, 9594976: 5, 10594480: 5, 10597472: 6, 10595984: 6, 9070688: 6, 10594496: 6, 7465056: 7, 10596496: 7, 10596000: 7, 8546400: 7, 9087072: 7, 10595008: 7, 7481440: 8, 10597008: 8, 10596016: 8, 8022112: 8, 9103456: 8, 10595520: 8, 7497824: 9, 10597520: 9, 10596032: 9, 9119840: 9, 6973536: 10, 10597536: 10, 10596048: 10, 9136224: 10, 6449248: 11, 10597552: 11, 10596064: 11, 9152608: 11, 5924960: 12, 10597568: 12, 10596080: 12, 9168992: 12, 5941344: 13, 10598080: 13, 10595568: 13, 10596096: 13, 9185376: 13, 5957728: 14, 10598592: 14, 10595056: 14, 10596112: 14, 9201760: 14, 5974112: 15, 10599104: 15, 10594544: 15, 10596128: 15, 9218144: 15, 2746464: 16, 5449824: 16, 5990496: 16, 10599088: 16, 10599120: 16, 10594560: 16, 10596640: 16, 10596144: 16, 8693856: 16, 9742432: 16, 2762848: 17, 4925536: 17, 6006880: 17, 10599072: 17, 10599136: 17, 10594576: 17, 10597152: 17, 10596160: 17, 8169568: 17, 10266720: 17, 2779232: 18, 4401248: 18, 6023264: 18, 10599056: 18, 10599152: 18, 10594592: 18, 10597664: 18, 10596176: 18, 7645280: 18, 3303520: 19, 2795616: 19, 4384864: 19, 5498976: 19, 6039648: 19, 10599008: 19, 10599040: 19, 10598640: 19, 10599168: 19, 10594608: 19, 10597648: 19, 10595664: 19, 10596688: 19, 7120992: 19, 7661664: 19, 649312: 20, 3827808: 20, 2812000: 20, 4368480: 20, 4974688: 20, 6056032: 20, 10599024: 20, 10598128: 20, 10599184: 20, 10594624: 20, 10597632: 20, 10595152: 20, 10597200: 20, 6596704: 20, 7678048: 20, 665696: 21, 4352096: 21, 2828384: 21, 4450400: 21, 6072416: 21, 10597616: 21, 10599200: 21, 10594640: 21, 10597712: 21, 7694432: 21, 682080: 22, 2304096: 22, 2844768: 22, 4466784: 22, 10599216: 22, 10315872: 22, 10594656: 22, 10597728: 22, 7170144: 22, 8218720: 22, 698464: 23, 1779808: 23, 2861152: 23, 4483168: 23, 10599232: 23, 9791584: 23, 10594672: 23, 10597744: 23, 6645856: 23, 8743008: 23, 714848: 24, 1255520: 24, 2877536: 24, 4499552: 24, 10599248: 24, 9267296: 24, 10594688: 24, 10597760: 24, 6121568: 24, 731232: 25, 2353248: 25, 2893920: 25, 3975264: 25, 10599264: 25, 10594704: 25, 10597248: 25, 10597776: 25, 5597280: 25, 1828960: 26, 2910304: 26, 3450976: 26, 10599280: 26, 10594720: 26, 10596736: 26, 10597792: 26, 5072992: 26, 1304672: 27, 2926688: 27, 10599296: 27, 10595232: 27, 10596224: 27, 10598304: 27, 4548704: 27, 780384: 28, 2943072: 28, 10599312: 28, 10595744: 28, 10596240: 28, 10598816: 28, 4024416: 28, 4565088: 28, 796768: 29, 2959456: 29, 10599328: 29, 10596256: 29, 3500128: 29, 4581472: 29, 813152: 30, 2975840: 30, 4597856: 30, 829536: 31, 2451552: 31, 2992224: 31, 4614240: 31, 845920: 32, 1927264: 32, 3008608: 32, 4630624: 32, 862304: 33, 1402976: 33, 3024992: 33, 4106336: 33, 878688: 34, 3041376: 34, 3582048: 34, 895072: 35, 3057760: 35, 911456: 36, 2533472: 36, 927840: 37, 2009184: 37, 944224: 38, 1484896: 38, 960608: 39, 11119200: 0, 11119712: 1, 10611296: 2, 11120224: 2, 10627680: 3, 11120736: 3, 11120240: 3, 10644064: 4, 11121248: 4, 11120256: 4, 10119776: 5, 10660448: 5, 11121760: 5, 11120272: 5, 9595488: 6, 10676832: 6, 11120784: 6, 11120288: 6, 9071200: 7, 10693216: 7, 11121296: 7, 11120304: 7, 7465568: 8, 8546912: 8, 9087584: 8, 11119296: 8, 11121808: 8, 11120320: 8, 7481952: 9, 8022624: 9, 9103968: 9, 11119808: 9, 11121824: 9, 11120336: 9, 7498336: 10, 9120352: 10, 11121840: 10, 11120352: 10, 6974048: 11, 9136736: 11, 11121856: 11, 11120368: 11, 6449760: 12, 9153120: 12, 11122368: 12, 11119856: 12, 11120384: 12, 5925472: 13, 9169504: 13, 11122880: 13, 11119344: 13, 11120400: 13, 5941856: 14, 9185888: 14, 11123392: 14, 10742368: 14, 11120416: 14, 5958240: 15, 9202272: 15, 11123376: 15, 11123408: 15, 10758752: 15, 11120928: 15, 11120432: 15, 5974624: 16, 9218656: 16, 11123360: 16, 11123424: 16, 10775136: 16, 11121440: 16, 11120448: 16, 2746976: 17, 5450336: 17, 5991008: 17, 8694368: 17, 9742944: 17, 11123344: 17, 11123440: 17, 10791520: 17, 11121952: 17, 11120464: 17, 2763360: 18, 4926048: 18, 6007392: 18, 8170080: 18, 10267232: 18, 11123296: 18, 11123328: 18, 11122928: 18, 11123456: 18, 10807904: 18, 11121936: 18, 11119952: 18, 11120976: 18, 2779744: 19, 4401760: 19, 6023776: 19, 7645792: 19, 11123312: 19, 11122416: 19, 11123472: 19, 10824288: 19, 11121920: 19, 11119440: 19, 11121488: 19, 3304032: 20, 2796128: 20, 4385376: 20, 5499488: 20, 6040160: 20, 7121504: 20, 7662176: 20, 11121904: 20, 11123488: 20, 10840672: 20, 11122000: 20, 649824: 21, 3828320: 21, 2812512: 21, 4368992: 21, 4975200: 21, 6056544: 21, 6597216: 21, 7678560: 21, 11123504: 21, 10316384: 21, 10857056: 21, 11122016: 21, 666208: 22, 4352608: 22, 2828896: 22, 4450912: 22, 6072928: 22, 7694944: 22, 11123520: 22, 9792096: 22, 10873440: 22, 11122032: 22, 682592: 23, 2304608: 23, 2845280: 23, 4467296: 23, 7170656: 23, 8219232: 23, 11123536: 23, 9267808: 23, 10889824: 23, 11122048: 23, 698976: 24, 1780320: 24, 2861664: 24, 4483680: 24, 6646368: 24, 8743520: 24, 11123552: 24, 10906208: 24, 11121536: 24, 11122064: 24, 715360: 25, 1256032: 25, 2878048: 25, 4500064: 25, 6122080: 25, 11123568: 25, 10922592: 25, 11121024: 25, 11122080: 25, 731744: 26, 2353760: 26, 2894432: 26, 3975776: 26, 5597792: 26, 11123584: 26, 11119520: 26, 11120512: 26, 11122592: 26, 1829472: 27, 2910816: 27, 3451488: 27, 5073504: 27, 11123600: 27, 11120032: 27, 11120528: 27, 11123104: 27, 1305184: 28, 2927200: 28, 4549216: 28, 11123616: 28, 11120544: 28, 780896: 29, 2943584: 29, 4024928: 29, 4565600: 29, 797280: 30, 2959968: 30, 3500640: 30, 4581984: 30, 813664: 31, 2976352: 31, 4598368: 31, 830048: 32, 2452064: 32, 2992736: 32, 4614752: 32, 846432: 33, 1927776: 33, 3009120: 33, 4631136: 33, 862816: 34, 1403488: 34, 3025504: 34, 4106848: 34, 879200: 35, 3041888: 35, 3582560: 35, 895584: 36, 3058272: 36, 911968: 37, 2533984: 37, 928352: 38, 2009696: 38, 944736: 39, 1485408: 39, 961120: 40, 11644000: 0, 11644512: 1, 11645024: 2, 11644528: 2, 10611808: 3, 11645536: 3, 11644544: 3, 10628192: 4, 11646048: 4, 11644560: 4, 10644576: 5, 11645072: 5, 11644576: 5, 10120288: 6, 10660960: 6, 11645584: 6, 11644592: 6, 9596000: 7, 10677344: 7, 11646096: 7, 11644608: 7, 9071712: 8, 10693728: 8, 11646112: 8, 11644096: 8, 11644624: 8, 7466080: 9, 8547424: 9, 9088096: 9, 11218016: 9, 11646128: 9, 11644640: 9, 7482464: 10, 8023136: 10, 9104480: 10, 11646144: 10, 11644656: 10, 7498848: 11, 9120864: 11, 11646656: 11, 11644144: 11, 11644672: 11, 6974560: 12, 9137248: 12, 11647168: 12, 11267168: 12, 11644688: 12, 6450272: 13, 9153632: 13, 11647680: 13, 10742880: 13, 11644704: 13, 5925984: 14, 9170016: 14, 11647664: 14, 11647696: 14, 10759264: 14, 11645216: 14, 11644720: 14, 5942368: 15, 9186400: 15, 11647648: 15, 11647712: 15, 10775648: 15, 11645728: 15, 11644736: 15, 5958752: 16, 9202784: 16, 11647632: 16, 11647728: 16, 10792032: 16, 11646240: 16, 11644752: 16, 5975136: 17, 9219168: 17, 11647584: 17, 11647616: 17, 11647216: 17, 11647744: 17, 10267744: 17, 10808416: 17, 11646224: 17, 11644240: 17, 11645264: 17, 2747488: 18, 5450848: 18, 5991520: 18, 8694880: 18, 9743456: 18, 11647600: 18, 11646704: 18, 11647760: 18, 10824800: 18, 11646208: 18, 11365472: 18, 11645776: 18, 2763872: 19, 4926560: 19, 6007904: 19, 8170592: 19, 11646192: 19, 11647776: 19, 10841184: 19, 11646288: 19, 2780256: 20, 4402272: 20, 6024288: 20, 7646304: 20, 11647792: 20, 10316896: 20, 10857568: 20, 11646304: 20, 3304544: 21, 2796640: 21, 4385888: 21, 5500000: 21, 6040672: 21, 7122016: 21, 7662688: 21, 11647808: 21, 9792608: 21, 10873952: 21, 11646320: 21, 650336: 22, 3828832: 22, 2813024: 22, 4369504: 22, 4975712: 22, 6057056: 22, 6597728: 22, 7679072: 22, 11647824: 22, 9268320: 22, 10890336: 22, 11646336: 22, 666720: 23, 4353120: 23, 2829408: 23, 4451424: 23, 6073440: 23, 7695456: 23, 11647840: 23, 8744032: 23, 10906720: 23, 11645824: 23, 11646352: 23, 683104: 24, 2305120: 24, 2845792: 24, 4467808: 24, 7171168: 24, 8219744: 24, 11647856: 24, 10923104: 24, 11645312: 24, 11646368: 24, 699488: 25, 1780832: 25, 2862176: 25, 4484192: 25, 6646880: 25, 11647872: 25, 11447392: 25, 11644800: 25, 11646880: 25, 715872: 26, 1256544: 26, 2878560: 26, 4500576: 26, 6122592: 26, 11647888: 26, 11644320: 26, 11644816: 26, 11647392: 26, 732256: 27, 2354272: 27, 2894944: 27, 3976288: 27, 5598304: 27, 11647904: 27, 11644832: 27, 1829984: 28, 2911328: 28, 3452000: 28, 5074016: 28, 1305696: 29, 2927712: 29, 4549728: 29, 781408: 30, 2944096: 30, 4025440: 30, 4566112: 30, 797792: 31, 2960480: 31, 3501152: 31, 4582496: 31, 814176: 32, 2976864: 32, 4598880: 32, 830560: 33, 2452576: 33, 2993248: 33, 4615264: 33, 846944: 34, 1928288: 34, 3009632: 34, 4631648: 34, 863328: 35, 1404000: 35, 3026016: 35, 4107360: 35, 879712: 36, 3042400: 36, 3583072: 36, 896096: 37, 3058784: 37, 912480: 38, 2534496: 38, 928864: 39, 2010208: 39, 945248: 40, 1485920: 40, 961632: 41, 12168800: 0, 12169312: 1, 12168816: 1, 12169824: 2, 12168832: 2, 12170336: 3, 12168848: 3, 10612320: 4, 12169360: 4, 12168864: 4, 10628704: 5, 12169872: 5, 12168880: 5, 10645088: 6, 12170384: 6, 12168896: 6, 10120800: 7, 10661472: 7, 12170400: 7, 11742816: 7, 12168912: 7, 9596512: 8, 10677856: 8, 12170416: 8, 11218528: 8, 12168928: 8, 9072224: 9, 10694240: 9, 12170432: 9, 12168944: 9, 7466592: 10, 8547936: 10, 9088608: 10, 12170944: 10, 11791968: 10, 12168960: 10, 7482976: 11, 8023648: 11, 9104992: 11, 12171456: 11, 11267680: 11, 12168976: 11, 7499360: 12, 9121376: 12, 12171968: 12, 10743392: 12, 12168992: 12, 6975072: 13, 9137760: 13, 12171952: 13, 12171984: 13, 10759776: 13, 12169504: 13, 12169008: 13, 6450784: 14, 9154144: 14, 12171936: 14, 12172000: 14, 10776160: 14, 12170016: 14, 12169024: 14, 5926496: 15, 9170528: 15, 12171920: 15, 12172016: 15, 10792544: 15, 12170528: 15, 12169040: 15, 5942880: 16, 9186912: 16, 12171872: 16, 12171904: 16, 12171504: 16, 12172032: 16, 10268256: 16, 10808928: 16, 12170512: 16, 11890272: 16, 12169552: 16, 5959264: 17, 9203296: 17, 12171888: 17, 12170992: 17, 12172048: 17, 9743968: 17, 10825312: 17, 12170496: 17, 11365984: 17, 12170064: 17, 5975648: 18, 9219680: 18, 12170480: 18, 12172064: 18, 10841696: 18, 12170576: 18, 2748000: 19, 5451360: 19, 5992032: 19, 8695392: 19, 12172080: 19, 10317408: 19, 10858080: 19, 12170592: 19, 2764384: 20, 4927072: 20, 6008416: 20, 8171104: 20, 12172096: 20, 9793120: 20, 10874464: 20, 12170608: 20, 2780768: 21, 4402784: 21, 6024800: 21, 7646816: 21, 12172112: 21, 9268832: 21, 10890848: 21, 12170624: 21, 3305056: 22, 2797152: 22, 4386400: 22, 5500512: 22, 6041184: 22, 7122528: 22, 7663200: 22, 12172128: 22, 8744544: 22, 10907232: 22, 12170112: 22, 12170640: 22, 650848: 23, 3829344: 23, 2813536: 23, 4370016: 23, 4976224: 23, 6057568: 23, 6598240: 23, 7679584: 23, 12172144: 23, 8220256: 23, 10923616: 23, 12169600: 23, 12170656: 23, 667232: 24, 4353632: 24, 2829920: 24, 4451936: 24, 6073952: 24, 7695968: 24, 12172160: 24, 11447904: 24, 12169088: 24, 12171168: 24, 683616: 25, 2305632: 25, 2846304: 25, 4468320: 25, 7171680: 25, 12172176: 25, 11972192: 25, 12169104: 25, 12171680: 25, 700000: 26, 1781344: 26, 2862688: 26, 4484704: 26, 6647392: 26, 12172192: 26, 12169120: 26, 716384: 27, 1257056: 27, 2879072: 27, 4501088: 27, 6123104: 27, 732768: 28, 2354784: 28, 2895456: 28, 3976800: 28, 5598816: 28, 1830496: 29, 2911840: 29, 3452512: 29, 5074528: 29, 1306208: 30, 2928224: 30, 4550240: 30, 781920: 31, 2944608: 31, 4025952: 31, 4566624: 31, 798304: 32, 2960992: 32, 3501664: 32, 4583008: 32, 814688: 33, 2977376: 33, 4599392: 33, 831072: 34, 2453088: 34, 2993760: 34, 4615776: 34, 847456: 35, 1928800: 35, 3010144: 35, 4632160: 35, 863840: 36, 1404512: 36, 3026528: 36, 4107872: 36, 880224: 37, 3042912: 37, 3583584: 37, 896608: 38, 3059296: 38, 912992: 39, 2535008: 39, 929376: 40, 2010720: 40, 945760: 41, 1486432: 41, 962144: 42, 12693600: 0, 12694112: 1, 12185696: 2, 12694624: 2, 12202080: 3, 12218464: 4, 10612832: 5, 12693648: 5, 12234848: 5, 10629216: 6, 12694160: 6, 12251232: 6, 10645600: 7, 12694672: 7, 12267616: 7, 10121312: 8, 10661984: 8, 12694688: 8, 11743328: 8, 12284000: 8, 9597024: 9, 10678368: 9, 12694704: 9, 11219040: 9, 12300384: 9, 9072736: 10, 10694752: 10, 12694720: 10, 12316768: 10, 7467104: 11, 8548448: 11, 9089120: 11, 12695232: 11, 11792480: 11, 12333152: 11, 7483488: 12, 8024160: 12, 9105504: 12, 12695744: 12, 11268192: 12, 12349536: 12, 7499872: 13, 9121888: 13, 12696256: 13, 10743904: 13, 12365920: 13, 6975584: 14, 9138272: 14, 12696240: 14, 12696272: 14, 10760288: 14, 12693792: 14, 12382304: 14, 6451296: 15, 9154656: 15, 12696224: 15, 12696288: 15, 10776672: 15, 12694304: 15, 12398688: 15, 12696160: 15, 5927008: 16, 9171040: 16, 12696208: 16, 12696304: 16, 10793056: 16, 12694816: 16, 12415072: 16, 12696176: 16, 5943392: 17, 9187424: 17, 12696192: 17, 12695792: 17, 12696320: 17, 10268768: 17, 10809440: 17, 12694800: 17, 11890784: 17, 12693840: 17, 5959776: 18, 9203808: 18, 12695280: 18, 12696336: 18, 9744480: 18, 10825824: 18, 12694784: 18, 11366496: 18, 12694352: 18, 5976160: 19, 9220192: 19, 12694768: 19, 12696352: 19, 10842208: 19, 12694864: 19, 2748512: 20, 5451872: 20, 5992544: 20, 8695904: 20, 12696368: 20, 10317920: 20, 10858592: 20, 12694880: 20, 2764896: 21, 4927584: 21, 6008928: 21, 8171616: 21, 12696384: 21, 9793632: 21, 10874976: 21, 12694896: 21, 2781280: 22, 4403296: 22, 6025312: 22, 7647328: 22, 12696400: 22, 9269344: 22, 10891360: 22, 12694912: 22, 3305568: 23, 2797664: 23, 4386912: 23, 5501024: 23, 6041696: 23, 7123040: 23, 7663712: 23, 12696416: 23, 8745056: 23, 10907744: 23, 12694400: 23, 12694928: 23, 651360: 24, 3829856: 24, 2814048: 24, 4370528: 24, 4976736: 24, 6058080: 24, 6598752: 24, 7680096: 24, 12696432: 24, 8220768: 24, 10924128: 24, 12693888: 24, 12694944: 24, 667744: 25, 4354144: 25, 2830432: 25, 4452448: 25, 6074464: 25, 7696480: 25, 12696448: 25, 11448416: 25, 12464224: 25, 12695456: 25, 684128: 26, 2306144: 26, 2846816: 26, 4468832: 26, 7172192: 26, 12696464: 26, 11972704: 26, 12480608: 26, 12695968: 26, 700512: 27, 1781856: 27, 2863200: 27, 4485216: 27, 6647904: 27, 12696480: 27, 12496992: 27, 716896: 28, 1257568: 28, 2879584: 28, 4501600: 28, 6123616: 28, 733280: 29, 2355296: 29, 2895968: 29, 3977312: 29, 5599328: 29, 1831008: 30, 2912352: 30, 3453024: 30, 5075040: 30, 1306720: 31, 2928736: 31, 4550752: 31, 782432: 32, 2945120: 32, 4026464: 32, 4567136: 32, 798816: 33, 2961504: 33, 3502176: 33, 4583520: 33, 815200: 34, 2977888: 34, 4599904: 34, 831584: 35, 2453600: 35, 2994272: 35, 4616288: 35, 847968: 36, 1929312: 36, 3010656: 36, 4632672: 36, 864352: 37, 1405024: 37, 3027040: 37, 4108384: 37, 880736: 38, 3043424: 38, 3584096: 38, 897120: 39, 3059808: 39, 913504: 40, 2535520: 40, 929888: 41, 2011232: 41, 946272: 42, 1486944: 42, 962656: 43, 13218400: 0, 13218912: 1, 12186208: 3, 12202592: 4, 12218976: 5, 10613344: 6, 12743264: 6, 12235360: 6, 10629728: 7, 13218448: 7, 12251744: 7, 10646112: 8, 13218960: 8, 12268128: 8, 10121824: 9, 10662496: 9, 13218976: 9, 11743840: 9, 12284512: 9, 9597536: 10, 10678880: 10, 13218992: 10, 11219552: 10, 12300896: 10, 9073248: 11, 10695264: 11, 13219008: 11, 12317280: 11, 7467616: 12, 8548960: 12, 9089632: 12, 13219520: 12, 11792992: 12, 12333664: 12, 7484000: 13, 8024672: 13, 9106016: 13, 13220032: 13, 11268704: 13, 12350048: 13, 7500384: 14, 9122400: 14, 13220544: 14, 10744416: 14, 12366432: 14, 13220448: 14, 6976096: 15, 9138784: 15, 13220528: 15, 13220560: 15, 10760800: 15, 12890720: 15, 12382816: 15, 13220464: 15, 6451808: 16, 9155168: 16, 13220512: 16, 13220576: 16, 10777184: 16, 13218592: 16, 12399200: 16, 13220480: 16, 5927520: 17, 9171552: 17, 13220496: 17, 13220592: 17, 10793568: 17, 13219104: 17, 12415584: 17, 5943904: 18, 9187936: 18, 13220080: 18, 13220608: 18, 10269280: 18, 10809952: 18, 13219088: 18, 11891296: 18, 12939872: 18, 5960288: 19, 9204320: 19, 13219568: 19, 13220624: 19, 9744992: 19, 10826336: 19, 13219072: 19, 11367008: 19, 13218640: 19, 5976672: 20, 9220704: 20, 13219056: 20, 13220640: 20, 10842720: 20, 13219152: 20, 2749024: 21, 5452384: 21, 5993056: 21, 8696416: 21, 13220656: 21, 10318432: 21, 10859104: 21, 13219168: 21, 2765408: 22, 4928096: 22, 6009440: 22, 8172128: 22, 13220672: 22, 9794144: 22, 10875488: 22, 13219184: 22, 2781792: 23, 4403808: 23, 6025824: 23, 7647840: 23, 13220688: 23, 9269856: 23, 10891872: 23, 13219200: 23, 3306080: 24, 2798176: 24, 4387424: 24, 5501536: 24, 6042208: 24, 7123552: 24, 7664224: 24, 13220704: 24, 8745568: 24, 10908256: 24, 13218688: 24, 13219216: 24, 651872: 25, 3830368: 25, 2814560: 25, 4371040: 25, 4977248: 25, 6058592: 25, 6599264: 25, 7680608: 25, 13220720: 25, 8221280: 25, 10924640: 25, 12989024: 25, 13219232: 25, 668256: 26, 4354656: 26, 2830944: 26, 4452960: 26, 6074976: 26, 7696992: 26, 13220736: 26, 11448928: 26, 12464736: 26, 13219744: 26, 684640: 27, 2306656: 27, 2847328: 27, 4469344: 27, 7172704: 27, 13220752: 27, 11973216: 27, 12481120: 27, 13220256: 27, 701024: 28, 1782368: 28, 2863712: 28, 4485728: 28, 6648416: 28, 13220768: 28, 12497504: 28, 717408: 29, 1258080: 29, 2880096: 29, 4502112: 29, 6124128: 29, 733792: 30, 2355808: 30, 2896480: 30, 3977824: 30, 5599840: 30, 1831520: 31, 2912864: 31, 3453536: 31, 5075552: 31, 1307232: 32, 2929248: 32, 4551264: 32, 782944: 33, 2945632: 33, 4026976: 33, 4567648: 33, 799328: 34, 2962016: 34, 3502688: 34, 4584032: 34, 815712: 35, 2978400: 35, 4600416: 35, 832096: 36, 2454112: 36, 2994784: 36, 4616800: 36, 848480: 37, 1929824: 37, 3011168: 37, 4633184: 37, 864864: 38, 1405536: 38, 3027552: 38, 4108896: 38, 881248: 39, 3043936: 39, 3584608: 39, 897632: 40, 3060320: 40, 914016: 41, 2536032: 41, 930400: 42, 2011744: 42, 946784: 43, 1487456: 43, 963168: 44, 13743200: 0, 12186720: 4, 12203104: 5, 12219488: 6, 10613856: 7, 12743776: 7, 12235872: 7, 10630240: 8, 13268064: 8, 12252256: 8, 10646624: 9, 13743248: 9, 12268640: 9, 10122336: 10, 10663008: 10, 13743264: 10, 11744352: 10, 12285024: 10, 9598048: 11, 10679392: 11, 13743280: 11, 11220064: 11, 12301408: 11, 9073760: 12, 10695776: 12, 13743296: 12, 12317792: 12, 7468128: 13, 8549472: 13, 9090144: 13, 13743808: 13, 11793504: 13, 12334176: 13, 13744736: 13, 7484512: 14, 8025184: 14, 9106528: 14, 13744320: 14, 11269216: 14, 12350560: 14, 13744752: 14, 7500896: 15, 9122912: 15, 13744832: 15, 10744928: 15, 12366944: 15, 13744768: 15, 6976608: 16, 9139296: 16, 13744816: 16, 13744848: 16, 10761312: 16, 12891232: 16, 12383328: 16, 13744784: 16, 6452320: 17, 9155680: 17, 13744800: 17, 13744864: 17, 10777696: 17, 13415520: 17, 12399712: 17, 5928032: 18, 9172064: 18, 13744880: 18, 10794080: 18, 13743392: 18, 12416096: 18, 5944416: 19, 9188448: 19, 13744368: 19, 13744896: 19, 10269792: 19, 10810464: 19, 13743376: 19, 11891808: 19, 12940384: 19, 5960800: 20, 9204832: 20, 13743856: 20, 13744912: 20, 9745504: 20, 10826848: 20, 13743360: 20, 11367520: 20, 13464672: 20, 5977184: 21, 9221216: 21, 13743344: 21, 13744928: 21, 10843232: 21, 13743440: 21, 2749536: 22, 5452896: 22, 5993568: 22, 8696928: 22, 13744944: 22, 10318944: 22, 10859616: 22, 13743456: 22, 2765920: 23, 4928608: 23, 6009952: 23, 8172640: 23, 13744960: 23, 9794656: 23, 10876000: 23, 13743472: 23, 2782304: 24, 4404320: 24, 6026336: 24, 7648352: 24, 13744976: 24, 9270368: 24, 10892384: 24, 13743488: 24, 3306592: 25, 2798688: 25, 4387936: 25, 5502048: 25, 6042720: 25, 7124064: 25, 7664736: 25, 13744992: 25, 8746080: 25, 10908768: 25, 13513824: 25, 13743504: 25, 652384: 26, 3830880: 26, 2815072: 26, 4371552: 26, 4977760: 26, 6059104: 26, 6599776: 26, 7681120: 26, 13745008: 26, 8221792: 26, 10925152: 26, 12989536: 26, 13743520: 26, 668768: 27, 4355168: 27, 2831456: 27, 4453472: 27, 6075488: 27, 7697504: 27, 13745024: 27, 11449440: 27, 12465248: 27, 13744032: 27, 685152: 28, 2307168: 28, 2847840: 28, 4469856: 28, 7173216: 28, 13745040: 28, 11973728: 28, 12481632: 28, 13744544: 28, 701536: 29, 1782880: 29, 2864224: 29, 4486240: 29, 6648928: 29, 13745056: 29, 12498016: 29, 717920: 30, 1258592: 30, 2880608: 30, 4502624: 30, 6124640: 30, 734304: 31, 2356320: 31, 2896992: 31, 3978336: 31, 5600352: 31, 1832032: 32, 2913376: 32, 3454048: 32, 5076064: 32, 1307744: 33, 2929760: 33, 4551776: 33, 783456: 34, 2946144: 34, 4027488: 34, 4568160: 34, 799840: 35, 2962528: 35, 3503200: 35, 4584544: 35, 816224: 36, 2978912: 36, 4600928: 36, 832608: 37, 2454624: 37, 2995296: 37, 4617312: 37, 848992: 38, 1930336: 38, 3011680: 38, 4633696: 38, 865376: 39, 1406048: 39, 3028064: 39, 4109408: 39, 881760: 40, 3044448: 40, 3585120: 40, 898144: 41, 3060832: 41, 914528: 42, 2536544: 42, 930912: 43, 2012256: 43, 947296: 44, 1487968: 44, 963680: 45, 15317600: 0, 15317616: 1, 15317632: 2, 15317648: 3, 15317664: 4, 15317680: 5, 15317696: 6, 14891616: 7, 15317712: 7, 14367328: 8, 15317728: 8, 13843040: 9, 15317744: 9, 13826656: 10, 14940768: 10, 15317760: 10, 13810272: 11, 14416480: 11, 15317776: 11, 13793888: 12, 13892192: 12, 15317792: 12, 13269600: 13, 13908576: 13, 15317808: 13, 12745312: 14, 13924960: 14, 15317824: 14, 12221024: 15, 13941344: 15, 15317840: 15, 12204640: 16, 12237408: 16, 13417056: 16, 15317856: 16, 12188256: 17, 12253792: 17, 12892768: 17, 15317872: 17, 12270176: 18, 12368480: 18, 15317888: 18, 11745888: 19, 12286560: 19, 12352096: 19, 12384864: 19, 15317904: 19, 10615392: 20, 11221600: 20, 12302944: 20, 12335712: 20, 12401248: 20, 15317920: 20, 10631776: 21, 10697312: 21, 12319328: 21, 12417632: 21, 15120992: 21, 10648160: 22, 10680928: 22, 11795040: 22, 11893344: 22, 12941920: 22, 14596704: 22, 10123872: 23, 10664544: 23, 11270752: 23, 11369056: 23, 13466208: 23, 14072416: 23, 9599584: 24, 10746464: 24, 10844768: 24, 13990496: 24, 14056032: 24, 9075296: 25, 10762848: 25, 10320480: 25, 10828384: 25, 10861152: 25, 14006880: 25, 14039648: 25, 7469664: 26, 8551008: 26, 9091680: 26, 10779232: 26, 9796192: 26, 10812000: 26, 10877536: 26, 14023264: 26, 13515360: 26, 7486048: 27, 8026720: 27, 9108064: 27, 10795616: 27, 9271904: 27, 10893920: 27, 12991072: 27, 7502432: 28, 9124448: 28, 10271328: 28, 8747616: 28, 10910304: 28, 12466784: 28, 6978144: 29, 9140832: 29, 9747040: 29, 8223328: 29, 10926688: 29, 12483168: 29, 6453856: 30, 9157216: 30, 9222752: 30, 7699040: 30, 11450976: 30, 12499552: 30, 5929568: 31, 9173600: 31, 8698464: 31, 9206368: 31, 7174752: 31, 7682656: 31, 11975264: 31, 5945952: 32, 9189984: 32, 8174176: 32, 6650464: 32, 7666272: 32, 5962336: 33, 7649888: 33, 6126176: 33, 5978720: 34, 7125600: 34, 5601888: 34, 2751072: 35, 5454432: 35, 5995104: 35, 6601312: 35, 5077600: 35, 2767456: 36, 4930144: 36, 6011488: 36, 6077024: 36, 4553312: 36, 2783840: 37, 4405856: 37, 6027872: 37, 6060640: 37, 4029024: 37, 4569696: 37, 3308128: 38, 2800224: 38, 4389472: 38, 5503584: 38, 6044256: 38, 3504736: 38, 4586080: 38, 653920: 39, 3832416: 39, 2816608: 39, 4373088: 39, 4979296: 39, 2980448: 39, 4602464: 39, 670304: 40, 4356704: 40, 2832992: 40, 4455008: 40, 2456160: 40, 2964064: 40, 2996832: 40, 4618848: 40, 686688: 41, 2308704: 41, 2849376: 41, 4471392: 41, 1931872: 41, 2947680: 41, 3013216: 41, 4635232: 41, 703072: 42, 1784416: 42, 2865760: 42, 4487776: 42, 1407584: 42, 2931296: 42, 3029600: 42, 4110944: 42, 719456: 43, 1260128: 43, 2882144: 43, 4504160: 43, 883296: 43, 2914912: 43, 3455584: 43, 3045984: 43, 3586656: 43, 735840: 44, 2357856: 44, 2898528: 44, 3979872: 44, 866912: 44, 899680: 44, 3062368: 44, 1833568: 45, 850528: 45, 916064: 45, 2538080: 45, 1309280: 46, 834144: 46, 932448: 46, 2013792: 46, 784992: 47, 817760: 47, 948832: 47, 1489504: 47, 801376: 48, 965216: 48, 639600: 0, 639616: 1, 639632: 2, 639648: 3, 639664: 4, 639680: 5, 641648: 6, 640192: 6, 641664: 7, 640704: 7, 641680: 8, 641216: 8, 642192: 9, 641696: 9, 641728: 9, 642704: 10, 641712: 10, 641744: 10, 643216: 11, 641760: 11, 643232: 12, 641776: 12, 643248: 13, 641264: 13, 641792: 13, 643264: 14, 640752: 14, 641808: 14, 646256: 15, 643776: 15, 640240: 15, 641824: 15, 646272: 16, 644288: 16, 639728: 16, 642336: 16, 641840: 16, 646288: 17, 644800: 17, 639744: 17, 642848: 17, 641856: 17, 645776: 18, 646800: 18, 644784: 18, 644816: 18, 639760: 18, 643360: 18, 641872: 18, 645264: 19, 647312: 19, 644768: 19, 644832: 19, 639776: 19, 643344: 19, 641360: 19, 642384: 19, 641888: 19, 644752: 20, 647824: 20, 644848: 20, 639792: 20, 643328: 20, 640848: 20, 642896: 20, 641904: 20, 649328: 21, 648336: 21, 647840: 21, 644336: 21, 644864: 21, 639808: 21, 643312: 21, 640336: 21, 643408: 21, 641920: 21, 649344: 22, 648848: 22, 647856: 22, 643824: 22, 644880: 22, 639824: 22, 643920: 22, 643424: 22, 641936: 22, 649360: 23, 647872: 23, 644896: 23, 639840: 23, 644432: 23, 643440: 23, 641952: 23, 650864: 24, 649376: 24, 647888: 24, 645408: 24, 639856: 24, 644944: 24, 643456: 24, 641440: 24, 642464: 24, 650880: 25, 649392: 25, 647904: 25, 645920: 25, 639872: 25, 645456: 25, 643472: 25, 640928: 25, 642976: 25, 650896: 26, 649408: 26, 647920: 26, 646432: 26, 639888: 26, 645968: 26, 643488: 26, 640416: 26, 651408: 27, 650912: 27, 649920: 27, 647936: 27, 646944: 27, 646448: 27, 639904: 27, 646480: 27, 651920: 28, 650928: 28, 650432: 28, 647952: 28, 647456: 28, 646464: 28, 646992: 28, 652432: 29, 650944: 29, 647968: 29, 647504: 29, 652448: 30, 650960: 30, 648480: 30, 648016: 30, 652464: 31, 650976: 31, 648992: 31, 648528: 31, 652480: 32, 650992: 32, 649504: 32, 649040: 32, 652992: 33, 650480: 33, 651008: 33, 649488: 33, 649520: 33, 649552: 33, 653504: 34, 649968: 34, 651024: 34, 649472: 34, 649536: 34, 650064: 34, 649568: 34, 654016: 35, 649456: 35, 651040: 35, 650576: 35, 649584: 35, 654000: 36, 654032: 36, 651552: 36, 651056: 36, 651088: 36, 649600: 36, 653984: 37, 654048: 37, 652064: 37, 651072: 37, 651600: 37, 649616: 37, 653968: 38, 654064: 38, 652576: 38, 652112: 38, 649632: 38, 653952: 39, 653552: 39, 654080: 39, 652560: 39, 652624: 39, 650144: 39, 653936: 40, 653040: 40, 654096: 40, 652544: 40, 652640: 40, 650656: 40, 652528: 41, 654112: 41, 652656: 41, 651168: 41, 654128: 42, 652672: 42, 651152: 42, 654144: 43, 652160: 43, 652688: 43, 651136: 43, 654160: 44, 651648: 44, 652704: 44, 654176: 45, 653216: 45, 654192: 46, 653728: 46, 654208: 47, 654240: 47, 654224: 48, 2738800: 0, 2738816: 1, 2738832: 2, 2739344: 3, 2738848: 3, 2739856: 4, 2738864: 4, 2740368: 5, 2738880: 5, 2740384: 6, 2296432: 6, 2738896: 6, 658032: 7, 2740400: 7, 1772144: 7, 2738912: 7, 674416: 8, 2740416: 8, 1247856: 8, 2738928: 8, 690800: 9, 2740928: 9, 723568: 9, 2345584: 9, 2738944: 9, 707184: 10, 2741440: 10, 1821296: 10, 2738960: 10, 2743408: 11, 2741952: 11, 1297008: 11, 2738976: 11, 2743424: 12, 2741936: 12, 2741968: 12, 772720: 12, 2739488: 12, 2738992: 12, 2743440: 13, 2741920: 13, 2741984: 13, 789104: 13, 2740000: 13, 2739008: 13, 2742928: 14, 2743952: 14, 2741904: 14, 2742000: 14, 805488: 14, 2740512: 14, 2739024: 14, 2742416: 15, 2744464: 15, 2741488: 15, 2742016: 15, 821872: 15, 2740496: 15, 2443888: 15, 2739536: 15, 2739040: 15, 2744976: 16, 2740976: 16, 2742032: 16, 838256: 16, 2740480: 16, 1919600: 16, 2740048: 16, 2739056: 16, 2746480: 17, 2745488: 17, 2744992: 17, 2740464: 17, 2742048: 17, 854640: 17, 1395312: 17, 2740560: 17, 2739072: 17, 2746496: 18, 2746000: 18, 2745008: 18, 2742560: 18, 871024: 18, 2741072: 18, 2740576: 18, 2739088: 18, 2746512: 19, 2745024: 19, 2743072: 19, 887408: 19, 2741584: 19, 2740592: 19, 2739104: 19, 2748016: 20, 2746528: 20, 2745040: 20, 2743584: 20, 903792: 20, 2742096: 20, 2740608: 20, 2525808: 20, 2739616: 20, 2748032: 21, 2746544: 21, 2745056: 21, 2744096: 21, 2743600: 21, 920176: 21, 2742608: 21, 2740624: 21, 2001520: 21, 2740128: 21, 2748048: 22, 2746560: 22, 2745072: 22, 2744608: 22, 2743616: 22, 936560: 22, 2743120: 22, 2740640: 22, 1477232: 22, 2748560: 23, 2748064: 23, 2747072: 23, 2745088: 23, 2745120: 23, 2743632: 23, 952944: 23, 2749072: 24, 2748080: 24, 2747584: 24, 2745104: 24, 2745632: 24, 2744144: 24, 2749584: 25, 2748096: 25, 2746144: 25, 2744656: 25, 2749600: 26, 2748112: 26, 2746656: 26, 2745168: 26, 2749616: 27, 2748128: 27, 2746640: 27, 2746672: 27, 2745680: 27, 2749632: 28, 2748144: 28, 2746624: 28, 2746688: 28, 2746192: 28, 2750144: 29, 2747632: 29, 2748160: 29, 2746608: 29, 2746704: 29, 2750656: 30, 2747120: 30, 2748176: 30, 2747216: 30, 2746720: 30, 2751168: 31, 2748192: 31, 2747728: 31, 2746736: 31, 2751152: 32, 2751184: 32, 2748704: 32, 2748208: 32, 2748240: 32, 2746752: 32, 2751136: 33, 2751200: 33, 2749216: 33, 2748224: 33, 2748752: 33, 2746768: 33, 2751120: 34, 2751216: 34, 2749728: 34, 2749264: 34, 2746784: 34, 2751104: 35, 2750704: 35, 2751232: 35, 2749712: 35, 2749776: 35, 2747296: 35, 2751088: 36, 2750192: 36, 2751248: 36, 2749696: 36, 2749792: 36, 2747808: 36, 2749680: 37, 2751264: 37, 2749808: 37, 2748320: 37, 2751280: 38, 2749824: 38, 2748304: 38, 2751296: 39, 2749312: 39, 2749840: 39, 2748288: 39, 2751312: 40, 2748800: 40, 2749856: 40, 2751328: 41, 2750368: 41, 2751344: 42, 2750880: 42, 2751360: 43, 2751392: 43, 2751376: 44, 7462000: 0, 7462016: 1, 7462032: 2, 6970480: 3, 7462544: 3, 6446192: 4, 7463056: 4, 5921904: 5, 7463568: 5, 5938288: 6, 7464080: 6, 7463584: 6, 5954672: 7, 7464592: 7, 7463600: 7, 7465072: 8, 5971056: 8, 7465104: 8, 7463616: 8, 7465088: 9, 5446768: 9, 5987440: 9, 7465120: 9, 7463632: 9, 4922480: 10, 6003824: 10, 7465136: 10, 7463648: 10, 7466608: 11, 4398192: 11, 6020208: 11, 7465152: 11, 7463664: 11, 2759792: 12, 7466624: 12, 4381808: 12, 5495920: 12, 6036592: 12, 7465664: 12, 7463680: 12, 2776176: 13, 7466640: 13, 4365424: 13, 4971632: 13, 6052976: 13, 7466176: 13, 7463696: 13, 3300464: 14, 2792560: 14, 7467152: 14, 7466656: 14, 4349040: 14, 4447344: 14, 6069360: 14, 7466688: 14, 7463712: 14, 3824752: 15, 2808944: 15, 7467664: 15, 7466672: 15, 4463728: 15, 6593648: 15, 7466704: 15, 7463200: 15, 7464224: 15, 662640: 16, 2825328: 16, 7468176: 16, 4480112: 16, 7117936: 16, 7466720: 16, 7462688: 16, 7464736: 16, 679024: 17, 2301040: 17, 2841712: 17, 7468192: 17, 4496496: 17, 7462176: 17, 7466736: 17, 7465248: 17, 695408: 18, 1776752: 18, 2858096: 18, 7468208: 18, 3972208: 18, 7462192: 18, 7466224: 18, 7466752: 18, 7465232: 18, 7465264: 18, 711792: 19, 1252464: 19, 2874480: 19, 7468224: 19, 3447920: 19, 7462208: 19, 7465712: 19, 7466768: 19, 7465216: 19, 7465280: 19, 728176: 20, 2350192: 20, 2890864: 20, 7468736: 20, 2923632: 20, 7462224: 20, 7465200: 20, 7466784: 20, 7465296: 20, 1825904: 21, 2907248: 21, 7469248: 21, 2940016: 21, 7167088: 21, 7462736: 21, 7467296: 21, 7466800: 21, 7464784: 21, 7465808: 21, 7465312: 21, 1301616: 22, 7469760: 22, 2956400: 22, 6642800: 22, 7463248: 22, 7467808: 22, 7466816: 22, 7464272: 22, 7466320: 22, 7465328: 22, 777328: 23, 7469744: 23, 7469776: 23, 2972784: 23, 6118512: 23, 7463760: 23, 7468320: 23, 7466832: 23, 7465344: 23, 793712: 24, 7469728: 24, 7469792: 24, 2448496: 24, 3497072: 24, 2989168: 24, 5594224: 24, 7468304: 24, 7467344: 24, 7465360: 24, 810096: 25, 7469712: 25, 7469808: 25, 1924208: 25, 4021360: 25, 3005552: 25, 5069936: 25, 7468288: 25, 7467856: 25, 7465376: 25, 826480: 26, 7469696: 26, 7469296: 26, 7469824: 26, 1399920: 26, 4545648: 26, 3021936: 26, 7468272: 26, 7468368: 26, 7465888: 26, 842864: 27, 7469680: 27, 7468784: 27, 7469840: 27, 875632: 27, 4562032: 27, 3038320: 27, 7468384: 27, 7466400: 27, 859248: 28, 7469856: 28, 892016: 28, 4578416: 28, 3054704: 28, 7468400: 28, 7466912: 28, 7469872: 29, 908400: 29, 4594800: 29, 2530416: 29, 3578992: 29, 7468416: 29, 7466896: 29, 7469888: 30, 924784: 30, 4611184: 30, 2006128: 30, 4103280: 30, 7467904: 30, 7468432: 30, 7466880: 30, 7469904: 31, 941168: 31, 4627568: 31, 1481840: 31, 7467392: 31, 7468448: 31, 7469920: 32, 957552: 32, 7468960: 32, 7469936: 33, 7469472: 33, 7469952: 34, 7469984: 34, 7469968: 35, 10610800: 0, 10610816: 1, 10610832: 2, 10119280: 3, 10610848: 3, 9594992: 4, 10610864: 4, 10612336: 5, 9070704: 5, 10610880: 5, 10612352: 6, 8546416: 6, 9087088: 6, 10611392: 6, 10612368: 7, 8022128: 7, 9103472: 7, 10611904: 7, 10612880: 8, 10612384: 8, 7497840: 8, 9119856: 8, 10612416: 8, 7481456: 9, 10613392: 9, 10612400: 9, 6973552: 9, 9136240: 9, 10612432: 9, 10613904: 10, 6449264: 10, 9152624: 10, 10612448: 10, 10613920: 11, 5924976: 11, 9169008: 11, 10612464: 11, 10613936: 12, 5941360: 12, 9185392: 12, 10611952: 12, 10612480: 12, 10613952: 13, 5957744: 13, 9201776: 13, 10611440: 13, 10612496: 13, 10614464: 14, 5974128: 14, 9218160: 14, 10610928: 14, 10612512: 14, 10614976: 15, 5449840: 15, 5990512: 15, 8693872: 15, 9742448: 15, 10610944: 15, 10613024: 15, 10612528: 15, 10615488: 16, 4925552: 16, 6006896: 16, 8169584: 16, 10266736: 16, 10610960: 16, 10613536: 16, 10612544: 16, 10615472: 17, 10615504: 17, 4401264: 17, 6023280: 17, 7645296: 17, 10610976: 17, 10614048: 17, 10612560: 17, 2762864: 18, 10615456: 18, 10615520: 18, 4384880: 18, 5498992: 18, 6039664: 18, 7121008: 18, 7661680: 18, 10610992: 18, 10614032: 18, 10612048: 18, 10613072: 18, 2779248: 19, 10615440: 19, 10615536: 19, 4368496: 19, 4974704: 19, 6056048: 19, 6596720: 19, 7678064: 19, 10611008: 19, 10614016: 19, 10611536: 19, 10613584: 19, 3303536: 20, 2795632: 20, 10615424: 20, 10615024: 20, 10615552: 20, 4352112: 20, 4450416: 20, 6072432: 20, 7694448: 20, 10611024: 20, 10614000: 20, 10614096: 20, 3827824: 21, 2812016: 21, 10615408: 21, 10614512: 21, 10615568: 21, 4466800: 21, 7170160: 21, 8218736: 21, 10315888: 21, 10611040: 21, 10614112: 21, 665712: 22, 2828400: 22, 10615584: 22, 4483184: 22, 6645872: 22, 8743024: 22, 9791600: 22, 10611056: 22, 10614128: 22, 682096: 23, 2304112: 23, 2844784: 23, 10615600: 23, 4499568: 23, 6121584: 23, 9267312: 23, 10611072: 23, 10614144: 23, 698480: 24, 1779824: 24, 2861168: 24, 10615616: 24, 3975280: 24, 5597296: 24, 10611088: 24, 10613632: 24, 10614160: 24, 714864: 25, 1255536: 25, 2877552: 25, 10615632: 25, 3450992: 25, 5073008: 25, 10611104: 25, 10613120: 25, 10614176: 25, 731248: 26, 2353264: 26, 2893936: 26, 10615648: 26, 2926704: 26, 4548720: 26, 10611616: 26, 10612608: 26, 10614688: 26, 1828976: 27, 2910320: 27, 10615664: 27, 2943088: 27, 4024432: 27, 4565104: 27, 10612128: 27, 10612624: 27, 10615200: 27, 1304688: 28, 10615680: 28, 2959472: 28, 3500144: 28, 4581488: 28, 10612640: 28, 10615712: 28, 780400: 29, 10615696: 29, 2975856: 29, 4597872: 29, 796784: 30, 2451568: 30, 2992240: 30, 4614256: 30, 813168: 31, 1927280: 31, 3008624: 31, 4630640: 31, 829552: 32, 1402992: 32, 3025008: 32, 4106352: 32, 845936: 33, 878704: 33, 3041392: 33, 3582064: 33, 862320: 34, 895088: 34, 3057776: 34, 911472: 35, 2533488: 35, 927856: 36, 2009200: 36, 944240: 37, 1484912: 37, 960624: 38, 12185200: 0, 12185216: 1, 12185232: 2, 12185744: 3, 12185248: 3, 12186256: 4, 12185264: 4, 12186768: 5, 12185280: 5, 10628720: 6, 12186784: 6, 11742832: 6, 12185296: 6, 10645104: 7, 12186800: 7, 11218544: 7, 12185312: 7, 10120816: 8, 10661488: 8, 12186816: 8, 10694256: 8, 12185328: 8, 9596528: 9, 10677872: 9, 12187328: 9, 11791984: 9, 12185344: 9, 9072240: 10, 12187840: 10, 11267696: 10, 12185360: 10, 8547952: 11, 9088624: 11, 12188352: 11, 10743408: 11, 12185376: 11, 7482992: 12, 8023664: 12, 9105008: 12, 12188336: 12, 12188368: 12, 10759792: 12, 12185888: 12, 12185392: 12, 7499376: 13, 9121392: 13, 12188320: 13, 12188384: 13, 10776176: 13, 12186400: 13, 12185408: 13, 6975088: 14, 9137776: 14, 12188304: 14, 12188400: 14, 10792560: 14, 12186912: 14, 12185424: 14, 6450800: 15, 9154160: 15, 12188288: 15, 12187888: 15, 12188416: 15, 10268272: 15, 10808944: 15, 12186896: 15, 11890288: 15, 12185936: 15, 5926512: 16, 9170544: 16, 12188272: 16, 12187376: 16, 12188432: 16, 9743984: 16, 10825328: 16, 12186880: 16, 11366000: 16, 12186448: 16, 5942896: 17, 9186928: 17, 12186864: 17, 12188448: 17, 9219696: 17, 10841712: 17, 12186960: 17, 5959280: 18, 9203312: 18, 12188464: 18, 8695408: 18, 10317424: 18, 10858096: 18, 12186976: 18, 5975664: 19, 12188480: 19, 8171120: 19, 9793136: 19, 10874480: 19, 12186992: 19, 5451376: 20, 5992048: 20, 12188496: 20, 7646832: 20, 9268848: 20, 10890864: 20, 12187008: 20, 2764400: 21, 4927088: 21, 6008432: 21, 12188512: 21, 7122544: 21, 7663216: 21, 8744560: 21, 10907248: 21, 12186496: 21, 12187024: 21, 2780784: 22, 4402800: 22, 6024816: 22, 12188528: 22, 6598256: 22, 7679600: 22, 8220272: 22, 10923632: 22, 12185984: 22, 12187040: 22, 3305072: 23, 2797168: 23, 4386416: 23, 5500528: 23, 6041200: 23, 12188544: 23, 6073968: 23, 7695984: 23, 11447920: 23, 12185472: 23, 12187552: 23, 3829360: 24, 2813552: 24, 4370032: 24, 4976240: 24, 6057584: 24, 12188560: 24, 7171696: 24, 11972208: 24, 12185488: 24, 12188064: 24, 667248: 25, 4353648: 25, 2829936: 25, 4451952: 25, 12188576: 25, 6647408: 25, 12185504: 25, 683632: 26, 2305648: 26, 2846320: 26, 4468336: 26, 6123120: 26, 700016: 27, 1781360: 27, 2862704: 27, 4484720: 27, 5598832: 27, 716400: 28, 1257072: 28, 2879088: 28, 4501104: 28, 5074544: 28, 732784: 29, 2354800: 29, 2895472: 29, 3976816: 29, 4550256: 29, 1830512: 30, 2911856: 30, 3452528: 30, 4025968: 30, 4566640: 30, 1306224: 31, 2928240: 31, 3501680: 31, 4583024: 31, 781936: 32, 2944624: 32, 2977392: 32, 4599408: 32, 798320: 33, 2961008: 33, 2453104: 33, 2993776: 33, 4615792: 33, 814704: 34, 1928816: 34, 3010160: 34, 4632176: 34, 831088: 35, 1404528: 35, 3026544: 35, 4107888: 35, 847472: 36, 880240: 36, 3042928: 36, 3583600: 36, 863856: 37, 896624: 37, 3059312: 37, 913008: 38, 2535024: 38, 929392: 39, 2010736: 39, 945776: 40, 1486448: 40, 962160: 41, 15334000: 0, 15334016: 1, 15334032: 2, 15334048: 3, 15334064: 4, 15334080: 5, 14891632: 6, 15334096: 6, 14367344: 7, 15334112: 7, 13843056: 8, 15334128: 8, 13826672: 9, 14940784: 9, 15334144: 9, 13810288: 10, 14416496: 10, 15334160: 10, 13793904: 11, 13892208: 11, 15334176: 11, 13269616: 12, 13908592: 12, 15334192: 12, 12745328: 13, 13924976: 13, 15334208: 13, 12221040: 14, 13941360: 14, 15334224: 14, 12204656: 15, 12237424: 15, 13417072: 15, 15334240: 15, 12253808: 16, 12892784: 16, 15334256: 16, 12270192: 17, 12368496: 17, 15334272: 17, 11745904: 18, 12286576: 18, 12352112: 18, 12384880: 18, 15334288: 18, 11221616: 19, 12302960: 19, 12335728: 19, 12401264: 19, 15334304: 19, 10697328: 20, 12319344: 20, 12417648: 20, 15121008: 20, 10680944: 21, 11795056: 21, 11893360: 21, 12941936: 21, 14596720: 21, 10631792: 22, 10664560: 22, 11270768: 22, 11369072: 22, 13466224: 22, 14072432: 22, 10648176: 23, 10746480: 23, 10844784: 23, 13990512: 23, 14056048: 23, 10123888: 24, 10762864: 24, 10320496: 24, 10828400: 24, 10861168: 24, 14006896: 24, 14039664: 24, 9599600: 25, 10779248: 25, 9796208: 25, 10812016: 25, 10877552: 25, 14023280: 25, 13515376: 25, 9075312: 26, 10795632: 26, 9271920: 26, 10893936: 26, 12991088: 26, 8551024: 27, 9091696: 27, 10271344: 27, 8747632: 27, 10910320: 27, 12466800: 27, 7486064: 28, 8026736: 28, 9108080: 28, 9747056: 28, 8223344: 28, 10926704: 28, 12483184: 28, 7502448: 29, 9124464: 29, 9222768: 29, 7699056: 29, 11450992: 29, 12499568: 29, 6978160: 30, 9140848: 30, 8698480: 30, 9206384: 30, 7174768: 30, 7682672: 30, 11975280: 30, 6453872: 31, 9157232: 31, 8174192: 31, 9190000: 31, 6650480: 31, 7666288: 31, 5929584: 32, 9173616: 32, 7649904: 32, 6126192: 32, 5945968: 33, 7125616: 33, 5601904: 33, 5962352: 34, 6601328: 34, 5077616: 34, 5978736: 35, 6077040: 35, 4553328: 35, 5454448: 36, 5995120: 36, 6060656: 36, 4029040: 36, 4569712: 36, 2767472: 37, 4930160: 37, 6011504: 37, 6044272: 37, 3504752: 37, 4586096: 37, 2783856: 38, 4405872: 38, 6027888: 38, 2980464: 38, 4602480: 38, 3308144: 39, 2800240: 39, 4389488: 39, 5503600: 39, 2456176: 39, 2964080: 39, 2996848: 39, 4618864: 39, 3832432: 40, 2816624: 40, 4373104: 40, 4979312: 40, 1931888: 40, 2947696: 40, 3013232: 40, 4635248: 40, 670320: 41, 4356720: 41, 2833008: 41, 4455024: 41, 1407600: 41, 2931312: 41, 3029616: 41, 4110960: 41, 686704: 42, 2308720: 42, 2849392: 42, 4471408: 42, 883312: 42, 2914928: 42, 3455600: 42, 3046000: 42, 3586672: 42, 703088: 43, 1784432: 43, 2865776: 43, 4487792: 43, 866928: 43, 899696: 43, 2898544: 43, 3979888: 43, 3062384: 43, 719472: 44, 1260144: 44, 2882160: 44, 4504176: 44, 850544: 44, 916080: 44, 2538096: 44, 735856: 45, 2357872: 45, 834160: 45, 932464: 45, 2013808: 45, 1833584: 46, 817776: 46, 948848: 46, 1489520: 46, 1309296: 47, 801392: 47, 965232: 47, 785008: 48, 656000: 0, 656016: 1, 656032: 2, 656048: 3, 656064: 4, 656576: 5, 657088: 6, 657600: 7, 658048: 8, 658112: 8, 658064: 9, 658096: 9, 658128: 9, 658576: 10, 658080: 10, 658144: 10, 659088: 11, 658160: 11, 659600: 12, 657648: 12, 658176: 12, 659616: 13, 657136: 13, 658192: 13, 659632: 14, 656624: 14, 658208: 14, 659648: 15, 656112: 15, 658720: 15, 658224: 15, 660160: 16, 656128: 16, 659232: 16, 658240: 16, 662656: 17, 660672: 17, 656144: 17, 659744: 17, 658256: 17, 662672: 18, 661184: 18, 656160: 18, 659728: 18, 657744: 18, 658768: 18, 658272: 18, 662160: 19, 663184: 19, 661168: 19, 661200: 19, 656176: 19, 659712: 19, 657232: 19, 659280: 19, 658288: 19, 661648: 20, 663696: 20, 661152: 20, 661216: 20, 656192: 20, 659696: 20, 656720: 20, 659792: 20, 658304: 20, 661136: 21, 664208: 21, 661232: 21, 656208: 21, 660208: 21, 660304: 21, 659808: 21, 658320: 21, 664720: 22, 664224: 22, 660720: 22, 661248: 22, 656224: 22, 660816: 22, 659824: 22, 658336: 22, 665728: 23, 665232: 23, 664240: 23, 661264: 23, 656240: 23, 661328: 23, 659840: 23, 657824: 23, 658848: 23, 665744: 24, 664256: 24, 661280: 24, 656256: 24, 661840: 24, 659856: 24, 657312: 24, 659360: 24, 665760: 25, 664272: 25, 661792: 25, 656272: 25, 662352: 25, 659872: 25, 656800: 25, 667264: 26, 665776: 26, 664288: 26, 662304: 26, 656288: 26, 662864: 26, 667280: 27, 665792: 27, 664304: 27, 662816: 27, 662848: 27, 663376: 27, 667792: 28, 667296: 28, 666304: 28, 664320: 28, 663328: 28, 662832: 28, 663888: 28, 668304: 29, 667312: 29, 666816: 29, 664336: 29, 663840: 29, 664400: 29, 668816: 30, 667328: 30, 664352: 30, 664912: 30, 668832: 31, 667344: 31, 664864: 31, 665424: 31, 668848: 32, 667360: 32, 665376: 32, 665936: 32, 668864: 33, 667376: 33, 665888: 33, 665920: 33, 666448: 33, 665952: 33, 669376: 34, 666864: 34, 667392: 34, 665872: 34, 665904: 34, 666960: 34, 665968: 34, 669888: 35, 666352: 35, 667408: 35, 665856: 35, 667472: 35, 665984: 35, 670400: 36, 665840: 36, 667424: 36, 667456: 36, 667984: 36, 666000: 36, 670384: 37, 670416: 37, 667936: 37, 667440: 37, 668496: 37, 666016: 37, 670368: 38, 670432: 38, 668448: 38, 669008: 38, 666528: 38, 670352: 39, 670448: 39, 668960: 39, 669024: 39, 667040: 39, 670336: 40, 669936: 40, 670464: 40, 668944: 40, 669040: 40, 667552: 40, 669424: 41, 670480: 41, 668928: 41, 669056: 41, 667536: 41, 668912: 42, 670496: 42, 668544: 42, 669072: 42, 667520: 42, 670512: 43, 668032: 43, 669088: 43, 670528: 44, 669600: 44, 670544: 45, 670112: 45, 670560: 46, 670624: 46, 670576: 47, 670608: 47, 670592: 48, 2755200: 0, 2755216: 1, 2755728: 2, 2755232: 2, 2756240: 3, 2755248: 3, 2756752: 4, 2755264: 4, 2756768: 5, 2296448: 5, 2755280: 5, 2756784: 6, 1772160: 6, 2755296: 6, 2756800: 7, 1247872: 7, 2755312: 7, 2757312: 8, 723584: 8, 2345600: 8, 2755328: 8, 674432: 9, 2757824: 9, 707200: 9, 1821312: 9, 2755344: 9, 690816: 10, 2758336: 10, 1297024: 10, 2755360: 10, 2758320: 11, 2758352: 11, 772736: 11, 2755872: 11, 2755376: 11, 2758304: 12, 2758368: 12, 789120: 12, 2756384: 12, 2755392: 12, 2759808: 13, 2758288: 13, 2758384: 13, 805504: 13, 2756896: 13, 2755408: 13, 2759824: 14, 2758800: 14, 2757872: 14, 2758400: 14, 821888: 14, 2756880: 14, 2443904: 14, 2755920: 14, 2755424: 14, 2759312: 15, 2760336: 15, 2757360: 15, 2758416: 15, 838272: 15, 2756864: 15, 1919616: 15, 2756432: 15, 2755440: 15, 2760848: 16, 2756848: 16, 2758432: 16, 854656: 16, 1395328: 16, 2756944: 16, 2755456: 16, 2761360: 17, 2758944: 17, 871040: 17, 2757456: 17, 2756960: 17, 2755472: 17, 2761872: 18, 2761376: 18, 2759456: 18, 887424: 18, 2757968: 18, 2756976: 18, 2755488: 18, 2762880: 19, 2762384: 19, 2761392: 19, 2759968: 19, 903808: 19, 2758480: 19, 2756992: 19, 2525824: 19, 2756000: 19, 2762896: 20, 2761408: 20, 2760480: 20, 2759984: 20, 920192: 20, 2758992: 20, 2757008: 20, 2001536: 20, 2756512: 20, 2762912: 21, 2761424: 21, 2760992: 21, 2760000: 21, 936576: 21, 2759504: 21, 2757024: 21, 1477248: 21, 2764416: 22, 2762928: 22, 2761440: 22, 2761504: 22, 2760016: 22, 952960: 22, 2764432: 23, 2762944: 23, 2761456: 23, 2761488: 23, 2762016: 23, 2760528: 23, 2764944: 24, 2764448: 24, 2763456: 24, 2761472: 24, 2762528: 24, 2761040: 24, 2765456: 25, 2764464: 25, 2763968: 25, 2763040: 25, 2761552: 25, 2765968: 26, 2764480: 26, 2763024: 26, 2763056: 26, 2762064: 26, 2765984: 27, 2764496: 27, 2763008: 27, 2763072: 27, 2762576: 27, 2766000: 28, 2764512: 28, 2762992: 28, 2763088: 28, 2766016: 29, 2764528: 29, 2763504: 29, 2763600: 29, 2763104: 29, 2766528: 30, 2764016: 30, 2764544: 30, 2764112: 30, 2763120: 30, 2767040: 31, 2764560: 31, 2764624: 31, 2763136: 31, 2767552: 32, 2764576: 32, 2764608: 32, 2765136: 32, 2763152: 32, 2767536: 33, 2767568: 33, 2765088: 33, 2764592: 33, 2765648: 33, 2763168: 33, 2767520: 34, 2767584: 34, 2765600: 34, 2766160: 34, 2763680: 34, 2767504: 35, 2767600: 35, 2766112: 35, 2766176: 35, 2764192: 35, 2767488: 36, 2767088: 36, 2767616: 36, 2766096: 36, 2766192: 36, 2764704: 36, 2766576: 37, 2767632: 37, 2766080: 37, 2766208: 37, 2764688: 37, 2766064: 38, 2767648: 38, 2765696: 38, 2766224: 38, 2764672: 38, 2767664: 39, 2765184: 39, 2766240: 39, 2767680: 40, 2766752: 40, 2767696: 41, 2767264: 41, 2767712: 42, 2767776: 42, 2767728: 43, 2767760: 43, 2767744: 44, 7478400: 0, 7478416: 1, 6970496: 2, 7478928: 2, 6446208: 3, 7479440: 3, 5921920: 4, 7479952: 4, 5938304: 5, 7480464: 5, 7479968: 5, 5954688: 6, 7480976: 6, 7479984: 6, 5971072: 7, 7481488: 7, 7480000: 7, 5446784: 8, 5987456: 8, 7481472: 8, 7481504: 8, 7480016: 8, 4922496: 9, 6003840: 9, 7481520: 9, 7480032: 9, 4398208: 10, 6020224: 10, 7481536: 10, 7480048: 10, 4381824: 11, 5495936: 11, 6036608: 11, 7482048: 11, 7480064: 11, 4365440: 12, 4971648: 12, 6052992: 12, 7482560: 12, 7480080: 12, 7483008: 13, 4349056: 13, 4447360: 13, 6069376: 13, 7483072: 13, 7480096: 13, 2776192: 14, 7483024: 14, 3824768: 14, 4463744: 14, 6593664: 14, 7483056: 14, 7483088: 14, 7479584: 14, 7480608: 14, 3300480: 15, 2792576: 15, 7483536: 15, 7483040: 15, 4480128: 15, 7117952: 15, 7483104: 15, 7479072: 15, 7481120: 15, 2808960: 16, 7484048: 16, 4496512: 16, 7478560: 16, 7483120: 16, 7481632: 16, 2825344: 17, 7484560: 17, 3972224: 17, 7478576: 17, 7482608: 17, 7483136: 17, 7481616: 17, 7481648: 17, 679040: 18, 2301056: 18, 2841728: 18, 7484576: 18, 3447936: 18, 7478592: 18, 7482096: 18, 7483152: 18, 7481600: 18, 7481664: 18, 695424: 19, 1776768: 19, 2858112: 19, 7484592: 19, 2923648: 19, 7478608: 19, 7481584: 19, 7483168: 19, 7481680: 19, 711808: 20, 1252480: 20, 2874496: 20, 7484608: 20, 2907264: 20, 2940032: 20, 7167104: 20, 7479120: 20, 7483680: 20, 7483184: 20, 7481168: 20, 7482192: 20, 7481696: 20, 728192: 21, 2350208: 21, 2890880: 21, 7485120: 21, 2956416: 21, 6642816: 21, 7479632: 21, 7484192: 21, 7483200: 21, 7480656: 21, 7482704: 21, 7481712: 21, 1825920: 22, 7485632: 22, 2972800: 22, 6118528: 22, 7480144: 22, 7484704: 22, 7483216: 22, 7481728: 22, 1301632: 23, 7486144: 23, 2448512: 23, 3497088: 23, 2989184: 23, 5594240: 23, 7484688: 23, 7483728: 23, 7481744: 23, 777344: 24, 7486128: 24, 7486160: 24, 1924224: 24, 4021376: 24, 3005568: 24, 5069952: 24, 7484672: 24, 7484240: 24, 7481760: 24, 793728: 25, 7486112: 25, 7486176: 25, 1399936: 25, 4545664: 25, 3021952: 25, 7484656: 25, 7484752: 25, 7482272: 25, 810112: 26, 7486096: 26, 7486192: 26, 875648: 26, 4562048: 26, 3038336: 26, 7485168: 26, 7484768: 26, 7482784: 26, 826496: 27, 7486080: 27, 7485680: 27, 7486208: 27, 859264: 27, 892032: 27, 4578432: 27, 3054720: 27, 7484784: 27, 7483296: 27, 842880: 28, 7486224: 28, 908416: 28, 4594816: 28, 2530432: 28, 3579008: 28, 7484800: 28, 7483280: 28, 7486240: 29, 924800: 29, 4611200: 29, 2006144: 29, 4103296: 29, 7484288: 29, 7484816: 29, 7483264: 29, 7486256: 30, 941184: 30, 4627584: 30, 1481856: 30, 7483776: 30, 7484832: 30, 7486272: 31, 957568: 31, 7485344: 31, 7486288: 32, 7485856: 32, 7486304: 33, 7486368: 33, 7486320: 34, 7486352: 34, 7486336: 35, 10627200: 0, 10627216: 1, 10119296: 2, 10627232: 2, 9595008: 3, 10627248: 3, 9070720: 4, 10627264: 4, 8546432: 5, 9087104: 5, 10627776: 5, 8022144: 6, 9103488: 6, 10628288: 6, 10628736: 7, 7497856: 7, 9119872: 7, 10628800: 7, 10628752: 8, 6973568: 8, 9136256: 8, 10628784: 8, 10628816: 8, 10629264: 9, 10628768: 9, 6449280: 9, 9152640: 9, 10628832: 9, 10629776: 10, 5924992: 10, 9169024: 10, 10628848: 10, 10630288: 11, 5941376: 11, 9185408: 11, 10628336: 11, 10628864: 11, 10630304: 12, 5957760: 12, 9201792: 12, 10627824: 12, 10628880: 12, 10630320: 13, 5974144: 13, 9218176: 13, 10627312: 13, 10628896: 13, 10630336: 14, 5449856: 14, 5990528: 14, 8693888: 14, 9742464: 14, 10627328: 14, 10629408: 14, 10628912: 14, 10630848: 15, 4925568: 15, 6006912: 15, 8169600: 15, 10266752: 15, 10627344: 15, 10629920: 15, 10628928: 15, 10631360: 16, 4401280: 16, 6023296: 16, 7645312: 16, 10627360: 16, 10630432: 16, 10628944: 16, 10631872: 17, 4384896: 17, 5499008: 17, 6039680: 17, 7121024: 17, 7661696: 17, 10627376: 17, 10630416: 17, 10628432: 17, 10629456: 17, 10631856: 18, 10631888: 18, 4368512: 18, 4974720: 18, 6056064: 18, 6596736: 18, 7678080: 18, 10627392: 18, 10630400: 18, 10627920: 18, 10629968: 18, 10631840: 19, 10631904: 19, 4352128: 19, 4450432: 19, 6072448: 19, 7694464: 19, 10627408: 19, 10630384: 19, 10630480: 19, 2779264: 20, 10631824: 20, 10631920: 20, 3827840: 20, 4466816: 20, 7170176: 20, 8218752: 20, 10315904: 20, 10627424: 20, 10630896: 20, 10630496: 20, 3303552: 21, 2795648: 21, 10631808: 21, 10631408: 21, 10631936: 21, 4483200: 21, 6645888: 21, 8743040: 21, 9791616: 21, 10627440: 21, 10630512: 21, 2812032: 22, 10631952: 22, 4499584: 22, 6121600: 22, 9267328: 22, 10627456: 22, 10630528: 22, 2828416: 23, 10631968: 23, 3975296: 23, 5597312: 23, 10627472: 23, 10630016: 23, 10630544: 23, 682112: 24, 2304128: 24, 2844800: 24, 10631984: 24, 3451008: 24, 5073024: 24, 10627488: 24, 10629504: 24, 10630560: 24, 698496: 25, 1779840: 25, 2861184: 25, 10632000: 25, 2926720: 25, 4548736: 25, 10628000: 25, 10628992: 25, 10631072: 25, 714880: 26, 1255552: 26, 2877568: 26, 10632016: 26, 2910336: 26, 2943104: 26, 4024448: 26, 4565120: 26, 10628512: 26, 10629008: 26, 10631584: 26, 731264: 27, 2353280: 27, 2893952: 27, 10632032: 27, 2959488: 27, 3500160: 27, 4581504: 27, 10629024: 27, 10632096: 27, 1828992: 28, 10632048: 28, 2975872: 28, 4597888: 28, 10632080: 28, 1304704: 29, 10632064: 29, 2451584: 29, 2992256: 29, 4614272: 29, 780416: 30, 1927296: 30, 3008640: 30, 4630656: 30, 796800: 31, 1403008: 31, 3025024: 31, 4106368: 31, 813184: 32, 878720: 32, 3041408: 32, 3582080: 32, 829568: 33, 862336: 33, 895104: 33, 3057792: 33, 845952: 34, 911488: 34, 2533504: 34, 927872: 35, 2009216: 35, 944256: 36, 1484928: 36, 960640: 37, 12201600: 0, 12201616: 1, 12202128: 2, 12201632: 2, 12202640: 3, 12201648: 3, 12203152: 4, 12201664: 4, 12203168: 5, 11742848: 5, 12201680: 5, 12203184: 6, 11218560: 6, 12201696: 6, 12203200: 7, 10694272: 7, 12201712: 7, 10645120: 8, 12203712: 8, 10677888: 8, 11792000: 8, 12201728: 8, 10120832: 9, 10661504: 9, 12204224: 9, 11267712: 9, 12201744: 9, 9596544: 10, 12204736: 10, 10743424: 10, 12201760: 10, 9072256: 11, 12204720: 11, 12204752: 11, 10759808: 11, 12202272: 11, 12201776: 11, 8547968: 12, 9088640: 12, 12204704: 12, 12204768: 12, 10776192: 12, 12202784: 12, 12201792: 12, 8023680: 13, 9105024: 13, 12204688: 13, 12204784: 13, 10792576: 13, 12203296: 13, 12201808: 13, 7499392: 14, 9121408: 14, 12204672: 14, 12204272: 14, 12204800: 14, 10268288: 14, 10808960: 14, 12203280: 14, 11890304: 14, 12202320: 14, 6975104: 15, 9137792: 15, 12203760: 15, 12204816: 15, 9744000: 15, 10825344: 15, 12203264: 15, 11366016: 15, 12202832: 15, 6450816: 16, 9154176: 16, 12203248: 16, 12204832: 16, 9219712: 16, 10841728: 16, 12203344: 16, 5926528: 17, 9170560: 17, 12204848: 17, 8695424: 17, 9203328: 17, 10317440: 17, 10858112: 17, 12203360: 17, 5942912: 18, 9186944: 18, 12204864: 18, 8171136: 18, 9793152: 18, 10874496: 18, 12203376: 18, 5959296: 19, 12204880: 19, 7646848: 19, 9268864: 19, 10890880: 19, 12203392: 19, 5975680: 20, 12204896: 20, 7122560: 20, 7663232: 20, 8744576: 20, 10907264: 20, 12202880: 20, 12203408: 20, 5451392: 21, 5992064: 21, 12204912: 21, 6598272: 21, 7679616: 21, 8220288: 21, 10923648: 21, 12202368: 21, 12203424: 21, 4927104: 22, 6008448: 22, 12204928: 22, 6073984: 22, 7696000: 22, 11447936: 22, 12201856: 22, 12203936: 22, 2780800: 23, 4402816: 23, 6024832: 23, 12204944: 23, 6057600: 23, 7171712: 23, 11972224: 23, 12201872: 23, 12204448: 23, 3305088: 24, 2797184: 24, 4386432: 24, 5500544: 24, 6041216: 24, 12204960: 24, 6647424: 24, 12201888: 24, 3829376: 25, 2813568: 25, 4370048: 25, 4976256: 25, 6123136: 25, 4353664: 26, 2829952: 26, 4451968: 26, 5598848: 26, 683648: 27, 2305664: 27, 2846336: 27, 4468352: 27, 5074560: 27, 700032: 28, 1781376: 28, 2862720: 28, 4484736: 28, 4550272: 28, 716416: 29, 1257088: 29, 2879104: 29, 4501120: 29, 4025984: 29, 4566656: 29, 732800: 30, 2354816: 30, 2895488: 30, 3976832: 30, 3501696: 30, 4583040: 30, 1830528: 31, 2911872: 31, 3452544: 31, 2977408: 31, 4599424: 31, 1306240: 32, 2928256: 32, 2453120: 32, 2961024: 32, 2993792: 32, 4615808: 32, 781952: 33, 2944640: 33, 1928832: 33, 3010176: 33, 4632192: 33, 798336: 34, 1404544: 34, 3026560: 34, 4107904: 34, 814720: 35, 880256: 35, 3042944: 35, 3583616: 35, 831104: 36, 863872: 36, 896640: 36, 3059328: 36, 847488: 37, 913024: 37, 2535040: 37, 929408: 38, 2010752: 38, 945792: 39, 1486464: 39, 962176: 40, 15350400: 0, 15350416: 1, 15350432: 2, 15350448: 3, 15350464: 4, 14891648: 5, 15350480: 5, 14367360: 6, 15350496: 6, 13843072: 7, 15350512: 7, 13826688: 8, 14940800: 8, 15350528: 8, 13810304: 9, 14416512: 9, 15350544: 9, 13793920: 10, 13892224: 10, 15350560: 10, 13269632: 11, 13908608: 11, 15350576: 11, 12745344: 12, 13924992: 12, 15350592: 12, 12221056: 13, 13941376: 13, 15350608: 13, 12237440: 14, 13417088: 14, 15350624: 14, 12253824: 15, 12892800: 15, 15350640: 15, 12270208: 16, 12368512: 16, 15350656: 16, 11745920: 17, 12286592: 17, 12352128: 17, 12384896: 17, 15350672: 17, 11221632: 18, 12302976: 18, 12335744: 18, 12401280: 18, 15350688: 18, 10697344: 19, 12319360: 19, 12417664: 19, 15121024: 19, 10680960: 20, 11795072: 20, 11893376: 20, 12941952: 20, 14596736: 20, 10664576: 21, 11270784: 21, 11369088: 21, 13466240: 21, 14072448: 21, 10648192: 22, 10746496: 22, 10844800: 22, 13990528: 22, 14056064: 22, 10123904: 23, 10762880: 23, 10320512: 23, 10828416: 23, 10861184: 23, 14006912: 23, 14039680: 23, 9599616: 24, 10779264: 24, 9796224: 24, 10812032: 24, 10877568: 24, 14023296: 24, 13515392: 24, 9075328: 25, 10795648: 25, 9271936: 25, 10893952: 25, 12991104: 25, 8551040: 26, 9091712: 26, 10271360: 26, 8747648: 26, 10910336: 26, 12466816: 26, 8026752: 27, 9108096: 27, 9747072: 27, 8223360: 27, 10926720: 27, 12483200: 27, 7502464: 28, 9124480: 28, 9222784: 28, 7699072: 28, 11451008: 28, 12499584: 28, 6978176: 29, 9140864: 29, 8698496: 29, 9206400: 29, 7174784: 29, 7682688: 29, 11975296: 29, 6453888: 30, 9157248: 30, 8174208: 30, 9190016: 30, 6650496: 30, 7666304: 30, 5929600: 31, 9173632: 31, 7649920: 31, 6126208: 31, 5945984: 32, 7125632: 32, 5601920: 32, 5962368: 33, 6601344: 33, 5077632: 33, 5978752: 34, 6077056: 34, 4553344: 34, 5454464: 35, 5995136: 35, 6060672: 35, 4029056: 35, 4569728: 35, 4930176: 36, 6011520: 36, 6044288: 36, 3504768: 36, 4586112: 36, 2783872: 37, 4405888: 37, 6027904: 37, 2980480: 37, 4602496: 37, 3308160: 38, 2800256: 38, 4389504: 38, 5503616: 38, 2456192: 38, 2964096: 38, 2996864: 38, 4618880: 38, 3832448: 39, 2816640: 39, 4373120: 39, 4979328: 39, 1931904: 39, 2947712: 39, 3013248: 39, 4635264: 39, 4356736: 40, 2833024: 40, 4455040: 40, 1407616: 40, 2931328: 40, 3029632: 40, 4110976: 40, 686720: 41, 2308736: 41, 2849408: 41, 4471424: 41, 883328: 41, 2914944: 41, 3455616: 41, 3046016: 41, 3586688: 41, 703104: 42, 1784448: 42, 2865792: 42, 4487808: 42, 866944: 42, 899712: 42, 2898560: 42, 3979904: 42, 3062400: 42, 719488: 43, 1260160: 43, 2882176: 43, 4504192: 43, 850560: 43, 916096: 43, 2538112: 43, 735872: 44, 2357888: 44, 834176: 44, 932480: 44, 2013824: 44, 1833600: 45, 817792: 45, 948864: 45, 1489536: 45, 1309312: 46, 801408: 46, 965248: 46, 785024: 47, 672400: 0, 672416: 1, 672432: 2, 672448: 3, 672960: 4, 673472: 5, 673984: 6, 674496: 7, 674480: 8, 674512: 8, 674464: 9, 674528: 9, 674448: 10, 674544: 10, 674960: 11, 674032: 11, 674560: 11, 675472: 12, 673520: 12, 674576: 12, 675984: 13, 673008: 13, 674592: 13, 676000: 14, 672496: 14, 675104: 14, 674608: 14, 676016: 15, 672512: 15, 675616: 15, 674624: 15, 676032: 16, 672528: 16, 676128: 16, 674640: 16, 676544: 17, 672544: 17, 676112: 17, 674128: 17, 675152: 17, 674656: 17, 677056: 18, 672560: 18, 676096: 18, 673616: 18, 675664: 18, 674672: 18, 679056: 19, 677568: 19, 672576: 19, 676080: 19, 673104: 19, 676176: 19, 674688: 19, 678544: 20, 679568: 20, 677552: 20, 677584: 20, 672592: 20, 676592: 20, 676688: 20, 676192: 20, 674704: 20, 678032: 21, 680080: 21, 677536: 21, 677600: 21, 672608: 21, 677104: 21, 677200: 21, 676208: 21, 674720: 21, 677520: 22, 680592: 22, 677616: 22, 672624: 22, 677712: 22, 676224: 22, 674208: 22, 675232: 22, 681104: 23, 680608: 23, 677632: 23, 672640: 23, 678224: 23, 676240: 23, 673696: 23, 675744: 23, 681616: 24, 680624: 24, 677648: 24, 672656: 24, 678736: 24, 676256: 24, 673184: 24, 682128: 25, 680640: 25, 677664: 25, 672672: 25, 679248: 25, 682144: 26, 680656: 26, 678176: 26, 679232: 26, 679760: 26, 682160: 27, 680672: 27, 678688: 27, 679216: 27, 680272: 27, 683664: 28, 682176: 28, 680688: 28, 679200: 28, 680784: 28, 684176: 29, 683680: 29, 682688: 29, 680704: 29, 679712: 29, 681296: 29, 684688: 30, 683696: 30, 683200: 30, 680720: 30, 680224: 30, 681808: 30, 685200: 31, 683712: 31, 680736: 31, 682320: 31, 685216: 32, 683728: 32, 681248: 32, 682304: 32, 682832: 32, 682336: 32, 685232: 33, 683744: 33, 681760: 33, 682288: 33, 683344: 33, 682352: 33, 685248: 34, 683760: 34, 682272: 34, 683856: 34, 682368: 34, 685760: 35, 683248: 35, 683776: 35, 682256: 35, 683840: 35, 684368: 35, 682384: 35, 686272: 36, 682736: 36, 683792: 36, 682240: 36, 683824: 36, 684880: 36, 682400: 36, 686784: 37, 682224: 37, 683808: 37, 685392: 37, 682912: 37, 686768: 38, 686800: 38, 684320: 38, 685408: 38, 683424: 38, 686752: 39, 686816: 39, 684832: 39, 685424: 39, 683936: 39, 686736: 40, 686832: 40, 685344: 40, 685440: 40, 683920: 40, 686320: 41, 686848: 41, 685328: 41, 684928: 41, 685456: 41, 683904: 41, 685808: 42, 686864: 42, 685312: 42, 684416: 42, 685472: 42, 685296: 43, 686880: 43, 685984: 43, 686896: 44, 686496: 44, 686912: 45, 687008: 45, 686928: 46, 686992: 46, 686944: 47, 686976: 47, 686960: 48, 2771600: 0, 2772112: 1, 2771616: 1, 2772624: 2, 2771632: 2, 2773136: 3, 2771648: 3, 2773152: 4, 2296464: 4, 2771664: 4, 2773168: 5, 1772176: 5, 2771680: 5, 2773184: 6, 1247888: 6, 2771696: 6, 2773696: 7, 723600: 7, 2345616: 7, 2771712: 7, 2774208: 8, 707216: 8, 1821328: 8, 2771728: 8, 2774720: 9, 690832: 9, 1297040: 9, 2771744: 9, 2774704: 10, 2774736: 10, 772752: 10, 2772256: 10, 2771760: 10, 2774688: 11, 2774752: 11, 789136: 11, 2772768: 11, 2771776: 11, 2774672: 12, 2774768: 12, 805520: 12, 2773280: 12, 2771792: 12, 2775184: 13, 2774256: 13, 2774784: 13, 821904: 13, 2773264: 13, 2443920: 13, 2772304: 13, 2771808: 13, 2775696: 14, 2773744: 14, 2774800: 14, 838288: 14, 2773248: 14, 1919632: 14, 2772816: 14, 2771824: 14, 2776208: 15, 2773232: 15, 2774816: 15, 854672: 15, 1395344: 15, 2773328: 15, 2771840: 15, 2776720: 16, 2775328: 16, 871056: 16, 2773840: 16, 2773344: 16, 2771856: 16, 2777232: 17, 2775840: 17, 887440: 17, 2774352: 17, 2773360: 17, 2771872: 17, 2777744: 18, 2776352: 18, 903824: 18, 2774864: 18, 2773376: 18, 2525840: 18, 2772384: 18, 2778256: 19, 2777760: 19, 2776864: 19, 2776368: 19, 920208: 19, 2775376: 19, 2773392: 19, 2001552: 19, 2772896: 19, 2778768: 20, 2777776: 20, 2777376: 20, 2776384: 20, 936592: 20, 2775888: 20, 2773408: 20, 1477264: 20, 2779280: 21, 2777792: 21, 2777888: 21, 2776400: 21, 952976: 21, 2779296: 22, 2777808: 22, 2777872: 22, 2778400: 22, 2776912: 22, 2779312: 23, 2777824: 23, 2777856: 23, 2778912: 23, 2777424: 23, 2780816: 24, 2779328: 24, 2777840: 24, 2779424: 24, 2777936: 24, 2781328: 25, 2780832: 25, 2779840: 25, 2779408: 25, 2779440: 25, 2778448: 25, 2781840: 26, 2780848: 26, 2780352: 26, 2779392: 26, 2779456: 26, 2778960: 26, 2782352: 27, 2780864: 27, 2779376: 27, 2779472: 27, 2782368: 28, 2780880: 28, 2779888: 28, 2779984: 28, 2779488: 28, 2782384: 29, 2780896: 29, 2780400: 29, 2780496: 29, 2779504: 29, 2782400: 30, 2780912: 30, 2781008: 30, 2779520: 30, 2782912: 31, 2780928: 31, 2780992: 31, 2781520: 31, 2779536: 31, 2783424: 32, 2780944: 32, 2780976: 32, 2782032: 32, 2779552: 32, 2783936: 33, 2780960: 33, 2782544: 33, 2780064: 33, 2783920: 34, 2783952: 34, 2781472: 34, 2782560: 34, 2780576: 34, 2783904: 35, 2783968: 35, 2781984: 35, 2782576: 35, 2781088: 35, 2783888: 36, 2783984: 36, 2782496: 36, 2782592: 36, 2781072: 36, 2783472: 37, 2784000: 37, 2782480: 37, 2782080: 37, 2782608: 37, 2781056: 37, 2782960: 38, 2784016: 38, 2782464: 38, 2781568: 38, 2782624: 38, 2782448: 39, 2784032: 39, 2783136: 39, 2784048: 40, 2783648: 40, 2784064: 41, 2784160: 41, 2784080: 42, 2784144: 42, 2784096: 43, 2784128: 43, 2784112: 44, 3296400: 0, 3296912: 1, 2788496: 2, 3297424: 2, 2804880: 3, 3297440: 3, 2821264: 4, 3297456: 4, 2296976: 5, 2837648: 5, 3297472: 5, 1772688: 6, 2854032: 6, 3297984: 6, 1248400: 7, 2870416: 7, 3298496: 7, 724112: 8, 2346128: 8, 2886800: 8, 3299008: 8, 707728: 9, 1821840: 9, 2903184: 9, 3298992: 9, 3299024: 9, 691344: 10, 1297552: 10, 2919568: 10, 3298976: 10, 3299040: 10, 773264: 11, 3296544: 11, 2935952: 11, 3298960: 11, 3299056: 11, 789648: 12, 3297056: 12, 2952336: 12, 3299472: 12, 3298544: 12, 3299072: 12, 806032: 13, 3297568: 13, 2968720: 13, 3299984: 13, 3298032: 13, 3299088: 13, 822416: 14, 3297552: 14, 2444432: 14, 3296592: 14, 2985104: 14, 3300496: 14, 3297520: 14, 3299104: 14, 838800: 15, 3297536: 15, 1920144: 15, 3297104: 15, 3001488: 15, 3301008: 15, 3299616: 15, 855184: 16, 1395856: 16, 3297616: 16, 3017872: 16, 3301520: 16, 3300128: 16, 871568: 17, 3298128: 17, 3297632: 17, 3034256: 17, 3302032: 17, 3300640: 17, 887952: 18, 3298640: 18, 3297648: 18, 3050640: 18, 3302544: 18, 3302048: 18, 3301152: 18, 3300656: 18, 904336: 19, 3299152: 19, 3297664: 19, 2526352: 19, 3296672: 19, 3303056: 19, 3302064: 19, 3301664: 19, 3300672: 19, 920720: 20, 3299664: 20, 3297680: 20, 2002064: 20, 3297184: 20, 3303568: 20, 3302080: 20, 3302176: 20, 3300688: 20, 937104: 21, 3300176: 21, 3297696: 21, 1477776: 21, 3303584: 21, 3302096: 21, 3302160: 21, 3302688: 21, 3301200: 21, 953488: 22, 3303600: 22, 3302112: 22, 3302144: 22, 3303200: 22, 3301712: 22, 3303616: 23, 3302128: 23, 3303712: 23, 3302224: 23, 3304128: 24, 3303696: 24, 3303728: 24, 3302736: 24, 3305104: 25, 3304640: 25, 3303680: 25, 3303744: 25, 3303248: 25, 3305616: 26, 3305120: 26, 3305152: 26, 3303664: 26, 3303760: 26, 3306128: 27, 3305136: 27, 3305168: 27, 3304176: 27, 3304272: 27, 3303776: 27, 3306640: 28, 3305184: 28, 3304688: 28, 3304784: 28, 3303792: 28, 3306656: 29, 3305200: 29, 3305296: 29, 3303808: 29, 3306672: 30, 3305216: 30, 3305280: 30, 3305808: 30, 3303824: 30, 3306688: 31, 3305232: 31, 3305264: 31, 3306320: 31, 3303840: 31, 3307200: 32, 3305248: 32, 3306832: 32, 3304352: 32, 3307712: 33, 3305760: 33, 3306848: 33, 3304864: 33, 3308224: 34, 3306272: 34, 3306864: 34, 3305376: 34, 3308208: 35, 3308240: 35, 3306784: 35, 3306880: 35, 3305360: 35, 3308192: 36, 3308256: 36, 3306768: 36, 3306368: 36, 3306896: 36, 3305344: 36, 3308176: 37, 3308272: 37, 3306752: 37, 3305856: 37, 3306912: 37, 3307760: 38, 3308288: 38, 3306736: 38, 3307424: 38, 3307248: 39, 3308304: 39, 3307936: 39, 3308320: 40, 3308448: 40, 3308336: 41, 3308432: 41, 3308352: 42, 3308416: 42, 3308368: 43, 3308400: 43, 3308384: 44, 3821200: 0, 3821712: 1, 3821728: 2, 2789008: 3, 3821744: 3, 2805392: 4, 3821760: 4, 2821776: 5, 3822272: 5, 2297488: 6, 2838160: 6, 3822784: 6, 1773200: 7, 2854544: 7, 3823296: 7, 1248912: 8, 2870928: 8, 3823280: 8, 3823312: 8, 724624: 9, 2346640: 9, 2887312: 9, 3823264: 9, 3823328: 9, 708240: 10, 1822352: 10, 2903696: 10, 3823248: 10, 3823344: 10, 691856: 11, 1298064: 11, 2920080: 11, 3823760: 11, 3822832: 11, 3823360: 11, 773776: 12, 3444368: 12, 2936464: 12, 3824272: 12, 3822320: 12, 3823376: 12, 790160: 13, 3821344: 13, 2952848: 13, 3824784: 13, 3821808: 13, 3823392: 13, 806544: 14, 3821856: 14, 2969232: 14, 3825296: 14, 3821824: 14, 3823904: 14, 822928: 15, 3821840: 15, 2444944: 15, 3493520: 15, 2985616: 15, 3825808: 15, 3824416: 15, 839312: 16, 1920656: 16, 3821392: 16, 3002000: 16, 3826320: 16, 3824928: 16, 855696: 17, 1396368: 17, 3821904: 17, 3018384: 17, 3826832: 17, 3826336: 17, 3825440: 17, 3824944: 17, 872080: 18, 3822416: 18, 3821920: 18, 3034768: 18, 3827344: 18, 3826352: 18, 3825952: 18, 3824960: 18, 888464: 19, 3822928: 19, 3821936: 19, 3051152: 19, 3827856: 19, 3826368: 19, 3826464: 19, 3824976: 19, 904848: 20, 3823440: 20, 3821952: 20, 2526864: 20, 3575440: 20, 3827872: 20, 3826384: 20, 3826448: 20, 3826976: 20, 3824464: 20, 3825488: 20, 921232: 21, 3823952: 21, 3821968: 21, 2002576: 21, 3821472: 21, 3827888: 21, 3826400: 21, 3826432: 21, 3827488: 21, 3826000: 21, 937616: 22, 3821984: 22, 1478288: 22, 3827904: 22, 3826416: 22, 3828000: 22, 3826512: 22, 954000: 23, 3828416: 23, 3827984: 23, 3828016: 23, 3827024: 23, 3828928: 24, 3827968: 24, 3828032: 24, 3827536: 24, 3829440: 25, 3827952: 25, 3828048: 25, 3829392: 26, 3829424: 26, 3829456: 26, 3828464: 26, 3828560: 26, 3828064: 26, 3829904: 27, 3829408: 27, 3829472: 27, 3828976: 27, 3829072: 27, 3828080: 27, 3830416: 28, 3829488: 28, 3829584: 28, 3828096: 28, 3830928: 29, 3829504: 29, 3829568: 29, 3830096: 29, 3828112: 29, 3830944: 30, 3829520: 30, 3829552: 30, 3830608: 30, 3828128: 30, 3830960: 31, 3829536: 31, 3831120: 31, 3828640: 31, 3830976: 32, 3830048: 32, 3831136: 32, 3829152: 32, 3831488: 33, 3830560: 33, 3831152: 33, 3829664: 33, 3832000: 34, 3831072: 34, 3831168: 34, 3829648: 34, 3832512: 35, 3831056: 35, 3830656: 35, 3831184: 35, 3829632: 35, 3832496: 36, 3832528: 36, 3831040: 36, 3830144: 36, 3831200: 36, 3832480: 37, 3832544: 37, 3831024: 37, 3831712: 37, 3832464: 38, 3832560: 38, 3831536: 38, 3832224: 38, 3832048: 39, 3832576: 39, 3832736: 39, 3832592: 40, 3832720: 40, 3832608: 41, 3832704: 41, 3832624: 42, 3832688: 42, 3832640: 43, 3832672: 43, 3832656: 44, 4346000: 0, 4346016: 1, 4346032: 2, 4346048: 3, 2789520: 4, 4346560: 4, 2805904: 5, 4347072: 5, 2822288: 6, 4347584: 6, 2298000: 7, 2838672: 7, 4347568: 7, 4347600: 7, 1773712: 8, 2855056: 8, 4347552: 8, 4347616: 8, 1249424: 9, 2871440: 9, 4347536: 9, 4347632: 9, 725136: 10, 2347152: 10, 2887824: 10, 4348048: 10, 4347120: 10, 4347648: 10, 708752: 11, 1822864: 11, 2904208: 11, 4348560: 11, 4346608: 11, 4347664: 11, 692368: 12, 1298576: 12, 2920592: 12, 4349072: 12, 4346096: 12, 4347680: 12, 774288: 13, 3444880: 13, 2936976: 13, 4349584: 13, 4346112: 13, 4348192: 13, 790672: 14, 3969168: 14, 2953360: 14, 4350096: 14, 4346128: 14, 4348704: 14, 807056: 15, 4346144: 15, 2969744: 15, 4350608: 15, 4349216: 15, 823440: 16, 2445456: 16, 3494032: 16, 2986128: 16, 4351120: 16, 4350624: 16, 4349728: 16, 4349232: 16, 839824: 17, 1921168: 17, 4018320: 17, 3002512: 17, 4351632: 17, 4350640: 17, 4350240: 17, 4349248: 17, 856208: 18, 1396880: 18, 4346192: 18, 3018896: 18, 4352144: 18, 4350656: 18, 4350752: 18, 4349264: 18, 872592: 19, 4346704: 19, 4346208: 19, 3035280: 19, 4352160: 19, 4350672: 19, 4350736: 19, 4351264: 19, 4348752: 19, 4349776: 19, 888976: 20, 4347216: 20, 4346224: 20, 3051664: 20, 4352176: 20, 4350688: 20, 4350720: 20, 4351776: 20, 4348240: 20, 4350288: 20, 905360: 21, 4347728: 21, 4346240: 21, 2527376: 21, 3575952: 21, 4352192: 21, 4350704: 21, 4352288: 21, 4350800: 21, 921744: 22, 4346256: 22, 2003088: 22, 4100240: 22, 4352704: 22, 4352272: 22, 4352304: 22, 4351312: 22, 938128: 23, 4346272: 23, 1478800: 23, 4353216: 23, 4352256: 23, 4352320: 23, 4351824: 23, 954512: 24, 4353728: 24, 4352240: 24, 4352336: 24, 4353712: 25, 4353744: 25, 4352752: 25, 4352848: 25, 4352352: 25, 4353696: 26, 4353760: 26, 4353264: 26, 4353360: 26, 4352368: 26, 4353680: 27, 4353776: 27, 4353872: 27, 4352384: 27, 4354192: 28, 4353792: 28, 4353856: 28, 4354384: 28, 4352400: 28, 4354704: 29, 4353808: 29, 4353840: 29, 4354896: 29, 4352416: 29, 4355216: 30, 4353824: 30, 4355408: 30, 4352928: 30, 4355232: 31, 4354336: 31, 4355424: 31, 4353440: 31, 4355248: 32, 4354848: 32, 4355440: 32, 4353952: 32, 4355264: 33, 4355360: 33, 4355456: 33, 4353936: 33, 4355776: 34, 4355344: 34, 4354944: 34, 4355472: 34, 4353920: 34, 4356288: 35, 4355328: 35, 4354432: 35, 4355488: 35, 4356800: 36, 4355312: 36, 4356000: 36, 4356784: 37, 4356816: 37, 4355824: 37, 4356512: 37, 4356768: 38, 4356832: 38, 4356336: 38, 4357024: 38, 4356752: 39, 4356848: 39, 4357008: 39, 4356864: 40, 4356992: 40, 4356880: 41, 4356976: 41, 4356896: 42, 4356960: 42, 4356912: 43, 4356944: 43, 4356928: 44, 5920400: 0, 5920912: 1, 5920416: 1, 5921424: 2, 5920432: 2, 5921936: 3, 5920448: 3, 5922448: 4, 5445264: 4, 5920464: 4, 5922960: 5, 4920976: 5, 5920480: 5, 5923472: 6, 4396688: 6, 5920496: 6, 5923984: 7, 5923488: 7, 4380304: 7, 5494416: 7, 5920512: 7, 5924496: 8, 5923504: 8, 4363920: 8, 4970128: 8, 5920528: 8, 5925008: 9, 5923520: 9, 4445840: 9, 5920544: 9, 5925024: 10, 5923536: 10, 4462224: 10, 5921056: 10, 5925040: 11, 5923552: 11, 4478608: 11, 5921568: 11, 5925056: 12, 5923568: 12, 4494992: 12, 5922080: 12, 5925568: 13, 5923584: 13, 2791056: 13, 3970704: 13, 5922592: 13, 5922096: 13, 5926080: 14, 5923600: 14, 2807440: 14, 3446416: 14, 5923104: 14, 5922112: 14, 5926592: 15, 5923616: 15, 2823824: 15, 2922128: 15, 5922128: 15, 5926576: 16, 5926608: 16, 5924128: 16, 2299536: 16, 2840208: 16, 2905744: 16, 2938512: 16, 5921616: 16, 5922640: 16, 5926560: 17, 5926624: 17, 5924640: 17, 1775248: 17, 2856592: 17, 2889360: 17, 2954896: 17, 5921104: 17, 5923152: 17, 5926544: 18, 5926640: 18, 5925152: 18, 1250960: 18, 2872976: 18, 2971280: 18, 5920592: 18, 5923664: 18, 5927056: 19, 5926128: 19, 5926656: 19, 5925136: 19, 5925168: 19, 726672: 19, 2348688: 19, 2446992: 19, 3495568: 19, 2987664: 19, 5592720: 19, 5924176: 19, 5927568: 20, 5925616: 20, 5926672: 20, 5925120: 20, 5925184: 20, 710288: 20, 1824400: 20, 1922704: 20, 4019856: 20, 3004048: 20, 5068432: 20, 5924688: 20, 5928080: 21, 5925104: 21, 5926688: 21, 5925200: 21, 693904: 21, 1300112: 21, 1398416: 21, 4544144: 21, 3020432: 21, 5928096: 22, 5927200: 22, 5926704: 22, 5925712: 22, 5925216: 22, 775824: 22, 874128: 22, 4560528: 22, 3036816: 22, 5928112: 23, 5927712: 23, 5926720: 23, 5926224: 23, 5925232: 23, 792208: 23, 857744: 23, 890512: 23, 4576912: 23, 3053200: 23, 5928128: 24, 5928224: 24, 5926736: 24, 5925248: 24, 808592: 24, 841360: 24, 906896: 24, 4593296: 24, 2528912: 24, 3577488: 24, 5928640: 25, 5928208: 25, 5927248: 25, 5925264: 25, 824976: 25, 923280: 25, 4609680: 25, 2004624: 25, 4101776: 25, 5929152: 26, 5928192: 26, 5927760: 26, 5925280: 26, 939664: 26, 4626064: 26, 1480336: 26, 5929664: 27, 5928176: 27, 5928272: 27, 5925792: 27, 956048: 27, 5929648: 28, 5929680: 28, 5928688: 28, 5928288: 28, 5926304: 28, 5929632: 29, 5929696: 29, 5929200: 29, 5928304: 29, 5926816: 29, 5929616: 30, 5929712: 30, 5928320: 30, 5926800: 30, 5929728: 31, 5927808: 31, 5928336: 31, 5926784: 31, 5929744: 32, 5927296: 32, 5928352: 32, 5929760: 33, 5928864: 33, 5929776: 34, 5929376: 34, 5929792: 35, 5929888: 35, 5929808: 36, 5929872: 36, 5929824: 37, 5929856: 37, 5929840: 38, 6445200: 0, 6445712: 1, 5937296: 2, 6446224: 2, 5953680: 3, 6446736: 3, 5970064: 4, 6447248: 4, 5445776: 5, 5986448: 5, 6447760: 5, 4921488: 6, 6002832: 6, 6448272: 6, 6447776: 6, 4397200: 7, 6019216: 7, 6448784: 7, 6447792: 7, 4380816: 8, 5494928: 8, 6035600: 8, 6449296: 8, 6447808: 8, 4364432: 9, 4970640: 9, 6051984: 9, 6449312: 9, 6447824: 9, 4446352: 10, 6068368: 10, 6449328: 10, 6447840: 10, 4462736: 11, 6445344: 11, 6449344: 11, 6447856: 11, 4479120: 12, 6445856: 12, 6449856: 12, 6447872: 12, 4495504: 13, 6446368: 13, 6450368: 13, 6447888: 13, 2791568: 14, 3971216: 14, 6446880: 14, 6446384: 14, 6450880: 14, 6447904: 14, 2807952: 15, 3446928: 15, 6447392: 15, 6446400: 15, 6450864: 15, 6450896: 15, 6448416: 15, 2824336: 16, 2922640: 16, 6446416: 16, 6450848: 16, 6450912: 16, 6448928: 16, 2300048: 17, 2840720: 17, 2906256: 17, 2939024: 17, 6445904: 17, 6446928: 17, 6450832: 17, 6450928: 17, 6449440: 17, 1775760: 18, 2857104: 18, 2889872: 18, 2955408: 18, 6445392: 18, 6447440: 18, 6451344: 18, 6450416: 18, 6450944: 18, 6449424: 18, 6449456: 18, 1251472: 19, 2873488: 19, 2971792: 19, 6117520: 19, 6447952: 19, 6451856: 19, 6449904: 19, 6450960: 19, 6449408: 19, 6449472: 19, 727184: 20, 2349200: 20, 2447504: 20, 3496080: 20, 2988176: 20, 5593232: 20, 6448464: 20, 6452368: 20, 6449392: 20, 6450976: 20, 6449488: 20, 710800: 21, 1824912: 21, 1923216: 21, 4020368: 21, 3004560: 21, 5068944: 21, 6448976: 21, 6452384: 21, 6451488: 21, 6450992: 21, 6450000: 21, 6449504: 21, 694416: 22, 1300624: 22, 1398928: 22, 4544656: 22, 3020944: 22, 6452400: 22, 6452000: 22, 6451008: 22, 6450512: 22, 6449520: 22, 776336: 23, 874640: 23, 4561040: 23, 3037328: 23, 6452416: 23, 6452512: 23, 6451024: 23, 6449536: 23, 792720: 24, 858256: 24, 891024: 24, 4577424: 24, 3053712: 24, 6452928: 24, 6452496: 24, 6451536: 24, 6449552: 24, 809104: 25, 841872: 25, 907408: 25, 4593808: 25, 2529424: 25, 3578000: 25, 6453440: 25, 6452480: 25, 6452048: 25, 6449568: 25, 825488: 26, 923792: 26, 4610192: 26, 2005136: 26, 4102288: 26, 6453952: 26, 6452464: 26, 6452560: 26, 6450080: 26, 940176: 27, 4626576: 27, 1480848: 27, 6453936: 27, 6453968: 27, 6452976: 27, 6452576: 27, 6450592: 27, 956560: 28, 6453920: 28, 6453984: 28, 6453488: 28, 6452592: 28, 6451104: 28, 6453904: 29, 6454000: 29, 6452608: 29, 6451088: 29, 6454016: 30, 6452096: 30, 6452624: 30, 6451072: 30, 6454032: 31, 6451584: 31, 6452640: 31, 6454048: 32, 6453152: 32, 6454064: 33, 6453664: 33, 6454080: 34, 6454176: 34, 6454096: 35, 6454160: 35, 6454112: 36, 6454144: 36, 6454128: 37, 6970000: 0, 6970512: 1, 6971024: 2, 5937808: 3, 6971536: 3, 5954192: 4, 6972048: 4, 5970576: 5, 6972560: 5, 6972064: 5, 5446288: 6, 5986960: 6, 6973072: 6, 6972080: 6, 4922000: 7, 6003344: 7, 6973584: 7, 6972096: 7, 4397712: 8, 6019728: 8, 6973600: 8, 6972112: 8, 4381328: 9, 5495440: 9, 6036112: 9, 6973616: 9, 6972128: 9, 4364944: 10, 4971152: 10, 6052496: 10, 6973632: 10, 6972144: 10, 4446864: 11, 6068880: 11, 6974144: 11, 6972160: 11, 4463248: 12, 6593168: 12, 6974656: 12, 6972176: 12, 4479632: 13, 6970144: 13, 6975168: 13, 6972192: 13, 4496016: 14, 6970656: 14, 6975152: 14, 6975184: 14, 6971680: 14, 6972704: 14, 2792080: 15, 3971728: 15, 6971168: 15, 6970672: 15, 6975136: 15, 6975200: 15, 6973216: 15, 2808464: 16, 3447440: 16, 6970688: 16, 6975120: 16, 6975216: 16, 6973728: 16, 2824848: 17, 2923152: 17, 6970704: 17, 6975632: 17, 6974704: 17, 6975232: 17, 6973712: 17, 6973744: 17, 2300560: 18, 2841232: 18, 2906768: 18, 2939536: 18, 6970192: 18, 6971216: 18, 6976144: 18, 6974192: 18, 6975248: 18, 6973696: 18, 6973760: 18, 1776272: 19, 2857616: 19, 2890384: 19, 2955920: 19, 6642320: 19, 6971728: 19, 6976656: 19, 6973680: 19, 6975264: 19, 6973776: 19, 1251984: 20, 2874000: 20, 2972304: 20, 6118032: 20, 6972240: 20, 6976672: 20, 6975776: 20, 6975280: 20, 6973264: 20, 6974288: 20, 6973792: 20, 727696: 21, 2349712: 21, 2448016: 21, 3496592: 21, 2988688: 21, 5593744: 21, 6972752: 21, 694928: 21, 6976688: 21, 6976288: 21, 6975296: 21, 6974800: 21, 6973808: 21, 711312: 22, 1825424: 22, 1923728: 22, 4020880: 22, 3005072: 22, 5069456: 22, 6976704: 22, 6976800: 22, 6975312: 22, 6973824: 22, 1301136: 23, 1399440: 23, 4545168: 23, 3021456: 23, 6977216: 23, 6976784: 23, 6975824: 23, 6973840: 23, 776848: 24, 875152: 24, 4561552: 24, 3037840: 24, 6977728: 24, 6976768: 24, 6976336: 24, 6973856: 24, 793232: 25, 858768: 25, 891536: 25, 4577936: 25, 3054224: 25, 6978240: 25, 6976752: 25, 6976848: 25, 6974368: 25, 809616: 26, 842384: 26, 907920: 26, 4594320: 26, 2529936: 26, 3578512: 26, 6978224: 26, 6978256: 26, 6977264: 26, 6976864: 26, 6974880: 26, 826000: 27, 924304: 27, 4610704: 27, 2005648: 27, 4102800: 27, 6978208: 27, 6978272: 27, 6977776: 27, 6976880: 27, 6975392: 27, 940688: 28, 4627088: 28, 1481360: 28, 6978192: 28, 6978288: 28, 6976896: 28, 6975376: 28, 957072: 29, 6978304: 29, 6976384: 29, 6976912: 29, 6975360: 29, 6978320: 30, 6975872: 30, 6976928: 30, 6978336: 31, 6977440: 31, 6978352: 32, 6977952: 32, 6978368: 33, 6978464: 33, 6978384: 34, 6978448: 34, 6978400: 35, 6978432: 35, 6978416: 36, 7494800: 0, 7495312: 1, 7495824: 2, 7496336: 3, 5938320: 4, 7496848: 4, 7496352: 4, 5954704: 5, 7497360: 5, 7496368: 5, 5971088: 6, 7497872: 6, 7496384: 6, 5446800: 7, 5987472: 7, 7497888: 7, 7496400: 7, 4922512: 8, 6003856: 8, 7497904: 8, 7496416: 8, 4398224: 9, 6020240: 9, 7497920: 9, 7496432: 9, 4381840: 10, 5495952: 10, 6036624: 10, 7498432: 10, 7496448: 10, 4365456: 11, 4971664: 11, 6053008: 11, 7498944: 11, 7496464: 11, 4447376: 12, 6069392: 12, 7499456: 12, 7496480: 12, 4463760: 13, 6593680: 13, 7499440: 13, 7499472: 13, 7495968: 13, 7496992: 13, 4480144: 14, 7117968: 14, 7499424: 14, 7499488: 14, 7495456: 14, 7497504: 14, 4496528: 15, 7494944: 15, 7499408: 15, 7499504: 15, 7498016: 15, 2792592: 16, 3972240: 16, 7494960: 16, 7499920: 16, 7498992: 16, 7499520: 16, 7498000: 16, 7498032: 16, 2808976: 17, 3447952: 17, 7494976: 17, 7500432: 17, 7498480: 17, 7499536: 17, 7497984: 17, 7498048: 17, 2825360: 18, 2923664: 18, 7494992: 18, 7500944: 18, 7497968: 18, 7499552: 18, 7498064: 18, 2301072: 19, 2841744: 19, 2907280: 19, 2940048: 19, 7167120: 19, 7495504: 19, 7500960: 19, 7500064: 19, 7499568: 19, 7497552: 19, 7498576: 19, 7498080: 19, 1776784: 20, 2858128: 20, 2890896: 20, 2956432: 20, 6642832: 20, 7496016: 20, 695440: 20, 7500976: 20, 7500576: 20, 7499584: 20, 7497040: 20, 7499088: 20, 7498096: 20, 1252496: 21, 2874512: 21, 2972816: 21, 6118544: 21, 7496528: 21, 711824: 21, 7500992: 21, 7501088: 21, 7499600: 21, 7498112: 21, 728208: 22, 2350224: 22, 2448528: 22, 3497104: 22, 2989200: 22, 5594256: 22, 7501504: 22, 7501072: 22, 7500112: 22, 7498128: 22, 1825936: 23, 1924240: 23, 4021392: 23, 3005584: 23, 5069968: 23, 7502016: 23, 7501056: 23, 7500624: 23, 7498144: 23, 1301648: 24, 1399952: 24, 4545680: 24, 3021968: 24, 7502528: 24, 7501040: 24, 7501136: 24, 7498656: 24, 777360: 25, 875664: 25, 4562064: 25, 3038352: 25, 7502512: 25, 7502544: 25, 7501552: 25, 7501152: 25, 7499168: 25, 793744: 26, 859280: 26, 892048: 26, 4578448: 26, 3054736: 26, 7502496: 26, 7502560: 26, 7502064: 26, 7501168: 26, 7499680: 26, 810128: 27, 842896: 27, 908432: 27, 4594832: 27, 2530448: 27, 3579024: 27, 7502480: 27, 7502576: 27, 7501184: 27, 7499664: 27, 826512: 28, 924816: 28, 4611216: 28, 2006160: 28, 4103312: 28, 7502592: 28, 7500672: 28, 7501200: 28, 7499648: 28, 941200: 29, 4627600: 29, 1481872: 29, 7502608: 29, 7500160: 29, 7501216: 29, 957584: 30, 7502624: 30, 7501728: 30, 7502640: 31, 7502240: 31, 7502656: 32, 7502752: 32, 7502672: 33, 7502736: 33, 7502688: 34, 7502720: 34, 7502704: 35, 8019600: 0, 8020112: 1, 8020624: 2, 8021136: 3, 8020640: 3, 8021648: 4, 8020656: 4, 5938832: 5, 8022160: 5, 8020672: 5, 5955216: 6, 8022176: 6, 8020688: 6, 5971600: 7, 8022192: 7, 8020704: 7, 5447312: 8, 5987984: 8, 8022208: 8, 8020720: 8, 4923024: 9, 6004368: 9, 8022720: 9, 8020736: 9, 4398736: 10, 6020752: 10, 8023232: 10, 8020752: 10, 4382352: 11, 5496464: 11, 6037136: 11, 8023744: 11, 8020768: 11, 4365968: 12, 4972176: 12, 6053520: 12, 8023728: 12, 8023760: 12, 8020256: 12, 8021280: 12, 4447888: 13, 6069904: 13, 8023712: 13, 8023776: 13, 8019744: 13, 8021792: 13, 4464272: 14, 6594192: 14, 8023696: 14, 8023792: 14, 7642768: 14, 8022304: 14, 4480656: 15, 7118480: 15, 8024208: 15, 8023280: 15, 8023808: 15, 7659152: 15, 8022288: 15, 8022320: 15, 4497040: 16, 8024720: 16, 8022768: 16, 8023824: 16, 7675536: 16, 8022272: 16, 8022336: 16, 2793104: 17, 3972752: 17, 8025232: 17, 8022256: 17, 8023840: 17, 7691920: 17, 8022352: 17, 2809488: 18, 3448464: 18, 8025248: 18, 8024352: 18, 8023856: 18, 7167632: 18, 8019792: 18, 8021840: 18, 8022864: 18, 8022368: 18, 2825872: 19, 2924176: 19, 8025264: 19, 8024864: 19, 8023872: 19, 6643344: 19, 8020304: 19, 8021328: 19, 8023376: 19, 8022384: 19, 2301584: 20, 2842256: 20, 2907792: 20, 2940560: 20, 8025280: 20, 8025376: 20, 8023888: 20, 6119056: 20, 8020816: 20, 8022400: 20, 1777296: 21, 2858640: 21, 2891408: 21, 2956944: 21, 695952: 21, 8025792: 21, 8025360: 21, 8024400: 21, 5594768: 21, 8022416: 21, 1253008: 22, 2875024: 22, 2973328: 22, 712336: 22, 8026304: 22, 8025344: 22, 8024912: 22, 5070480: 22, 8022432: 22, 728720: 23, 2350736: 23, 2449040: 23, 3497616: 23, 2989712: 23, 8026816: 23, 8025328: 23, 8025424: 23, 4546192: 23, 8022944: 23, 1826448: 24, 1924752: 24, 4021904: 24, 3006096: 24, 8026800: 24, 8026832: 24, 8025840: 24, 8025440: 24, 4562576: 24, 8023456: 24, 1302160: 25, 1400464: 25, 3022480: 25, 8026784: 25, 8026848: 25, 8026352: 25, 8025456: 25, 4578960: 25, 8023968: 25, 777872: 26, 876176: 26, 3038864: 26, 8026768: 26, 8026864: 26, 8025472: 26, 4595344: 26, 8023952: 26, 794256: 27, 859792: 27, 892560: 27, 3055248: 27, 8026880: 27, 8024960: 27, 8025488: 27, 4611728: 27, 8023936: 27, 810640: 28, 843408: 28, 908944: 28, 2530960: 28, 3579536: 28, 8026896: 28, 8024448: 28, 8025504: 28, 4628112: 28, 827024: 29, 925328: 29, 2006672: 29, 4103824: 29, 8026912: 29, 8026016: 29, 941712: 30, 1482384: 30, 8026928: 30, 8026528: 30, 958096: 31, 8026944: 31, 8027040: 31, 8026960: 32, 8027024: 32, 8026976: 33, 8027008: 33, 8026992: 34, 8544400: 0, 8544912: 1, 8545424: 2, 8544928: 2, 8545936: 3, 8544944: 3, 8546448: 4, 8544960: 4, 8546464: 5, 8544976: 5, 5939344: 6, 8546480: 6, 8544992: 6, 5955728: 7, 8546496: 7, 8545008: 7, 5972112: 8, 8547008: 8, 8545024: 8, 5447824: 9, 5988496: 9, 8547520: 9, 8545040: 9, 4923536: 10, 6004880: 10, 8548032: 10, 8545056: 10, 4399248: 11, 6021264: 11, 8548016: 11, 8548048: 11, 8544544: 11, 8545568: 11, 4382864: 12, 5496976: 12, 6037648: 12, 8548000: 12, 8548064: 12, 8167568: 12, 8546080: 12, 4366480: 13, 4972688: 13, 6054032: 13, 8547984: 13, 8548080: 13, 7643280: 13, 8546592: 13, 4448400: 14, 6070416: 14, 8548496: 14, 8547568: 14, 8548096: 14, 7118992: 14, 7659664: 14, 8546576: 14, 8546608: 14, 4464784: 15, 6594704: 15, 8549008: 15, 8547056: 15, 8548112: 15, 7676048: 15, 8546560: 15, 8546624: 15, 4481168: 16, 8549520: 16, 8546544: 16, 8548128: 16, 7692432: 16, 8546640: 16, 4497552: 17, 8549536: 17, 8548640: 17, 8548144: 17, 7168144: 17, 8216720: 17, 8546128: 17, 8547152: 17, 8546656: 17, 2793616: 18, 3973264: 18, 8549552: 18, 8549152: 18, 8548160: 18, 6643856: 18, 8544592: 18, 8545616: 18, 8547664: 18, 8546672: 18, 2810000: 19, 3448976: 19, 8549568: 19, 8549664: 19, 8548176: 19, 6119568: 19, 8545104: 19, 8546688: 19, 2826384: 20, 2924688: 20, 8550080: 20, 8549648: 20, 8548688: 20, 5595280: 20, 8546704: 20, 2302096: 21, 2842768: 21, 2908304: 21, 2941072: 21, 8550592: 21, 8549632: 21, 8549200: 21, 5070992: 21, 8546720: 21, 1777808: 22, 2859152: 22, 2891920: 22, 2957456: 22, 696464: 22, 8551104: 22, 8549616: 22, 8549712: 22, 4546704: 22, 8547232: 22, 1253520: 23, 2875536: 23, 2973840: 23, 712848: 23, 8551088: 23, 8551120: 23, 8550128: 23, 8549728: 23, 4022416: 23, 4563088: 23, 8547744: 23, 729232: 24, 2351248: 24, 2449552: 24, 3498128: 24, 2990224: 24, 8551072: 24, 8551136: 24, 8550640: 24, 8549744: 24, 4579472: 24, 8548256: 24, 1826960: 25, 1925264: 25, 3006608: 25, 8551056: 25, 8551152: 25, 8549760: 25, 4595856: 25, 8548240: 25, 1302672: 26, 1400976: 26, 3022992: 26, 8551168: 26, 8549248: 26, 8549776: 26, 4612240: 26, 8548224: 26, 778384: 27, 876688: 27, 3039376: 27, 8551184: 27, 8548736: 27, 8549792: 27, 4628624: 27, 794768: 28, 860304: 28, 893072: 28, 3055760: 28, 8551200: 28, 8550304: 28, 4104336: 28, 811152: 29, 843920: 29, 909456: 29, 2531472: 29, 3580048: 29, 8551216: 29, 8550816: 29, 827536: 30, 925840: 30, 2007184: 30, 8551232: 30, 8551328: 30, 942224: 31, 1482896: 31, 8551248: 31, 8551312: 31, 958608: 32, 8551264: 32, 8551296: 32, 8551280: 33, 9069200: 0, 9069712: 1, 9069216: 1, 9070224: 2, 9069232: 2, 9070736: 3, 9069248: 3, 9070752: 4, 9069264: 4, 9070768: 5, 9069280: 5, 9070784: 6, 9069296: 6, 5939856: 7, 9071296: 7, 9069312: 7, 5956240: 8, 9071808: 8, 9069328: 8, 5972624: 9, 9072320: 9, 9069344: 9, 5448336: 10, 5989008: 10, 9072304: 10, 9072336: 10, 8692368: 10, 9069856: 10, 4924048: 11, 6005392: 11, 9072288: 11, 9072352: 11, 8168080: 11, 9070368: 11, 4399760: 12, 6021776: 12, 9072272: 12, 9072368: 12, 7643792: 12, 9070880: 12, 4383376: 13, 5497488: 13, 6038160: 13, 9072784: 13, 9071856: 13, 9072384: 13, 7119504: 13, 7660176: 13, 9070864: 13, 9070896: 13, 4366992: 14, 4973200: 14, 6054544: 14, 9073296: 14, 9071344: 14, 9072400: 14, 6595216: 14, 7676560: 14, 9070848: 14, 9070912: 14, 4448912: 15, 6070928: 15, 9073808: 15, 9070832: 15, 9072416: 15, 7692944: 15, 9070928: 15, 4465296: 16, 9073824: 16, 9072928: 16, 9072432: 16, 7168656: 16, 8217232: 16, 9070416: 16, 9071440: 16, 9070944: 16, 4481680: 17, 9073840: 17, 9073440: 17, 9072448: 17, 6644368: 17, 8741520: 17, 9069904: 17, 9071952: 17, 9070960: 17, 4498064: 18, 9073856: 18, 9073952: 18, 9072464: 18, 6120080: 18, 9069392: 18, 9070976: 18, 2794128: 19, 3973776: 19, 9074368: 19, 9073936: 19, 9072976: 19, 5595792: 19, 9070992: 19, 2810512: 20, 3449488: 20, 9074880: 20, 9073920: 20, 9073488: 20, 5071504: 20, 9071008: 20, 2826896: 21, 2925200: 21, 9075392: 21, 9073904: 21, 9074000: 21, 4547216: 21, 9071520: 21, 2302608: 22, 2843280: 22, 2908816: 22, 2941584: 22, 9075376: 22, 9075408: 22, 9074416: 22, 9074016: 22, 4022928: 22, 4563600: 22, 9072032: 22, 1778320: 23, 2859664: 23, 2892432: 23, 2957968: 23, 696976: 23, 9075360: 23, 9075424: 23, 9074928: 23, 9074032: 23, 3498640: 23, 4579984: 23, 9072544: 23, 1254032: 24, 2876048: 24, 2974352: 24, 713360: 24, 9075344: 24, 9075440: 24, 9074048: 24, 4596368: 24, 9072528: 24, 729744: 25, 2351760: 25, 2450064: 25, 2990736: 25, 9075456: 25, 9073536: 25, 9074064: 25, 4612752: 25, 9072512: 25, 1827472: 26, 1925776: 26, 3007120: 26, 9075472: 26, 9073024: 26, 9074080: 26, 4629136: 26, 1303184: 27, 1401488: 27, 3023504: 27, 9075488: 27, 9074592: 27, 4104848: 27, 778896: 28, 877200: 28, 3039888: 28, 9075504: 28, 9075104: 28, 3580560: 28, 795280: 29, 860816: 29, 893584: 29, 3056272: 29, 9075520: 29, 9075616: 29, 811664: 30, 844432: 30, 909968: 30, 2531984: 30, 9075536: 30, 9075600: 30, 828048: 31, 926352: 31, 2007696: 31, 9075552: 31, 9075584: 31, 942736: 32, 1483408: 32, 9075568: 32, 959120: 33, 9594000: 0, 9594512: 1, 9086096: 2, 9595024: 2, 9102480: 3, 9595040: 3, 9118864: 4, 9595056: 4, 9135248: 5, 9595072: 5, 9151632: 6, 9595584: 6, 9168016: 7, 9596096: 7, 5940368: 8, 9184400: 8, 9596608: 8, 5956752: 9, 9200784: 9, 9596592: 9, 9596624: 9, 5973136: 10, 9217168: 10, 9596576: 10, 9596640: 10, 5448848: 11, 5989520: 11, 8692880: 11, 9594144: 11, 9596560: 11, 9596656: 11, 4924560: 12, 6005904: 12, 8168592: 12, 9594656: 12, 9597072: 12, 9596144: 12, 9596672: 12, 4400272: 13, 6022288: 13, 7644304: 13, 9595168: 13, 9597584: 13, 9595632: 13, 9596688: 13, 4383888: 14, 5498000: 14, 6038672: 14, 7120016: 14, 7660688: 14, 9595152: 14, 9595184: 14, 9598096: 14, 9595120: 14, 9596704: 14, 4367504: 15, 4973712: 15, 6055056: 15, 6595728: 15, 7677072: 15, 9595136: 15, 9595200: 15, 9598112: 15, 9597216: 15, 9596720: 15, 4449424: 16, 6071440: 16, 7693456: 16, 9595216: 16, 9598128: 16, 9597728: 16, 9596736: 16, 4465808: 17, 7169168: 17, 8217744: 17, 9594704: 17, 9595728: 17, 9595232: 17, 9598144: 17, 9598240: 17, 9596752: 17, 4482192: 18, 6644880: 18, 8742032: 18, 9594192: 18, 9596240: 18, 9595248: 18, 9598656: 18, 9598224: 18, 9597264: 18, 4498576: 19, 6120592: 19, 9266320: 19, 9595264: 19, 9599168: 19, 9598208: 19, 9597776: 19, 2794640: 20, 3974288: 20, 5596304: 20, 9595280: 20, 9599680: 20, 9598192: 20, 9598288: 20, 2811024: 21, 3450000: 21, 5072016: 21, 9595296: 21, 9599664: 21, 9599696: 21, 9598704: 21, 9598304: 21, 2827408: 22, 2925712: 22, 4547728: 22, 9595808: 22, 9599648: 22, 9599712: 22, 9599216: 22, 9598320: 22, 2303120: 23, 2843792: 23, 2909328: 23, 2942096: 23, 4023440: 23, 4564112: 23, 9596320: 23, 9599632: 23, 9599728: 23, 9598336: 23, 1778832: 24, 2860176: 24, 2892944: 24, 2958480: 24, 697488: 24, 3499152: 24, 4580496: 24, 9596832: 24, 9599744: 24, 9597824: 24, 9598352: 24, 1254544: 25, 2876560: 25, 2974864: 25, 713872: 25, 4596880: 25, 9596816: 25, 9599760: 25, 9597312: 25, 9598368: 25, 730256: 26, 2352272: 26, 2450576: 26, 2991248: 26, 4613264: 26, 9596800: 26, 9599776: 26, 9598880: 26, 1827984: 27, 1926288: 27, 3007632: 27, 4629648: 27, 9599792: 27, 9599392: 27, 1303696: 28, 1402000: 28, 3024016: 28, 4105360: 28, 9599808: 28, 9599904: 28, 779408: 29, 877712: 29, 3040400: 29, 3581072: 29, 9599824: 29, 9599888: 29, 795792: 30, 861328: 30, 894096: 30, 3056784: 30, 9599840: 30, 9599872: 30, 812176: 31, 844944: 31, 910480: 31, 2532496: 31, 9599856: 31, 828560: 32, 926864: 32, 2008208: 32, 943248: 33, 1483920: 33, 959632: 34, 10118800: 0, 10119312: 1, 10119328: 2, 9086608: 3, 10119344: 3, 9102992: 4, 10119360: 4, 9119376: 5, 10119872: 5, 9135760: 6, 10120384: 6, 9152144: 7, 10120896: 7, 9168528: 8, 10120880: 8, 10120912: 8, 5940880: 9, 9184912: 9, 10120864: 9, 10120928: 9, 5957264: 10, 9201296: 10, 10120848: 10, 10120944: 10, 5973648: 11, 9217680: 11, 10121360: 11, 10120432: 11, 10120960: 11, 5449360: 12, 5990032: 12, 8693392: 12, 9741968: 12, 10121872: 12, 10119920: 12, 10120976: 12, 4925072: 13, 6006416: 13, 8169104: 13, 10118944: 13, 10122384: 13, 10119408: 13, 10120992: 13, 4400784: 14, 6022800: 14, 7644816: 14, 10119456: 14, 10122400: 14, 10119424: 14, 10121504: 14, 10121008: 14, 4384400: 15, 5498512: 15, 6039184: 15, 7120528: 15, 7661200: 15, 10119440: 15, 10119472: 15, 10122416: 15, 10122016: 15, 10121024: 15, 4368016: 16, 4974224: 16, 6055568: 16, 6596240: 16, 7677584: 16, 10119488: 16, 10122432: 16, 10122528: 16, 10121040: 16, 4449936: 17, 6071952: 17, 7693968: 17, 10119504: 17, 10122944: 17, 10122512: 17, 10120528: 17, 10121552: 17, 4466320: 18, 7169680: 18, 8218256: 18, 10118992: 18, 10120016: 18, 10119520: 18, 10123456: 18, 10122496: 18, 10122064: 18, 4482704: 19, 6645392: 19, 8742544: 19, 9791120: 19, 10119536: 19, 10123968: 19, 10122480: 19, 10122576: 19, 4499088: 20, 6121104: 20, 9266832: 20, 10119552: 20, 10123952: 20, 10123984: 20, 10122992: 20, 10122592: 20, 2795152: 21, 3974800: 21, 5596816: 21, 10119568: 21, 10123936: 21, 10124000: 21, 10123504: 21, 10122608: 21, 2811536: 22, 3450512: 22, 5072528: 22, 10119584: 22, 10123920: 22, 10124016: 22, 10122624: 22, 2827920: 23, 2926224: 23, 4548240: 23, 10120096: 23, 10124032: 23, 10122112: 23, 10122640: 23, 2303632: 24, 2844304: 24, 2909840: 24, 2942608: 24, 4023952: 24, 4564624: 24, 10120608: 24, 10124048: 24, 10121600: 24, 10122656: 24, 1779344: 25, 2860688: 25, 2893456: 25, 2958992: 25, 698000: 25, 3499664: 25, 4581008: 25, 10121120: 25, 10124064: 25, 10121088: 25, 10123168: 25, 1255056: 26, 2877072: 26, 2975376: 26, 714384: 26, 4597392: 26, 10121104: 26, 10124080: 26, 10123680: 26, 730768: 27, 2352784: 27, 2451088: 27, 2991760: 27, 4613776: 27, 10124096: 27, 10124192: 27, 1828496: 28, 1926800: 28, 3008144: 28, 4630160: 28, 10124112: 28, 10124176: 28, 1304208: 29, 1402512: 29, 3024528: 29, 4105872: 29, 10124128: 29, 10124160: 29, 779920: 30, 878224: 30, 3040912: 30, 3581584: 30, 10124144: 30, 796304: 31, 861840: 31, 894608: 31, 3057296: 31, 812688: 32, 845456: 32, 910992: 32, 2533008: 32, 829072: 33, 927376: 33, 2008720: 33, 943760: 34, 1484432: 34, 960144: 35, 10643600: 0, 10643616: 1, 10643632: 2, 10643648: 3, 9087120: 4, 10644160: 4, 9103504: 5, 10644672: 5, 9119888: 6, 10645184: 6, 9136272: 7, 10645168: 7, 10645200: 7, 9152656: 8, 10645152: 8, 10645216: 8, 9169040: 9, 10645136: 9, 10645232: 9, 5941392: 10, 9185424: 10, 10645648: 10, 10644720: 10, 10645248: 10, 5957776: 11, 9201808: 11, 10646160: 11, 10644208: 11, 10645264: 11, 5974160: 12, 9218192: 12, 10646672: 12, 10643696: 12, 10645280: 12, 5449872: 13, 5990544: 13, 8693904: 13, 9742480: 13, 10646688: 13, 10643712: 13, 10645792: 13, 10645296: 13, 4925584: 14, 6006928: 14, 8169616: 14, 10266768: 14, 10646704: 14, 10643728: 14, 10646304: 14, 10645312: 14, 4401296: 15, 6023312: 15, 7645328: 15, 10643744: 15, 10646720: 15, 10646816: 15, 10645328: 15, 4384912: 16, 5499024: 16, 6039696: 16, 7121040: 16, 7661712: 16, 10643760: 16, 10647232: 16, 10646800: 16, 10644816: 16, 10645840: 16, 4368528: 17, 4974736: 17, 6056080: 17, 6596752: 17, 7678096: 17, 10643776: 17, 10647744: 17, 10646784: 17, 10644304: 17, 10646352: 17, 4450448: 18, 6072464: 18, 7694480: 18, 10643792: 18, 10648256: 18, 10646768: 18, 10646864: 18, 4466832: 19, 7170192: 19, 8218768: 19, 10315920: 19, 10643808: 19, 10648240: 19, 10648272: 19, 10647280: 19, 10646880: 19, 4483216: 20, 6645904: 20, 8743056: 20, 9791632: 20, 10643824: 20, 10648224: 20, 10648288: 20, 10647792: 20, 10646896: 20, 4499600: 21, 6121616: 21, 9267344: 21, 10643840: 21, 10648208: 21, 10648304: 21, 10646912: 21, 2795664: 22, 3975312: 22, 5597328: 22, 10643856: 22, 10648320: 22, 10646400: 22, 10646928: 22, 2812048: 23, 3451024: 23, 5073040: 23, 10643872: 23, 10648336: 23, 10645888: 23, 10646944: 23, 2828432: 24, 2926736: 24, 4548752: 24, 10644384: 24, 10648352: 24, 10645376: 24, 10647456: 24, 2304144: 25, 2844816: 25, 2910352: 25, 2943120: 25, 4024464: 25, 4565136: 25, 10644896: 25, 10648368: 25, 10645392: 25, 10647968: 25, 1779856: 26, 2861200: 26, 2893968: 26, 2959504: 26, 698512: 26, 3500176: 26, 4581520: 26, 10645408: 26, 10648384: 26, 10648480: 26, 1255568: 27, 2877584: 27, 2975888: 27, 714896: 27, 4597904: 27, 10648400: 27, 10648464: 27, 731280: 28, 2353296: 28, 2451600: 28, 2992272: 28, 4614288: 28, 10648416: 28, 10648448: 28, 1829008: 29, 1927312: 29, 3008656: 29, 4630672: 29, 10648432: 29, 1304720: 30, 1403024: 30, 3025040: 30, 4106384: 30, 780432: 31, 878736: 31, 3041424: 31, 3582096: 31, 796816: 32, 862352: 32, 895120: 32, 3057808: 32, 813200: 33, 845968: 33, 911504: 33, 2533520: 33, 829584: 34, 927888: 34, 2009232: 34, 944272: 35, 1484944: 35, 960656: 36, 12218000: 0, 12218512: 1, 12218016: 1, 12219024: 2, 12218032: 2, 12219536: 3, 12218048: 3, 12219552: 4, 11742864: 4, 12218064: 4, 12219568: 5, 11218576: 5, 12218080: 5, 12219584: 6, 10694288: 6, 12218096: 6, 12220096: 7, 10677904: 7, 11792016: 7, 12218112: 7, 12220608: 8, 10661520: 8, 11267728: 8, 12218128: 8, 12221120: 9, 10743440: 9, 12218144: 9, 12221104: 10, 12221136: 10, 10759824: 10, 12218656: 10, 12218160: 10, 12221088: 11, 12221152: 11, 10776208: 11, 12219168: 11, 12218176: 11, 12221072: 12, 12221168: 12, 10792592: 12, 12219680: 12, 12218192: 12, 9088656: 13, 12220656: 13, 12221184: 13, 10268304: 13, 10808976: 13, 12219664: 13, 11890320: 13, 12218704: 13, 9105040: 14, 12220144: 14, 12221200: 14, 9744016: 14, 10825360: 14, 12219648: 14, 11366032: 14, 12219216: 14, 9121424: 15, 12219632: 15, 12221216: 15, 9219728: 15, 10841744: 15, 12219728: 15, 9137808: 16, 12221232: 16, 8695440: 16, 9203344: 16, 10317456: 16, 10858128: 16, 12219744: 16, 9154192: 17, 12221248: 17, 8171152: 17, 9186960: 17, 9793168: 17, 10874512: 17, 12219760: 17, 9170576: 18, 12221264: 18, 7646864: 18, 9268880: 18, 10890896: 18, 12219776: 18, 5942928: 19, 12221280: 19, 7122576: 19, 7663248: 19, 8744592: 19, 10907280: 19, 12219264: 19, 12219792: 19, 5959312: 20, 12221296: 20, 6598288: 20, 7679632: 20, 8220304: 20, 10923664: 20, 12218752: 20, 12219808: 20, 5975696: 21, 12221312: 21, 6074000: 21, 7696016: 21, 11447952: 21, 12218240: 21, 12220320: 21, 5451408: 22, 5992080: 22, 12221328: 22, 6057616: 22, 7171728: 22, 11972240: 22, 12218256: 22, 12220832: 22, 4927120: 23, 6008464: 23, 12221344: 23, 6041232: 23, 6647440: 23, 12218272: 23, 4402832: 24, 6024848: 24, 6123152: 24, 2797200: 25, 4386448: 25, 5500560: 25, 5598864: 25, 2813584: 26, 4370064: 26, 4976272: 26, 5074576: 26, 2829968: 27, 4451984: 27, 4550288: 27, 2305680: 28, 2846352: 28, 4468368: 28, 4026000: 28, 4566672: 28, 700048: 29, 1781392: 29, 2862736: 29, 4484752: 29, 3501712: 29, 4583056: 29, 716432: 30, 1257104: 30, 2879120: 30, 4501136: 30, 2977424: 30, 4599440: 30, 732816: 31, 2354832: 31, 2895504: 31, 3976848: 31, 2453136: 31, 2961040: 31, 2993808: 31, 4615824: 31, 1830544: 32, 2911888: 32, 3452560: 32, 1928848: 32, 2944656: 32, 3010192: 32, 4632208: 32, 1306256: 33, 2928272: 33, 1404560: 33, 3026576: 33, 4107920: 33, 781968: 34, 880272: 34, 3042960: 34, 3583632: 34, 798352: 35, 863888: 35, 896656: 35, 3059344: 35, 814736: 36, 847504: 36, 913040: 36, 2535056: 36, 831120: 37, 929424: 37, 2010768: 37, 945808: 38, 1486480: 38, 962192: 39, 12742800: 0, 12743312: 1, 12234896: 2, 12743824: 2, 12251280: 3, 12743840: 3, 12267664: 4, 12743856: 4, 11743376: 5, 12284048: 5, 12743872: 5, 11219088: 6, 12300432: 6, 12744384: 6, 10694800: 7, 12316816: 7, 12744896: 7, 10678416: 8, 11792528: 8, 12333200: 8, 12745408: 8, 10662032: 9, 11268240: 9, 12349584: 9, 12745392: 9, 12745424: 9, 10743952: 10, 12365968: 10, 12745376: 10, 12745440: 10, 10760336: 11, 12742944: 11, 12382352: 11, 12745360: 11, 12745456: 11, 10776720: 12, 12743456: 12, 12398736: 12, 12744944: 12, 12745472: 12, 10793104: 13, 12743968: 13, 12415120: 13, 12744432: 13, 12745488: 13, 9089168: 14, 10268816: 14, 10809488: 14, 12743952: 14, 11890832: 14, 12742992: 14, 12743920: 14, 12745504: 14, 9105552: 15, 9744528: 15, 10825872: 15, 12743936: 15, 11366544: 15, 12743504: 15, 12745520: 15, 9121936: 16, 9220240: 16, 10842256: 16, 12744016: 16, 12745536: 16, 9138320: 17, 8695952: 17, 9203856: 17, 10317968: 17, 10858640: 17, 12744032: 17, 12745552: 17, 9154704: 18, 8171664: 18, 9187472: 18, 9793680: 18, 10875024: 18, 12744048: 18, 12745568: 18, 9171088: 19, 7647376: 19, 9269392: 19, 10891408: 19, 12744064: 19, 12745584: 19, 5943440: 20, 7123088: 20, 7663760: 20, 8745104: 20, 10907792: 20, 12743552: 20, 12744080: 20, 12745600: 20, 5959824: 21, 6598800: 21, 7680144: 21, 8220816: 21, 10924176: 21, 12743040: 21, 12744096: 21, 12745616: 21, 5976208: 22, 6074512: 22, 7696528: 22, 11448464: 22, 12464272: 22, 12744608: 22, 12745632: 22, 5451920: 23, 5992592: 23, 6058128: 23, 7172240: 23, 11972752: 23, 12480656: 23, 12745120: 23, 4927632: 24, 6008976: 24, 6041744: 24, 6647952: 24, 12497040: 24, 4403344: 25, 6025360: 25, 6123664: 25, 2797712: 26, 4386960: 26, 5501072: 26, 5599376: 26, 2814096: 27, 4370576: 27, 4976784: 27, 5075088: 27, 2830480: 28, 4452496: 28, 4550800: 28, 2306192: 29, 2846864: 29, 4468880: 29, 4026512: 29, 4567184: 29, 700560: 30, 1781904: 30, 2863248: 30, 4485264: 30, 3502224: 30, 4583568: 30, 716944: 31, 1257616: 31, 2879632: 31, 4501648: 31, 2977936: 31, 4599952: 31, 733328: 32, 2355344: 32, 2896016: 32, 3977360: 32, 2453648: 32, 2961552: 32, 2994320: 32, 4616336: 32, 1831056: 33, 2912400: 33, 3453072: 33, 1929360: 33, 2945168: 33, 3010704: 33, 4632720: 33, 1306768: 34, 2928784: 34, 1405072: 34, 3027088: 34, 4108432: 34, 782480: 35, 880784: 35, 3043472: 35, 3584144: 35, 798864: 36, 864400: 36, 897168: 36, 3059856: 36, 815248: 37, 848016: 37, 913552: 37, 2535568: 37, 831632: 38, 929936: 38, 2011280: 38, 946320: 39, 1486992: 39, 962704: 40, 13267600: 0, 13268112: 1, 13268128: 2, 12235408: 3, 13268144: 3, 12251792: 4, 13268160: 4, 12268176: 5, 13268672: 5, 11743888: 6, 12284560: 6, 13269184: 6, 11219600: 7, 12300944: 7, 13269696: 7, 10695312: 8, 12317328: 8, 13269680: 8, 13269712: 8, 10678928: 9, 11793040: 9, 12333712: 9, 13269664: 9, 13269728: 9, 10662544: 10, 11268752: 10, 12350096: 10, 13269648: 10, 13269744: 10, 10744464: 11, 12366480: 11, 13269232: 11, 13269760: 11, 10760848: 12, 12890768: 12, 12382864: 12, 13268720: 12, 13269776: 12, 10777232: 13, 13267744: 13, 12399248: 13, 13268208: 13, 13269792: 13, 10793616: 14, 13268256: 14, 12415632: 14, 13268224: 14, 13269808: 14, 9089680: 15, 10269328: 15, 10810000: 15, 13268240: 15, 11891344: 15, 12939920: 15, 13269824: 15, 9106064: 16, 9745040: 16, 10826384: 16, 11367056: 16, 13267792: 16, 13269840: 16, 9122448: 17, 9220752: 17, 10842768: 17, 13268304: 17, 13269856: 17, 9138832: 18, 8696464: 18, 9204368: 18, 10318480: 18, 10859152: 18, 13268320: 18, 13269872: 18, 9155216: 19, 8172176: 19, 9187984: 19, 9794192: 19, 10875536: 19, 13268336: 19, 13269888: 19, 9171600: 20, 7647888: 20, 9269904: 20, 10891920: 20, 13268352: 20, 13269904: 20, 5943952: 21, 7123600: 21, 7664272: 21, 8745616: 21, 10908304: 21, 13267840: 21, 13268368: 21, 13269920: 21, 5960336: 22, 6599312: 22, 7680656: 22, 8221328: 22, 10924688: 22, 12989072: 22, 13268384: 22, 13269408: 22, 5976720: 23, 6075024: 23, 7697040: 23, 11448976: 23, 12464784: 23, 13268896: 23, 5452432: 24, 5993104: 24, 6058640: 24, 7172752: 24, 11973264: 24, 12481168: 24, 4928144: 25, 6009488: 25, 6042256: 25, 6648464: 25, 12497552: 25, 4403856: 26, 6025872: 26, 6124176: 26, 2798224: 27, 4387472: 27, 5501584: 27, 5599888: 27, 2814608: 28, 4371088: 28, 4977296: 28, 5075600: 28, 2830992: 29, 4453008: 29, 4551312: 29, 2306704: 30, 2847376: 30, 4469392: 30, 4027024: 30, 4567696: 30, 701072: 31, 1782416: 31, 2863760: 31, 4485776: 31, 3502736: 31, 4584080: 31, 717456: 32, 1258128: 32, 2880144: 32, 4502160: 32, 2978448: 32, 4600464: 32, 733840: 33, 2355856: 33, 2896528: 33, 3977872: 33, 2454160: 33, 2962064: 33, 2994832: 33, 4616848: 33, 1831568: 34, 2912912: 34, 3453584: 34, 1929872: 34, 2945680: 34, 3011216: 34, 4633232: 34, 1307280: 35, 2929296: 35, 1405584: 35, 3027600: 35, 4108944: 35, 782992: 36, 881296: 36, 3043984: 36, 3584656: 36, 799376: 37, 864912: 37, 897680: 37, 3060368: 37, 815760: 38, 848528: 38, 914064: 38, 2536080: 38, 832144: 39, 930448: 39, 2011792: 39, 946832: 40, 1487504: 40, 963216: 41, 13792400: 0, 13792416: 1, 13792432: 2, 13792448: 3, 12235920: 4, 13792960: 4, 12252304: 5, 13793472: 5, 12268688: 6, 13793984: 6, 11744400: 7, 12285072: 7, 13793968: 7, 13794000: 7, 11220112: 8, 12301456: 8, 13793952: 8, 13794016: 8, 10695824: 9, 12317840: 9, 13793936: 9, 13794032: 9, 10679440: 10, 11793552: 10, 12334224: 10, 13793520: 10, 13794048: 10, 10663056: 11, 11269264: 11, 12350608: 11, 13793008: 11, 13794064: 11, 10744976: 12, 12366992: 12, 13792496: 12, 13794080: 12, 10761360: 13, 12891280: 13, 12383376: 13, 13792512: 13, 13794096: 13, 10777744: 14, 13415568: 14, 12399760: 14, 13792528: 14, 13794112: 14, 10794128: 15, 13792544: 15, 12416144: 15, 13794128: 15, 9090192: 16, 10269840: 16, 10810512: 16, 11891856: 16, 12940432: 16, 13794144: 16, 9106576: 17, 9745552: 17, 10826896: 17, 11367568: 17, 13464720: 17, 13794160: 17, 9122960: 18, 9221264: 18, 10843280: 18, 13792592: 18, 13794176: 18, 9139344: 19, 8696976: 19, 9204880: 19, 10318992: 19, 10859664: 19, 13792608: 19, 13794192: 19, 9155728: 20, 8172688: 20, 9188496: 20, 9794704: 20, 10876048: 20, 13792624: 20, 13794208: 20, 9172112: 21, 7648400: 21, 9270416: 21, 10892432: 21, 13792640: 21, 13793696: 21, 5944464: 22, 7124112: 22, 7664784: 22, 8746128: 22, 10908816: 22, 13513872: 22, 13792656: 22, 13793184: 22, 5960848: 23, 6599824: 23, 7681168: 23, 8221840: 23, 10925200: 23, 12989584: 23, 13792672: 23, 5977232: 24, 6075536: 24, 7697552: 24, 11449488: 24, 12465296: 24, 5452944: 25, 5993616: 25, 6059152: 25, 7173264: 25, 11973776: 25, 12481680: 25, 4928656: 26, 6010000: 26, 6042768: 26, 6648976: 26, 12498064: 26, 4404368: 27, 6026384: 27, 6124688: 27, 2798736: 28, 4387984: 28, 5502096: 28, 5600400: 28, 2815120: 29, 4371600: 29, 4977808: 29, 5076112: 29, 2831504: 30, 4453520: 30, 4551824: 30, 2307216: 31, 2847888: 31, 4469904: 31, 4027536: 31, 4568208: 31, 701584: 32, 1782928: 32, 2864272: 32, 4486288: 32, 3503248: 32, 4584592: 32, 717968: 33, 1258640: 33, 2880656: 33, 4502672: 33, 2978960: 33, 4600976: 33, 734352: 34, 2356368: 34, 2897040: 34, 3978384: 34, 2454672: 34, 2962576: 34, 2995344: 34, 4617360: 34, 1832080: 35, 2913424: 35, 3454096: 35, 1930384: 35, 2946192: 35, 3011728: 35, 4633744: 35, 1307792: 36, 2929808: 36, 1406096: 36, 3028112: 36, 4109456: 36, 783504: 37, 881808: 37, 3044496: 37, 3585168: 37, 799888: 38, 865424: 38, 898192: 38, 3060880: 38, 816272: 39, 849040: 39, 914576: 39, 2536592: 39, 832656: 40, 930960: 40, 2012304: 40, 947344: 41, 1488016: 41, 963728: 42, 15366800: 0, 15366816: 1, 15366832: 2, 15366848: 3, 14891664: 4, 15366864: 4, 14367376: 5, 15366880: 5, 13843088: 6, 15366896: 6, 13826704: 7, 14940816: 7, 15366912: 7, 13810320: 8, 14416528: 8, 15366928: 8, 13892240: 9, 15366944: 9, 13908624: 10, 15366960: 10, 13925008: 11, 15366976: 11, 13941392: 12, 15366992: 12, 12237456: 13, 13417104: 13, 15367008: 13, 12253840: 14, 12892816: 14, 15367024: 14, 12270224: 15, 12368528: 15, 15367040: 15, 11745936: 16, 12286608: 16, 12352144: 16, 12384912: 16, 15367056: 16, 11221648: 17, 12302992: 17, 12335760: 17, 12401296: 17, 15367072: 17, 10697360: 18, 12319376: 18, 12417680: 18, 15121040: 18, 10680976: 19, 11795088: 19, 11893392: 19, 12941968: 19, 14596752: 19, 10664592: 20, 11270800: 20, 11369104: 20, 13466256: 20, 14072464: 20, 10746512: 21, 10844816: 21, 13990544: 21, 14056080: 21, 10762896: 22, 10320528: 22, 10828432: 22, 10861200: 22, 14006928: 22, 14039696: 22, 10779280: 23, 9796240: 23, 10812048: 23, 10877584: 23, 14023312: 23, 13515408: 23, 10795664: 24, 9271952: 24, 10893968: 24, 12991120: 24, 9091728: 25, 10271376: 25, 8747664: 25, 10910352: 25, 12466832: 25, 9108112: 26, 9747088: 26, 8223376: 26, 10926736: 26, 12483216: 26, 9124496: 27, 9222800: 27, 7699088: 27, 11451024: 27, 12499600: 27, 9140880: 28, 8698512: 28, 9206416: 28, 7174800: 28, 7682704: 28, 11975312: 28, 9157264: 29, 8174224: 29, 9190032: 29, 6650512: 29, 7666320: 29, 9173648: 30, 7649936: 30, 6126224: 30, 5946000: 31, 7125648: 31, 5601936: 31, 5962384: 32, 6601360: 32, 5077648: 32, 5978768: 33, 6077072: 33, 4553360: 33, 5454480: 34, 5995152: 34, 6060688: 34, 4029072: 34, 4569744: 34, 4930192: 35, 6011536: 35, 6044304: 35, 3504784: 35, 4586128: 35, 4405904: 36, 6027920: 36, 2980496: 36, 4602512: 36, 2800272: 37, 4389520: 37, 5503632: 37, 2456208: 37, 2964112: 37, 2996880: 37, 4618896: 37, 2816656: 38, 4373136: 38, 4979344: 38, 1931920: 38, 2947728: 38, 3013264: 38, 4635280: 38, 2833040: 39, 4455056: 39, 1407632: 39, 2931344: 39, 3029648: 39, 4110992: 39, 2308752: 40, 2849424: 40, 4471440: 40, 883344: 40, 2914960: 40, 3455632: 40, 3046032: 40, 3586704: 40, 703120: 41, 1784464: 41, 2865808: 41, 4487824: 41, 866960: 41, 899728: 41, 2898576: 41, 3979920: 41, 3062416: 41, 719504: 42, 1260176: 42, 2882192: 42, 4504208: 42, 850576: 42, 916112: 42, 2538128: 42, 735888: 43, 2357904: 43, 834192: 43, 932496: 43, 2013840: 43, 1833616: 44, 817808: 44, 948880: 44, 1489552: 44, 1309328: 45, 801424: 45, 965264: 45, 785040: 46, 688800: 0, 688816: 1, 688832: 2, 689344: 3, 689856: 4, 690368: 5, 690880: 6, 690864: 7, 690896: 7, 690848: 8, 690912: 8, 690928: 9, 690416: 10, 690944: 10, 689904: 11, 690960: 11, 689392: 12, 690976: 12, 692384: 13, 688880: 13, 691488: 13, 690992: 13, 692400: 14, 688896: 14, 692000: 14, 691008: 14, 692416: 15, 688912: 15, 692512: 15, 691024: 15, 692928: 16, 688928: 16, 692496: 16, 690512: 16, 691536: 16, 691040: 16, 693440: 17, 688944: 17, 692480: 17, 690000: 17, 692048: 17, 691056: 17, 693952: 18, 688960: 18, 692464: 18, 689488: 18, 692560: 18, 691072: 18, 693936: 19, 693968: 19, 688976: 19, 692976: 19, 693072: 19, 692576: 19, 691088: 19, 693920: 20, 693984: 20, 688992: 20, 693488: 20, 693584: 20, 692592: 20, 691104: 20, 694000: 21, 689008: 21, 694096: 21, 692608: 21, 690592: 21, 691616: 21, 694016: 22, 689024: 22, 694608: 22, 692624: 22, 690080: 22, 692128: 22, 694032: 23, 689040: 23, 695120: 23, 692640: 23, 689568: 23, 696992: 24, 694048: 24, 689056: 24, 695632: 24, 697008: 25, 694560: 25, 695616: 25, 696144: 25, 697024: 26, 695072: 26, 695600: 26, 696656: 26, 698528: 27, 697040: 27, 695584: 27, 697168: 27, 698544: 28, 697056: 28, 696096: 28, 697680: 28, 698560: 29, 697072: 29, 696608: 29, 698192: 29, 700064: 30, 699072: 30, 697088: 30, 697120: 30, 698704: 30, 700080: 31, 699584: 31, 697104: 31, 697632: 31, 698688: 31, 699216: 31, 698720: 31, 700096: 32, 698144: 32, 698672: 32, 699728: 32, 698736: 32, 701600: 33, 700112: 33, 698656: 33, 700240: 33, 698752: 33, 701616: 34, 700128: 34, 698640: 34, 700224: 34, 700752: 34, 698768: 34, 701632: 35, 700144: 35, 698624: 35, 700208: 35, 701264: 35, 698784: 35, 702144: 36, 699632: 36, 700160: 36, 698608: 36, 700192: 36, 701776: 36, 699296: 36, 702656: 37, 699120: 37, 700176: 37, 700704: 37, 701792: 37, 699808: 37, 703168: 38, 701216: 38, 701808: 38, 700320: 38, 703152: 39, 703184: 39, 701728: 39, 701824: 39, 700304: 39, 703136: 40, 703200: 40, 701712: 40, 701312: 40, 701840: 40, 700288: 40, 703216: 41, 701696: 41, 700800: 41, 701856: 41, 702704: 42, 703232: 42, 701680: 42, 702368: 42, 702192: 43, 703248: 43, 702880: 43, 703264: 44, 703392: 44, 703280: 45, 703376: 45, 703296: 46, 703360: 46, 703312: 47, 703344: 47, 703328: 48, 2788000: 0, 2788016: 1, 2788032: 2, 2296480: 3, 2788048: 3, 1772192: 4, 2788064: 4, 2789536: 5, 1247904: 5, 2788080: 5, 2789552: 6, 723616: 6, 2345632: 6, 2788096: 6, 2789568: 7, 707232: 7, 1821344: 7, 2788112: 7, 2790080: 8, 1297056: 8, 2788128: 8, 2790592: 9, 772768: 9, 2788640: 9, 2788144: 9, 2791104: 10, 789152: 10, 2789152: 10, 2788160: 10, 2791088: 11, 2791120: 11, 805536: 11, 2789664: 11, 2788176: 11, 2791072: 12, 2791136: 12, 821920: 12, 2789648: 12, 2443936: 12, 2788688: 12, 2788192: 12, 2791152: 13, 838304: 13, 2789632: 13, 1919648: 13, 2789200: 13, 2788208: 13, 2790640: 14, 2791168: 14, 854688: 14, 2789616: 14, 1395360: 14, 2789712: 14, 2788224: 14, 2790128: 15, 2791184: 15, 871072: 15, 2790224: 15, 2789728: 15, 2788240: 15, 2791200: 16, 887456: 16, 2790736: 16, 2789744: 16, 2788256: 16, 2791712: 17, 903840: 17, 2791248: 17, 2789760: 17, 2525856: 17, 2788768: 17, 2792224: 18, 920224: 18, 2791760: 18, 2789776: 18, 2001568: 18, 2789280: 18, 2792736: 19, 936608: 19, 2792272: 19, 2789792: 19, 1477280: 19, 2794144: 20, 2793248: 20, 2792752: 20, 952992: 20, 2792784: 20, 2794160: 21, 2793760: 21, 2792768: 21, 2793296: 21, 2794176: 22, 2794272: 22, 2793808: 22, 2795680: 23, 2794192: 23, 2794256: 23, 2794784: 23, 2794320: 23, 2795696: 24, 2794208: 24, 2794240: 24, 2795296: 24, 2794832: 24, 2795712: 25, 2794224: 25, 2795808: 25, 2795344: 25, 2797216: 26, 2796224: 26, 2795792: 26, 2795824: 26, 2795856: 26, 2797232: 27, 2796736: 27, 2795776: 27, 2795840: 27, 2796368: 27, 2795872: 27, 2797248: 28, 2795760: 28, 2796880: 28, 2795888: 28, 2798752: 29, 2797264: 29, 2796272: 29, 2797392: 29, 2795904: 29, 2798768: 30, 2797280: 30, 2796784: 30, 2797376: 30, 2797904: 30, 2795920: 30, 2798784: 31, 2797296: 31, 2797360: 31, 2798416: 31, 2795936: 31, 2799296: 32, 2797312: 32, 2797344: 32, 2798928: 32, 2796448: 32, 2799808: 33, 2797328: 33, 2797856: 33, 2798944: 33, 2796960: 33, 2800320: 34, 2798368: 34, 2798960: 34, 2797472: 34, 2800304: 35, 2800336: 35, 2798880: 35, 2798976: 35, 2797456: 35, 2800288: 36, 2800352: 36, 2798864: 36, 2798464: 36, 2798992: 36, 2797440: 36, 2800368: 37, 2798848: 37, 2797952: 37, 2799008: 37, 2799856: 38, 2800384: 38, 2798832: 38, 2799520: 38, 2799344: 39, 2800400: 39, 2800032: 39, 2800416: 40, 2800544: 40, 2800432: 41, 2800528: 41, 2800448: 42, 2800512: 42, 2800464: 43, 2800496: 43, 2800480: 44, 4362400: 0, 4362416: 1, 4362432: 2, 4362944: 3, 4363456: 4, 4363968: 5, 2805920: 6, 4363952: 6, 4363984: 6, 2822304: 7, 4363936: 7, 4364000: 7, 2298016: 8, 2838688: 8, 4364016: 8, 1773728: 9, 2855072: 9, 4363504: 9, 4364032: 9, 1249440: 10, 2871456: 10, 4362992: 10, 4364048: 10, 725152: 11, 2347168: 11, 2887840: 11, 4362480: 11, 4364064: 11, 708768: 12, 1822880: 12, 2904224: 12, 4362496: 12, 4364576: 12, 1298592: 13, 2920608: 13, 4362512: 13, 4365088: 13, 774304: 14, 3444896: 14, 2936992: 14, 4362528: 14, 4365600: 14, 790688: 15, 3969184: 15, 2953376: 15, 4367008: 15, 4366112: 15, 4365616: 15, 807072: 16, 2969760: 16, 4367024: 16, 4366624: 16, 4365632: 16, 823456: 17, 2445472: 17, 3494048: 17, 2986144: 17, 4367040: 17, 4367136: 17, 4365648: 17, 839840: 18, 1921184: 18, 4018336: 18, 3002528: 18, 4368544: 18, 4367056: 18, 4367120: 18, 4367648: 18, 4365136: 18, 4366160: 18, 856224: 19, 1396896: 19, 4362576: 19, 3018912: 19, 4368560: 19, 4367072: 19, 4367104: 19, 4368160: 19, 4364624: 19, 4366672: 19, 872608: 20, 4363088: 20, 4362592: 20, 3035296: 20, 4368576: 20, 4367088: 20, 4368672: 20, 4364112: 20, 4367184: 20, 888992: 21, 4363600: 21, 4362608: 21, 3051680: 21, 4369088: 21, 4368656: 21, 4368688: 21, 4367696: 21, 905376: 22, 4362624: 22, 2527392: 22, 3575968: 22, 4369600: 22, 4368640: 22, 4368704: 22, 4368208: 22, 921760: 23, 4362640: 23, 2003104: 23, 4100256: 23, 4370112: 23, 4368624: 23, 4368720: 23, 938144: 24, 4362656: 24, 1478816: 24, 4370096: 24, 4370128: 24, 4369136: 24, 4369232: 24, 4368736: 24, 954528: 25, 4370080: 25, 4370144: 25, 4369648: 25, 4369744: 25, 4368752: 25, 4370160: 26, 4370256: 26, 4368768: 26, 4370176: 27, 4370240: 27, 4370768: 27, 4368784: 27, 4370192: 28, 4370224: 28, 4371280: 28, 4368800: 28, 4370208: 29, 4371792: 29, 4369312: 29, 4371616: 30, 4370720: 30, 4371808: 30, 4369824: 30, 4371632: 31, 4371232: 31, 4371824: 31, 4370336: 31, 4371648: 32, 4371744: 32, 4371840: 32, 4370320: 32, 4372160: 33, 4371728: 33, 4371328: 33, 4371856: 33, 4370304: 33, 4372672: 34, 4371712: 34, 4370816: 34, 4371872: 34, 4373184: 35, 4371696: 35, 4372384: 35, 4373168: 36, 4373200: 36, 4372208: 36, 4372896: 36, 4373152: 37, 4373216: 37, 4372720: 37, 4373408: 37, 4373232: 38, 4373392: 38, 4373248: 39, 4373376: 39, 4373264: 40, 4373360: 40, 4373280: 41, 4373344: 41, 4373296: 42, 4373328: 42, 4373312: 43, 5936800: 0, 5936816: 1, 5936832: 2, 5445280: 3, 5936848: 3, 4920992: 4, 5936864: 4, 4396704: 5, 5936880: 5, 4380320: 6, 5494432: 6, 5936896: 6, 4970144: 7, 5936912: 7, 5939872: 8, 4445856: 8, 5936928: 8, 5939888: 9, 4462240: 9, 5937440: 9, 5939904: 10, 4478624: 10, 5937952: 10, 5941408: 11, 5939920: 11, 4495008: 11, 5938464: 11, 5941424: 12, 5939936: 12, 3970720: 12, 5938976: 12, 5938480: 12, 5941440: 13, 5939952: 13, 2807456: 13, 3446432: 13, 5939488: 13, 5938496: 13, 5941952: 14, 5939968: 14, 2823840: 14, 2922144: 14, 5940000: 14, 5938512: 14, 5942464: 15, 5939984: 15, 2299552: 15, 2840224: 15, 2905760: 15, 2938528: 15, 5940512: 15, 5938000: 15, 5939024: 15, 5942976: 16, 1775264: 16, 2856608: 16, 2889376: 16, 2954912: 16, 5941024: 16, 5937488: 16, 5939536: 16, 5942960: 17, 5942992: 17, 1250976: 17, 2872992: 17, 2971296: 17, 5941536: 17, 5936976: 17, 5940048: 17, 5942944: 18, 5943008: 18, 726688: 18, 2348704: 18, 2447008: 18, 3495584: 18, 2987680: 18, 5941520: 18, 5941552: 18, 5592736: 18, 5940560: 18, 5943024: 19, 710304: 19, 1824416: 19, 1922720: 19, 4019872: 19, 3004064: 19, 5941504: 19, 5941568: 19, 5068448: 19, 5941072: 19, 5942512: 20, 5943040: 20, 1300128: 20, 1398432: 20, 4544160: 20, 3020448: 20, 5941488: 20, 5941584: 20, 5942000: 21, 5943056: 21, 775840: 21, 874144: 21, 4560544: 21, 3036832: 21, 5942096: 21, 5941600: 21, 5943072: 22, 792224: 22, 857760: 22, 890528: 22, 4576928: 22, 3053216: 22, 5942608: 22, 5941616: 22, 5944480: 23, 5943584: 23, 5943088: 23, 808608: 23, 841376: 23, 906912: 23, 4593312: 23, 2528928: 23, 3577504: 23, 5943120: 23, 5941632: 23, 5944496: 24, 5944096: 24, 5943104: 24, 824992: 24, 923296: 24, 4609696: 24, 2004640: 24, 4101792: 24, 5943632: 24, 5941648: 24, 5944512: 25, 5944608: 25, 939680: 25, 4626080: 25, 1480352: 25, 5944144: 25, 5941664: 25, 5945024: 26, 5944592: 26, 956064: 26, 5944656: 26, 5942176: 26, 5945536: 27, 5944576: 27, 5944672: 27, 5942688: 27, 5946048: 28, 5944560: 28, 5944688: 28, 5943200: 28, 5946032: 29, 5946064: 29, 5945072: 29, 5944704: 29, 5943184: 29, 5946016: 30, 5946080: 30, 5945584: 30, 5944192: 30, 5944720: 30, 5943168: 30, 5946096: 31, 5943680: 31, 5944736: 31, 5946112: 32, 5945248: 32, 5946128: 33, 5945760: 33, 5946144: 34, 5946272: 34, 5946160: 35, 5946256: 35, 5946176: 36, 5946240: 36, 5946192: 37, 5946224: 37, 5946208: 38, 9085600: 0, 9085616: 1, 9085632: 2, 9085648: 3, 9085664: 4, 9087136: 5, 9085680: 5, 9087152: 6, 9085696: 6, 9087168: 7, 9085712: 7, 9087680: 8, 9085728: 8, 5956256: 9, 9088192: 9, 8692384: 9, 9086240: 9, 5972640: 10, 9088704: 10, 8168096: 10, 9086752: 10, 5448352: 11, 5989024: 11, 9088688: 11, 9088720: 11, 7643808: 11, 9087264: 11, 4924064: 12, 6005408: 12, 9088672: 12, 9088736: 12, 7119520: 12, 7660192: 12, 9087248: 12, 9087280: 12, 4399776: 13, 6021792: 13, 9088752: 13, 6595232: 13, 7676576: 13, 9087232: 13, 9087296: 13, 4383392: 14, 5497504: 14, 6038176: 14, 9088240: 14, 9088768: 14, 6070944: 14, 7692960: 14, 9087216: 14, 9087312: 14, 4973216: 15, 6054560: 15, 9087728: 15, 9088784: 15, 7168672: 15, 8217248: 15, 9086800: 15, 9087824: 15, 9087328: 15, 4448928: 16, 9088800: 16, 6644384: 16, 8741536: 16, 9086288: 16, 9088336: 16, 9087344: 16, 4465312: 17, 9090208: 17, 9089312: 17, 9088816: 17, 6120096: 17, 9085776: 17, 9088848: 17, 9087360: 17, 4481696: 18, 9090224: 18, 9089824: 18, 9088832: 18, 5595808: 18, 9089360: 18, 9087376: 18, 4498080: 19, 9090240: 19, 9090336: 19, 5071520: 19, 9089872: 19, 9087392: 19, 3973792: 20, 9090752: 20, 9090320: 20, 4547232: 20, 9090384: 20, 9087904: 20, 2810528: 21, 3449504: 21, 9091264: 21, 9090304: 21, 4022944: 21, 4563616: 21, 9090400: 21, 9088416: 21, 2826912: 22, 2925216: 22, 9091776: 22, 9090288: 22, 3498656: 22, 4580000: 22, 9090416: 22, 9088928: 22, 2302624: 23, 2843296: 23, 2908832: 23, 2941600: 23, 9091760: 23, 9091792: 23, 9090800: 23, 2974368: 23, 4596384: 23, 9090432: 23, 9088912: 23, 1778336: 24, 2859680: 24, 2892448: 24, 2957984: 24, 9091744: 24, 9091808: 24, 9091312: 24, 2450080: 24, 2990752: 24, 4612768: 24, 9089920: 24, 9090448: 24, 9088896: 24, 1254048: 25, 2876064: 25, 713376: 25, 9091824: 25, 1925792: 25, 3007136: 25, 4629152: 25, 9089408: 25, 9090464: 25, 729760: 26, 2351776: 26, 9091840: 26, 1401504: 26, 3023520: 26, 4104864: 26, 9090976: 26, 1827488: 27, 9091856: 27, 877216: 27, 3039904: 27, 3580576: 27, 9091488: 27, 1303200: 28, 9091872: 28, 860832: 28, 893600: 28, 3056288: 28, 9092000: 28, 778912: 29, 9091888: 29, 844448: 29, 909984: 29, 2532000: 29, 9091984: 29, 795296: 30, 9091904: 30, 828064: 30, 926368: 30, 2007712: 30, 9091968: 30, 811680: 31, 9091920: 31, 942752: 31, 1483424: 31, 9091952: 31, 9091936: 32, 959136: 32, 10660000: 0, 10660016: 1, 10660032: 2, 10660544: 3, 10661056: 4, 10661568: 5, 9103520: 6, 10661552: 6, 10661584: 6, 9119904: 7, 10661536: 7, 10661600: 7, 9136288: 8, 10661616: 8, 9152672: 9, 10661104: 9, 10661632: 9, 9169056: 10, 10660592: 10, 10661648: 10, 9185440: 11, 10660080: 11, 10661664: 11, 5957792: 12, 9201824: 12, 10663072: 12, 10660096: 12, 10662176: 12, 10661680: 12, 5974176: 13, 9218208: 13, 10663088: 13, 10660112: 13, 10662688: 13, 10661696: 13, 5449888: 14, 5990560: 14, 8693920: 14, 9742496: 14, 10663104: 14, 10660128: 14, 10663200: 14, 10661712: 14, 4925600: 15, 6006944: 15, 8169632: 15, 10266784: 15, 10663616: 15, 10660144: 15, 10663184: 15, 10661200: 15, 10662224: 15, 4401312: 16, 6023328: 16, 7645344: 16, 10664128: 16, 10660160: 16, 10663168: 16, 10660688: 16, 10662736: 16, 4384928: 17, 5499040: 17, 6039712: 17, 7121056: 17, 7661728: 17, 10664640: 17, 10660176: 17, 10663152: 17, 10663248: 17, 4974752: 18, 6056096: 18, 6596768: 18, 7678112: 18, 10664624: 18, 10664656: 18, 10315936: 18, 10660192: 18, 10663664: 18, 10663264: 18, 4450464: 19, 6072480: 19, 7694496: 19, 10664608: 19, 10664672: 19, 9791648: 19, 10660208: 19, 10664176: 19, 10663280: 19, 4466848: 20, 7170208: 20, 8218784: 20, 10664688: 20, 9267360: 20, 10660224: 20, 10663296: 20, 4483232: 21, 6645920: 21, 8743072: 21, 10664704: 21, 10660240: 21, 10662784: 21, 10663312: 21, 4499616: 22, 6121632: 22, 10664720: 22, 10660256: 22, 10662272: 22, 10663328: 22, 3975328: 23, 5597344: 23, 10664736: 23, 10660768: 23, 10661760: 23, 10663840: 23, 2812064: 24, 3451040: 24, 5073056: 24, 10664752: 24, 10661280: 24, 10661776: 24, 10664352: 24, 2828448: 25, 2926752: 25, 4548768: 25, 10664768: 25, 10661792: 25, 10664864: 25, 2304160: 26, 2844832: 26, 2910368: 26, 2943136: 26, 4024480: 26, 4565152: 26, 10664784: 26, 10664848: 26, 1779872: 27, 2861216: 27, 2893984: 27, 2959520: 27, 3500192: 27, 4581536: 27, 10664800: 27, 10664832: 27, 1255584: 28, 2877600: 28, 2975904: 28, 714912: 28, 4597920: 28, 10664816: 28, 731296: 29, 2353312: 29, 2451616: 29, 2992288: 29, 4614304: 29, 1829024: 30, 1927328: 30, 3008672: 30, 4630688: 30, 1304736: 31, 1403040: 31, 3025056: 31, 4106400: 31, 780448: 32, 878752: 32, 3041440: 32, 3582112: 32, 796832: 33, 862368: 33, 895136: 33, 3057824: 33, 813216: 34, 845984: 34, 911520: 34, 2533536: 34, 829600: 35, 927904: 35, 2009248: 35, 944288: 36, 1484960: 36, 960672: 37, 12234400: 0, 12234416: 1, 12234432: 2, 11742880: 3, 12234448: 3, 11218592: 4, 12234464: 4, 12235936: 5, 10694304: 5, 12234480: 5, 12235952: 6, 10677920: 6, 11792032: 6, 12234496: 6, 12235968: 7, 11267744: 7, 12234512: 7, 12236480: 8, 10743456: 8, 12234528: 8, 12236992: 9, 10759840: 9, 12235040: 9, 12234544: 9, 12237504: 10, 10776224: 10, 12235552: 10, 12234560: 10, 12237488: 11, 12237520: 11, 10792608: 11, 12236064: 11, 12234576: 11, 12237472: 12, 12237536: 12, 10268320: 12, 10808992: 12, 12236048: 12, 11890336: 12, 12235088: 12, 12237552: 13, 9105056: 13, 9744032: 13, 10825376: 13, 12236032: 13, 11366048: 13, 12235600: 13, 12237040: 14, 12237568: 14, 9121440: 14, 9219744: 14, 10841760: 14, 12236016: 14, 12236112: 14, 12236528: 15, 12237584: 15, 9137824: 15, 8695456: 15, 9203360: 15, 10317472: 15, 10858144: 15, 12236128: 15, 12237600: 16, 9154208: 16, 8171168: 16, 9186976: 16, 9793184: 16, 10874528: 16, 12236144: 16, 12237616: 17, 9170592: 17, 7646880: 17, 9268896: 17, 10890912: 17, 12236160: 17, 12237632: 18, 7122592: 18, 7663264: 18, 8744608: 18, 10907296: 18, 12235648: 18, 12236176: 18, 12237648: 19, 5959328: 19, 6598304: 19, 7679648: 19, 8220320: 19, 10923680: 19, 12235136: 19, 12236192: 19, 12237664: 20, 5975712: 20, 6074016: 20, 7696032: 20, 11447968: 20, 12234624: 20, 12236704: 20, 12237680: 21, 5451424: 21, 5992096: 21, 6057632: 21, 7171744: 21, 11972256: 21, 12234640: 21, 12237216: 21, 12237696: 22, 4927136: 22, 6008480: 22, 6041248: 22, 6647456: 22, 12234656: 22, 12237728: 22, 12237712: 23, 4402848: 23, 6024864: 23, 6123168: 23, 4386464: 24, 5500576: 24, 5598880: 24, 4976288: 25, 5074592: 25, 4452000: 26, 4550304: 26, 2813600: 27, 4468384: 27, 4026016: 27, 4566688: 27, 2829984: 28, 4484768: 28, 3501728: 28, 4583072: 28, 2305696: 29, 2846368: 29, 4501152: 29, 2977440: 29, 4599456: 29, 1781408: 30, 2862752: 30, 3976864: 30, 2453152: 30, 2961056: 30, 2993824: 30, 4615840: 30, 716448: 31, 1257120: 31, 2879136: 31, 3452576: 31, 1928864: 31, 2944672: 31, 3010208: 31, 4632224: 31, 732832: 32, 2354848: 32, 2895520: 32, 2928288: 32, 1404576: 32, 3026592: 32, 4107936: 32, 1830560: 33, 2911904: 33, 880288: 33, 3042976: 33, 3583648: 33, 1306272: 34, 863904: 34, 896672: 34, 3059360: 34, 781984: 35, 847520: 35, 913056: 35, 2535072: 35, 798368: 36, 831136: 36, 929440: 36, 2010784: 36, 814752: 37, 945824: 37, 1486496: 37, 962208: 38, 13808800: 0, 13808816: 1, 13808832: 2, 13809344: 3, 13809856: 4, 13810368: 5, 12252320: 6, 13810352: 6, 13810384: 6, 12268704: 7, 13810336: 7, 13810400: 7, 11744416: 8, 12285088: 8, 13810416: 8, 11220128: 9, 12301472: 9, 13809904: 9, 13810432: 9, 10695840: 10, 12317856: 10, 13809392: 10, 13810448: 10, 10679456: 11, 11793568: 11, 12334240: 11, 13808880: 11, 13810464: 11, 11269280: 12, 12350624: 12, 13808896: 12, 13810480: 12, 10744992: 13, 12367008: 13, 13808912: 13, 13810496: 13, 10761376: 14, 12891296: 14, 12383392: 14, 13808928: 14, 13810512: 14, 10777760: 15, 13415584: 15, 12399776: 15, 13810528: 15, 10794144: 16, 12416160: 16, 13810544: 16, 10269856: 17, 10810528: 17, 11891872: 17, 12940448: 17, 13810560: 17, 9106592: 18, 9745568: 18, 10826912: 18, 11367584: 18, 13464736: 18, 13810576: 18, 9122976: 19, 9221280: 19, 10843296: 19, 13808976: 19, 13810592: 19, 9139360: 20, 8696992: 20, 9204896: 20, 10319008: 20, 10859680: 20, 13808992: 20, 13810080: 20, 9155744: 21, 8172704: 21, 9188512: 21, 9794720: 21, 10876064: 21, 13809008: 21, 13809568: 21, 9172128: 22, 7648416: 22, 9270432: 22, 10892448: 22, 13809024: 22, 13809056: 22, 7124128: 23, 7664800: 23, 8746144: 23, 10908832: 23, 13513888: 23, 13809040: 23, 5960864: 24, 6599840: 24, 7681184: 24, 8221856: 24, 10925216: 24, 12989600: 24, 5977248: 25, 6075552: 25, 7697568: 25, 11449504: 25, 12465312: 25, 5452960: 26, 5993632: 26, 6059168: 26, 7173280: 26, 11973792: 26, 12481696: 26, 4928672: 27, 6010016: 27, 6042784: 27, 6648992: 27, 12498080: 27, 4404384: 28, 6026400: 28, 6124704: 28, 4388000: 29, 5502112: 29, 5600416: 29, 2815136: 30, 4977824: 30, 5076128: 30, 2831520: 31, 4453536: 31, 4551840: 31, 2307232: 32, 2847904: 32, 4469920: 32, 4027552: 32, 4568224: 32, 1782944: 33, 2864288: 33, 4486304: 33, 3503264: 33, 4584608: 33, 717984: 34, 1258656: 34, 2880672: 34, 4502688: 34, 2978976: 34, 4600992: 34, 734368: 35, 2356384: 35, 2897056: 35, 3978400: 35, 2454688: 35, 2962592: 35, 2995360: 35, 4617376: 35, 1832096: 36, 2913440: 36, 3454112: 36, 1930400: 36, 2946208: 36, 3011744: 36, 4633760: 36, 1307808: 37, 2929824: 37, 1406112: 37, 3028128: 37, 4109472: 37, 783520: 38, 881824: 38, 3044512: 38, 3585184: 38, 799904: 39, 865440: 39, 898208: 39, 3060896: 39, 816288: 40, 849056: 40, 914592: 40, 2536608: 40, 832672: 41, 930976: 41, 2012320: 41, 947360: 42, 1488032: 42, 963744: 43, 15383200: 0, 15383216: 1, 15383232: 2, 14891680: 3, 15383248: 3, 14367392: 4, 15383264: 4, 13843104: 5, 15383280: 5, 13826720: 6, 14940832: 6, 15383296: 6, 14416544: 7, 15383312: 7, 13892256: 8, 15383328: 8, 13908640: 9, 15383344: 9, 13925024: 10, 15383360: 10, 13941408: 11, 15383376: 11, 13417120: 12, 15383392: 12, 12253856: 13, 12892832: 13, 15383408: 13, 12270240: 14, 12368544: 14, 15383424: 14, 11745952: 15, 12286624: 15, 12352160: 15, 12384928: 15, 15383440: 15, 11221664: 16, 12303008: 16, 12335776: 16, 12401312: 16, 15383456: 16, 10697376: 17, 12319392: 17, 12417696: 17, 15121056: 17, 10680992: 18, 11795104: 18, 11893408: 18, 12941984: 18, 14596768: 18, 11270816: 19, 11369120: 19, 13466272: 19, 14072480: 19, 10746528: 20, 10844832: 20, 13990560: 20, 14056096: 20, 10762912: 21, 10320544: 21, 10828448: 21, 10861216: 21, 14006944: 21, 14039712: 21, 10779296: 22, 9796256: 22, 10812064: 22, 10877600: 22, 14023328: 22, 13515424: 22, 10795680: 23, 9271968: 23, 10893984: 23, 12991136: 23, 10271392: 24, 8747680: 24, 10910368: 24, 12466848: 24, 9108128: 25, 9747104: 25, 8223392: 25, 10926752: 25, 12483232: 25, 9124512: 26, 9222816: 26, 7699104: 26, 11451040: 26, 12499616: 26, 9140896: 27, 8698528: 27, 9206432: 27, 7174816: 27, 7682720: 27, 11975328: 27, 9157280: 28, 8174240: 28, 9190048: 28, 6650528: 28, 7666336: 28, 9173664: 29, 7649952: 29, 6126240: 29, 7125664: 30, 5601952: 30, 5962400: 31, 6601376: 31, 5077664: 31, 5978784: 32, 6077088: 32, 4553376: 32, 5454496: 33, 5995168: 33, 6060704: 33, 4029088: 33, 4569760: 33, 4930208: 34, 6011552: 34, 6044320: 34, 3504800: 34, 4586144: 34, 4405920: 35, 6027936: 35, 2980512: 35, 4602528: 35, 4389536: 36, 5503648: 36, 2456224: 36, 2964128: 36, 2996896: 36, 4618912: 36, 2816672: 37, 4979360: 37, 1931936: 37, 2947744: 37, 3013280: 37, 4635296: 37, 2833056: 38, 4455072: 38, 1407648: 38, 2931360: 38, 3029664: 38, 4111008: 38, 2308768: 39, 2849440: 39, 4471456: 39, 883360: 39, 2914976: 39, 3455648: 39, 3046048: 39, 3586720: 39, 1784480: 40, 2865824: 40, 4487840: 40, 866976: 40, 899744: 40, 2898592: 40, 3979936: 40, 3062432: 40, 719520: 41, 1260192: 41, 2882208: 41, 4504224: 41, 850592: 41, 916128: 41, 2538144: 41, 735904: 42, 2357920: 42, 834208: 42, 932512: 42, 2013856: 42, 1833632: 43, 817824: 43, 948896: 43, 1489568: 43, 1309344: 44, 801440: 44, 965280: 44, 785056: 45, 705200: 0, 705216: 1, 705728: 2, 706240: 3, 706752: 4, 707264: 5, 707248: 6, 707280: 6, 707296: 7, 707312: 8, 706800: 9, 707328: 9, 706288: 10, 707344: 10, 705776: 11, 707360: 11, 705264: 12, 707872: 12, 707376: 12, 708784: 13, 705280: 13, 708384: 13, 707392: 13, 708800: 14, 705296: 14, 708896: 14, 707408: 14, 709312: 15, 705312: 15, 708880: 15, 706896: 15, 707920: 15, 707424: 15, 709824: 16, 705328: 16, 708864: 16, 706384: 16, 708432: 16, 707440: 16, 710336: 17, 705344: 17, 708848: 17, 705872: 17, 708944: 17, 707456: 17, 710320: 18, 710352: 18, 705360: 18, 709360: 18, 709456: 18, 708960: 18, 707472: 18, 710368: 19, 705376: 19, 709872: 19, 709968: 19, 708976: 19, 707488: 19, 710384: 20, 705392: 20, 710480: 20, 708992: 20, 706976: 20, 708000: 20, 710400: 21, 705408: 21, 710992: 21, 709008: 21, 706464: 21, 708512: 21, 710416: 22, 705424: 22, 711504: 22, 709024: 22, 705952: 22, 710432: 23, 705440: 23, 712016: 23, 710944: 24, 712000: 24, 712528: 24, 711456: 25, 711984: 25, 713040: 25, 713392: 26, 711968: 26, 713552: 26, 713408: 27, 712480: 27, 714064: 27, 713424: 28, 712992: 28, 714576: 28, 714928: 29, 713440: 29, 713504: 29, 715088: 29, 714944: 30, 713456: 30, 713488: 30, 714016: 30, 715072: 30, 715600: 30, 715104: 30, 715456: 31, 713472: 31, 714528: 31, 715056: 31, 716112: 31, 715120: 31, 716464: 32, 715968: 32, 715040: 32, 716624: 32, 715136: 32, 716480: 33, 715024: 33, 716608: 33, 717136: 33, 715152: 33, 716496: 34, 715008: 34, 716592: 34, 717648: 34, 715168: 34, 718000: 35, 716512: 35, 714992: 35, 716576: 35, 718160: 35, 715680: 35, 718016: 36, 716528: 36, 715504: 36, 716560: 36, 717088: 36, 718176: 36, 716192: 36, 718528: 37, 716016: 37, 716544: 37, 717600: 37, 718192: 37, 716704: 37, 719040: 38, 718112: 38, 718208: 38, 716688: 38, 719552: 39, 718096: 39, 717696: 39, 718224: 39, 716672: 39, 719536: 40, 719568: 40, 718080: 40, 717184: 40, 718240: 40, 719584: 41, 718064: 41, 718752: 41, 719600: 42, 718576: 42, 719264: 42, 719088: 43, 719616: 43, 719776: 43, 719632: 44, 719760: 44, 719648: 45, 719744: 45, 719664: 46, 719728: 46, 719680: 47, 719712: 47, 719696: 48, 2804400: 0, 2804416: 1, 2296496: 2, 2804432: 2, 1772208: 3, 2804448: 3, 1247920: 4, 2804464: 4, 723632: 5, 2345648: 5, 2804480: 5, 1821360: 6, 2804496: 6, 2805936: 7, 1297072: 7, 2804512: 7, 2805952: 8, 772784: 8, 2805024: 8, 2804528: 8, 2806464: 9, 789168: 9, 2805536: 9, 2804544: 9, 2806976: 10, 805552: 10, 2806048: 10, 2804560: 10, 2807488: 11, 821936: 11, 2806032: 11, 2443952: 11, 2805072: 11, 2804576: 11, 2807472: 12, 2807504: 12, 838320: 12, 2806016: 12, 1919664: 12, 2805584: 12, 2804592: 12, 2807520: 13, 854704: 13, 2806000: 13, 1395376: 13, 2806096: 13, 2804608: 13, 2807536: 14, 871088: 14, 2806512: 14, 2806608: 14, 2806112: 14, 2804624: 14, 2807024: 15, 2807552: 15, 887472: 15, 2807120: 15, 2806128: 15, 2804640: 15, 2807568: 16, 903856: 16, 2807632: 16, 2806144: 16, 2525872: 16, 2805152: 16, 2807584: 17, 920240: 17, 2808144: 17, 2806160: 17, 2001584: 17, 2805664: 17, 2808096: 18, 936624: 18, 2808656: 18, 2806176: 18, 1477296: 18, 2808608: 19, 953008: 19, 2809168: 19, 2809120: 20, 2809152: 20, 2809680: 20, 2809632: 21, 2809136: 21, 2810192: 21, 2810544: 22, 2810144: 22, 2810704: 22, 2810560: 23, 2810656: 23, 2811216: 23, 2810576: 24, 2810640: 24, 2811168: 24, 2811728: 24, 2812080: 25, 2810592: 25, 2810624: 25, 2811680: 25, 2812240: 25, 2812096: 26, 2810608: 26, 2812192: 26, 2812224: 26, 2812752: 26, 2812256: 26, 2812608: 27, 2812176: 27, 2812208: 27, 2813264: 27, 2812272: 27, 2813616: 28, 2813120: 28, 2812160: 28, 2813776: 28, 2812288: 28, 2813632: 29, 2812144: 29, 2813760: 29, 2814288: 29, 2812304: 29, 2813648: 30, 2812656: 30, 2813744: 30, 2814800: 30, 2812320: 30, 2815152: 31, 2813664: 31, 2813168: 31, 2813728: 31, 2815312: 31, 2812832: 31, 2815168: 32, 2813680: 32, 2813712: 32, 2814240: 32, 2815328: 32, 2813344: 32, 2815680: 33, 2813696: 33, 2814752: 33, 2815344: 33, 2813856: 33, 2816192: 34, 2815264: 34, 2815360: 34, 2813840: 34, 2816704: 35, 2815248: 35, 2814848: 35, 2815376: 35, 2813824: 35, 2816688: 36, 2816720: 36, 2815232: 36, 2814336: 36, 2815392: 36, 2816736: 37, 2815216: 37, 2815904: 37, 2816752: 38, 2815728: 38, 2816416: 38, 2816240: 39, 2816768: 39, 2816928: 39, 2816784: 40, 2816912: 40, 2816800: 41, 2816896: 41, 2816816: 42, 2816880: 42, 2816832: 43, 2816864: 43, 2816848: 44, 4378800: 0, 4378816: 1, 4379328: 2, 4379840: 3, 4380352: 4, 4380336: 5, 4380368: 5, 4380384: 6, 4380400: 7, 2822320: 8, 4379888: 8, 4380416: 8, 2298032: 9, 2838704: 9, 4379376: 9, 4380432: 9, 1773744: 10, 2855088: 10, 4378864: 10, 4380448: 10, 1249456: 11, 2871472: 11, 4378880: 11, 4380960: 11, 725168: 12, 2347184: 12, 2887856: 12, 4378896: 12, 4381472: 12, 1822896: 13, 2904240: 13, 4378912: 13, 4381984: 13, 1298608: 14, 2920624: 14, 3969200: 14, 4382496: 14, 4382000: 14, 774320: 15, 3444912: 15, 2937008: 15, 4383408: 15, 4383008: 15, 4382016: 15, 790704: 16, 2953392: 16, 4383424: 16, 4383520: 16, 4382032: 16, 807088: 17, 2969776: 17, 4383440: 17, 4383504: 17, 4384032: 17, 4381520: 17, 4382544: 17, 823472: 18, 2445488: 18, 3494064: 18, 2986160: 18, 4384944: 18, 4383456: 18, 4383488: 18, 4384544: 18, 4381008: 18, 4383056: 18, 839856: 19, 1921200: 19, 4018352: 19, 3002544: 19, 4384960: 19, 4383472: 19, 4385056: 19, 4380496: 19, 4383568: 19, 856240: 20, 1396912: 20, 4378960: 20, 3018928: 20, 4385472: 20, 4385040: 20, 4385072: 20, 4379984: 20, 4384080: 20, 872624: 21, 4379472: 21, 4378976: 21, 3035312: 21, 4385984: 21, 4385024: 21, 4385088: 21, 4384592: 21, 889008: 22, 4378992: 22, 3051696: 22, 4386496: 22, 4385008: 22, 4385104: 22, 905392: 23, 4379008: 23, 2527408: 23, 3575984: 23, 4386480: 23, 4386512: 23, 4385520: 23, 4385616: 23, 4385120: 23, 921776: 24, 4379024: 24, 2003120: 24, 4100272: 24, 4386528: 24, 4386032: 24, 4386128: 24, 4385136: 24, 938160: 25, 4379040: 25, 1478832: 25, 4386544: 25, 4386640: 25, 4385152: 25, 954544: 26, 4386560: 26, 4386624: 26, 4387152: 26, 4385168: 26, 4386576: 27, 4386608: 27, 4387664: 27, 4385184: 27, 4386592: 28, 4388176: 28, 4385696: 28, 4387104: 29, 4388192: 29, 4386208: 29, 4388016: 30, 4387616: 30, 4388208: 30, 4386720: 30, 4388032: 31, 4388128: 31, 4388224: 31, 4386704: 31, 4388544: 32, 4388112: 32, 4387712: 32, 4388240: 32, 4386688: 32, 4389056: 33, 4388096: 33, 4387200: 33, 4388256: 33, 4389568: 34, 4388080: 34, 4388768: 34, 4389552: 35, 4389584: 35, 4388592: 35, 4389280: 35, 4389600: 36, 4389104: 36, 4389792: 36, 4389616: 37, 4389776: 37, 4389632: 38, 4389760: 38, 4389648: 39, 4389744: 39, 4389664: 40, 4389728: 40, 4389680: 41, 4389712: 41, 4389696: 42, 5953200: 0, 5953216: 1, 5445296: 2, 5953232: 2, 4921008: 3, 5953248: 3, 4396720: 4, 5953264: 4, 5494448: 5, 5953280: 5, 4970160: 6, 5953296: 6, 4445872: 7, 5953312: 7, 4462256: 8, 5953824: 8, 4478640: 9, 5954336: 9, 5956272: 10, 4495024: 10, 5954848: 10, 5956288: 11, 3970736: 11, 5955360: 11, 5954864: 11, 5956304: 12, 3446448: 12, 5955872: 12, 5954880: 12, 5957808: 13, 5956320: 13, 2823856: 13, 2922160: 13, 5956384: 13, 5954896: 13, 5957824: 14, 5956336: 14, 2299568: 14, 2840240: 14, 2905776: 14, 2938544: 14, 5956368: 14, 5956896: 14, 5954384: 14, 5955408: 14, 5958336: 15, 5956352: 15, 1775280: 15, 2856624: 15, 2889392: 15, 2954928: 15, 5957408: 15, 5953872: 15, 5955920: 15, 5958848: 16, 1250992: 16, 2873008: 16, 2971312: 16, 5957920: 16, 5953360: 16, 5956432: 16, 5959360: 17, 726704: 17, 2348720: 17, 2447024: 17, 3495600: 17, 2987696: 17, 5957904: 17, 5957936: 17, 5592752: 17, 5956944: 17, 5959344: 18, 5959376: 18, 1824432: 18, 1922736: 18, 4019888: 18, 3004080: 18, 5957888: 18, 5957952: 18, 5068464: 18, 5957456: 18, 5959392: 19, 1300144: 19, 1398448: 19, 4544176: 19, 3020464: 19, 5957872: 19, 5957968: 19, 5959408: 20, 775856: 20, 874160: 20, 4560560: 20, 3036848: 20, 5958384: 20, 5958480: 20, 5957984: 20, 5958896: 21, 5959424: 21, 792240: 21, 857776: 21, 890544: 21, 4576944: 21, 3053232: 21, 5958992: 21, 5958000: 21, 5959440: 22, 808624: 22, 841392: 22, 906928: 22, 4593328: 22, 2528944: 22, 3577520: 22, 5959504: 22, 5958016: 22, 5959456: 23, 825008: 23, 923312: 23, 4609712: 23, 2004656: 23, 4101808: 23, 5959488: 23, 5960016: 23, 5958032: 23, 5959968: 24, 5959472: 24, 939696: 24, 4626096: 24, 1480368: 24, 5960528: 24, 5958048: 24, 5960880: 25, 5960480: 25, 956080: 25, 5961040: 25, 5958560: 25, 5960896: 26, 5960992: 26, 5961056: 26, 5959072: 26, 5961408: 27, 5960976: 27, 5961072: 27, 5959584: 27, 5961920: 28, 5960960: 28, 5961088: 28, 5959568: 28, 5962432: 29, 5960944: 29, 5960576: 29, 5961104: 29, 5959552: 29, 5962416: 30, 5962448: 30, 5961456: 30, 5960064: 30, 5961120: 30, 5962464: 31, 5961968: 31, 5961632: 31, 5962480: 32, 5962144: 32, 5962496: 33, 5962656: 33, 5962512: 34, 5962640: 34, 5962528: 35, 5962624: 35, 5962544: 36, 5962608: 36, 5962560: 37, 5962592: 37, 5962576: 38, 9102000: 0, 9102016: 1, 9102032: 2, 9102048: 3, 9102064: 4, 9102080: 5, 9102096: 6, 9103536: 7, 9102112: 7, 9103552: 8, 8692400: 8, 9102624: 8, 9104064: 9, 8168112: 9, 9103136: 9, 9104576: 10, 7643824: 10, 9103648: 10, 5972656: 11, 9105088: 11, 7119536: 11, 7660208: 11, 9103632: 11, 9103664: 11, 5448368: 12, 5989040: 12, 9105072: 12, 9105104: 12, 6595248: 12, 7676592: 12, 9103616: 12, 9103680: 12, 4924080: 13, 6005424: 13, 9105120: 13, 6070960: 13, 7692976: 13, 9103600: 13, 9103696: 13, 4399792: 14, 6021808: 14, 9105136: 14, 6054576: 14, 7168688: 14, 8217264: 14, 9104112: 14, 9103184: 14, 9104208: 14, 9103712: 14, 5497520: 15, 6038192: 15, 9104624: 15, 9105152: 15, 6644400: 15, 8741552: 15, 9102672: 15, 9104720: 15, 9103728: 15, 4973232: 16, 9105168: 16, 6120112: 16, 9102160: 16, 9105232: 16, 9103744: 16, 4448944: 17, 9105184: 17, 5595824: 17, 9105216: 17, 9105744: 17, 9103760: 17, 4465328: 18, 9105696: 18, 9105200: 18, 5071536: 18, 9106256: 18, 9103776: 18, 4481712: 19, 9106608: 19, 9106208: 19, 4547248: 19, 9106768: 19, 9104288: 19, 4498096: 20, 9106624: 20, 9106720: 20, 4022960: 20, 4563632: 20, 9106784: 20, 9104800: 20, 3973808: 21, 9107136: 21, 9106704: 21, 3498672: 21, 4580016: 21, 9106800: 21, 9105312: 21, 3449520: 22, 9107648: 22, 9106688: 22, 2974384: 22, 4596400: 22, 9106816: 22, 9105296: 22, 2826928: 23, 2925232: 23, 9108160: 23, 9106672: 23, 2450096: 23, 2958000: 23, 2990768: 23, 4612784: 23, 9106304: 23, 9106832: 23, 9105280: 23, 2302640: 24, 2843312: 24, 2908848: 24, 2941616: 24, 9108144: 24, 9108176: 24, 9107184: 24, 1925808: 24, 3007152: 24, 4629168: 24, 9105792: 24, 9106848: 24, 1778352: 25, 2859696: 25, 2892464: 25, 9108192: 25, 9107696: 25, 1401520: 25, 3023536: 25, 4104880: 25, 9107360: 25, 1254064: 26, 2876080: 26, 9108208: 26, 877232: 26, 3039920: 26, 3580592: 26, 9107872: 26, 729776: 27, 2351792: 27, 9108224: 27, 860848: 27, 893616: 27, 3056304: 27, 9108384: 27, 1827504: 28, 9108240: 28, 844464: 28, 910000: 28, 2532016: 28, 9108368: 28, 1303216: 29, 9108256: 29, 828080: 29, 926384: 29, 2007728: 29, 9108352: 29, 778928: 30, 9108272: 30, 811696: 30, 942768: 30, 1483440: 30, 9108336: 30, 795312: 31, 9108288: 31, 959152: 31, 9108320: 31, 9108304: 32, 10676400: 0, 10676416: 1, 10676928: 2, 10677440: 3, 10677952: 4, 10677936: 5, 10677968: 5, 10677984: 6, 10678000: 7, 9119920: 8, 10677488: 8, 10678016: 8, 9136304: 9, 10676976: 9, 10678032: 9, 9152688: 10, 10676464: 10, 10678048: 10, 9169072: 11, 10676480: 11, 10678560: 11, 10678064: 11, 9185456: 12, 10679472: 12, 10676496: 12, 10679072: 12, 10678080: 12, 9201840: 13, 10679488: 13, 10676512: 13, 10679584: 13, 10678096: 13, 5974192: 14, 9218224: 14, 10680000: 14, 10266800: 14, 10676528: 14, 10679568: 14, 10677584: 14, 10678608: 14, 5449904: 15, 5990576: 15, 8693936: 15, 9742512: 15, 10680512: 15, 10676544: 15, 10679552: 15, 10677072: 15, 10679120: 15, 4925616: 16, 6006960: 16, 8169648: 16, 10681024: 16, 10676560: 16, 10679536: 16, 10679632: 16, 4401328: 17, 6023344: 17, 7645360: 17, 10681008: 17, 10681040: 17, 10315952: 17, 10676576: 17, 10680048: 17, 10679648: 17, 5499056: 18, 6039728: 18, 7121072: 18, 7661744: 18, 10681056: 18, 9791664: 18, 10676592: 18, 10680560: 18, 10679664: 18, 4974768: 19, 6056112: 19, 6596784: 19, 7678128: 19, 10681072: 19, 9267376: 19, 10676608: 19, 10679680: 19, 4450480: 20, 6072496: 20, 7694512: 20, 10681088: 20, 8743088: 20, 10676624: 20, 10679168: 20, 10679696: 20, 4466864: 21, 7170224: 21, 8218800: 21, 10681104: 21, 10676640: 21, 10678656: 21, 10679712: 21, 4483248: 22, 6645936: 22, 10681120: 22, 10677152: 22, 10678144: 22, 10680224: 22, 4499632: 23, 6121648: 23, 10681136: 23, 10677664: 23, 10678160: 23, 10680736: 23, 3975344: 24, 5597360: 24, 10681152: 24, 10678176: 24, 10681248: 24, 3451056: 25, 5073072: 25, 10681168: 25, 10681232: 25, 2828464: 26, 2926768: 26, 4548784: 26, 10681184: 26, 10681216: 26, 2304176: 27, 2844848: 27, 2910384: 27, 2943152: 27, 4024496: 27, 4565168: 27, 10681200: 27, 1779888: 28, 2861232: 28, 2894000: 28, 2959536: 28, 3500208: 28, 4581552: 28, 1255600: 29, 2877616: 29, 2975920: 29, 4597936: 29, 731312: 30, 2353328: 30, 2451632: 30, 2992304: 30, 4614320: 30, 1829040: 31, 1927344: 31, 3008688: 31, 4630704: 31, 1304752: 32, 1403056: 32, 3025072: 32, 4106416: 32, 780464: 33, 878768: 33, 3041456: 33, 3582128: 33, 796848: 34, 862384: 34, 895152: 34, 3057840: 34, 813232: 35, 846000: 35, 911536: 35, 2533552: 35, 829616: 36, 927920: 36, 2009264: 36, 944304: 37, 1484976: 37, 960688: 38, 12250800: 0, 12250816: 1, 11742896: 2, 12250832: 2, 11218608: 3, 12250848: 3, 10694320: 4, 12250864: 4, 11792048: 5, 12250880: 5, 11267760: 6, 12250896: 6, 12252336: 7, 10743472: 7, 12250912: 7, 12252352: 8, 10759856: 8, 12251424: 8, 12250928: 8, 12252864: 9, 10776240: 9, 12251936: 9, 12250944: 9, 12253376: 10, 10792624: 10, 12252448: 10, 12250960: 10, 12253888: 11, 10268336: 11, 10809008: 11, 12252432: 11, 11890352: 11, 12251472: 11, 12253872: 12, 12253904: 12, 9744048: 12, 10825392: 12, 12252416: 12, 11366064: 12, 12251984: 12, 12253920: 13, 9121456: 13, 9219760: 13, 10841776: 13, 12252400: 13, 12252496: 13, 12253936: 14, 9137840: 14, 8695472: 14, 9203376: 14, 10317488: 14, 10858160: 14, 12252912: 14, 12252512: 14, 12253424: 15, 12253952: 15, 9154224: 15, 8171184: 15, 9186992: 15, 9793200: 15, 10874544: 15, 12252528: 15, 12253968: 16, 9170608: 16, 7646896: 16, 9268912: 16, 10890928: 16, 12252544: 16, 12253984: 17, 7122608: 17, 7663280: 17, 8744624: 17, 10907312: 17, 12252032: 17, 12252560: 17, 12254000: 18, 6598320: 18, 7679664: 18, 8220336: 18, 10923696: 18, 12251520: 18, 12252576: 18, 12254016: 19, 5975728: 19, 6074032: 19, 7696048: 19, 11447984: 19, 12251008: 19, 12253088: 19, 12254032: 20, 5451440: 20, 5992112: 20, 6057648: 20, 7171760: 20, 11972272: 20, 12251024: 20, 12253600: 20, 12254048: 21, 4927152: 21, 6008496: 21, 6041264: 21, 6647472: 21, 12251040: 21, 12254112: 21, 12254064: 22, 4402864: 22, 6024880: 22, 6123184: 22, 12254096: 22, 12254080: 23, 5500592: 23, 5598896: 23, 4976304: 24, 5074608: 24, 4452016: 25, 4550320: 25, 4468400: 26, 4026032: 26, 4566704: 26, 4484784: 27, 3501744: 27, 4583088: 27, 4501168: 28, 2977456: 28, 4599472: 28, 2830000: 29, 3976880: 29, 2453168: 29, 2961072: 29, 2993840: 29, 4615856: 29, 2305712: 30, 2846384: 30, 3452592: 30, 1928880: 30, 2944688: 30, 3010224: 30, 4632240: 30, 1781424: 31, 2862768: 31, 2928304: 31, 1404592: 31, 3026608: 31, 4107952: 31, 1257136: 32, 2879152: 32, 2911920: 32, 880304: 32, 3042992: 32, 3583664: 32, 732848: 33, 2354864: 33, 2895536: 33, 863920: 33, 896688: 33, 3059376: 33, 1830576: 34, 847536: 34, 913072: 34, 2535088: 34, 1306288: 35, 831152: 35, 929456: 35, 2010800: 35, 782000: 36, 814768: 36, 945840: 36, 1486512: 36, 798384: 37, 962224: 37, 13825200: 0, 13825216: 1, 13825728: 2, 13826240: 3, 13826752: 4, 13826736: 5, 13826768: 5, 13826784: 6, 13826800: 7, 12268720: 8, 13826288: 8, 13826816: 8, 11744432: 9, 12285104: 9, 13825776: 9, 13826832: 9, 11220144: 10, 12301488: 10, 13825264: 10, 13826848: 10, 10695856: 11, 12317872: 11, 13825280: 11, 13826864: 11, 11793584: 12, 12334256: 12, 13825296: 12, 13826880: 12, 11269296: 13, 12350640: 13, 13825312: 13, 13826896: 13, 10745008: 14, 12367024: 14, 13415600: 14, 13826912: 14, 10761392: 15, 12891312: 15, 12383408: 15, 13826928: 15, 10777776: 16, 12399792: 16, 13826944: 16, 10794160: 17, 12416176: 17, 13826960: 17, 10269872: 18, 10810544: 18, 11891888: 18, 12940464: 18, 13826976: 18, 9745584: 19, 10826928: 19, 11367600: 19, 13464752: 19, 13826464: 19, 9122992: 20, 9221296: 20, 10843312: 20, 13825360: 20, 13825952: 20, 9139376: 21, 8697008: 21, 9204912: 21, 10319024: 21, 10859696: 21, 13825376: 21, 13825440: 21, 9155760: 22, 8172720: 22, 9188528: 22, 9794736: 22, 10876080: 22, 13825392: 22, 13825424: 22, 9172144: 23, 7648432: 23, 9270448: 23, 10892464: 23, 13825408: 23, 7124144: 24, 7664816: 24, 8746160: 24, 10908848: 24, 13513904: 24, 6599856: 25, 7681200: 25, 8221872: 25, 10925232: 25, 12989616: 25, 5977264: 26, 6075568: 26, 7697584: 26, 11449520: 26, 12465328: 26, 5452976: 27, 5993648: 27, 6059184: 27, 7173296: 27, 11973808: 27, 12481712: 27, 4928688: 28, 6010032: 28, 6042800: 28, 6649008: 28, 12498096: 28, 4404400: 29, 6026416: 29, 6124720: 29, 5502128: 30, 5600432: 30, 4977840: 31, 5076144: 31, 2831536: 32, 4453552: 32, 4551856: 32, 2307248: 33, 2847920: 33, 4469936: 33, 4027568: 33, 4568240: 33, 1782960: 34, 2864304: 34, 4486320: 34, 3503280: 34, 4584624: 34, 1258672: 35, 2880688: 35, 4502704: 35, 2978992: 35, 4601008: 35, 734384: 36, 2356400: 36, 2897072: 36, 3978416: 36, 2454704: 36, 2962608: 36, 2995376: 36, 4617392: 36, 1832112: 37, 2913456: 37, 3454128: 37, 1930416: 37, 2946224: 37, 3011760: 37, 4633776: 37, 1307824: 38, 2929840: 38, 1406128: 38, 3028144: 38, 4109488: 38, 783536: 39, 881840: 39, 3044528: 39, 3585200: 39, 799920: 40, 865456: 40, 898224: 40, 3060912: 40, 816304: 41, 849072: 41, 914608: 41, 2536624: 41, 832688: 42, 930992: 42, 2012336: 42, 947376: 43, 1488048: 43, 963760: 44, 15399600: 0, 15399616: 1, 14891696: 2, 15399632: 2, 14367408: 3, 15399648: 3, 13843120: 4, 15399664: 4, 14940848: 5, 15399680: 5, 14416560: 6, 15399696: 6, 13892272: 7, 15399712: 7, 13908656: 8, 15399728: 8, 13925040: 9, 15399744: 9, 13941424: 10, 15399760: 10, 13417136: 11, 15399776: 11, 12892848: 12, 15399792: 12, 12270256: 13, 12368560: 13, 15399808: 13, 11745968: 14, 12286640: 14, 12352176: 14, 12384944: 14, 15399824: 14, 11221680: 15, 12303024: 15, 12335792: 15, 12401328: 15, 15399840: 15, 10697392: 16, 12319408: 16, 12417712: 16, 15121072: 16, 11795120: 17, 11893424: 17, 12942000: 17, 14596784: 17, 11270832: 18, 11369136: 18, 13466288: 18, 14072496: 18, 10746544: 19, 10844848: 19, 13990576: 19, 14056112: 19, 10762928: 20, 10320560: 20, 10828464: 20, 10861232: 20, 14006960: 20, 14039728: 20, 10779312: 21, 9796272: 21, 10812080: 21, 10877616: 21, 14023344: 21, 13515440: 21, 10795696: 22, 9271984: 22, 10894000: 22, 12991152: 22, 10271408: 23, 8747696: 23, 10910384: 23, 12466864: 23, 9747120: 24, 8223408: 24, 10926768: 24, 12483248: 24, 9124528: 25, 9222832: 25, 7699120: 25, 11451056: 25, 12499632: 25, 9140912: 26, 8698544: 26, 9206448: 26, 7174832: 26, 7682736: 26, 11975344: 26, 9157296: 27, 8174256: 27, 9190064: 27, 6650544: 27, 7666352: 27, 9173680: 28, 7649968: 28, 6126256: 28, 7125680: 29, 5601968: 29, 6601392: 30, 5077680: 30, 5978800: 31, 6077104: 31, 4553392: 31, 5454512: 32, 5995184: 32, 6060720: 32, 4029104: 32, 4569776: 32, 4930224: 33, 6011568: 33, 6044336: 33, 3504816: 33, 4586160: 33, 4405936: 34, 6027952: 34, 2980528: 34, 4602544: 34, 5503664: 35, 2456240: 35, 2964144: 35, 2996912: 35, 4618928: 35, 4979376: 36, 1931952: 36, 2947760: 36, 3013296: 36, 4635312: 36, 2833072: 37, 4455088: 37, 1407664: 37, 2931376: 37, 3029680: 37, 4111024: 37, 2308784: 38, 2849456: 38, 4471472: 38, 883376: 38, 2914992: 38, 3455664: 38, 3046064: 38, 3586736: 38, 1784496: 39, 2865840: 39, 4487856: 39, 866992: 39, 899760: 39, 2898608: 39, 3979952: 39, 3062448: 39, 1260208: 40, 2882224: 40, 4504240: 40, 850608: 40, 916144: 40, 2538160: 40, 735920: 41, 2357936: 41, 834224: 41, 932528: 41, 2013872: 41, 1833648: 42, 817840: 42, 948912: 42, 1489584: 42, 1309360: 43, 801456: 43, 965296: 43, 785072: 44, 721600: 0, 722112: 1, 722624: 2, 723136: 3, 723648: 4, 723664: 5, 723680: 6, 723696: 7, 723184: 8, 723712: 8, 722672: 9, 723728: 9, 722160: 10, 723744: 10, 721648: 11, 724256: 11, 723760: 11, 721664: 12, 724768: 12, 723776: 12, 725184: 13, 721680: 13, 725280: 13, 723792: 13, 725696: 14, 721696: 14, 725264: 14, 723280: 14, 724304: 14, 723808: 14, 726208: 15, 721712: 15, 725248: 15, 722768: 15, 724816: 15, 723824: 15, 726720: 16, 721728: 16, 725232: 16, 722256: 16, 725328: 16, 723840: 16, 726736: 17, 721744: 17, 725744: 17, 725840: 17, 725344: 17, 723856: 17, 726752: 18, 721760: 18, 726256: 18, 726352: 18, 725360: 18, 723872: 18, 726768: 19, 721776: 19, 726864: 19, 725376: 19, 723360: 19, 724384: 19, 726784: 20, 721792: 20, 727376: 20, 725392: 20, 722848: 20, 724896: 20, 726800: 21, 721808: 21, 727888: 21, 725408: 21, 722336: 21, 726816: 22, 721824: 22, 728400: 22, 727328: 23, 728384: 23, 728912: 23, 727840: 24, 728368: 24, 729424: 24, 728352: 25, 729936: 25, 728864: 26, 730448: 26, 729376: 27, 730960: 27, 729792: 28, 729888: 28, 731472: 28, 729808: 29, 729872: 29, 730400: 29, 731456: 29, 731984: 29, 731488: 29, 729824: 30, 729856: 30, 730912: 30, 731440: 30, 732496: 30, 731504: 30, 731328: 31, 729840: 31, 731424: 31, 733008: 31, 731520: 31, 731840: 32, 731408: 32, 732992: 32, 733520: 32, 731536: 32, 732352: 33, 731392: 33, 732976: 33, 734032: 33, 731552: 33, 732864: 34, 731376: 34, 732960: 34, 734544: 34, 732064: 34, 732880: 35, 731888: 35, 732944: 35, 733472: 35, 734560: 35, 732576: 35, 732896: 36, 732400: 36, 732928: 36, 733984: 36, 734576: 36, 733088: 36, 734400: 37, 732912: 37, 734496: 37, 734592: 37, 733072: 37, 734912: 38, 734480: 38, 734080: 38, 734608: 38, 733056: 38, 735424: 39, 734464: 39, 733568: 39, 734624: 39, 735936: 40, 734448: 40, 735136: 40, 735952: 41, 734960: 41, 735648: 41, 735968: 42, 735472: 42, 736160: 42, 735984: 43, 736144: 43, 736000: 44, 736128: 44, 736016: 45, 736112: 45, 736032: 46, 736096: 46, 736048: 47, 736080: 47, 736064: 48, 1246400: 0, 1246912: 1, 1247424: 2, 1247936: 3, 1247952: 4, 1247968: 5, 1247984: 6, 1247472: 7, 1248000: 7, 1246960: 8, 1248016: 8, 1246448: 9, 1248032: 9, 771264: 10, 1248544: 10, 1248048: 10, 787648: 11, 1249056: 11, 1248064: 11, 1249472: 12, 804032: 12, 1249568: 12, 1248080: 12, 1249984: 13, 820416: 13, 1249552: 13, 1247568: 13, 1248592: 13, 1248096: 13, 1250496: 14, 836800: 14, 1249536: 14, 1247056: 14, 1249104: 14, 1248112: 14, 1251008: 15, 853184: 15, 1249520: 15, 1246544: 15, 1249616: 15, 1248128: 15, 1251024: 16, 869568: 16, 1250032: 16, 1250128: 16, 1249632: 16, 1248144: 16, 1251040: 17, 885952: 17, 1250544: 17, 1250640: 17, 1249648: 17, 1248160: 17, 1251056: 18, 902336: 18, 1251152: 18, 1249664: 18, 1247648: 18, 1248672: 18, 1251072: 19, 918720: 19, 1251664: 19, 1249680: 19, 1247136: 19, 1249184: 19, 1251088: 20, 935104: 20, 1252176: 20, 1249696: 20, 1246624: 20, 1251104: 21, 951488: 21, 1252688: 21, 1251616: 22, 1252672: 22, 1253200: 22, 1252128: 23, 1252656: 23, 1253712: 23, 1252640: 24, 1254224: 24, 1253152: 25, 1254736: 25, 1253664: 26, 1255248: 26, 1254080: 27, 1254176: 27, 1255760: 27, 1254096: 28, 1254160: 28, 1254688: 28, 1255744: 28, 1256272: 28, 1255776: 28, 1254112: 29, 1254144: 29, 1255200: 29, 1255728: 29, 1256784: 29, 1255792: 29, 1255616: 30, 1254128: 30, 1255712: 30, 1257296: 30, 1255808: 30, 1256128: 31, 1255696: 31, 1257280: 31, 1257808: 31, 1255824: 31, 1256640: 32, 1255680: 32, 1257264: 32, 1258320: 32, 1255840: 32, 1257152: 33, 1255664: 33, 1257248: 33, 1258832: 33, 1256352: 33, 1257168: 34, 1256176: 34, 1257232: 34, 1257760: 34, 1258848: 34, 1256864: 34, 1257184: 35, 1256688: 35, 1257216: 35, 1258272: 35, 1258864: 35, 1257376: 35, 1258688: 36, 1257200: 36, 1258784: 36, 1258880: 36, 1257360: 36, 1259200: 37, 1258768: 37, 1258368: 37, 1258896: 37, 1257344: 37, 1259712: 38, 1258752: 38, 1257856: 38, 1258912: 38, 1260224: 39, 1258736: 39, 1259424: 39, 1260240: 40, 1259248: 40, 1259936: 40, 1260256: 41, 1259760: 41, 1260448: 41, 1260272: 42, 1260432: 42, 1260288: 43, 1260416: 43, 1260304: 44, 1260400: 44, 1260320: 45, 1260384: 45, 1260336: 46, 1260368: 46, 1260352: 47, 1771200: 0, 1771712: 1, 1772224: 2, 1772240: 3, 1772256: 4, 1772272: 5, 1771760: 6, 1772288: 6, 1771248: 7, 1772304: 7, 1296064: 8, 1772320: 8, 771776: 9, 1772832: 9, 1772336: 9, 788160: 10, 1773344: 10, 1772352: 10, 1773760: 11, 804544: 11, 1773856: 11, 1772368: 11, 1774272: 12, 820928: 12, 1773840: 12, 1771856: 12, 1772880: 12, 1772384: 12, 1774784: 13, 837312: 13, 1773824: 13, 1771344: 13, 1773392: 13, 1772400: 13, 1775296: 14, 853696: 14, 1773808: 14, 1394368: 14, 1773904: 14, 1772416: 14, 1775312: 15, 870080: 15, 1774320: 15, 1774416: 15, 1773920: 15, 1772432: 15, 1775328: 16, 886464: 16, 1774832: 16, 1774928: 16, 1773936: 16, 1772448: 16, 1775344: 17, 902848: 17, 1775440: 17, 1773952: 17, 1771936: 17, 1772960: 17, 1775360: 18, 919232: 18, 1775952: 18, 1773968: 18, 1771424: 18, 1773472: 18, 1775376: 19, 935616: 19, 1776464: 19, 1773984: 19, 1476288: 19, 1775392: 20, 952000: 20, 1776976: 20, 1775904: 21, 1776960: 21, 1777488: 21, 1776416: 22, 1776944: 22, 1778000: 22, 1776928: 23, 1778512: 23, 1777440: 24, 1779024: 24, 1777952: 25, 1779536: 25, 1778368: 26, 1778464: 26, 1780048: 26, 1778384: 27, 1778448: 27, 1778976: 27, 1780032: 27, 1780560: 27, 1780064: 27, 1778400: 28, 1778432: 28, 1779488: 28, 1780016: 28, 1781072: 28, 1780080: 28, 1779904: 29, 1778416: 29, 1780000: 29, 1781584: 29, 1780096: 29, 1780416: 30, 1779984: 30, 1781568: 30, 1782096: 30, 1780112: 30, 1780928: 31, 1779968: 31, 1781552: 31, 1782608: 31, 1780128: 31, 1781440: 32, 1779952: 32, 1781536: 32, 1783120: 32, 1780640: 32, 1781456: 33, 1780464: 33, 1781520: 33, 1782048: 33, 1783136: 33, 1781152: 33, 1781472: 34, 1780976: 34, 1781504: 34, 1782560: 34, 1783152: 34, 1781664: 34, 1782976: 35, 1781488: 35, 1783072: 35, 1783168: 35, 1781648: 35, 1783488: 36, 1783056: 36, 1782656: 36, 1783184: 36, 1781632: 36, 1784000: 37, 1783040: 37, 1782144: 37, 1783200: 37, 1784512: 38, 1783024: 38, 1783712: 38, 1784528: 39, 1783536: 39, 1784224: 39, 1784544: 40, 1784048: 40, 1784736: 40, 1784560: 41, 1784720: 41, 1784576: 42, 1784704: 42, 1784592: 43, 1784688: 43, 1784608: 44, 1784672: 44, 1784624: 45, 1784656: 45, 1784640: 46, 2296000: 0, 2296512: 1, 2296528: 2, 2296544: 3, 2296560: 4, 2296048: 5, 2296576: 5, 1820864: 6, 2296592: 6, 1296576: 7, 2296608: 7, 772288: 8, 2297120: 8, 2296624: 8, 788672: 9, 2297632: 9, 2296640: 9, 2298048: 10, 805056: 10, 2298144: 10, 2296656: 10, 2298560: 11, 821440: 11, 2298128: 11, 2296144: 11, 2297168: 11, 2296672: 11, 2299072: 12, 837824: 12, 2298112: 12, 1919168: 12, 2297680: 12, 2296688: 12, 2299584: 13, 854208: 13, 2298096: 13, 1394880: 13, 2298192: 13, 2296704: 13, 2299600: 14, 870592: 14, 2298608: 14, 2298704: 14, 2298208: 14, 2296720: 14, 2299616: 15, 886976: 15, 2299120: 15, 2299216: 15, 2298224: 15, 2296736: 15, 2299632: 16, 903360: 16, 2299728: 16, 2298240: 16, 2296224: 16, 2297248: 16, 2299648: 17, 919744: 17, 2300240: 17, 2298256: 17, 2001088: 17, 2297760: 17, 2299664: 18, 936128: 18, 2300752: 18, 2298272: 18, 1476800: 18, 2299680: 19, 952512: 19, 2301264: 19, 2300192: 20, 2301248: 20, 2301776: 20, 2300704: 21, 2301232: 21, 2302288: 21, 2301216: 22, 2302800: 22, 2301728: 23, 2303312: 23, 2302240: 24, 2303824: 24, 2302656: 25, 2302752: 25, 2304336: 25, 2302672: 26, 2302736: 26, 2303264: 26, 2304320: 26, 2304848: 26, 2304352: 26, 2302688: 27, 2302720: 27, 2303776: 27, 2304304: 27, 2305360: 27, 2304368: 27, 2304192: 28, 2302704: 28, 2304288: 28, 2305872: 28, 2304384: 28, 2304704: 29, 2304272: 29, 2305856: 29, 2306384: 29, 2304400: 29, 2305216: 30, 2304256: 30, 2305840: 30, 2306896: 30, 2304416: 30, 2305728: 31, 2304240: 31, 2305824: 31, 2307408: 31, 2304928: 31, 2305744: 32, 2304752: 32, 2305808: 32, 2306336: 32, 2307424: 32, 2305440: 32, 2305760: 33, 2305264: 33, 2305792: 33, 2306848: 33, 2307440: 33, 2305952: 33, 2307264: 34, 2305776: 34, 2307360: 34, 2307456: 34, 2305936: 34, 2307776: 35, 2307344: 35, 2306944: 35, 2307472: 35, 2305920: 35, 2308288: 36, 2307328: 36, 2306432: 36, 2307488: 36, 2308800: 37, 2307312: 37, 2308000: 37, 2308816: 38, 2307824: 38, 2308512: 38, 2308832: 39, 2308336: 39, 2309024: 39, 2308848: 40, 2309008: 40, 2308864: 41, 2308992: 41, 2308880: 42, 2308976: 42, 2308896: 43, 2308960: 43, 2308912: 44, 2308944: 44, 2308928: 45, 2820800: 0, 2820816: 1, 2820832: 2, 2820848: 3, 2345664: 4, 2820864: 4, 1821376: 5, 2820880: 5, 1297088: 6, 2820896: 6, 772800: 7, 2821408: 7, 2820912: 7, 789184: 8, 2821920: 8, 2820928: 8, 2822336: 9, 805568: 9, 2822432: 9, 2820944: 9, 2822848: 10, 821952: 10, 2822416: 10, 2443968: 10, 2821456: 10, 2820960: 10, 2823360: 11, 838336: 11, 2822400: 11, 1919680: 11, 2821968: 11, 2820976: 11, 2823872: 12, 854720: 12, 2822384: 12, 1395392: 12, 2822480: 12, 2820992: 12, 2823888: 13, 871104: 13, 2822896: 13, 2822992: 13, 2822496: 13, 2821008: 13, 2823904: 14, 887488: 14, 2823408: 14, 2823504: 14, 2822512: 14, 2821024: 14, 2823920: 15, 903872: 15, 2824016: 15, 2822528: 15, 2525888: 15, 2821536: 15, 2823936: 16, 920256: 16, 2824528: 16, 2822544: 16, 2001600: 16, 2822048: 16, 2823952: 17, 936640: 17, 2825040: 17, 2822560: 17, 1477312: 17, 2823968: 18, 953024: 18, 2825552: 18, 2824480: 19, 2825536: 19, 2826064: 19, 2824992: 20, 2825520: 20, 2826576: 20, 2825504: 21, 2827088: 21, 2826016: 22, 2827600: 22, 2826528: 23, 2828112: 23, 2826944: 24, 2827040: 24, 2828624: 24, 2826960: 25, 2827024: 25, 2827552: 25, 2828608: 25, 2829136: 25, 2828640: 25, 2826976: 26, 2827008: 26, 2828064: 26, 2828592: 26, 2829648: 26, 2828656: 26, 2828480: 27, 2826992: 27, 2828576: 27, 2830160: 27, 2828672: 27, 2828992: 28, 2828560: 28, 2830144: 28, 2830672: 28, 2828688: 28, 2829504: 29, 2828544: 29, 2830128: 29, 2831184: 29, 2828704: 29, 2830016: 30, 2828528: 30, 2830112: 30, 2831696: 30, 2829216: 30, 2830032: 31, 2829040: 31, 2830096: 31, 2830624: 31, 2831712: 31, 2829728: 31, 2830048: 32, 2829552: 32, 2830080: 32, 2831136: 32, 2831728: 32, 2830240: 32, 2831552: 33, 2830064: 33, 2831648: 33, 2831744: 33, 2830224: 33, 2832064: 34, 2831632: 34, 2831232: 34, 2831760: 34, 2830208: 34, 2832576: 35, 2831616: 35, 2830720: 35, 2831776: 35, 2833088: 36, 2831600: 36, 2832288: 36, 2833104: 37, 2832112: 37, 2832800: 37, 2833120: 38, 2832624: 38, 2833312: 38, 2833136: 39, 2833296: 39, 2833152: 40, 2833280: 40, 2833168: 41, 2833264: 41, 2833184: 42, 2833248: 42, 2833200: 43, 2833232: 43, 2833216: 44, 4395200: 0, 4395712: 1, 4396224: 2, 4396736: 3, 4396752: 4, 4396768: 5, 4396784: 6, 4396272: 7, 4396800: 7, 4395760: 8, 4396816: 8, 4395248: 9, 4396832: 9, 2838720: 10, 4395264: 10, 4397344: 10, 2855104: 11, 4395280: 11, 4397856: 11, 2871488: 12, 4395296: 12, 4398368: 12, 2347200: 13, 2887872: 13, 3969216: 13, 4398880: 13, 4398384: 13, 1822912: 14, 2904256: 14, 3444928: 14, 4399392: 14, 4398400: 14, 1298624: 15, 2920640: 15, 4399808: 15, 4399904: 15, 4398416: 15, 774336: 16, 2937024: 16, 4399824: 16, 4399888: 16, 4400416: 16, 4397904: 16, 4398928: 16, 790720: 17, 2953408: 17, 4399840: 17, 4399872: 17, 4400928: 17, 4397392: 17, 4399440: 17, 807104: 18, 2969792: 18, 4401344: 18, 4399856: 18, 4401440: 18, 4396880: 18, 4399952: 18, 823488: 19, 2445504: 19, 3494080: 19, 2986176: 19, 4401856: 19, 4401424: 19, 4401456: 19, 4396368: 19, 4400464: 19, 839872: 20, 1921216: 20, 4018368: 20, 3002560: 20, 4402368: 20, 4401408: 20, 4401472: 20, 4395856: 20, 4400976: 20, 856256: 21, 1396928: 21, 4395344: 21, 3018944: 21, 4402880: 21, 4401392: 21, 4401488: 21, 872640: 22, 4395360: 22, 3035328: 22, 4402896: 22, 4401904: 22, 4402000: 22, 4401504: 22, 889024: 23, 4395376: 23, 3051712: 23, 4402912: 23, 4402416: 23, 4402512: 23, 4401520: 23, 905408: 24, 4395392: 24, 2527424: 24, 3576000: 24, 4402928: 24, 4403024: 24, 4401536: 24, 921792: 25, 4395408: 25, 2003136: 25, 4100288: 25, 4402944: 25, 4403008: 25, 4403536: 25, 4401552: 25, 938176: 26, 4395424: 26, 1478848: 26, 4402960: 26, 4402992: 26, 4404048: 26, 4401568: 26, 954560: 27, 4402976: 27, 4404560: 27, 4402080: 27, 4403488: 28, 4404576: 28, 4402592: 28, 4404000: 29, 4404592: 29, 4403104: 29, 4404416: 30, 4404512: 30, 4404608: 30, 4403088: 30, 4404928: 31, 4404496: 31, 4404096: 31, 4404624: 31, 4403072: 31, 4405440: 32, 4404480: 32, 4403584: 32, 4404640: 32, 4405952: 33, 4404464: 33, 4405152: 33, 4405968: 34, 4404976: 34, 4405664: 34, 4405984: 35, 4405488: 35, 4406176: 35, 4406000: 36, 4406160: 36, 4406016: 37, 4406144: 37, 4406032: 38, 4406128: 38, 4406048: 39, 4406112: 39, 4406064: 40, 4406096: 40, 4406080: 41, 4920000: 0, 4920512: 1, 4921024: 2, 4921040: 3, 4921056: 4, 4921072: 5, 4920560: 6, 4921088: 6, 4920048: 7, 4921104: 7, 4444864: 8, 4921120: 8, 4461248: 9, 4921632: 9, 4477632: 10, 4922144: 10, 2839232: 11, 4494016: 11, 4922656: 11, 2855616: 12, 3969728: 12, 4923168: 12, 4922672: 12, 2872000: 13, 3445440: 13, 4923680: 13, 4922688: 13, 2347712: 14, 2888384: 14, 4924096: 14, 2921152: 14, 4924192: 14, 4922704: 14, 1823424: 15, 2904768: 15, 4924112: 15, 2937536: 15, 4924176: 15, 4924704: 15, 4922192: 15, 4923216: 15, 1299136: 16, 4924128: 16, 2953920: 16, 4924160: 16, 4925216: 16, 4921680: 16, 4923728: 16, 774848: 17, 4925632: 17, 4924144: 17, 2970304: 17, 4925728: 17, 4921168: 17, 4924240: 17, 791232: 18, 4926144: 18, 2446016: 18, 3494592: 18, 2986688: 18, 4925712: 18, 4925744: 18, 4920656: 18, 4924752: 18, 807616: 19, 4926656: 19, 1921728: 19, 4018880: 19, 3003072: 19, 4925696: 19, 4925760: 19, 4920144: 19, 4925264: 19, 824000: 20, 4927168: 20, 1397440: 20, 4543168: 20, 3019456: 20, 4925680: 20, 4925776: 20, 840384: 21, 4927184: 21, 873152: 21, 4559552: 21, 3035840: 21, 4926192: 21, 4926288: 21, 4925792: 21, 856768: 22, 4927200: 22, 889536: 22, 4575936: 22, 3052224: 22, 4926704: 22, 4926800: 22, 4925808: 22, 4927216: 23, 905920: 23, 4592320: 23, 2527936: 23, 3576512: 23, 4927312: 23, 4925824: 23, 4927232: 24, 922304: 24, 4608704: 24, 2003648: 24, 4100800: 24, 4927296: 24, 4927824: 24, 4925840: 24, 4927248: 25, 938688: 25, 4625088: 25, 1479360: 25, 4927280: 25, 4928336: 25, 4925856: 25, 4927264: 26, 955072: 26, 4928848: 26, 4926368: 26, 4927776: 27, 4928864: 27, 4926880: 27, 4928288: 28, 4928880: 28, 4927392: 28, 4928704: 29, 4928800: 29, 4928896: 29, 4927376: 29, 4929216: 30, 4928784: 30, 4928384: 30, 4928912: 30, 4927360: 30, 4929728: 31, 4928768: 31, 4927872: 31, 4928928: 31, 4930240: 32, 4928752: 32, 4929440: 32, 4930256: 33, 4929264: 33, 4929952: 33, 4930272: 34, 4929776: 34, 4930464: 34, 4930288: 35, 4930448: 35, 4930304: 36, 4930432: 36, 4930320: 37, 4930416: 37, 4930336: 38, 4930400: 38, 4930352: 39, 4930384: 39, 4930368: 40, 5444800: 0, 5445312: 1, 5445328: 2, 5445344: 3, 5445360: 4, 5444848: 5, 5445376: 5, 4969664: 6, 5445392: 6, 4445376: 7, 5445408: 7, 4461760: 8, 5445920: 8, 4478144: 9, 5446432: 9, 4494528: 10, 5446944: 10, 3970240: 11, 5447456: 11, 5446960: 11, 2839744: 12, 3445952: 12, 5447968: 12, 5446976: 12, 2856128: 13, 5448384: 13, 2921664: 13, 5448480: 13, 5446992: 13, 2872512: 14, 5448400: 14, 2905280: 14, 2938048: 14, 5448464: 14, 5448992: 14, 5446480: 14, 5447504: 14, 2348224: 15, 2888896: 15, 5448416: 15, 2954432: 15, 5448448: 15, 5449504: 15, 5445968: 15, 5448016: 15, 1823936: 16, 5449920: 16, 5448432: 16, 2970816: 16, 5450016: 16, 5445456: 16, 5448528: 16, 1299648: 17, 5450432: 17, 2446528: 17, 3495104: 17, 2987200: 17, 5450000: 17, 5450032: 17, 5444944: 17, 5449040: 17, 775360: 18, 5450944: 18, 1922240: 18, 4019392: 18, 3003584: 18, 5449984: 18, 5450048: 18, 5067968: 18, 5449552: 18, 791744: 19, 5451456: 19, 1397952: 19, 4543680: 19, 3019968: 19, 5449968: 19, 5450064: 19, 808128: 20, 5451472: 20, 873664: 20, 4560064: 20, 3036352: 20, 5450480: 20, 5450576: 20, 5450080: 20, 824512: 21, 5451488: 21, 857280: 21, 890048: 21, 4576448: 21, 3052736: 21, 5450992: 21, 5451088: 21, 5450096: 21, 840896: 22, 5451504: 22, 906432: 22, 4592832: 22, 2528448: 22, 3577024: 22, 5451600: 22, 5450112: 22, 5451520: 23, 922816: 23, 4609216: 23, 2004160: 23, 4101312: 23, 5451584: 23, 5452112: 23, 5450128: 23, 5451536: 24, 939200: 24, 4625600: 24, 1479872: 24, 5451568: 24, 5452624: 24, 5450144: 24, 5451552: 25, 955584: 25, 5453136: 25, 5450656: 25, 5452064: 26, 5453152: 26, 5451168: 26, 5452576: 27, 5453168: 27, 5451680: 27, 5452992: 28, 5453088: 28, 5453184: 28, 5451664: 28, 5453504: 29, 5453072: 29, 5452672: 29, 5453200: 29, 5451648: 29, 5454016: 30, 5453056: 30, 5452160: 30, 5453216: 30, 5454528: 31, 5453040: 31, 5453728: 31, 5454544: 32, 5453552: 32, 5454240: 32, 5454560: 33, 5454064: 33, 5454752: 33, 5454576: 34, 5454736: 34, 5454592: 35, 5454720: 35, 5454608: 36, 5454704: 36, 5454624: 37, 5454688: 37, 5454640: 38, 5454672: 38, 5454656: 39, 5969600: 0, 5969616: 1, 5969632: 2, 5969648: 3, 5494464: 4, 5969664: 4, 4970176: 5, 5969680: 5, 4445888: 6, 5969696: 6, 4462272: 7, 5970208: 7, 4478656: 8, 5970720: 8, 4495040: 9, 5971232: 9, 3970752: 10, 5971744: 10, 5971248: 10, 3446464: 11, 5972256: 11, 5971264: 11, 5972672: 12, 2922176: 12, 5972768: 12, 5971280: 12, 2840256: 13, 5972688: 13, 2905792: 13, 2938560: 13, 5972752: 13, 5973280: 13, 5970768: 13, 5971792: 13, 2856640: 14, 5972704: 14, 2889408: 14, 2954944: 14, 5972736: 14, 5973792: 14, 5970256: 14, 5972304: 14, 2873024: 15, 5974208: 15, 5972720: 15, 2971328: 15, 5974304: 15, 5969744: 15, 5972816: 15, 2348736: 16, 5974720: 16, 2447040: 16, 3495616: 16, 2987712: 16, 5974288: 16, 5974320: 16, 5592768: 16, 5973328: 16, 1824448: 17, 5975232: 17, 1922752: 17, 4019904: 17, 3004096: 17, 5974272: 17, 5974336: 17, 5068480: 17, 5973840: 17, 1300160: 18, 5975744: 18, 1398464: 18, 4544192: 18, 3020480: 18, 5974256: 18, 5974352: 18, 775872: 19, 5975760: 19, 874176: 19, 4560576: 19, 3036864: 19, 5974768: 19, 5974864: 19, 5974368: 19, 792256: 20, 5975776: 20, 857792: 20, 890560: 20, 4576960: 20, 3053248: 20, 5975280: 20, 5975376: 20, 5974384: 20, 808640: 21, 5975792: 21, 841408: 21, 906944: 21, 4593344: 21, 2528960: 21, 3577536: 21, 5975888: 21, 5974400: 21, 825024: 22, 5975808: 22, 923328: 22, 4609728: 22, 2004672: 22, 4101824: 22, 5975872: 22, 5976400: 22, 5974416: 22, 5975824: 23, 939712: 23, 4626112: 23, 1480384: 23, 5975856: 23, 5976912: 23, 5974432: 23, 5975840: 24, 956096: 24, 5977424: 24, 5974944: 24, 5976352: 25, 5977440: 25, 5975456: 25, 5976864: 26, 5977456: 26, 5975968: 26, 5977280: 27, 5977376: 27, 5977472: 27, 5975952: 27, 5977792: 28, 5977360: 28, 5976960: 28, 5977488: 28, 5975936: 28, 5978304: 29, 5977344: 29, 5976448: 29, 5977504: 29, 5978816: 30, 5977328: 30, 5978016: 30, 5978832: 31, 5977840: 31, 5978528: 31, 5978848: 32, 5978352: 32, 5979040: 32, 5978864: 33, 5979024: 33, 5978880: 34, 5979008: 34, 5978896: 35, 5978992: 35, 5978912: 36, 5978976: 36, 5978928: 37, 5978960: 37, 5978944: 38, 9118400: 0, 9118416: 1, 9118432: 2, 9118448: 3, 9118464: 4, 9118480: 5, 9118496: 6, 8692416: 7, 9119008: 7, 8168128: 8, 9119520: 8, 9119936: 9, 7643840: 9, 9120032: 9, 9120448: 10, 7119552: 10, 7660224: 10, 9120016: 10, 9120048: 10, 9120960: 11, 6595264: 11, 7676608: 11, 9120000: 11, 9120064: 11, 9121472: 12, 6070976: 12, 7692992: 12, 9119984: 12, 9120080: 12, 5989056: 13, 9121488: 13, 6054592: 13, 7168704: 13, 8217280: 13, 9120496: 13, 9119568: 13, 9120592: 13, 9120096: 13, 6005440: 14, 9121504: 14, 6038208: 14, 6644416: 14, 8741568: 14, 9121008: 14, 9119056: 14, 9121104: 14, 9120112: 14, 6021824: 15, 9121520: 15, 6120128: 15, 9118544: 15, 9121616: 15, 9120128: 15, 5497536: 16, 9121536: 16, 5595840: 16, 9121600: 16, 9122128: 16, 9120144: 16, 4973248: 17, 9121552: 17, 5071552: 17, 9121584: 17, 9122640: 17, 9120160: 17, 4448960: 18, 9121568: 18, 4547264: 18, 9123152: 18, 9120672: 18, 4465344: 19, 9122080: 19, 4022976: 19, 4563648: 19, 9123168: 19, 9121184: 19, 4481728: 20, 9122592: 20, 3498688: 20, 4580032: 20, 9123184: 20, 9121696: 20, 4498112: 21, 9123008: 21, 9123104: 21, 2974400: 21, 4596416: 21, 9123200: 21, 9121680: 21, 3973824: 22, 9123520: 22, 9123088: 22, 2450112: 22, 2958016: 22, 2990784: 22, 4612800: 22, 9122688: 22, 9123216: 22, 9121664: 22, 3449536: 23, 9124032: 23, 9123072: 23, 1925824: 23, 2941632: 23, 3007168: 23, 4629184: 23, 9122176: 23, 9123232: 23, 2925248: 24, 9124544: 24, 9123056: 24, 1401536: 24, 3023552: 24, 4104896: 24, 9123744: 24, 2843328: 25, 2908864: 25, 9124560: 25, 9123568: 25, 877248: 25, 3039936: 25, 3580608: 25, 9124256: 25, 2859712: 26, 2892480: 26, 9124576: 26, 9124080: 26, 860864: 26, 893632: 26, 3056320: 26, 9124768: 26, 2876096: 27, 9124592: 27, 844480: 27, 910016: 27, 2532032: 27, 9124752: 27, 2351808: 28, 9124608: 28, 828096: 28, 926400: 28, 2007744: 28, 9124736: 28, 1827520: 29, 9124624: 29, 811712: 29, 942784: 29, 1483456: 29, 9124720: 29, 1303232: 30, 9124640: 30, 795328: 30, 959168: 30, 9124704: 30, 778944: 31, 9124656: 31, 9124688: 31, 9124672: 32, 10692800: 0, 10693312: 1, 10693824: 2, 10694336: 3, 10694352: 4, 10694368: 5, 10694384: 6, 10693872: 7, 10694400: 7, 10693360: 8, 10694416: 8, 10692848: 9, 10694432: 9, 9136320: 10, 10692864: 10, 10694944: 10, 10694448: 10, 9152704: 11, 10692880: 11, 10695456: 11, 10694464: 11, 9169088: 12, 10695872: 12, 10692896: 12, 10695968: 12, 10694480: 12, 9185472: 13, 10696384: 13, 10266816: 13, 10692912: 13, 10695952: 13, 10693968: 13, 10694992: 13, 9201856: 14, 10696896: 14, 9742528: 14, 10692928: 14, 10695936: 14, 10693456: 14, 10695504: 14, 9218240: 15, 10697408: 15, 10692944: 15, 10695920: 15, 10696016: 15, 5990592: 16, 8693952: 16, 10697424: 16, 10315968: 16, 10692960: 16, 10696432: 16, 10696032: 16, 6006976: 17, 8169664: 17, 10697440: 17, 9791680: 17, 10692976: 17, 10696944: 17, 10696048: 17, 6023360: 18, 7645376: 18, 10697456: 18, 9267392: 18, 10692992: 18, 10696064: 18, 5499072: 19, 6039744: 19, 7121088: 19, 7661760: 19, 10697472: 19, 8743104: 19, 10693008: 19, 10695552: 19, 10696080: 19, 4974784: 20, 6056128: 20, 6596800: 20, 7678144: 20, 10697488: 20, 8218816: 20, 10693024: 20, 10695040: 20, 10696096: 20, 4450496: 21, 6072512: 21, 7694528: 21, 10697504: 21, 10693536: 21, 10694528: 21, 10696608: 21, 4466880: 22, 7170240: 22, 10697520: 22, 10694048: 22, 10694544: 22, 10697120: 22, 4483264: 23, 6645952: 23, 10697536: 23, 10694560: 23, 10697632: 23, 4499648: 24, 6121664: 24, 10697552: 24, 10697616: 24, 3975360: 25, 5597376: 25, 10697568: 25, 10697600: 25, 3451072: 26, 5073088: 26, 10697584: 26, 2926784: 27, 4548800: 27, 2844864: 28, 2910400: 28, 2943168: 28, 4024512: 28, 4565184: 28, 2861248: 29, 2894016: 29, 2959552: 29, 3500224: 29, 4581568: 29, 2877632: 30, 2975936: 30, 4597952: 30, 2353344: 31, 2451648: 31, 2992320: 31, 4614336: 31, 1829056: 32, 1927360: 32, 3008704: 32, 4630720: 32, 1304768: 33, 1403072: 33, 3025088: 33, 4106432: 33, 780480: 34, 878784: 34, 3041472: 34, 3582144: 34, 796864: 35, 862400: 35, 895168: 35, 3057856: 35, 813248: 36, 846016: 36, 911552: 36, 2533568: 36, 829632: 37, 927936: 37, 2009280: 37, 944320: 38, 1484992: 38, 960704: 39, 11217600: 0, 11218112: 1, 11218624: 2, 11218640: 3, 11218656: 4, 11218672: 5, 11218160: 6, 11218688: 6, 11217648: 7, 11218704: 7, 10742464: 8, 11218720: 8, 10758848: 9, 11219232: 9, 11218736: 9, 10775232: 10, 11219744: 10, 11218752: 10, 9136832: 11, 11220160: 11, 10791616: 11, 11220256: 11, 11218768: 11, 9153216: 12, 11220672: 12, 10267328: 12, 10808000: 12, 11220240: 12, 11218256: 12, 11219280: 12, 9169600: 13, 11221184: 13, 9743040: 13, 10824384: 13, 11220224: 13, 11217744: 13, 11219792: 13, 9185984: 14, 11221696: 14, 9218752: 14, 10840768: 14, 11220208: 14, 11220304: 14, 9202368: 15, 11221712: 15, 8694464: 15, 10316480: 15, 10857152: 15, 11220720: 15, 11220320: 15, 11221728: 16, 8170176: 16, 9792192: 16, 10873536: 16, 11221232: 16, 11220336: 16, 5991104: 17, 11221744: 17, 7645888: 17, 9267904: 17, 10889920: 17, 11220352: 17, 6007488: 18, 11221760: 18, 7121600: 18, 7662272: 18, 8743616: 18, 10906304: 18, 11219840: 18, 11220368: 18, 6023872: 19, 11221776: 19, 6597312: 19, 7678656: 19, 8219328: 19, 10922688: 19, 11219328: 19, 11220384: 19, 5499584: 20, 6040256: 20, 11221792: 20, 6073024: 20, 7695040: 20, 11217824: 20, 11218816: 20, 11220896: 20, 4975296: 21, 6056640: 21, 11221808: 21, 7170752: 21, 11218336: 21, 11218832: 21, 11221408: 21, 4451008: 22, 11221824: 22, 6646464: 22, 11218848: 22, 11221920: 22, 4467392: 23, 11221840: 23, 6122176: 23, 11221904: 23, 4483776: 24, 11221856: 24, 5597888: 24, 11221888: 24, 4500160: 25, 11221872: 25, 5073600: 25, 3975872: 26, 4549312: 26, 3451584: 27, 4025024: 27, 4565696: 27, 2927296: 28, 3500736: 28, 4582080: 28, 2845376: 29, 2910912: 29, 2943680: 29, 2976448: 29, 4598464: 29, 2861760: 30, 2894528: 30, 2960064: 30, 2452160: 30, 2992832: 30, 4614848: 30, 2878144: 31, 1927872: 31, 3009216: 31, 4631232: 31, 2353856: 32, 1403584: 32, 3025600: 32, 4106944: 32, 1829568: 33, 879296: 33, 3041984: 33, 3582656: 33, 1305280: 34, 862912: 34, 895680: 34, 3058368: 34, 780992: 35, 846528: 35, 912064: 35, 2534080: 35, 797376: 36, 830144: 36, 928448: 36, 2009792: 36, 813760: 37, 944832: 37, 1485504: 37, 961216: 38, 11742400: 0, 11742912: 1, 11742928: 2, 11742944: 3, 11742960: 4, 11742448: 5, 11742976: 5, 11267264: 6, 11742992: 6, 10742976: 7, 11743008: 7, 10759360: 8, 11743520: 8, 11743024: 8, 10775744: 9, 11744032: 9, 11743040: 9, 11744448: 10, 10792128: 10, 11744544: 10, 11743056: 10, 11744960: 11, 10267840: 11, 10808512: 11, 11744528: 11, 11742544: 11, 11743568: 11, 9137344: 12, 11745472: 12, 9743552: 12, 10824896: 12, 11744512: 12, 11365568: 12, 11744080: 12, 9153728: 13, 11745984: 13, 9219264: 13, 10841280: 13, 11744496: 13, 11744592: 13, 9170112: 14, 11746000: 14, 8694976: 14, 9202880: 14, 10316992: 14, 10857664: 14, 11745008: 14, 11744608: 14, 9186496: 15, 11746016: 15, 8170688: 15, 9792704: 15, 10874048: 15, 11745520: 15, 11744624: 15, 11746032: 16, 7646400: 16, 9268416: 16, 10890432: 16, 11744640: 16, 11746048: 17, 7122112: 17, 7662784: 17, 8744128: 17, 10906816: 17, 11744128: 17, 11744656: 17, 5991616: 18, 11746064: 18, 6597824: 18, 7679168: 18, 8219840: 18, 10923200: 18, 11743616: 18, 11744672: 18, 6008000: 19, 11746080: 19, 6073536: 19, 7695552: 19, 11447488: 19, 11743104: 19, 11745184: 19, 6024384: 20, 11746096: 20, 6057152: 20, 7171264: 20, 11742624: 20, 11743120: 20, 11745696: 20, 5500096: 21, 6040768: 21, 11746112: 21, 6646976: 21, 11743136: 21, 11746208: 21, 4975808: 22, 11746128: 22, 6122688: 22, 11746192: 22, 4451520: 23, 11746144: 23, 5598400: 23, 11746176: 23, 4467904: 24, 11746160: 24, 5074112: 24, 4484288: 25, 4549824: 25, 4500672: 26, 4025536: 26, 4566208: 26, 3976384: 27, 3501248: 27, 4582592: 27, 3452096: 28, 2976960: 28, 4598976: 28, 2927808: 29, 2452672: 29, 2960576: 29, 2993344: 29, 4615360: 29, 2845888: 30, 2911424: 30, 2944192: 30, 1928384: 30, 3009728: 30, 4631744: 30, 2862272: 31, 2895040: 31, 1404096: 31, 3026112: 31, 4107456: 31, 2878656: 32, 879808: 32, 3042496: 32, 3583168: 32, 2354368: 33, 863424: 33, 896192: 33, 3058880: 33, 1830080: 34, 847040: 34, 912576: 34, 2534592: 34, 1305792: 35, 830656: 35, 928960: 35, 2010304: 35, 781504: 36, 814272: 36, 945344: 36, 1486016: 36, 797888: 37, 961728: 37, 12267200: 0, 12267216: 1, 12267232: 2, 12267248: 3, 11792064: 4, 12267264: 4, 11267776: 5, 12267280: 5, 10743488: 6, 12267296: 6, 10759872: 7, 12267808: 7, 12267312: 7, 10776256: 8, 12268320: 8, 12267328: 8, 12268736: 9, 10792640: 9, 12268832: 9, 12267344: 9, 12269248: 10, 10268352: 10, 10809024: 10, 12268816: 10, 11890368: 10, 12267856: 10, 12269760: 11, 9744064: 11, 10825408: 11, 12268800: 11, 11366080: 11, 12268368: 11, 12270272: 12, 9219776: 12, 10841792: 12, 12268784: 12, 12268880: 12, 9137856: 13, 12270288: 13, 8695488: 13, 9203392: 13, 10317504: 13, 10858176: 13, 12269296: 13, 12268896: 13, 9154240: 14, 12270304: 14, 8171200: 14, 9187008: 14, 9793216: 14, 10874560: 14, 12269808: 14, 12268912: 14, 9170624: 15, 12270320: 15, 7646912: 15, 9268928: 15, 10890944: 15, 12268928: 15, 12270336: 16, 7122624: 16, 7663296: 16, 8744640: 16, 10907328: 16, 12268416: 16, 12268944: 16, 12270352: 17, 6598336: 17, 7679680: 17, 8220352: 17, 10923712: 17, 12267904: 17, 12268960: 17, 12270368: 18, 6074048: 18, 7696064: 18, 11448000: 18, 12267392: 18, 12269472: 18, 5992128: 19, 12270384: 19, 6057664: 19, 7171776: 19, 11972288: 19, 12267408: 19, 12269984: 19, 6008512: 20, 12270400: 20, 6041280: 20, 6647488: 20, 12267424: 20, 12270496: 20, 6024896: 21, 12270416: 21, 6123200: 21, 12270480: 21, 5500608: 22, 12270432: 22, 5598912: 22, 12270464: 22, 4976320: 23, 12270448: 23, 5074624: 23, 4452032: 24, 4550336: 24, 4468416: 25, 4026048: 25, 4566720: 25, 4484800: 26, 3501760: 26, 4583104: 26, 4501184: 27, 2977472: 27, 4599488: 27, 3976896: 28, 2453184: 28, 2961088: 28, 2993856: 28, 4615872: 28, 3452608: 29, 1928896: 29, 2944704: 29, 3010240: 29, 4632256: 29, 2928320: 30, 1404608: 30, 3026624: 30, 4107968: 30, 2846400: 31, 2911936: 31, 880320: 31, 3043008: 31, 3583680: 31, 2862784: 32, 2895552: 32, 863936: 32, 896704: 32, 3059392: 32, 2879168: 33, 847552: 33, 913088: 33, 2535104: 33, 2354880: 34, 831168: 34, 929472: 34, 2010816: 34, 1830592: 35, 814784: 35, 945856: 35, 1486528: 35, 1306304: 36, 798400: 36, 962240: 36, 782016: 37, 13841600: 0, 13842112: 1, 13842624: 2, 13843136: 3, 13843152: 4, 13843168: 5, 13843184: 6, 13842672: 7, 13843200: 7, 13842160: 8, 13843216: 8, 13841648: 9, 13843232: 9, 12285120: 10, 13841664: 10, 13843248: 10, 12301504: 11, 13841680: 11, 13843264: 11, 12317888: 12, 13841696: 12, 13843280: 12, 11793600: 13, 12334272: 13, 13415616: 13, 13843296: 13, 11269312: 14, 12350656: 14, 12891328: 14, 13843312: 14, 10745024: 15, 12367040: 15, 13843328: 15, 10761408: 16, 12383424: 16, 13843344: 16, 10777792: 17, 12399808: 17, 13843360: 17, 10794176: 18, 12416192: 18, 13842848: 18, 10269888: 19, 10810560: 19, 11891904: 19, 12940480: 19, 13842336: 19, 9745600: 20, 10826944: 20, 11367616: 20, 13464768: 20, 13841824: 20, 9221312: 21, 10843328: 21, 13841744: 21, 13841808: 21, 9139392: 22, 8697024: 22, 9204928: 22, 10319040: 22, 10859712: 22, 13841760: 22, 13841792: 22, 9155776: 23, 8172736: 23, 9188544: 23, 9794752: 23, 10876096: 23, 13841776: 23, 13513920: 23, 9172160: 24, 7648448: 24, 9270464: 24, 10892480: 24, 12989632: 24, 7124160: 25, 7664832: 25, 8746176: 25, 10908864: 25, 12465344: 25, 6599872: 26, 7681216: 26, 8221888: 26, 10925248: 26, 12481728: 26, 6075584: 27, 7697600: 27, 11449536: 27, 12498112: 27, 5993664: 28, 6059200: 28, 7173312: 28, 11973824: 28, 6010048: 29, 6042816: 29, 6649024: 29, 6026432: 30, 6124736: 30, 5502144: 31, 5600448: 31, 4977856: 32, 5076160: 32, 4453568: 33, 4551872: 33, 2847936: 34, 4469952: 34, 4027584: 34, 4568256: 34, 2864320: 35, 4486336: 35, 3503296: 35, 4584640: 35, 2880704: 36, 4502720: 36, 2979008: 36, 4601024: 36, 2356416: 37, 2897088: 37, 3978432: 37, 2454720: 37, 2962624: 37, 2995392: 37, 4617408: 37, 1832128: 38, 2913472: 38, 3454144: 38, 1930432: 38, 2946240: 38, 3011776: 38, 4633792: 38, 1307840: 39, 2929856: 39, 1406144: 39, 3028160: 39, 4109504: 39, 783552: 40, 881856: 40, 3044544: 40, 3585216: 40, 799936: 41, 865472: 41, 898240: 41, 3060928: 41, 816320: 42, 849088: 42, 914624: 42, 2536640: 42, 832704: 43, 931008: 43, 2012352: 43, 947392: 44, 1488064: 44, 963776: 45, 14366400: 0, 14366912: 1, 14367424: 2, 14367440: 3, 14367456: 4, 14367472: 5, 14366960: 6, 14367488: 6, 14366448: 7, 14367504: 7, 13891264: 8, 14367520: 8, 13907648: 9, 14367536: 9, 13924032: 10, 14367552: 10, 12285632: 11, 13940416: 11, 14367568: 11, 12302016: 12, 13416128: 12, 14367584: 12, 12318400: 13, 12891840: 13, 14367600: 13, 11794112: 14, 12334784: 14, 12367552: 14, 14367616: 14, 11269824: 15, 12351168: 15, 12383936: 15, 14367632: 15, 10745536: 16, 12400320: 16, 14367648: 16, 10761920: 17, 12416704: 17, 14367136: 17, 10778304: 18, 11892416: 18, 12940992: 18, 14366624: 18, 10794688: 19, 11368128: 19, 13465280: 19, 14071488: 19, 10270400: 20, 10811072: 20, 10843840: 20, 13989568: 20, 14055104: 20, 9746112: 21, 10827456: 21, 10319552: 21, 10860224: 21, 14005952: 21, 14038720: 21, 9221824: 22, 9795264: 22, 10876608: 22, 14022336: 22, 13514432: 22, 9139904: 23, 8697536: 23, 9205440: 23, 9270976: 23, 10892992: 23, 12990144: 23, 9156288: 24, 8173248: 24, 9189056: 24, 8746688: 24, 10909376: 24, 12465856: 24, 9172672: 25, 7648960: 25, 8222400: 25, 10925760: 25, 12482240: 25, 7124672: 26, 7665344: 26, 7698112: 26, 11450048: 26, 12498624: 26, 6600384: 27, 7681728: 27, 7173824: 27, 11974336: 27, 6076096: 28, 6649536: 28, 5994176: 29, 6059712: 29, 6125248: 29, 6010560: 30, 6043328: 30, 5600960: 30, 6026944: 31, 5076672: 31, 5502656: 32, 4552384: 32, 4978368: 33, 4028096: 33, 4568768: 33, 4454080: 34, 3503808: 34, 4585152: 34, 2848448: 35, 4470464: 35, 2979520: 35, 4601536: 35, 2864832: 36, 4486848: 36, 2455232: 36, 2963136: 36, 2995904: 36, 4617920: 36, 2881216: 37, 4503232: 37, 1930944: 37, 2946752: 37, 3012288: 37, 4634304: 37, 2356928: 38, 2897600: 38, 3978944: 38, 1406656: 38, 2930368: 38, 3028672: 38, 4110016: 38, 1832640: 39, 2913984: 39, 3454656: 39, 882368: 39, 3045056: 39, 3585728: 39, 1308352: 40, 865984: 40, 898752: 40, 3061440: 40, 784064: 41, 849600: 41, 915136: 41, 2537152: 41, 800448: 42, 833216: 42, 931520: 42, 2012864: 42, 816832: 43, 947904: 43, 1488576: 43, 964288: 44, 14891200: 0, 14891712: 1, 14891728: 2, 14891744: 3, 14891760: 4, 14891248: 5, 14891776: 5, 14416064: 6, 14891792: 6, 13891776: 7, 14891808: 7, 13908160: 8, 14891824: 8, 13924544: 9, 14891840: 9, 13940928: 10, 14891856: 10, 13416640: 11, 14891872: 11, 12286144: 12, 12892352: 12, 14891888: 12, 12302528: 13, 12368064: 13, 14891904: 13, 12318912: 14, 12351680: 14, 12384448: 14, 14891920: 14, 11794624: 15, 12335296: 15, 12400832: 15, 14891936: 15, 11270336: 16, 12417216: 16, 14891424: 16, 10746048: 17, 11892928: 17, 12941504: 17, 14596288: 17, 10762432: 18, 11368640: 18, 13465792: 18, 14072000: 18, 10778816: 19, 10844352: 19, 13990080: 19, 14055616: 19, 10795200: 20, 10320064: 20, 10827968: 20, 10860736: 20, 14006464: 20, 14039232: 20, 10270912: 21, 10811584: 21, 9795776: 21, 10877120: 21, 14022848: 21, 13514944: 21, 9746624: 22, 9271488: 22, 10893504: 22, 12990656: 22, 9222336: 23, 8747200: 23, 10909888: 23, 12466368: 23, 9140416: 24, 8698048: 24, 9205952: 24, 8222912: 24, 10926272: 24, 12482752: 24, 9156800: 25, 8173760: 25, 9189568: 25, 7698624: 25, 11450560: 25, 12499136: 25, 9173184: 26, 7649472: 26, 7174336: 26, 7682240: 26, 11974848: 26, 7125184: 27, 7665856: 27, 6650048: 27, 6600896: 28, 6125760: 28, 6076608: 29, 5601472: 29, 5994688: 30, 6060224: 30, 5077184: 30, 6011072: 31, 6043840: 31, 4552896: 31, 6027456: 32, 4028608: 32, 4569280: 32, 5503168: 33, 3504320: 33, 4585664: 33, 4978880: 34, 2980032: 34, 4602048: 34, 4454592: 35, 2455744: 35, 2963648: 35, 2996416: 35, 4618432: 35, 2848960: 36, 4470976: 36, 1931456: 36, 2947264: 36, 3012800: 36, 4634816: 36, 2865344: 37, 4487360: 37, 1407168: 37, 2930880: 37, 3029184: 37, 4110528: 37, 2881728: 38, 4503744: 38, 882880: 38, 2914496: 38, 3455168: 38, 3045568: 38, 3586240: 38, 2357440: 39, 2898112: 39, 3979456: 39, 866496: 39, 899264: 39, 3061952: 39, 1833152: 40, 850112: 40, 915648: 40, 2537664: 40, 1308864: 41, 833728: 41, 932032: 41, 2013376: 41, 784576: 42, 817344: 42, 948416: 42, 1489088: 42, 800960: 43, 964800: 43, 15416000: 0, 15416016: 1, 15416032: 2, 15416048: 3, 14940864: 4, 15416064: 4, 14416576: 5, 15416080: 5, 13892288: 6, 15416096: 6, 13908672: 7, 15416112: 7, 13925056: 8, 15416128: 8, 13941440: 9, 15416144: 9, 13417152: 10, 15416160: 10, 12892864: 11, 15416176: 11, 12368576: 12, 15416192: 12, 12286656: 13, 12352192: 13, 12384960: 13, 15416208: 13, 12303040: 14, 12335808: 14, 12401344: 14, 15416224: 14, 12319424: 15, 12417728: 15, 15121088: 15, 11795136: 16, 11893440: 16, 12942016: 16, 14596800: 16, 11270848: 17, 11369152: 17, 13466304: 17, 14072512: 17, 10746560: 18, 10844864: 18, 13990592: 18, 14056128: 18, 10762944: 19, 10320576: 19, 10828480: 19, 10861248: 19, 14006976: 19, 14039744: 19, 10779328: 20, 9796288: 20, 10812096: 20, 10877632: 20, 14023360: 20, 13515456: 20, 10795712: 21, 9272000: 21, 10894016: 21, 12991168: 21, 10271424: 22, 8747712: 22, 10910400: 22, 12466880: 22, 9747136: 23, 8223424: 23, 10926784: 23, 12483264: 23, 9222848: 24, 7699136: 24, 11451072: 24, 12499648: 24, 9140928: 25, 8698560: 25, 9206464: 25, 7174848: 25, 7682752: 25, 11975360: 25, 9157312: 26, 8174272: 26, 9190080: 26, 6650560: 26, 7666368: 26, 9173696: 27, 7649984: 27, 6126272: 27, 7125696: 28, 5601984: 28, 6601408: 29, 5077696: 29, 6077120: 30, 4553408: 30, 5995200: 31, 6060736: 31, 4029120: 31, 4569792: 31, 6011584: 32, 6044352: 32, 3504832: 32, 4586176: 32, 6027968: 33, 2980544: 33, 4602560: 33, 5503680: 34, 2456256: 34, 2964160: 34, 2996928: 34, 4618944: 34, 4979392: 35, 1931968: 35, 2947776: 35, 3013312: 35, 4635328: 35, 4455104: 36, 1407680: 36, 2931392: 36, 3029696: 36, 4111040: 36, 2849472: 37, 4471488: 37, 883392: 37, 2915008: 37, 3455680: 37, 3046080: 37, 3586752: 37, 2865856: 38, 4487872: 38, 867008: 38, 899776: 38, 2898624: 38, 3979968: 38, 3062464: 38, 2882240: 39, 4504256: 39, 850624: 39, 916160: 39, 2538176: 39, 2357952: 40, 834240: 40, 932544: 40, 2013888: 40, 1833664: 41, 817856: 41, 948928: 41, 1489600: 41, 1309376: 42, 801472: 42, 965312: 42, 785088: 43, 2837200: 0, 2837216: 1, 2837232: 2, 2345680: 3, 2837248: 3, 1821392: 4, 2837264: 4, 1297104: 5, 2837280: 5, 772816: 6, 2837792: 6, 2837296: 6, 789200: 7, 2838304: 7, 2837312: 7, 805584: 8, 2838816: 8, 2837328: 8, 821968: 9, 2838800: 9, 2443984: 9, 2837840: 9, 2837344: 9, 838352: 10, 2838784: 10, 1919696: 10, 2838352: 10, 2837360: 10, 854736: 11, 2838768: 11, 1395408: 11, 2838864: 11, 2837376: 11, 871120: 12, 2839280: 12, 2839376: 12, 2838880: 12, 2837392: 12, 887504: 13, 2839792: 13, 2839888: 13, 2838896: 13, 2837408: 13, 2840272: 14, 903888: 14, 2840304: 14, 2840400: 14, 2838912: 14, 2525904: 14, 2837920: 14, 2840288: 15, 920272: 15, 2840320: 15, 2840912: 15, 2838928: 15, 2001616: 15, 2838432: 15, 936656: 16, 2840336: 16, 2841424: 16, 2838944: 16, 1477328: 16, 953040: 17, 2840352: 17, 2841936: 17, 2840864: 18, 2841920: 18, 2842448: 18, 2841376: 19, 2841904: 19, 2842960: 19, 2841888: 20, 2843472: 20, 2842400: 21, 2843984: 21, 2842912: 22, 2844496: 22, 2843424: 23, 2845008: 23, 2843408: 24, 2843936: 24, 2844992: 24, 2845520: 24, 2845024: 24, 2843392: 25, 2844448: 25, 2844976: 25, 2846032: 25, 2845040: 25, 2843344: 26, 2843376: 26, 2844960: 26, 2846544: 26, 2845056: 26, 2843360: 27, 2844944: 27, 2846528: 27, 2847056: 27, 2845072: 27, 2844928: 28, 2846512: 28, 2847568: 28, 2845088: 28, 2844912: 29, 2846496: 29, 2848080: 29, 2845600: 29, 2845424: 30, 2846480: 30, 2847008: 30, 2848096: 30, 2846112: 30, 2845936: 31, 2846464: 31, 2847520: 31, 2848112: 31, 2846624: 31, 2846416: 32, 2846448: 32, 2848032: 32, 2848128: 32, 2846608: 32, 2846432: 33, 2848016: 33, 2847616: 33, 2848144: 33, 2846592: 33, 2848000: 34, 2847104: 34, 2848160: 34, 2847984: 35, 2848672: 35, 2848496: 36, 2849184: 36, 2849008: 37, 2849696: 37, 2849488: 38, 2849520: 38, 2849680: 38, 2849504: 39, 2849536: 39, 2849664: 39, 2849552: 40, 2849648: 40, 2849568: 41, 2849632: 41, 2849584: 42, 2849616: 42, 2849600: 43, 5986000: 0, 5986016: 1, 5986032: 2, 5494480: 3, 5986048: 3, 4970192: 4, 5986064: 4, 4445904: 5, 5986080: 5, 4462288: 6, 5986592: 6, 4478672: 7, 5987104: 7, 4495056: 8, 5987616: 8, 3970768: 9, 5988128: 9, 5987632: 9, 3446480: 10, 5988640: 10, 5987648: 10, 2922192: 11, 5989152: 11, 5987664: 11, 2905808: 12, 2938576: 12, 5989136: 12, 5989664: 12, 5987152: 12, 5988176: 12, 2889424: 13, 2954960: 13, 5989120: 13, 5990176: 13, 5986640: 13, 5988688: 13, 5989072: 14, 2873040: 14, 2971344: 14, 5989104: 14, 5990688: 14, 5986128: 14, 5989200: 14, 2856656: 15, 5989088: 15, 2348752: 15, 2447056: 15, 3495632: 15, 2987728: 15, 5990672: 15, 5990704: 15, 5592784: 15, 5989712: 15, 1824464: 16, 1922768: 16, 4019920: 16, 3004112: 16, 5990656: 16, 5990720: 16, 5068496: 16, 5990224: 16, 1300176: 17, 1398480: 17, 4544208: 17, 3020496: 17, 5990640: 17, 5990736: 17, 775888: 18, 874192: 18, 4560592: 18, 3036880: 18, 5991152: 18, 5991248: 18, 5990752: 18, 792272: 19, 857808: 19, 890576: 19, 4576976: 19, 3053264: 19, 5991664: 19, 5991760: 19, 5990768: 19, 5992144: 20, 808656: 20, 841424: 20, 906960: 20, 4593360: 20, 2528976: 20, 3577552: 20, 5992176: 20, 5992272: 20, 5990784: 20, 5992160: 21, 825040: 21, 923344: 21, 4609744: 21, 2004688: 21, 4101840: 21, 5992192: 21, 5992256: 21, 5992784: 21, 5990800: 21, 939728: 22, 4626128: 22, 1480400: 22, 5992208: 22, 5992240: 22, 5993296: 22, 5990816: 22, 956112: 23, 5992224: 23, 5993808: 23, 5991328: 23, 5992736: 24, 5993824: 24, 5991840: 24, 5993248: 25, 5993840: 25, 5992352: 25, 5993760: 26, 5993856: 26, 5992336: 26, 5993744: 27, 5993344: 27, 5993872: 27, 5992320: 27, 5993728: 28, 5992832: 28, 5993888: 28, 5993712: 29, 5994400: 29, 5994224: 30, 5994912: 30, 5994736: 31, 5995424: 31, 5995216: 32, 5995248: 32, 5995408: 32, 5995232: 33, 5995264: 33, 5995392: 33, 5995280: 34, 5995376: 34, 5995296: 35, 5995360: 35, 5995312: 36, 5995344: 36, 5995328: 37, 9134800: 0, 9134816: 1, 9134832: 2, 9134848: 3, 9134864: 4, 9134880: 5, 8692432: 6, 9135392: 6, 8168144: 7, 9135904: 7, 7643856: 8, 9136416: 8, 7119568: 9, 7660240: 9, 9136400: 9, 9136432: 9, 6595280: 10, 7676624: 10, 9136384: 10, 9136448: 10, 6070992: 11, 7693008: 11, 9136368: 11, 9136464: 11, 6054608: 12, 7168720: 12, 8217296: 12, 9136880: 12, 9135952: 12, 9136976: 12, 9136480: 12, 6038224: 13, 6644432: 13, 8741584: 13, 9137392: 13, 9135440: 13, 9137488: 13, 9136496: 13, 9137872: 14, 6021840: 14, 6120144: 14, 9134928: 14, 9137904: 14, 9138000: 14, 9136512: 14, 6005456: 15, 9137888: 15, 5497552: 15, 5595856: 15, 9137920: 15, 9137984: 15, 9138512: 15, 9136528: 15, 4973264: 16, 5071568: 16, 9137936: 16, 9137968: 16, 9139024: 16, 9136544: 16, 4448976: 17, 4547280: 17, 9137952: 17, 9139536: 17, 9137056: 17, 4465360: 18, 4022992: 18, 4563664: 18, 9138464: 18, 9139552: 18, 9137568: 18, 4481744: 19, 3498704: 19, 4580048: 19, 9138976: 19, 9139568: 19, 9138080: 19, 4498128: 20, 2974416: 20, 4596432: 20, 9139488: 20, 9139584: 20, 9138064: 20, 3973840: 21, 2450128: 21, 2958032: 21, 2990800: 21, 4612816: 21, 9139472: 21, 9139072: 21, 9139600: 21, 9138048: 21, 3449552: 22, 1925840: 22, 2941648: 22, 3007184: 22, 4629200: 22, 9139456: 22, 9138560: 22, 9139616: 22, 2925264: 23, 1401552: 23, 3023568: 23, 4104912: 23, 9139440: 23, 9140128: 23, 2908880: 24, 877264: 24, 3039952: 24, 3580624: 24, 9139952: 24, 9140640: 24, 2892496: 25, 860880: 25, 893648: 25, 3056336: 25, 9140464: 25, 9141152: 25, 9140944: 26, 2876112: 26, 844496: 26, 910032: 26, 2532048: 26, 9140976: 26, 9141136: 26, 2859728: 27, 9140960: 27, 2351824: 27, 828112: 27, 926416: 27, 2007760: 27, 9140992: 27, 9141120: 27, 1827536: 28, 811728: 28, 942800: 28, 1483472: 28, 9141008: 28, 9141104: 28, 1303248: 29, 795344: 29, 959184: 29, 9141024: 29, 9141088: 29, 778960: 30, 9141040: 30, 9141072: 30, 9141056: 31, 12283600: 0, 12283616: 1, 12283632: 2, 11792080: 3, 12283648: 3, 11267792: 4, 12283664: 4, 10743504: 5, 12283680: 5, 10759888: 6, 12284192: 6, 12283696: 6, 10776272: 7, 12284704: 7, 12283712: 7, 10792656: 8, 12285216: 8, 12283728: 8, 10268368: 9, 10809040: 9, 12285200: 9, 11890384: 9, 12284240: 9, 9744080: 10, 10825424: 10, 12285184: 10, 11366096: 10, 12284752: 10, 9219792: 11, 10841808: 11, 12285168: 11, 12285264: 11, 8695504: 12, 9203408: 12, 10317520: 12, 10858192: 12, 12285680: 12, 12285280: 12, 8171216: 13, 9187024: 13, 9793232: 13, 10874576: 13, 12286192: 13, 12285296: 13, 12286672: 14, 7646928: 14, 9170640: 14, 9268944: 14, 10890960: 14, 12286704: 14, 12285312: 14, 9154256: 15, 12286688: 15, 7122640: 15, 7663312: 15, 8744656: 15, 10907344: 15, 12286720: 15, 12284800: 15, 12285328: 15, 6598352: 16, 7679696: 16, 8220368: 16, 10923728: 16, 12286736: 16, 12284288: 16, 12285344: 16, 6074064: 17, 7696080: 17, 11448016: 17, 12286752: 17, 12283776: 17, 12285856: 17, 6057680: 18, 7171792: 18, 11972304: 18, 12286768: 18, 12283792: 18, 12286368: 18, 6041296: 19, 6647504: 19, 12283808: 19, 12286784: 19, 12286880: 19, 6024912: 20, 6123216: 20, 12286800: 20, 12286864: 20, 6008528: 21, 5500624: 21, 5598928: 21, 12286816: 21, 12286848: 21, 4976336: 22, 5074640: 22, 12286832: 22, 4452048: 23, 4550352: 23, 4468432: 24, 4026064: 24, 4566736: 24, 4484816: 25, 3501776: 25, 4583120: 25, 4501200: 26, 2977488: 26, 4599504: 26, 3976912: 27, 2453200: 27, 2961104: 27, 2993872: 27, 4615888: 27, 3452624: 28, 1928912: 28, 2944720: 28, 3010256: 28, 4632272: 28, 2928336: 29, 1404624: 29, 3026640: 29, 4107984: 29, 2911952: 30, 880336: 30, 3043024: 30, 3583696: 30, 2895568: 31, 863952: 31, 896720: 31, 3059408: 31, 2879184: 32, 847568: 32, 913104: 32, 2535120: 32, 2862800: 33, 2354896: 33, 831184: 33, 929488: 33, 2010832: 33, 1830608: 34, 814800: 34, 945872: 34, 1486544: 34, 1306320: 35, 798416: 35, 962256: 35, 782032: 36, 15432400: 0, 15432416: 1, 15432432: 2, 14940880: 3, 15432448: 3, 14416592: 4, 15432464: 4, 13892304: 5, 15432480: 5, 13908688: 6, 15432496: 6, 13925072: 7, 15432512: 7, 13941456: 8, 15432528: 8, 13417168: 9, 15432544: 9, 12892880: 10, 15432560: 10, 12368592: 11, 15432576: 11, 12352208: 12, 12384976: 12, 15432592: 12, 12335824: 13, 12401360: 13, 15432608: 13, 12319440: 14, 12417744: 14, 15121104: 14, 12303056: 15, 11795152: 15, 11893456: 15, 12942032: 15, 14596816: 15, 11270864: 16, 11369168: 16, 13466320: 16, 14072528: 16, 10746576: 17, 10844880: 17, 13990608: 17, 14056144: 17, 10762960: 18, 10320592: 18, 10828496: 18, 10861264: 18, 14006992: 18, 14039760: 18, 10779344: 19, 9796304: 19, 10812112: 19, 10877648: 19, 14023376: 19, 13515472: 19, 10795728: 20, 9272016: 20, 10894032: 20, 12991184: 20, 10271440: 21, 8747728: 21, 10910416: 21, 12466896: 21, 9747152: 22, 8223440: 22, 10926800: 22, 12483280: 22, 9222864: 23, 7699152: 23, 11451088: 23, 12499664: 23, 8698576: 24, 9206480: 24, 7174864: 24, 7682768: 24, 11975376: 24, 8174288: 25, 9190096: 25, 6650576: 25, 7666384: 25, 7650000: 26, 9173712: 26, 6126288: 26, 9157328: 27, 7125712: 27, 5602000: 27, 6601424: 28, 5077712: 28, 6077136: 29, 4553424: 29, 6060752: 30, 4029136: 30, 4569808: 30, 6044368: 31, 3504848: 31, 4586192: 31, 6027984: 32, 2980560: 32, 4602576: 32, 6011600: 33, 5503696: 33, 2456272: 33, 2964176: 33, 2996944: 33, 4618960: 33, 4979408: 34, 1931984: 34, 2947792: 34, 3013328: 34, 4635344: 34, 4455120: 35, 1407696: 35, 2931408: 35, 3029712: 35, 4111056: 35, 4471504: 36, 883408: 36, 2915024: 36, 3455696: 36, 3046096: 36, 3586768: 36, 4487888: 37, 867024: 37, 899792: 37, 2898640: 37, 3979984: 37, 3062480: 37, 4504272: 38, 850640: 38, 916176: 38, 2882256: 38, 2538192: 38, 2865872: 39, 834256: 39, 932560: 39, 2357968: 39, 2013904: 39, 817872: 40, 948944: 40, 1833680: 40, 1489616: 40, 801488: 41, 965328: 41, 1309392: 41, 785104: 42, 2853600: 0, 2853616: 1, 2345696: 2, 2853632: 2, 1821408: 3, 2853648: 3, 1297120: 4, 2853664: 4, 772832: 5, 2854176: 5, 2853680: 5, 789216: 6, 2854688: 6, 2853696: 6, 805600: 7, 2855200: 7, 2853712: 7, 821984: 8, 2855184: 8, 2444000: 8, 2854224: 8, 2853728: 8, 838368: 9, 2855168: 9, 1919712: 9, 2854736: 9, 2853744: 9, 854752: 10, 2855152: 10, 1395424: 10, 2855248: 10, 2853760: 10, 871136: 11, 2855664: 11, 2855760: 11, 2855264: 11, 2853776: 11, 887520: 12, 2856176: 12, 2856272: 12, 2855280: 12, 2853792: 12, 903904: 13, 2856688: 13, 2856784: 13, 2855296: 13, 2525920: 13, 2854304: 13, 920288: 14, 2856672: 14, 2856704: 14, 2857296: 14, 2855312: 14, 2001632: 14, 2854816: 14, 936672: 15, 2856720: 15, 2857808: 15, 2855328: 15, 1477344: 15, 953056: 16, 2856736: 16, 2858320: 16, 2857248: 17, 2858304: 17, 2858832: 17, 2857760: 18, 2858288: 18, 2859344: 18, 2858272: 19, 2859856: 19, 2858784: 20, 2860368: 20, 2859296: 21, 2860880: 21, 2859808: 22, 2861392: 22, 2859792: 23, 2860320: 23, 2861376: 23, 2861904: 23, 2861408: 23, 2859776: 24, 2860832: 24, 2861360: 24, 2862416: 24, 2861424: 24, 2859760: 25, 2861344: 25, 2862928: 25, 2861440: 25, 2859744: 26, 2861328: 26, 2862912: 26, 2863440: 26, 2861456: 26, 2861312: 27, 2862896: 27, 2863952: 27, 2861472: 27, 2861296: 28, 2862880: 28, 2864464: 28, 2861984: 28, 2861808: 29, 2862864: 29, 2863392: 29, 2864480: 29, 2862496: 29, 2862320: 30, 2862848: 30, 2863904: 30, 2864496: 30, 2863008: 30, 2862832: 31, 2864416: 31, 2864512: 31, 2862992: 31, 2862816: 32, 2864400: 32, 2864000: 32, 2864528: 32, 2862976: 32, 2864384: 33, 2863488: 33, 2864544: 33, 2864368: 34, 2865056: 34, 2864880: 35, 2865568: 35, 2865392: 36, 2866080: 36, 2865904: 37, 2866064: 37, 2865888: 38, 2865920: 38, 2866048: 38, 2865936: 39, 2866032: 39, 2865952: 40, 2866016: 40, 2865968: 41, 2866000: 41, 2865984: 42, 6002400: 0, 6002416: 1, 5494496: 2, 6002432: 2, 4970208: 3, 6002448: 3, 4445920: 4, 6002464: 4, 4462304: 5, 6002976: 5, 4478688: 6, 6003488: 6, 4495072: 7, 6004000: 7, 3970784: 8, 6004512: 8, 6004016: 8, 3446496: 9, 6005024: 9, 6004032: 9, 2922208: 10, 6005536: 10, 6004048: 10, 2905824: 11, 2938592: 11, 6005520: 11, 6006048: 11, 6003536: 11, 6004560: 11, 2889440: 12, 2954976: 12, 6005504: 12, 6006560: 12, 6003024: 12, 6005072: 12, 2873056: 13, 2971360: 13, 6005488: 13, 6007072: 13, 6002512: 13, 6005584: 13, 2348768: 14, 2447072: 14, 3495648: 14, 2987744: 14, 6005472: 14, 6007056: 14, 6007088: 14, 5592800: 14, 6006096: 14, 1824480: 15, 1922784: 15, 4019936: 15, 3004128: 15, 6007040: 15, 6007104: 15, 5068512: 15, 6006608: 15, 1300192: 16, 1398496: 16, 4544224: 16, 3020512: 16, 6007024: 16, 6007120: 16, 775904: 17, 874208: 17, 4560608: 17, 3036896: 17, 6007536: 17, 6007632: 17, 6007136: 17, 792288: 18, 857824: 18, 890592: 18, 4576992: 18, 3053280: 18, 6008048: 18, 6008144: 18, 6007152: 18, 808672: 19, 841440: 19, 906976: 19, 4593376: 19, 2528992: 19, 3577568: 19, 6008560: 19, 6008656: 19, 6007168: 19, 825056: 20, 923360: 20, 4609760: 20, 2004704: 20, 4101856: 20, 6008544: 20, 6008576: 20, 6008640: 20, 6009168: 20, 6007184: 20, 939744: 21, 4626144: 21, 1480416: 21, 6008592: 21, 6008624: 21, 6009680: 21, 6007200: 21, 956128: 22, 6008608: 22, 6010192: 22, 6007712: 22, 6009120: 23, 6010208: 23, 6008224: 23, 6009632: 24, 6010224: 24, 6008736: 24, 6010144: 25, 6010240: 25, 6008720: 25, 6010128: 26, 6009728: 26, 6010256: 26, 6008704: 26, 6010112: 27, 6009216: 27, 6010272: 27, 6010096: 28, 6010784: 28, 6010608: 29, 6011296: 29, 6011120: 30, 6011808: 30, 6011632: 31, 6011792: 31, 6011616: 32, 6011648: 32, 6011776: 32, 6011664: 33, 6011760: 33, 6011680: 34, 6011744: 34, 6011696: 35, 6011728: 35, 6011712: 36, 9151200: 0, 9151216: 1, 9151232: 2, 9151248: 3, 9151264: 4, 8692448: 5, 9151776: 5, 8168160: 6, 9152288: 6, 7643872: 7, 9152800: 7, 7119584: 8, 7660256: 8, 9152784: 8, 9152816: 8, 6595296: 9, 7676640: 9, 9152768: 9, 9152832: 9, 6071008: 10, 7693024: 10, 9152752: 10, 9152848: 10, 6054624: 11, 7168736: 11, 8217312: 11, 9153264: 11, 9152336: 11, 9153360: 11, 9152864: 11, 6038240: 12, 6644448: 12, 8741600: 12, 9153776: 12, 9151824: 12, 9153872: 12, 9152880: 12, 6021856: 13, 6120160: 13, 9151312: 13, 9154288: 13, 9154384: 13, 9152896: 13, 5497568: 14, 5595872: 14, 9154272: 14, 9154304: 14, 9154368: 14, 9154896: 14, 9152912: 14, 4973280: 15, 5071584: 15, 9154320: 15, 9154352: 15, 9155408: 15, 9152928: 15, 4448992: 16, 4547296: 16, 9154336: 16, 9155920: 16, 9153440: 16, 4465376: 17, 4023008: 17, 4563680: 17, 9154848: 17, 9155936: 17, 9153952: 17, 4481760: 18, 3498720: 18, 4580064: 18, 9155360: 18, 9155952: 18, 9154464: 18, 4498144: 19, 2974432: 19, 4596448: 19, 9155872: 19, 9155968: 19, 9154448: 19, 3973856: 20, 2450144: 20, 2958048: 20, 2990816: 20, 4612832: 20, 9155856: 20, 9155456: 20, 9155984: 20, 9154432: 20, 3449568: 21, 1925856: 21, 2941664: 21, 3007200: 21, 4629216: 21, 9155840: 21, 9154944: 21, 9156000: 21, 2925280: 22, 1401568: 22, 3023584: 22, 4104928: 22, 9155824: 22, 9156512: 22, 2908896: 23, 877280: 23, 3039968: 23, 3580640: 23, 9156336: 23, 9157024: 23, 2892512: 24, 860896: 24, 893664: 24, 3056352: 24, 9156848: 24, 9157536: 24, 2876128: 25, 844512: 25, 910048: 25, 2532064: 25, 9157360: 25, 9157520: 25, 2351840: 26, 828128: 26, 926432: 26, 2007776: 26, 9157344: 26, 9157376: 26, 9157504: 26, 1827552: 27, 811744: 27, 942816: 27, 1483488: 27, 9157392: 27, 9157488: 27, 1303264: 28, 795360: 28, 959200: 28, 9157408: 28, 9157472: 28, 778976: 29, 9157424: 29, 9157456: 29, 9157440: 30, 12300000: 0, 12300016: 1, 11792096: 2, 12300032: 2, 11267808: 3, 12300048: 3, 10743520: 4, 12300064: 4, 10759904: 5, 12300576: 5, 12300080: 5, 10776288: 6, 12301088: 6, 12300096: 6, 10792672: 7, 12301600: 7, 12300112: 7, 10268384: 8, 10809056: 8, 12301584: 8, 11890400: 8, 12300624: 8, 9744096: 9, 10825440: 9, 12301568: 9, 11366112: 9, 12301136: 9, 9219808: 10, 10841824: 10, 12301552: 10, 12301648: 10, 8695520: 11, 9203424: 11, 10317536: 11, 10858208: 11, 12302064: 11, 12301664: 11, 8171232: 12, 9187040: 12, 9793248: 12, 10874592: 12, 12302576: 12, 12301680: 12, 7646944: 13, 9170656: 13, 9268960: 13, 10890976: 13, 12303088: 13, 12301696: 13, 7122656: 14, 7663328: 14, 8744672: 14, 10907360: 14, 12303072: 14, 12303104: 14, 12301184: 14, 12301712: 14, 6598368: 15, 7679712: 15, 8220384: 15, 10923744: 15, 12303120: 15, 12300672: 15, 12301728: 15, 6074080: 16, 7696096: 16, 11448032: 16, 12303136: 16, 12300160: 16, 12302240: 16, 6057696: 17, 7171808: 17, 11972320: 17, 12303152: 17, 12300176: 17, 12302752: 17, 6041312: 18, 6647520: 18, 12300192: 18, 12303168: 18, 12303264: 18, 6024928: 19, 6123232: 19, 12303184: 19, 12303248: 19, 5500640: 20, 5598944: 20, 12303200: 20, 12303232: 20, 4976352: 21, 5074656: 21, 12303216: 21, 4452064: 22, 4550368: 22, 4468448: 23, 4026080: 23, 4566752: 23, 4484832: 24, 3501792: 24, 4583136: 24, 4501216: 25, 2977504: 25, 4599520: 25, 3976928: 26, 2453216: 26, 2961120: 26, 2993888: 26, 4615904: 26, 3452640: 27, 1928928: 27, 2944736: 27, 3010272: 27, 4632288: 27, 2928352: 28, 1404640: 28, 3026656: 28, 4108000: 28, 2911968: 29, 880352: 29, 3043040: 29, 3583712: 29, 2895584: 30, 863968: 30, 896736: 30, 3059424: 30, 2879200: 31, 847584: 31, 913120: 31, 2535136: 31, 2354912: 32, 831200: 32, 929504: 32, 2010848: 32, 1830624: 33, 814816: 33, 945888: 33, 1486560: 33, 1306336: 34, 798432: 34, 962272: 34, 782048: 35, 15448800: 0, 15448816: 1, 14940896: 2, 15448832: 2, 14416608: 3, 15448848: 3, 13892320: 4, 15448864: 4, 13908704: 5, 15448880: 5, 13925088: 6, 15448896: 6, 13941472: 7, 15448912: 7, 13417184: 8, 15448928: 8, 12892896: 9, 15448944: 9, 12368608: 10, 15448960: 10, 12352224: 11, 12384992: 11, 15448976: 11, 12335840: 12, 12401376: 12, 15448992: 12, 12319456: 13, 12417760: 13, 15121120: 13, 11795168: 14, 11893472: 14, 12942048: 14, 14596832: 14, 11270880: 15, 11369184: 15, 13466336: 15, 14072544: 15, 10746592: 16, 10844896: 16, 13990624: 16, 14056160: 16, 10762976: 17, 10320608: 17, 10828512: 17, 10861280: 17, 14007008: 17, 14039776: 17, 10779360: 18, 9796320: 18, 10812128: 18, 10877664: 18, 14023392: 18, 13515488: 18, 10795744: 19, 9272032: 19, 10894048: 19, 12991200: 19, 10271456: 20, 8747744: 20, 10910432: 20, 12466912: 20, 9747168: 21, 8223456: 21, 10926816: 21, 12483296: 21, 9222880: 22, 7699168: 22, 11451104: 22, 12499680: 22, 8698592: 23, 9206496: 23, 7174880: 23, 7682784: 23, 11975392: 23, 8174304: 24, 9190112: 24, 6650592: 24, 7666400: 24, 7650016: 25, 9173728: 25, 6126304: 25, 7125728: 26, 5602016: 26, 6601440: 27, 5077728: 27, 6077152: 28, 4553440: 28, 6060768: 29, 4029152: 29, 4569824: 29, 6044384: 30, 3504864: 30, 4586208: 30, 6028000: 31, 2980576: 31, 4602592: 31, 5503712: 32, 2456288: 32, 2964192: 32, 2996960: 32, 4618976: 32, 4979424: 33, 1932000: 33, 2947808: 33, 3013344: 33, 4635360: 33, 4455136: 34, 1407712: 34, 2931424: 34, 3029728: 34, 4111072: 34, 4471520: 35, 883424: 35, 2915040: 35, 3455712: 35, 3046112: 35, 3586784: 35, 4487904: 36, 867040: 36, 899808: 36, 2898656: 36, 3980000: 36, 3062496: 36, 4504288: 37, 850656: 37, 916192: 37, 2882272: 37, 2538208: 37, 834272: 38, 932576: 38, 2357984: 38, 2013920: 38, 817888: 39, 948960: 39, 1833696: 39, 1489632: 39, 801504: 40, 965344: 40, 1309408: 40, 785120: 41, 770800: 0, 771312: 1, 770816: 1, 771824: 2, 770832: 2, 772336: 3, 770848: 3, 772848: 4, 770864: 4, 772864: 5, 770880: 5, 772880: 6, 770896: 6, 772896: 7, 771408: 7, 770912: 7, 773408: 8, 772912: 8, 771920: 8, 770928: 8, 773920: 9, 772928: 9, 772432: 9, 770944: 9, 774432: 10, 772944: 10, 770960: 10, 774416: 11, 773456: 11, 772960: 11, 770976: 11, 774400: 12, 773968: 12, 772976: 12, 771488: 12, 774384: 13, 774480: 13, 772992: 13, 772000: 13, 774896: 14, 774992: 14, 774496: 14, 773008: 14, 772512: 14, 775408: 15, 775504: 15, 774512: 15, 773024: 15, 775920: 16, 776016: 16, 774528: 16, 773536: 16, 775936: 17, 776528: 17, 774544: 17, 774048: 17, 775952: 18, 777040: 18, 774560: 18, 775968: 19, 777552: 19, 776480: 20, 777536: 20, 778064: 20, 776992: 21, 777520: 21, 778576: 21, 777504: 22, 779088: 22, 778016: 23, 779600: 23, 778528: 24, 780112: 24, 779040: 25, 780624: 25, 779024: 26, 779552: 26, 780608: 26, 781136: 26, 780640: 26, 779008: 27, 780064: 27, 780592: 27, 781648: 27, 780656: 27, 778992: 28, 780576: 28, 782160: 28, 780672: 28, 780560: 29, 782144: 29, 782672: 29, 780688: 29, 780544: 30, 782128: 30, 783184: 30, 780704: 30, 780528: 31, 782112: 31, 783696: 31, 781216: 31, 781040: 32, 782096: 32, 782624: 32, 783712: 32, 781728: 32, 781552: 33, 782080: 33, 783136: 33, 783728: 33, 782240: 33, 782064: 34, 783648: 34, 783744: 34, 782224: 34, 783632: 35, 783232: 35, 783760: 35, 782208: 35, 783616: 36, 782720: 36, 783776: 36, 783600: 37, 784288: 37, 784112: 38, 784800: 38, 784624: 39, 785312: 39, 785136: 40, 785296: 40, 785152: 41, 785280: 41, 785168: 42, 785264: 42, 785184: 43, 785248: 43, 785200: 44, 785232: 44, 785216: 45, 1295600: 0, 1296112: 1, 787696: 2, 1296624: 2, 804080: 3, 1297136: 3, 820464: 4, 1297152: 4, 836848: 5, 1297168: 5, 853232: 6, 1297184: 6, 869616: 7, 1297696: 7, 1297200: 7, 1295696: 8, 886000: 8, 1298208: 8, 1297216: 8, 1296208: 9, 902384: 9, 1298720: 9, 1297232: 9, 1296720: 10, 918768: 10, 1298704: 10, 1297744: 10, 1297248: 10, 935152: 11, 1298688: 11, 1298256: 11, 1297264: 11, 951536: 12, 1298672: 12, 1298768: 12, 1297280: 12, 1295776: 13, 1299184: 13, 1299280: 13, 1298784: 13, 1297296: 13, 1296288: 14, 1299696: 14, 1299792: 14, 1298800: 14, 1297312: 14, 1296800: 15, 1300208: 15, 1300304: 15, 1298816: 15, 1297824: 15, 1300224: 16, 1300816: 16, 1298832: 16, 1298336: 16, 1300240: 17, 1301328: 17, 1298848: 17, 1300256: 18, 1301840: 18, 1300768: 19, 1301824: 19, 1302352: 19, 1301280: 20, 1301808: 20, 1302864: 20, 1301792: 21, 1303376: 21, 1302304: 22, 1303888: 22, 1302816: 23, 1304400: 23, 1303328: 24, 1304912: 24, 1303312: 25, 1303840: 25, 1304896: 25, 1305424: 25, 1304928: 25, 1303296: 26, 1304352: 26, 1304880: 26, 1305936: 26, 1304944: 26, 1303280: 27, 1304864: 27, 1306448: 27, 1304960: 27, 1304848: 28, 1306432: 28, 1306960: 28, 1304976: 28, 1304832: 29, 1306416: 29, 1307472: 29, 1304992: 29, 1304816: 30, 1306400: 30, 1307984: 30, 1305504: 30, 1305328: 31, 1306384: 31, 1306912: 31, 1308000: 31, 1306016: 31, 1305840: 32, 1306368: 32, 1307424: 32, 1308016: 32, 1306528: 32, 1306352: 33, 1307936: 33, 1308032: 33, 1306512: 33, 1307920: 34, 1307520: 34, 1308048: 34, 1306496: 34, 1307904: 35, 1307008: 35, 1308064: 35, 1307888: 36, 1308576: 36, 1308400: 37, 1309088: 37, 1308912: 38, 1309600: 38, 1309424: 39, 1309584: 39, 1309440: 40, 1309568: 40, 1309456: 41, 1309552: 41, 1309472: 42, 1309536: 42, 1309488: 43, 1309520: 43, 1309504: 44, 1820400: 0, 1820912: 1, 1821424: 2, 788208: 3, 1821440: 3, 804592: 4, 1821456: 4, 820976: 5, 1821472: 5, 837360: 6, 1821984: 6, 1821488: 6, 853744: 7, 1822496: 7, 1821504: 7, 870128: 8, 1823008: 8, 1821520: 8, 1394416: 9, 886512: 9, 1822992: 9, 1821008: 9, 1822032: 9, 1821536: 9, 1820496: 10, 902896: 10, 1822976: 10, 1822544: 10, 1821552: 10, 919280: 11, 1822960: 11, 1823056: 11, 1821568: 11, 935664: 12, 1823472: 12, 1823568: 12, 1823072: 12, 1821584: 12, 952048: 13, 1823984: 13, 1824080: 13, 1823088: 13, 1821600: 13, 1476336: 14, 1824496: 14, 1824592: 14, 1823104: 14, 1821088: 14, 1822112: 14, 1820576: 15, 1824512: 15, 1825104: 15, 1823120: 15, 1822624: 15, 1824528: 16, 1825616: 16, 1823136: 16, 1824544: 17, 1826128: 17, 1825056: 18, 1826112: 18, 1826640: 18, 1825568: 19, 1826096: 19, 1827152: 19, 1826080: 20, 1827664: 20, 1826592: 21, 1828176: 21, 1827104: 22, 1828688: 22, 1827616: 23, 1829200: 23, 1827600: 24, 1828128: 24, 1829184: 24, 1829712: 24, 1829216: 24, 1827584: 25, 1828640: 25, 1829168: 25, 1830224: 25, 1829232: 25, 1827568: 26, 1829152: 26, 1830736: 26, 1829248: 26, 1829136: 27, 1830720: 27, 1831248: 27, 1829264: 27, 1829120: 28, 1830704: 28, 1831760: 28, 1829280: 28, 1829104: 29, 1830688: 29, 1832272: 29, 1829792: 29, 1829616: 30, 1830672: 30, 1831200: 30, 1832288: 30, 1830304: 30, 1830128: 31, 1830656: 31, 1831712: 31, 1832304: 31, 1830816: 31, 1830640: 32, 1832224: 32, 1832320: 32, 1830800: 32, 1832208: 33, 1831808: 33, 1832336: 33, 1830784: 33, 1832192: 34, 1831296: 34, 1832352: 34, 1832176: 35, 1832864: 35, 1832688: 36, 1833376: 36, 1833200: 37, 1833888: 37, 1833712: 38, 1833872: 38, 1833728: 39, 1833856: 39, 1833744: 40, 1833840: 40, 1833760: 41, 1833824: 41, 1833776: 42, 1833808: 42, 1833792: 43, 2345200: 0, 2345712: 1, 2345728: 2, 2345744: 3, 788720: 4, 2345760: 4, 805104: 5, 2346272: 5, 2345776: 5, 821488: 6, 2346784: 6, 2345792: 6, 837872: 7, 2347296: 7, 2345808: 7, 854256: 8, 2347280: 8, 2345296: 8, 2346320: 8, 2345824: 8, 870640: 9, 2347264: 9, 1919216: 9, 2346832: 9, 2345840: 9, 1394928: 10, 887024: 10, 2347248: 10, 2347344: 10, 2345856: 10, 903408: 11, 2347760: 11, 2347856: 11, 2347360: 11, 2345872: 11, 919792: 12, 2348272: 12, 2348368: 12, 2347376: 12, 2345888: 12, 936176: 13, 2348784: 13, 2348880: 13, 2347392: 13, 2345376: 13, 2346400: 13, 952560: 14, 2348800: 14, 2349392: 14, 2347408: 14, 2001136: 14, 2346912: 14, 1476848: 15, 2348816: 15, 2349904: 15, 2347424: 15, 2348832: 16, 2350416: 16, 2349344: 17, 2350400: 17, 2350928: 17, 2349856: 18, 2350384: 18, 2351440: 18, 2350368: 19, 2351952: 19, 2350880: 20, 2352464: 20, 2351392: 21, 2352976: 21, 2351904: 22, 2353488: 22, 2351888: 23, 2352416: 23, 2353472: 23, 2354000: 23, 2353504: 23, 2351872: 24, 2352928: 24, 2353456: 24, 2354512: 24, 2353520: 24, 2351856: 25, 2353440: 25, 2355024: 25, 2353536: 25, 2353424: 26, 2355008: 26, 2355536: 26, 2353552: 26, 2353408: 27, 2354992: 27, 2356048: 27, 2353568: 27, 2353392: 28, 2354976: 28, 2356560: 28, 2354080: 28, 2353904: 29, 2354960: 29, 2355488: 29, 2356576: 29, 2354592: 29, 2354416: 30, 2354944: 30, 2356000: 30, 2356592: 30, 2355104: 30, 2354928: 31, 2356512: 31, 2356608: 31, 2355088: 31, 2356496: 32, 2356096: 32, 2356624: 32, 2355072: 32, 2356480: 33, 2355584: 33, 2356640: 33, 2356464: 34, 2357152: 34, 2356976: 35, 2357664: 35, 2357488: 36, 2358176: 36, 2358000: 37, 2358160: 37, 2358016: 38, 2358144: 38, 2358032: 39, 2358128: 39, 2358048: 40, 2358112: 40, 2358064: 41, 2358096: 41, 2358080: 42, 2870000: 0, 2870016: 1, 2870032: 2, 2870048: 3, 2870560: 4, 2870064: 4, 789232: 5, 2871072: 5, 2870080: 5, 805616: 6, 2871584: 6, 2870096: 6, 822000: 7, 2871568: 7, 2444016: 7, 2870608: 7, 2870112: 7, 838384: 8, 2871552: 8, 1919728: 8, 2871120: 8, 2870128: 8, 854768: 9, 2871536: 9, 1395440: 9, 2871632: 9, 2870144: 9, 871152: 10, 2872048: 10, 2872144: 10, 2871648: 10, 2870160: 10, 887536: 11, 2872560: 11, 2872656: 11, 2871664: 11, 2870176: 11, 903920: 12, 2873072: 12, 2873168: 12, 2871680: 12, 2525936: 12, 2870688: 12, 920304: 13, 2873088: 13, 2873680: 13, 2871696: 13, 2001648: 13, 2871200: 13, 936688: 14, 2873104: 14, 2874192: 14, 2871712: 14, 1477360: 14, 953072: 15, 2873120: 15, 2874704: 15, 2873632: 16, 2874688: 16, 2875216: 16, 2874144: 17, 2874672: 17, 2875728: 17, 2874656: 18, 2876240: 18, 2875168: 19, 2876752: 19, 2875680: 20, 2877264: 20, 2876192: 21, 2877776: 21, 2876176: 22, 2876704: 22, 2877760: 22, 2878288: 22, 2877792: 22, 2876160: 23, 2877216: 23, 2877744: 23, 2878800: 23, 2877808: 23, 2876144: 24, 2877728: 24, 2879312: 24, 2877824: 24, 2877712: 25, 2879296: 25, 2879824: 25, 2877840: 25, 2877696: 26, 2879280: 26, 2880336: 26, 2877856: 26, 2877680: 27, 2879264: 27, 2880848: 27, 2878368: 27, 2878192: 28, 2879248: 28, 2879776: 28, 2880864: 28, 2878880: 28, 2878704: 29, 2879232: 29, 2880288: 29, 2880880: 29, 2879392: 29, 2879216: 30, 2880800: 30, 2880896: 30, 2879376: 30, 2880784: 31, 2880384: 31, 2880912: 31, 2879360: 31, 2880768: 32, 2879872: 32, 2880928: 32, 2880752: 33, 2881440: 33, 2881264: 34, 2881952: 34, 2881776: 35, 2882464: 35, 2882288: 36, 2882448: 36, 2882304: 37, 2882432: 37, 2882320: 38, 2882416: 38, 2882336: 39, 2882400: 39, 2882352: 40, 2882384: 40, 2882368: 41, 4444400: 0, 4444912: 1, 4444416: 1, 4445424: 2, 4444432: 2, 4445936: 3, 4444448: 3, 4445952: 4, 3969264: 4, 4445968: 5, 3444976: 5, 4445984: 6, 2920688: 6, 4446496: 7, 2904304: 7, 2937072: 7, 4447008: 8, 2887920: 8, 2953456: 8, 4447520: 9, 2969840: 9, 4448032: 10, 4447536: 10, 2445552: 10, 3494128: 10, 2986224: 10, 4448544: 11, 4447552: 11, 1921264: 11, 4018416: 11, 3002608: 11, 4449056: 12, 4447568: 12, 1396976: 12, 4444496: 12, 3018992: 12, 4449040: 13, 4449568: 13, 4447056: 13, 4448080: 13, 872688: 13, 4445008: 13, 4444512: 13, 3035376: 13, 4449024: 14, 4450080: 14, 4446544: 14, 4448592: 14, 790768: 14, 856304: 14, 889072: 14, 4445520: 14, 4444528: 14, 3051760: 14, 4449008: 15, 4450592: 15, 4446032: 15, 4449104: 15, 807152: 15, 839920: 15, 905456: 15, 4444544: 15, 2527472: 15, 3576048: 15, 4450576: 16, 4450608: 16, 4449616: 16, 823536: 16, 921840: 16, 4444560: 16, 2003184: 16, 4100336: 16, 4450560: 17, 4450624: 17, 4450128: 17, 938224: 17, 4444576: 17, 1478896: 17, 4450544: 18, 4450640: 18, 954608: 18, 4451056: 19, 4451152: 19, 4450656: 19, 4451568: 20, 4451664: 20, 4450672: 20, 4452080: 21, 4452176: 21, 4450688: 21, 4452096: 22, 4452160: 22, 4452688: 22, 4450704: 22, 4452112: 23, 4452144: 23, 4453200: 23, 4450720: 23, 4452128: 24, 4453712: 24, 4451232: 24, 4452640: 25, 4453728: 25, 4451744: 25, 4453152: 26, 4453744: 26, 4452256: 26, 4453664: 27, 4453760: 27, 4452240: 27, 4453648: 28, 4453248: 28, 4453776: 28, 4452224: 28, 4453632: 29, 4452736: 29, 4453792: 29, 4453616: 30, 4454304: 30, 4454128: 31, 4454816: 31, 4454640: 32, 4455328: 32, 4455152: 33, 4455312: 33, 4455168: 34, 4455296: 34, 4455184: 35, 4455280: 35, 4455200: 36, 4455264: 36, 4455216: 37, 4455248: 37, 4455232: 38, 4969200: 0, 4969712: 1, 4461296: 2, 4970224: 2, 4477680: 3, 4970240: 3, 4494064: 4, 4970256: 4, 3969776: 5, 4970272: 5, 3445488: 6, 4970784: 6, 2921200: 7, 4971296: 7, 2904816: 8, 2937584: 8, 4971808: 8, 2888432: 9, 2953968: 9, 4972320: 9, 4971824: 9, 2970352: 10, 4972832: 10, 4971840: 10, 2446064: 11, 3494640: 11, 2986736: 11, 4973344: 11, 4971856: 11, 1921776: 12, 4018928: 12, 3003120: 12, 4973328: 12, 4973856: 12, 4971344: 12, 4972368: 12, 1397488: 13, 4543216: 13, 3019504: 13, 4973312: 13, 4974368: 13, 4970832: 13, 4972880: 13, 873200: 14, 4969296: 14, 4559600: 14, 3035888: 14, 4973296: 14, 4974880: 14, 4970320: 14, 4973392: 14, 791280: 15, 856816: 15, 889584: 15, 4969808: 15, 4575984: 15, 3052272: 15, 4974864: 15, 4974896: 15, 4973904: 15, 807664: 16, 840432: 16, 905968: 16, 4592368: 16, 2527984: 16, 3576560: 16, 4974848: 16, 4974912: 16, 4974416: 16, 824048: 17, 922352: 17, 4608752: 17, 2003696: 17, 4100848: 17, 4974832: 17, 4974928: 17, 938736: 18, 4625136: 18, 1479408: 18, 4975344: 18, 4975440: 18, 4974944: 18, 955120: 19, 4975856: 19, 4975952: 19, 4974960: 19, 4976368: 20, 4976464: 20, 4974976: 20, 4976384: 21, 4976448: 21, 4976976: 21, 4974992: 21, 4976400: 22, 4976432: 22, 4977488: 22, 4975008: 22, 4976416: 23, 4978000: 23, 4975520: 23, 4976928: 24, 4978016: 24, 4976032: 24, 4977440: 25, 4978032: 25, 4976544: 25, 4977952: 26, 4978048: 26, 4976528: 26, 4977936: 27, 4977536: 27, 4978064: 27, 4976512: 27, 4977920: 28, 4977024: 28, 4978080: 28, 4977904: 29, 4978592: 29, 4978416: 30, 4979104: 30, 4978928: 31, 4979616: 31, 4979440: 32, 4979600: 32, 4979456: 33, 4979584: 33, 4979472: 34, 4979568: 34, 4979488: 35, 4979552: 35, 4979504: 36, 4979536: 36, 4979520: 37, 5494000: 0, 5494512: 1, 5494528: 2, 4461808: 3, 5494544: 3, 4478192: 4, 5494560: 4, 4494576: 5, 5495072: 5, 3970288: 6, 5495584: 6, 3446000: 7, 5496096: 7, 2921712: 8, 5496608: 8, 5496112: 8, 2905328: 9, 2938096: 9, 5497120: 9, 5496128: 9, 2888944: 10, 2954480: 10, 5497632: 10, 5496144: 10, 2970864: 11, 5497616: 11, 5498144: 11, 5495632: 11, 5496656: 11, 2446576: 12, 3495152: 12, 2987248: 12, 5497600: 12, 5498656: 12, 5495120: 12, 5497168: 12, 1922288: 13, 4019440: 13, 3003632: 13, 5497584: 13, 5499168: 13, 5494608: 13, 5497680: 13, 1398000: 14, 4543728: 14, 3020016: 14, 5499152: 14, 5499184: 14, 5494096: 14, 5498192: 14, 873712: 15, 5068016: 15, 4560112: 15, 3036400: 15, 5499136: 15, 5499200: 15, 5498704: 15, 791792: 16, 857328: 16, 890096: 16, 4576496: 16, 3052784: 16, 5499120: 16, 5499216: 16, 808176: 17, 840944: 17, 906480: 17, 4592880: 17, 2528496: 17, 3577072: 17, 5499632: 17, 5499728: 17, 5499232: 17, 824560: 18, 922864: 18, 4609264: 18, 2004208: 18, 4101360: 18, 5500144: 18, 5500240: 18, 5499248: 18, 939248: 19, 4625648: 19, 1479920: 19, 5500656: 19, 5500752: 19, 5499264: 19, 955632: 20, 5500672: 20, 5500736: 20, 5501264: 20, 5499280: 20, 5500688: 21, 5500720: 21, 5501776: 21, 5499296: 21, 5500704: 22, 5502288: 22, 5499808: 22, 5501216: 23, 5502304: 23, 5500320: 23, 5501728: 24, 5502320: 24, 5500832: 24, 5502240: 25, 5502336: 25, 5500816: 25, 5502224: 26, 5501824: 26, 5502352: 26, 5500800: 26, 5502208: 27, 5501312: 27, 5502368: 27, 5502192: 28, 5502880: 28, 5502704: 29, 5503392: 29, 5503216: 30, 5503904: 30, 5503728: 31, 5503888: 31, 5503744: 32, 5503872: 32, 5503760: 33, 5503856: 33, 5503776: 34, 5503840: 34, 5503792: 35, 5503824: 35, 5503808: 36, 6018800: 0, 6018816: 1, 6018832: 2, 6018848: 3, 4462320: 4, 6019360: 4, 4478704: 5, 6019872: 5, 4495088: 6, 6020384: 6, 3970800: 7, 6020896: 7, 6020400: 7, 3446512: 8, 6021408: 8, 6020416: 8, 2922224: 9, 6021920: 9, 6020432: 9, 2905840: 10, 2938608: 10, 6021904: 10, 6022432: 10, 6019920: 10, 6020944: 10, 2889456: 11, 2954992: 11, 6021888: 11, 6022944: 11, 6019408: 11, 6021456: 11, 2971376: 12, 6021872: 12, 6023456: 12, 6018896: 12, 6021968: 12, 2447088: 13, 3495664: 13, 2987760: 13, 6023440: 13, 6023472: 13, 5592816: 13, 6022480: 13, 1922800: 14, 4019952: 14, 3004144: 14, 6023424: 14, 6023488: 14, 5068528: 14, 6022992: 14, 1398512: 15, 4544240: 15, 3020528: 15, 6023408: 15, 6023504: 15, 874224: 16, 4560624: 16, 3036912: 16, 6023920: 16, 6024016: 16, 6023520: 16, 792304: 17, 857840: 17, 890608: 17, 4577008: 17, 3053296: 17, 6024432: 17, 6024528: 17, 6023536: 17, 808688: 18, 841456: 18, 906992: 18, 4593392: 18, 2529008: 18, 3577584: 18, 6024944: 18, 6025040: 18, 6023552: 18, 825072: 19, 923376: 19, 4609776: 19, 2004720: 19, 4101872: 19, 6024960: 19, 6025024: 19, 6025552: 19, 6023568: 19, 939760: 20, 4626160: 20, 1480432: 20, 6024976: 20, 6025008: 20, 6026064: 20, 6023584: 20, 956144: 21, 6024992: 21, 6026576: 21, 6024096: 21, 6025504: 22, 6026592: 22, 6024608: 22, 6026016: 23, 6026608: 23, 6025120: 23, 6026528: 24, 6026624: 24, 6025104: 24, 6026512: 25, 6026112: 25, 6026640: 25, 6025088: 25, 6026496: 26, 6025600: 26, 6026656: 26, 6026480: 27, 6027168: 27, 6026992: 28, 6027680: 28, 6027504: 29, 6028192: 29, 6028016: 30, 6028176: 30, 6028032: 31, 6028160: 31, 6028048: 32, 6028144: 32, 6028064: 33, 6028128: 33, 6028080: 34, 6028112: 34, 6028096: 35, 9167600: 0, 9167616: 1, 9167632: 2, 9167648: 3, 8692464: 4, 9168160: 4, 8168176: 5, 9168672: 5, 7643888: 6, 9169184: 6, 7119600: 7, 7660272: 7, 9169168: 7, 9169200: 7, 6595312: 8, 7676656: 8, 9169152: 8, 9169216: 8, 6071024: 9, 7693040: 9, 9169136: 9, 9169232: 9, 6054640: 10, 7168752: 10, 8217328: 10, 9169648: 10, 9168720: 10, 9169744: 10, 9169248: 10, 6038256: 11, 6644464: 11, 8741616: 11, 9170160: 11, 9168208: 11, 9170256: 11, 9169264: 11, 6120176: 12, 9167696: 12, 9170672: 12, 9170768: 12, 9169280: 12, 5595888: 13, 9170688: 13, 9170752: 13, 9171280: 13, 9169296: 13, 5071600: 14, 9170704: 14, 9170736: 14, 9171792: 14, 9169312: 14, 4547312: 15, 9170720: 15, 9172304: 15, 9169824: 15, 4465392: 16, 4023024: 16, 4563696: 16, 9171232: 16, 9172320: 16, 9170336: 16, 4481776: 17, 3498736: 17, 4580080: 17, 9171744: 17, 9172336: 17, 9170848: 17, 4498160: 18, 2974448: 18, 4596464: 18, 9172256: 18, 9172352: 18, 9170832: 18, 3973872: 19, 2450160: 19, 2958064: 19, 2990832: 19, 4612848: 19, 9172240: 19, 9171840: 19, 9172368: 19, 9170816: 19, 3449584: 20, 1925872: 20, 2941680: 20, 3007216: 20, 4629232: 20, 9172224: 20, 9171328: 20, 9172384: 20, 2925296: 21, 1401584: 21, 3023600: 21, 4104944: 21, 9172208: 21, 9172896: 21, 2908912: 22, 877296: 22, 3039984: 22, 3580656: 22, 9172720: 22, 9173408: 22, 2892528: 23, 860912: 23, 893680: 23, 3056368: 23, 9173232: 23, 9173920: 23, 844528: 24, 910064: 24, 2532080: 24, 9173744: 24, 9173904: 24, 828144: 25, 926448: 25, 2007792: 25, 9173760: 25, 9173888: 25, 811760: 26, 942832: 26, 1483504: 26, 9173776: 26, 9173872: 26, 795376: 27, 959216: 27, 9173792: 27, 9173856: 27, 9173808: 28, 9173840: 28, 9173824: 29, 10742000: 0, 10742512: 1, 10742016: 1, 10743024: 2, 10742032: 2, 10743536: 3, 10742048: 3, 10743552: 4, 10266864: 4, 10742064: 4, 10743568: 5, 9742576: 5, 10742080: 5, 10743584: 6, 9218288: 6, 10742096: 6, 10744096: 7, 10743600: 7, 8694000: 7, 9201904: 7, 10316016: 7, 10742608: 7, 10742112: 7, 10744608: 8, 10743616: 8, 8169712: 8, 9185520: 8, 9791728: 8, 10743120: 8, 10742128: 8, 10745120: 9, 10743632: 9, 7645424: 9, 9267440: 9, 10742144: 9, 10745104: 10, 10744144: 10, 7121136: 10, 7661808: 10, 8743152: 10, 10742160: 10, 10745088: 11, 10744656: 11, 6596848: 11, 7678192: 11, 8218864: 11, 10742176: 11, 10745072: 12, 10745168: 12, 6072560: 12, 7694576: 12, 10742688: 12, 10745584: 13, 10745184: 13, 6056176: 13, 7170288: 13, 10743200: 13, 10746096: 14, 10745200: 14, 6039792: 14, 6646000: 14, 10743712: 14, 10746608: 15, 10745216: 15, 6121712: 15, 10743696: 15, 10746624: 16, 10744704: 16, 10745232: 16, 5597424: 16, 10743680: 16, 10746640: 17, 10744192: 17, 10745248: 17, 5073136: 17, 10746656: 18, 10745760: 18, 4548848: 18, 10746672: 19, 10746272: 19, 4466928: 19, 4024560: 19, 4565232: 19, 10746688: 20, 10746784: 20, 4483312: 20, 3500272: 20, 4581616: 20, 10746704: 21, 10746768: 21, 4499696: 21, 2975984: 21, 4598000: 21, 10746720: 22, 10746752: 22, 3975408: 22, 2451696: 22, 2959600: 22, 2992368: 22, 4614384: 22, 10746736: 23, 3451120: 23, 1927408: 23, 2943216: 23, 3008752: 23, 4630768: 23, 2926832: 24, 1403120: 24, 3025136: 24, 4106480: 24, 2910448: 25, 878832: 25, 3041520: 25, 3582192: 25, 2894064: 26, 862448: 26, 895216: 26, 3057904: 26, 846064: 27, 911600: 27, 2533616: 27, 829680: 28, 927984: 28, 2009328: 28, 813296: 29, 944368: 29, 1485040: 29, 796912: 30, 960752: 30, 11266800: 0, 11267312: 1, 10758896: 2, 11267824: 2, 10775280: 3, 11267840: 3, 10791664: 4, 11267856: 4, 10267376: 5, 10808048: 5, 11267872: 5, 9743088: 6, 10824432: 6, 11268384: 6, 11267888: 6, 9218800: 7, 10840816: 7, 11268896: 7, 11267904: 7, 8694512: 8, 9202416: 8, 10316528: 8, 11266896: 8, 10857200: 8, 11269408: 8, 11267920: 8, 8170224: 9, 9186032: 9, 9792240: 9, 11267408: 9, 10873584: 9, 11269392: 9, 11268432: 9, 7645936: 10, 9267952: 10, 10889968: 10, 11269376: 10, 11268944: 10, 7121648: 11, 7662320: 11, 8743664: 11, 10906352: 11, 11269360: 11, 11269456: 11, 6597360: 12, 7678704: 12, 8219376: 12, 10922736: 12, 11269872: 12, 11269472: 12, 6073072: 13, 7695088: 13, 11266976: 13, 11270384: 13, 11269488: 13, 6056688: 14, 7170800: 14, 11267488: 14, 11270896: 14, 11269504: 14, 6040304: 15, 6646512: 15, 11268000: 15, 11270912: 15, 11268992: 15, 11269520: 15, 6122224: 16, 11267984: 16, 11270928: 16, 11268480: 16, 11269536: 16, 5597936: 17, 11267968: 17, 11270944: 17, 11270048: 17, 5073648: 18, 11270960: 18, 11270560: 18, 4549360: 19, 11270976: 19, 11271072: 19, 4467440: 20, 4025072: 20, 4565744: 20, 11270992: 20, 11271056: 20, 4483824: 21, 3500784: 21, 4582128: 21, 11271008: 21, 11271040: 21, 4500208: 22, 2976496: 22, 4598512: 22, 11271024: 22, 3975920: 23, 2452208: 23, 2960112: 23, 2992880: 23, 4614896: 23, 3451632: 24, 1927920: 24, 2943728: 24, 3009264: 24, 4631280: 24, 2927344: 25, 1403632: 25, 3025648: 25, 4106992: 25, 2910960: 26, 879344: 26, 3042032: 26, 3582704: 26, 2894576: 27, 862960: 27, 895728: 27, 3058416: 27, 846576: 28, 912112: 28, 2534128: 28, 830192: 29, 928496: 29, 2009840: 29, 813808: 30, 944880: 30, 1485552: 30, 797424: 31, 961264: 31, 11791600: 0, 11792112: 1, 11792128: 2, 10759408: 3, 11792144: 3, 10775792: 4, 11792160: 4, 10792176: 5, 11792672: 5, 11792176: 5, 10267888: 6, 10808560: 6, 11793184: 6, 11792192: 6, 9743600: 7, 10824944: 7, 11793696: 7, 11792208: 7, 9219312: 8, 10841328: 8, 11793680: 8, 11791696: 8, 11792720: 8, 8695024: 9, 9202928: 9, 10317040: 9, 11365616: 9, 10857712: 9, 11793664: 9, 11793232: 9, 8170736: 10, 9186544: 10, 9792752: 10, 10874096: 10, 11793648: 10, 11793744: 10, 7646448: 11, 9268464: 11, 10890480: 11, 11794160: 11, 11793760: 11, 7122160: 12, 7662832: 12, 8744176: 12, 10906864: 12, 11794672: 12, 11793776: 12, 6597872: 13, 7679216: 13, 8219888: 13, 10923248: 13, 11795184: 13, 11793792: 13, 6073584: 14, 7695600: 14, 11447536: 14, 11795200: 14, 11793280: 14, 11793808: 14, 6057200: 15, 7171312: 15, 11791776: 15, 11795216: 15, 11792768: 15, 11793824: 15, 6040816: 16, 6647024: 16, 11792288: 16, 11795232: 16, 11792256: 16, 11794336: 16, 6122736: 17, 11792272: 17, 11795248: 17, 11794848: 17, 5598448: 18, 11795264: 18, 11795360: 18, 5074160: 19, 11795280: 19, 11795344: 19, 4549872: 20, 11795296: 20, 11795328: 20, 4467952: 21, 4025584: 21, 4566256: 21, 11795312: 21, 4484336: 22, 3501296: 22, 4582640: 22, 4500720: 23, 2977008: 23, 4599024: 23, 3976432: 24, 2452720: 24, 2960624: 24, 2993392: 24, 4615408: 24, 3452144: 25, 1928432: 25, 2944240: 25, 3009776: 25, 4631792: 25, 2927856: 26, 1404144: 26, 3026160: 26, 4107504: 26, 2911472: 27, 879856: 27, 3042544: 27, 3583216: 27, 2895088: 28, 863472: 28, 896240: 28, 3058928: 28, 847088: 29, 912624: 29, 2534640: 29, 830704: 30, 929008: 30, 2010352: 30, 814320: 31, 945392: 31, 1486064: 31, 797936: 32, 961776: 32, 12316400: 0, 12316416: 1, 12316432: 2, 12316448: 3, 10759920: 4, 12316960: 4, 12316464: 4, 10776304: 5, 12317472: 5, 12316480: 5, 10792688: 6, 12317984: 6, 12316496: 6, 10268400: 7, 10809072: 7, 12317968: 7, 11890416: 7, 12317008: 7, 9744112: 8, 10825456: 8, 12317952: 8, 11366128: 8, 12317520: 8, 9219824: 9, 10841840: 9, 12317936: 9, 12318032: 9, 8695536: 10, 9203440: 10, 10317552: 10, 10858224: 10, 12318448: 10, 12318048: 10, 8171248: 11, 9187056: 11, 9793264: 11, 10874608: 11, 12318960: 11, 12318064: 11, 7646960: 12, 9268976: 12, 10890992: 12, 12319472: 12, 12318080: 12, 7122672: 13, 7663344: 13, 8744688: 13, 10907376: 13, 12319488: 13, 12317568: 13, 12318096: 13, 6598384: 14, 7679728: 14, 8220400: 14, 10923760: 14, 12319504: 14, 12317056: 14, 12318112: 14, 6074096: 15, 7696112: 15, 11448048: 15, 12319520: 15, 12316544: 15, 12318624: 15, 6057712: 16, 7171824: 16, 11972336: 16, 12319536: 16, 12316560: 16, 12319136: 16, 6041328: 17, 6647536: 17, 12316576: 17, 12319552: 17, 12319648: 17, 6123248: 18, 12319568: 18, 12319632: 18, 5598960: 19, 12319584: 19, 12319616: 19, 5074672: 20, 12319600: 20, 4550384: 21, 4468464: 22, 4026096: 22, 4566768: 22, 4484848: 23, 3501808: 23, 4583152: 23, 4501232: 24, 2977520: 24, 4599536: 24, 3976944: 25, 2453232: 25, 2961136: 25, 2993904: 25, 4615920: 25, 3452656: 26, 1928944: 26, 2944752: 26, 3010288: 26, 4632304: 26, 2928368: 27, 1404656: 27, 3026672: 27, 4108016: 27, 2911984: 28, 880368: 28, 3043056: 28, 3583728: 28, 2895600: 29, 863984: 29, 896752: 29, 3059440: 29, 847600: 30, 913136: 30, 2535152: 30, 831216: 31, 929520: 31, 2010864: 31, 814832: 32, 945904: 32, 1486576: 32, 798448: 33, 962288: 33, 13890800: 0, 13891312: 1, 13890816: 1, 13891824: 2, 13890832: 2, 13892336: 3, 13890848: 3, 13892352: 4, 13415664: 4, 13892368: 5, 12891376: 5, 13892384: 6, 12367088: 6, 13892400: 7, 12350704: 7, 12383472: 7, 13892416: 8, 12334320: 8, 12399856: 8, 13892432: 9, 12416240: 9, 13892448: 10, 11891952: 10, 12940528: 10, 13892464: 11, 11367664: 11, 13464816: 11, 13892480: 12, 10843376: 12, 13890896: 12, 13892496: 13, 10761456: 13, 10319088: 13, 10826992: 13, 10859760: 13, 13890912: 13, 13892512: 14, 10777840: 14, 9794800: 14, 10810608: 14, 10876144: 14, 13890928: 14, 13892000: 15, 10794224: 15, 9270512: 15, 10892528: 15, 13890944: 15, 13891488: 16, 10269936: 16, 8746224: 16, 10908912: 16, 13513968: 16, 13890960: 16, 13890976: 17, 9745648: 17, 8221936: 17, 10925296: 17, 12989680: 17, 9221360: 18, 7697648: 18, 11449584: 18, 12465392: 18, 8697072: 19, 9204976: 19, 7173360: 19, 7681264: 19, 11973872: 19, 12481776: 19, 8172784: 20, 9188592: 20, 6649072: 20, 7664880: 20, 12498160: 20, 7648496: 21, 6124784: 21, 7124208: 22, 5600496: 22, 6599920: 23, 5076208: 23, 6075632: 24, 4551920: 24, 6059248: 25, 4027632: 25, 4568304: 25, 6042864: 26, 3503344: 26, 4584688: 26, 2979056: 27, 4601072: 27, 2454768: 28, 2962672: 28, 2995440: 28, 4617456: 28, 1930480: 29, 2946288: 29, 3011824: 29, 4633840: 29, 1406192: 30, 2929904: 30, 3028208: 30, 4109552: 30, 4470000: 31, 881904: 31, 2913520: 31, 3454192: 31, 3044592: 31, 3585264: 31, 4486384: 32, 865520: 32, 898288: 32, 2897136: 32, 3978480: 32, 3060976: 32, 4502768: 33, 849136: 33, 914672: 33, 2536688: 33, 832752: 34, 931056: 34, 2012400: 34, 816368: 35, 947440: 35, 1488112: 35, 799984: 36, 963824: 36, 14415600: 0, 14416112: 1, 13907696: 2, 14416624: 2, 13924080: 3, 14416640: 3, 13940464: 4, 14416656: 4, 13416176: 5, 14416672: 5, 12891888: 6, 14416688: 6, 12367600: 7, 14416704: 7, 12351216: 8, 12383984: 8, 14416720: 8, 12334832: 9, 12400368: 9, 14416736: 9, 12416752: 10, 14416752: 10, 11892464: 11, 12941040: 11, 14416768: 11, 11368176: 12, 13465328: 12, 14416784: 12, 10843888: 13, 13989616: 13, 14416800: 13, 10761968: 14, 10319600: 14, 10827504: 14, 10860272: 14, 14006000: 14, 14416288: 14, 10778352: 15, 9795312: 15, 10811120: 15, 10876656: 15, 14022384: 15, 14415776: 15, 10794736: 16, 9271024: 16, 10893040: 16, 14038768: 16, 14071536: 16, 10270448: 17, 8746736: 17, 10909424: 17, 13514480: 17, 14055152: 17, 9746160: 18, 8222448: 18, 10925808: 18, 12990192: 18, 9221872: 19, 7698160: 19, 11450096: 19, 12465904: 19, 8697584: 20, 9205488: 20, 7173872: 20, 7681776: 20, 11974384: 20, 12482288: 20, 8173296: 21, 9189104: 21, 6649584: 21, 7665392: 21, 12498672: 21, 7649008: 22, 6125296: 22, 7124720: 23, 5601008: 23, 6600432: 24, 5076720: 24, 6076144: 25, 4552432: 25, 6059760: 26, 4028144: 26, 4568816: 26, 6043376: 27, 3503856: 27, 4585200: 27, 2979568: 28, 4601584: 28, 2455280: 29, 2963184: 29, 2995952: 29, 4617968: 29, 1930992: 30, 2946800: 30, 3012336: 30, 4634352: 30, 1406704: 31, 2930416: 31, 3028720: 31, 4110064: 31, 4470512: 32, 882416: 32, 2914032: 32, 3454704: 32, 3045104: 32, 3585776: 32, 4486896: 33, 866032: 33, 898800: 33, 2897648: 33, 3978992: 33, 3061488: 33, 4503280: 34, 849648: 34, 915184: 34, 2537200: 34, 833264: 35, 931568: 35, 2012912: 35, 816880: 36, 947952: 36, 1488624: 36, 800496: 37, 964336: 37, 14940400: 0, 14940912: 1, 14940928: 2, 13908208: 3, 14940944: 3, 13924592: 4, 14940960: 4, 13940976: 5, 14940976: 5, 13416688: 6, 14940992: 6, 12892400: 7, 14941008: 7, 12368112: 8, 14941024: 8, 12351728: 9, 12384496: 9, 14941040: 9, 12335344: 10, 12400880: 10, 14941056: 10, 12417264: 11, 14941072: 11, 11892976: 12, 12941552: 12, 14941088: 12, 11368688: 13, 13465840: 13, 14940576: 13, 10844400: 14, 13990128: 14, 14596336: 14, 10762480: 15, 10320112: 15, 10828016: 15, 10860784: 15, 14006512: 15, 14072048: 15, 10778864: 16, 9795824: 16, 10811632: 16, 10877168: 16, 14022896: 16, 14055664: 16, 10795248: 17, 9271536: 17, 10893552: 17, 14039280: 17, 10270960: 18, 8747248: 18, 10909936: 18, 13514992: 18, 9746672: 19, 8222960: 19, 10926320: 19, 12990704: 19, 9222384: 20, 7698672: 20, 11450608: 20, 12466416: 20, 8698096: 21, 9206000: 21, 7174384: 21, 7682288: 21, 11974896: 21, 12482800: 21, 8173808: 22, 9189616: 22, 6650096: 22, 7665904: 22, 12499184: 22, 7649520: 23, 6125808: 23, 7125232: 24, 5601520: 24, 6600944: 25, 5077232: 25, 6076656: 26, 4552944: 26, 6060272: 27, 4028656: 27, 4569328: 27, 6043888: 28, 3504368: 28, 4585712: 28, 2980080: 29, 4602096: 29, 2455792: 30, 2963696: 30, 2996464: 30, 4618480: 30, 1931504: 31, 2947312: 31, 3012848: 31, 4634864: 31, 1407216: 32, 2930928: 32, 3029232: 32, 4110576: 32, 4471024: 33, 882928: 33, 2914544: 33, 3455216: 33, 3045616: 33, 3586288: 33, 4487408: 34, 866544: 34, 899312: 34, 2898160: 34, 3979504: 34, 3062000: 34, 4503792: 35, 850160: 35, 915696: 35, 2537712: 35, 833776: 36, 932080: 36, 2013424: 36, 817392: 37, 948464: 37, 1489136: 37, 801008: 38, 964848: 38, 15465200: 0, 15465216: 1, 15465232: 2, 15465248: 3, 13908720: 4, 15465264: 4, 13925104: 5, 15465280: 5, 13941488: 6, 15465296: 6, 13417200: 7, 15465312: 7, 12892912: 8, 15465328: 8, 12368624: 9, 15465344: 9, 12352240: 10, 12385008: 10, 15465360: 10, 12335856: 11, 12401392: 11, 15465376: 11, 12417776: 12, 15121136: 12, 11893488: 13, 12942064: 13, 14596848: 13, 11369200: 14, 13466352: 14, 14072560: 14, 10844912: 15, 13990640: 15, 14056176: 15, 10762992: 16, 10320624: 16, 10828528: 16, 10861296: 16, 14007024: 16, 14039792: 16, 10779376: 17, 9796336: 17, 10812144: 17, 10877680: 17, 14023408: 17, 13515504: 17, 10795760: 18, 9272048: 18, 10894064: 18, 12991216: 18, 10271472: 19, 8747760: 19, 10910448: 19, 12466928: 19, 9747184: 20, 8223472: 20, 10926832: 20, 12483312: 20, 9222896: 21, 7699184: 21, 11451120: 21, 12499696: 21, 8698608: 22, 9206512: 22, 7174896: 22, 7682800: 22, 11975408: 22, 8174320: 23, 9190128: 23, 6650608: 23, 7666416: 23, 7650032: 24, 6126320: 24, 7125744: 25, 5602032: 25, 6601456: 26, 5077744: 26, 6077168: 27, 4553456: 27, 6060784: 28, 4029168: 28, 4569840: 28, 6044400: 29, 3504880: 29, 4586224: 29, 2980592: 30, 4602608: 30, 2456304: 31, 2964208: 31, 2996976: 31, 4618992: 31, 1932016: 32, 2947824: 32, 3013360: 32, 4635376: 32, 1407728: 33, 2931440: 33, 3029744: 33, 4111088: 33, 4471536: 34, 883440: 34, 2915056: 34, 3455728: 34, 3046128: 34, 3586800: 34, 4487920: 35, 867056: 35, 899824: 35, 2898672: 35, 3980016: 35, 3062512: 35, 4504304: 36, 850672: 36, 916208: 36, 2538224: 36, 834288: 37, 932592: 37, 2013936: 37, 817904: 38, 948976: 38, 1489648: 38, 801520: 39, 965360: 39, 787200: 0, 787216: 1, 787232: 2, 787248: 3, 787264: 4, 787280: 5, 789248: 6, 787792: 6, 787296: 6, 789264: 7, 788304: 7, 787312: 7, 789280: 8, 788816: 8, 787328: 8, 789792: 9, 789296: 9, 789328: 9, 787344: 9, 790304: 10, 789312: 10, 789840: 10, 789344: 10, 787360: 10, 790816: 11, 790352: 11, 789360: 11, 787872: 11, 790800: 12, 790864: 12, 789376: 12, 788384: 12, 790784: 13, 791376: 13, 790880: 13, 789392: 13, 788896: 13, 791888: 14, 790896: 14, 789408: 14, 792400: 15, 790912: 15, 789920: 15, 792912: 16, 790928: 16, 790432: 16, 793424: 17, 790944: 17, 792320: 18, 793936: 18, 792336: 19, 793920: 19, 794448: 19, 792352: 20, 793904: 20, 794960: 20, 792864: 21, 793888: 21, 795472: 21, 793376: 22, 794400: 22, 795984: 22, 794912: 23, 796496: 23, 795424: 24, 797008: 24, 795408: 25, 795936: 25, 796992: 25, 797520: 25, 797024: 25, 795392: 26, 796448: 26, 796976: 26, 798032: 26, 797040: 26, 796960: 27, 798544: 27, 797056: 27, 796944: 28, 798528: 28, 799056: 28, 797072: 28, 796928: 29, 798512: 29, 799568: 29, 797088: 29, 798496: 30, 800080: 30, 797600: 30, 798480: 31, 799008: 31, 800096: 31, 798112: 31, 798464: 32, 799520: 32, 800112: 32, 798624: 32, 800032: 33, 800128: 33, 798608: 33, 800016: 34, 799616: 34, 800144: 34, 798592: 34, 800000: 35, 799104: 35, 800160: 35, 800672: 36, 801184: 37, 801696: 38, 801680: 39, 801536: 40, 801664: 40, 801552: 41, 801648: 41, 801568: 42, 801632: 42, 801584: 43, 801616: 43, 801600: 44, 2886400: 0, 2886416: 1, 2886432: 2, 2886944: 3, 2886448: 3, 2887456: 4, 2886464: 4, 2887968: 5, 2886480: 5, 2887952: 6, 2444032: 6, 2886992: 6, 2886496: 6, 805632: 7, 2887936: 7, 1919744: 7, 2887504: 7, 2886512: 7, 822016: 8, 1395456: 8, 2888016: 8, 2886528: 8, 838400: 9, 871168: 9, 2888528: 9, 2888032: 9, 2886544: 9, 854784: 10, 887552: 10, 2889040: 10, 2888048: 10, 2886560: 10, 903936: 11, 2889552: 11, 2888064: 11, 2525952: 11, 2887072: 11, 2889472: 12, 920320: 12, 2890064: 12, 2888080: 12, 2001664: 12, 2887584: 12, 2889488: 13, 936704: 13, 2890576: 13, 2888096: 13, 1477376: 13, 2889504: 14, 953088: 14, 2891088: 14, 2890016: 15, 2891072: 15, 2891600: 15, 2890528: 16, 2891056: 16, 2892112: 16, 2891040: 17, 2892624: 17, 2891552: 18, 2893136: 18, 2892064: 19, 2893648: 19, 2892576: 20, 2894160: 20, 2892560: 21, 2893088: 21, 2894144: 21, 2894672: 21, 2894176: 21, 2892544: 22, 2893600: 22, 2894128: 22, 2895184: 22, 2894192: 22, 2894112: 23, 2895696: 23, 2894208: 23, 2894096: 24, 2895680: 24, 2896208: 24, 2894224: 24, 2894080: 25, 2895664: 25, 2896720: 25, 2894240: 25, 2895648: 26, 2897232: 26, 2894752: 26, 2895632: 27, 2896160: 27, 2897248: 27, 2895264: 27, 2895616: 28, 2896672: 28, 2897264: 28, 2895776: 28, 2897184: 29, 2897280: 29, 2895760: 29, 2897168: 30, 2896768: 30, 2897296: 30, 2895744: 30, 2897152: 31, 2896256: 31, 2897312: 31, 2897824: 32, 2898336: 33, 2898848: 34, 2898832: 35, 2898688: 36, 2898816: 36, 2898704: 37, 2898800: 37, 2898720: 38, 2898784: 38, 2898736: 39, 2898768: 39, 2898752: 40, 4460800: 0, 4460816: 1, 4460832: 2, 3969280: 3, 3444992: 4, 4462336: 5, 2920704: 5, 4462352: 6, 2904320: 6, 2937088: 6, 4462368: 7, 2953472: 7, 4462880: 8, 2969856: 8, 4463392: 9, 2445568: 9, 3494144: 9, 2986240: 9, 4463904: 10, 1921280: 10, 4018432: 10, 3002624: 10, 4464416: 11, 4463920: 11, 1396992: 11, 4460880: 11, 3019008: 11, 4464928: 12, 4463936: 12, 872704: 12, 4461392: 12, 4460896: 12, 3035392: 12, 4465440: 13, 4463952: 13, 856320: 13, 889088: 13, 4461904: 13, 4460912: 13, 3051776: 13, 4465424: 14, 4465952: 14, 4463440: 14, 4464464: 14, 807168: 14, 839936: 14, 905472: 14, 4462416: 14, 4460928: 14, 2527488: 14, 3576064: 14, 4465408: 15, 4466464: 15, 4462928: 15, 4464976: 15, 823552: 15, 921856: 15, 4460944: 15, 2003200: 15, 4100352: 15, 4466976: 16, 4465488: 16, 938240: 16, 4460960: 16, 1478912: 16, 4466960: 17, 4466992: 17, 4466000: 17, 954624: 17, 4466944: 18, 4467008: 18, 4466512: 18, 4467024: 19, 4467536: 20, 4467040: 20, 4468048: 21, 4467056: 21, 4468560: 22, 4467072: 22, 4468480: 23, 4468544: 23, 4469072: 23, 4467088: 23, 4468496: 24, 4468528: 24, 4469584: 24, 4467104: 24, 4468512: 25, 4470096: 25, 4467616: 25, 4469024: 26, 4470112: 26, 4468128: 26, 4469536: 27, 4470128: 27, 4468640: 27, 4470048: 28, 4470144: 28, 4468624: 28, 4470032: 29, 4469632: 29, 4470160: 29, 4468608: 29, 4470016: 30, 4469120: 30, 4470176: 30, 4470688: 31, 4471200: 32, 4471712: 33, 4471696: 34, 4471552: 35, 4471680: 35, 4471568: 36, 4471664: 36, 4471584: 37, 4471648: 37, 4471600: 38, 4471632: 38, 4471616: 39, 6035200: 0, 6035216: 1, 6035232: 2, 6035744: 3, 6036256: 4, 6036768: 5, 4478720: 6, 6037280: 6, 6036784: 6, 4495104: 7, 6037792: 7, 6036800: 7, 3970816: 8, 6038304: 8, 6036816: 8, 3446528: 9, 6038288: 9, 6038816: 9, 6036304: 9, 6037328: 9, 2922240: 10, 6038272: 10, 6039328: 10, 6035792: 10, 6037840: 10, 2905856: 11, 2938624: 11, 6039840: 11, 6035280: 11, 6038352: 11, 2955008: 12, 6039824: 12, 6039856: 12, 5592832: 12, 6038864: 12, 2971392: 13, 6039808: 13, 6039872: 13, 5068544: 13, 6039376: 13, 2447104: 14, 3495680: 14, 2987776: 14, 6039888: 14, 4544256: 14, 1922816: 15, 4019968: 15, 3004160: 15, 6040400: 15, 6039904: 15, 4560640: 15, 1398528: 16, 3020544: 16, 6040912: 16, 6039920: 16, 4577024: 16, 874240: 17, 3036928: 17, 6041424: 17, 6039936: 17, 4593408: 17, 857856: 18, 890624: 18, 3053312: 18, 6041344: 18, 6041408: 18, 6041936: 18, 6039952: 18, 4609792: 18, 808704: 19, 841472: 19, 907008: 19, 2529024: 19, 3577600: 19, 6041360: 19, 6041392: 19, 6042448: 19, 6039968: 19, 4626176: 19, 825088: 20, 923392: 20, 2004736: 20, 4101888: 20, 6041376: 20, 6042960: 20, 6040480: 20, 939776: 21, 1480448: 21, 6041888: 21, 6042976: 21, 6040992: 21, 956160: 22, 6042400: 22, 6042992: 22, 6041504: 22, 6042912: 23, 6043008: 23, 6041488: 23, 6042896: 24, 6042496: 24, 6043024: 24, 6041472: 24, 6042880: 25, 6041984: 25, 6043040: 25, 6043552: 26, 6044064: 27, 6044576: 28, 6044560: 29, 6044416: 30, 6044544: 30, 6044432: 31, 6044528: 31, 6044448: 32, 6044512: 32, 6044464: 33, 6044496: 33, 6044480: 34, 9184000: 0, 9184016: 1, 9184032: 2, 8692480: 3, 9184544: 3, 8168192: 4, 9185056: 4, 7643904: 5, 9185568: 5, 7119616: 6, 7660288: 6, 9185552: 6, 9185584: 6, 6595328: 7, 7676672: 7, 9185536: 7, 9185600: 7, 6071040: 8, 7693056: 8, 9185616: 8, 6054656: 9, 7168768: 9, 8217344: 9, 9185104: 9, 9186128: 9, 9185632: 9, 6644480: 10, 8741632: 10, 9184592: 10, 9186640: 10, 9185648: 10, 6120192: 11, 9184080: 11, 9187152: 11, 9185664: 11, 5595904: 12, 9187072: 12, 9187136: 12, 9187664: 12, 9185680: 12, 5071616: 13, 9187088: 13, 9187120: 13, 9188176: 13, 9185696: 13, 4547328: 14, 9187104: 14, 9188688: 14, 9186208: 14, 4023040: 15, 4563712: 15, 9187616: 15, 9188704: 15, 9186720: 15, 4481792: 16, 3498752: 16, 4580096: 16, 9188128: 16, 9188720: 16, 9187232: 16, 4498176: 17, 2974464: 17, 4596480: 17, 9188640: 17, 9188736: 17, 9187216: 17, 3973888: 18, 2450176: 18, 2958080: 18, 2990848: 18, 4612864: 18, 9188624: 18, 9188224: 18, 9188752: 18, 9187200: 18, 3449600: 19, 1925888: 19, 2941696: 19, 3007232: 19, 4629248: 19, 9188608: 19, 9187712: 19, 9188768: 19, 2925312: 20, 1401600: 20, 3023616: 20, 4104960: 20, 9189280: 20, 2908928: 21, 877312: 21, 3040000: 21, 3580672: 21, 9189792: 21, 860928: 22, 893696: 22, 3056384: 22, 9190304: 22, 844544: 23, 910080: 23, 2532096: 23, 9190288: 23, 828160: 24, 926464: 24, 2007808: 24, 9190144: 24, 9190272: 24, 811776: 25, 942848: 25, 1483520: 25, 9190160: 25, 9190256: 25, 959232: 26, 9190176: 26, 9190240: 26, 9190192: 27, 9190224: 27, 9190208: 28, 10758400: 0, 10758416: 1, 10758432: 2, 10266880: 3, 10758448: 3, 9742592: 4, 10758464: 4, 10759936: 5, 9218304: 5, 10758480: 5, 10759952: 6, 8694016: 6, 9201920: 6, 10316032: 6, 10758992: 6, 10758496: 6, 10759968: 7, 8169728: 7, 9791744: 7, 10759504: 7, 10758512: 7, 10760480: 8, 10759984: 8, 7645440: 8, 9267456: 8, 10760016: 8, 10758528: 8, 10760992: 9, 10760000: 9, 7121152: 9, 7661824: 9, 8743168: 9, 10760528: 9, 10758544: 9, 10761504: 10, 6596864: 10, 7678208: 10, 8218880: 10, 10761040: 10, 10758560: 10, 10761488: 11, 6072576: 11, 7694592: 11, 10761552: 11, 10759072: 11, 10761472: 12, 6056192: 12, 7170304: 12, 10761568: 12, 10759584: 12, 6646016: 13, 10761584: 13, 10760096: 13, 6121728: 14, 10761600: 14, 10760080: 14, 5597440: 15, 10761088: 15, 10761616: 15, 10760064: 15, 5073152: 16, 10760576: 16, 10761632: 16, 10763008: 17, 4548864: 17, 10762144: 17, 10763024: 18, 4024576: 18, 4565248: 18, 10762656: 18, 10763040: 19, 4483328: 19, 3500288: 19, 4581632: 19, 10763168: 19, 10763056: 20, 4499712: 20, 2976000: 20, 4598016: 20, 10763152: 20, 10763072: 21, 3975424: 21, 2451712: 21, 2959616: 21, 2992384: 21, 4614400: 21, 10763136: 21, 10763088: 22, 3451136: 22, 1927424: 22, 2943232: 22, 3008768: 22, 4630784: 22, 10763120: 22, 10763104: 23, 2926848: 23, 1403136: 23, 3025152: 23, 4106496: 23, 2910464: 24, 878848: 24, 3041536: 24, 3582208: 24, 862464: 25, 895232: 25, 3057920: 25, 846080: 26, 911616: 26, 2533632: 26, 829696: 27, 928000: 27, 2009344: 27, 813312: 28, 944384: 28, 1485056: 28, 960768: 29, 12332800: 0, 12332816: 1, 12332832: 2, 12333344: 3, 12332848: 3, 12333856: 4, 12332864: 4, 12334368: 5, 12332880: 5, 10776320: 6, 12334352: 6, 11890432: 6, 12333392: 6, 10792704: 7, 12334336: 7, 11366144: 7, 12333904: 7, 10268416: 8, 10809088: 8, 10841856: 8, 12334416: 8, 9744128: 9, 10825472: 9, 10317568: 9, 10858240: 9, 12334432: 9, 9219840: 10, 9793280: 10, 10874624: 10, 12334448: 10, 8695552: 11, 9203456: 11, 9268992: 11, 10891008: 11, 12334464: 11, 8171264: 12, 12335872: 12, 8744704: 12, 10907392: 12, 12333952: 12, 12334480: 12, 7646976: 13, 12335888: 13, 8220416: 13, 10923776: 13, 12333440: 13, 12334496: 13, 7122688: 14, 7663360: 14, 12335904: 14, 7696128: 14, 11448064: 14, 12332928: 14, 12335008: 14, 6598400: 15, 7679744: 15, 12335920: 15, 7171840: 15, 11972352: 15, 12332944: 15, 12335520: 15, 6074112: 16, 12335936: 16, 6647552: 16, 12332960: 16, 12336032: 16, 6057728: 17, 12335952: 17, 6123264: 17, 12336016: 17, 12335968: 18, 5598976: 18, 12336000: 18, 12335984: 19, 5074688: 19, 4550400: 20, 4026112: 21, 4566784: 21, 3501824: 22, 4583168: 22, 2977536: 23, 4599552: 23, 4484864: 24, 2453248: 24, 2961152: 24, 2993920: 24, 4615936: 24, 4501248: 25, 1928960: 25, 2944768: 25, 3010304: 25, 4632320: 25, 3976960: 26, 1404672: 26, 2928384: 26, 3026688: 26, 4108032: 26, 3452672: 27, 880384: 27, 2912000: 27, 3043072: 27, 3583744: 27, 864000: 28, 896768: 28, 3059456: 28, 847616: 29, 913152: 29, 2535168: 29, 831232: 30, 929536: 30, 2010880: 30, 814848: 31, 945920: 31, 1486592: 31, 962304: 32, 13907200: 0, 13907216: 1, 13907232: 2, 13415680: 3, 12891392: 4, 13908736: 5, 12367104: 5, 13908752: 6, 12350720: 6, 12383488: 6, 13908768: 7, 12399872: 7, 13908784: 8, 12416256: 8, 13908800: 9, 11891968: 9, 12940544: 9, 13908816: 10, 11367680: 10, 13464832: 10, 13908832: 11, 10843392: 11, 13907280: 11, 13908848: 12, 10319104: 12, 10827008: 12, 10859776: 12, 13907296: 12, 13908864: 13, 10777856: 13, 9794816: 13, 10810624: 13, 10876160: 13, 13907312: 13, 13908880: 14, 10794240: 14, 9270528: 14, 10892544: 14, 13907328: 14, 13908896: 15, 10269952: 15, 8746240: 15, 10908928: 15, 13513984: 15, 13907344: 15, 13908384: 16, 9745664: 16, 8221952: 16, 10925312: 16, 12989696: 16, 13907360: 16, 13907872: 17, 9221376: 17, 7697664: 17, 11449600: 17, 12465408: 17, 8697088: 18, 9204992: 18, 7173376: 18, 7681280: 18, 11973888: 18, 12481792: 18, 8172800: 19, 6649088: 19, 7664896: 19, 12498176: 19, 7648512: 20, 6124800: 20, 7124224: 21, 5600512: 21, 6599936: 22, 5076224: 22, 6075648: 23, 4551936: 23, 6059264: 24, 4027648: 24, 4568320: 24, 3503360: 25, 4584704: 25, 2979072: 26, 4601088: 26, 2454784: 27, 2962688: 27, 2995456: 27, 4617472: 27, 1930496: 28, 2946304: 28, 3011840: 28, 4633856: 28, 1406208: 29, 2929920: 29, 3028224: 29, 4109568: 29, 881920: 30, 2913536: 30, 3454208: 30, 3044608: 30, 3585280: 30, 4486400: 31, 865536: 31, 898304: 31, 3978496: 31, 3060992: 31, 4502784: 32, 849152: 32, 914688: 32, 2536704: 32, 832768: 33, 931072: 33, 2012416: 33, 816384: 34, 947456: 34, 1488128: 34, 963840: 35, 15481600: 0, 15481616: 1, 15481632: 2, 15481648: 3, 15481664: 4, 15481680: 5, 13925120: 6, 15481696: 6, 13941504: 7, 15481712: 7, 13417216: 8, 15481728: 8, 12892928: 9, 15481744: 9, 12368640: 10, 15481760: 10, 12352256: 11, 12385024: 11, 15121152: 11, 12401408: 12, 14596864: 12, 12417792: 13, 14072576: 13, 11893504: 14, 12942080: 14, 14056192: 14, 11369216: 15, 13466368: 15, 14039808: 15, 10844928: 16, 13990656: 16, 13515520: 16, 14023424: 16, 10320640: 17, 10828544: 17, 10861312: 17, 14007040: 17, 12991232: 17, 10779392: 18, 9796352: 18, 10812160: 18, 10877696: 18, 12466944: 18, 10795776: 19, 9272064: 19, 10894080: 19, 12483328: 19, 10271488: 20, 8747776: 20, 10910464: 20, 12499712: 20, 9747200: 21, 8223488: 21, 10926848: 21, 11975424: 21, 9222912: 22, 7699200: 22, 11451136: 22, 8698624: 23, 9206528: 23, 7174912: 23, 7682816: 23, 8174336: 24, 6650624: 24, 7666432: 24, 7650048: 25, 6126336: 25, 7125760: 26, 5602048: 26, 6601472: 27, 5077760: 27, 6077184: 28, 4553472: 28, 6060800: 29, 4029184: 29, 4569856: 29, 3504896: 30, 4586240: 30, 2980608: 31, 4602624: 31, 2456320: 32, 2964224: 32, 2996992: 32, 4619008: 32, 1932032: 33, 2947840: 33, 3013376: 33, 4635392: 33, 1407744: 34, 2931456: 34, 3029760: 34, 4111104: 34, 883456: 35, 2915072: 35, 3455744: 35, 3046144: 35, 3586816: 35, 4487936: 36, 867072: 36, 899840: 36, 3980032: 36, 3062528: 36, 4504320: 37, 850688: 37, 916224: 37, 2538240: 37, 834304: 38, 932608: 38, 2013952: 38, 817920: 39, 948992: 39, 1489664: 39, 965376: 40, 803600: 0, 803616: 1, 803632: 2, 803648: 3, 803664: 4, 804176: 5, 803680: 5, 804688: 6, 803696: 6, 805200: 7, 803712: 7, 805648: 8, 805712: 8, 803728: 8, 805664: 9, 805696: 9, 806224: 9, 805728: 9, 803744: 9, 806176: 10, 805680: 10, 806736: 10, 805744: 10, 804256: 10, 806688: 11, 807248: 11, 805760: 11, 804768: 11, 807200: 12, 807760: 12, 807264: 12, 805776: 12, 805280: 12, 807184: 13, 808272: 13, 807280: 13, 805792: 13, 808784: 14, 807296: 14, 806304: 14, 809296: 15, 807312: 15, 806816: 15, 809808: 16, 807328: 16, 810320: 17, 810304: 18, 810832: 18, 810288: 19, 811344: 19, 808720: 20, 810272: 20, 811856: 20, 808736: 21, 809760: 21, 810784: 21, 812368: 21, 809248: 22, 811296: 22, 812880: 22, 811808: 23, 813392: 23, 811792: 24, 812320: 24, 813376: 24, 813904: 24, 813408: 24, 812832: 25, 813360: 25, 814416: 25, 813424: 25, 813344: 26, 814928: 26, 813440: 26, 813328: 27, 814912: 27, 815440: 27, 813456: 27, 814896: 28, 815952: 28, 813472: 28, 814880: 29, 816464: 29, 813984: 29, 814864: 30, 815392: 30, 816480: 30, 814496: 30, 815904: 31, 816496: 31, 815008: 31, 816416: 32, 816512: 32, 814992: 32, 816400: 33, 816000: 33, 816528: 33, 814976: 33, 815488: 34, 816544: 34, 817056: 35, 817568: 36, 818080: 37, 818064: 38, 818048: 39, 817936: 40, 818032: 40, 817952: 41, 818016: 41, 817968: 42, 818000: 42, 817984: 43, 2902800: 0, 2902816: 1, 2903328: 2, 2902832: 2, 2903840: 3, 2902848: 3, 2904352: 4, 2902864: 4, 2904336: 5, 2444048: 5, 2903376: 5, 2902880: 5, 1919760: 6, 2903888: 6, 2902896: 6, 1395472: 7, 2904400: 7, 2902912: 7, 871184: 8, 2904912: 8, 2904416: 8, 2902928: 8, 822032: 9, 854800: 9, 887568: 9, 2905424: 9, 2904432: 9, 2902944: 9, 838416: 10, 903952: 10, 2905936: 10, 2904448: 10, 2525968: 10, 2903456: 10, 920336: 11, 2906448: 11, 2904464: 11, 2001680: 11, 2903968: 11, 2905872: 12, 936720: 12, 2906960: 12, 2904480: 12, 1477392: 12, 2905888: 13, 953104: 13, 2907472: 13, 2906400: 14, 2907456: 14, 2907984: 14, 2906912: 15, 2907440: 15, 2908496: 15, 2907424: 16, 2909008: 16, 2907936: 17, 2909520: 17, 2908448: 18, 2910032: 18, 2908960: 19, 2910544: 19, 2908944: 20, 2909472: 20, 2910528: 20, 2911056: 20, 2910560: 20, 2909984: 21, 2910512: 21, 2911568: 21, 2910576: 21, 2910496: 22, 2912080: 22, 2910592: 22, 2910480: 23, 2912064: 23, 2912592: 23, 2910608: 23, 2912048: 24, 2913104: 24, 2910624: 24, 2912032: 25, 2913616: 25, 2911136: 25, 2912016: 26, 2912544: 26, 2913632: 26, 2911648: 26, 2913056: 27, 2913648: 27, 2912160: 27, 2913568: 28, 2913664: 28, 2912144: 28, 2913552: 29, 2913152: 29, 2913680: 29, 2912128: 29, 2912640: 30, 2913696: 30, 2914208: 31, 2914720: 32, 2915232: 33, 2915216: 34, 2915200: 35, 2915088: 36, 2915184: 36, 2915104: 37, 2915168: 37, 2915120: 38, 2915152: 38, 2915136: 39, 4477200: 0, 4477216: 1, 3969296: 2, 3445008: 3, 2920720: 4, 2937104: 5, 2953488: 6, 4478736: 7, 2969872: 7, 4478752: 8, 2445584: 8, 3494160: 8, 2986256: 8, 4479264: 9, 1921296: 9, 4018448: 9, 3002640: 9, 4479776: 10, 1397008: 10, 4477264: 10, 3019024: 10, 4480288: 11, 872720: 11, 4477776: 11, 4477280: 11, 3035408: 11, 4480800: 12, 4480304: 12, 856336: 12, 889104: 12, 4478288: 12, 4477296: 12, 3051792: 12, 4481312: 13, 4480320: 13, 839952: 13, 905488: 13, 4478800: 13, 4477312: 13, 2527504: 13, 3576080: 13, 4481824: 14, 4480336: 14, 823568: 14, 921872: 14, 4479312: 14, 4477328: 14, 2003216: 14, 4100368: 14, 4481808: 15, 4482336: 15, 4479824: 15, 4480848: 15, 938256: 15, 4477344: 15, 1478928: 15, 4482848: 16, 4481360: 16, 954640: 16, 4483360: 17, 4481872: 17, 4483344: 18, 4483376: 18, 4482384: 18, 4483392: 19, 4482896: 19, 4483408: 20, 4483920: 21, 4483424: 21, 4484432: 22, 4483440: 22, 4484944: 23, 4483456: 23, 4484928: 24, 4485456: 24, 4483472: 24, 4484880: 25, 4484912: 25, 4485968: 25, 4483488: 25, 4484896: 26, 4486480: 26, 4484000: 26, 4485408: 27, 4486496: 27, 4484512: 27, 4485920: 28, 4486512: 28, 4485024: 28, 4486432: 29, 4486528: 29, 4485008: 29, 4486416: 30, 4486016: 30, 4486544: 30, 4484992: 30, 4485504: 31, 4486560: 31, 4487072: 32, 4487584: 33, 4488096: 34, 4488080: 35, 4488064: 36, 4487952: 37, 4488048: 37, 4487968: 38, 4488032: 38, 4487984: 39, 4488016: 39, 4488000: 40, 6051600: 0, 6051616: 1, 6052128: 2, 6052640: 3, 6053152: 4, 6053664: 5, 6053168: 5, 6054176: 6, 6053184: 6, 6054688: 7, 6053200: 7, 4495120: 8, 6054672: 8, 6055200: 8, 6052688: 8, 6053712: 8, 3970832: 9, 6055712: 9, 6052176: 9, 6054224: 9, 3446544: 10, 6056224: 10, 6051664: 10, 6054736: 10, 2922256: 11, 6056208: 11, 6056240: 11, 5592848: 11, 6055248: 11, 2938640: 12, 6056256: 12, 5068560: 12, 6055760: 12, 2955024: 13, 6056272: 13, 4544272: 13, 2971408: 14, 6056784: 14, 6056288: 14, 4019984: 14, 4560656: 14, 2447120: 15, 3495696: 15, 2987792: 15, 6057296: 15, 6056304: 15, 4577040: 15, 1922832: 16, 3004176: 16, 6057808: 16, 6056320: 16, 4593424: 16, 1398544: 17, 3020560: 17, 6057792: 17, 6058320: 17, 6056336: 17, 4609808: 17, 874256: 18, 3036944: 18, 6057744: 18, 6057776: 18, 6058832: 18, 6056352: 18, 4626192: 18, 857872: 19, 890640: 19, 3053328: 19, 6057760: 19, 6059344: 19, 6056864: 19, 4101904: 19, 841488: 20, 907024: 20, 2529040: 20, 3577616: 20, 6058272: 20, 6059360: 20, 6057376: 20, 825104: 21, 923408: 21, 2004752: 21, 6058784: 21, 6059376: 21, 6057888: 21, 939792: 22, 1480464: 22, 6059296: 22, 6059392: 22, 6057872: 22, 956176: 23, 6059280: 23, 6058880: 23, 6059408: 23, 6057856: 23, 6058368: 24, 6059424: 24, 6059936: 25, 6060448: 26, 6060960: 27, 6060944: 28, 6060928: 29, 6060816: 30, 6060912: 30, 6060832: 31, 6060896: 31, 6060848: 32, 6060880: 32, 6060864: 33, 9200400: 0, 9200416: 1, 8692496: 2, 9200928: 2, 8168208: 3, 9201440: 3, 7643920: 4, 9201952: 4, 7119632: 5, 7660304: 5, 9201936: 5, 9201968: 5, 6595344: 6, 7676688: 6, 9201984: 6, 6071056: 7, 7693072: 7, 9202000: 7, 7168784: 8, 8217360: 8, 9201488: 8, 9202512: 8, 9202016: 8, 6644496: 9, 8741648: 9, 9200976: 9, 9203024: 9, 9202032: 9, 6120208: 10, 9200464: 10, 9203536: 10, 9202048: 10, 5595920: 11, 9203520: 11, 9204048: 11, 9202064: 11, 5071632: 12, 9203472: 12, 9203504: 12, 9204560: 12, 9202080: 12, 4547344: 13, 9203488: 13, 9205072: 13, 9202592: 13, 4023056: 14, 4563728: 14, 9204000: 14, 9205088: 14, 9203104: 14, 3498768: 15, 4580112: 15, 9204512: 15, 9205104: 15, 9203616: 15, 4498192: 16, 2974480: 16, 4596496: 16, 9205024: 16, 9205120: 16, 9203600: 16, 3973904: 17, 2450192: 17, 2958096: 17, 2990864: 17, 4612880: 17, 9205008: 17, 9204608: 17, 9205136: 17, 9203584: 17, 3449616: 18, 1925904: 18, 2941712: 18, 3007248: 18, 4629264: 18, 9204096: 18, 9205152: 18, 2925328: 19, 1401616: 19, 3023632: 19, 4104976: 19, 9205664: 19, 877328: 20, 3040016: 20, 3580688: 20, 9206176: 20, 860944: 21, 893712: 21, 3056400: 21, 9206688: 21, 844560: 22, 910096: 22, 2532112: 22, 9206672: 22, 828176: 23, 926480: 23, 2007824: 23, 9206656: 23, 942864: 24, 1483536: 24, 9206544: 24, 9206640: 24, 959248: 25, 9206560: 25, 9206624: 25, 9206576: 26, 9206608: 26, 9206592: 27, 10774800: 0, 10774816: 1, 10266896: 2, 10774832: 2, 9742608: 3, 10774848: 3, 9218320: 4, 10774864: 4, 8694032: 5, 10316048: 5, 10775376: 5, 10774880: 5, 8169744: 6, 9791760: 6, 10775888: 6, 10774896: 6, 10776336: 7, 7645456: 7, 9267472: 7, 10776400: 7, 10774912: 7, 10776352: 8, 7121168: 8, 7661840: 8, 8743184: 8, 10776384: 8, 10776912: 8, 10774928: 8, 10776864: 9, 10776368: 9, 6596880: 9, 7678224: 9, 8218896: 9, 10777424: 9, 10774944: 9, 10777376: 10, 6072592: 10, 7694608: 10, 10777936: 10, 10775456: 10, 10777888: 11, 7170320: 11, 10777952: 11, 10775968: 11, 10777872: 12, 6646032: 12, 10777968: 12, 10776480: 12, 6121744: 13, 10777984: 13, 10776464: 13, 5597456: 14, 10777472: 14, 10778000: 14, 10776448: 14, 5073168: 15, 10776960: 15, 10778016: 15, 4548880: 16, 10778528: 16, 4024592: 17, 4565264: 17, 10779040: 17, 3500304: 18, 4581648: 18, 10779552: 18, 10779408: 19, 4499728: 19, 2976016: 19, 4598032: 19, 10779536: 19, 10779424: 20, 3975440: 20, 2451728: 20, 2959632: 20, 2992400: 20, 4614416: 20, 10779520: 20, 10779440: 21, 3451152: 21, 1927440: 21, 2943248: 21, 3008784: 21, 4630800: 21, 10779504: 21, 10779456: 22, 2926864: 22, 1403152: 22, 3025168: 22, 4106512: 22, 10779488: 22, 10779472: 23, 878864: 23, 3041552: 23, 3582224: 23, 862480: 24, 895248: 24, 3057936: 24, 846096: 25, 911632: 25, 2533648: 25, 829712: 26, 928016: 26, 2009360: 26, 944400: 27, 1485072: 27, 960784: 28, 12349200: 0, 12349216: 1, 12349728: 2, 12349232: 2, 12350240: 3, 12349248: 3, 12350752: 4, 12349264: 4, 12350736: 5, 11890448: 5, 12349776: 5, 11366160: 6, 12350288: 6, 10841872: 7, 12350800: 7, 10792720: 8, 10317584: 8, 10825488: 8, 10858256: 8, 12350816: 8, 10268432: 9, 10809104: 9, 9793296: 9, 10874640: 9, 12350832: 9, 9744144: 10, 9269008: 10, 10891024: 10, 12350848: 10, 9219856: 11, 8744720: 11, 10907408: 11, 12350336: 11, 12350864: 11, 8695568: 12, 12352272: 12, 8220432: 12, 10923792: 12, 12349824: 12, 12350880: 12, 8171280: 13, 12352288: 13, 7696144: 13, 11448080: 13, 12349312: 13, 12351392: 13, 7646992: 14, 12352304: 14, 7171856: 14, 7679760: 14, 11972368: 14, 12349328: 14, 12351904: 14, 7122704: 15, 7663376: 15, 12352320: 15, 6647568: 15, 12349344: 15, 12352416: 15, 6598416: 16, 12352336: 16, 6123280: 16, 12352400: 16, 6074128: 17, 12352352: 17, 5598992: 17, 12352384: 17, 12352368: 18, 5074704: 18, 4550416: 19, 4026128: 20, 4566800: 20, 3501840: 21, 4583184: 21, 2977552: 22, 4599568: 22, 2453264: 23, 2961168: 23, 2993936: 23, 4615952: 23, 1928976: 24, 2944784: 24, 3010320: 24, 4632336: 24, 1404688: 25, 2928400: 25, 3026704: 25, 4108048: 25, 4501264: 26, 880400: 26, 3452688: 26, 3043088: 26, 3583760: 26, 3976976: 27, 864016: 27, 896784: 27, 3059472: 27, 847632: 28, 913168: 28, 2535184: 28, 831248: 29, 929552: 29, 2010896: 29, 945936: 30, 1486608: 30, 962320: 31, 13923600: 0, 13923616: 1, 13415696: 2, 12891408: 3, 12367120: 4, 12383504: 5, 12399888: 6, 13925136: 7, 12416272: 7, 13925152: 8, 11891984: 8, 12940560: 8, 13925168: 9, 11367696: 9, 13464848: 9, 13925184: 10, 10843408: 10, 13923664: 10, 13925200: 11, 10319120: 11, 10827024: 11, 10859792: 11, 13923680: 11, 13925216: 12, 9794832: 12, 10810640: 12, 10876176: 12, 13923696: 12, 13925232: 13, 10794256: 13, 9270544: 13, 10892560: 13, 13923712: 13, 13925248: 14, 10269968: 14, 8746256: 14, 10908944: 14, 13514000: 14, 13923728: 14, 13925264: 15, 9745680: 15, 8221968: 15, 10925328: 15, 12989712: 15, 13923744: 15, 13925280: 16, 9221392: 16, 7697680: 16, 11449616: 16, 12465424: 16, 13924256: 16, 13924768: 17, 8697104: 17, 7173392: 17, 7681296: 17, 11973904: 17, 12481808: 17, 8172816: 18, 6649104: 18, 7664912: 18, 12498192: 18, 7648528: 19, 6124816: 19, 7124240: 20, 5600528: 20, 6599952: 21, 5076240: 21, 6075664: 22, 4551952: 22, 4027664: 23, 4568336: 23, 3503376: 24, 4584720: 24, 2979088: 25, 4601104: 25, 2454800: 26, 2962704: 26, 2995472: 26, 4617488: 26, 1930512: 27, 2946320: 27, 3011856: 27, 4633872: 27, 1406224: 28, 2929936: 28, 3028240: 28, 4109584: 28, 881936: 29, 3454224: 29, 3044624: 29, 3585296: 29, 865552: 30, 898320: 30, 3978512: 30, 3061008: 30, 4502800: 31, 849168: 31, 914704: 31, 2536720: 31, 832784: 32, 931088: 32, 2012432: 32, 947472: 33, 1488144: 33, 963856: 34, 15498000: 0, 15498016: 1, 15498032: 2, 15498048: 3, 15498064: 4, 15498080: 5, 15498096: 6, 15498112: 7, 13941520: 8, 15498128: 8, 13417232: 9, 15498144: 9, 12892944: 10, 15121168: 10, 12368656: 11, 14596880: 11, 12385040: 12, 14072592: 12, 12401424: 13, 14056208: 13, 12417808: 14, 14039824: 14, 11893520: 15, 12942096: 15, 13515536: 15, 14023440: 15, 11369232: 16, 13466384: 16, 12991248: 16, 14007056: 16, 10844944: 17, 13990672: 17, 12466960: 17, 10320656: 18, 10828560: 18, 10861328: 18, 12483344: 18, 9796368: 19, 10812176: 19, 10877712: 19, 12499728: 19, 10795792: 20, 9272080: 20, 10894096: 20, 11975440: 20, 10271504: 21, 8747792: 21, 10910480: 21, 11451152: 21, 9747216: 22, 8223504: 22, 10926864: 22, 9222928: 23, 7699216: 23, 8698640: 24, 7174928: 24, 7682832: 24, 8174352: 25, 6650640: 25, 7666448: 25, 7650064: 26, 6126352: 26, 7125776: 27, 5602064: 27, 6601488: 28, 5077776: 28, 6077200: 29, 4553488: 29, 4029200: 30, 4569872: 30, 3504912: 31, 4586256: 31, 2980624: 32, 4602640: 32, 2456336: 33, 2964240: 33, 2997008: 33, 4619024: 33, 1932048: 34, 2947856: 34, 3013392: 34, 4635408: 34, 1407760: 35, 2931472: 35, 3029776: 35, 4111120: 35, 883472: 36, 3455760: 36, 3046160: 36, 3586832: 36, 867088: 37, 899856: 37, 3980048: 37, 3062544: 37, 4504336: 38, 850704: 38, 916240: 38, 2538256: 38, 834320: 39, 932624: 39, 2013968: 39, 949008: 40, 1489680: 40, 965392: 41, 820000: 0, 820016: 1, 820032: 2, 820048: 3, 820560: 4, 820064: 4, 821072: 5, 820080: 5, 821584: 6, 820096: 6, 822096: 7, 820112: 7, 822080: 8, 822608: 8, 822112: 8, 820128: 8, 822064: 9, 823120: 9, 822128: 9, 820640: 9, 822048: 10, 823632: 10, 822144: 10, 821152: 10, 822560: 11, 824144: 11, 823648: 11, 822160: 11, 821664: 11, 823072: 12, 824656: 12, 823664: 12, 822176: 12, 823584: 13, 825168: 13, 823680: 13, 822688: 13, 825680: 14, 823696: 14, 823200: 14, 826192: 15, 823712: 15, 826704: 16, 826688: 17, 827216: 17, 826672: 18, 827728: 18, 826656: 19, 828240: 19, 826144: 20, 827168: 20, 828752: 20, 825632: 21, 827680: 21, 829264: 21, 825120: 22, 828192: 22, 829776: 22, 828704: 23, 829760: 23, 830288: 23, 829792: 23, 829216: 24, 829744: 24, 830800: 24, 829808: 24, 829728: 25, 831312: 25, 829824: 25, 831296: 26, 831824: 26, 829840: 26, 831280: 27, 832336: 27, 829856: 27, 831264: 28, 832848: 28, 830368: 28, 831776: 29, 832864: 29, 830880: 29, 832288: 30, 832880: 30, 831392: 30, 832800: 31, 832896: 31, 831376: 31, 832384: 32, 832912: 32, 831360: 32, 831872: 33, 832928: 33, 833440: 34, 833952: 35, 834464: 36, 834448: 37, 834432: 38, 834416: 39, 834336: 40, 834400: 40, 834352: 41, 834384: 41, 834368: 42, 2919200: 0, 2919712: 1, 2919216: 1, 2920224: 2, 2919232: 2, 2920736: 3, 2919248: 3, 2444064: 4, 2919760: 4, 2919264: 4, 1919776: 5, 2920272: 5, 2919280: 5, 1395488: 6, 2920784: 6, 2919296: 6, 871200: 7, 2921296: 7, 2920800: 7, 2919312: 7, 854816: 8, 887584: 8, 2921808: 8, 2920816: 8, 2919328: 8, 838432: 9, 903968: 9, 2922320: 9, 2920832: 9, 2525984: 9, 2919840: 9, 920352: 10, 2922832: 10, 2920848: 10, 2001696: 10, 2920352: 10, 936736: 11, 2923344: 11, 2920864: 11, 1477408: 11, 2922272: 12, 953120: 12, 2923856: 12, 2922784: 13, 2923840: 13, 2924368: 13, 2923296: 14, 2923824: 14, 2924880: 14, 2923808: 15, 2925392: 15, 2924320: 16, 2925904: 16, 2924832: 17, 2926416: 17, 2925344: 18, 2926928: 18, 2925856: 19, 2926912: 19, 2927440: 19, 2926944: 19, 2926368: 20, 2926896: 20, 2927952: 20, 2926960: 20, 2926880: 21, 2928464: 21, 2926976: 21, 2928448: 22, 2928976: 22, 2926992: 22, 2928432: 23, 2929488: 23, 2927008: 23, 2928416: 24, 2930000: 24, 2927520: 24, 2928928: 25, 2930016: 25, 2928032: 25, 2929440: 26, 2930032: 26, 2928544: 26, 2929952: 27, 2930048: 27, 2928528: 27, 2929536: 28, 2930064: 28, 2928512: 28, 2929024: 29, 2930080: 29, 2930592: 30, 2931104: 31, 2931616: 32, 2931600: 33, 2931584: 34, 2931568: 35, 2931488: 36, 2931552: 36, 2931504: 37, 2931536: 37, 2931520: 38, 3444000: 0, 3444512: 1, 2936096: 2, 3445024: 2, 2952480: 3, 2968864: 4, 2444576: 5, 3444048: 5, 2985248: 5, 1920288: 6, 3444560: 6, 3001632: 6, 1396000: 7, 3445072: 7, 3018016: 7, 871712: 8, 3445584: 8, 3445088: 8, 3034400: 8, 855328: 9, 888096: 9, 3446096: 9, 3445104: 9, 3050784: 9, 838944: 10, 904480: 10, 3446608: 10, 3445120: 10, 2526496: 10, 3444128: 10, 920864: 11, 3447120: 11, 3445136: 11, 2002208: 11, 3444640: 11, 3446560: 11, 937248: 12, 3447632: 12, 3445152: 12, 1477920: 12, 3447072: 12, 953632: 13, 3448144: 13, 3447584: 13, 3448128: 14, 3448656: 14, 3448096: 14, 3448112: 15, 3449168: 15, 3448608: 15, 3449680: 16, 3449120: 16, 3450192: 17, 3449632: 17, 3450704: 18, 3450144: 18, 3451216: 19, 3450656: 19, 3451200: 20, 3451728: 20, 3451232: 20, 3451168: 20, 3451184: 21, 3452240: 21, 3451248: 21, 3452752: 22, 3451264: 22, 3452736: 23, 3453264: 23, 3451280: 23, 3452720: 24, 3453776: 24, 3451296: 24, 3452704: 25, 3454288: 25, 3451808: 25, 3453216: 26, 3454304: 26, 3452320: 26, 3453728: 27, 3454320: 27, 3452832: 27, 3454240: 28, 3454336: 28, 3452816: 28, 3453824: 29, 3454352: 29, 3452800: 29, 3453312: 30, 3454368: 30, 3454880: 31, 3455392: 32, 3455904: 33, 3455888: 34, 3455872: 35, 3455856: 36, 3455776: 37, 3455840: 37, 3455792: 38, 3455824: 38, 3455808: 39, 3968800: 0, 3969312: 1, 2936608: 3, 2952992: 4, 2969376: 5, 2445088: 6, 3493664: 6, 2985760: 6, 1920800: 7, 3968848: 7, 3002144: 7, 1396512: 8, 3969360: 8, 3018528: 8, 872224: 9, 3969872: 9, 3969376: 9, 3034912: 9, 855840: 10, 888608: 10, 3970384: 10, 3969392: 10, 3051296: 10, 3970848: 10, 839456: 11, 904992: 11, 3970896: 11, 3969408: 11, 2527008: 11, 3575584: 11, 3971360: 11, 921376: 12, 3971408: 12, 3969424: 12, 2002720: 12, 3968928: 12, 3971872: 12, 937760: 13, 3971920: 13, 3969440: 13, 1478432: 13, 3972384: 13, 954144: 14, 3972432: 14, 3972896: 14, 3972400: 14, 3972416: 15, 3972944: 15, 3973408: 15, 3973456: 16, 3973920: 16, 3973968: 17, 3974432: 17, 3974480: 18, 3974944: 18, 3974992: 19, 3975456: 19, 3975504: 20, 3975472: 20, 3975488: 21, 3976016: 21, 3975520: 21, 3976528: 22, 3975536: 22, 3977040: 23, 3975552: 23, 3977024: 24, 3977552: 24, 3975568: 24, 3977008: 25, 3978064: 25, 3975584: 25, 3976992: 26, 3978576: 26, 3976096: 26, 3977504: 27, 3978592: 27, 3976608: 27, 3978016: 28, 3978608: 28, 3977120: 28, 3978528: 29, 3978624: 29, 3977104: 29, 3978112: 30, 3978640: 30, 3977088: 30, 3977600: 31, 3978656: 31, 3979168: 32, 3979680: 33, 3980192: 34, 3980176: 35, 3980160: 36, 3980144: 37, 3980064: 38, 3980128: 38, 3980080: 39, 3980112: 39, 3980096: 40, 4493600: 0, 2937120: 4, 2953504: 5, 2969888: 6, 2445600: 7, 3494176: 7, 2986272: 7, 1921312: 8, 4018464: 8, 3002656: 8, 1397024: 9, 4493648: 9, 3019040: 9, 4495136: 9, 872736: 10, 4494160: 10, 4493664: 10, 3035424: 10, 4495648: 10, 856352: 11, 889120: 11, 4494672: 11, 4493680: 11, 3051808: 11, 4496160: 11, 839968: 12, 905504: 12, 4495184: 12, 4493696: 12, 2527520: 12, 3576096: 12, 4496672: 12, 921888: 13, 4495696: 13, 4493712: 13, 2003232: 13, 4100384: 13, 4497184: 13, 4496688: 13, 938272: 14, 4496208: 14, 4493728: 14, 1478944: 14, 4497696: 14, 4496704: 14, 954656: 15, 4496720: 15, 4498208: 15, 4497232: 16, 4498720: 16, 4497744: 17, 4499232: 17, 4498256: 18, 4499744: 18, 4498768: 19, 4499760: 19, 4499280: 20, 4499776: 20, 4499792: 21, 4500304: 22, 4499808: 22, 4500816: 23, 4499824: 23, 4501328: 24, 4499840: 24, 4501312: 25, 4501840: 25, 4499856: 25, 4501296: 26, 4502352: 26, 4499872: 26, 4501280: 27, 4502864: 27, 4500384: 27, 4501792: 28, 4502880: 28, 4500896: 28, 4502304: 29, 4502896: 29, 4501408: 29, 4502816: 30, 4502912: 30, 4501392: 30, 4502400: 31, 4502928: 31, 4501376: 31, 4501888: 32, 4502944: 32, 4503456: 33, 4503968: 34, 4504480: 35, 4504464: 36, 4504448: 37, 4504432: 38, 4504352: 39, 4504416: 39, 4504368: 40, 4504400: 40, 4504384: 41, 6068000: 0, 6068512: 1, 6069024: 2, 6069536: 3, 6070048: 4, 6069552: 4, 6070560: 5, 6069568: 5, 6071072: 6, 6069584: 6, 6071584: 7, 6069072: 7, 6070096: 7, 6072096: 8, 6068560: 8, 6070608: 8, 6072608: 9, 6068048: 9, 6071120: 9, 6072624: 10, 5592864: 10, 6071632: 10, 6072640: 11, 5068576: 11, 6072144: 11, 6072656: 12, 4544288: 12, 2938656: 13, 6073168: 13, 6072672: 13, 4020000: 13, 4560672: 13, 2955040: 14, 6073680: 14, 6072688: 14, 3495712: 14, 4577056: 14, 2971424: 15, 6074192: 15, 6072704: 15, 4593440: 15, 2447136: 16, 2987808: 16, 6074176: 16, 6074704: 16, 6072720: 16, 4609824: 16, 1922848: 17, 3004192: 17, 6074160: 17, 6075216: 17, 6072736: 17, 4626208: 17, 1398560: 18, 3020576: 18, 6074144: 18, 6075728: 18, 6073248: 18, 4101920: 18, 874272: 19, 3036960: 19, 6074656: 19, 6075744: 19, 6073760: 19, 3577632: 19, 857888: 20, 890656: 20, 3053344: 20, 6075168: 20, 6075760: 20, 6074272: 20, 841504: 21, 907040: 21, 2529056: 21, 6075680: 21, 6075776: 21, 6074256: 21, 923424: 22, 2004768: 22, 6075264: 22, 6075792: 22, 6074240: 22, 939808: 23, 1480480: 23, 6074752: 23, 6075808: 23, 956192: 24, 6076320: 24, 6076832: 25, 6077344: 26, 6077328: 27, 6077312: 28, 6077296: 29, 6077216: 30, 6077280: 30, 6077232: 31, 6077264: 31, 6077248: 32, 6592800: 0, 6593312: 1, 6593824: 2, 6594336: 3, 6593840: 3, 6594848: 4, 6593856: 4, 6595360: 5, 6593872: 5, 6595872: 6, 6593360: 6, 6594384: 6, 6596384: 7, 6592848: 7, 6594896: 7, 6596896: 8, 6117664: 8, 6595408: 8, 6596912: 9, 5593376: 9, 6595920: 9, 6596928: 10, 5069088: 10, 6596432: 10, 6596944: 11, 4544800: 11, 6597456: 12, 6596960: 12, 4020512: 12, 4561184: 12, 6597968: 13, 6596976: 13, 3496224: 13, 4577568: 13, 2939168: 14, 6598480: 14, 6596992: 14, 2971936: 14, 4593952: 14, 2955552: 15, 6598464: 15, 6598992: 15, 6597008: 15, 2447648: 15, 2988320: 15, 4610336: 15, 6598448: 16, 6599504: 16, 6597024: 16, 1923360: 16, 3004704: 16, 4626720: 16, 6598432: 17, 6600016: 17, 6597536: 17, 1399072: 17, 3021088: 17, 4102432: 17, 6598944: 18, 6600032: 18, 6598048: 18, 874784: 18, 3037472: 18, 3578144: 18, 6599456: 19, 6600048: 19, 6598560: 19, 858400: 19, 891168: 19, 3053856: 19, 6599968: 20, 6600064: 20, 6598544: 20, 842016: 20, 907552: 20, 2529568: 20, 6599552: 21, 6600080: 21, 6598528: 21, 923936: 21, 2005280: 21, 6599040: 22, 6600096: 22, 940320: 22, 1480992: 22, 6600608: 23, 956704: 23, 6601120: 24, 6601632: 25, 6601616: 26, 6601600: 27, 6601584: 28, 6601504: 29, 6601568: 29, 6601520: 30, 6601552: 30, 6601536: 31, 7117600: 0, 7118112: 1, 7118624: 2, 7118128: 2, 7119136: 3, 7118144: 3, 7119648: 4, 7118160: 4, 7120160: 5, 7117648: 5, 7118672: 5, 7120672: 6, 6642464: 6, 7119184: 6, 7121184: 7, 6118176: 7, 7119696: 7, 7121200: 8, 5593888: 8, 7120208: 8, 7121216: 9, 5069600: 9, 7120720: 9, 7121232: 10, 4545312: 10, 7121744: 11, 7121248: 11, 4021024: 11, 4561696: 11, 7122256: 12, 7121264: 12, 3496736: 12, 4578080: 12, 7122768: 13, 7121280: 13, 2972448: 13, 4594464: 13, 7122752: 14, 7123280: 14, 7121296: 14, 2448160: 14, 2956064: 14, 2988832: 14, 4610848: 14, 2939680: 15, 7122736: 15, 7123792: 15, 7121312: 15, 1923872: 15, 3005216: 15, 4627232: 15, 7122720: 16, 7124304: 16, 7121824: 16, 1399584: 16, 3021600: 16, 4102944: 16, 7123232: 17, 7124320: 17, 7122336: 17, 875296: 17, 3037984: 17, 3578656: 17, 7123744: 18, 7124336: 18, 7122848: 18, 858912: 18, 891680: 18, 3054368: 18, 7124256: 19, 7124352: 19, 7122832: 19, 842528: 19, 908064: 19, 2530080: 19, 7123840: 20, 7124368: 20, 7122816: 20, 924448: 20, 2005792: 20, 7123328: 21, 7124384: 21, 940832: 21, 1481504: 21, 7124896: 22, 957216: 22, 7125408: 23, 7125920: 24, 7125904: 25, 7125888: 26, 7125872: 27, 7125792: 28, 7125856: 28, 7125808: 29, 7125840: 29, 7125824: 30, 7642400: 0, 7642912: 1, 7642416: 1, 7643424: 2, 7642432: 2, 7643936: 3, 7642448: 3, 7644448: 4, 7167264: 4, 7642960: 4, 7644960: 5, 6642976: 5, 7643472: 5, 7645472: 6, 6118688: 6, 7643984: 6, 7645488: 7, 5594400: 7, 7644496: 7, 7645504: 8, 5070112: 8, 7645008: 8, 7645520: 9, 4545824: 9, 7646032: 10, 7645536: 10, 4021536: 10, 4562208: 10, 7646544: 11, 7645552: 11, 3497248: 11, 4578592: 11, 7647056: 12, 7645568: 12, 2972960: 12, 4594976: 12, 7647040: 13, 7647568: 13, 7645584: 13, 2448672: 13, 2956576: 13, 2989344: 13, 4611360: 13, 7647024: 14, 7648080: 14, 7645600: 14, 1924384: 14, 2940192: 14, 3005728: 14, 4627744: 14, 7647008: 15, 7648592: 15, 7646112: 15, 1400096: 15, 3022112: 15, 4103456: 15, 7647520: 16, 7648608: 16, 7646624: 16, 875808: 16, 3038496: 16, 3579168: 16, 7648032: 17, 7648624: 17, 7647136: 17, 859424: 17, 892192: 17, 3054880: 17, 7648544: 18, 7648640: 18, 7647120: 18, 843040: 18, 908576: 18, 2530592: 18, 7648128: 19, 7648656: 19, 7647104: 19, 924960: 19, 2006304: 19, 7647616: 20, 7648672: 20, 941344: 20, 1482016: 20, 7649184: 21, 957728: 21, 7649696: 22, 7650208: 23, 7650192: 24, 7650176: 25, 7650160: 26, 7650080: 27, 7650144: 27, 7650096: 28, 7650128: 28, 7650112: 29, 8167200: 0, 8167712: 1, 7659296: 2, 8168224: 2, 7675680: 3, 8168736: 3, 7692064: 4, 8169248: 4, 7167776: 5, 8167248: 5, 8169760: 5, 6643488: 6, 8167760: 6, 8169776: 6, 6119200: 7, 8168272: 7, 8169792: 7, 5594912: 8, 8168784: 8, 8169808: 8, 5070624: 9, 8169296: 9, 8170320: 9, 8169824: 9, 4546336: 10, 8170832: 10, 8169840: 10, 4022048: 11, 4562720: 11, 8171344: 11, 8169856: 11, 3497760: 12, 4579104: 12, 8171328: 12, 8171856: 12, 8169872: 12, 2973472: 13, 4595488: 13, 8171312: 13, 8172368: 13, 8169888: 13, 2449184: 14, 2957088: 14, 2989856: 14, 4611872: 14, 8171296: 14, 8172880: 14, 8170400: 14, 1924896: 15, 2940704: 15, 3006240: 15, 4628256: 15, 8171808: 15, 8172896: 15, 8170912: 15, 1400608: 16, 3022624: 16, 4103968: 16, 8172320: 16, 8172912: 16, 8171424: 16, 876320: 17, 3039008: 17, 3579680: 17, 8172832: 17, 8172928: 17, 8171408: 17, 859936: 18, 892704: 18, 3055392: 18, 8172416: 18, 8172944: 18, 8171392: 18, 843552: 19, 909088: 19, 2531104: 19, 8171904: 19, 8172960: 19, 925472: 20, 2006816: 20, 8173472: 20, 941856: 21, 1482528: 21, 8173984: 21, 958240: 22, 8174496: 22, 8174480: 23, 8174464: 24, 8174448: 25, 8174368: 26, 8174432: 26, 8174384: 27, 8174416: 27, 8174400: 28, 8692000: 0, 8692512: 1, 8693024: 2, 7659808: 3, 8693536: 3, 7676192: 4, 8694048: 4, 7692576: 5, 8694064: 5, 7168288: 6, 8216864: 6, 8694080: 6, 6644000: 7, 8692048: 7, 8694096: 7, 6119712: 8, 8692560: 8, 8693584: 8, 8694608: 8, 8694112: 8, 5595424: 9, 8693072: 9, 8695120: 9, 8694128: 9, 5071136: 10, 8695632: 10, 8694144: 10, 4546848: 11, 8695616: 11, 8696144: 11, 8694160: 11, 4022560: 12, 4563232: 12, 8695600: 12, 8696656: 12, 8694176: 12, 3498272: 13, 4579616: 13, 8695584: 13, 8697168: 13, 8694688: 13, 2973984: 14, 4596000: 14, 8696096: 14, 8697184: 14, 8695200: 14, 2449696: 15, 2957600: 15, 2990368: 15, 4612384: 15, 8696608: 15, 8697200: 15, 8695712: 15, 1925408: 16, 2941216: 16, 3006752: 16, 4628768: 16, 8697120: 16, 8697216: 16, 8695696: 16, 1401120: 17, 3023136: 17, 4104480: 17, 8696704: 17, 8697232: 17, 8695680: 17, 876832: 18, 3039520: 18, 3580192: 18, 8696192: 18, 8697248: 18, 860448: 19, 893216: 19, 3055904: 19, 8697760: 19, 844064: 20, 909600: 20, 2531616: 20, 8698272: 20, 925984: 21, 2007328: 21, 8698784: 21, 942368: 22, 1483040: 22, 8698768: 22, 958752: 23, 8698752: 23, 8698736: 24, 8698656: 25, 8698720: 25, 8698672: 26, 8698704: 26, 8698688: 27, 9216800: 0, 9217312: 1, 9217824: 2, 9218336: 3, 7660320: 4, 9218352: 4, 7676704: 5, 9218368: 5, 7693088: 6, 9218384: 6, 7168800: 7, 8217376: 7, 9217872: 7, 9218896: 7, 9218400: 7, 6644512: 8, 8741664: 8, 9217360: 8, 9219408: 8, 9218416: 8, 6120224: 9, 9216848: 9, 9219920: 9, 9218432: 9, 5595936: 10, 9219904: 10, 9220432: 10, 9218448: 10, 5071648: 11, 9219888: 11, 9220944: 11, 9218464: 11, 4547360: 12, 9219872: 12, 9221456: 12, 9218976: 12, 4023072: 13, 4563744: 13, 9220384: 13, 9221472: 13, 9219488: 13, 3498784: 14, 4580128: 14, 9220896: 14, 9221488: 14, 9220000: 14, 2974496: 15, 4596512: 15, 9221408: 15, 9221504: 15, 9219984: 15, 2450208: 16, 2958112: 16, 2990880: 16, 4612896: 16, 9220992: 16, 9221520: 16, 9219968: 16, 1925920: 17, 2941728: 17, 3007264: 17, 4629280: 17, 9220480: 17, 9221536: 17, 1401632: 18, 3023648: 18, 4104992: 18, 9222048: 18, 877344: 19, 3040032: 19, 3580704: 19, 9222560: 19, 860960: 20, 893728: 20, 3056416: 20, 9223072: 20, 844576: 21, 910112: 21, 2532128: 21, 9223056: 21, 926496: 22, 2007840: 22, 9223040: 22, 942880: 23, 1483552: 23, 9223024: 23, 959264: 24, 9222944: 24, 9223008: 24, 9222960: 25, 9222992: 25, 9222976: 26, 9741600: 0, 9742112: 1, 9742624: 2, 9742640: 3, 9742656: 4, 7660832: 5, 9742672: 5, 7677216: 6, 9742160: 6, 9743184: 6, 9742688: 6, 7693600: 7, 9741648: 7, 9743696: 7, 9742704: 7, 7169312: 8, 8217888: 8, 9266464: 8, 9744208: 8, 9742720: 8, 6645024: 9, 8742176: 9, 9744192: 9, 9744720: 9, 9742736: 9, 6120736: 10, 9744176: 10, 9745232: 10, 9742752: 10, 5596448: 11, 9744160: 11, 9745744: 11, 9743264: 11, 5072160: 12, 9744672: 12, 9745760: 12, 9743776: 12, 4547872: 13, 9745184: 13, 9745776: 13, 9744288: 13, 4023584: 14, 4564256: 14, 9745696: 14, 9745792: 14, 9744272: 14, 3499296: 15, 4580640: 15, 9745280: 15, 9745808: 15, 9744256: 15, 2975008: 16, 4597024: 16, 9744768: 16, 9745824: 16, 2450720: 17, 2958624: 17, 2991392: 17, 4613408: 17, 9746336: 17, 1926432: 18, 2942240: 18, 3007776: 18, 4629792: 18, 9746848: 18, 1402144: 19, 3024160: 19, 4105504: 19, 9747360: 19, 877856: 20, 3040544: 20, 3581216: 20, 9747344: 20, 861472: 21, 894240: 21, 3056928: 21, 9747328: 21, 845088: 22, 910624: 22, 2532640: 22, 9747312: 22, 927008: 23, 2008352: 23, 9747232: 23, 9747296: 23, 943392: 24, 1484064: 24, 9747248: 24, 9747280: 24, 959776: 25, 9747264: 25, 10266400: 0, 10266912: 1, 10266928: 2, 10266944: 3, 10266960: 4, 10266448: 5, 10267472: 5, 10266976: 5, 7661344: 6, 9791264: 6, 10267984: 6, 10266992: 6, 7677728: 7, 9266976: 7, 10268496: 7, 10267008: 7, 7694112: 8, 8742688: 8, 10268480: 8, 10269008: 8, 10267024: 8, 7169824: 9, 8218400: 9, 10268464: 9, 10269520: 9, 10267040: 9, 6645536: 10, 10268448: 10, 10270032: 10, 10267552: 10, 6121248: 11, 10268960: 11, 10270048: 11, 10268064: 11, 5596960: 12, 10269472: 12, 10270064: 12, 10268576: 12, 5072672: 13, 10269984: 13, 10270080: 13, 10268560: 13, 4548384: 14, 10269568: 14, 10270096: 14, 10268544: 14, 4024096: 15, 4564768: 15, 10269056: 15, 10270112: 15, 3499808: 16, 4581152: 16, 10270624: 16, 2975520: 17, 4597536: 17, 10271136: 17, 2451232: 18, 2959136: 18, 2991904: 18, 4613920: 18, 10271648: 18, 1926944: 19, 2942752: 19, 3008288: 19, 4630304: 19, 10271632: 19, 1402656: 20, 3024672: 20, 4106016: 20, 10271616: 20, 878368: 21, 3041056: 21, 3581728: 21, 10271600: 21, 861984: 22, 894752: 22, 3057440: 22, 10271520: 22, 10271584: 22, 845600: 23, 911136: 23, 2533152: 23, 10271536: 23, 10271568: 23, 927520: 24, 2008864: 24, 10271552: 24, 943904: 25, 1484576: 25, 960288: 26, 10791200: 0, 10791216: 1, 10791232: 2, 10791248: 3, 10316064: 4, 10791760: 4, 10791264: 4, 9791776: 5, 10792272: 5, 10791280: 5, 9267488: 6, 10792784: 6, 10791296: 6, 7661856: 7, 8743200: 7, 10792768: 7, 10793296: 7, 10791312: 7, 7678240: 8, 8218912: 8, 10792752: 8, 10793808: 8, 10791328: 8, 7694624: 9, 10792736: 9, 10794320: 9, 10791840: 9, 7170336: 10, 10793248: 10, 10794336: 10, 10792352: 10, 6646048: 11, 10793760: 11, 10794352: 11, 10792864: 11, 6121760: 12, 10794272: 12, 10794368: 12, 10792848: 12, 5597472: 13, 10793856: 13, 10794384: 13, 10792832: 13, 5073184: 14, 10793344: 14, 10794400: 14, 4548896: 15, 10794912: 15, 4024608: 16, 4565280: 16, 10795424: 16, 3500320: 17, 4581664: 17, 10795936: 17, 2976032: 18, 4598048: 18, 10795920: 18, 2451744: 19, 2959648: 19, 2992416: 19, 4614432: 19, 10795904: 19, 1927456: 20, 2943264: 20, 3008800: 20, 4630816: 20, 10795888: 20, 1403168: 21, 3025184: 21, 4106528: 21, 10795808: 21, 10795872: 21, 878880: 22, 3041568: 22, 3582240: 22, 10795824: 22, 10795856: 22, 862496: 23, 895264: 23, 3057952: 23, 10795840: 23, 846112: 24, 911648: 24, 2533664: 24, 928032: 25, 2009376: 25, 944416: 26, 1485088: 26, 960800: 27, 12365600: 0, 12366112: 1, 12365616: 1, 12366624: 2, 12365632: 2, 12367136: 3, 12365648: 3, 11890464: 4, 12366160: 4, 11366176: 5, 12366672: 5, 10841888: 6, 12367184: 6, 10317600: 7, 10825504: 7, 10858272: 7, 12367200: 7, 9793312: 8, 10809120: 8, 10874656: 8, 12367216: 8, 9269024: 9, 10891040: 9, 12367232: 9, 8744736: 10, 10907424: 10, 12366720: 10, 12367248: 10, 8220448: 11, 10923808: 11, 12366208: 11, 12367264: 11, 12368672: 12, 7696160: 12, 11448096: 12, 12365696: 12, 12367776: 12, 12368688: 13, 7171872: 13, 7679776: 13, 11972384: 13, 12365712: 13, 12368288: 13, 12368704: 14, 6647584: 14, 7663392: 14, 12365728: 14, 12368800: 14, 12368720: 15, 6123296: 15, 12368784: 15, 12368736: 16, 5599008: 16, 12368768: 16, 12368752: 17, 5074720: 17, 4550432: 18, 4026144: 19, 4566816: 19, 3501856: 20, 4583200: 20, 2977568: 21, 4599584: 21, 2453280: 22, 2961184: 22, 2993952: 22, 4615968: 22, 1928992: 23, 2944800: 23, 3010336: 23, 4632352: 23, 1404704: 24, 3026720: 24, 4108064: 24, 880416: 25, 3043104: 25, 3583776: 25, 864032: 26, 896800: 26, 3059488: 26, 847648: 27, 913184: 27, 2535200: 27, 929568: 28, 2010912: 28, 945952: 29, 1486624: 29, 962336: 30, 12890400: 0, 12890912: 1, 12382496: 2, 12891424: 2, 12398880: 3, 12415264: 4, 11890976: 5, 12890448: 5, 11366688: 6, 12890960: 6, 10842400: 7, 12891472: 7, 10318112: 8, 10826016: 8, 10858784: 8, 12891488: 8, 9793824: 9, 10809632: 9, 10875168: 9, 12891504: 9, 9269536: 10, 10891552: 10, 12891520: 10, 8745248: 11, 10907936: 11, 12891008: 11, 12891536: 11, 12892960: 11, 8220960: 12, 10924320: 12, 12890496: 12, 12891552: 12, 12892976: 12, 7696672: 13, 11448608: 13, 12464416: 13, 12892064: 13, 12892992: 13, 7172384: 14, 7680288: 14, 11972896: 14, 12480800: 14, 12892576: 14, 12893008: 14, 6648096: 15, 7663904: 15, 12497184: 15, 12893088: 15, 12893024: 15, 6123808: 16, 12893072: 16, 12893040: 16, 5599520: 17, 12893056: 17, 5075232: 18, 4550944: 19, 4026656: 20, 4567328: 20, 3502368: 21, 4583712: 21, 2978080: 22, 4600096: 22, 2453792: 23, 2961696: 23, 2994464: 23, 4616480: 23, 1929504: 24, 2945312: 24, 3010848: 24, 4632864: 24, 1405216: 25, 3027232: 25, 4108576: 25, 880928: 26, 3043616: 26, 3584288: 26, 864544: 27, 897312: 27, 3060000: 27, 848160: 28, 913696: 28, 2535712: 28, 930080: 29, 2011424: 29, 946464: 30, 1487136: 30, 962848: 31, 13415200: 0, 13415712: 1, 12383008: 3, 12399392: 4, 12415776: 5, 11891488: 6, 12940064: 6, 11367200: 7, 13415248: 7, 10842912: 8, 13415760: 8, 10318624: 9, 10826528: 9, 10859296: 9, 13415776: 9, 9794336: 10, 10810144: 10, 10875680: 10, 13415792: 10, 13417248: 10, 9270048: 11, 10892064: 11, 13415808: 11, 13417264: 11, 8745760: 12, 10908448: 12, 13415296: 12, 13415824: 12, 13417280: 12, 8221472: 13, 10924832: 13, 12989216: 13, 13415840: 13, 13417296: 13, 7697184: 14, 11449120: 14, 12464928: 14, 13416352: 14, 13417312: 14, 7172896: 15, 7680800: 15, 11973408: 15, 12481312: 15, 13416864: 15, 13417328: 15, 6648608: 16, 7664416: 16, 12497696: 16, 13417376: 16, 13417344: 16, 6124320: 17, 13417360: 17, 5600032: 18, 5075744: 19, 4551456: 20, 4027168: 21, 4567840: 21, 3502880: 22, 4584224: 22, 2978592: 23, 4600608: 23, 2454304: 24, 2962208: 24, 2994976: 24, 4616992: 24, 1930016: 25, 2945824: 25, 3011360: 25, 4633376: 25, 1405728: 26, 3027744: 26, 4109088: 26, 881440: 27, 3044128: 27, 3584800: 27, 865056: 28, 897824: 28, 3060512: 28, 848672: 29, 914208: 29, 2536224: 29, 930592: 30, 2011936: 30, 946976: 31, 1487648: 31, 963360: 32, 13940000: 0, 12383520: 4, 12399904: 5, 12416288: 6, 11892000: 7, 12940576: 7, 11367712: 8, 13464864: 8, 10843424: 9, 13940048: 9, 13941536: 9, 10319136: 10, 10827040: 10, 10859808: 10, 13940064: 10, 13941552: 10, 9794848: 11, 10810656: 11, 10876192: 11, 13940080: 11, 13941568: 11, 9270560: 12, 10892576: 12, 13940096: 12, 13941584: 12, 8746272: 13, 10908960: 13, 13514016: 13, 13940112: 13, 13941600: 13, 8221984: 14, 10925344: 14, 12989728: 14, 13940128: 14, 13941616: 14, 7697696: 15, 11449632: 15, 12465440: 15, 13940640: 15, 13941632: 15, 7173408: 16, 7681312: 16, 11973920: 16, 12481824: 16, 13941152: 16, 13941648: 16, 6649120: 17, 7664928: 17, 12498208: 17, 13941664: 17, 6124832: 18, 5600544: 19, 5076256: 20, 4551968: 21, 4027680: 22, 4568352: 22, 3503392: 23, 4584736: 23, 2979104: 24, 4601120: 24, 2454816: 25, 2962720: 25, 2995488: 25, 4617504: 25, 1930528: 26, 2946336: 26, 3011872: 26, 4633888: 26, 1406240: 27, 3028256: 27, 4109600: 27, 881952: 28, 3044640: 28, 3585312: 28, 865568: 29, 898336: 29, 3061024: 29, 849184: 30, 914720: 30, 2536736: 30, 931104: 31, 2012448: 31, 947488: 32, 1488160: 32, 963872: 33, 15514400: 0, 15514416: 1, 15514432: 2, 15514448: 3, 15514464: 4, 15514480: 5, 15514496: 6, 15514512: 7, 15514528: 8, 15121184: 9, 14596896: 10, 14072608: 11, 14056224: 12, 12385056: 13, 14039840: 13, 12401440: 14, 13515552: 14, 14023456: 14, 12417824: 15, 12991264: 15, 14007072: 15, 11893536: 16, 12942112: 16, 12466976: 16, 13990688: 16, 11369248: 17, 13466400: 17, 12483360: 17, 10844960: 18, 12499744: 18, 10320672: 19, 10828576: 19, 10861344: 19, 11975456: 19, 9796384: 20, 10812192: 20, 10877728: 20, 11451168: 20, 9272096: 21, 10894112: 21, 10926880: 21, 8747808: 22, 10910496: 22, 8223520: 23, 7699232: 24, 7174944: 25, 7682848: 25, 6650656: 26, 7666464: 26, 6126368: 27, 5602080: 28, 5077792: 29, 4553504: 30, 4029216: 31, 4569888: 31, 3504928: 32, 4586272: 32, 2980640: 33, 4602656: 33, 2456352: 34, 2964256: 34, 2997024: 34, 4619040: 34, 1932064: 35, 2947872: 35, 3013408: 35, 4635424: 35, 1407776: 36, 3029792: 36, 4111136: 36, 883488: 37, 3046176: 37, 3586848: 37, 867104: 38, 899872: 38, 3062560: 38, 850720: 39, 916256: 39, 2538272: 39, 932640: 40, 2013984: 40, 949024: 41, 1489696: 41, 965408: 42, 836400: 0, 836416: 1, 836432: 2, 836944: 3, 836448: 3, 837456: 4, 836464: 4, 837968: 5, 836480: 5, 838480: 6, 836496: 6, 838464: 7, 838992: 7, 838496: 7, 836512: 7, 838448: 8, 839504: 8, 838512: 8, 837024: 8, 840016: 9, 838528: 9, 837536: 9, 840528: 10, 840032: 10, 838544: 10, 838048: 10, 841040: 11, 840048: 11, 838560: 11, 841552: 12, 840064: 12, 839072: 12, 842064: 13, 840080: 13, 839584: 13, 842576: 14, 840096: 14, 843088: 15, 843072: 16, 843600: 16, 843056: 17, 844112: 17, 844624: 18, 845136: 19, 845648: 20, 846160: 21, 846144: 22, 846672: 22, 846176: 22, 846128: 23, 847184: 23, 846192: 23, 847696: 24, 846208: 24, 847680: 25, 848208: 25, 846224: 25, 847664: 26, 848720: 26, 846240: 26, 849232: 27, 846752: 27, 849248: 28, 847264: 28, 849264: 29, 847776: 29, 849280: 30, 847760: 30, 848768: 31, 849296: 31, 847744: 31, 848256: 32, 849312: 32, 849824: 33, 850336: 34, 850848: 35, 850832: 36, 850816: 37, 850800: 38, 850784: 39, 850736: 40, 850768: 40, 850752: 41, 2935600: 0, 2935616: 1, 2935632: 2, 2444080: 3, 2936144: 3, 2935648: 3, 1919792: 4, 2936656: 4, 2935664: 4, 1395504: 5, 2937168: 5, 2935680: 5, 871216: 6, 2937680: 6, 2937184: 6, 2935696: 6, 854832: 7, 887600: 7, 2938192: 7, 2937200: 7, 2935712: 7, 903984: 8, 2938704: 8, 2937216: 8, 2526000: 8, 2936224: 8, 920368: 9, 2939216: 9, 2937232: 9, 2001712: 9, 2936736: 9, 936752: 10, 2939728: 10, 2937248: 10, 1477424: 10, 953136: 11, 2940240: 11, 2940224: 12, 2940752: 12, 2940208: 13, 2941264: 13, 2941776: 14, 2942288: 15, 2942800: 16, 2943312: 17, 2943296: 18, 2943824: 18, 2943328: 18, 2943280: 19, 2944336: 19, 2943344: 19, 2944848: 20, 2943360: 20, 2944832: 21, 2945360: 21, 2943376: 21, 2944816: 22, 2945872: 22, 2943392: 22, 2946384: 23, 2943904: 23, 2946400: 24, 2944416: 24, 2946416: 25, 2944928: 25, 2946432: 26, 2944912: 26, 2945920: 27, 2946448: 27, 2944896: 27, 2945408: 28, 2946464: 28, 2946976: 29, 2947488: 30, 2948000: 31, 2947984: 32, 2947968: 33, 2947952: 34, 2947936: 35, 2947888: 36, 2947920: 36, 2947904: 37, 7658800: 0, 7658816: 1, 7658832: 2, 7167280: 3, 7659344: 3, 6642992: 4, 7659856: 4, 6118704: 5, 7660368: 5, 5594416: 6, 7660880: 6, 5070128: 7, 7661392: 7, 7661872: 8, 4545840: 8, 7661904: 8, 7661888: 9, 4021552: 9, 4562224: 9, 7662416: 9, 7661920: 9, 3497264: 10, 4578608: 10, 7662928: 10, 7661936: 10, 2972976: 11, 4594992: 11, 7663440: 11, 7661952: 11, 2448688: 12, 2956592: 12, 2989360: 12, 4611376: 12, 7663424: 12, 7663952: 12, 7661968: 12, 1924400: 13, 3005744: 13, 4627760: 13, 7663408: 13, 7664464: 13, 7661984: 13, 1400112: 14, 3022128: 14, 4103472: 14, 7664976: 14, 7662496: 14, 875824: 15, 3038512: 15, 3579184: 15, 7664992: 15, 7663008: 15, 859440: 16, 892208: 16, 3054896: 16, 7665008: 16, 7663520: 16, 908592: 17, 2530608: 17, 7665024: 17, 7663504: 17, 924976: 18, 2006320: 18, 7664512: 18, 7665040: 18, 7663488: 18, 941360: 19, 1482032: 19, 7664000: 19, 7665056: 19, 957744: 20, 7665568: 20, 7666080: 21, 7666592: 22, 7666576: 23, 7666560: 24, 7666544: 25, 7666528: 26, 7666480: 27, 7666512: 27, 7666496: 28, 10807600: 0, 10807616: 1, 10807632: 2, 10316080: 3, 10808144: 3, 10807648: 3, 9791792: 4, 10808656: 4, 10807664: 4, 9267504: 5, 10809168: 5, 10807680: 5, 8743216: 6, 10809152: 6, 10809680: 6, 10807696: 6, 8218928: 7, 10809136: 7, 10810192: 7, 10807712: 7, 7694640: 8, 10810704: 8, 10808224: 8, 7678256: 9, 7170352: 9, 10810720: 9, 10808736: 9, 6646064: 10, 10810736: 10, 10809248: 10, 6121776: 11, 10810752: 11, 10809232: 11, 5597488: 12, 10810240: 12, 10810768: 12, 10809216: 12, 5073200: 13, 10809728: 13, 10810784: 13, 4548912: 14, 10811296: 14, 4024624: 15, 4565296: 15, 10811808: 15, 3500336: 16, 4581680: 16, 10812320: 16, 2976048: 17, 4598064: 17, 10812304: 17, 2451760: 18, 2959664: 18, 2992432: 18, 4614448: 18, 10812288: 18, 1927472: 19, 3008816: 19, 4630832: 19, 10812272: 19, 1403184: 20, 3025200: 20, 4106544: 20, 10812256: 20, 878896: 21, 3041584: 21, 3582256: 21, 10812208: 21, 10812240: 21, 862512: 22, 895280: 22, 3057968: 22, 10812224: 22, 911664: 23, 2533680: 23, 928048: 24, 2009392: 24, 944432: 25, 1485104: 25, 960816: 26, 12382000: 0, 12382016: 1, 12382032: 2, 11890480: 3, 12382544: 3, 11366192: 4, 12383056: 4, 10841904: 5, 12383568: 5, 10317616: 6, 10825520: 6, 10858288: 6, 12383584: 6, 9793328: 7, 10874672: 7, 12383600: 7, 9269040: 8, 10891056: 8, 12383616: 8, 8744752: 9, 10907440: 9, 12383104: 9, 12383632: 9, 8220464: 10, 10923824: 10, 12382592: 10, 12383648: 10, 7696176: 11, 11448112: 11, 12382080: 11, 12384160: 11, 7171888: 12, 7679792: 12, 11972400: 12, 12382096: 12, 12384672: 12, 6647600: 13, 12382112: 13, 12385184: 13, 12385072: 14, 6123312: 14, 12385168: 14, 12385088: 15, 5599024: 15, 12385152: 15, 12385104: 16, 5074736: 16, 12385136: 16, 12385120: 17, 4550448: 17, 4026160: 18, 4566832: 18, 3501872: 19, 4583216: 19, 2977584: 20, 4599600: 20, 2453296: 21, 2961200: 21, 2993968: 21, 4615984: 21, 1929008: 22, 3010352: 22, 4632368: 22, 1404720: 23, 3026736: 23, 4108080: 23, 880432: 24, 3043120: 24, 3583792: 24, 864048: 25, 896816: 25, 3059504: 25, 913200: 26, 2535216: 26, 929584: 27, 2010928: 27, 945968: 28, 1486640: 28, 962352: 29, 15530800: 0, 15530816: 1, 15530832: 2, 15530848: 3, 15530864: 4, 15530880: 5, 15530896: 6, 15530912: 7, 15121200: 8, 14596912: 9, 14072624: 10, 14056240: 11, 14039856: 12, 13515568: 13, 14023472: 13, 12991280: 14, 14007088: 14, 12401456: 15, 12466992: 15, 13990704: 15, 12417840: 16, 12483376: 16, 13466416: 16, 11893552: 17, 12942128: 17, 12499760: 17, 11369264: 18, 11975472: 18, 10844976: 19, 11451184: 19, 10320688: 20, 10828592: 20, 10861360: 20, 10926896: 20, 9796400: 21, 10877744: 21, 10910512: 21, 9272112: 22, 10894128: 22, 8747824: 23, 8223536: 24, 7699248: 25, 7174960: 26, 7682864: 26, 6650672: 27, 6126384: 28, 5602096: 29, 5077808: 30, 4553520: 31, 4029232: 32, 4569904: 32, 3504944: 33, 4586288: 33, 2980656: 34, 4602672: 34, 2456368: 35, 2964272: 35, 2997040: 35, 4619056: 35, 1932080: 36, 3013424: 36, 4635440: 36, 1407792: 37, 3029808: 37, 4111152: 37, 883504: 38, 3046192: 38, 3586864: 38, 867120: 39, 899888: 39, 3062576: 39, 916272: 40, 2538288: 40, 932656: 41, 2014000: 41, 949040: 42, 1489712: 42, 965424: 43, 852800: 0, 852816: 1, 853328: 2, 852832: 2, 853840: 3, 852848: 3, 854352: 4, 852864: 4, 854864: 5, 852880: 5, 854848: 6, 855376: 6, 854880: 6, 852896: 6, 855888: 7, 854896: 7, 853408: 7, 856400: 8, 854912: 8, 853920: 8, 856912: 9, 856416: 9, 854928: 9, 854432: 9, 857424: 10, 856432: 10, 854944: 10, 857936: 11, 856448: 11, 855456: 11, 858448: 12, 856464: 12, 855968: 12, 858960: 13, 856480: 13, 859472: 14, 859456: 15, 859984: 15, 860496: 16, 861008: 17, 861520: 18, 862032: 19, 862544: 20, 862528: 21, 863056: 21, 862560: 21, 863568: 22, 862576: 22, 864080: 23, 862592: 23, 864064: 24, 864592: 24, 862608: 24, 865104: 25, 862624: 25, 865616: 26, 863136: 26, 865632: 27, 863648: 27, 865648: 28, 864160: 28, 865664: 29, 864144: 29, 865152: 30, 865680: 30, 864128: 30, 864640: 31, 865696: 31, 866208: 32, 866720: 33, 867232: 34, 867216: 35, 867200: 36, 867184: 37, 867168: 38, 867152: 39, 867136: 40, 2952000: 0, 2952016: 1, 2444096: 2, 2952528: 2, 2952032: 2, 1919808: 3, 2953040: 3, 2952048: 3, 1395520: 4, 2953552: 4, 2952064: 4, 871232: 5, 2954064: 5, 2953568: 5, 2952080: 5, 887616: 6, 2954576: 6, 2953584: 6, 2952096: 6, 904000: 7, 2955088: 7, 2953600: 7, 2526016: 7, 2952608: 7, 920384: 8, 2955600: 8, 2953616: 8, 2001728: 8, 2953120: 8, 936768: 9, 2956112: 9, 2953632: 9, 1477440: 9, 953152: 10, 2956624: 10, 2956608: 11, 2957136: 11, 2957648: 12, 2958160: 13, 2958672: 14, 2959184: 15, 2959696: 16, 2959680: 17, 2960208: 17, 2959712: 17, 2960720: 18, 2959728: 18, 2961232: 19, 2959744: 19, 2961216: 20, 2961744: 20, 2959760: 20, 2962256: 21, 2959776: 21, 2962768: 22, 2960288: 22, 2962784: 23, 2960800: 23, 2962800: 24, 2961312: 24, 2962816: 25, 2961296: 25, 2962304: 26, 2962832: 26, 2961280: 26, 2961792: 27, 2962848: 27, 2963360: 28, 2963872: 29, 2964384: 30, 2964368: 31, 2964352: 32, 2964336: 33, 2964320: 34, 2964304: 35, 2964288: 36, 7675200: 0, 7675216: 1, 7167296: 2, 7675728: 2, 6643008: 3, 7676240: 3, 6118720: 4, 7676752: 4, 5594432: 5, 7677264: 5, 5070144: 6, 7677776: 6, 4545856: 7, 7678288: 7, 4021568: 8, 4562240: 8, 7678272: 8, 7678800: 8, 7678304: 8, 3497280: 9, 4578624: 9, 7679312: 9, 7678320: 9, 2972992: 10, 4595008: 10, 7679824: 10, 7678336: 10, 2448704: 11, 2989376: 11, 4611392: 11, 7679808: 11, 7680336: 11, 7678352: 11, 1924416: 12, 3005760: 12, 4627776: 12, 7680848: 12, 7678368: 12, 1400128: 13, 3022144: 13, 4103488: 13, 7681360: 13, 7678880: 13, 875840: 14, 3038528: 14, 3579200: 14, 7681376: 14, 7679392: 14, 892224: 15, 3054912: 15, 7681392: 15, 7679904: 15, 908608: 16, 2530624: 16, 7681408: 16, 7679888: 16, 924992: 17, 2006336: 17, 7680896: 17, 7681424: 17, 7679872: 17, 941376: 18, 1482048: 18, 7680384: 18, 7681440: 18, 957760: 19, 7681952: 19, 7682464: 20, 7682976: 21, 7682960: 22, 7682944: 23, 7682928: 24, 7682912: 25, 7682896: 26, 7682880: 27, 10824000: 0, 10824016: 1, 10316096: 2, 10824528: 2, 10824032: 2, 9791808: 3, 10825040: 3, 10824048: 3, 9267520: 4, 10825552: 4, 10824064: 4, 8743232: 5, 10825536: 5, 10826064: 5, 10824080: 5, 8218944: 6, 10826576: 6, 10824096: 6, 7694656: 7, 10827088: 7, 10824608: 7, 7170368: 8, 10827104: 8, 10825120: 8, 6646080: 9, 10827120: 9, 10825632: 9, 6121792: 10, 10827136: 10, 10825616: 10, 5597504: 11, 10826624: 11, 10827152: 11, 10825600: 11, 5073216: 12, 10826112: 12, 10827168: 12, 4548928: 13, 10827680: 13, 4024640: 14, 4565312: 14, 10828192: 14, 3500352: 15, 4581696: 15, 10828704: 15, 2976064: 16, 4598080: 16, 10828688: 16, 2451776: 17, 2992448: 17, 4614464: 17, 10828672: 17, 1927488: 18, 3008832: 18, 4630848: 18, 10828656: 18, 1403200: 19, 3025216: 19, 4106560: 19, 10828640: 19, 878912: 20, 3041600: 20, 3582272: 20, 10828624: 20, 895296: 21, 3057984: 21, 10828608: 21, 911680: 22, 2533696: 22, 928064: 23, 2009408: 23, 944448: 24, 1485120: 24, 960832: 25, 12398400: 0, 12398416: 1, 11890496: 2, 12398928: 2, 11366208: 3, 12399440: 3, 10841920: 4, 12399952: 4, 10317632: 5, 10858304: 5, 12399968: 5, 9793344: 6, 10874688: 6, 12399984: 6, 9269056: 7, 10891072: 7, 12400000: 7, 8744768: 8, 10907456: 8, 12399488: 8, 12400016: 8, 8220480: 9, 10923840: 9, 12398976: 9, 12400032: 9, 7696192: 10, 11448128: 10, 12398464: 10, 12400544: 10, 7171904: 11, 11972416: 11, 12398480: 11, 12401056: 11, 6647616: 12, 12398496: 12, 12401568: 12, 6123328: 13, 12401552: 13, 5599040: 14, 12401536: 14, 5074752: 15, 12401520: 15, 12401472: 16, 4550464: 16, 12401504: 16, 12401488: 17, 4026176: 17, 4566848: 17, 3501888: 18, 4583232: 18, 2977600: 19, 4599616: 19, 2453312: 20, 2993984: 20, 4616000: 20, 1929024: 21, 3010368: 21, 4632384: 21, 1404736: 22, 3026752: 22, 4108096: 22, 880448: 23, 3043136: 23, 3583808: 23, 896832: 24, 3059520: 24, 913216: 25, 2535232: 25, 929600: 26, 2010944: 26, 945984: 27, 1486656: 27, 962368: 28, 15547200: 0, 15547216: 1, 15547232: 2, 15547248: 3, 15547264: 4, 15547280: 5, 15547296: 6, 15121216: 7, 14596928: 8, 14072640: 9, 14056256: 10, 14039872: 11, 13515584: 12, 14023488: 12, 12991296: 13, 14007104: 13, 12467008: 14, 13990720: 14, 12483392: 15, 13466432: 15, 12499776: 16, 12942144: 16, 12417856: 17, 11975488: 17, 11893568: 18, 11451200: 18, 11369280: 19, 10926912: 19, 10844992: 20, 10910528: 20, 10320704: 21, 10861376: 21, 10894144: 21, 9796416: 22, 10877760: 22, 9272128: 23, 8747840: 24, 8223552: 25, 7699264: 26, 7174976: 27, 6650688: 28, 6126400: 29, 5602112: 30, 5077824: 31, 4553536: 32, 4029248: 33, 4569920: 33, 3504960: 34, 4586304: 34, 2980672: 35, 4602688: 35, 2456384: 36, 2997056: 36, 4619072: 36, 1932096: 37, 3013440: 37, 4635456: 37, 1407808: 38, 3029824: 38, 4111168: 38, 883520: 39, 3046208: 39, 3586880: 39, 899904: 40, 3062592: 40, 916288: 41, 2538304: 41, 932672: 42, 2014016: 42, 949056: 43, 1489728: 43, 965440: 44, 869200: 0, 869712: 1, 869216: 1, 870224: 2, 869232: 2, 870736: 3, 869248: 3, 871248: 4, 869264: 4, 871760: 5, 871264: 5, 869280: 5, 872272: 6, 871280: 6, 869792: 6, 872784: 7, 871296: 7, 870304: 7, 873296: 8, 872800: 8, 871312: 8, 870816: 8, 873808: 9, 872816: 9, 871328: 9, 874320: 10, 872832: 10, 871840: 10, 874832: 11, 872848: 11, 872352: 11, 875344: 12, 872864: 12, 875856: 13, 876368: 14, 876880: 15, 877392: 16, 877904: 17, 878416: 18, 878928: 19, 879440: 20, 878944: 20, 879952: 21, 878960: 21, 880464: 22, 878976: 22, 880976: 23, 878992: 23, 881488: 24, 879008: 24, 882000: 25, 879520: 25, 882016: 26, 880032: 26, 882032: 27, 880544: 27, 882048: 28, 880528: 28, 881536: 29, 882064: 29, 880512: 29, 881024: 30, 882080: 30, 882592: 31, 883104: 32, 883616: 33, 883600: 34, 883584: 35, 883568: 36, 883552: 37, 883536: 38, 1394000: 0, 1394512: 1, 886096: 2, 1395024: 2, 902480: 3, 1395536: 3, 918864: 4, 1396048: 4, 1395552: 4, 935248: 5, 1396560: 5, 1395568: 5, 951632: 6, 1397072: 6, 1395584: 6, 1394080: 7, 1397584: 7, 1397088: 7, 1395600: 7, 1394592: 8, 1398096: 8, 1397104: 8, 1395616: 8, 1395104: 9, 1398608: 9, 1397120: 9, 1396128: 9, 1399120: 10, 1397136: 10, 1396640: 10, 1399632: 11, 1397152: 11, 1400144: 12, 1400656: 13, 1401168: 14, 1401680: 15, 1402192: 16, 1402704: 17, 1403216: 18, 1403728: 19, 1403232: 19, 1404240: 20, 1403248: 20, 1404752: 21, 1403264: 21, 1405264: 22, 1403280: 22, 1405776: 23, 1403296: 23, 1406288: 24, 1403808: 24, 1406304: 25, 1404320: 25, 1406320: 26, 1404832: 26, 1406336: 27, 1404816: 27, 1405824: 28, 1406352: 28, 1404800: 28, 1405312: 29, 1406368: 29, 1406880: 30, 1407392: 31, 1407904: 32, 1407888: 33, 1407872: 34, 1407856: 35, 1407840: 36, 1407824: 37, 1918800: 0, 1919312: 1, 1919824: 2, 886608: 3, 1920336: 3, 1919840: 3, 902992: 4, 1920848: 4, 1919856: 4, 919376: 5, 1921360: 5, 1919872: 5, 935760: 6, 1921872: 6, 1921376: 6, 1919888: 6, 952144: 7, 1922384: 7, 1921392: 7, 1919904: 7, 1476432: 8, 1922896: 8, 1921408: 8, 1919392: 8, 1920416: 8, 1918880: 9, 1923408: 9, 1921424: 9, 1920928: 9, 1923920: 10, 1921440: 10, 1924432: 11, 1924944: 12, 1925456: 13, 1925968: 14, 1926480: 15, 1926992: 16, 1927504: 17, 1928016: 18, 1927520: 18, 1928528: 19, 1927536: 19, 1929040: 20, 1927552: 20, 1929552: 21, 1927568: 21, 1930064: 22, 1927584: 22, 1930576: 23, 1928096: 23, 1930592: 24, 1928608: 24, 1930608: 25, 1929120: 25, 1930624: 26, 1929104: 26, 1930112: 27, 1930640: 27, 1929088: 27, 1929600: 28, 1930656: 28, 1931168: 29, 1931680: 30, 1932192: 31, 1932176: 32, 1932160: 33, 1932144: 34, 1932128: 35, 1932112: 36, 2443600: 0, 2444112: 1, 2444624: 2, 2444128: 2, 2445136: 3, 2444144: 3, 887120: 4, 2445648: 4, 2444160: 4, 903504: 5, 2446160: 5, 2445664: 5, 2444176: 5, 919888: 6, 2446672: 6, 2445680: 6, 2444192: 6, 936272: 7, 2447184: 7, 2445696: 7, 2443680: 7, 2444704: 7, 952656: 8, 2447696: 8, 2445712: 8, 2001232: 8, 2445216: 8, 1476944: 9, 2448208: 9, 2445728: 9, 2448720: 10, 2449232: 11, 2449744: 12, 2450256: 13, 2450768: 14, 2451280: 15, 2451792: 16, 2452304: 17, 2451808: 17, 2452816: 18, 2451824: 18, 2453328: 19, 2451840: 19, 2453840: 20, 2451856: 20, 2454352: 21, 2451872: 21, 2454864: 22, 2452384: 22, 2454880: 23, 2452896: 23, 2454896: 24, 2453408: 24, 2454912: 25, 2453392: 25, 2454400: 26, 2454928: 26, 2453376: 26, 2453888: 27, 2454944: 27, 2455456: 28, 2455968: 29, 2456480: 30, 2456464: 31, 2456448: 32, 2456432: 33, 2456416: 34, 2456400: 35, 2968400: 0, 2968912: 1, 2968416: 1, 2969424: 2, 2968432: 2, 2969936: 3, 2968448: 3, 2970448: 4, 2969952: 4, 2968464: 4, 887632: 5, 2970960: 5, 2969968: 5, 2968480: 5, 904016: 6, 2971472: 6, 2969984: 6, 2526032: 6, 2968992: 6, 920400: 7, 2971984: 7, 2970000: 7, 2001744: 7, 2969504: 7, 936784: 8, 2972496: 8, 2970016: 8, 1477456: 8, 953168: 9, 2973008: 9, 2973520: 10, 2974032: 11, 2974544: 12, 2975056: 13, 2975568: 14, 2976080: 15, 2976592: 16, 2976096: 16, 2977104: 17, 2976112: 17, 2977616: 18, 2976128: 18, 2978128: 19, 2976144: 19, 2978640: 20, 2976160: 20, 2979152: 21, 2976672: 21, 2979168: 22, 2977184: 22, 2979184: 23, 2977696: 23, 2979200: 24, 2977680: 24, 2978688: 25, 2979216: 25, 2977664: 25, 2978176: 26, 2979232: 26, 2979744: 27, 2980256: 28, 2980768: 29, 2980752: 30, 2980736: 31, 2980720: 32, 2980704: 33, 2980688: 34, 3493200: 0, 3493712: 1, 2985296: 2, 3494224: 2, 3001680: 3, 3494736: 3, 3494240: 3, 3018064: 4, 3495248: 4, 3494256: 4, 3034448: 5, 3495760: 5, 3494272: 5, 888144: 6, 3050832: 6, 3496272: 6, 3494288: 6, 904528: 7, 2526544: 7, 3493280: 7, 3496784: 7, 3494304: 7, 920912: 8, 2002256: 8, 3493792: 8, 3497296: 8, 937296: 9, 1477968: 9, 3497808: 9, 953680: 10, 3498320: 10, 3498832: 11, 3499344: 12, 3499856: 13, 3500368: 14, 3500880: 15, 3500384: 15, 3501392: 16, 3500400: 16, 3501904: 17, 3500416: 17, 3502416: 18, 3500432: 18, 3502928: 19, 3500448: 19, 3503440: 20, 3500960: 20, 3503456: 21, 3501472: 21, 3503472: 22, 3501984: 22, 3503488: 23, 3501968: 23, 3502976: 24, 3503504: 24, 3501952: 24, 3502464: 25, 3503520: 25, 3504032: 26, 3504544: 27, 3505056: 28, 3505040: 29, 3505024: 30, 3505008: 31, 3504992: 32, 3504976: 33, 4018000: 0, 4018512: 1, 4019024: 2, 4018528: 2, 2985808: 3, 4019536: 3, 4018544: 3, 3002192: 4, 4020048: 4, 4018560: 4, 3018576: 5, 4020560: 5, 4018576: 5, 3034960: 6, 4021072: 6, 4018592: 6, 888656: 7, 3051344: 7, 4021584: 7, 4018080: 7, 905040: 8, 2527056: 8, 3575632: 8, 4022096: 8, 921424: 9, 2002768: 9, 4022608: 9, 937808: 10, 1478480: 10, 4023120: 10, 954192: 11, 4023632: 11, 4024144: 12, 4024656: 13, 4025168: 14, 4024672: 14, 4025680: 15, 4024688: 15, 4026192: 16, 4024704: 16, 4026704: 17, 4024720: 17, 4027216: 18, 4024736: 18, 4027728: 19, 4025248: 19, 4027744: 20, 4025760: 20, 4027760: 21, 4026272: 21, 4027776: 22, 4026256: 22, 4027264: 23, 4027792: 23, 4026240: 23, 4026752: 24, 4027808: 24, 4028320: 25, 4028832: 26, 4029344: 27, 4029328: 28, 4029312: 29, 4029296: 30, 4029280: 31, 4029264: 32, 4542800: 0, 4543312: 1, 4542816: 1, 4543824: 2, 4542832: 2, 4544336: 3, 4542848: 3, 2986320: 4, 4544848: 4, 4542864: 4, 3002704: 5, 4545360: 5, 4542880: 5, 3019088: 6, 4545872: 6, 4100432: 6, 3035472: 7, 4546384: 7, 3576144: 7, 889168: 8, 3051856: 8, 4546896: 8, 905552: 9, 2527568: 9, 4547408: 9, 921936: 10, 2003280: 10, 4547920: 10, 938320: 11, 1478992: 11, 4548432: 11, 954704: 12, 4548944: 12, 4549456: 13, 4548960: 13, 4549968: 14, 4548976: 14, 4550480: 15, 4548992: 15, 4550992: 16, 4549008: 16, 4551504: 17, 4549024: 17, 4552016: 18, 4549536: 18, 4552032: 19, 4550048: 19, 4552048: 20, 4550560: 20, 4552064: 21, 4550544: 21, 4551552: 22, 4552080: 22, 4550528: 22, 4551040: 23, 4552096: 23, 4552608: 24, 4553120: 25, 4553632: 26, 4553616: 27, 4553600: 28, 4553584: 29, 4553568: 30, 4553552: 31, 5067600: 0, 5068112: 1, 4559696: 2, 5068624: 2, 4576080: 3, 5069136: 3, 4592464: 4, 5069648: 4, 2986832: 5, 4608848: 5, 5070160: 5, 3003216: 6, 4625232: 6, 5070672: 6, 3019600: 7, 4100944: 7, 5071184: 7, 3035984: 8, 3576656: 8, 5071696: 8, 889680: 9, 3052368: 9, 5072208: 9, 906064: 10, 2528080: 10, 5072720: 10, 922448: 11, 2003792: 11, 5073232: 11, 938832: 12, 1479504: 12, 5073744: 12, 5073248: 12, 955216: 13, 5074256: 13, 5073264: 13, 5074768: 14, 5073280: 14, 5075280: 15, 5073296: 15, 5075792: 16, 5073312: 16, 5076304: 17, 5073824: 17, 5076320: 18, 5074336: 18, 5076336: 19, 5074848: 19, 5076352: 20, 5074832: 20, 5075840: 21, 5076368: 21, 5074816: 21, 5075328: 22, 5076384: 22, 5076896: 23, 5077408: 24, 5077920: 25, 5077904: 26, 5077888: 27, 5077872: 28, 5077856: 29, 5077840: 30, 5592400: 0, 5592912: 1, 5593424: 2, 4560208: 3, 5593936: 3, 4576592: 4, 5594448: 4, 4592976: 5, 5594960: 5, 2987344: 6, 4609360: 6, 5595472: 6, 3003728: 7, 4625744: 7, 5595984: 7, 3020112: 8, 4101456: 8, 5596496: 8, 3036496: 9, 3577168: 9, 5597008: 9, 890192: 10, 3052880: 10, 5597520: 10, 906576: 11, 2528592: 11, 5598032: 11, 5597536: 11, 922960: 12, 2004304: 12, 5598544: 12, 5597552: 12, 939344: 13, 1480016: 13, 5599056: 13, 5597568: 13, 955728: 14, 5599568: 14, 5597584: 14, 5600080: 15, 5597600: 15, 5600592: 16, 5598112: 16, 5600608: 17, 5598624: 17, 5600624: 18, 5599136: 18, 5600640: 19, 5599120: 19, 5600128: 20, 5600656: 20, 5599104: 20, 5599616: 21, 5600672: 21, 5601184: 22, 5601696: 23, 5602208: 24, 5602192: 25, 5602176: 26, 5602160: 27, 5602144: 28, 5602128: 29, 6117200: 0, 6117712: 1, 6118224: 2, 6118736: 3, 4560720: 4, 6119248: 4, 4577104: 5, 6119760: 5, 4593488: 6, 6120272: 6, 2987856: 7, 4609872: 7, 6120784: 7, 3004240: 8, 4626256: 8, 6121296: 8, 3020624: 9, 4101968: 9, 6121808: 9, 3037008: 10, 3577680: 10, 6122320: 10, 6121824: 10, 890704: 11, 3053392: 11, 6122832: 11, 6121840: 11, 907088: 12, 2529104: 12, 6123344: 12, 6121856: 12, 923472: 13, 2004816: 13, 6123856: 13, 6121872: 13, 939856: 14, 1480528: 14, 6124368: 14, 6121888: 14, 956240: 15, 6124880: 15, 6122400: 15, 6124896: 16, 6122912: 16, 6124912: 17, 6123424: 17, 6124928: 18, 6123408: 18, 6124416: 19, 6124944: 19, 6123392: 19, 6123904: 20, 6124960: 20, 6125472: 21, 6125984: 22, 6126496: 23, 6126480: 24, 6126464: 25, 6126448: 26, 6126432: 27, 6126416: 28, 6642000: 0, 6642512: 1, 6643024: 2, 6643536: 3, 6644048: 4, 4561232: 5, 6644560: 5, 4577616: 6, 6645072: 6, 4594000: 7, 6645584: 7, 2988368: 8, 4610384: 8, 6646096: 8, 3004752: 9, 4626768: 9, 6646608: 9, 6646112: 9, 3021136: 10, 4102480: 10, 6647120: 10, 6646128: 10, 3037520: 11, 3578192: 11, 6647632: 11, 6646144: 11, 891216: 12, 3053904: 12, 6648144: 12, 6646160: 12, 907600: 13, 2529616: 13, 6648656: 13, 6646176: 13, 923984: 14, 2005328: 14, 6649168: 14, 6646688: 14, 940368: 15, 1481040: 15, 6649184: 15, 6647200: 15, 956752: 16, 6649200: 16, 6647712: 16, 6649216: 17, 6647696: 17, 6648704: 18, 6649232: 18, 6647680: 18, 6648192: 19, 6649248: 19, 6649760: 20, 6650272: 21, 6650784: 22, 6650768: 23, 6650752: 24, 6650736: 25, 6650720: 26, 6650704: 27, 7166800: 0, 7167312: 1, 7167824: 2, 7168336: 3, 7168848: 4, 7169360: 5, 4561744: 6, 7169872: 6, 4578128: 7, 7170384: 7, 4594512: 8, 7170896: 8, 7170400: 8, 2988880: 9, 4610896: 9, 7171408: 9, 7170416: 9, 3005264: 10, 4627280: 10, 7171920: 10, 7170432: 10, 3021648: 11, 4102992: 11, 7172432: 11, 7170448: 11, 3038032: 12, 3578704: 12, 7172944: 12, 7170464: 12, 891728: 13, 3054416: 13, 7173456: 13, 7170976: 13, 908112: 14, 2530128: 14, 7173472: 14, 7171488: 14, 924496: 15, 2005840: 15, 7173488: 15, 7172000: 15, 940880: 16, 1481552: 16, 7173504: 16, 7171984: 16, 957264: 17, 7172992: 17, 7173520: 17, 7171968: 17, 7172480: 18, 7173536: 18, 7174048: 19, 7174560: 20, 7175072: 21, 7175056: 22, 7175040: 23, 7175024: 24, 7175008: 25, 7174992: 26, 7691600: 0, 7692112: 1, 7692624: 2, 7693136: 3, 7693648: 4, 7694160: 5, 7694672: 6, 4562256: 7, 7695184: 7, 7694688: 7, 4578640: 8, 7695696: 8, 7694704: 8, 4595024: 9, 7696208: 9, 7694720: 9, 2989392: 10, 4611408: 10, 7696720: 10, 7694736: 10, 3005776: 11, 4627792: 11, 7697232: 11, 7694752: 11, 3022160: 12, 4103504: 12, 7697744: 12, 7695264: 12, 3038544: 13, 3579216: 13, 7697760: 13, 7695776: 13, 892240: 14, 3054928: 14, 7697776: 14, 7696288: 14, 908624: 15, 2530640: 15, 7697792: 15, 7696272: 15, 925008: 16, 2006352: 16, 7697280: 16, 7697808: 16, 7696256: 16, 941392: 17, 1482064: 17, 7696768: 17, 7697824: 17, 957776: 18, 7698336: 18, 7698848: 19, 7699360: 20, 7699344: 21, 7699328: 22, 7699312: 23, 7699296: 24, 7699280: 25, 8216400: 0, 8216912: 1, 8217424: 2, 8217936: 3, 8218448: 4, 8218960: 5, 8219472: 6, 8218976: 6, 8219984: 7, 8218992: 7, 4562768: 8, 8220496: 8, 8219008: 8, 4579152: 9, 8221008: 9, 8219024: 9, 4595536: 10, 8221520: 10, 8219040: 10, 2989904: 11, 4611920: 11, 8222032: 11, 8219552: 11, 3006288: 12, 4628304: 12, 8222048: 12, 8220064: 12, 3022672: 13, 4104016: 13, 8222064: 13, 8220576: 13, 3039056: 14, 3579728: 14, 8222080: 14, 8220560: 14, 892752: 15, 3055440: 15, 8221568: 15, 8222096: 15, 8220544: 15, 909136: 16, 2531152: 16, 8221056: 16, 8222112: 16, 925520: 17, 2006864: 17, 8222624: 17, 941904: 18, 1482576: 18, 8223136: 18, 958288: 19, 8223648: 19, 8223632: 20, 8223616: 21, 8223600: 22, 8223584: 23, 8223568: 24, 8741200: 0, 8741712: 1, 8742224: 2, 8742736: 3, 8743248: 4, 8743760: 5, 8743264: 5, 8744272: 6, 8743280: 6, 8744784: 7, 8743296: 7, 8745296: 8, 8743312: 8, 4563280: 9, 8745808: 9, 8743328: 9, 4579664: 10, 8746320: 10, 8743840: 10, 4596048: 11, 8746336: 11, 8744352: 11, 2990416: 12, 4612432: 12, 8746352: 12, 8744864: 12, 3006800: 13, 4628816: 13, 8746368: 13, 8744848: 13, 3023184: 14, 4104528: 14, 8745856: 14, 8746384: 14, 8744832: 14, 3039568: 15, 3580240: 15, 8745344: 15, 8746400: 15, 893264: 16, 3055952: 16, 8746912: 16, 909648: 17, 2531664: 17, 8747424: 17, 926032: 18, 2007376: 18, 8747936: 18, 942416: 19, 1483088: 19, 8747920: 19, 958800: 20, 8747904: 20, 8747888: 21, 8747872: 22, 8747856: 23, 9266000: 0, 9266512: 1, 9267024: 2, 9267536: 3, 9268048: 4, 9267552: 4, 9268560: 5, 9267568: 5, 9269072: 6, 9267584: 6, 9269584: 7, 9267600: 7, 9270096: 8, 9267616: 8, 9270608: 9, 9268128: 9, 4563792: 10, 9270624: 10, 9268640: 10, 4580176: 11, 9270640: 11, 9269152: 11, 4596560: 12, 9270656: 12, 9269136: 12, 2990928: 13, 4612944: 13, 9270144: 13, 9270672: 13, 9269120: 13, 3007312: 14, 4629328: 14, 9269632: 14, 9270688: 14, 3023696: 15, 4105040: 15, 9271200: 15, 3040080: 16, 3580752: 16, 9271712: 16, 893776: 17, 3056464: 17, 9272224: 17, 910160: 18, 2532176: 18, 9272208: 18, 926544: 19, 2007888: 19, 9272192: 19, 942928: 20, 1483600: 20, 9272176: 20, 959312: 21, 9272160: 21, 9272144: 22, 9790800: 0, 9791312: 1, 9791824: 2, 9792336: 3, 9791840: 3, 9792848: 4, 9791856: 4, 9793360: 5, 9791872: 5, 9793872: 6, 9791888: 6, 9794384: 7, 9791904: 7, 9794896: 8, 9792416: 8, 9794912: 9, 9792928: 9, 9794928: 10, 9793440: 10, 4564304: 11, 9794944: 11, 9793424: 11, 4580688: 12, 9794432: 12, 9794960: 12, 9793408: 12, 4597072: 13, 9793920: 13, 9794976: 13, 2991440: 14, 4613456: 14, 9795488: 14, 3007824: 15, 4629840: 15, 9796000: 15, 3024208: 16, 4105552: 16, 9796512: 16, 3040592: 17, 3581264: 17, 9796496: 17, 894288: 18, 3056976: 18, 9796480: 18, 910672: 19, 2532688: 19, 9796464: 19, 927056: 20, 2008400: 20, 9796448: 20, 943440: 21, 1484112: 21, 9796432: 21, 959824: 22, 10315600: 0, 10316112: 1, 10316624: 2, 10316128: 2, 10317136: 3, 10316144: 3, 10317648: 4, 10316160: 4, 10318160: 5, 10316176: 5, 10318672: 6, 10316192: 6, 10319184: 7, 10316704: 7, 10319200: 8, 10317216: 8, 10319216: 9, 10317728: 9, 10319232: 10, 10317712: 10, 10318720: 11, 10319248: 11, 10317696: 11, 4564816: 12, 10318208: 12, 10319264: 12, 4581200: 13, 10319776: 13, 4597584: 14, 10320288: 14, 2991952: 15, 4613968: 15, 10320800: 15, 3008336: 16, 4630352: 16, 10320784: 16, 3024720: 17, 4106064: 17, 10320768: 17, 3041104: 18, 3581776: 18, 10320752: 18, 894800: 19, 3057488: 19, 10320736: 19, 911184: 20, 2533200: 20, 10320720: 20, 927568: 21, 2008912: 21, 943952: 22, 1484624: 22, 960336: 23, 10840400: 0, 10840912: 1, 10840416: 1, 10841424: 2, 10840432: 2, 10841936: 3, 10840448: 3, 10842448: 4, 10840464: 4, 10842960: 5, 10840480: 5, 10843472: 6, 10840992: 6, 10843488: 7, 10841504: 7, 10843504: 8, 10842016: 8, 10843520: 9, 10842000: 9, 10843008: 10, 10843536: 10, 10841984: 10, 10842496: 11, 10843552: 11, 10844064: 12, 4565328: 13, 10844576: 13, 4581712: 14, 10845088: 14, 4598096: 15, 10845072: 15, 2992464: 16, 4614480: 16, 10845056: 16, 3008848: 17, 4630864: 17, 10845040: 17, 3025232: 18, 4106576: 18, 10845024: 18, 3041616: 19, 3582288: 19, 10845008: 19, 895312: 20, 3058000: 20, 911696: 21, 2533712: 21, 928080: 22, 2009424: 22, 944464: 23, 1485136: 23, 960848: 24, 11365200: 0, 11365712: 1, 10857296: 2, 11366224: 2, 10873680: 3, 11366736: 3, 10890064: 4, 11367248: 4, 10906448: 5, 11367760: 5, 10922832: 6, 11367776: 6, 11365280: 7, 11367792: 7, 11365792: 8, 11367808: 8, 11366304: 9, 11367296: 9, 11367824: 9, 11366288: 10, 11366784: 10, 11367840: 10, 11366272: 11, 11368352: 11, 11368864: 12, 11369376: 13, 4565840: 14, 11369360: 14, 4582224: 15, 11369344: 15, 4598608: 16, 11369328: 16, 2992976: 17, 4614992: 17, 11369312: 17, 3009360: 18, 4631376: 18, 11369296: 18, 3025744: 19, 4107088: 19, 3042128: 20, 3582800: 20, 895824: 21, 3058512: 21, 912208: 22, 2534224: 22, 928592: 23, 2009936: 23, 944976: 24, 1485648: 24, 961360: 25, 11890000: 0, 11890512: 1, 11891024: 2, 10857808: 3, 11891536: 3, 10874192: 4, 11892048: 4, 10890576: 5, 11892064: 5, 10906960: 6, 11892080: 6, 10923344: 7, 11892096: 7, 11447632: 8, 11891584: 8, 11892112: 8, 11890080: 9, 11891072: 9, 11892128: 9, 11890592: 10, 11890560: 10, 11892640: 10, 11890576: 11, 11893152: 11, 11893664: 12, 11893648: 13, 11893632: 14, 4566352: 15, 11893616: 15, 4582736: 16, 11893600: 16, 4599120: 17, 11893584: 17, 2993488: 18, 4615504: 18, 3009872: 19, 4631888: 19, 3026256: 20, 4107600: 20, 3042640: 21, 3583312: 21, 896336: 22, 3059024: 22, 912720: 23, 2534736: 23, 929104: 24, 2010448: 24, 945488: 25, 1486160: 25, 961872: 26, 12414800: 0, 12415312: 1, 12415824: 2, 12416336: 3, 10858320: 4, 12416352: 4, 10874704: 5, 12416368: 5, 10891088: 6, 12416384: 6, 10907472: 7, 12415872: 7, 12416400: 7, 10923856: 8, 12415360: 8, 12416416: 8, 11448144: 9, 12414848: 9, 12416928: 9, 11972432: 10, 12414864: 10, 12417440: 10, 12414880: 11, 12417952: 11, 12417936: 12, 12417920: 13, 12417904: 14, 12417888: 15, 4566864: 16, 12417872: 16, 4583248: 17, 4599632: 18, 2994000: 19, 4616016: 19, 3010384: 20, 4632400: 20, 3026768: 21, 4108112: 21, 3043152: 22, 3583824: 22, 896848: 23, 3059536: 23, 913232: 24, 2535248: 24, 929616: 25, 2010960: 25, 946000: 26, 1486672: 26, 962384: 27, 12939600: 0, 12940112: 1, 12940624: 2, 12940640: 3, 12940656: 4, 10858832: 5, 12940672: 5, 10875216: 6, 12940160: 6, 12940688: 6, 10891600: 7, 12939648: 7, 12940704: 7, 10907984: 8, 12464464: 8, 12941216: 8, 10924368: 9, 12480848: 9, 12941728: 9, 11448656: 10, 12497232: 10, 12942240: 10, 11972944: 11, 12942224: 11, 12942208: 12, 12942192: 13, 12942176: 14, 12942160: 15, 4567376: 17, 4583760: 18, 4600144: 19, 2994512: 20, 4616528: 20, 3010896: 21, 4632912: 21, 3027280: 22, 4108624: 22, 3043664: 23, 3584336: 23, 897360: 24, 3060048: 24, 913744: 25, 2535760: 25, 930128: 26, 2011472: 26, 946512: 27, 1487184: 27, 962896: 28, 13464400: 0, 13464912: 1, 13464928: 2, 13464944: 3, 13464960: 4, 13464448: 5, 13464976: 5, 10859344: 6, 12989264: 6, 13464992: 6, 10875728: 7, 12464976: 7, 13465504: 7, 10892112: 8, 12481360: 8, 13466016: 8, 10908496: 9, 12497744: 9, 13466528: 9, 10924880: 10, 11973456: 10, 13466512: 10, 11449168: 11, 13466496: 11, 13466480: 12, 13466464: 13, 13466448: 14, 4567888: 18, 4584272: 19, 4600656: 20, 2995024: 21, 4617040: 21, 3011408: 22, 4633424: 22, 3027792: 23, 4109136: 23, 3044176: 24, 3584848: 24, 897872: 25, 3060560: 25, 914256: 26, 2536272: 26, 930640: 27, 2011984: 27, 947024: 28, 1487696: 28, 963408: 29, 13989200: 0, 13989216: 1, 13989232: 2, 13989248: 3, 13514064: 4, 13989264: 4, 12989776: 5, 13989280: 5, 12465488: 6, 13989792: 6, 10859856: 7, 12481872: 7, 13990304: 7, 10876240: 8, 12498256: 8, 13990816: 8, 10892624: 9, 11973968: 9, 13990800: 9, 10909008: 10, 11449680: 10, 13990784: 10, 10925392: 11, 13990768: 11, 13990752: 12, 13990736: 13, 4568400: 19, 4584784: 20, 4601168: 21, 2995536: 22, 4617552: 22, 3011920: 23, 4633936: 23, 3028304: 24, 4109648: 24, 3044688: 25, 3585360: 25, 898384: 26, 3061072: 26, 914768: 27, 2536784: 27, 931152: 28, 2012496: 28, 947536: 29, 1488208: 29, 963920: 30, 15563600: 0, 15563616: 1, 15563632: 2, 15563648: 3, 15563664: 4, 15563680: 5, 15121232: 6, 14596944: 7, 14072656: 8, 14056272: 9, 14039888: 10, 13515600: 11, 14023504: 11, 12991312: 12, 14007120: 12, 12467024: 13, 12483408: 14, 12499792: 15, 11975504: 16, 11451216: 17, 10926928: 18, 10910544: 19, 10894160: 20, 10861392: 20, 10877776: 21, 4569936: 32, 4586320: 33, 4602704: 34, 2997072: 35, 4619088: 35, 3013456: 36, 4635472: 36, 3029840: 37, 4111184: 37, 3046224: 38, 3586896: 38, 899920: 39, 3062608: 39, 916304: 40, 2538320: 40, 932688: 41, 2014032: 41, 949072: 42, 1489744: 42, 965456: 43, 885600: 0, 885616: 1, 885632: 2, 885648: 3, 885664: 4, 886176: 5, 887648: 6, 886688: 6, 887664: 7, 887200: 7, 887680: 8, 887712: 8, 889184: 9, 887696: 9, 888224: 9, 889200: 10, 888736: 10, 889216: 11, 889248: 11, 889232: 12, 895328: 21, 895344: 22, 895360: 23, 895376: 24, 895392: 25, 895904: 26, 898400: 27, 896416: 27, 898416: 28, 896928: 28, 898432: 29, 896912: 29, 897920: 30, 898448: 30, 896896: 30, 897408: 31, 898464: 31, 898976: 32, 899488: 33, 900000: 34, 899984: 35, 899968: 36, 899952: 37, 899936: 38, 2984800: 0, 2984816: 1, 2984832: 2, 2984848: 3, 2984864: 4, 2986336: 5, 2526048: 5, 2985376: 5, 2986352: 6, 2001760: 6, 2985888: 6, 904032: 7, 2986368: 7, 1477472: 7, 2986400: 7, 920416: 8, 2986384: 8, 953184: 8, 936800: 9, 2992480: 17, 2992496: 18, 2992512: 19, 2992528: 20, 2992544: 21, 2993056: 22, 2995552: 23, 2993568: 23, 2995568: 24, 2994080: 24, 2995584: 25, 2994064: 25, 2995072: 26, 2995600: 26, 2994048: 26, 2994560: 27, 2995616: 27, 2996128: 28, 2996640: 29, 2997152: 30, 2997136: 31, 2997120: 32, 2997104: 33, 2997088: 34, 4559200: 0, 4559216: 1, 4559232: 2, 4559248: 3, 4559264: 4, 4100448: 5, 3002720: 6, 3576160: 6, 3019104: 7, 3051872: 7, 3035488: 8, 2527584: 8, 2003296: 9, 905568: 10, 1479008: 10, 921952: 11, 954720: 11, 938336: 12, 4565344: 14, 4565360: 15, 4565376: 16, 4565392: 17, 4565408: 18, 4565920: 19, 4568416: 20, 4566432: 20, 4568432: 21, 4566944: 21, 4568448: 22, 4566928: 22, 4567936: 23, 4568464: 23, 4566912: 23, 4567424: 24, 4568480: 24, 4568992: 25, 4569504: 26, 4570016: 27, 4570000: 28, 4569984: 29, 4569968: 30, 4569952: 31, 10856800: 0, 10856816: 1, 10856832: 2, 10856848: 3, 10856864: 4, 10857376: 5, 10857888: 6, 10858400: 7, 10859872: 8, 10858384: 8, 10859888: 9, 10858368: 9, 10859904: 10, 10858880: 10, 10859392: 11, 10859920: 11, 10859936: 12, 10860448: 13, 10860960: 14, 4581728: 15, 10861472: 15, 4598112: 16, 10861456: 16, 4614496: 17, 10861440: 17, 3008864: 18, 4630880: 18, 10861424: 18, 3025248: 19, 4106592: 19, 10861408: 19, 3041632: 20, 3582304: 20, 3058016: 21, 911712: 22, 2533728: 22, 928096: 23, 2009440: 23, 944480: 24, 1485152: 24, 960864: 25, 14005600: 0, 14005616: 1, 14005632: 2, 13514080: 3, 14005648: 3, 12989792: 4, 14005664: 4, 12465504: 5, 14006176: 5, 12481888: 6, 14006688: 6, 12498272: 7, 14007200: 7, 11973984: 8, 14007184: 8, 10876256: 9, 11449696: 9, 14007168: 9, 10892640: 10, 10925408: 10, 14007152: 10, 10909024: 11, 14007136: 11, 4584800: 21, 4601184: 22, 4617568: 23, 3011936: 24, 4633952: 24, 3028320: 25, 4109664: 25, 3044704: 26, 3585376: 26, 3061088: 27, 914784: 28, 2536800: 28, 931168: 29, 2012512: 29, 947552: 30, 1488224: 30, 963936: 31, 15580000: 0, 15580016: 1, 15580032: 2, 15580048: 3, 15580064: 4, 15121248: 5, 14596960: 6, 14072672: 7, 14056288: 8, 14039904: 9, 13515616: 10, 14023520: 10, 12991328: 11, 12467040: 12, 12483424: 13, 12499808: 14, 11975520: 15, 11451232: 16, 10926944: 17, 10910560: 18, 10894176: 19, 10877792: 20, 4586336: 32, 4602720: 33, 4619104: 34, 3013472: 35, 4635488: 35, 3029856: 36, 4111200: 36, 3046240: 37, 3586912: 37, 3062624: 38, 916320: 39, 2538336: 39, 932704: 40, 2014048: 40, 949088: 41, 1489760: 41, 965472: 42, 902000: 0, 902016: 1, 902032: 2, 902048: 3, 902560: 4, 903072: 5, 903584: 6, 904096: 7, 904048: 8, 904080: 8, 904608: 8, 904064: 9, 905120: 9, 905632: 10, 905584: 11, 905616: 11, 905600: 12, 911728: 23, 911744: 24, 911760: 25, 911776: 26, 912288: 27, 912800: 28, 914800: 29, 913312: 29, 914816: 30, 913296: 30, 914304: 31, 914832: 31, 913280: 31, 913792: 32, 914848: 32, 915360: 33, 915872: 34, 916384: 35, 916368: 36, 916352: 37, 916336: 38, 3001200: 0, 3001216: 1, 3001232: 2, 3001248: 3, 2526064: 4, 3001760: 4, 2001776: 5, 3002272: 5, 1477488: 6, 3002784: 6, 3002736: 7, 953200: 7, 3002768: 7, 3002752: 8, 936816: 8, 920432: 9, 3008880: 19, 3008896: 20, 3008912: 21, 3008928: 22, 3009440: 23, 3009952: 24, 3011952: 25, 3010464: 25, 3011968: 26, 3010448: 26, 3011456: 27, 3011984: 27, 3010432: 27, 3010944: 28, 3012000: 28, 3012512: 29, 3013024: 30, 3013536: 31, 3013520: 32, 3013504: 33, 3013488: 34, 4575600: 0, 4575616: 1, 4575632: 2, 4575648: 3, 4100464: 4, 3576176: 5, 3051888: 6, 2527600: 7, 3035504: 7, 3019120: 8, 2003312: 8, 1479024: 9, 954736: 10, 938352: 11, 921968: 12, 4581744: 16, 4581760: 17, 4581776: 18, 4581792: 19, 4582304: 20, 4582816: 21, 4584816: 22, 4583328: 22, 4584832: 23, 4583312: 23, 4584320: 24, 4584848: 24, 4583296: 24, 4583808: 25, 4584864: 25, 4585376: 26, 4585888: 27, 4586400: 28, 4586384: 29, 4586368: 30, 4586352: 31, 10873200: 0, 10873216: 1, 10873232: 2, 10873248: 3, 10873760: 4, 10874272: 5, 10874784: 6, 10874768: 7, 10874752: 8, 10875264: 9, 10876272: 10, 10875776: 10, 10876288: 11, 10876304: 12, 10876320: 13, 10876832: 14, 10877344: 15, 10877856: 16, 4598128: 17, 10877840: 17, 4614512: 18, 10877824: 18, 4630896: 19, 10877808: 19, 3025264: 20, 4106608: 20, 3041648: 21, 3582320: 21, 3058032: 22, 2533744: 23, 928112: 24, 2009456: 24, 944496: 25, 1485168: 25, 960880: 26, 14022000: 0, 14022016: 1, 13514096: 2, 14022032: 2, 12989808: 3, 14022048: 3, 12465520: 4, 14022560: 4, 12481904: 5, 14023072: 5, 12498288: 6, 14023584: 6, 11974000: 7, 14023568: 7, 11449712: 8, 14023552: 8, 10925424: 9, 14023536: 9, 10909040: 10, 10892656: 11, 4601200: 23, 4617584: 24, 4633968: 25, 3028336: 26, 4109680: 26, 3044720: 27, 3585392: 27, 3061104: 28, 2536816: 29, 931184: 30, 2012528: 30, 947568: 31, 1488240: 31, 963952: 32, 15596400: 0, 15596416: 1, 15596432: 2, 15596448: 3, 15121264: 4, 14596976: 5, 14072688: 6, 14056304: 7, 14039920: 8, 13515632: 9, 12991344: 10, 12467056: 11, 12483440: 12, 12499824: 13, 11975536: 14, 11451248: 15, 10926960: 16, 10910576: 17, 10894192: 18, 4602736: 32, 4619120: 33, 4635504: 34, 3029872: 35, 4111216: 35, 3046256: 36, 3586928: 36, 3062640: 37, 2538352: 38, 932720: 39, 2014064: 39, 949104: 40, 1489776: 40, 965488: 41, 918400: 0, 918416: 1, 918432: 2, 918944: 3, 919456: 4, 919968: 5, 920480: 6, 920464: 7, 920992: 7, 920448: 8, 921504: 8, 922016: 9, 922000: 10, 921984: 11, 928128: 25, 928144: 26, 928160: 27, 928672: 28, 929184: 29, 929696: 30, 931200: 31, 929680: 31, 930688: 32, 931216: 32, 929664: 32, 930176: 33, 931232: 33, 931744: 34, 932256: 35, 932768: 36, 932752: 37, 932736: 38, 3017600: 0, 3017616: 1, 3017632: 2, 2526080: 3, 3018144: 3, 2001792: 4, 3018656: 4, 1477504: 5, 3019168: 5, 953216: 6, 3019152: 6, 936832: 7, 3019136: 7, 3025280: 21, 3025296: 22, 3025312: 23, 3025824: 24, 3026336: 25, 3026848: 26, 3028352: 27, 3026832: 27, 3027840: 28, 3028368: 28, 3026816: 28, 3027328: 29, 3028384: 29, 3028896: 30, 3029408: 31, 3029920: 32, 3029904: 33, 3029888: 34, 4592000: 0, 4592016: 1, 4592032: 2, 4100480: 3, 3576192: 4, 3051904: 5, 2527616: 6, 3035520: 6, 2003328: 7, 1479040: 8, 954752: 9, 938368: 10, 4598144: 18, 4598160: 19, 4598176: 20, 4598688: 21, 4599200: 22, 4599712: 23, 4601216: 24, 4599696: 24, 4600704: 25, 4601232: 25, 4599680: 25, 4600192: 26, 4601248: 26, 4601760: 27, 4602272: 28, 4602784: 29, 4602768: 30, 4602752: 31, 10889600: 0, 10889616: 1, 10889632: 2, 10890144: 3, 10890656: 4, 10891168: 5, 10891152: 6, 10891136: 7, 10891648: 8, 10892160: 9, 10892672: 10, 10892688: 11, 10892704: 12, 10893216: 13, 10893728: 14, 10894240: 15, 10894224: 16, 10894208: 17, 4614528: 19, 4630912: 20, 4106624: 21, 3041664: 22, 3582336: 22, 3058048: 23, 2533760: 24, 2009472: 25, 944512: 26, 1485184: 26, 960896: 27, 12464000: 0, 12464512: 1, 12464016: 1, 12465024: 2, 12464032: 2, 12465536: 3, 11972480: 3, 12465552: 4, 11448192: 4, 12465568: 5, 10923904: 5, 12466080: 6, 10907520: 6, 12466592: 7, 12467104: 8, 12467088: 9, 12467072: 10, 4616064: 26, 4632448: 27, 4108160: 28, 3043200: 29, 3583872: 29, 3059584: 30, 2535296: 31, 2011008: 32, 946048: 33, 1486720: 33, 962432: 34, 12988800: 0, 12989312: 1, 12480896: 2, 12989824: 2, 12497280: 3, 12989840: 3, 11972992: 4, 12989856: 4, 11448704: 5, 12990368: 5, 10924416: 6, 12990880: 6, 10908032: 7, 12991392: 7, 12991376: 8, 12991360: 9, 4616576: 27, 4632960: 28, 4108672: 29, 3043712: 30, 3584384: 30, 3060096: 31, 2535808: 32, 2011520: 33, 946560: 34, 1487232: 34, 962944: 35, 13513600: 0, 13514112: 1, 13514128: 2, 12481408: 3, 13514144: 3, 12497792: 4, 13514656: 4, 11973504: 5, 13515168: 5, 11449216: 6, 13515680: 6, 10924928: 7, 13515664: 7, 10908544: 8, 13515648: 8, 4617088: 26, 4633472: 27, 4109184: 28, 3044224: 29, 3584896: 29, 3060608: 30, 2536320: 31, 2012032: 32, 947072: 33, 1487744: 33, 963456: 34, 14038400: 0, 14038416: 1, 14038432: 2, 14038944: 3, 12481920: 4, 14039456: 4, 12498304: 5, 14039968: 5, 11974016: 6, 14039952: 6, 11449728: 7, 14039936: 7, 10925440: 8, 10909056: 9, 4617600: 25, 4633984: 26, 4109696: 27, 3044736: 28, 3585408: 28, 3061120: 29, 2536832: 30, 2012544: 31, 947584: 32, 1488256: 32, 963968: 33, 15612800: 0, 15612816: 1, 15612832: 2, 15121280: 3, 14596992: 4, 14072704: 5, 14056320: 6, 12483456: 11, 12499840: 12, 11975552: 13, 11451264: 14, 10926976: 15, 10910592: 16, 4619136: 32, 4635520: 33, 4111232: 34, 3046272: 35, 3586944: 35, 3062656: 36, 2538368: 37, 2014080: 38, 949120: 39, 1489792: 39, 965504: 40, 934800: 0, 934816: 1, 935328: 2, 935840: 3, 936352: 4, 936864: 5, 936848: 6, 937376: 6, 937888: 7, 938400: 8, 938384: 9, 944528: 27, 944544: 28, 945056: 29, 945568: 30, 946080: 31, 946064: 32, 947600: 33, 947616: 34, 948128: 35, 948640: 36, 949152: 37, 949136: 38, 3034000: 0, 3034016: 1, 2526096: 2, 3034528: 2, 2001808: 3, 3035040: 3, 1477520: 4, 3035552: 4, 953232: 5, 3035536: 5, 3041680: 23, 3041696: 24, 3042208: 25, 3042720: 26, 3043232: 27, 3043216: 28, 3044752: 29, 3044768: 30, 3045280: 31, 3045792: 32, 3046304: 33, 3046288: 34, 4608400: 0, 4608416: 1, 4100496: 2, 3576208: 3, 3051920: 4, 2527632: 5, 2003344: 6, 1479056: 7, 954768: 8, 4614544: 20, 4614560: 21, 4615072: 22, 4615584: 23, 4616096: 24, 4616080: 25, 4617616: 26, 4617632: 27, 4618144: 28, 4618656: 29, 4619168: 30, 4619152: 31, 10906000: 0, 10906016: 1, 10906528: 2, 10907040: 3, 10907552: 4, 10907536: 5, 10909072: 10, 10909088: 11, 10909600: 12, 10910112: 13, 10910624: 14, 10910608: 15, 4630928: 21, 4106640: 22, 3582352: 23, 3058064: 24, 2533776: 25, 2009488: 26, 1485200: 27, 960912: 28, 12480400: 0, 12480416: 1, 11972496: 2, 11448208: 3, 10923920: 4, 12481936: 5, 12481952: 6, 12482464: 7, 12482976: 8, 12483488: 9, 12483472: 10, 4632464: 26, 4108176: 27, 3583888: 28, 3059600: 29, 2535312: 30, 2011024: 31, 1486736: 32, 962448: 33, 14054800: 0, 14054816: 1, 14055328: 2, 14055840: 3, 14056352: 4, 14056336: 5, 12498320: 6, 11974032: 7, 11449744: 8, 10925456: 9, 4634000: 27, 4109712: 28, 3585424: 29, 3061136: 30, 2536848: 31, 2012560: 32, 1488272: 33, 963984: 34, 15629200: 0, 15629216: 1, 15121296: 2, 14597008: 3, 14072720: 4, 12499856: 11, 11975568: 12, 11451280: 13, 10926992: 14, 4635536: 32, 4111248: 33, 3586960: 34, 3062672: 35, 2538384: 36, 2014096: 37, 1489808: 38, 965520: 39, 951200: 0, 951712: 1, 952224: 2, 952736: 3, 953248: 4, 953760: 5, 954272: 6, 954784: 7, 960928: 29, 961440: 30, 961952: 31, 962464: 32, 964000: 35, 964512: 36, 965024: 37, 965536: 38, 1476000: 0, 1476512: 1, 1477024: 2, 1477536: 3, 1478048: 4, 1478560: 5, 1479072: 6, 1485216: 28, 1485728: 29, 1486240: 30, 1486752: 31, 1488288: 34, 1488800: 35, 1489312: 36, 1489824: 37, 2000800: 0, 2001312: 1, 2001824: 2, 2002336: 3, 2002848: 4, 2003360: 5, 2009504: 27, 2010016: 28, 2010528: 29, 2011040: 30, 2012576: 33, 2013088: 34, 2013600: 35, 2014112: 36, 2525600: 0, 2526112: 1, 2526624: 2, 2527136: 3, 2527648: 4, 2533792: 26, 2534304: 27, 2534816: 28, 2535328: 29, 2536864: 32, 2537376: 33, 2537888: 34, 2538400: 35, 3050400: 0, 3050912: 1, 3051424: 2, 3051936: 3, 3058080: 25, 3058592: 26, 3059104: 27, 3059616: 28, 3061152: 31, 3061664: 32, 3062176: 33, 3062688: 34, 3575200: 0, 3575712: 1, 3576224: 2, 3582368: 24, 3582880: 25, 3583392: 26, 3583904: 27, 3585440: 30, 3585952: 31, 3586464: 32, 3586976: 33, 4100000: 0, 4100512: 1, 4106656: 23, 4107168: 24, 4107680: 25, 4108192: 26, 4109728: 29, 4110240: 30, 4110752: 31, 4111264: 32, 4624800: 0, 4630944: 22, 4631456: 23, 4631968: 24, 4632480: 25, 4634016: 28, 4634528: 29, 4635040: 30, 4635552: 31, 10922400: 0, 10922912: 1, 10923424: 2, 10923936: 3, 10925472: 10, 10925984: 11, 10926496: 12, 10927008: 13, 11447200: 0, 11447712: 1, 11448224: 2, 11449760: 9, 11450272: 10, 11450784: 11, 11451296: 12, 11972000: 0, 11972512: 1, 11974048: 8, 11974560: 9, 11975072: 10, 11975584: 11, 12496800: 0, 12498336: 7, 12498848: 8, 12499360: 9, 12499872: 10, 14071200: 0, 14071712: 1, 14072224: 2, 14072736: 3, 14596000: 0, 14596512: 1, 14597024: 2, 15120800: 0, 15121312: 1, 15645600: 0}
@@ -1,95 +1,168 @@
-
-import bitstruct.c as bitstruct
-from gameState import Directions, Location, GameState
-
-
-class Node:
-    def __init__(self, loc: Location, dist: int):
-        self.loc = loc
-        self.dist = dist
-
-def comp_locations(locA: Location, locB: Location) -> bool:
-    return locA.row == locB.row and locA.col == locB.col
-
-def comp_location_pair(locA1: Location, locA2: Location, locB1: Location, locB2: Location) -> bool:
-    return (comp_locations(locA1, locB1) and comp_locations(locA2, locB2)) or \
-            (comp_locations(locA1, locB2) and comp_locations(locA2, locB1))
-
-def getKey(loc1: Location, loc2: Location) -> int:
-    r1 = loc1.row
-    c1 = loc1.col
-    r2 = loc2.row
-    c2 = loc2.col
-
-    if ((r1, c1) > (r2, c2)):
-        r1, c1, r2, c2 = r2, c2, r1, c1
-    return int.from_bytes(bitstruct.pack('u5u5u5u5', r1, c1, r2, c2), "big")
-
-# use BFS to get dist btwn loc
-def getDistance(loc: Location, state: GameState, dist_dict, count):
-
-    # BFS queue
-    firstNode = Node(loc, 0)
-    queue = [firstNode]
-    visited = set()
-    if str(firstNode.loc) + " " + str(firstNode.loc.row) not in visited:
-        count += 1
-        # dist_dict[getKey(loc, loc)] = (0, loc, loc)
-        dist_dict[getKey(loc, loc)] = 0
-        visited.add(str(firstNode.loc))
-    
-
-    while queue:
-        # pop from queue
-        currNode = queue.pop(0)
-
-        # Loop over the directions
-        for direction in Directions:
-
-            # If the direction is none, skip it
-            if direction == Directions.NONE:
-                continue
-
-            # get next location (deep copy)
-            nextLoc = Location(state)
-            nextNode = Node(nextLoc, currNode.dist + 1)
-            nextNode.loc.col = currNode.loc.col
-            nextNode.loc.row = currNode.loc.row
-            nextNode.loc.setDirection(direction)
-            valid = nextNode.loc.advance()
-
-            # avoid same node twice
-            # check this is a valid move
-            if str(nextNode.loc) not in visited and valid:
-                count += 1
-                # dist_dict[getKey(loc, nextNode.loc)] = (nextNode.dist, loc, nextNode.loc)
-                dist_dict[getKey(loc, nextNode.loc)] = nextNode.dist
-                queue.append(nextNode)
-                visited.add(str(nextNode.loc))
-    return count
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+from multiprocessing import Pool
+from walls import wallArr
+
+# Maze dimensions (cells are indexed by row * NUM_COLS + col)
+NUM_ROWS = 31
+NUM_COLS = 28
+NUM_CELLS = NUM_ROWS * NUM_COLS
+
+# Distance stored for pairs of cells that cannot reach each other (walls)
+UNREACHABLE = 0xff
+
+# Binary artifact: a header, followed by a dense (cell index x cell index)
+# uint8 distance matrix
+DIST_MATRIX_PATH = os.path.join(os.path.dirname(__file__), 'pachattan.bin')
+
+# Header: magic, format version, rows, cols, sha256 of the wall bitsets
+HEADER = struct.Struct('>4sHBB32s')
+MAGIC = b'PACD'
+VERSION = 2
+
+
+def wallHash(walls: list[int]) -> bytes:
+    '''
+    Hash of the wall bitsets, used to detect a stale distance matrix
+    '''
+
+    return hashlib.sha256(struct.pack(f'>{len(walls)}I', *walls)).digest()
+
+def getNeighbors(walls: list[int]) -> list[list[int]]:
+    '''
+    Open neighbors (cell indices) of every open cell
+    '''
+
+    def isOpen(row: int, col: int) -> bool:
+        return (0 <= row < NUM_ROWS) and (0 <= col < NUM_COLS) and \
+            not ((walls[row] >> col) & 1)
+
+    neighbors: list[list[int]] = [[] for _ in range(NUM_CELLS)]
+    for row in range(NUM_ROWS):
+        for col in range(NUM_COLS):
+            if isOpen(row, col):
+                # Same order as Directions: up, left, down, right
+                for dRow, dCol in ((-1, 0), (0, -1), (1, 0), (0, 1)):
+                    if isOpen(row + dRow, col + dCol):
+                        neighbors[row * NUM_COLS + col].append((row + dRow) * NUM_COLS + col + dCol)
+    return neighbors
+
+def bfsRows(sources: list[int], neighbors: list[list[int]]) -> list[tuple[int, bytes]]:
+    '''
+    Breadth-first search from each source cell, returning one matrix row each
+    '''
+
+    rows = []
+    for source in sources:
+        dist = bytearray([UNREACHABLE]) * NUM_CELLS
+        dist[source] = 0
+        queue = [source]
+        head = 0
+        while head < len(queue):
+            cell = queue[head]
+            head += 1
+            nextDist = dist[cell] + 1
+            for nextCell in neighbors[cell]:
+                if dist[nextCell] == UNREACHABLE:
+                    dist[nextCell] = nextDist
+                    queue.append(nextCell)
+        rows.append((source, bytes(dist)))
+    return rows
+
+def generate(walls: list[int] = wallArr, workers: int = 0) -> bytes:
+    '''
+    Compute all-pairs shortest paths for the maze, split across worker processes
+    '''
+
+    neighbors = getNeighbors(walls)
+    sources = [cell for cell in range(NUM_CELLS) if neighbors[cell]]
+    workers = workers or os.cpu_count() or 1
+
+    # Split the sources into one chunk per worker
+    chunks = [sources[i::workers] for i in range(workers)]
+    if workers > 1:
+        with Pool(workers) as pool:
+            results = pool.starmap(bfsRows, [(chunk, neighbors) for chunk in chunks])
+    else:
+        results = [bfsRows(sources, neighbors)]
+
+    matrix = bytearray([UNREACHABLE]) * (NUM_CELLS * NUM_CELLS)
+    for rows in results:
+        for source, dist in rows:
+            matrix[source * NUM_CELLS:(source + 1) * NUM_CELLS] = dist
+    return bytes(matrix)
+
+def writeDistMatrix(path: str = DIST_MATRIX_PATH, walls: list[int] = wallArr, workers: int = 0) -> bytes:
+    '''
+    Generate the distance matrix and write it (with its header) to a file
+    '''
+
+    data = HEADER.pack(MAGIC, VERSION, NUM_ROWS, NUM_COLS, wallHash(walls)) + \
+        generate(walls, workers)
+
+    # Write to a temporary file first, so readers never see a partial matrix
+    tmpPath = f'{path}.{os.getpid()}.tmp'
+    with open(tmpPath, 'wb') as matrixFile:
+        matrixFile.write(data)
+    os.replace(tmpPath, path)
+    return data
+
+def isCurrent(header: bytes, walls: list[int] = wallArr) -> bool:
+    '''
+    Check whether a distance matrix header matches this version and maze
+    '''
+
+    if len(header) < HEADER.size:
+        return False
+    return HEADER.unpack_from(header) == \
+        (MAGIC, VERSION, NUM_ROWS, NUM_COLS, wallHash(walls))
+
+def loadDistMatrix(path: str = DIST_MATRIX_PATH) -> memoryview:
+    '''
+    Memory-map the distance matrix artifact (read-only), indexed by
+    (row1 * 28 + col1) * 868 + (row2 * 28 + col2); the artifact is
+    regenerated first if it is missing or was built for different walls,
+    in this process (this runs on import, where starting a process pool
+    would re-import the module in each child under the spawn start method,
+    so the parallel BFS is only used by main)
+    '''
+
+    try:
+        with open(path, 'rb') as matrixFile:
+            header = matrixFile.read(HEADER.size)
+            if isCurrent(header):
+                return memoryview(mmap.mmap(matrixFile.fileno(), 0, access=mmap.ACCESS_READ))[HEADER.size:]
+    except FileNotFoundError:
+        pass
+
+    print(f'regenerating Pachattan distances ({path})')
+    try:
+        data = writeDistMatrix(path, workers=1)
+    except OSError: # read-only checkout: keep the matrix in memory only
+        data = HEADER.pack(MAGIC, VERSION, NUM_ROWS, NUM_COLS, wallHash(wallArr)) + generate(workers=1)
+    return memoryview(data)[HEADER.size:]
 
 
 def main():
 
-    state: GameState = GameState()
-
-    dist_dict = {}
-    count = 0
-    wall_count = 0
+    parser = argparse.ArgumentParser(description='Generate the Pachattan distance matrix')
+    parser.add_argument('-o', '--output', default=DIST_MATRIX_PATH, help='artifact path')
+    parser.add_argument('-j', '--workers', type=int, default=0, help='worker processes (default: all cores)')
+    parser.add_argument('-f', '--force', action='store_true', help='regenerate even if up to date')
+    args = parser.parse_args()
 
+    if not args.force and os.path.exists(args.output):
+        with open(args.output, 'rb') as matrixFile:
+            if isCurrent(matrixFile.read(HEADER.size)):
+                print(f'{args.output} is up to date')
+                return
 
-    for col in range(28):
-        for row in range(31):
-            if state.wallAt(col=col, row=row):
-                wall_count += 1
-                continue
-            loc: Location = Location(state)
-            loc.col = col
-            loc.row = row
-            count = getDistance(loc, state, dist_dict, count)
-    print(dist_dict)
+    writeDistMatrix(args.output, workers=args.workers)
+    print(f'wrote {args.output}')
 
-        
-    
 
-# main()
\ No newline at end of file
+if __name__ == '__main__':
+    main()
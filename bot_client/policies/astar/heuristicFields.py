@@ -0,0 +1,90 @@
+# NumPy (for computing fields over all cells at once)
+import numpy as np
+
+# Game state
+from gameState import *
+
+# Internal representation of walls
+from walls import wallArr
+
+# Constant of the danger terms (K >> distance, see AStarPolicy.fCostMultiplier)
+DANGER_K: int = 128
+
+# Cell of the ghost lair
+LAIR_CELL: int = 11 * 28 + 13
+
+# Open cells (Pacman gets no lair penalty inside walls)
+OPEN_CELLS: np.ndarray = np.array(
+	[not ((wallArr[cell // 28] >> (cell % 28)) & 1) for cell in range(868)], dtype=np.int64
+)
+
+class HeuristicFields:
+	'''
+	Heuristic terms of the A-Star policy, precomputed over all cells from the
+	Pachattan distance matrix, and read by Pacman's cell index: the danger of
+	the ghosts (the f-cost multiplier, a sum of one field per non-frightened
+	ghost, and per spawning ghost) and the attraction of the target, victim
+	and fruit (distance fields, which the h-cost combines); fields are built
+	once per cell, as they are needed, so a ghost configuration or target
+	only costs a few lookups
+	'''
+
+	def __init__(self, distMatrix: memoryview) -> None:
+
+		# Pachattan distances, indexed by [cell1, cell2] (one byte per pair)
+		self.dist: np.ndarray = np.frombuffer(distMatrix, dtype=np.uint8).reshape(868, 868)
+
+		# Distance and danger fields, by cell (built as they are needed)
+		self.distFields: list[list[int] | None] = [None] * 868
+		self.dangerFields: list[list[int] | None] = [None] * 868
+
+		# Danger field of a spawning ghost (the lair's, except inside walls)
+		self.lairDanger: list[int] = (
+			OPEN_CELLS * (DANGER_K >> np.minimum(self.dist[:, LAIR_CELL], 62).astype(np.int64))
+		).tolist()
+
+	def distance(self, cell: int) -> list[int]:
+		'''
+		Distance field of a cell: the distance from each cell to it
+		'''
+
+		field = self.distFields[cell]
+		if field is None:
+			field = self.distFields[cell] = self.dist[:, cell].tolist()
+		return field
+
+	def ghostDanger(self, cell: int) -> list[int]:
+		'''
+		Danger field of a non-frightened ghost in a cell: K >> distance
+		'''
+
+		field = self.dangerFields[cell]
+		if field is None:
+			field = self.dangerFields[cell] = \
+				(DANGER_K >> np.minimum(self.dist[:, cell], 62).astype(np.int64)).tolist()
+		return field
+
+	def danger(self, state: GameState) -> tuple[list[int], ...] | None:
+		'''
+		Danger fields of the ghosts in a game state, which the f-cost multiplier
+		adds up: one per non-frightened ghost, and one per spawning ghost, if no
+		ghost is frightened (None if a ghost which counts is off the grid)
+		'''
+
+		fright = False
+		for ghost in state.ghosts:
+			if ghost.frightSteps > 0:
+				fright = True
+
+		fields: list[list[int]] = []
+		for ghost in state.ghosts:
+			if ghost.spawning:
+				if not fright:
+					fields.append(self.lairDanger)
+			elif ghost.frightSteps <= 0:
+				location = ghost.location
+				if not ((0 <= location.row < 31) and (0 <= location.col < 28)):
+					return None
+				fields.append(self.ghostDanger(location.row * 28 + location.col))
+
+		return tuple(fields)
@@ -0,0 +1,144 @@
+# Ordered dictionary (for least-recently-used eviction)
+from collections import OrderedDict
+
+# Game state
+from gameState import *
+
+class CachedPlan:
+	'''
+	Plan kept in a plan cache: the moves (directions and delays, from the
+	state the plan was made in), and the victim color and pellet target which
+	the search ended with
+	'''
+
+	__slots__ = ('directions', 'delays', 'victimColor', 'targetRow', 'targetCol')
+
+	def __init__(
+		self,
+		directions: list[Directions],
+		delays: list[int],
+		victimColor: GhostColors,
+		targetRow: int,
+		targetCol: int
+	) -> None:
+
+		self.directions: list[Directions] = directions
+		self.delays: list[int] = delays
+		self.victimColor: GhostColors = victimColor
+		self.targetRow: int = targetRow
+		self.targetCol: int = targetCol
+
+class PlanCache:
+	'''
+	Bounded cache of plans, keyed by a quantized fingerprint of the game state
+	(see key), which evicts the least recently used plan when full; as the
+	fingerprint ignores far-away pellets and ghosts, plans are validated by
+	simulating them before reuse
+	'''
+
+	def __init__(self, capacity: int = 4096, radius: int = 6) -> None:
+
+		# Maximum number of plans
+		self.capacity: int = capacity
+
+		# Pellets and ghosts farther than this from Pacman (in rows or columns)
+		# are left out of the fingerprint
+		self.radius: int = radius
+
+		# Plans, from least to most recently used
+		self.plans: OrderedDict[tuple, CachedPlan] = OrderedDict()
+
+		# Number of lookups which found a valid plan (hits), found no plan or an
+		# unsafe one (misses), and of plans which were found unsafe, or evicted
+		self.hits: int = 0
+		self.misses: int = 0
+		self.invalidations: int = 0
+		self.evictions: int = 0
+
+	def hitRate(self) -> float:
+		'''
+		Fraction of lookups which found a valid plan
+		'''
+
+		return self.hits / max(self.hits + self.misses, 1)
+
+	def counters(self) -> tuple[int, int, int, int]:
+		'''
+		Numbers of hits, misses, invalidations and evictions so far (to report
+		them from another process)
+		'''
+
+		return self.hits, self.misses, self.invalidations, self.evictions
+
+	def key(self, state: GameState, victimColor: GhostColors, pelletTarget: Location) -> tuple:
+		'''
+		Quantized fingerprint of the inputs of a plan: Pacman's location, the
+		game mode, the ghosts and pellets near Pacman, the victim color and the
+		pellet target
+		'''
+
+		radius = self.radius
+		pacmanLoc = state.pacmanLoc
+		pacmanRow, pacmanCol = pacmanLoc.row, pacmanLoc.col
+
+		# Pellets in the window around Pacman, one bit mask per row
+		colStart = max(pacmanCol - radius, 0)
+		colMask = (1 << (2 * radius + 1)) - 1
+		pellets = tuple(
+			(state.pelletArr[row] >> colStart) & colMask
+			for row in range(max(pacmanRow - radius, 0), min(pacmanRow + radius + 1, 31))
+		)
+
+		# Ghosts in the window around Pacman (ghosts outside it count as absent)
+		ghosts = tuple(
+			(
+				ghost.location.row, ghost.location.col, ghost.location.getDirection(),
+				ghost.isFrightened(), ghost.spawning
+			)
+			if (abs(ghost.location.row - pacmanRow) <= radius) and \
+				(abs(ghost.location.col - pacmanCol) <= radius) else None
+			for ghost in state.ghosts[:4]
+		)
+
+		return (
+			pacmanRow, pacmanCol, pacmanLoc.getDirection(), state.gameMode,
+			state.currTicks % state.updatePeriod, pellets, ghosts,
+			victimColor, pelletTarget.row, pelletTarget.col
+		)
+
+	def get(self, state: GameState, key: tuple) -> CachedPlan | None:
+		'''
+		Look up the plan for a fingerprint, if there is one and it is safe to
+		carry out from the given state (which is left unchanged)
+		'''
+
+		plan = self.plans.get(key)
+		if plan is None:
+			self.misses += 1
+			return None
+
+		# Simulate the plan, to check that it is still safe
+		snapshot = state.snapshot()
+		numSafe = state.simulateActions(list(zip(plan.delays, plan.directions)))
+		state.restore(snapshot)
+		if numSafe < len(plan.directions):
+			del self.plans[key]
+			self.invalidations += 1
+			self.misses += 1
+			return None
+
+		self.plans.move_to_end(key)
+		self.hits += 1
+		return plan
+
+	def put(self, key: tuple, plan: CachedPlan) -> None:
+		'''
+		Keep a plan for a fingerprint, evicting the least recently used plan if
+		the cache is full
+		'''
+
+		self.plans[key] = plan
+		self.plans.move_to_end(key)
+		if len(self.plans) > self.capacity:
+			self.plans.popitem(last=False)
+			self.evictions += 1
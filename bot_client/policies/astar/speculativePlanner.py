@@ -0,0 +1,167 @@
+# Asyncio (for planning in the background)
+import asyncio
+
+# Game state
+from gameState import *
+
+# Server messages
+from serverMessage import ServerMessage
+
+# A-Star Policy, running in a worker process
+from policies.astar.workerPolicy import WorkerPolicy
+
+# Indices of the snapshot fields which do not affect a plan: the tick count
+# (only its phase within an update period matters), the ghosts' planned
+# directions (guessed again by the search) and the Zobrist hash
+IGNORED_FIELDS: frozenset[int] = frozenset((0, 18, 25, 32, 39, 43))
+
+def stateFingerprint(state: GameState, victimColor: GhostColors, pelletTarget: Location) -> tuple:
+	'''
+	Fingerprint of the inputs of a plan: the game state, the victim color and
+	the pellet target
+	'''
+
+	snapshot = state.snapshot()
+	return (
+		state.currTicks % state.updatePeriod,
+		*(field for index, field in enumerate(snapshot) if index not in IGNORED_FIELDS),
+		victimColor, pelletTarget.row, pelletTarget.col
+	)
+
+class SpeculativePlanner:
+	'''
+	Plans ahead in the worker process while the robot carries out a move:
+	the states the game will likely be in once the move is done are predicted
+	by simulating the queued messages, and planned for in the background, so
+	that if the next frame matches one of them, its plan is ready right away
+	'''
+
+	def __init__(self, state: GameState, policy: WorkerPolicy) -> None:
+
+		# Game state
+		self.state: GameState = state
+
+		# Policy running in a worker process
+		self.policy: WorkerPolicy = policy
+
+		# Scratch game state, for predicting the next states
+		self.scratchState: GameState = GameState()
+
+		# Speculative plans, by fingerprint of their inputs (plans which are not
+		# done yet are futures)
+		self.plans: dict[tuple, asyncio.Future] = {}
+
+		# Background task planning for the predicted states
+		self.task: asyncio.Task | None = None
+
+		# Number of frames with (hits) and without (misses) a speculative plan
+		self.hits: int = 0
+		self.misses: int = 0
+
+	def hitRate(self) -> float:
+		'''
+		Fraction of frames which had a speculative plan
+		'''
+
+		return self.hits / max(self.hits + self.misses, 1)
+
+	def predictStates(self, messages: list[ServerMessage], predicted_delay: int) -> list[bytes]:
+		'''
+		Predict the likely states after the robot carries out the first of some
+		queued messages (most likely first): on time, and one update late; the
+		first step waits out the message's ticks, and the rest take the
+		predicted delay per step
+
+		Returns: the serializations of the predicted states
+		'''
+
+		if not messages:
+			return []
+
+		# Simulate the first message's moves (one step per cell, as planned)
+		scratchState = self.scratchState
+		scratchState.update(self.state.serialize(), lockOverride=True)
+		message = messages[0]
+		direction = Directions(D_MESSAGES.index(message.messageBytes))
+		actions = [(message.waitTicks + 1, direction)] + \
+			[(predicted_delay, direction)] * (message.dist - 1)
+		if scratchState.simulateActions(actions) < message.dist:
+			return []
+		predictions = [scratchState.serialize()]
+
+		# If the robot takes longer, the ghosts move once more in the meantime
+		if scratchState.simulateAction(scratchState.updatePeriod, Directions.NONE):
+			predictions.append(scratchState.serialize())
+
+		return predictions
+
+	def speculate(self, predicted_delay: int, victimColor: GhostColors, pelletTarget: Location) -> None:
+		'''
+		Start planning in the background for the states predicted after the
+		queued messages, with the victim color and pellet target of the last plan
+		'''
+
+		self.cancel()
+
+		loop = asyncio.get_running_loop()
+		frames: list[tuple[bytes, asyncio.Future]] = []
+		for frame in self.predictStates(list(self.state.writeServerBuf), predicted_delay):
+			self.scratchState.update(frame, lockOverride=True)
+			fingerprint = stateFingerprint(self.scratchState, victimColor, pelletTarget)
+			if fingerprint not in self.plans:
+				self.plans[fingerprint] = loop.create_future()
+				frames.append((frame, self.plans[fingerprint]))
+
+		async def planAll() -> None:
+			for frame, future in frames:
+				try:
+					future.set_result(await self.policy.planInWorker(
+						frame, predicted_delay, victimColor, pelletTarget, speculative=True
+					))
+				except asyncio.CancelledError:
+					future.cancel()
+					raise
+
+		if frames:
+			self.task = asyncio.create_task(planAll())
+
+	def cancel(self) -> None:
+		'''
+		Drop the speculative plans, and stop a speculative search already
+		running in the worker process (otherwise, the next plan would wait for
+		it to use up its budget)
+		'''
+
+		if self.task is not None:
+			self.task.cancel()
+			self.task = None
+			self.policy.stopSpeculation()
+		for future in self.plans.values():
+			future.cancel()
+		self.plans.clear()
+
+	async def act(
+		self,
+		predicted_delay: int,
+		victimColor: GhostColors,
+		pelletTarget: Location
+	) -> tuple[GhostColors, Location]:
+		'''
+		Queue the speculative plan for the current state, if there is one
+		(waiting for it, if it is still being planned), or else plan as usual
+		'''
+
+		future = self.plans.get(stateFingerprint(self.state, victimColor, pelletTarget))
+		if (future is not None) and not future.cancelled():
+			try:
+				result = await future
+			except asyncio.CancelledError:
+				result = None
+			if result is not None:
+				self.hits += 1
+				self.cancel()
+				return self.policy.applyPlan(result)
+
+		self.misses += 1
+		self.cancel()
+		return await self.policy.act(predicted_delay, victimColor, pelletTarget)
@@ -0,0 +1,307 @@
+# Asyncio (for awaiting plans)
+import asyncio
+
+# Process pool (for planning in worker processes)
+from concurrent.futures import ProcessPoolExecutor
+
+# Shared values (for the bound shared by parallel searches, and for stopping
+# speculative searches)
+from multiprocessing import Value
+from multiprocessing.sharedctypes import Synchronized
+
+# CPU count (for the default number of workers)
+import os
+
+# Time (for the planning budget)
+import time
+
+# Game state
+from gameState import *
+
+# Server messages
+from serverMessage import ServerMessage
+
+# A-Star Policy
+from policies.astar.aStarPolicy import *
+
+# Game state and policy owned by a worker process, the bound shared by
+# parallel searches, if any, and the generation of speculative searches, if
+# any (set up by initWorker)
+workerState: GameState
+workerPolicy: AStarPolicy
+workerBound: Synchronized | None = None
+workerGeneration: Synchronized | None = None
+
+# Value of the shared bound before any search commits to a path
+NO_BOUND: int = 1 << 62
+
+def initWorker(
+	gameFPS: int,
+	horizon: int = 14,
+	bound: Synchronized | None = None,
+	generation: Synchronized | None = None
+) -> None:
+	'''
+	Set up the game state and policy of a worker process
+	'''
+
+	global workerState, workerPolicy, workerBound, workerGeneration
+	workerState = GameState()
+	workerPolicy = AStarPolicy(
+		workerState, newLocation(5, 21, workerState), gameFPS=gameFPS, horizon=horizon
+	)
+	workerBound = bound
+	workerGeneration = generation
+
+def pingWorker() -> None:
+	'''
+	Empty task, to start a worker process ahead of the first plan
+	'''
+
+def planFrame(
+	frame: bytes,
+	predictedDelay: int,
+	victimColor: GhostColors,
+	targetRow: int,
+	targetCol: int,
+	budget: float | None,
+	rootDirections: tuple[Directions, ...] | None = None,
+	generation: int | None = None
+) -> tuple[list[ServerMessage], GhostColors, int, int, tuple[float, float, bool, int, int, int | None, tuple[int, int, int, int] | None]]:
+	'''
+	Plan from a serialized game state, in a worker process (optionally only
+	exploring some first moves, against the shared bound, or as a speculative
+	search of a given generation, which stops once the generation changes)
+
+	Returns: the queued messages, the new victim color and pellet target
+	(row and column), and the planning statistics of the policy (including
+	the counters of the worker's plan cache, see PlanCache.counters)
+	'''
+
+	workerState.update(frame, lockOverride=True)
+	workerState.writeServerBuf.clear()
+
+	pelletTarget = newLocation(targetRow, targetCol, workerState)
+	victimColor, pelletTarget = workerPolicy.plan(
+		predictedDelay, victimColor, pelletTarget, budget,
+		rootDirections, workerBound if (rootDirections is not None) else None,
+		(workerGeneration, generation) if (workerGeneration is not None) and (generation is not None) else None
+	)
+
+	return (
+		list(workerState.writeServerBuf), victimColor, pelletTarget.row, pelletTarget.col,
+		(
+			workerPolicy.planTime, workerPolicy.budgetUsed, workerPolicy.timedOut,
+			workerPolicy.numNodes, workerPolicy.planDepth, workerPolicy.commitCost,
+			workerPolicy.planCache.counters() if (workerPolicy.planCache is not None) else None
+		)
+	)
+
+class WorkerPolicy:
+	'''
+	Policy class which runs the A-Star policy in a worker process, so that
+	planning does not block the event loop (same interface as AStarPolicy)
+	'''
+
+	def __init__(self, state: GameState, gameFPS: int = 24, horizon: int = 14) -> None:
+
+		# Game state
+		self.state: GameState = state
+
+		# Generation of speculative searches: a speculative search stops once it
+		# changes (see stopSpeculation)
+		self.generation: Synchronized = Value('q', 0)
+
+		# Worker process, started right away so that the first plan does not
+		# wait for it to import the policy
+		self.executor: ProcessPoolExecutor = ProcessPoolExecutor(
+			max_workers=1, initializer=initWorker, initargs=(gameFPS, horizon, None, self.generation)
+		)
+		self.executor.submit(pingWorker)
+
+		# Statistics of the last search (see AStarPolicy), and the counters of
+		# the plan cache in the worker process (see PlanCache.counters)
+		self.planTime: float = 0.0
+		self.budgetUsed: float = 0.0
+		self.timedOut: bool = False
+		self.numNodes: int = 0
+		self.cacheCounters: tuple[int, int, int, int] | None = None
+
+	async def act(
+		self,
+		predicted_delay: int,
+		victimColor: GhostColors,
+		pelletTarget: Location,
+		budget: float | None = None
+	) -> tuple[GhostColors, Location]:
+		'''
+		Plan the next moves in the worker process, from a serialization of the
+		game state, and queue the resulting messages to the server
+		'''
+
+		return self.applyPlan(await self.planInWorker(
+			self.state.serialize(), predicted_delay, victimColor, pelletTarget, budget
+		))
+
+	async def planInWorker(
+		self,
+		frame: bytes,
+		predicted_delay: int,
+		victimColor: GhostColors,
+		pelletTarget: Location,
+		budget: float | None = None,
+		speculative: bool = False
+	) -> tuple[list[ServerMessage], GhostColors, int, int, tuple[float, float, bool, int, int, int | None, tuple[int, int, int, int] | None]]:
+		'''
+		Plan from a serialized game state in the worker process, without queuing
+		the resulting messages (see planFrame); speculative searches can be
+		stopped by stopSpeculation
+		'''
+
+		loop = asyncio.get_running_loop()
+		return await loop.run_in_executor(
+			self.executor, planFrame, frame, predicted_delay,
+			victimColor, pelletTarget.row, pelletTarget.col, budget, None,
+			self.generation.value if speculative else None
+		)
+
+	def stopSpeculation(self) -> None:
+		'''
+		Stop the speculative searches started so far, including one already
+		running in the worker process (it stops at its next node, so that the
+		worker is free for the next search)
+		'''
+
+		with self.generation.get_lock():
+			self.generation.value += 1
+
+	def applyPlan(
+		self,
+		result: tuple[list[ServerMessage], GhostColors, int, int, tuple[float, float, bool, int, int, int | None, tuple[int, int, int, int] | None]]
+	) -> tuple[GhostColors, Location]:
+		'''
+		Queue the messages of a plan from the worker process, and keep its
+		statistics
+		'''
+
+		messages, victimColor, targetRow, targetCol, stats = result
+		self.state.writeServerBuf.extend(messages)
+		self.planTime, self.budgetUsed, self.timedOut, self.numNodes, _, _, self.cacheCounters = stats
+		return victimColor, newLocation(targetRow, targetCol, self.state)
+
+	def shutdown(self) -> None:
+		'''
+		Stop the worker process
+		'''
+
+		self.executor.shutdown(cancel_futures=True)
+
+class RootSplitPolicy:
+	'''
+	Policy class which splits the A-Star search by first move, exploring each
+	legal first move in a separate worker process; the workers share the
+	lowest cost at which one of them committed to a path (see
+	AStarPolicy.commit), to cut off searches that can no longer commit first
+	(same interface as AStarPolicy)
+	'''
+
+	def __init__(
+		self,
+		state: GameState,
+		gameFPS: int = 24,
+		numWorkers: int = 0,
+		horizon: int = 14
+	) -> None:
+
+		# Game state
+		self.state: GameState = state
+
+		# Server frame rate (ticks per second), for the default planning budget
+		self.gameFPS: int = gameFPS
+
+		# Bound shared by the workers (lowest commit cost so far)
+		self.bound: Synchronized = Value('q', NO_BOUND)
+
+		# Worker processes (one per first move, at most), started right away
+		numWorkers = min(numWorkers or os.cpu_count() or 1, len(Directions))
+		self.executor: ProcessPoolExecutor = ProcessPoolExecutor(
+			max_workers=numWorkers, initializer=initWorker,
+			initargs=(gameFPS, horizon, self.bound)
+		)
+		for _ in range(numWorkers):
+			self.executor.submit(pingWorker)
+
+		# Statistics of the last search (see AStarPolicy; the node count is the
+		# total over all workers)
+		self.planTime: float = 0.0
+		self.budgetUsed: float = 0.0
+		self.timedOut: bool = False
+		self.numNodes: int = 0
+
+	async def act(
+		self,
+		predicted_delay: int,
+		victimColor: GhostColors,
+		pelletTarget: Location,
+		budget: float | None = None
+	) -> tuple[GhostColors, Location]:
+		'''
+		Plan the next moves with one worker per legal first move, and queue the
+		messages of the plan which a single search would have chosen: the one
+		which committed at the lowest cost (or, if none did, the best partial
+		plan, see AStarNode.betterPartialPlan)
+		'''
+
+		startTime = time.perf_counter()
+		if budget is None:
+			budget = self.state.updatePeriod / self.gameFPS
+
+		# First moves which are not into walls (waiting is decided by the workers)
+		pacmanRow, pacmanCol = self.state.pacmanLoc.row, self.state.pacmanLoc.col
+		rootDirections = [
+			direction for direction in Directions
+			if (direction == Directions.NONE) or (
+				(0 <= pacmanRow < 31) and (0 <= pacmanCol < 28) and
+				NEXT_CELL[(pacmanRow * 28 + pacmanCol) * 5 + direction] != NO_CELL
+			)
+		]
+
+		# Search each first move's subtree in parallel
+		self.bound.value = NO_BOUND
+		frame = self.state.serialize()
+		loop = asyncio.get_running_loop()
+		results = await asyncio.gather(*[
+			loop.run_in_executor(
+				self.executor, planFrame, frame, predicted_delay, victimColor,
+				pelletTarget.row, pelletTarget.col, budget, (direction,)
+			) for direction in rootDirections
+		])
+
+		# Keep the plan which committed at the lowest cost, then the deepest plan
+		# (ties go to the first direction, as in a single search)
+		best = results[0]
+		for result in results[1:]:
+			messages, _, _, _, (_, _, _, _, depth, cost, _) = result
+			bestMessages, _, _, _, (_, _, _, _, bestDepth, bestCost, _) = best
+			if not messages:
+				continue
+			if (not bestMessages) or (bestCost is None and cost is not None) or \
+				(bestCost is not None and cost is not None and cost < bestCost) or \
+				(bestCost is None and cost is None and depth > bestDepth):
+				best = result
+
+		messages, victimColor, targetRow, targetCol, _ = best
+		self.state.writeServerBuf.extend(messages)
+
+		self.planTime = time.perf_counter() - startTime
+		self.budgetUsed = self.planTime / budget
+		self.timedOut = any(stats[2] for _, _, _, _, stats in results)
+		self.numNodes = sum(stats[3] for _, _, _, _, stats in results)
+		return victimColor, newLocation(targetRow, targetCol, self.state)
+
+	def shutdown(self) -> None:
+		'''
+		Stop the worker processes
+		'''
+
+		self.executor.shutdown(cancel_futures=True)
@@ -0,0 +1,93 @@
+# Game state
+from gameState import *
+
+# A-Star Policy
+from policies.astar.aStarPolicy import *
+
+'''
+Tests of the trap check of the A-Star policy (AStarPolicy.trapped), on
+hand-built states with Pacman in a corridor: sealed by ghosts coming at him
+along both ways out, or not; run with pytest, or as a script
+'''
+
+# Pacman's cell: a corridor cell, with ways out to (5, 9) and to (11, 12)
+PACMAN_CELL: tuple[int, int] = (8, 12)
+
+# Cell of the ghosts which are not used (off the grid)
+EMPTY_CELL: tuple[int, int] = (32, 32)
+
+def trapPolicy(ghosts: list[tuple[int, int, Directions, Directions]], modeSteps: int = 100) -> AStarPolicy:
+	'''
+	Policy on a state with Pacman at PACMAN_CELL, in chase mode with the
+	normal pellets left, and the given ghosts (row, column, heading and planned direction); the other ghosts are
+	off the grid
+	'''
+
+	state = GameState()
+	state.currTicks = 120
+	state.updatePeriod = 12
+	state.gameMode = GameModes.CHASE
+	state.modeSteps = modeSteps
+	state.pacmanLoc.row, state.pacmanLoc.col = PACMAN_CELL
+
+	# Pellets on every open cell, except the super pellets
+	state.pelletArr = [
+		~wallArr[row] & ((1 << 28) - 1) & ~(((row == 3) or (row == 23)) * ((1 << 1) | (1 << 26)))
+		for row in range(31)
+	]
+	state.countPellets()
+
+	for index, ghost in enumerate(state.ghosts):
+		ghost.location.row, ghost.location.col, heading, plan = \
+			ghosts[index] if index < len(ghosts) else (*EMPTY_CELL, Directions.NONE, Directions.NONE)
+		ghost.location.setDirection(heading)
+		ghost.plannedDirection = plan
+		ghost.frightSteps = 0
+		ghost.spawning = False
+	state.zobrist = state.computeZobrist()
+
+	return AStarPolicy(state, newLocation(5, 21, state))
+
+# Ghost coming down at Pacman's corridor (planning its move out of the corner
+# below, to the right, towards Pacman), 4 cells away, and the same ghost
+# leaving
+GHOST_LEFT: tuple[int, int, Directions, Directions] = (7, 9, Directions.DOWN, Directions.RIGHT)
+GHOST_LEFT_LEAVING: tuple[int, int, Directions, Directions] = (7, 9, Directions.UP, Directions.UP)
+
+# Ghost coming up at Pacman, 2 cells away
+GHOST_BELOW: tuple[int, int, Directions, Directions] = (10, 12, Directions.UP, Directions.UP)
+
+def test_trappedSealed() -> None:
+	'''
+	Ghosts heading at Pacman along both ways out trap him (the ghosts' next
+	moves follow their headings, not their planned directions)
+	'''
+
+	assert trapPolicy([GHOST_LEFT, GHOST_BELOW]).trapped()
+
+def test_trappedUnsealed() -> None:
+	'''
+	A way out without a ghost heading at Pacman is not a trap, nor is a
+	single ghost
+	'''
+
+	assert not trapPolicy([GHOST_LEFT_LEAVING, GHOST_BELOW]).trapped()
+	assert not trapPolicy([GHOST_LEFT]).trapped()
+	assert not trapPolicy([GHOST_BELOW]).trapped()
+
+def test_trappedModeChange() -> None:
+	'''
+	A change of mode turns the ghosts around, so the trap only holds if the
+	farther ghost (4 updates away) reaches Pacman before then; the ghosts
+	move once more along their headings after the update which changes the
+	mode
+	'''
+
+	assert trapPolicy([GHOST_LEFT, GHOST_BELOW], modeSteps=3).trapped()
+	assert not trapPolicy([GHOST_LEFT, GHOST_BELOW], modeSteps=2).trapped()
+
+if __name__ == '__main__':
+	test_trappedSealed()
+	test_trappedUnsealed()
+	test_trappedModeChange()
+	print('all tests passed')
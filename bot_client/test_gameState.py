@@ -0,0 +1,442 @@
+# Random number generation (for the randomized states)
+from random import Random
+
+# NumPy (for the per-candidate actions of the batched simulator)
+import numpy as np
+
+# Game state
+from gameState import *
+
+# Batched simulator
+from batchSimulator import BatchGameState
+
+'''
+Differential tests of the simulator: simulateAction (which jumps straight to
+the ticks with a ghost update, and plans ghost moves from tables) against
+the original per-tick simulator, kept here as a reference, guessGhostPlans
+against the original guessPlan, and simulateActions against a loop of
+simulateAction calls, over randomized states, update periods and tick
+windows, and the batched simulator against game states stepped one by one;
+run with pytest, or as a script
+'''
+
+# Number of randomized states per test, and of actions per state
+NUM_STATES: int = 2000
+MAX_ACTIONS: int = 16
+
+# Tick windows of the actions (including empty and multi-update windows)
+TICK_WINDOWS: tuple[int, ...] = (0, 1, 4, 4, 5, 6, 8, 12, 13, 24, 30)
+
+# Open cells of the maze, and cells off the grid (for ghosts not on the maze)
+OPEN_CELLS: list[tuple[int, int]] = [
+	(row, col) for row in range(31) for col in range(28) if not ((wallArr[row] >> col) & 1)
+]
+EMPTY_CELL: tuple[int, int] = (32, 32)
+
+def randomFrame(rng: Random) -> bytes:
+	'''
+	Serialize a random game state: ticks, update period, mode, ghosts (on the
+	maze, off the grid, frightened or spawning), Pacman, fruit and pellets
+	'''
+
+	state = GameState()
+
+	# General game info (short mode steps, so that modes change in a window)
+	state.currTicks = rng.randrange(0, 2000)
+	state.updatePeriod = rng.choice((6, 8, 12))
+	state.gameMode = rng.choice((GameModes.SCATTER, GameModes.CHASE, GameModes.PAUSED))
+	state.modeSteps = rng.choice((0, 1, 2, rng.randrange(0, 70)))
+	state.modeDuration = 65
+
+	# Ghosts
+	for ghost in state.ghosts:
+		ghost.location.row, ghost.location.col = rng.choice(OPEN_CELLS + [EMPTY_CELL])
+		ghost.location.setDirection(Directions(rng.randrange(5)))
+		ghost.frightSteps = rng.choice((0, 0, 0, 1, 5, 40))
+		ghost.spawning = rng.random() < 0.2
+
+	# Pacman
+	state.pacmanLoc.row, state.pacmanLoc.col = rng.choice(OPEN_CELLS)
+	state.pacmanLoc.setDirection(Directions(rng.randrange(5)))
+
+	# Fruit
+	state.fruitSteps = rng.choice((0, 0, 10))
+	state.fruitLoc.row, state.fruitLoc.col = (17, 13) if state.fruitSteps else EMPTY_CELL
+
+	# Pellets (a random subset of the open cells, sometimes only a few)
+	density = rng.choice((0.0, 0.02, 0.5, 1.0))
+	state.pelletArr = [
+		sum(1 << col for col in range(28) if not ((wallArr[row] >> col) & 1) and (rng.random() < density))
+		for row in range(31)
+	]
+
+	return state.serialize()
+
+def randomActions(rng: Random) -> list[tuple[int, Directions]]:
+	'''
+	Random sequence of actions (number of ticks and Pacman direction)
+	'''
+
+	return [
+		(rng.choice(TICK_WINDOWS), Directions(rng.randrange(5)))
+		for _ in range(rng.randrange(1, MAX_ACTIONS + 1))
+	]
+
+def loadState(frame: bytes) -> GameState:
+	'''
+	Fresh game state from a serialization
+	'''
+
+	state = GameState()
+	state.update(frame)
+	return state
+
+def referenceWallAt(row: int, col: int) -> bool:
+	'''
+	Reference wall check: off the grid, or a wall bit
+	'''
+
+	if (row < 0 or row >= 31) or (col < 0 or col >= 28):
+		return True
+	return bool((wallArr[row] >> col) & 1)
+
+def referenceAdvance(location: Location) -> bool:
+	'''
+	Reference Location.advance: one step along the location's direction,
+	unless it runs into a wall
+	'''
+
+	# If the current position is out of bounds, ignore it
+	if (location.row >= 31) or (location.col >= 28) or (location.row < 0) or (location.col < 0):
+		return False
+
+	# Move to the next row and column, if applicable
+	newRow = location.row + location.rowDir
+	newCol = location.col + location.colDir
+	if not referenceWallAt(newRow, newCol):
+		location.row = newRow
+		location.col = newCol
+		return True
+
+	return False
+
+def referenceGuessPlan(state: GameState, ghost: Ghost) -> None:
+	'''
+	Reference Ghost.guessPlan: the original per-ghost target choice and
+	comparison of the four moves out of the ghost's next cell
+	'''
+
+	# Ignore spawning ghosts, and ghosts at an empty location
+	if ghost.spawning:
+		return
+	if ghost.location.row >= 32 or ghost.location.col >= 32:
+		return
+
+	# Row and column at the next step
+	nextRow: int = ghost.location.row + ghost.location.rowDir
+	nextCol: int = ghost.location.col + ghost.location.colDir
+
+	# Pacman and the red ghost
+	pacmanRow: int = state.pacmanLoc.row
+	pacmanCol: int = state.pacmanLoc.col
+	pacmanRowDir: int = state.pacmanLoc.rowDir
+	pacmanColDir: int = state.pacmanLoc.colDir
+	redRow: int = state.ghosts[GhostColors.RED].location.row
+	redCol: int = state.ghosts[GhostColors.RED].location.col
+
+	# Choose a target for the ghost based on its color (including the original
+	# pink target, which overwrites its row with Pacman's column)
+	targetRow: int = 0
+	targetCol: int = 0
+	if state.gameMode == GameModes.CHASE:
+		if ghost.color == GhostColors.RED:
+			targetRow = pacmanRow
+			targetCol = pacmanCol
+		elif ghost.color == GhostColors.PINK:
+			targetRow = pacmanRow + 4 * pacmanRowDir
+			targetRow = pacmanCol + 4 * pacmanColDir
+		elif ghost.color == GhostColors.CYAN:
+			targetRow = 2 * pacmanRow + 4 * pacmanRowDir - redRow
+			targetCol = 2 * pacmanCol + 4 * pacmanColDir - redCol
+		elif ghost.color == GhostColors.ORANGE:
+			distSqToPacman = (nextRow - pacmanRow) * (nextRow - pacmanRow) + \
+				(nextCol - pacmanCol) * (nextCol - pacmanCol)
+			targetRow = pacmanRow if (distSqToPacman < 64) else SCATTER_ROW[GhostColors.ORANGE]
+			targetCol = pacmanCol if (distSqToPacman < 64) else SCATTER_COL[GhostColors.ORANGE]
+	if state.gameMode == GameModes.SCATTER:
+		targetRow = SCATTER_ROW[ghost.color]
+		targetCol = SCATTER_COL[ghost.color]
+
+	# Calculate the distance squared to the target, for all 4 moves
+	minDist = 0xfffffff
+	maxDist = -1
+	minDir  = Directions.UP
+	maxDir  = Directions.UP
+	for direction in Directions:
+		if direction == Directions.NONE:
+			continue
+
+		# Avoid reversals and walls
+		if D_ROW[direction] + ghost.location.rowDir == 0 and \
+			D_COL[direction] + ghost.location.colDir == 0:
+			continue
+		newRow = nextRow + D_ROW[direction]
+		newCol = nextCol + D_COL[direction]
+		if referenceWallAt(newRow, newCol):
+			continue
+
+		distSqToTarget = (newRow - targetRow) * (newRow - targetRow) + \
+			(newCol - targetCol) * (newCol - targetCol)
+		if distSqToTarget < minDist:
+			minDir  = direction
+			minDist = distSqToTarget
+		elif distSqToTarget >= maxDist:
+			maxDir  = direction
+			maxDist = distSqToTarget
+
+	# Update the best direction to be the plan
+	ghost.plannedDirection = minDir if (not ghost.isFrightened()) else maxDir
+
+def referenceMove(ghost: Ghost) -> None:
+	'''
+	Reference Ghost.move: advance along the current heading, then turn to the
+	planned direction
+	'''
+
+	if ghost.spawning:
+		return
+
+	referenceAdvance(ghost.location)
+	ghost.location.setDirection(ghost.plannedDirection)
+	if ghost.isFrightened():
+		ghost.frightSteps -= 1
+
+def referenceSafetyCheck(state: GameState) -> bool:
+	'''
+	Reference GameState.safetyCheck: whether Pacman is not on a non-frightened
+	ghost (frightened ghosts on Pacman are sent back to spawn)
+	'''
+
+	for ghost in state.ghosts:
+		if ghost.location.at(state.pacmanLoc.row, state.pacmanLoc.col):
+			if not ghost.isFrightened():
+				return False
+			ghost.spawning = True
+
+	return True
+
+def referenceCollectPellet(state: GameState, row: int, col: int) -> None:
+	'''
+	Reference GameState.collectPellet: remove the pellet, score it, spawn the
+	fruit and frighten the ghosts, counting the pellets from scratch
+	'''
+
+	if not ((state.pelletArr[row] >> col) & 1):
+		return
+
+	superPellet: bool = ((row == 3) or (row == 23)) and ((col == 1) or (col == 26))
+	state.pelletArr[row] &= (~(1 << col))
+	state.currScore += (50 if superPellet else 10)
+
+	numPellets = sum(rowArr.bit_count() for rowArr in state.pelletArr)
+	if numPellets == 174 or numPellets == 74:
+		state.fruitSteps = 30
+		state.fruitLoc.row = 17
+		state.fruitLoc.col = 13
+
+	if superPellet:
+		for ghost in state.ghosts:
+			ghost.frightSteps = 40
+			ghost.plannedDirection = reversedDirections[ghost.plannedDirection]
+
+def referenceAction(state: GameState, numTicks: int, pacmanDir: Directions) -> bool:
+	'''
+	Reference simulateAction: the original loop over every tick of the window,
+	checking each tick for a ghost update, built only from the reference
+	helpers above (no move table, ghost decision tables, incremental pellet
+	counts or Zobrist hashing; see syncReference)
+	'''
+
+	# Try to plan the ghost directions if we expect them to be none
+	for ghost in state.ghosts:
+		if ghost.plannedDirection == Directions.NONE:
+			referenceGuessPlan(state, ghost)
+
+	# Loop over every tick
+	for tick in range(1, numTicks+1):
+
+		# Keep ticking until an update
+		if (state.currTicks + tick) % state.updatePeriod != 0:
+			continue
+
+		# Update the ghost positions
+		for ghost in state.ghosts:
+			referenceMove(ghost)
+
+		# Return if Pacman collides with a non-frightened ghost
+		if not referenceSafetyCheck(state):
+			return False
+
+		# Update the mode steps counter, and change the mode if necessary
+		if state.modeSteps > 0:
+			state.modeSteps -= 1
+
+		if state.modeSteps == 0:
+
+			# Scatter -> Chase
+			if state.gameMode == GameModes.SCATTER:
+				state.gameMode = GameModes.CHASE
+				state.modeSteps = 175
+				state.modeDuration = 175
+
+			# Chase -> Scatter
+			elif state.gameMode == GameModes.CHASE and \
+				sum(rowArr.bit_count() for rowArr in state.pelletArr) > 20:
+				state.gameMode = GameModes.SCATTER
+				state.modeSteps = 65
+				state.modeDuration = 65
+
+			# Reverse the planned directions of all ghosts
+			for ghost in state.ghosts:
+				ghost.plannedDirection = reversedDirections[ghost.plannedDirection]
+
+		# Guess the next ghost moves
+		for ghost in state.ghosts:
+			referenceGuessPlan(state, ghost)
+
+	# If Pacman is not given a direction to move towards, skip motion
+	if pacmanDir != Directions.NONE:
+
+		# Set the direction of Pacman, as chosen, and try to move one step
+		pacmanPrevDir = state.pacmanLoc.getDirection()
+		state.pacmanLoc.setDirection(pacmanDir)
+		if not referenceAdvance(state.pacmanLoc):
+			state.pacmanLoc.setDirection(pacmanPrevDir)
+			return False
+
+		referenceCollectPellet(state, state.pacmanLoc.row, state.pacmanLoc.col)
+
+		# If there are no pellets left, return
+		if sum(rowArr.bit_count() for rowArr in state.pelletArr) == 0:
+			return True
+
+	# Return if Pacman collides with a non-frightened ghost
+	if not referenceSafetyCheck(state):
+		return False
+
+	# Increment the number of ticks by the chosen amount
+	state.currTicks += numTicks
+
+	# Return that Pacman was safe during this transition
+	return True
+
+def syncReference(reference: GameState) -> tuple:
+	'''
+	Snapshot of a reference state, with the pellet counts and Zobrist hash
+	computed from scratch (the reference does not maintain them), so that it
+	checks the incremental ones of the simulator
+	'''
+
+	reference._pelletTuple = None
+	reference.countPellets()
+	reference.zobrist = reference.computeZobrist()
+	return reference.snapshot()
+
+def test_simulateAction(seed: int = 0) -> None:
+	'''
+	simulateAction returns the same results, and leaves the same states
+	(including ghost plans, pellet counts and Zobrist hashes), as the
+	original per-tick simulator
+	'''
+
+	rng = Random(seed)
+	for index in range(NUM_STATES):
+		frame = randomFrame(rng)
+		actions = randomActions(rng)
+
+		state, reference = loadState(frame), loadState(frame)
+		for step, (numTicks, pacmanDir) in enumerate(actions):
+			result = state.simulateAction(numTicks, pacmanDir)
+			expected = referenceAction(reference, numTicks, pacmanDir)
+			assert result == expected, f'state {index}, action {step}: returned {result}'
+			assert state.snapshot() == syncReference(reference), f'state {index}, action {step}: states differ'
+			if not result:
+				break
+
+def test_guessGhostPlans(seed: int = 2) -> None:
+	'''
+	guessGhostPlans (in one pass, from the decision tables) plans the same
+	ghost moves as the original guessPlan of each ghost in turn
+	'''
+
+	rng = Random(seed)
+	for index in range(5 * NUM_STATES):
+		frame = randomFrame(rng)
+
+		state, reference = loadState(frame), loadState(frame)
+		state.guessGhostPlans()
+		for ghost in reference.ghosts:
+			referenceGuessPlan(reference, ghost)
+		assert state.getGhostPlans() == reference.getGhostPlans(), f'state {index}: plans differ'
+
+def test_simulateActions(seed: int = 1) -> None:
+	'''
+	simulateActions simulates as many actions, and leaves the same state, as
+	a loop of simulateAction calls which stops at the first unsafe action
+	'''
+
+	rng = Random(seed)
+	for index in range(NUM_STATES):
+		frame = randomFrame(rng)
+		actions = randomActions(rng)
+
+		state, reference = loadState(frame), loadState(frame)
+		numSafe = state.simulateActions(actions)
+		expected = 0
+		for numTicks, pacmanDir in actions:
+			if not reference.simulateAction(numTicks, pacmanDir):
+				break
+			expected += 1
+		assert numSafe == expected, f'state {index}: {numSafe} safe actions, expected {expected}'
+		assert state.snapshot() == reference.snapshot(), f'state {index}: states differ'
+
+def test_batchSimulateAction(seed: int = 3) -> None:
+	'''
+	BatchGameState.simulateAction leaves each candidate in the same state as
+	GameState.simulateAction with the same action, and returns the same
+	results, up to the first unsafe action of the candidate
+	'''
+
+	rng = Random(seed)
+	for updatePeriod in (6, 8, 12):
+
+		# Random game states with this update period (shared by the batch)
+		states: list[GameState] = []
+		while len(states) < NUM_STATES // 4:
+			state = loadState(randomFrame(rng))
+			if state.updatePeriod == updatePeriod:
+				states.append(state)
+		batch = BatchGameState.fromSnapshots([state.snapshot() for state in states], updatePeriod)
+
+		# Step all of them with a random action each, until every one is unsafe
+		alive = list(range(len(states)))
+		for step in range(MAX_ACTIONS):
+			numTicks = [rng.choice(TICK_WINDOWS) for _ in states]
+			directions = [rng.randrange(5) for _ in states]
+			results = batch.simulateAction(np.array(numTicks), np.array(directions))
+
+			stillAlive: list[int] = []
+			for index in alive:
+				expected = states[index].simulateAction(numTicks[index], Directions(directions[index]))
+				assert bool(results[index]) == expected, f'period {updatePeriod}, state {index}, action {step}: returned {results[index]}'
+				assert batch.snapshot(index) == states[index].snapshot(), f'period {updatePeriod}, state {index}, action {step}: states differ'
+				if expected:
+					stillAlive.append(index)
+			alive = stillAlive
+
+if __name__ == '__main__':
+	test_simulateAction()
+	test_guessGhostPlans()
+	test_simulateActions()
+	test_batchSimulateAction()
+	print(f'simulateAction, guessGhostPlans, simulateActions and the batched simulator match on random states')
@@ -0,0 +1,133 @@
+# Move table and maze dimensions
+from moveTable import NEXT_CELL, NUM_CELLS
+
+# Corridors between junctions
+from corridorGraph import CORRIDOR_EXIT, NO_DIRECTION, exits, isOpen
+
+'''
+Trap map: for each cell of the maze, the escapes which Pacman could run to
+without passing a choice of moves (the junctions at both ends of a corridor,
+or the mouth of a dead-end pocket), how many moves away they are, and the
+ghost moves which seal them; ghosts do not turn around, so a ghost heading
+towards Pacman along the way to an escape keeps coming until it meets him,
+and Pacman is trapped once every escape is sealed
+'''
+
+def buildPockets() -> set[int]:
+	'''
+	Find the dead-end pockets: open cells which only lead on through one
+	cell, found by repeatedly stripping cells with at most one open neighbor
+	which has not been stripped yet
+	'''
+
+	degree = [len(exits(cell)) for cell in range(NUM_CELLS)]
+	pockets: set[int] = set()
+	queue = [cell for cell in range(NUM_CELLS) if isOpen(cell) and (degree[cell] <= 1)]
+	while queue:
+		cell = queue.pop()
+		if cell in pockets:
+			continue
+		pockets.add(cell)
+		for direction in exits(cell):
+			nextCell = NEXT_CELL[cell * 5 + direction]
+			degree[nextCell] -= 1
+			if (nextCell not in pockets) and (degree[nextCell] <= 1):
+				queue.append(nextCell)
+
+	return pockets
+
+# Cells of the dead-end pockets (none in the Pacbot maze, which has no dead ends)
+POCKETS: set[int] = buildPockets()
+
+def buildPaths() -> list[list[list[int]]]:
+	'''
+	Build the ways out of each cell, as lists of the cells along them (the
+	last is the escape): none for junctions (which are not traps), both ways
+	along the corridor for corridor cells, and the way to the mouth of the
+	pocket for pocket cells
+	'''
+
+	paths: list[list[list[int]]] = [[] for _ in range(NUM_CELLS)]
+
+	# Corridor cells: run both ways to the ends of the corridor
+	for cell in range(NUM_CELLS):
+		if (cell in POCKETS) or (len(exits(cell)) != 2):
+			continue
+		for direction in exits(cell):
+			path: list[int] = []
+			nextCell = cell
+			while direction != NO_DIRECTION:
+				nextCell = NEXT_CELL[nextCell * 5 + direction]
+				path.append(nextCell)
+				if (nextCell == cell) or (nextCell in POCKETS):
+					break
+				direction = CORRIDOR_EXIT[nextCell * 5 + direction]
+			if (nextCell != cell) and (nextCell not in POCKETS):
+				paths[cell].append(path)
+
+	# Pocket cells: walk in from each mouth (the non-pocket cells next to a
+	# pocket), extending the way out by one cell each step
+	for mouth in range(NUM_CELLS):
+		if (mouth in POCKETS) or not isOpen(mouth):
+			continue
+		frontier = [(mouth, [mouth])]
+		while frontier:
+			prevCell, path = frontier.pop()
+			for direction in exits(prevCell):
+				nextCell = NEXT_CELL[prevCell * 5 + direction]
+				if (nextCell in POCKETS) and not paths[nextCell]:
+					paths[nextCell].append(path)
+					frontier.append((nextCell, [nextCell] + path))
+
+	return paths
+
+# Ways out of each cell, built once on import
+PATHS: list[list[list[int]]] = buildPaths()
+
+# Escapes of each cell, as (escape cell, number of moves) pairs
+ESCAPES: list[tuple[tuple[int, int], ...]] = [
+	tuple((path[-1], len(path)) for path in paths) for paths in PATHS
+]
+
+def buildSealers() -> list[tuple[frozenset[int], ...]]:
+	'''
+	Build the ghost moves which seal each escape of each cell, as sets of
+	cell * 5 + heading: moves one cell closer to Pacman, from the
+	cells on the way to the escape (including the escape itself)
+	'''
+
+	sealers: list[tuple[frozenset[int], ...]] = [()] * NUM_CELLS
+	for cell in range(NUM_CELLS):
+		sides: list[frozenset[int]] = []
+		for path in PATHS[cell]:
+			keys: set[int] = set()
+			for index, pathCell in enumerate(path):
+				closerCell = path[index - 1] if index else cell
+				for direction in exits(pathCell):
+					if NEXT_CELL[pathCell * 5 + direction] == closerCell:
+						keys.add(pathCell * 5 + direction)
+			sides.append(frozenset(keys))
+		sealers[cell] = tuple(sides)
+
+	return sealers
+
+# Sealing ghost moves for each escape of each cell, built once on import
+SEALERS: list[tuple[frozenset[int], ...]] = buildSealers()
+
+def isTrapped(cell: int, ghostMoves: list[int]) -> bool:
+	'''
+	Whether the ghosts seal every escape of Pacman's cell, given the next move
+	of each non-frightened ghost (as cell * 5 + heading); this
+	assumes that the ghosts do not turn around (by a change of mode, or a
+	super pellet) before reaching Pacman
+	'''
+
+	sides = SEALERS[cell] if (0 <= cell < NUM_CELLS) else ()
+	if not (sides and ghostMoves):
+		return False
+
+	for side in sides:
+		if not any(move in side for move in ghostMoves):
+			return False
+
+	return True